@@ -3,28 +3,51 @@ ESPHome integration for the Immergas Modbus custom component.
 
 This module mirrors the structure used in `esphome-samsung-nasa`:
 - provides a controller/client schema
-- exposes a `language` option (e.g. `en`, `it`) which can be used
-  to select label translations for sensors and other entities
+- exposes a `language` option (any language in the label catalog, e.g. `en`,
+  `it`) which selects the language of the boiler fault texts
 - registers declared devices
 
 Notes:
-- Label mapping files for each language live under
-  `components/immergas_modbus/immergas/labels_<lang>.py`. A minimal
-  English and Italian file are included; the full mapping should be
-  generated from the Dominus label JSON and placed here for production.
+- The fault labels of every language live in one packed catalog,
+  `components/immergas_modbus/immergas/labels.bin`, generated from the Dominus
+  label JSON by `extract_registers.py` and keyed by fault code. Entity names do
+  not come from it. `immergas/labels.py` loads the catalog on first use;
+  `fault_text: true` embeds the selected language in the firmware.
 """
 
+from pathlib import Path
+
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import uart
 from esphome import pins
 from esphome.cpp_helpers import gpio_pin_expression
-from esphome.const import CONF_ID, CONF_FLOW_CONTROL_PIN
+from esphome.helpers import write_file_if_changed
+from esphome.core import CORE, coroutine_with_priority
+from esphome.const import (
+	CONF_BAUD_RATE,
+	CONF_ID,
+	CONF_FLOW_CONTROL_PIN,
+	CONF_UART_ID,
+	CONF_UPDATE_INTERVAL,
+	DEVICE_CLASS_CONNECTIVITY,
+	ENTITY_CATEGORY_DIAGNOSTIC,
+	STATE_CLASS_MEASUREMENT,
+	STATE_CLASS_TOTAL_INCREASING,
+	UNIT_MILLISECOND,
+	UNIT_PERCENT,
+)
+from .immergas.const import IM_MESSAGE
+from .immergas import label_catalog, labels, pdu_map, read_plan, register_index
 from esphome.components import number, select, sensor as esph_sensor, binary_sensor as esph_binary, switch as esph_switch, climate as esph_climate
 
+DOMAIN = "immergas_modbus"
+REGISTERS_JSON = Path(__file__).resolve().parents[2] / "immergas_registers.json"
+
 MULTI_CONF = False
 CODEOWNERS = ["You"]
 DEPENDENCIES = ["uart"]
+AUTO_LOAD = ["binary_sensor", "sensor"]
 
 
 immergas_ns = cg.esphome_ns.namespace("immergas_modbus")
@@ -42,6 +65,7 @@ IM_Sensor = immergas_ns.class_("IM_Sensor", esph_sensor.Sensor, IM_Device)
 IM_BinarySensor = immergas_ns.class_("IM_BinarySensor", esph_binary.BinarySensor, IM_Device)
 IM_Switch = immergas_ns.class_("IM_Switch", esph_switch.Switch, IM_Device)
 IM_Climate = immergas_ns.class_("IM_Climate", esph_climate.Climate, cg.Component)
+ImmergasBusMetric = immergas_ns.enum("ImmergasBusMetric")
 
 IM_CONTROLLER_ID = "im_controller_id"
 IM_CLIENT_ID = "im_client_id"
@@ -50,6 +74,17 @@ IM_DEVICE_ID = "im_device_id"
 IM_DEVICE_ADDRESS = "address"
 IM_DEBUG_LOG_MESSAGES = "debug_log_messages"
 IM_LANGUAGE = "language"
+IM_DISCOVERY = "discovery"
+IM_RESTORE_VALUES = "restore_values"
+IM_LOOP_BUDGET = "loop_budget"
+IM_FAULT_TEXT = "fault_text"
+IM_DEADBAND = "deadband"
+IM_HEARTBEAT = "heartbeat"
+IM_ONLINE = "online"
+IM_RESTORED = "restored"
+IM_SUCCESSFUL_TRANSACTIONS = "successful_transactions"
+IM_FAILED_TRANSACTIONS = "failed_transactions"
+IM_BUS_TASK = "bus_task"
 
 
 def device_validator(config):
@@ -59,8 +94,177 @@ def device_validator(config):
 	return config
 
 
+def register_subscription(config):
+	"""Record the PDU an entity polls, for the read plan computed at codegen time."""
+	interval = config.get(CONF_UPDATE_INTERVAL)
+	CORE.data.setdefault(DOMAIN, {}).setdefault("subscriptions", []).append(
+		(config[IM_DEVICE_ID].id, config[IM_MESSAGE], interval.total_milliseconds if interval is not None else None)
+	)
+
+
+def uart_baud_rate(config):
+	for conf in CORE.config.get("uart", []):
+		if conf[CONF_ID].id == config[CONF_UART_ID].id:
+			return conf.get(CONF_BAUD_RATE, 9600)
+	return 9600
+
+
+@coroutine_with_priority(-100.0)
+async def emit_pdu_map(config, controller):
+	# runs after every platform registered its entities
+	if not REGISTERS_JSON.exists():
+		return
+	data = CORE.data.get(DOMAIN, {})
+	index = register_index.load_index()
+	entries, bits = index["pdu_entries"], index["pdu_bits"]
+	# preferences stay keyed by the full map, see render_header()
+	layout = entries
+	# Only the PDUs the configuration uses go into the firmware. immergas_pdus.h picks this
+	# header up from the build's src directory instead of its own full map.
+	used = {pdu for _, pdu, _ in data.get("subscriptions", [])} & {e["pdu"] for e in entries}
+	if used:
+		entries, bits = pdu_map.prune(entries, bits, used)
+	write_file_if_changed(
+		CORE.relative_src_path("immergas_pdus_config.h"),
+		"#pragma once\n// Generated by the immergas_modbus codegen from the PDUs in the configuration\n"
+		+ pdu_map.render_header(entries, bits, layout),
+	)
+	known = {e["pdu"] for e in entries}
+	hub_interval = config[CONF_UPDATE_INTERVAL].total_milliseconds
+	# slave -> pdu -> fastest update interval of its entities, like pdu_interval_()
+	slaves = {}
+	for device_id, pdu, interval in data.get("subscriptions", []):
+		address = data.get("devices", {}).get(device_id)
+		try:
+			slave = int(str(address).split(".")[0])
+		except ValueError:
+			continue
+		if slave == 0 or pdu not in known:
+			continue
+		intervals = slaves.setdefault(slave, {})
+		interval = interval or hub_interval
+		intervals[pdu] = min(intervals.get(pdu, interval), interval)
+	max_gap = read_plan.max_bridge_gap(uart_baud_rate(config))
+	batches, indices = [], []
+	for slave, intervals in sorted(slaves.items()):
+		for start, count, interval, entry_indices in read_plan.build_slave_plan(entries, intervals, max_gap):
+			batches.append("{%d, %d, %d, %d, %d, %d}" % (slave, start, count, len(indices), len(entry_indices), interval))
+			indices.extend(entry_indices)
+	if not batches:
+		return
+	cg.add_global(cg.RawStatement(
+		"static constexpr esphome::immergas_modbus::ImmergasStaticBatch immergas_static_plan[] = {%s};" % ", ".join(batches)
+	))
+	cg.add_global(cg.RawStatement(
+		"static constexpr uint16_t immergas_static_plan_entries[] = {%s};" % ", ".join(str(i) for i in indices)
+	))
+	cg.add(controller.set_static_plan(
+		cg.RawExpression("immergas_static_plan"),
+		len(batches),
+		cg.RawExpression("immergas_static_plan_entries"),
+		cg.RawExpression("0x%08X" % pdu_map.map_hash(entries)),
+		max_gap,
+	))
+
+
+def bus_task(value):
+	# the task is pinned to the second core, which only the ESP32 has
+	value = cv.boolean(value)
+	if value and not CORE.is_esp32:
+		raise cv.Invalid("bus_task is only available on ESP32")
+	return value
+
+
+def fault_text(value):
+	# the catalog is read in place; on the ESP8266 a const array is copied to RAM at boot
+	value = cv.boolean(value)
+	if value and CORE.is_esp8266:
+		raise cv.Invalid("fault_text is not available on ESP8266")
+	return value
+
+
+def deadband(value):
+	# `0.5` is absolute, `5%` is relative to the last published value
+	if isinstance(value, str) and value.strip().endswith("%"):
+		return {"relative": cv.percentage(value)}
+	return {"absolute": cv.positive_float(value)}
+
+
+# Change-only publishing options shared by the entity platforms. Entities
+# publish a polled value only when it changed, and at least every `heartbeat`.
+PUBLISH_SCHEMA = cv.Schema({cv.Optional(IM_HEARTBEAT): cv.positive_time_period_milliseconds})
+NUMERIC_PUBLISH_SCHEMA = PUBLISH_SCHEMA.extend({cv.Optional(IM_DEADBAND): deadband})
+
+
+def setup_publish_options(var, config):
+	if (band := config.get(IM_DEADBAND)) is not None:
+		if "relative" in band:
+			cg.add(var.set_relative_deadband(band["relative"]))
+		else:
+			cg.add(var.set_deadband(band["absolute"]))
+	if IM_HEARTBEAT in config:
+		cg.add(var.set_heartbeat(config[IM_HEARTBEAT]))
+
+
+# Optional link diagnostics for the Modbus slave behind a device
+transaction_counter_schema = esph_sensor.sensor_schema(
+	accuracy_decimals=0,
+	state_class=STATE_CLASS_TOTAL_INCREASING,
+	entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+)
+
+# Optional bus diagnostics of the hub, published every update interval
+bus_time_schema = esph_sensor.sensor_schema(
+	unit_of_measurement=UNIT_MILLISECOND,
+	accuracy_decimals=1,
+	state_class=STATE_CLASS_MEASUREMENT,
+	entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+)
+BUS_SENSORS = {
+	"bus_utilization": (
+		ImmergasBusMetric.IM_BUS_UTILIZATION,
+		esph_sensor.sensor_schema(
+			unit_of_measurement=UNIT_PERCENT,
+			accuracy_decimals=1,
+			state_class=STATE_CLASS_MEASUREMENT,
+			entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+		),
+	),
+	"bus_bytes": (
+		ImmergasBusMetric.IM_BUS_BYTES,
+		esph_sensor.sensor_schema(
+			unit_of_measurement="B",
+			accuracy_decimals=0,
+			state_class=STATE_CLASS_MEASUREMENT,
+			entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+		),
+	),
+	"round_trip_min": (ImmergasBusMetric.IM_BUS_ROUND_TRIP_MIN, bus_time_schema),
+	"round_trip_avg": (ImmergasBusMetric.IM_BUS_ROUND_TRIP_AVG, bus_time_schema),
+	"round_trip_p95": (ImmergasBusMetric.IM_BUS_ROUND_TRIP_P95, bus_time_schema),
+	"turnaround_min": (ImmergasBusMetric.IM_BUS_TURNAROUND_MIN, bus_time_schema),
+	"turnaround_avg": (ImmergasBusMetric.IM_BUS_TURNAROUND_AVG, bus_time_schema),
+	"turnaround_p95": (ImmergasBusMetric.IM_BUS_TURNAROUND_P95, bus_time_schema),
+	"cycle_duration": (ImmergasBusMetric.IM_BUS_CYCLE_DURATION, bus_time_schema),
+	"poll_overruns": (ImmergasBusMetric.IM_BUS_OVERRUNS, transaction_counter_schema),
+}
+
 device_schema = cv.All(
-	cv.Schema({cv.GenerateID(): cv.declare_id(IM_Device), cv.Required(IM_DEVICE_ADDRESS): cv.string_strict}),
+	cv.Schema(
+		{
+			cv.GenerateID(): cv.declare_id(IM_Device),
+			cv.Required(IM_DEVICE_ADDRESS): cv.string_strict,
+			cv.Optional(IM_ONLINE): esph_binary.binary_sensor_schema(
+				device_class=DEVICE_CLASS_CONNECTIVITY,
+				entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+			),
+			cv.Optional(IM_RESTORED): esph_binary.binary_sensor_schema(
+				entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
+			),
+			cv.Optional(IM_SUCCESSFUL_TRANSACTIONS): transaction_counter_schema,
+			cv.Optional(IM_FAILED_TRANSACTIONS): transaction_counter_schema,
+		}
+	),
 	device_validator,
 )
 
@@ -68,6 +272,7 @@ client_schema = cv.Schema(
 	{
 		cv.GenerateID(IM_CLIENT_ID): cv.declare_id(IM_Client),
 		cv.Optional(CONF_FLOW_CONTROL_PIN): pins.gpio_output_pin_schema,
+		cv.Optional(IM_BUS_TASK, default=False): bus_task,
 	}
 )
 
@@ -77,8 +282,13 @@ CONFIG_SCHEMA = cv.Schema(
 		cv.GenerateID(IM_CONTROLLER_ID): cv.declare_id(IM_Controller),
 		cv.Required("client"): client_schema,
 		cv.Optional(IM_DEBUG_LOG_MESSAGES, default=False): cv.boolean,
-		cv.Optional(IM_LANGUAGE, default="en"): cv.one_of("en", "it", "fr", "de", "es"),
+		cv.Optional(IM_LANGUAGE, default=labels.DEFAULT_LANGUAGE): cv.one_of(*labels.LANGUAGES),
+		cv.Optional(IM_DISCOVERY, default=True): cv.boolean,
+		cv.Optional(IM_RESTORE_VALUES, default=True): cv.boolean,
+		cv.Optional(IM_LOOP_BUDGET, default="20ms"): cv.positive_time_period_milliseconds,
+		cv.Optional(IM_FAULT_TEXT, default=False): fault_text,
 		cv.Required(IM_DEVICES): cv.ensure_list(device_schema),
+		**{cv.Optional(key): schema for key, (_, schema) in BUS_SENSORS.items()},
 	}
 ).extend(uart.UART_DEVICE_SCHEMA).extend(cv.polling_component_schema("30s"))
 
@@ -89,15 +299,51 @@ async def to_code(config):
 	if (conf_pin := conf_client.get(CONF_FLOW_CONTROL_PIN)) is not None:
 		pin = await gpio_pin_expression(conf_pin)
 		cg.add(client_var.set_flow_control_pin(pin))
+	cg.add(client_var.set_bus_task(conf_client[IM_BUS_TASK]))
 
 	controller = cg.new_Pvariable(config[IM_CONTROLLER_ID], client_var)
 	cg.add(controller.set_debug_log_messages(config[IM_DEBUG_LOG_MESSAGES]))
 	# pass selected language to C++ component (no-op if not used yet)
 	cg.add(controller.set_language(config[IM_LANGUAGE]))
+	cg.add(controller.set_discovery(config[IM_DISCOVERY]))
+	cg.add(controller.set_restore_values(config[IM_RESTORE_VALUES]))
+	cg.add(controller.set_loop_budget(config[IM_LOOP_BUDGET]))
+	if config[IM_FAULT_TEXT]:
+		# embed the fault labels of the selected language only, in the same packed format
+		blob = label_catalog.subset(labels.get_catalog(), [config[IM_LANGUAGE]])
+		write_file_if_changed(
+			CORE.relative_src_path("immergas_labels_catalog.h"),
+			"#pragma once\n// Generated by the immergas_modbus codegen from immergas/labels.bin\n"
+			+ label_catalog.render_header(blob),
+		)
+		cg.add_global(cg.RawStatement('#include "immergas_labels_catalog.h"'))
+		cg.add(controller.set_label_catalog(cg.RawExpression("esphome::immergas_modbus::immergas_label_catalog")))
+
+	CORE.data.setdefault(DOMAIN, {})["devices"] = {
+		device[CONF_ID].id: device[IM_DEVICE_ADDRESS] for device in config[IM_DEVICES]
+	}
+	CORE.add_job(emit_pdu_map, config, controller)
 
 	for device in config[IM_DEVICES]:
 		var_device = cg.new_Pvariable(device[CONF_ID], device[IM_DEVICE_ADDRESS])
 		cg.add(controller.register_device(var_device))
+		if (conf := device.get(IM_ONLINE)) is not None:
+			sens = await esph_binary.new_binary_sensor(conf)
+			cg.add(controller.set_online_sensor(var_device, sens))
+		if (conf := device.get(IM_RESTORED)) is not None:
+			sens = await esph_binary.new_binary_sensor(conf)
+			cg.add(controller.set_restored_sensor(var_device, sens))
+		if (conf := device.get(IM_SUCCESSFUL_TRANSACTIONS)) is not None:
+			sens = await esph_sensor.new_sensor(conf)
+			cg.add(controller.set_successes_sensor(var_device, sens))
+		if (conf := device.get(IM_FAILED_TRANSACTIONS)) is not None:
+			sens = await esph_sensor.new_sensor(conf)
+			cg.add(controller.set_failures_sensor(var_device, sens))
+
+	for key, (metric, _) in BUS_SENSORS.items():
+		if (conf := config.get(key)) is not None:
+			sens = await esph_sensor.new_sensor(conf)
+			cg.add(controller.set_bus_sensor(metric, sens))
 
 	await cg.register_component(controller, config)
 	await cg.register_component(client_var, conf_client)
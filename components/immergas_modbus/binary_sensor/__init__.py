@@ -1,16 +1,22 @@
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import binary_sensor
+from esphome.const import CONF_UPDATE_INTERVAL
 from ..immergas.const import IM_LABEL, IM_MESSAGE, IM_MODE
-from ..immergas.labels_en import immergas_labels
 from ..immergas.auto_entities import binary_sensors as auto_binary_map
+from ..immergas.register_index import load_index
 from .. import (
     IM_CONTROLLER_ID,
     IM_DEVICE_ID,
+    PUBLISH_SCHEMA,
+    register_subscription,
+    setup_publish_options,
     IM_BinarySensor,
 )
 
 
+IM_BIT = "bit"
+
 AUTO_LOAD = ["immergas_modbus"]
 DEPENDENCIES = ["immergas_modbus"]
 
@@ -19,11 +25,17 @@ def validate(config):
     if IM_MESSAGE in config:
         mapped = auto_binary_map.get(config[IM_MESSAGE]) if auto_binary_map is not None else None
         if mapped is not None:
-            config[IM_LABEL] = mapped.get(IM_LABEL, immergas_labels.get(config[IM_MESSAGE], "IM_UNKNOWN_LABEL"))
+            config[IM_LABEL] = mapped.get(IM_LABEL, "IM_UNKNOWN_LABEL")
             config[IM_MODE] = mapped.get(IM_MODE, "STATUS")
     return config
 
 
+def validate_bit(config):
+    if IM_BIT in config and (config[IM_MESSAGE], config[IM_BIT]) not in load_index()["pdu_bits"]:
+        raise cv.Invalid(f"PDU {config[IM_MESSAGE]} has no known flag at bit {config[IM_BIT]}", path=[IM_BIT])
+    return config
+
+
 CONFIG_SCHEMA = cv.All(
     cv.Schema({cv.GenerateID(): cv.declare_id(IM_BinarySensor), cv.Required(IM_MESSAGE): cv.hex_int}, extra=cv.ALLOW_EXTRA),
     validate,
@@ -31,8 +43,13 @@ CONFIG_SCHEMA = cv.All(
     .extend({
         cv.GenerateID(): cv.declare_id(IM_BinarySensor),
         cv.Required(IM_MESSAGE): cv.hex_int,
+        cv.Optional(CONF_UPDATE_INTERVAL): cv.update_interval,
+        # one bit of an LB flag8 register; sensors on the same register share its read
+        cv.Optional(IM_BIT): cv.int_range(min=0, max=7),
     })
-    .extend({cv.GenerateID(IM_CONTROLLER_ID): cv.use_id, cv.GenerateID(IM_DEVICE_ID): cv.use_id})
+    .extend(PUBLISH_SCHEMA)
+    .extend({cv.GenerateID(IM_CONTROLLER_ID): cv.use_id, cv.GenerateID(IM_DEVICE_ID): cv.use_id}),
+    validate_bit,
 )
 
 
@@ -41,10 +58,13 @@ async def to_code(config):
     controller = await cg.get_variable(config[IM_CONTROLLER_ID])
     var_bin = await binary_sensor.new_binary_sensor(
         config,
-        config[IM_LABEL],
-        config[IM_MESSAGE],
-        config.get(IM_MODE, "STATUS"),
-        device,
+        device.get_address(),
     )
-    cg.add(var_bin.set_parent(controller))
+    cg.add(var_bin.set_pdu(config[IM_MESSAGE]))
+    if CONF_UPDATE_INTERVAL in config:
+        cg.add(var_bin.set_update_interval(config[CONF_UPDATE_INTERVAL]))
+    if IM_BIT in config:
+        cg.add(var_bin.set_bit(config[IM_BIT]))
+    setup_publish_options(var_bin, config)
     cg.add(controller.register_device(var_bin))
+    register_subscription(config)
@@ -10,7 +10,16 @@ class IM_BinarySensor : public binary_sensor::BinarySensor, public IM_Device {
   IM_BinarySensor(const std::string &address) : IM_Device(address) {}
   void setup() override {}
   void loop() override {}
-  void handle_immergas_update(uint16_t pdu, float value) override { this->publish_state(value >= 1.0f); }
+  // Report one bit of a flag register instead of the whole value. Every bit of the
+  // register is served by the same read, see immergas_pdu_bits.
+  void set_bit(uint8_t bit) { this->bit_ = bit; }
+  void handle_immergas_update(uint16_t pdu, float value) override {
+    bool state = this->bit_ >= 0 ? ((static_cast<uint32_t>(value) >> this->bit_) & 1) != 0 : value >= 1.0f;
+    if (this->should_publish_(state ? 1.0f : 0.0f)) this->publish_state(state);
+  }
+
+ protected:
+  int8_t bit_{-1};
 };
 
 }  // namespace immergas_modbus
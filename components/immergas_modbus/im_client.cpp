@@ -0,0 +1,271 @@
+#include "im_client.h"
+#include "im_crc.h"
+#include <algorithm>
+#include <cstring>
+
+namespace esphome {
+namespace immergas_modbus {
+
+static const char *const TAG = "immergas_modbus.client";
+
+// Time a slave may take to start answering a read, on top of the reply's own wire time
+static const uint32_t IM_RESPONSE_TURNAROUND_MS = 300;
+
+#ifdef USE_ESP32
+// Stack of the bus task; it only shuffles bytes between the UART and the frame buffers
+static const uint32_t IM_BUS_TASK_STACK_SIZE = 3072;
+// Above the main loop task (1), so Wi-Fi, API and web_server work cannot delay the bus
+static const UBaseType_t IM_BUS_TASK_PRIORITY = 5;
+#endif
+
+void IM_Client::setup() {
+	if (this->flow_control_pin_ != nullptr) {
+		this->flow_control_pin_->setup();
+		this->flow_control_pin_->digital_write(false);
+	}
+#ifdef USE_ESP32
+	if (this->use_bus_task_ &&
+	    xTaskCreatePinnedToCore(IM_Client::bus_task_, "immergas_bus", IM_BUS_TASK_STACK_SIZE, this, IM_BUS_TASK_PRIORITY,
+	                            &this->bus_task_handle_, 0) != pdPASS) {
+		ESP_LOGE(TAG, "Could not start the bus task, running the bus from the main loop");
+		this->bus_task_handle_ = nullptr;
+	}
+#endif
+}
+
+#ifdef USE_ESP32
+void IM_Client::bus_task_(void *arg) {
+	IM_Client *client = static_cast<IM_Client *>(arg);
+	for (;;) {
+		ImmergasTransactionState state = client->state_;
+		if (state == IM_TRANSACTION_IDLE || state == IM_TRANSACTION_DONE) {
+			// woken by start_()
+			ulTaskNotifyTake(pdTRUE, portMAX_DELAY);
+			continue;
+		}
+		client->step_();
+		// one tick between UART polls lets the idle task of core 0 feed the watchdog
+		vTaskDelay(1);
+	}
+}
+#endif
+
+uint32_t IM_Client::char_time_us_() const {
+	uint32_t baud = this->get_baud_rate();
+	if (baud == 0) baud = 9600;
+	// RTU characters are always 11 bits (start, 8 data, parity or 2nd stop, stop)
+	return 11000000UL / baud;
+}
+
+bool IM_Client::read_holding_registers(uint8_t slave_id, uint16_t reg_addr, uint16_t count, ImmergasResponseCallback &&callback) {
+	if (this->state_ != IM_TRANSACTION_IDLE || count == 0 || count > IM_MAX_READ_REGISTERS) return false;
+	this->tx_len_ = 0;
+	this->put_byte_(slave_id);
+	this->put_byte_(0x03);
+	this->put_u16_(reg_addr);
+	this->put_u16_(count);
+	// a 125-register reply alone is on the wire for ~290 ms at 9600 baud
+	const uint32_t reply_ms = ((5 + 2 * count) * this->char_time_us_() + 999) / 1000;
+	this->start_(IM_RESPONSE_TURNAROUND_MS + reply_ms, std::move(callback));
+	return true;
+}
+
+bool IM_Client::write_multiple_registers(uint8_t slave_id, uint16_t reg_addr, const uint16_t *values, uint16_t count,
+                                         ImmergasResponseCallback &&callback) {
+	if (this->state_ != IM_TRANSACTION_IDLE || count == 0 || count > IM_MAX_WRITE_REGISTERS) return false;
+	// header: slave, func, addr_hi, addr_lo, count_hi, count_lo, bytecount
+	this->tx_len_ = 0;
+	this->put_byte_(slave_id);
+	this->put_byte_(0x10);
+	this->put_u16_(reg_addr);
+	this->put_u16_(count);
+	this->put_byte_(static_cast<uint8_t>(count * 2));
+	for (uint16_t i = 0; i < count; i++) this->put_u16_(values[i]);
+	this->start_(500, std::move(callback));
+	return true;
+}
+
+bool IM_Client::write_single_register(uint8_t slave_id, uint16_t reg_addr, uint16_t value, ImmergasResponseCallback &&callback) {
+	if (this->state_ != IM_TRANSACTION_IDLE) return false;
+	// 8 bytes on the wire instead of 11 for a one-register function 0x10
+	this->tx_len_ = 0;
+	this->put_byte_(slave_id);
+	this->put_byte_(0x06);
+	this->put_u16_(reg_addr);
+	this->put_u16_(value);
+	this->start_(500, std::move(callback));
+	return true;
+}
+
+uint32_t IM_Client::frame_silence_us_() const {
+	// the spec fixes t3.5 at 1750us above 19200 baud
+	return std::max<uint32_t>(this->char_time_us_() * 7 / 2, 1750);
+}
+
+size_t IM_Client::expected_frame_length_() const {
+	if (this->rx_len_ < 2) return 0;
+	uint8_t func = this->rx_[1];
+	// exception: slave, func | 0x80, code, crc_lo, crc_hi
+	if (func & 0x80) return 5;
+	switch (func) {
+		case 0x03:
+			// slave, func, bytecount, data, crc_lo, crc_hi
+			return this->rx_len_ < 3 ? 0 : 5 + this->rx_[2];
+		case 0x06:
+		case 0x10:
+			// slave, func, addr_hi, addr_lo, value/count_hi, value/count_lo, crc_lo, crc_hi
+			return 8;
+		default:
+			return 0;
+	}
+}
+
+void IM_Client::start_(uint32_t timeout_ms, ImmergasResponseCallback &&callback) {
+	uint16_t crc = crc16_calc(this->tx_, this->tx_len_);
+	this->put_byte_(crc & 0xFF);
+	this->put_byte_((crc >> 8) & 0xFF);
+	this->rx_len_ = 0;
+	this->rx_crc_ = IM_CRC16_INIT;
+	this->timeout_ms_ = timeout_ms;
+	this->callback_ = std::move(callback);
+	this->state_ = IM_TRANSACTION_SENDING;
+#ifdef USE_ESP32
+	if (this->bus_task_handle_ != nullptr) {
+		xTaskNotifyGive(this->bus_task_handle_);
+		return;
+	}
+#endif
+	this->high_freq_.start();
+}
+
+void IM_Client::loop() {
+#ifdef USE_ESP32
+	if (this->bus_task_handle_ != nullptr) {
+		ImmergasCompletion completion;
+		if (!this->completions_.pop(&completion)) return;
+		ESP_LOGVV(TAG, "Response delivered %u ms after the bus task finished it", millis() - completion.completed_ms);
+		this->complete_(completion.response);
+		return;
+	}
+#endif
+	this->step_();
+}
+
+void IM_Client::step_() {
+	switch (this->state_) {
+		case IM_TRANSACTION_IDLE:
+			return;
+		case IM_TRANSACTION_SENDING:
+			if (this->tx_time_us_ == 0) {
+				// drop anything left over from a previous, late response
+				while (this->available() > 0) this->read();
+				if (this->flow_control_pin_ != nullptr) this->flow_control_pin_->digital_write(true);
+				this->write_array(this->tx_, this->tx_len_);
+				this->sent_us_ = micros();
+				this->tx_time_us_ = this->tx_len_ * this->char_time_us_();
+				return;
+			}
+			// wait for the UART to shift the frame out without blocking the main loop
+			if (micros() - this->sent_us_ < this->tx_time_us_) return;
+			if (this->flow_control_pin_ != nullptr) {
+				this->flush();
+				this->flow_control_pin_->digital_write(false);
+			}
+			this->tx_time_us_ = 0;
+			this->tx_done_us_ = micros();
+			this->wait_start_ms_ = millis();
+			this->state_ = IM_TRANSACTION_AWAITING_RESPONSE;
+			return;
+		case IM_TRANSACTION_AWAITING_RESPONSE: {
+			const uint32_t now_us = micros();
+			while (this->available() > 0) {
+				int b = this->read();
+				if (b < 0) break;
+				this->last_rx_us_ = now_us;
+				// an oversized frame can never be valid; keep draining but stop storing
+				if (this->rx_len_ == IM_MAX_FRAME_SIZE) continue;
+				if (this->rx_len_ == 0) this->first_rx_us_ = now_us;
+				this->rx_[this->rx_len_++] = static_cast<uint8_t>(b);
+				this->rx_crc_ = crc16_update(this->rx_crc_, static_cast<uint8_t>(b));
+			}
+			// complete as soon as the frame is whole. Only while its length is still unknown does
+			// t3.5 of silence end it, so short and garbled frames do not wait for the timeout; bytes
+			// are timestamped when drained, so a loop gap would otherwise cut a valid frame short.
+			size_t expected = this->expected_frame_length_();
+			if (expected != 0 && this->rx_len_ >= expected) {
+				this->state_ = IM_TRANSACTION_DONE;
+			} else if (expected == 0 && this->rx_len_ != 0 && now_us - this->last_rx_us_ >= this->frame_silence_us_()) {
+				this->state_ = IM_TRANSACTION_DONE;
+			} else if (this->rx_len_ == 0 ? millis() - this->wait_start_ms_ >= this->timeout_ms_
+			                              : now_us - this->last_rx_us_ >= this->timeout_ms_ * 1000UL) {
+				// once the response has started, the deadline runs from its last byte
+				this->state_ = IM_TRANSACTION_TIMEOUT;
+			} else {
+				return;
+			}
+			this->finish_();
+			return;
+		}
+		default:
+			this->finish_();
+			return;
+	}
+}
+
+void IM_Client::finish_() {
+	ImmergasResponse response{IM_RESULT_OK, 0, {}, {}};
+	const uint8_t *buf = this->rx_;
+	const size_t len = this->rx_len_;
+	response.timing.round_trip_us = micros() - this->sent_us_;
+	if (len != 0) response.timing.turnaround_us = this->first_rx_us_ - this->tx_done_us_;
+	response.timing.wire_bytes = static_cast<uint16_t>(this->tx_len_ + len);
+	size_t expected = this->expected_frame_length_();
+	if (this->state_ == IM_TRANSACTION_TIMEOUT && len == 0) {
+		response.result = IM_RESULT_TIMEOUT;
+	} else if (len < 5 || (expected != 0 && len != expected)) {
+		response.result = IM_RESULT_BAD_FRAME;
+	} else if (this->rx_crc_ != IM_CRC16_RESIDUE) {
+		response.result = IM_RESULT_BAD_FRAME;
+	} else if (buf[0] != this->tx_[0] || (buf[1] & 0x7F) != this->tx_[1]) {
+		response.result = IM_RESULT_BAD_FRAME;
+	} else if (buf[1] & 0x80) {
+		response.result = IM_RESULT_EXCEPTION;
+		response.exception = buf[2];
+	} else if (this->tx_[1] == 0x03) {
+		uint16_t count = (this->tx_[4] << 8) | this->tx_[5];
+		if (buf[2] != 2 * count || len < static_cast<size_t>(5 + 2 * count)) {
+			response.result = IM_RESULT_BAD_FRAME;
+		} else {
+			// decoded in place from the receive buffer
+			response.registers = ImmergasRegisterView(buf + 3, count);
+		}
+	} else if (this->tx_[1] == 0x10 || this->tx_[1] == 0x06) {
+		// success if echo of addr/count (0x10) or addr/value (0x06)
+		if (len < 8 || memcmp(buf + 2, this->tx_ + 2, 4) != 0) response.result = IM_RESULT_BAD_FRAME;
+	}
+	if (response.result != IM_RESULT_OK && response.result != IM_RESULT_EXCEPTION) {
+		ESP_LOGV(TAG, "Transaction with slave %d (func 0x%02X) failed: result=%d rx=%u bytes", this->tx_[0], this->tx_[1],
+		         response.result, static_cast<unsigned>(len));
+	}
+#ifdef USE_ESP32
+	if (this->bus_task_handle_ != nullptr) {
+		// the registers stay valid in `rx_`: no new transaction starts before loop() delivers this one
+		this->state_ = IM_TRANSACTION_DONE;
+		this->completions_.push(ImmergasCompletion{response, millis()});
+		return;
+	}
+#endif
+	this->complete_(response);
+}
+
+void IM_Client::complete_(const ImmergasResponse &response) {
+	// release the client before the callback so it can start the next transaction
+	ImmergasResponseCallback callback = std::move(this->callback_);
+	this->callback_ = nullptr;
+	this->state_ = IM_TRANSACTION_IDLE;
+	this->high_freq_.stop();
+	if (callback) callback(response);
+}
+
+}  // namespace immergas_modbus
+}  // namespace esphome
@@ -2,20 +2,165 @@
 
 #include "esphome.h"
 #include "esphome/components/uart/uart.h"
+#include "im_ring.h"
+#include <algorithm>
+#include <atomic>
+#include <functional>
+
+#ifdef USE_ESP32
+#include <freertos/FreeRTOS.h>
+#include <freertos/task.h>
+#endif
 
 namespace esphome {
 namespace immergas_modbus {
 
+// Lifecycle of the single in-flight Modbus RTU transaction
+enum ImmergasTransactionState : uint8_t {
+  IM_TRANSACTION_IDLE = 0,
+  IM_TRANSACTION_SENDING = 1,
+  IM_TRANSACTION_AWAITING_RESPONSE = 2,
+  IM_TRANSACTION_DONE = 3,
+  IM_TRANSACTION_TIMEOUT = 4,
+};
+
+enum ImmergasTransactionResult : uint8_t {
+  IM_RESULT_OK = 0,
+  IM_RESULT_TIMEOUT = 1,
+  IM_RESULT_BAD_FRAME = 2,  // CRC mismatch, wrong slave/function or unexpected length
+  IM_RESULT_EXCEPTION = 3,  // slave answered with an exception frame, see `exception`
+};
+
+// Largest Modbus RTU frame: address + 253-byte PDU + CRC
+static const size_t IM_MAX_FRAME_SIZE = 256;
+// Modbus limit for registers in one function 0x03 response
+static const uint16_t IM_MAX_READ_REGISTERS = 125;
+// Modbus limit for registers in one function 0x10 request
+static const uint16_t IM_MAX_WRITE_REGISTERS = 123;
+
+// Non-owning view of big-endian register values inside a received frame.
+// Only valid for the duration of the response callback.
+class ImmergasRegisterView {
+ public:
+  ImmergasRegisterView() = default;
+  ImmergasRegisterView(const uint8_t *bytes, size_t count) : bytes_(bytes), count_(count) {}
+
+  size_t size() const { return this->count_; }
+  bool empty() const { return this->count_ == 0; }
+  uint16_t operator[](size_t i) const { return (this->bytes_[2 * i] << 8) | this->bytes_[2 * i + 1]; }
+  // Registers [offset, offset + count), clipped to this view
+  ImmergasRegisterView slice(size_t offset, size_t count) const {
+    if (offset >= this->count_) return {};
+    return {this->bytes_ + 2 * offset, std::min(count, this->count_ - offset)};
+  }
+
+ protected:
+  const uint8_t *bytes_{nullptr};
+  size_t count_{0};
+};
+
+// How long a transaction held the bus, measured by the client
+struct ImmergasTransactionTiming {
+  uint32_t round_trip_us;  // first request byte to the end of the response, or to the timeout
+  uint32_t turnaround_us;  // end of the request to the first response byte; 0 without an answer
+  uint16_t wire_bytes;     // request plus response bytes
+};
+
+struct ImmergasResponse {
+  ImmergasTransactionResult result;
+  uint8_t exception;
+  // Register values of a function 0x03 response
+  ImmergasRegisterView registers;
+  ImmergasTransactionTiming timing;
+};
+
+using ImmergasResponseCallback = std::function<void(const ImmergasResponse &response)>;
+
+// A response finished by the bus task, waiting for loop() to run its callback
+struct ImmergasCompletion {
+  ImmergasResponse response;
+  uint32_t completed_ms;
+};
+
+// Non-blocking Modbus RTU master. A transaction is started with one of the
+// request methods and advanced from loop(); its callback runs from loop() once
+// the response is complete or the timeout expired.
+//
+// With the bus task enabled (ESP32 only) the transaction is advanced by a task
+// pinned to core 0 instead, so bus timing does not depend on the main loop. The
+// task hands finished responses over through a lock-free ring and the callbacks
+// still run from loop(), on the main thread.
 class IM_Client : public uart::UARTDevice, public Component {
  public:
   IM_Client() : uart::UARTDevice(nullptr) {}
-  void setup() override {}
-  void loop() override {}
+  void setup() override;
+  void loop() override;
+
+  void set_flow_control_pin(GPIOPin *pin) { this->flow_control_pin_ = pin; }
+  void set_bus_task(bool v) { this->use_bus_task_ = v; }
+  // Baud rate of the underlying UART, used to estimate time on the wire
+  uint32_t get_baud_rate() const { return this->parent_ != nullptr ? this->parent_->get_baud_rate() : 9600; }
+
+  bool is_idle() const { return this->state_ == IM_TRANSACTION_IDLE; }
+  ImmergasTransactionState get_state() const { return this->state_; }
+
+  // Function 0x03. Returns false if another transaction is still in flight.
+  bool read_holding_registers(uint8_t slave_id, uint16_t reg_addr, uint16_t count, ImmergasResponseCallback &&callback);
+  // Function 0x10. Returns false if another transaction is still in flight.
+  bool write_multiple_registers(uint8_t slave_id, uint16_t reg_addr, const uint16_t *values, uint16_t count,
+                                ImmergasResponseCallback &&callback);
+  // Function 0x06. Returns false if another transaction is still in flight.
+  bool write_single_register(uint8_t slave_id, uint16_t reg_addr, uint16_t value, ImmergasResponseCallback &&callback);
+
+ protected:
+  void put_byte_(uint8_t b) { this->tx_[this->tx_len_++] = b; }
+  void put_u16_(uint16_t v) {
+    this->put_byte_(v >> 8);
+    this->put_byte_(v & 0xFF);
+  }
+  // Append the CRC to `tx_` and hand the frame to loop() or the bus task for sending
+  void start_(uint32_t timeout_ms, ImmergasResponseCallback &&callback);
+  // Advance the in-flight transaction; from loop(), or from the bus task when it runs
+  void step_();
+  // Length of the response frame in `rx_` as far as it can be told from the bytes received so far,
+  // or 0 while the header is still incomplete
+  size_t expected_frame_length_() const;
+  // 3.5 character times of bus silence, the RTU end-of-frame marker
+  uint32_t frame_silence_us_() const;
+  // Validate `rx_` against the request and invoke the callback, or queue it for loop()
+  void finish_();
+  // Release the client and invoke the callback of the finished transaction
+  void complete_(const ImmergasResponse &response);
+  uint32_t char_time_us_() const;
 
-  void set_flow_control_pin(const gpio::GPIOPin &pin) { this->flow_control_pin_ = pin; }
+  GPIOPin *flow_control_pin_{nullptr};
+  HighFrequencyLoopRequester high_freq_;
 
- private:
-  gpio::GPIOPin flow_control_pin_{};
+  // Written by the bus task while a transaction is in flight, so accessed atomically.
+  // With the bus task a finished transaction stays DONE until loop() delivers it.
+  std::atomic<ImmergasTransactionState> state_{IM_TRANSACTION_IDLE};
+  ImmergasResponseCallback callback_;  // only touched by the main thread
+  bool use_bus_task_{false};
+  // One transaction is in flight at a time, so the ring never holds more than one completion
+  ImmergasSpscRing<ImmergasCompletion, 2> completions_;
+#ifdef USE_ESP32
+  static void bus_task_(void *arg);
+  TaskHandle_t bus_task_handle_{nullptr};
+#endif
+  // Frame buffers are preallocated for the largest frame so a transaction never touches the heap
+  uint8_t tx_[IM_MAX_FRAME_SIZE];
+  size_t tx_len_{0};
+  uint8_t rx_[IM_MAX_FRAME_SIZE];
+  size_t rx_len_{0};
+  // CRC over every byte in `rx_`, including the frame's own CRC; IM_CRC16_RESIDUE when intact
+  uint16_t rx_crc_{0};
+  uint32_t timeout_ms_{0};
+  uint32_t last_rx_us_{0};
+  uint32_t first_rx_us_{0};
+  uint32_t sent_us_{0};
+  uint32_t tx_done_us_{0};
+  uint32_t tx_time_us_{0};
+  uint32_t wait_start_ms_{0};
 };
 
 }  // namespace immergas_modbus
@@ -11,7 +11,18 @@ class IM_Climate : public climate::Climate, public IM_Device {
   void setup() override {}
   void loop() override {}
   void control(const climate::ClimateCall &call) override {}
-  void handle_immergas_update(uint16_t pdu, float value) override { this->publish_state(value); }
+  climate::ClimateTraits traits() override {
+    climate::ClimateTraits traits;
+    traits.add_feature_flags(climate::CLIMATE_SUPPORTS_CURRENT_TEMPERATURE);
+    traits.set_supported_modes({climate::CLIMATE_MODE_HEAT});
+    return traits;
+  }
+  // The PDU is reported as the current temperature
+  void handle_immergas_update(uint16_t pdu, float value) override {
+    if (!this->should_publish_(value)) return;
+    this->current_temperature = value;
+    this->publish_state();
+  }
 };
 
 }  // namespace immergas_modbus
@@ -1,10 +1,14 @@
 #pragma once
 
 #include "esphome.h"
+#include <algorithm>
+#include <cmath>
 
 namespace esphome {
 namespace immergas_modbus {
 
+struct ImmergasPduEntry;
+
 class IM_Device : public Component {
  public:
   IM_Device(const std::string &address) : address_(address) {}
@@ -22,6 +26,29 @@ class IM_Device : public Component {
   void set_pdu(uint16_t pdu) { this->pdu_ = pdu; }
   uint16_t get_pdu() const { return this->pdu_; }
 
+  // Requested polling interval in ms for this entity's PDU; 0 uses the controller's interval
+  void set_update_interval(uint32_t interval_ms) { this->update_interval_ = interval_ms; }
+  uint32_t get_update_interval() const { return this->update_interval_; }
+
+  // Change-only publishing: a polled value is published when it moved by at least the
+  // absolute deadband or `relative` times the last published value (any change if both
+  // are 0), and at least every `heartbeat_ms` when set.
+  void set_deadband(float absolute) { this->deadband_ = absolute; }
+  void set_relative_deadband(float relative) { this->relative_deadband_ = relative; }
+  void set_heartbeat(uint32_t heartbeat_ms) { this->heartbeat_ms_ = heartbeat_ms; }
+
+  // Modbus slave id and PDU map entry, resolved once by the controller on registration
+  // so the write path never parses the address or searches the PDU map
+  void set_slave_id(uint8_t slave_id) { this->slave_id_ = slave_id; }
+  uint8_t get_slave_id() const { return this->slave_id_; }
+  void set_pdu_entry(const ImmergasPduEntry *entry) { this->pdu_entry_ = entry; }
+  const ImmergasPduEntry *get_pdu_entry() const { return this->pdu_entry_; }
+
+  // True while the published state is the one the controller restored from flash at boot,
+  // i.e. until the first live read of this entity's PDU arrives
+  bool is_stale() const { return this->stale_; }
+  void set_stale(bool stale) { this->stale_ = stale; }
+
   // Controller pointer (set by the controller on registration)
   void set_controller(class ImmergasModbus *ctrl) { this->controller_ = ctrl; }
   class ImmergasModbus *get_controller() const { return this->controller_; }
@@ -41,7 +68,40 @@ class IM_Device : public Component {
  protected:
   std::string address_;
   uint16_t pdu_{0};
+  uint32_t update_interval_{0};
+  uint8_t slave_id_{0};
+  bool stale_{false};
+  const ImmergasPduEntry *pdu_entry_{nullptr};
   class ImmergasModbus *controller_{nullptr};
+
+  // True if `value` should be published; records it as the last published value if so
+  bool should_publish_(float value) {
+    const uint32_t now = millis();
+    if (this->has_published_ && !(this->heartbeat_ms_ != 0 && now - this->last_publish_ms_ >= this->heartbeat_ms_)) {
+      if (std::isnan(value) || std::isnan(this->last_published_)) {
+        if (std::isnan(value) == std::isnan(this->last_published_)) return false;
+      } else {
+        float delta = std::fabs(value - this->last_published_);
+        float band = std::max(this->deadband_, this->relative_deadband_ * std::fabs(this->last_published_));
+        if (band > 0.0f ? delta < band : delta == 0.0f) return false;
+      }
+    }
+    this->note_published_(value);
+    return true;
+  }
+  // Record a value published outside the poll path, e.g. optimistically after a write
+  void note_published_(float value) {
+    this->has_published_ = true;
+    this->last_published_ = value;
+    this->last_publish_ms_ = millis();
+  }
+
+  float deadband_{0.0f};
+  float relative_deadband_{0.0f};
+  uint32_t heartbeat_ms_{0};
+  bool has_published_{false};
+  float last_published_{NAN};
+  uint32_t last_publish_ms_{0};
 };
 
 }  // namespace immergas_modbus
@@ -0,0 +1,89 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+namespace esphome {
+namespace immergas_modbus {
+
+enum ImmergasLabelField : uint8_t { IM_LABEL_TEXT1 = 0, IM_LABEL_TEXT2, IM_LABEL_ACTION, IM_LABEL_COMMENT };
+
+// Reads the packed label catalog written by immergas/label_catalog.py straight out of
+// flash: string ids per language and fault code into a blob of NUL-terminated strings.
+// Plain pointer reads, so the hub refuses `fault_text` on the ESP8266, where the
+// array would not stay in flash.
+class ImmergasLabelCatalog {
+ public:
+  static constexpr uint16_t DEFAULT_CODE = 0xFFFF;
+
+  ImmergasLabelCatalog() = default;
+  explicit ImmergasLabelCatalog(const uint8_t *data) {
+    if (data == nullptr || data[0] != 'I' || data[1] != 'M' || data[2] != 'L' || data[3] != 'C' || data[4] != 1)
+      return;
+    this->fields_ = data[5];
+    this->languages_ = u16_(data + 6);
+    this->codes_ = u16_(data + 8);
+    const uint32_t strings = u32_(data + 12);
+    size_t pos = 16;
+    this->tags_ = data + pos;
+    pos += 2 * this->languages_;
+    this->code_table_ = data + pos;
+    pos += 2 * this->codes_;
+    pos += (4 - pos % 4) % 4;
+    this->offsets_ = data + pos;
+    pos += 4 * (strings + 1);
+    this->ids_ = data + pos;
+    pos += 2 * this->languages_ * this->codes_ * this->fields_;
+    this->blob_ = reinterpret_cast<const char *>(data + pos);
+  }
+
+  bool valid() const { return this->blob_ != nullptr; }
+
+  // Index of the two-letter language `lang`, or -1
+  int language_index(const char *lang) const {
+    for (uint16_t i = 0; lang != nullptr && i < this->languages_; i++) {
+      if (this->tags_[2 * i] == lang[0] && this->tags_[2 * i + 1] == lang[1]) return i;
+    }
+    return -1;
+  }
+
+  // Text of fault `code`, falling back to the catalog's 'default' entry; nullptr if neither exists
+  const char *text(int lang, uint16_t code, ImmergasLabelField field) const {
+    if (!this->valid() || lang < 0 || lang >= this->languages_ || field >= this->fields_) return nullptr;
+    int index = this->find_code_(code);
+    if (index < 0) index = this->find_code_(DEFAULT_CODE);
+    if (index < 0) return nullptr;
+    const size_t slot = (static_cast<size_t>(lang) * this->codes_ + index) * this->fields_ + field;
+    return this->blob_ + u32_(this->offsets_ + 4 * u16_(this->ids_ + 2 * slot));
+  }
+
+ protected:
+  static uint16_t u16_(const uint8_t *p) { return p[0] | (p[1] << 8); }
+  static uint32_t u32_(const uint8_t *p) {
+    return p[0] | (p[1] << 8) | (p[2] << 16) | (static_cast<uint32_t>(p[3]) << 24);
+  }
+
+  // codes are stored ascending
+  int find_code_(uint16_t code) const {
+    size_t lo = 0, hi = this->codes_;
+    while (lo < hi) {
+      size_t mid = (lo + hi) / 2;
+      uint16_t c = u16_(this->code_table_ + 2 * mid);
+      if (c == code) return mid;
+      if (c < code) lo = mid + 1; else hi = mid;
+    }
+    return -1;
+  }
+
+  uint8_t fields_{0};
+  uint16_t languages_{0};
+  uint16_t codes_{0};
+  const uint8_t *tags_{nullptr};
+  const uint8_t *code_table_{nullptr};
+  const uint8_t *offsets_{nullptr};
+  const uint8_t *ids_{nullptr};
+  const char *blob_{nullptr};
+};
+
+}  // namespace immergas_modbus
+}  // namespace esphome
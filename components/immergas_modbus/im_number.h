@@ -16,21 +16,19 @@ class IM_Number : public number::Number, public IM_Device {
       ESP_LOGW("immergas_modbus", "IM_Number: controller not set for device %s", this->get_address().c_str());
       return;
     }
-    uint16_t pdu = this->get_pdu();
-    if (pdu == 0) {
-      ESP_LOGW("immergas_modbus", "IM_Number: no PDU configured for device %s", this->get_address().c_str());
+    const ImmergasPduEntry *entry = this->get_pdu_entry();
+    if (entry == nullptr) {
+      ESP_LOGW("immergas_modbus", "IM_Number: no known PDU or slave configured for device %s", this->get_address().c_str());
       return;
     }
-    uint16_t slave = this->parse_slave();
-    if (slave == 0) {
-      ESP_LOGW("immergas_modbus", "IM_Number: invalid slave address '%s'", this->get_address().c_str());
-      return;
-    }
-    bool ok = ctrl->write_pdu_by_value(static_cast<uint8_t>(slave), pdu, value);
-    if (!ok) ESP_LOGW("immergas_modbus", "IM_Number: write failed for slave %d pdu %d", slave, pdu);
+    bool ok = ctrl->write_pdu(this->get_slave_id(), *entry, value);
+    if (!ok) ESP_LOGW("immergas_modbus", "IM_Number: write failed for slave %d pdu %d", this->get_slave_id(), this->get_pdu());
     this->publish_state(value);
+    this->note_published_(value);
+  }
+  void handle_immergas_update(uint16_t pdu, float value) override {
+    if (this->should_publish_(value)) this->publish_state(value);
   }
-  void handle_immergas_update(uint16_t pdu, float value) override { this->publish_state(value); }
 };
 
 }  // namespace immergas_modbus
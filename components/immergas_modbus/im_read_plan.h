@@ -0,0 +1,88 @@
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <set>
+#include <vector>
+
+namespace esphome {
+namespace immergas_modbus {
+
+// One holding-register read in a slave's read plan. `entry_offset`/`entry_count`
+// select the slice of `ImmergasSlave::plan_entries` (indices into
+// `immergas_pdu_map`) that are decoded from the response. Registers in the
+// range that belong to no entry are gap fillers read only to merge requests.
+struct ImmergasReadBatch {
+  uint16_t start;
+  uint16_t count;
+  uint16_t entry_offset;
+  uint16_t entry_count;
+  uint8_t tier;  // index into ImmergasModbus::tiers_
+  bool queued;   // waiting in the read queue or on the bus
+};
+
+// Tier of a map entry that is not polled
+static const uint8_t IM_PLAN_SKIP = 0xFF;
+
+// Bytes of a function 0x03 round trip that do not depend on the register count:
+// request frame (8) + response header and CRC (5) + two 3.5 character silences (7).
+static const uint32_t IM_READ_OVERHEAD_CHARS = 20;
+// Conservative estimate of the slave's processing time before it answers
+static const uint32_t IM_SLAVE_TURNAROUND_US = 20000;
+
+// Largest run of unused registers worth reading at `baud` to save one round trip
+inline uint16_t immergas_max_bridge_gap(uint32_t baud, uint16_t max_registers) {
+  if (baud == 0) baud = 9600;
+  // RTU characters are always 11 bits (start, 8 data, parity or 2nd stop, stop)
+  uint32_t char_us = 11000000UL / baud;
+  uint32_t round_trip_us = IM_READ_OVERHEAD_CHARS * char_us + IM_SLAVE_TURNAROUND_US;
+  // each filler register costs two extra response characters
+  uint32_t gap = round_trip_us / (2 * char_us);
+  return static_cast<uint16_t>(std::min<uint32_t>(gap, max_registers));
+}
+
+// Batch the entries of `map` (ordered by register) into holding-register reads, one set of
+// batches per tier in `tiers`; `entry_tiers[i]` is the tier of entry i or IM_PLAN_SKIP.
+// Gaps of up to `max_gap` registers are bridged unless one of their registers is in
+// `no_bridge`, `isolated` entries (if given) are always read alone, and no batch exceeds
+// `max_registers`. Free of ESPHome so tests/test_read_plan.py can hold immergas/read_plan.py,
+// which plans at codegen time, to the same result.
+template<typename Entry>
+void immergas_plan_reads(const Entry *map, size_t len, const uint8_t *entry_tiers, const std::set<uint8_t> &tiers,
+                         const std::vector<bool> &isolated, const std::set<uint16_t> &no_bridge, uint16_t max_gap,
+                         uint16_t max_registers, std::vector<ImmergasReadBatch> *plan,
+                         std::vector<uint16_t> *plan_entries) {
+  for (uint8_t tier : tiers) {
+    size_t tier_first_batch = plan->size();
+    for (size_t i = 0; i < len; ++i) {
+      const Entry &e = map[i];
+      if (entry_tiers[i] != tier) continue;
+      if (plan->size() > tier_first_batch) {
+        ImmergasReadBatch &last = plan->back();
+        uint32_t last_end = static_cast<uint32_t>(last.start) + last.count;
+        uint32_t e_end = static_cast<uint32_t>(e.reg_addr) + e.count;
+        bool mergeable = e.reg_addr >= last.start && e_end - last.start <= max_registers;
+        if (!isolated.empty()) mergeable = mergeable && !isolated[i] && !isolated[plan_entries->back()];
+        if (mergeable && e.reg_addr > last_end) {
+          mergeable = e.reg_addr - last_end <= max_gap;
+          for (uint32_t r = last_end; mergeable && r < e.reg_addr; ++r) {
+            if (no_bridge.count(static_cast<uint16_t>(r))) mergeable = false;
+          }
+        }
+        // entries are added whole, so a 32-bit value is always read in one frame
+        if (mergeable) {
+          last.count = static_cast<uint16_t>(std::max(last_end, e_end) - last.start);
+          last.entry_count++;
+          plan_entries->push_back(static_cast<uint16_t>(i));
+          continue;
+        }
+      }
+      plan->push_back(ImmergasReadBatch{e.reg_addr, e.count, static_cast<uint16_t>(plan_entries->size()), 1, tier, false});
+      plan_entries->push_back(static_cast<uint16_t>(i));
+    }
+  }
+}
+
+}  // namespace immergas_modbus
+}  // namespace esphome
@@ -0,0 +1,39 @@
+#pragma once
+
+#include <atomic>
+#include <cstddef>
+
+namespace esphome {
+namespace immergas_modbus {
+
+// Fixed-size single-producer/single-consumer queue. One thread only push()es and
+// another only pop()s, so neither takes a lock. `N` must be a power of two.
+template<typename T, size_t N> class ImmergasSpscRing {
+  static_assert(N != 0 && (N & (N - 1)) == 0, "ring size must be a power of two");
+
+ public:
+  // Producer side. Returns false if the ring is full.
+  bool push(const T &item) {
+    const size_t tail = this->tail_.load(std::memory_order_relaxed);
+    if (tail - this->head_.load(std::memory_order_acquire) == N) return false;
+    this->items_[tail & (N - 1)] = item;
+    this->tail_.store(tail + 1, std::memory_order_release);
+    return true;
+  }
+  // Consumer side. Returns false if the ring is empty.
+  bool pop(T *item) {
+    const size_t head = this->head_.load(std::memory_order_relaxed);
+    if (head == this->tail_.load(std::memory_order_acquire)) return false;
+    *item = this->items_[head & (N - 1)];
+    this->head_.store(head + 1, std::memory_order_release);
+    return true;
+  }
+
+ protected:
+  T items_[N];
+  std::atomic<size_t> head_{0};
+  std::atomic<size_t> tail_{0};
+};
+
+}  // namespace immergas_modbus
+}  // namespace esphome
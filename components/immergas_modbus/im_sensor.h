@@ -0,0 +1,19 @@
+#pragma once
+#include "esphome.h"
+#include "im_device.h"
+
+namespace esphome {
+namespace immergas_modbus {
+
+class IM_Sensor : public sensor::Sensor, public IM_Device {
+ public:
+  IM_Sensor(const std::string &address) : IM_Device(address) {}
+  void setup() override {}
+  void loop() override {}
+  void handle_immergas_update(uint16_t pdu, float value) override {
+    if (this->should_publish_(value)) this->publish_state(value);
+  }
+};
+
+}  // namespace immergas_modbus
+}  // namespace esphome
@@ -16,27 +16,19 @@ class IM_Switch : public switch_::Switch, public IM_Device {
       ESP_LOGW("immergas_modbus", "IM_Switch: controller not set for device %s", this->get_address().c_str());
       return;
     }
-    uint16_t pdu = this->get_pdu();
-    if (pdu == 0) {
-      ESP_LOGW("immergas_modbus", "IM_Switch: no PDU configured for device %s", this->get_address().c_str());
-      return;
-    }
-    uint16_t slave = 0;
-    try {
-      std::string addr = this->get_address();
-      size_t pos = addr.find('.');
-      if (pos != std::string::npos) slave = static_cast<uint16_t>(std::stoi(addr.substr(0, pos)));
-      else slave = static_cast<uint16_t>(std::stoi(addr));
-    } catch (...) { slave = 0; }
-    if (slave == 0) {
-      ESP_LOGW("immergas_modbus", "IM_Switch: invalid slave address '%s'", this->get_address().c_str());
+    const ImmergasPduEntry *entry = this->get_pdu_entry();
+    if (entry == nullptr) {
+      ESP_LOGW("immergas_modbus", "IM_Switch: no known PDU or slave configured for device %s", this->get_address().c_str());
       return;
     }
     float v = state ? 1.0f : 0.0f;
-    bool ok = ctrl->write_pdu_by_value(static_cast<uint8_t>(slave), pdu, v);
-    if (!ok) ESP_LOGW("immergas_modbus", "IM_Switch: write failed for slave %d pdu %d", slave, pdu);
+    bool ok = ctrl->write_pdu(this->get_slave_id(), *entry, v);
+    if (!ok) ESP_LOGW("immergas_modbus", "IM_Switch: write failed for slave %d pdu %d", this->get_slave_id(), this->get_pdu());
+  }
+  void handle_immergas_update(uint16_t pdu, float value) override {
+    bool state = value >= 1.0f;
+    if (this->should_publish_(state ? 1.0f : 0.0f)) this->publish_state(state);
   }
-  void handle_immergas_update(uint16_t pdu, float value) override { this->publish_state(value >= 1.0f); }
 };
 
 }  // namespace immergas_modbus
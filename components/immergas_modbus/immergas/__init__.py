@@ -1,3 +1,3 @@
 """Immergas labels and constants package placeholder."""
 
-__all__ = ["const", "labels_en", "labels_it"]
+__all__ = ["const", "labels"]
@@ -0,0 +1,176 @@
+"""Packed catalog of the fault labels of every language.
+
+Most fault texts repeat across languages (untranslated entries fall back to the
+English text), so every distinct string is stored once and each language is an
+array of string ids. Layout, all little-endian:
+
+    "IMLC", u8 version, u8 fields, u16 languages, u16 codes, u16 0, u32 strings
+    languages x 2 ASCII bytes    language tags
+    codes x u16                  fault codes, ascending; 0xFFFF is the 'default' entry
+    padding to 4 bytes
+    (strings + 1) x u32          offsets of the strings in the blob
+    languages x codes x fields x u16   string ids
+    blob                         UTF-8 strings, each NUL-terminated
+
+The reader works on a `memoryview` of the file and decodes a string only when
+it is looked up. `im_labels.h` reads the same layout on the device.
+"""
+import array
+import struct
+import sys
+
+MAGIC = b"IMLC"
+VERSION = 1
+FIELDS = ("text1", "text2", "action", "comment")
+DEFAULT_CODE = 0xFFFF
+_HEADER = struct.Struct("<4sBBHHHI")
+
+
+def _code_key(code):
+    return DEFAULT_CODE if code == "default" else int(code)
+
+
+def pack(mappings):
+    """Catalog bytes of `mappings`: language -> fault code (or 'default') -> field -> text."""
+    langs = sorted(mappings)
+    codes = sorted({_code_key(c) for m in mappings.values() for c in m})
+    strings = {}
+    ids = []
+    for lang in langs:
+        by_code = {_code_key(c): d for c, d in mappings[lang].items()}
+        for code in codes:
+            entry = by_code.get(code, {})
+            for field in FIELDS:
+                ids.append(strings.setdefault(entry.get(field) or "", len(strings)))
+    if len(strings) > 0xFFFF:
+        raise ValueError("label catalog holds more than 65535 distinct strings")
+
+    blob = bytearray()
+    offsets = []
+    for text in strings:
+        offsets.append(len(blob))
+        blob += text.encode("utf-8") + b"\0"
+    offsets.append(len(blob))
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(FIELDS), len(langs), len(codes), 0, len(strings)))
+    for lang in langs:
+        out += lang.encode("ascii")[:2].ljust(2, b"\0")
+    out += struct.pack("<%dH" % len(codes), *codes)
+    out += b"\0" * (-len(out) % 4)
+    out += struct.pack("<%dI" % len(offsets), *offsets)
+    out += struct.pack("<%dH" % len(ids), *ids)
+    out += blob
+    return bytes(out)
+
+
+def read_languages(path):
+    """Language tags of the catalog at `path`, reading only its header."""
+    with open(path, "rb") as fh:
+        head = fh.read(_HEADER.size)
+        _check(head)
+        count = _HEADER.unpack(head)[3]
+        tags = fh.read(2 * count)
+    return tuple(tags[i:i + 2].decode("ascii").rstrip("\0") for i in range(0, len(tags), 2))
+
+
+def _check(head):
+    if len(head) < _HEADER.size or head[:4] != MAGIC or head[4] != VERSION:
+        raise ValueError("not an Immergas label catalog (version %d)" % VERSION)
+
+
+def _cast(view, fmt):
+    # the layout is little-endian; only a big-endian host needs a converted copy
+    if sys.byteorder == "little":
+        return view.cast(fmt)
+    values = array.array(fmt, view.tobytes())
+    values.byteswap()
+    return values
+
+
+class LabelCatalog:
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        _check(view[:_HEADER.size])
+        _, _, fields, langs, codes, _, strings = _HEADER.unpack_from(view)
+        pos = _HEADER.size
+        self.languages = tuple(
+            bytes(view[pos + 2 * i:pos + 2 * i + 2]).decode("ascii").rstrip("\0") for i in range(langs)
+        )
+        pos += 2 * langs
+        self._codes = _cast(view[pos:pos + 2 * codes], "H")
+        pos += 2 * codes
+        pos += -pos % 4
+        self._offsets = _cast(view[pos:pos + 4 * (strings + 1)], "I")
+        pos += 4 * (strings + 1)
+        self._ids = _cast(view[pos:pos + 2 * langs * codes * fields], "H")
+        pos += 2 * langs * codes * fields
+        self._blob = view[pos:]
+        self._fields = fields
+        self._code_index = {code: i for i, code in enumerate(self._codes)}
+
+    def string(self, sid):
+        return str(self._blob[self._offsets[sid]:self._offsets[sid + 1] - 1], "utf-8")
+
+    def entry(self, lang, code):
+        """Field -> text of fault `code` in language index `lang`, or None if the code is unknown."""
+        index = self._code_index.get(_code_key(code))
+        if index is None:
+            return None
+        base = (lang * len(self._codes) + index) * self._fields
+        return {field: self.string(self._ids[base + f]) for f, field in enumerate(FIELDS)}
+
+    def codes(self):
+        return ["default" if code == DEFAULT_CODE else code for code in self._codes]
+
+    def table(self, lang):
+        return LabelTable(self, self.languages.index(lang))
+
+
+class LabelTable:
+    """Read-only `dict`-like view of one language, keyed by fault code."""
+
+    def __init__(self, catalog, lang):
+        self._catalog = catalog
+        self._lang = lang
+
+    def get(self, code, default=None):
+        try:
+            entry = self._catalog.entry(self._lang, code)
+        except (TypeError, ValueError):
+            return default
+        return default if entry is None else entry
+
+    def __getitem__(self, code):
+        entry = self.get(code)
+        if entry is None:
+            raise KeyError(code)
+        return entry
+
+    def __contains__(self, code):
+        return self.get(code) is not None
+
+    def __iter__(self):
+        return iter(self._catalog.codes())
+
+    def __len__(self):
+        return len(self._catalog.codes())
+
+    def items(self):
+        return ((code, self[code]) for code in self)
+
+
+def subset(catalog, langs):
+    """Catalog bytes holding only the languages in `langs`."""
+    return pack({lang: dict(catalog.table(lang).items()) for lang in langs})
+
+
+def render_header(blob):
+    """C++ declaration of `blob` as `immergas_label_catalog`, for `ImmergasLabelCatalog`."""
+    lines = ["#include <cstdint>", "namespace esphome { namespace immergas_modbus {"]
+    lines.append("static const uint8_t immergas_label_catalog[] = {")
+    for k in range(0, len(blob), 24):
+        lines.append("    " + ", ".join("0x%02X" % b for b in blob[k:k + 24]) + ",")
+    lines.append("};")
+    lines.append("}  // namespace immergas_modbus")
+    lines.append("}  // namespace esphome")
+    return "\n".join(lines) + "\n"
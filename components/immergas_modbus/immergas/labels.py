@@ -0,0 +1,60 @@
+"""Fault labels for the language selected on the `immergas_modbus` hub.
+
+The labels of all languages live in one packed catalog, `labels.bin` (see
+label_catalog.py). They are the texts of boiler fault codes, not names of PDUs:
+entity names come from `auto_entities.py`, in English. Importing this module only
+reads the catalog's language tags; the catalog itself is loaded the first time a
+label is looked up, and strings are decoded one at a time. `immergas_labels` is a
+dict-like view keyed by fault code, and the hub embeds the catalog for `fault_text`.
+"""
+import functools
+import os
+
+from esphome.core import CORE
+
+from . import label_catalog
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "labels.bin")
+DEFAULT_LANGUAGE = "en"
+LANGUAGES = label_catalog.read_languages(CATALOG_PATH)
+
+
+def active_language():
+    """The hub's `language` option; platforms may be validated before the hub, so read the raw config."""
+    hub = (CORE.raw_config or {}).get("immergas_modbus")
+    lang = hub.get("language", DEFAULT_LANGUAGE) if isinstance(hub, dict) else DEFAULT_LANGUAGE
+    return lang if lang in LANGUAGES else DEFAULT_LANGUAGE
+
+
+@functools.lru_cache(maxsize=None)
+def get_catalog():
+    with open(CATALOG_PATH, "rb") as fh:
+        return label_catalog.LabelCatalog(fh.read())
+
+
+@functools.lru_cache(maxsize=None)
+def get_labels(lang):
+    return get_catalog().table(lang)
+
+
+class LabelRegistry:
+    """Read-only view of the labels of the active language."""
+
+    @property
+    def language(self):
+        return active_language()
+
+    def _labels(self):
+        return get_labels(self.language)
+
+    def get(self, key, default=None):
+        return self._labels().get(key, default)
+
+    def __getitem__(self, key):
+        return self._labels()[key]
+
+    def __contains__(self, key):
+        return key in self._labels()
+
+
+immergas_labels = LabelRegistry()
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: bg)"""
-
-immergas_labels = {
-    'default': {"text1": 'Разпознат общ проблем', "text2": 'Проверете таблицата с грешки или избраната платка', "action": 'Проверете таблицата с грешки или избраната платка', "comment": 'Никаква бележка в тази връзка'},
-    0: {"text1": 'СИСТЕМА ОК', "text2": 'Системата работи правилно', "action": 'Никакво заявено действие', "comment": 'Никакъв проблем'},
-    1: {"text1": 'Блокиране незапалване', "text2": 'Не е отчетен пламък в края на последния опит за запалване', "action": 'Натиснете бутон Нулиране (Reset)', "comment": 'В случай на заявка за отопление или производство на битова гореща вода, котелът не се запалва в предварително определеното време. При първото запалване или след продължителен период на престой на уреда може да се наложи да се намесите, за да отстраните блокирането.'},
-    2: {"text1": 'Блокиране на предпазен термостат (свръхтемпература)', "text2": 'Сработване на предпазния термостат', "action": 'Натиснете бутон Нулиране (Reset)', "comment": 'Ако поради проблем по време на нормалния режим на функциониране се установи прекомерно вътрешно прегряване, котелът блокира.'},
-    3: {"text1": 'Блокиране на термостата за дим', "text2": 'Сработване на термостата за дим', "action": 'Натиснете бутон Нулиране (Reset) (версии Nike)/ Конфигурирайте параметър P.14 правилно. Ако е необходимо, натиснете бутон Reset (версии Star)', "comment": 'Ако поради проблем по време на нормалния режим на функциониране се установи прегряване на дима, котелът блокира (версии Nike)/ Погрешно конфигуриране на параметър P.14 (версия Star)'},
-    4: {"text1": 'Блокиране съпротивление контакти', "text2": 'Отчетен е проблем във веригата за управление на газовия вентил', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Електронната платка отчита проблем при захранването на газовия вентил. Проверете свързването му. (проблемът се открива и показва само при наличие на заявка).'},
-    5: {"text1": 'Проблем на сонда подаване', "text2": 'Сондата при подаването е със стойност на съпротивление извън позволения диапазон', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката установява проблем в сонда NTC подаване.'},
-    6: {"text1": 'Проблем на сондата за битова вода', "text2": 'Сондата за битова вода е със стойност на съпротивление извън позволения диапазон', "action": 'Котелът продължава да произвежда битова гореща вода, но не с оптимални работни характеристики. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката установява проблем в сонда NTC за битова вода.'},
-    8: {"text1": 'Максимален брой нулирания', "text2": 'Показва достигането на максималния брой нулирания, разрешени от вградената платка', "action": 'Внимание: възможно е да нулирате проблема до 5 последователни пъти, след което функцията се забранява за поне един час и имате право на един опит на всеки час, максимум 5 опита. Чрез спиране и повторно включване на захранването към уреда, отново имате право на 5 опита.', "comment": 'Вече изпълнен наличен брой нулирания.'},
-    10: {"text1": 'Недостатъчно налягане на инсталацията', "text2": 'Контактът на пресостата на инсталацията е отворен', "action": 'Проверете дали налягането на инсталацията, отчетено от манометъра, е между 1÷1,2 bar включително и при необходимост възстановете правилното налягане.', "comment": 'Налягането на водата във вътрешността на отоплителната верига не е отчетено като достатъчно, за да осигури правилно функциониране на котела.'},
-    11: {"text1": 'Проблем с пресостата за димните газове', "text2": 'Възможен проблем при пресостата за димните газове или при вентилатора', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'При възстановяване на условията на нормална работа, котелът възобновява работа без необходимост да бъде върнат в първоначалното си състояние'},
-    12: {"text1": 'Проблем сонда бойлер', "text2": 'Сондата на бойлера е със стойност на съпротивление извън позволения диапазон', "action": 'Котелът не може да произвежда битова гореща вода. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката отчита проблем при сондата на бойлера'},
-    13: {"text1": 'Уред за измерване на дебита въздух/димни газове извън позволения диапазон', "text2": 'Сигналът за въздух/димни газове е извън позволения диапазон или контролерът отчита твърде висок сигнал при спрял вентилатор', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Контролерът на въздух/димни газове отчита твърде висок сигнал при спрял вентилатор (клеясали контакти на пресостата)'},
-    15: {"text1": 'Грешка конфигурация', "text2": 'Платката отчита несъответствие между своята конфигурация и сигналите на входа', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието. Проверете дали котелът е бил конфигуриран правилно. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката отчита проблем или несъответствие при електрическото окабеляване на котела и не стартира.'},
-    16: {"text1": 'Проблем вентилатор', "text2": 'Вентилаторът се върти, когато не е захранен или е спрял, когато е захранен', "action": 'Натиснете бутон Reset. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Настъпва в случай, че има повреда по механиката или електрониката на вентилатора.'},
-    17: {"text1": 'Неправилна скорост на вентилатора', "text2": 'Броят обороти на вентилатора е извън правилния диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Неправилен брой обороти на вентилатора'},
-    20: {"text1": 'Блокиране на паразитен пламък', "text2": 'Отчитане на аномален пламък', "action": 'Натиснете бутон Reset. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Установява се при разсейване във веригата за отчитане или проблем при контрола на пламъка.'},
-    23: {"text1": 'Проблем на сондата при връщането', "text2": 'Сондата при връщането  е със стойност на съпротивление извън позволения диапазон', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката установява проблем в сонда NTC подаване.'},
-    24: {"text1": 'Проблем клавиатура', "text2": 'Отчита се непрекъснато натискане на бутоните на таблото за управление', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката отчита проблем при клавиатурата.'},
-    25: {"text1": 'Блокиране на сондата за димни газове / блокиране на CRC (TERA)', "text2": 'Температура на димните газове извън позволения диапазон / повредена памет (TERA)', "action": 'Натиснете бутон Reset', "comment": 'Повишен градиент на димните газове, вероятно блокиране на циркулационната помпа или липса на вода / повредена памет'},
-    27: {"text1": 'Недостатъчна циркулация', "text2": 'Прегряване на котела вследствие на недостатъчна циркулация в първичния кръг', "action": 'Натиснете бутон Reset', "comment": 'Проверете дали няма прекъсвания по веригата за отопление и/или дали циркулационната помпа работи добре'},
-    28: {"text1": 'Просмукване от веригата за битова вода', "text2": 'Ако по време на работа, на етап загряване, бъде открито покачване на температурата на битовата вода, котелът подава сигнал за проблем и намалява температурата на загряване, за да ограничи образуването на котлен камък в топлообменника.', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Проверете дали всички кранове на инсталацията за битова вода са затворени и дали не пропускат течност, като също така проверите дали няма течове от инсталацията. Котелът се връща към нормалната си работа след възстановяване на оптималните условия на инсталацията за битова вода'},
-    29: {"text1": 'Проблем на сондата на дима', "text2": 'Сондата за дим е със стойност на съпротивление извън позволения диапазон', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Платката отчита проблем при сондата за димни газове.'},
-    31: {"text1": 'Загуба на комуникация с Дистанционното управление CARV2', "text2": 'Няма комуникация между платката и дистанционното управление.', "action": 'Спрете и отново подайте напрежение към котела. Ако при повторното включване дистанционното управление не бъде разпознато, котелът преминава в локален работен режим и следователно използва командите, налични върху командния панел. В този случай не е възможно да активирате функция “Отопление”.', "comment": 'Настъпва в случай на свързване към несъвместимо дистанционно управление, или при спад на комуникацията между котела и CARV2.'},
-    32: {"text1": 'Проблем със сонда в нискотемпературната зона 2', "text2": 'Сондата при подаването в зона 2 е извън позволения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сондата в нискотемпературната зона 2 - системата не може да работи в засегнатата зона'},
-    33: {"text1": 'Проблем със сондата в нискотемпературната зона 3', "text2": 'Сондата при подаването в зона 3 е извън позволения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сондата в нискотемпературната зона 2 - системата не може да работи в засегнатата зона'},
-    36: {"text1": 'Загуба на комуникация IMG Bus', "text2": 'Загуба на комуникация при протокола IMG Bus.', "action": 'Котелът не задоволява нуждата от отопление.', "comment": 'Поради проблем в пулта за управление на котела, при разделената на зони платка (опционална) или при IMG Bus се прекъсва комуникацията между различните компоненти.'},
-    37: {"text1": 'Ниско захранващо напрежение', "text2": 'Стойността на напрежението на захранване на платката е по-ниска от позволените граници.', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието.', "comment": 'Установява се в случай, че захранващото напрежение е по-ниско от границите, разрешени за правилно функциониране на котела.'},
-    38: {"text1": 'Загуба на сигнал за пламък', "text2": 'След установяване на правилната стойност на ток на пламъка, платката сигнализира спад на тока на пламъка.', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието.', "comment": 'Установява се в случай, че котелът е правилно включен и настъпи неочаквано изгасване на пламъка на горелката; изпълнява се нов опит за повторно запалване и при възстановяване на нормалните условия котелът не се нуждае от нулиране на състоянието.'},
-    39: {"text1": 'проблем със сондата на соларния колектор', "text2": 'Външната сонда е със стойност на съпротивление извън позволения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сондата на соларния колектор. Котелът продължава да работи нормално, без да използва слънчева енергия за загряването на битовата гореща вода, тъй като соларната помпа спира да работи'},
-    40: {"text1": 'Проблем със сондата на соларния резервоар', "text2": 'Сондата на соларния резервоар е със стойност на съпротивление извън позволения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сондата на соларния резервоар. Котелът продължава да работи нормално, без да използва слънчева енергия за загряването на битовата гореща вода, тъй като соларната помпа спира да работи.'},
-    41: {"text1": 'Повишена температура при соларния колектор', "text2": 'Соларният колектор е надвишил настроената максимална температура', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Установява се, когато температурата на соларния колектор надхвърли настроения максимум'},
-    42: {"text1": 'Повишена температура при соларния резервоар', "text2": 'Соларният резервоар е надвишил настроената максимална температура', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Установява се, когато температурата на водата в соларния резервоар надхвърли настроения максимум.'},
-    43: {"text1": 'Блокиране поради загуба на сигнал за пламък', "text2": 'Загуба на сигнал за пламък при работа в нормален режим няколко последователни пъти.', "action": 'Натиснете бутон Reset, преди да заработи отново, котелът извършва един цикъл на поствентилация. ', "comment": 'Установява се, ако няколко последователни пъти в рамките на дадено предварително определено време се появи грешка “Загуба на сигнал за пламък”.'},
-    44: {"text1": 'Блокиране поради надхвърляне на максималното време за отваряне на газов вентил', "text2": 'Общото сумирано време на отваряне на газовия вентил без отчитане на пламък е по-голямо от максимално разрешеното.', "action": 'Натиснете бутон Reset.', "comment": 'Установява се в случай, че газовият вентил остане отворен за време, по-дълго от предвиденото за нормалното му функциониране без котелът да се включи.'},
-    45: {"text1": 'повишена ΔT', "text2": 'Разликата в измерената температура между подаването и връщането е ≥ от 40°C.', "action": 'Мощността на горелката се ограничава, за да се предотвратят евентуални щети на кондензния модул. След възстановяване на правилното ΔT, котелът се връща към нормалната си работа. Проверете дали има циркулация на вода в котела, дали циркулационната помпа е конфигурирана според нуждите на инсталацията и дали сондата при връщането работи правилно.', "comment": 'Котелът отчита внезапно и непредвидено повишаване на ΔT между сондата при подаването и сондата при връщането на инсталацията.'},
-    46: {"text1": 'Сработване на термостата за ниска температура / Погрешно конфигуриране на окабеляване/платка', "text2": 'Предпазният термостат, поставен при свързването на подаването от котел към DIM v2 (работещ единствено при ниска температура), е достигнал високи температури. / Грешка при окабеляването или използване на грешна резервна платка', "action": 'В този случай трябва да рестартирате термостата (вж. съответния лист с инструкции), след като изчакате да се охлади. / Ако блокирането или проблемът продължават, трябва да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Ако поради проблем по време на нормалния режим на работа се установи прекомерно повишение на температурата на подаване при ниска температура, котелът блокира. / Грешка при окабеляването или използване на грешна резервна платка'},
-    47: {"text1": 'Редуцирана мощност на горелката', "text2": 'Ако температурата на дима достигне висока стойност, платката намалява подаваната от горелката мощност, за да ограничи щетите по димната верига.', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'В случай, че се отчете висока температура на дима, котелът намалява разсеяната мощност, за да избегне повреди.'},
-    48: {"text1": 'Проблем при сондата на подаване от страна на инсталацията', "text2": 'Сондата при подаването от страната на инсталацията е със стойност на съпротивление извън позволения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'В случай че сондата при подаването от страната на инсталацията не е свързана или е повредена, се подава сигнал за проблем'},
-    49: {"text1": 'Блокиране поради завишена температура при сондата при връщането', "text2": 'Висока температура, измерена от сондата при връщането', "action": 'Проверете правилната циркулация в котела и доброто функциониране на трипътния вентил.', "comment": 'Настъпва, в случай че бъде достигната твърде висока температура във връщащия кръг на топлообменника'},
-    50: {"text1": 'Проблем с външната сонда', "text2": 'Външната сонда е със стойност на съпротивление извън позволения диапазон', "action": 'Проверете свързването на външната сонда. Системата продължава да работи', "comment": 'В случай че външната сонда не е свързана или е повредена, се подава сигнал за проблем'},
-    51: {"text1": 'Загуба на връзка с безжичното CAR', "text2": 'Комуникацията между предаващата база и CAR v2 RF е изчезнала.', "action": 'Проверете работата на безжичното дистанционно управление, проверете зареждането на батериите (вж съответната книжка с инструкции).', "comment": 'При загуба на комуникация между котела и дистанционното управление CAR в безжична версия, от този момент системата може да се управлява единствено чрез командния панел на котела.'},
-    54: {"text1": 'Проблем със сонда на топлоакумулиращия резервоар puffer', "text2": 'Сондата puffer е със стойност на съпротивление извън позволения диапазон', "action": 'Режим puffer се деактивира', "comment": 'В случай че сондата puffer не е свързана или е повредена, се подава сигнал за проблем'},
-    55: {"text1": 'Проблем при сондата за температура на подаване в Зона 1', "text2": 'Сондата при подаването на зона 1 е със стойност на съпротивление извън позволения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сондата в зона 1 при ниска температура - системата не може да работи в засегнатата зона.'},
-    58: {"text1": 'Неизправност на Audax', "text2": 'Подаден сигнал за неизправност от термопомпа AUDAX, свързана към системата', "action": 'Термопомпата не удовлетворява нуждата от отопление и охлаждане на помещението. След възстановяване на връзките, трябва да изключите системата и да я включите отново', "comment": 'Неизправност на термопомпа Audax, проверете типа неизправност директно на дисплея на термопомпата'},
-    59: {"text1": 'Честотно мрежово блокиране', "text2": 'Електронната платка е отчела ненормална честота по мрежата за електрозахранване.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита необичайна честота на захранването от електрическата мрежа.'},
-    60: {"text1": 'Проблем блокирана циркулационна помпа', "text2": 'Модулиращата циркулационна помпа е спряла.', "action": 'Опитайте се да разблокирате циркулационната помпа, както е описано в съответния параграф. В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието.', "comment": 'Циркулационната помпа е спряла по една от следните причини: блокирал ротор, електрическа повреда.'},
-    61: {"text1": 'Наличие на въздух в циркулационната помпа', "text2": 'Модулиращата циркулационна помпа е спряла поради констатиране на работа във въздуха.', "action": 'Обезвъздушете циркулационната помпа и отоплителния кръг. В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието.', "comment": 'Отчетено е наличие на въздух в циркулационната помпа; помпата не може да работи.'},
-    62: {"text1": 'Заявка за цялостно регулиране', "text2": 'Платката не е с правилно конфигуриране на параметрите за управление на горенето.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Отчита се липса на регулиране на електронната платка. Може да се установи при смяна на електронната платка или в случай на промяна на параметрите в секция въздух / газ, поради което се налага да се извърши “пълно регулиране”.'},
-    63: {"text1": 'Проблем при сонда връщане инсталация', "text2": 'Сондата при връщането е със стойност на съпротивление извън позволения диапазон', "action": 'Котелът продължава да работи без никаква интеграция от свързаните външни системи', "comment": 'В случай че сондата при връщането не е свързана или е повредена, се подава сигнал за проблем'},
-    67: {"text1": 'Проблем с пресостата на соларната инсталация', "text2": 'Отворен пресостат на инсталацията, възможна липса на флуид', "action": 'Върху манометъра на соларния циркулационен модул проверете дали стойността на налягането е правилна', "comment": 'Поради спад на налягането в соларния кръг пресостатът блокира работата на соларния отоплителен кръг'},
-    70: {"text1": 'Обърнати сонди', "text2": 'В случай на грешка при свързването на окабеляването на котела се отчита грешка', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Проверете свързването на сондата при подаването и при връщането'},
-    72: {"text1": 'Заявка за бързо регулиране', "text2": 'Платката не е с правилно конфигуриране на някои параметри за управление на горенето.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Отчита се промяна на някои параметри, поради което се налага “бързо регулиране“.'},
-    73: {"text1": 'Отчетена голяма разлика между сондата на подаване и предпазната сонда на подаване', "text2": 'Сондите при подаването са с голямо отклонение.', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието', "comment": 'Платката установява проблем при отчитане на температурите на сондите за подаване NTC и причините за това може да бъдат: дефектна сонда, неправилно функциониране, недостатъчна циркулация на инсталацията, запушване на първичния топлообменник от страната на водата.'},
-    74: {"text1": 'Проблем на предпазната сонда при подаването', "text2": 'Предпазната сонда при подаването е със стойност на съпротивление извън позволения диапазон.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката установява проблем при предпазната сонда NTC при подаването.'},
-    75: {"text1": 'Блокиране поради повреден NTC сензор', "text2": 'Възможно счупване на една или и на двете сонди при подаването и връщането на инсталацията', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Сензорът на предпазната сонда предизвиква повишен температурен градиент'},
-    76: {"text1": 'Отклонение сонда подаване или сонда връщане', "text2": 'Отчита се неизправност на една или на двете сонди за подаване и връщане на инсталацията', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": ' По-голяма разлика спрямо настроената между сондата на подаване и на връщане в случай на заявка за топлина'},
-    77: {"text1": 'Проблем при управление на горенето', "text2": 'Отчетеният ток при газовия вентил е извън позволения диапазон.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Отчетеният при газовия вентил ток е извън разрешения диапазон.'},
-    78: {"text1": 'Проблем при управление на горенето', "text2": 'Отчетен повишен ток при газовия вентил.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Установено по-високо ел. напрежение при газовия вентил.'},
-    79: {"text1": 'Проблем при управление на горенето', "text2": 'Отчетена ниска стойност на тока при газовия вентил.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Установено по-ниско ел. напрежение при газовия вентил.'},
-    80: {"text1": 'Блокиране неизправност електронна платка', "text2": 'Отчетена повреда при задвижването на електронния газов вентил поради проблеми в платката или газовия вентил.', "action": 'Натиснете бутон Нулиране (Reset)', "comment": 'Установява се при неизправност на електронната платка, която управлява вентила.'},
-    84: {"text1": 'Проблем горене - текущо намаление на мощността', "text2": 'Отчетени условия, сходни на ниско налягане на подаване на газовия вентил.', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието', "comment": 'Отчита се ниско налягане на подаване при газовата мрежа. Вследствие на това се намалява мощността на уреда и се подава сигнал за проблем.'},
-    85: {"text1": 'Блокиране поради проблем на етапа след горенето', "text2": 'Потенциален проблем с газовия вентил, електрода или електронната платка', "action": 'Натиснете бутон Reset. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas)', "comment": 'Пламък, наличен след затваряне на газовия вентил'},
-    87: {"text1": 'Блокиране на управлението на газовия вентил', "text2": 'Отчетена повреда при управлението на газовия вентил.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Отчетена е неизправност на един от компонентите, които управляват газовия вентил.'},
-    88: {"text1": 'Блокиране на управлението на газовия вентил', "text2": 'Отчетена повреда при управлението на газовия вентил.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Отчетена е неизправност на един от компонентите, които управляват газовия вентил.'},
-    89: {"text1": 'Нестабилен сигнал за горене', "text2": 'Отчетена нестабилност на сигнала за горене.', "action": 'Котелът продължава да работи.', "comment": 'Пламъкът е нестабилен поради: наличие на циркулация на дим, вятър, нестабилно налягане на газа, нестабилна скорост на вентилатора или поради неизправност на системата.'},
-    90: {"text1": 'Сигнал за горене извън границите', "text2": 'Отчетеният сигнал за горене е извън разрешените граници.', "action": 'Котелът продължава да работи.', "comment": 'Отчетеният сигнал за горене е  продължително време извън предвидения диапазон на регулиране.'},
-    91: {"text1": 'Блокиране неправилно запалване', "text2": 'Платката е изчерпала всички си възможни действия, за да постигне оптимално запалване на горелката.', "action": 'Натиснете бутон Нулиране (Reset)', "comment": 'Платката е изчерпала всички си възможни действия, за да постигне оптимално запалване на горелката.'},
-    92: {"text1": 'Лимит на корекция на оборотите на вентилатора', "text2": 'Платката е достигнала максималната корекция на оборотите на вентилатора.', "action": 'Котелът продължава да работи.', "comment": 'Системата е изчерпала всички възможни корекции на броя обороти на вентилатора.'},
-    93: {"text1": 'Сигнал за горене извън границите', "text2": 'Отчетеният сигнал за горене е извън разрешените граници.', "action": 'Котелът продължава да работи.', "comment": 'Отчетеният сигнал за горене е  продължително време извън предвидения диапазон на регулиране.'},
-    94: {"text1": 'Проблем при горенето', "text2": 'Отчетен проблем с горенето, причинен от система или управление на горенето.', "action": 'В случай на възстановяване на нормалните условия, котелът заработва отново без нужда от нулиране на състоянието.', "comment": 'Отчита се проблем при управление на горенето, който може да е причинен от: ниско налягане на газа, циркулация на димни газове, дефектен газов вентил или дефектна електронна платка.'},
-    95: {"text1": 'Прекъснат сигнал за горене', "text2": 'Отчетени прекъсвания на сигнала за горенето поради проблеми с електрически връзки или разсейване на сигнала.', "action": 'Котелът продължава да работи.', "comment": 'Системата отчита прекъсвания на сигнала за горене.'},
-    96: {"text1": 'Запушена система за димоотвеждане', "text2": 'Отчетено повишено запушване на димоотводната верига.', "action": 'Котелът не стартира. Ако блокирането или проблемът продължава, е необходимо да повикате правоспособна фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Установява се при отчитане на запушване в димната система.'},
-    98: {"text1": 'Блокиране макс. бр. софтуерни грешки', "text2": 'Електронната платка не работи правилно.', "action": 'Натиснете бутон Нулиране (Reset)', "comment": 'Достигнат е максималният брой допустими софтуерни грешки.'},
-    99: {"text1": 'Общо блокиране', "text2": 'Електронната платка не работи правилно.', "action": 'Натиснете бутон Нулиране (Reset)', "comment": 'Отчетен е проблем в котела.'},
-    101: {"text1": 'Аларма офлайн Audax', "text2": 'Загуба на комуникация с термопомпата', "action": 'Термопомпата не удовлетворява нуждата от отопление и охлаждане на помещението. След възстановяване на връзките, трябва да изключите системата и да я включите отново', "comment": 'При загуба на комуникацията, грешно свързване или изключена термопомпа, електрониката на котела не отчита термопомпата'},
-    102: {"text1": 'Аларма поради офлайн режим на разширението на зона 1', "text2": 'Загуба на комуникация с разширението на зона 1', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Проблем при комуникацията със зона 1'},
-    103: {"text1": 'Аларма поради офлайн режим на разширението на зона 2', "text2": 'Загуба на комуникация с разширението на зона 2', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Проблем при комуникацията със зона 2'},
-    104: {"text1": 'Аларма поради офлайн режим на разширението на зона 3', "text2": 'Загуба на комуникация с разширението на зона 3', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Проблем при комуникацията със зона 3'},
-    106: {"text1": 'Аларма сонда за битова вода ', "text2": 'При интеграция с котел и отделно управление на битовата вода, контролираната сонда на бойлера е със стойност на съпротивление извън позволения диапазон', "action": 'Системата не може да произвежда битова гореща вода с термопомпата. Производството на битова гореща вода се осигурява от котела', "comment": 'Платката отчита проблем при сондата на бойлера'},
-    120: {"text1": 'Аларма поради висока настроена стойност за отнемане на влагата в зона 1', "text2": 'Изчислената зададена стойност на заявка в зона 1 е твърде висока за влагоулавяне', "action": 'Изчислената зададена стойност на подаване е по-висока от границата, допустима за влагоуловителя. Охладете помещението и изчакайте температурата на оросяване да се върне до приемливи стойности', "comment": 'Изчислената зададена стойност на подаване на охлаждане за влагоулавяне е по-висока от настроената граница в зона 1'},
-    121: {"text1": 'Аларма поради офлайн режим на устройството на зона 1', "text2": 'Дистанционното управление и дистанционният контрол на зона 1 е офлайн', "action": 'Проверете дали дистанционното управление е включено', "comment": 'Не се открива комуникация с контролера на зоната. Не може да се извърши терморегулация на зоната'},
-    122: {"text1": 'Аларма поради офлайн режим на устройството на зона 2', "text2": 'Дистанционното управление и дистанционният контрол на зона 2 е офлайн', "action": 'Проверете дали дистанционното управление е включено', "comment": 'Не се открива комуникация с контролера на зоната. Не може да се извърши терморегулация на зоната'},
-    123: {"text1": 'Аларма поради офлайн режим на устройството на зона 3', "text2": 'Дистанционното управление и дистанционният контрол на зона 3 е офлайн', "action": 'Проверете дали дистанционното управление е включено', "comment": 'Не се открива комуникация с контролера на зоната. Не може да се извърши терморегулация на зоната'},
-    125: {"text1": 'Проблем при сондата за стайна температура на Зона 1', "text2": 'Сондата за стайна температура в зона 1 е извън разрешения диапазон', "action": 'Освен температурата, не се изчислява и точката на оросяване за зоната', "comment": 'Неизправност на сондата за стайна температура на зона 1 (опционална). Не може да се извърши терморегулация на зоната'},
-    126: {"text1": 'Проблем при сондата за стайна температура на зона 2', "text2": 'Сондата за стайна температура в зона 2 е извън разрешения диапазон', "action": 'Освен температурата, не се изчислява и точката на оросяване за зоната', "comment": 'Неизправност на сондата за стайна температура на зона 2 (опционална). Не може да се извърши терморегулация на зоната'},
-    127: {"text1": 'Проблем при сондата за стайна температура на зона 3', "text2": 'Сондата за стайна температура в зона 3 е извън разрешения диапазон', "action": 'Освен температурата, не се изчислява и точката на оросяване за зоната', "comment": 'Неизправност на сондата за стайна температура на зона 3 (опционална). Не може да се извърши терморегулация на зоната'},
-    129: {"text1": 'Проблем със сондата за влажност в зона 1', "text2": 'Сондата за стайната влажност в зона 1 е извън позволения диапазон', "action": 'Освен влажността, не се изчислява и точката на оросяване за зоната', "comment": 'Проблем при сондата за влажност в зона 1 (опционална). Не може да контролирате влажността на зоната'},
-    130: {"text1": 'Проблем със сондата за влажност в зона 2', "text2": 'Сондата за стайната влажност в зона 2 е извън позволения диапазон', "action": 'Освен влажността, не се изчислява и точката на оросяване за зоната', "comment": 'Проблем при сондата за влажност в зона 2 (опционална). Не може да контролирате влажността на зоната'},
-    131: {"text1": 'Проблем със сондата за влажност в зона 3', "text2": 'Сондата за стайната влажност в зона 3 е извън позволения диапазон', "action": 'Освен влажността, не се изчислява и точката на оросяване за зоната', "comment": 'Проблем при сондата за влажност в зона 3 (опционална). Не може да контролирате влажността на зоната'},
-    132: {"text1": 'Аларма поради висока настроена стойност за отнемане на влагата в зона 2', "text2": 'Изчислената зададена стойност на заявка в зона 2 е твърде висока за влагоулавяне', "action": 'Изчислената зададена стойност на подаване е по-висока от границата, допустима за влагоуловителя. Охладете помещението и изчакайте температурата на оросяване да се върне до приемливи стойности', "comment": 'Изчислената зададена стойност на подаване на охлаждане за влагоулавяне е по-висока от настроената граница в зона 2'},
-    133: {"text1": 'Аларма поради повреда на влагоуловителя в зона 1', "text2": 'Влагоуловителят на зона 1 е в алармено състояние', "action": 'Системата не отнема влагата от съответната зона', "comment": 'Проблем, създаван от влагоуловителя (опционален) при зона 1'},
-    134: {"text1": 'Аларма поради повреда на влагоуловителя в зона 2', "text2": 'Влагоуловителят на зона 2 е в алармено състояние', "action": 'Системата не отнема влагата от съответната зона', "comment": 'Проблем, създаван от влагоуловителя (опционален) при зона 2'},
-    135: {"text1": 'Аларма поради повреда на влагоуловителя в зона 3', "text2": 'Влагоуловителят на зона 3 е в алармено състояние', "action": 'Системата не отнема влагата от съответната зона', "comment": 'Проблем, създаван от влагоуловителя (опционален) при зона 3'},
-    137: {"text1": 'Аларма от система, върната в нормално състояние – Рестартирайте системата', "text2": 'След възстановяване на нормалното състояние чрез командния панел се подава алармен сигнал, тъй като трябва да рестартирате системата', "action": 'Изключете и включете системата', "comment": 'След възстановяване на стандартните параметри (тези по подразбиране) системата трябва да бъде рестартирана'},
-    138: {"text1": 'Протича затопляне на подовата замазка', "text2": 'Протича функция на затопляне на подовата замазка', "action": '', "comment": ''},
-    139: {"text1": 'Извършва се обезвъздушаване', "text2": 'Активна функция по обезвъздушаване', "action": '', "comment": ''},
-    177: {"text1": 'Аларма максимално време битова вода', "text2": 'Заявката за битова вода е направена след изтичане на предварително определеното максимално време', "action": 'системата продължава да работи, но не при максимална ефективност', "comment": 'Заявката за производство на битова гореща вода не може да бъде изпълнена в предварително зададеното време (5 часа)'},
-    178: {"text1": 'Неуспешен цикъл анти-легионела', "text2": 'Цикълът анти-легионела не е приключил успешно през предвидения период от време', "action": 'Натиснете бутон Reset', "comment": 'Цикълът анти-легионела се извършва без резултат през предвидения период от време (3 часа)'},
-    179: {"text1": 'Проблем със сондата за течна фаза', "text2": 'Сондата за течна фаза е извън позволения диапазон.', "action": 'Системата не стартира. Свържете се с лицензирана фирма (например със сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сондата за течна фаза'},
-    181: {"text1": 'Загуба на комуникация Дистанционно управление зона 2', "text2": 'Няма комуникация между платката и дистанционното управление в зона 2.', "action": 'Спрете напрежението и го подайте отново към хидравличния модул. Ако при повторното включване дистанционното управление не бъде разпознато, системата преминава в локален работен режим и следователно използва командите върху командния си панел. В този случай не е възможно да активирате функция “Отопление”', "comment": 'Настъпва в случай на свързване към несъвместимо дистанционно управление или при загуба на комуникацията между хидравличния модул и дистанционното управление CARV2 на втората зона'},
-    182: {"text1": 'Аларма на кондензаторния модул', "text2": 'Отчита се алармен сигнал от моторния кондензаторен модул', "action": 'Системата не работи, вж. неизправност на кондензаторния модул и съответната книжка с инструкции', "comment": 'Подава се сигнал за неизправност на моторния кондензаторен модул'},
-    183: {"text1": 'Аларма на кондензаторния модул в testmode', "text2": 'Кондензаторният модул се намира в режим TESTMODE', "action": 'По време на тази фаза заявките за стайна климатизация и за производство на битова гореща вода не може да се изпълняват', "comment": 'Подава се сигнал, че кондензаторният модул е във фаза на test mode'},
-    184: {"text1": 'Аларма поради изтичане на времето за комуникация с външен модул', "text2": 'Загуба на комуникация с кондензаторния модул', "action": 'Проверете електрическото свързване между модулите', "comment": 'Подава се сигнал за неизправност поради проблем в комуникацията между вътрешния модул и кондензаторния модул'},
-    185: {"text1": 'Аларма за комуникация safety module', "text2": 'Загуба на комуникация със safety –module', "action": 'Проверете свързването между компонентите', "comment": 'Проблем в комуникацията между платката за регулиране и тази за запалване'},
-    186: {"text1": 'Неизправност поради високо напрежение на датчика за запалване', "text2": 'Safety module: установен е проблем с напрежението на датчика за запалване', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Подава се сигнал за неизправност на платката за запалване'},
-    187: {"text1": 'Аларма при сондата на връщане на кондензаторния модул', "text2": 'Стойностите на сондата на връщане на кондензаторния модул са извън разрешените граници', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката отчита проблем при сонда NTC - връщане на термопомпата'},
-    188: {"text1": 'Заявка извън позволения работен диапазон', "text2": 'Направената заявка не се изпълнява, тъй като външните условия не позволяват активиране на кондензаторния модул', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Прави се заявка за отопление или охлаждане при външна температура извън работните граници'},
-    189: {"text1": 'Аларма поради изтичане на време за комуникация с комуникационната платка', "text2": 'Загуба на комуникация с комуникационната платка за кондензаторния модул', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'При загуба на комуникацията между електронните платки се подава сигнал за проблем'},
-    191: {"text1": 'Загуба на комуникация RF към CAR v2 RF зона 2', "text2": 'Комуникацията между предаващата база и CAR v2 RF на зона 2 е изчезнала', "action": 'Проверете работата на безжичното дистанционно управление CAR, проверете зареждането на батериите (вж съответната книжка с инструкции)', "comment": 'При загуба на връзка между вътрешния модул и безжичното дистанционно управление CAR за втора зона се подава сигнал за проблем и от този момент системата може да се управлява единствено чрез командния панел на вътрешния модул'},
-    192: {"text1": 'Проблем със сондата при подаването на кондензаторния модул', "text2": 'Сондата при подаването на кондензаторния модул е извън разрешения диапазон', "action": 'Ако блокирането или проблемът продължава, е необходимо да повикате лицензирана фирма (например сервизния център за техническа помощ на Immergas).', "comment": 'Платката установява проблем при сонда NTC при подаването на термопомпата'},
-    193: {"text1": 'Уредът е в Testmode', "text2": 'Уредът се управлява от външно устройство посредством Opentherm протокол', "action": 'Системата продължава да работи правилно', "comment": 'Подава се сигнал, че уредът е във фаза на test mode'},
-    194: {"text1": 'Деактивиран Audax Pro', "text2": 'Кондензаторният модул Audax Pro е деактивиран', "action": 'Системата продължава да работи правилно', "comment": 'Подава се сигнал, че кондензаторният модул е деактивиран чрез съответния вход в клемореда'},
-    195: {"text1": 'Проблем поради ниска темп. в течна фаза ', "text2": 'Темп. на сондата в течна фаза е твърде ниска ', "action": 'Проверете дали охладителният кръг работи добре', "comment": 'Отчита се твърде ниска температура в течната фаза'},
-    196: {"text1": 'Блокиране поради висока температура на подаване', "text2": 'Отчита се прекалено висока температура във веригата при връщането на термопомпата', "action": 'Проверете дали охладителният кръг работи добре', "comment": 'Отчита се прекалено висока температура във веригата при подаването на термопомпата'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: cs)"""
-
-immergas_labels = {
-    'default': {"text1": 'Obecná nerozpoznaná anomálie', "text2": 'Zkontrolujte tabulku poruch instalovaného zařízení', "action": 'Zkontrolujte tabulku chyb nebo vybranou kartu', "comment": 'Žádná související poznámka'},
-    0: {"text1": 'SYSTÉM OK', "text2": 'Systém funguje správně', "action": 'Nevyžaduje se žádná akce', "comment": 'Žádná anomálie'},
-    1: {"text1": 'Zablokování v důsledku nezapálení', "text2": 'Absence zjištění plamene po skončení posledního pokusu o zapálení', "action": 'Stiskněte tlačítko Reset.', "comment": 'Kotel se v případě požadavku na vytápění nebo ohřev teplé užitkové vody nezapálí do stanovené doby. Při prvním zapálení nebo po dlouhé nečinnosti kotle může být potřebný zásah pro odstranění zablokování.'},
-    2: {"text1": 'Zablokování bezpečnostního termostatu (vysoká teplota)', "text2": 'Zásah bezpečnostního termostatu', "action": 'Stiskněte tlačítko Reset.', "comment": 'Pokud během normálního provozního režimu dojde k přehřátí vnitřního prostředí, kotel se zablokuje.'},
-    3: {"text1": 'Zásah bezpečnostního termostatu spalin', "text2": 'Zásah termostatu spalin', "action": 'Stiskněte tlačítko Reset. (verze Nike)/ Nakonfigurujte správně parametr P.14. V případě potřeby stiskněte tlačítko Reset (verze Star)', "comment": 'Pokud během normálního provozního režimu dojde k překročení mezní teploty spalin, kotel se zablokuje. (verze Nike)/ Chybná konfigurace parametru P.14 (verze Star)'},
-    4: {"text1": 'Nestandardní elektrický odpor na kontaktech', "text2": 'Zjištěna anomálie obvodu ovládání plynového ventilu', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronická karta zjistila poruchu napájení plynového ventilu. Zkontrolujte připojení desky. (porucha je detekována a zobrazena pouze při požadavku na vytápění či ohřev TUV).'},
-    5: {"text1": 'Porucha čidla výstupu primárního okruhu', "text2": 'Hodnota odporu výstupního čidla mimo rozsah', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu bezpečnostního NTC čidla primárního okruhu kotle.'},
-    6: {"text1": 'Porucha čidla TUV', "text2": 'Hodnota odporu čidla TUV mimo rozsah', "action": 'V takovém případě kotel pokračuje s produkci TUV bez optimálního výkonu. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu bezpečnostního NTC čidla primárního okruhu kotle.'},
-    8: {"text1": 'Maximální počet resetování', "text2": 'Znamená dosažení maximálního povoleného počtu resetů zabudované desky', "action": 'Pozor: Je možné resetovat poruchu 5krát za sebou, pak je funkce deaktivována nejméně na jednu hodinu a pak je možné zkoušet jednou za hodinu, maximální počet pokusů je 5. Odpojením a opětovným zapojením napájení průtokového zásobníku TUV znovu získáte dalších 5 pokusů.', "comment": 'Počet možných resetování byl již vyčerpán.'},
-    10: {"text1": 'Nedostatečný tlak v zařízení', "text2": 'Kontakt spínače tlaku systému je otevřený', "action": 'Zkontrolujte na tlakoměru kotle, jestli je tlak v kotli mezi 1÷1,2 bary a eventuálně nastavte správný tlak.', "comment": 'Není zjištěn dostatečný tlak vody v topné soustavě, potřebný pro správný provoz kotle.'},
-    11: {"text1": 'Porucha snímače tlaku spalin', "text2": 'Možná anomálie na tlakoměru spalin nebo na ventilátoru', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Budou-li obnoveny podmínky normálního fungování, kotel se znovu spustí bez potřeby resetování.'},
-    12: {"text1": 'Porucha NTC čidla zásobníku TUV', "text2": 'Odpor čidla zásobníku TUV mimo rozsah', "action": 'Kotel nedokáže vyrobit TUV. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu čidla bojleru'},
-    13: {"text1": 'Průtokoměr vzduchu/spalin mimo rozsah', "text2": 'Signál vzduchu/spalin je mimo rozsah nebo když je ventilátor zastaven, řídící jednotka přečte příliš vysoký signál', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Při zastaveném ventilátoru kontrola detekuje příliš vysoký signál vzduchu/spalin (přilepené kontakty tlakového spínače)'},
-    15: {"text1": 'Chyba v konfiguraci elektroniky', "text2": 'Karta zjistila nesoulad mezi konfigurací karty a vstupními signály', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován. Zkontrolujte, zda je kotel správně nakonfigurován. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu nebo neshodnost na elektrických kabelech, kotel se nespustí.'},
-    16: {"text1": 'Porucha ventilátoru', "text2": 'Ventilátor se otáčí, když není pod napětím, nebo stojí, když je pod napětím', "action": 'Stiskněte tlačítko Reset. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Objevuje se v případě mechanické nebo elektronické poruchy ventilátoru.'},
-    17: {"text1": 'Nesprávná rychlost ventilátoru', "text2": 'Rychlost ventilátoru je mimo správný rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Nesprávný počet otáček ventilátoru'},
-    20: {"text1": 'Porucha v okruhu hlídání plamene', "text2": 'Zjištění anomálie detekce plamene', "action": 'Stiskněte tlačítko Reset. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Objevuje se v případě rozptylu v detekčním okruhu nebo při poruše kontroly plamene.'},
-    23: {"text1": 'Porucha čidla zpátečky z topení', "text2": 'Hodnota odporu čidla zpátečky mimo rozsah', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu bezpečnostního NTC čidla primárního okruhu kotle.'},
-    24: {"text1": 'Porucha funkčnosti tlačítek ovládacího panelu', "text2": 'Je vnímán soustavný tlak na tlačítka přístrojové desky.', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu na tlačítkovém panelu.'},
-    25: {"text1": 'Zablokování čidla spalin/zablokování CRC (TERA)', "text2": 'Teplota spalin mimo rozsah/poškození paměti (TERA)', "action": 'Stiskněte tlačítko Reset (1)', "comment": 'Vysoký nárůst spalin, pravděpodobné zablokování cirkulace nebo nedostatek vody/poškození paměti'},
-    27: {"text1": 'Nedostatečný oběh', "text2": 'Přehřátí kotle v důsledku nedostatečného oběhu primárního okruhu', "action": 'Stiskněte tlačítko Reset', "comment": 'Zkontrolujte, zda nedochází k překážkám na topném obvodu a/nebo zkontrolujte správné fungování oběhového čerpadla.'},
-    28: {"text1": 'Netěsnost užitkového okruhu', "text2": 'V případě, že během provozu dojde ke zvýšení teploty vody v užitkovém okruhu, kotel signalizuje anomálii a sníží teplotu ohřevu, aby omezil usazování vodního kamene ve výměníku.', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Zkontrolujte, zda jsou uzavřeny veškeré kohoutky užitkového obvodu nebo zda nevykazují netěsnosti a obecně zkontrolujte, zda nedochází k únikům ze zařízení. Kotel se vrátí k běžnému provozu po obnovení optimálních podmínek užitkového obvodu.'},
-    29: {"text1": 'Porucha čidla spalin', "text2": 'Odpor čidla teploty spalin mimo rozsah', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Karta zjistila poruchu na čidle spalin.'},
-    31: {"text1": 'Ztráta komunikace s CARV2', "text2": 'Není k dispozici komunikace mezi kartou a dálkovým ovládáním.', "action": 'Odpojte a znovu dodejte napětí kotli. Pokud po zapnutí nedojde k detekování řídicí jednotky, kotel přechází do lokálního provozního režimu, to jest používá ovládací prvky na ovládacím panelu. V tomto případě nelze aktivovat funkci „Vytápění”.', "comment": 'Objevuje se v případě nekompatibilního připojení k řídicí jednotce nebo v případě ztráty komunikace mezi kotlem a CARV2.'},
-    32: {"text1": 'Porucha čidla zóny 2 nízké teploty', "text2": 'Odpor čidla teploty výstupu do zóny 2 mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud elektronika detekuje poruchu čidla zóny 2 nízké teploty, systém nemůže pracovat pro příslušnou zónu.'},
-    33: {"text1": 'Porucha čidla zóny 3 nízké teploty', "text2": 'Odpor čidla teploty výstupu do zóny 3 mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud elektronika detekuje poruchu čidla zóny 2 nízké teploty, systém nemůže pracovat pro příslušnou zónu.'},
-    36: {"text1": 'Přerušení komunikace IMG Bus', "text2": 'Výpadek komunikace na protokolu IMG Bus.', "action": 'Kotel nesplňuje požadavky na vytápění.', "comment": 'V důsledku anomálie na řídicí jednotce kotle, na zónové centrále (volitelný prvek) nebo na sběrnici IMG dojde k přerušení komunikace mezi jednotlivými komponenty.'},
-    37: {"text1": 'Nízké napájecí napětí kotle', "text2": 'Napájecí napětí karty vykazuje hodnoty nižší než povolené limity.', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Objevuje se v případě, když je napájecí napětí nižší než jsou limity povolené pro správný provoz kotle.'},
-    38: {"text1": 'Ztráta signálu plamene', "text2": 'Deska kotle zaznamená správnou hodnotu signálu plamene, ale poté se hodnota sníží.', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Objevuje se v případě, když je kotel v provozu a dojde k neočekávanému vypnutí plamene hořáku; dojde k novému pokusu o zapnutí a v případě obnovení normálních podmínek se kotel spustí bez toho, že by musel být resetován.'},
-    39: {"text1": 'porucha čidla solárního kolektoru', "text2": 'Odpor čidla solárního kolektoru mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud elektronika detekuje poruchu na čidlu solárního kolektoru, kotel pokračuje v pravidelném provozu bez přívodu solární energie na ohřev teplé užitkové vody, protože solární čerpadlo přestane fungovat.'},
-    40: {"text1": 'Porucha čidla solární akumulace', "text2": 'Odpor čidla solární  akumulace mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud elektronika detekuje poruchu na čidlu solárního kolektoru, čidlo solární akumulace pokračuje v pravidelném provozu bez přívodu solární energie na ohřívání teplé užitkové vody, protože solární čerpadlo přestane fungovat.'},
-    41: {"text1": 'Vysoká teplota na solárním kolektoru', "text2": 'Solární kolektor překročil nastavenou maximální teplotu', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Objevuje se, když teplota na solárním kolektoru převýší maximální nastavený limit.'},
-    42: {"text1": 'Vysoká teplota v solární akumulaci', "text2": 'Solární akumulace překročila nastavenou maximální teplotu', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Objevuje se, když teplota na solární akumulaci převýší maximální nastavený limit.'},
-    43: {"text1": 'Zablokování v důsledku ztráty plamene', "text2": 'Výpadek signálu plamene v běžném provozu vícekrát za sebou.', "action": 'Stiskněte tlačítko Reset, kotel před restartováním provede cyklus předvětrání.', "comment": 'Objevuje se, pokud se vícekrát za sebou v průběhu stanovené doby objeví chyba „Ztráta signálu plamene“.'},
-    44: {"text1": 'Zablokování v důsledku překročení maximální doby otevření plynového ventilu', "text2": 'Celkový uplynulý čas otevření plynového ventilu bez zjištění plamene je delší než povolené maximum.', "action": 'Stiskněte tlačítko Reset.', "comment": 'Objevuje se v případě, když plynový ventil zůstane otevřený delší dobu než je doba potřebná pro jeho normální provoz bez toho, aby se kotel zapnul.'},
-    45: {"text1": 'Nadměrná dT', "text2": 'Rozdíl v náběhové a vratné teplotě systému je ≥ 40 °C.', "action": 'Dojde k dočasnému omezení výkonu hořáku tak, aby nedošlo k poškození kondenzačního modulu, pokud obnovíte přípustnou dT kotle, vrátí se do normálního provozu. Zkontrolujte, zda je v pořádku cirkulace otopné vody v kotli, zda je čerpadlo konfigurováno dle potřeb otopného systému a zda čidlo zpátečky funguje správně.', "comment": 'Kotel detekuje náhlou neočekávanou dT mezi výstupním čidlem a čidlem zpátečky.'},
-    46: {"text1": 'Zásah termostatu nízké teploty/nesprávná konfigurace zapojení/karty', "text2": 'Bezpečnostní termostat umístěný na výstupu z kotle / v DIM V2 (termostat nízké teploty) dosáhl vysokých teplot. / Chyba zapojení nebo nesprávné použití náhradní karty', "action": 'V takovém případě je možné po správném vychlazení resetovat termostat (viz příslušný návod k obsluze). / Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud se během normálního provozu objeví nadměrné zvýšení teploty výstupu při provozu s nízkou teplotou, kotel se zablokuje. / Chyba zapojení nebo nesprávné použití náhradní karty'},
-    47: {"text1": 'Dočasné omezení výkonu hořáku', "text2": 'Pokud teplota spalin dosáhne zvýšené hodnoty, omezuje se výkon dosahovaný hořákem, aby se omezily škody na okruhu spalin.', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'V případě zjištění nadměrné teploty spalin kotel sníží aktuální výkon, aby nedošlo k jeho poškození.'},
-    48: {"text1": 'Porucha čidla náběhu systému', "text2": 'Odpor čidla náběhu systému mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud čidlo náběhu systému není připojeno nebo je vadné, je signalizována porucha'},
-    49: {"text1": 'Vysoká teplota na NTC čidle zpátečky', "text2": 'Vysoká teplota naměřená sondou zpátečky', "action": 'Zkontrolujte správnou cirkulaci v kotli a správnou funkci třícestného ventilu.', "comment": 'Dochází k ní v případě příliš vysoké teploty na NTC čidle zpátečky z otopného okruhu'},
-    50: {"text1": 'Porucha venkovního čidla', "text2": 'Odpor venkovního čidla mimo rozsah', "action": 'Zkontrolujte připojení venkovního čidla. Systém nadále funguje', "comment": 'Pokud venkovní čidlo není připojeno nebo je vadné, je signalizována porucha'},
-    51: {"text1": 'Ztráta komunikace s bezdrátovou řídící jednotkou CAR', "text2": 'Komunikace mezi vysílací základnou a CAR v2 RF vypadla.', "action": 'Zkontrolujte funkčnost řídicí jednotky, zkontrolujte nabití baterie (viz příslušná příručka pokynů).', "comment": 'V případě ztráty komunikace mezi kotlem a CAR ve verzi Wireless bude signalizována porucha, od tohoto okamžiku je možné ovládat systém pouze pomocí ovládacího panelu kotle.'},
-    54: {"text1": 'Porucha čidla pufferu (akumulace)', "text2": 'Odpor čidla pufferu (akumulace) mimo rozsah', "action": 'Režim puffer bude deaktivován', "comment": 'V případě nepřipojeného nebo vadného čidla pufferu je signalizována porucha'},
-    55: {"text1": 'Porucha čidla teploty náběhu zóny 1', "text2": 'Odpor čidla výstupu do zóny 1 mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Pokud elektronika detekuje poruchu čidla zóny 1 nízké teploty, systém nemůže pracovat pro příslušnou zónu.'},
-    58: {"text1": 'Porucha Audax', "text2": 'Signalizace poruchy tepelného čerpadla AUDAX připojeného k systému', "action": 'Tepelné čerpadlo nesplňuje požadavky na vytápění a vychlazení prostředí a po opětovném zapojení je nutné systém vypnout a znovu zapnout', "comment": 'Porucha tepelného čerpadla Audax, zkontrolujte typ poruchy přímo na displeji tepelného čerpadla'},
-    59: {"text1": 'Blokace frekvence napájecí sítě', "text2": 'Elektronická karta zjistila anomálii frekvence v elektrické napájecí síti.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje abnormální frekvenci elektrické sítě.'},
-    60: {"text1": 'Porucha zablokování oběhového čerpadla', "text2": 'Modulační oběhové čerpadlo je zastaveno.', "action": 'Zkuste odblokovat oběhové čerpadlo podle pokynů v příslušném odstavci. V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Oběhové čerpadlo zastaveno z následujících příčin: rotor zablokován, elektrická porucha.'},
-    61: {"text1": 'Přítomnost vzduchu v oběhovém čerpadle', "text2": 'Modulační oběhové čerpadlo zastaveno v důsledku zavzdušnění.', "action": 'Proveďte odvzdušnění oběhového čerpadla a topného okruhu. V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Byl detekován vzduch uvnitř oběhového čerpadla, oběhové čerpadlo nemůže pracovat.'},
-    62: {"text1": 'Nutné provést úplnou kalibraci', "text2": 'Karta nemá správnou konfiguraci parametrů kontroly spalování.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Zjištěna chybějící kalibrace elektronické karty. Může nastat při výměně elektronické karty či při změnách parametrů v sekcích vzduch a plyn, díky čemuž bude nutné provést „kompletní kalibraci“.'},
-    63: {"text1": 'Porucha čidla zpátečky systému', "text2": 'Odpor čidla zpátečky systému mimo rozsah', "action": 'Kotel pokračuje v provozu bez integrace z externích připojených systémů', "comment": 'V případě nezapojeného nebo vadného čidla zpátečky je signalizována porucha'},
-    67: {"text1": 'Porucha tlakového spínače solárního systému', "text2": 'Otevřený tlakový spínač, možný nedostatek kapaliny', "action": 'Zkontrolujte na manometru jednotky oběhového čerpadla solárního zařízení, zda je tlak na správné hodnotě', "comment": 'Vlivem poklesu tlaku v solárním okruhu blokuje tlakový spínač provoz solárního tepelného okruhu'},
-    70: {"text1": 'Záměna sond výstup/zpátečka', "text2": 'V případě chybného zapojení kabeláže kotle dojde ke zjištění chyby', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Zkontrolujte zapojení sondy přívodu a zpátečky'},
-    72: {"text1": 'Nutné provést rychlou kalibraci', "text2": 'Karta nemá správnou konfiguraci některých parametrů kontroly spalování.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika kotle zaznamenala změnu nastavení, je nutné provést „rychlou kalibraci“.'},
-    73: {"text1": 'Vysoká odchylka teplot NTC čidla primárního okruhu a bezpečnostního čidla', "text2": 'Velký rozdíl teplot naměřených čidly výstupu', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Karta detekuje poruchu čtení teplot čidel NTC na přívodu a příčiny můžou být: vadné čidlo, nesprávné umístění, špatný oběh v systému, ucpání na straně vody primárního výměníku.'},
-    74: {"text1": 'Porucha bezpečnostního čidla', "text2": 'Odpor bezpečnostního čidla mimo rozsah', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Elektronika detekuje poruchu výstupního bezpečnostního NTC čidla.'},
-    75: {"text1": 'Poškozené čidlo výstupu/zpátečky', "text2": 'Možná porucha jedné nebo obou sond výstupu a zpátečky zařízení', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Snímač bezpečnostní sondy způsobuje zvýšený teplotní gradient'},
-    76: {"text1": 'Tepelný drift sondy výstupu nebo sondy zpátečky', "text2": 'Dojde ke zjištění poruchy jedné nebo obou sond výstupu a zpátečky zařízení', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Větší než nastavený rozdíl mezi sondou přívodu a zpátečky v případě požadavku na teplo'},
-    77: {"text1": 'Porucha kontroly spalování', "text2": 'Zjištěn proud plynového ventilu mimo interval.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Na plynovém ventilu je detekován proud mimo rozsah.'},
-    78: {"text1": 'Porucha kontroly spalování', "text2": 'Zjištěn zvýšený proud plynového ventilu.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Na plynovém ventilu je detekován vysoký proud.'},
-    79: {"text1": 'Porucha kontroly spalování', "text2": 'Zjištěn nízký proud plynového ventilu.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Na plynovém ventilu je detekován nízký proud.'},
-    80: {"text1": 'Porucha elektroniky', "text2": 'Zjištěna porucha na elektronickém pohonu plynového ventilu v důsledku problémů na kartě nebo plynovém ventilu.', "action": 'Stiskněte tlačítko Reset.', "comment": 'Vyskytuje se v případě poruchy elektronické desky, která ovládá ventil.'},
-    84: {"text1": 'Porucha spalování - snížení výkonu', "text2": 'Zjištěny podmínky podobné nízkému tlaku na přívodu plynu do plynového ventilu.', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Je detekován nízký vstupní tlak plynu. V důsledku toho dojde k dočasnému omezení výkonu kotle a signalizaci poruchy.'},
-    85: {"text1": 'Zablokování v důsledku problému post-spalování', "text2": 'Potenciální problém s plynovým ventilem, elektrodou nebo elektronickou deskou.', "action": 'Stiskněte tlačítko Reset. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Plamen je přítomen i po zavření plynového ventilu.'},
-    87: {"text1": 'Porucha řízení plynového ventilu', "text2": 'Zjištěna porucha na ovládání plynového ventilu.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Je detekováno selhání jednoho z komponentů, které ovládají plynový ventil.'},
-    88: {"text1": 'Porucha řízení plynového ventilu', "text2": 'Zjištěna porucha na ovládání plynového ventilu.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Je detekováno selhání jednoho z komponentů, které ovládají plynový ventil.'},
-    89: {"text1": 'Nestabilní signál spalování', "text2": 'Zjištěna nestabilita signálu spalování.', "action": 'Kotel nadále funguje.', "comment": 'Plamen je nestabilní v důsledku: přítomnost recirkulace spalin, vítr, nestabilní tlak plynu, rychlost ventilátoru nestabilní v důsledku poruchy systému.'},
-    90: {"text1": 'Signál spalování mimo rozsah', "text2": 'Zjištěn signál spalování mimo limit.', "action": 'Kotel nadále funguje.', "comment": 'Signál spalování je detekován mimo rozsah stanovené regulace na delší dobu.'},
-    91: {"text1": 'Opakované nezdařené zapálení', "text2": 'Karta vyčerpala všechny možné kroky pro dosažení optimálního zapálení hořáku.', "action": 'Stiskněte tlačítko Reset.', "comment": 'Deska vyčerpala všechny možné kroky pro dosažení optimálního zapálení hořáku.'},
-    92: {"text1": 'Limitní počet otáček ventilátoru', "text2": 'Karta dosáhla maximální korekce otáček ventilátoru.', "action": 'Kotel nadále funguje.', "comment": 'Systém vyčerpal všechny možné korekce otáček ventilátoru.'},
-    93: {"text1": 'Signál spalování mimo rozsah', "text2": 'Zjištěn signál spalování mimo limit.', "action": 'Kotel nadále funguje.', "comment": 'Signál spalování je detekován mimo rozsah stanovené regulace na delší dobu.'},
-    94: {"text1": 'Porucha spalování', "text2": 'Zjištěn problém spalování způsobený systémem nebo ovládáním spalování.', "action": 'V případě opětovného nastavení normálních podmínek se kotel spustí bez toho, že by musel být resetován.', "comment": 'Zjištěn problém kontroly spalování, který může být způsoben: nízkým tlakem plynu, recirkulací spalin, poruchou plynového ventilu nebo elektronické karty.'},
-    95: {"text1": 'Signál spalování nepravidelný', "text2": 'Zjištěno přerušení signálu spalování v důsledku problémů na elektrických spojích nebo rozptylu signálu.', "action": 'Kotel nadále funguje.', "comment": 'Systém detekuje nepravidelnost signálu spalování.'},
-    96: {"text1": 'Ucpaný odvod spalin', "text2": 'Zjištěna překážka v systému odtahu spalin.', "action": 'Kotel se nespustí. Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska Technické Asistence Immergas).', "comment": 'Objevuje se v případě ucpání odvodu spalin / odkouření.'},
-    98: {"text1": 'Blokace z důvodu max. počtu chyb', "text2": 'Elektronická karta nefunguje správně.', "action": 'Stiskněte tlačítko Reset.', "comment": 'Je dosaženo maximálního počtu chyb povolených softwarem.'},
-    99: {"text1": 'Všeobecné zablokování', "text2": 'Elektronická karta nefunguje správně.', "action": 'Stiskněte tlačítko Reset.', "comment": 'Byla detekována porucha kotle.'},
-    101: {"text1": 'Alarm off-line Audax', "text2": 'Ztráta komunikace s tepelným čerpadlem', "action": 'Tepelné čerpadlo nesplňuje požadavky na vytápění a vychlazení prostředí a po opětovném zapojení je nutné systém vypnout a znovu zapnout', "comment": 'V případě poruchy komunikace, nesprávného připojení nebo vypnutí tepelného čerpadla elektronika kotle nezjistí tepelné čerpadlo'},
-    102: {"text1": 'Alarm off-line expanze zóny 1', "text2": 'Ztráta komunikace s expanzí zóny 1', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Porucha komunikace se zónou 1'},
-    103: {"text1": 'Alarm off-line expanze zóny 2', "text2": 'Ztráta komunikace s expanzí zóny 2', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Porucha komunikace se zónou 2'},
-    104: {"text1": 'Alarm off-line expanze zóny 3', "text2": 'Ztráta komunikace s expanzí zóny 3', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Porucha komunikace se zónou 3'},
-    106: {"text1": 'Alarm NTC čidla TUV', "text2": 'V případě integrace s kotlem a samostatným řízením TUV je hodnota odporu čidla kotle řízeného regulátorem mimo rozsah', "action": 'Systém nemůže vyrábět TUV s tepelným čerpadlem. Výroba TUV je zajištěna kotlem', "comment": 'Elektronika detekuje poruchu čidla zásobníku TUV'},
-    120: {"text1": 'Alarm vysokého nastavení pro odvlhčování zóny 1', "text2": 'Vypočtená požadovaná nastavená hodnota zóny 1 je příliš vysoká pro odvlhčování', "action": 'Vypočtené nastavení náběhu chlazení je vyšší než povolený limit odvlhčovače. Vychlaďte pokoj a počkejte, dokud se rosný bod nevrátí na přijatelné hodnoty', "comment": 'Vypočtené nastavení náběhu chlazení pro odvlhčování je nad hranicí nastavenou v zóně 1'},
-    121: {"text1": 'Alarm off-line zařízení zóny 1', "text2": 'Dálkové ovládání nebo dálkové ovládání zóny 1 je off-line', "action": 'Ověřte, zda je dálkový ovladač zapnutý', "comment": 'Komunikace s kontrolou zóny není detekována. Není možné provést termoregulaci zóny'},
-    122: {"text1": 'Alarm off-line zařízení zóny 2', "text2": 'Dálkové ovládání nebo dálkové ovládání zóny 2 je off-line', "action": 'Ověřte, zda je dálkový ovladač zapnutý', "comment": 'Komunikace s kontrolou zóny není detekována. Není možné provést termoregulaci zóny'},
-    123: {"text1": 'Alarm off-line zařízení zóny 3', "text2": 'Dálkové ovládání nebo dálkové ovládání zóny 3 je off-line', "action": 'Ověřte, zda je dálkový ovladač zapnutý', "comment": 'Komunikace s kontrolou zóny není detekována. Není možné provést termoregulaci zóny'},
-    125: {"text1": 'Porucha čidla prostorové teploty zóny 1', "text2": 'Čidlo prostorové teploty zóny 1 je mimo rozsah', "action": 'Kromě teploty není vypočtený rosný bod pro zónu', "comment": 'Porucha čidla prostorové teploty zóny 1 (volitelné). Není možné provést termoregulaci zóny'},
-    126: {"text1": 'Porucha čidla prostorové teploty zóny 2', "text2": 'Čidlo prostorové teploty zóny 2 je mimo rozsah', "action": 'Kromě teploty není vypočtený rosný bod pro zónu', "comment": 'Porucha čidla prostorové teploty zóny 2 (volitelné). Není možné provést termoregulaci zóny'},
-    127: {"text1": 'Porucha čidla prostorové teploty zóny 3', "text2": 'Čidlo prostorové teploty zóny 3 je mimo rozsah', "action": 'Kromě teploty není vypočtený rosný bod pro zónu', "comment": 'Porucha čidla prostorové teploty zóny 3 (volitelné). Není možné provést termoregulaci zóny'},
-    129: {"text1": 'Porucha čidla vlhkosti zóny 1', "text2": 'Čidlo vlhkosti prostředí zóny 1 je mimo rozsah', "action": 'Kromě vlhkosti není vypočtený rosný bod pro zónu', "comment": 'Porucha čidla vlhkosti zóny 1 (volitelné). Není možné kontrolovat vlhkost zóny'},
-    130: {"text1": 'Porucha čidla vlhkosti zóny 2', "text2": 'Čidlo vlhkosti prostředí zóny 2 je mimo rozsah', "action": 'Kromě vlhkosti není vypočtený rosný bod pro zónu', "comment": 'Porucha přítomná na čidle vlhkosti zóny 2 (volitelně). Není možné kontrolovat vlhkost zóny'},
-    131: {"text1": 'Porucha zóny vlhkosti zóny 3', "text2": 'Čidlo vlhkosti prostředí zóny 3 je mimo rozsah', "action": 'Kromě vlhkosti není vypočtený rosný bod pro zónu', "comment": 'Porucha čidla vlhkosti zóny 3 (volitelné). Není možné kontrolovat vlhkost zóny'},
-    132: {"text1": 'Alarm vysokého nastavení pro odvlhčování zóny 2', "text2": 'Vypočtená požadovaná nastavená hodnota zóny 2 je příliš vysoká pro odvlhčování', "action": 'Vypočtené nastavení náběhu chlazení je vyšší než povolený limit odvlhčovače. Vychlaďte pokoj a počkejte, dokud se rosný bod nevrátí na přijatelné hodnoty', "comment": 'Vypočtené nastavení náběhu chlazení pro odvlhčování je nad hranicí nastavenou v zóně 2'},
-    133: {"text1": 'Alarm poruchy odvlhčovače zóny 1', "text2": 'Odvlhčovač zóny 1 je v stavu alarmu', "action": 'Systém neprovádí odvlhčování ve své zóně', "comment": 'Porucha pocházející z odvlhčovače (volitelné) v zóně 1'},
-    134: {"text1": 'Alarm poruchy odvlhčovače zóny 2', "text2": 'Odvlhčovač zóny 2 je v stavu alarmu', "action": 'Systém neprovádí odvlhčování ve své zóně', "comment": 'Porucha pocházející z odvlhčovače (volitelné) v zóně 2'},
-    135: {"text1": 'Alarm poruchy odvlhčovače zóny 3', "text2": 'Odvlhčovač zóny 3 je v stavu alarmu', "action": 'Systém neprovádí odvlhčování ve své zóně', "comment": 'Porucha pocházející z odvlhčovače (volitelné) v zóně 3'},
-    137: {"text1": 'Alarm obnoveného systému - restartujte systém', "text2": 'Po obnovení, které se provádí prostřednictvím ovládacího panelu, je signalizován alarm, protože je vyžadován restart systému', "action": 'Vypněte a zapněte systém', "comment": 'Po obnovení výchozích parametrů systém potřebuje restart'},
-    138: {"text1": 'Probíhá funkce vysoušení podlahy', "text2": 'Probíhá funkce vysoušení podlahy', "action": '', "comment": ''},
-    139: {"text1": 'Probíhá odvzdušnění', "text2": 'Probíhá funkce odvzdušnění', "action": '', "comment": ''},
-    177: {"text1": 'Alarm maximální doby okruhu TUV', "text2": 'Při poždavku na TUV byla překročena stanovená maximální doba', "action": 'systém nadále běží s neoptimálním výkonem', "comment": 'Produkce TUV není splněna v nastavené době (5 hodin)'},
-    178: {"text1": 'Neúspěšný cyklus odstranění legionely', "text2": 'Cyklus odstranění legionely nebyl úspěšně dokončen v nastaveném čase', "action": 'Stiskněte tlačítko Reset (1)', "comment": 'Cyklus odstranění legionely se neúspěšně provádí v nastaveném čase (3 hodiny)'},
-    179: {"text1": 'Porucha čidla kapalné fáze', "text2": 'Čidlo kapalné fáze je mimo rozsah.', "action": 'Systém se nespustí. Zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Karta zjistila poruchu na čidle kapalné fáze'},
-    181: {"text1": 'Ztráta komunikace s řídící jednotkou zóny 2', "text2": 'Není k dispozici komunikace mezi kartou a dálkovým ovládáním zóny 2.', "action": 'Odpojte a obnovte napětí v hydronickém modulu. Pokud po zapnutí nedojde k detekování dálkového ovládání, systém přechází do lokálního provozního režimu, tedy používá ovládací prvky na ovládacím panelu. V tomto případě nelze aktivovat funkci “Vytápění”', "comment": 'Objevuje se v případě nekompatibilního připojení k řídící jednotce nebo v případě ztráty komunikace mezi hydronickým modulem a CARV2 druhé zóny.'},
-    182: {"text1": 'Alarm venkovní jednotky', "text2": 'Vyskytl se alarm venkovní jednotky', "action": 'Systém nefunguje, viz porucha motorového kondenzátoru a související návod s pokyny', "comment": 'Je hlášena porucha na motorovém kondenzátoru'},
-    183: {"text1": 'Alarm venkovní jednotky v režimu testmode', "text2": 'Venkovní jednotka je v režimu TESTMODE', "action": 'Během této fáze není možné splnit požadavky na klimatizaci prostředí a výrobu TUV', "comment": 'Je hlášen motorový kondenzátor v režimu fázového testu'},
-    184: {"text1": 'Alarm časového limitu komunikace s venkovní jednotkou', "text2": 'Ztráta komunikace s venkovní jednotkou', "action": 'Zkontrolujte elektrické připojení mezi jednotkami', "comment": 'Je hlášena porucha v důsledku komunikačního problému mezi vnitřní jednotkou a motorovým kondenzátorem'},
-    185: {"text1": 'Alarm komunikace bezpečnostního modulu', "text2": 'Ztráta komunikace s bezpečnostním modulem', "action": 'Zkontrolujte propojení mezi komponenty', "comment": 'Problém v komunikaci mezi regulační kartou a kartou zapálení'},
-    186: {"text1": 'Porucha vysokonapěťového zapalovacího transformátoru', "text2": 'Bezpečnostní modul: je hlášena porucha napětí zapalovacího transformátoru', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Je hlášena porucha na desce zapálení'},
-    187: {"text1": 'Alarm čidla zpátečky venkovní jednotky', "text2": 'Čidlo zpátečky venkovní jednotky je mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Elektronika detekuje poruchu NTC čidla zpátečky tepelného čerpadla'},
-    188: {"text1": 'Požadavek mimo provozní rozsah', "text2": 'Zadaný požadavek není proveden, protože vnější podmínky neumožňují aktivaci venkovní jednotky', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Vyšle se požadavek na topení nebo chlazení s venkovní teplotou mimo funkční limity'},
-    189: {"text1": 'Alarm časového limitu komunikace s komunikační kartou', "text2": 'Ztráta komunikace s komunikační kartou venkovní jednotky', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'V případě ztráty komunikace mezi elektronickými deskami je signalizována porucha'},
-    191: {"text1": 'Ztráta RF komunikace do CAR v2 RF zóny 2', "text2": 'Komunikace mezi vysílací základnou a CAR v2 RF zóny 2 vypadla', "action": 'Zkontrolujte funkčnost jednotky CAR v bezdrátové verzi, zkontrolujte nabití baterie (viz příslušná příručka pokynů).', "comment": 'V případě ztráty komunikace mezi vnitřní jednotkou a jednotkou CAR v bezdrátové verzi druhé zóny bude signalizována porucha, od tohoto okamžiku je možné ovládat systém pouze pomocí ovládacího panelu této vnitřní jednotky'},
-    192: {"text1": 'Porucha čidla výstupu venkovní jednotky', "text2": 'Čidlo náběhu venkovní jednotky je mimo rozsah', "action": 'Pokud porucha přetrvává, zavolejte autorizovaného servisního technika (například ze Střediska technické asistence Immergas).', "comment": 'Elektronika detekuje poruchu výstupního bezpečnostního NTC čidla tepelného čerpadla'},
-    193: {"text1": 'Přístroj v režimu Testmode', "text2": 'Přístroj je řízen externím zařízením pomocí protokolu Opentherm', "action": 'Systém nadále funguje správně', "comment": 'Je hlášeno, že přístroj je v režimu fázového testu'},
-    194: {"text1": 'Audax Pro deaktivován', "text2": 'Venkovní jednotka Audax Pro byla deaktivována', "action": 'Systém nadále funguje správně', "comment": 'Je hlášeno, že motorový kondenzátor byl deaktivován pomocí příslušného vstupu na svorkovnici'},
-    195: {"text1": 'Porucha nízké teploty kapalné fáze', "text2": 'Teplota čidla kapalné fáze je příliš nízká', "action": 'Zkontrolujte správnou funkci chladicího obvodu', "comment": 'V kapalné fázi je zjištěna příliš nízká teplota'},
-    196: {"text1": 'Zablokování v důsledku vysoké teploty náběhu', "text2": 'Je zjištěna příliš vysoká teplota obvodu zpátečky tepelného čerpadla', "action": 'Zkontrolujte správnou funkci chladicího obvodu', "comment": 'Je zjištěna příliš vysoká teplota obvodu přívodu tepelného čerpadla'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: de)"""
-
-immergas_labels = {
-    'default': {"text1": 'Allgemeine Störung nicht anerkannt', "text2": 'Prüfung Fehlertabelle oder ausgewählte Karte', "action": 'Prüfung Fehlertabelle oder ausgewählte Karte', "comment": 'Diesbezüglich keine Anmerkung'},
-    0: {"text1": 'SYSTEM OK', "text2": 'System korrekt funktionstüchtig', "action": 'Keine erforderliche Anfrage', "comment": 'Keine Störung'},
-    1: {"text1": 'Blockierung keine Einschaltung', "text2": 'Nach dem letzten Einschaltversuch keine Flamme ermittelt.', "action": 'Die Taste Reset drücken.', "comment": 'Der Heizkessel schaltet sich im Falle einer Anfrage für Raumheizung oder Trinkwarmwasserproduktion nicht innerhalb der festgesetzten Zeit ein.  Nach dem ersten Einschalten oder nach einer längeren Inaktivität des Gerätes könnte ein Eingriff erforderlich sein, um die Blockierung zu eliminieren.'},
-    2: {"text1": 'Blockierung Sicherheitsthermostat (Übertemperatur)', "text2": 'Eingriff Sicherheitsthermostat', "action": 'Die Taste Reset drücken.', "comment": 'Wenn es während des normalen Betriebs aufgrund einer Störung zu einer übermäßigen internen Überhitzung kommt, wird der Heizkessel blockiert.'},
-    3: {"text1": 'Blockierung Thermostat Rauchgase', "text2": 'Eingriff Thermostat Rauchgase', "action": 'Die Taste Reset drücken. (Versionen Nike)/ Den Parameter P.14 korrekt konfigurieren. Bei Bedarf die Reset-Taste drücken (Versionen Star)', "comment": 'Wenn es während des normalen Betriebs aufgrund einer Störung zu einer übermäßigen  Überhitzung der Rauchgase kommt, wird der Heizkessel blockiert. (Versionen Nike)/ Falsche Konfiguration Parameter P.14 (Version Star)'},
-    4: {"text1": 'Blockierung Widerstand Kontakte', "text2": 'Ermittlung einer Störung am Steuerkreislauf Gasventil', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die elektronische Karte ermittelt eine Störung an der Versorgung Ihren Anschluss überprüfen. (der Anschluss wird nur im Falle einer Anfrage ermittelt und angezeigt).'},
-    5: {"text1": 'Störung Vorlaufsonde', "text2": 'Die Vorlaufsonde hat einen Widerstandswert außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung an der NTC-Vorlaufsonde.'},
-    6: {"text1": 'Störung Sonde Trinkwarmwasser', "text2": 'Die Sonde Trinkwasser hat einen Widerstandswert außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel produziert weiter Trinkwarmwasser, die Leistungen sind aber nicht optimal. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung an der Trinkwassersonde NTC.'},
-    8: {"text1": 'Max. Anzahl an Resetvorgängen', "text2": 'Zeigt an, dass die max. Anzahl an Resetvorgängen, die von der integrierten Karte zugelassen werden, erreicht wurde. ', "action": 'Achtung: Die Störung kann bis zu fünfmal hintereinander zurückgestellt werden, danach ist die Funktion mindestens 1 h lang gehemmt und man hat pro Stunde einen Versuch, bei max. 5 Versuchen. Indem am Gerät die Versorgung abgetrennt und dann wieder angebracht wird, erhält man erneut fünf Versuche.', "comment": 'Anzahl der verfügbaren bereits ausgeführten Resetvorgänge.'},
-    10: {"text1": 'Anlagendruck nicht ausreichend.', "text2": 'Der Kontakt des Druckwächters der Anlage ist geöffnet.', "action": 'Am Manometer des Heizkessels sicherstellen, dass der Druck der Anlage zwischen 1÷1,2 bar liegt und im Bedarfsfall den korrekten Druck wiederherstellen.', "comment": 'Der Wasserdruck im Heizkreislauf ist nicht ausreichend, um den korrekten Betrieb des Heizkessels zu garantieren.'},
-    11: {"text1": 'Störung Druckwächter Rauchgase', "text2": 'Mögliche Störung an Druckwächter oder Gebläse', "action": 'Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Wenn die normalen Betriebsbedingungen wiederhergestellt werden, startet der Heizkessel erneut, ohne dass ein Reset erforderlich ist.'},
-    12: {"text1": 'Störung Sonde Boiler', "text2": 'Der Widerstandswert der Sonde ist außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel kann kein Trinkwarmwasser aufbereiten. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung an der Boilersonde.'},
-    13: {"text1": 'Luft-/Rauchgasdurchsatzmessgerät außerhalb des zulässigen Bereichs', "text2": 'Das Signal Luft/Rauchgas liegt außerhalb des zulässigen Bereichs oder bei stillstehendem Gebläse erfasst die Steuerung ein zu hohes Signal', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Bei stillstehendem Gebläse erfasst die Steuerung Luft/Rauchgas ein zu hohes Signal (Kontakte Druckwächter verklebt)'},
-    15: {"text1": 'Konfigurationsfehler', "text2": 'Die Karte ermittelt eine Inkongruenz zwischen ihrer Konfiguration und den Signalen am Eingang', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen. Sicherstellen, dass der Heizkessel korrekt konfiguriert ist. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung bzw. eine Inkongruenz an der elektrischen Verkabelung des Heizkessels und startet nicht'},
-    16: {"text1": 'Störung Gebläse', "text2": 'Das Gebläse dreht sich, wenn es nicht versorgt ist, bzw. steht still, wenn es versorgt ist. ', "action": 'Die Taste Reset drücken. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Dazu kommt es in dem Fall, in dem das Gebläse einen mechanischen oder elektronischen Defekt aufweist.'},
-    17: {"text1": 'Gebläsegeschwindigkeit nicht korrekt', "text2": 'Die Gebläsedrehzahl liegt außerhalb des korrekten Bereichs', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Gebläsedrehzahl nicht korrekt'},
-    20: {"text1": 'Blockierung Streuflamme', "text2": 'Flamme nicht normal', "action": 'Die Taste Reset drücken. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Dazu kommt es im Falle einer Streuung im Erkennungskreislauf oder einer Störung bei der Flammenkontrolle.'},
-    23: {"text1": 'Störung Sonde Rücklauf', "text2": 'Die Sonde Rücklauf hat einen Widerstandswert außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung an der NTC-Vorlaufsonde.'},
-    24: {"text1": 'Störung Druckknopftafel', "text2": 'An den Tasten des Armaturenbretts wird ein ständiger Druck wahrgenommen.', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung an der Druckknopftafel.'},
-    25: {"text1": 'Blockierung Rauchgassonde / Blockierung CRC (TERA)', "text2": 'Rauchgastemperatur außerhalb des zulässigen Bereichs / Speicher beschädigt (TERA)', "action": 'Die Reset-Taste drücken', "comment": 'Rauchgasgradient hoch, wahrscheinliche Blockierung der Umwälzpumpe oder kein Wasser / Speicher beschädigt'},
-    27: {"text1": 'Unzureichende Zirkulation', "text2": 'Überhitzung des Heizkessels durch einen geringen Umlauf im Primärkreis', "action": 'Die Taste Reset drücken', "comment": 'Prüfen, dass keine Absperrungen auf dem Heizungskreis vorhanden sind, bzw. die korrekte Funktionsweise der Umwälzpumpe prüfen'},
-    28: {"text1": 'Leckage Warmwasserbereitung', "text2": 'Wenn während des Betriebs in der Heizphase eine Erhöhung der Temperatur des Warmwassers erfasst wird, zeigt der Heizkessel diese Anomalie an und verringert die Temperatur des Heizkessels, um die Bildung von Kalkablagerungen im Wärmetauscher zu begrenzen.', "action": 'Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Sicherstellen, dass alle Wasserhähne / Armaturen der Sanitäranlage geschlossen sind und nicht tropfen, sowie dass keine Leckage an der Anlage vorliegt. Sobald die optimalen Bedingungen des Warmwasserkreislaufs wiederhergestellt wurden, nimmt der Heizkessel wieder den Normalbetrieb auf.'},
-    29: {"text1": 'Störung Sonde Rauchgase', "text2": 'Die Sonde der Rauchgase hat einen Widerstandswert außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Die Karte ermittelt eine Störung an der Rauchgassonde.'},
-    31: {"text1": 'Unterbrechung des Datenaustausches mit CARV2', "text2": 'Kein Datenaustausch zwischen Karte und Fernsteuerung', "action": 'Die Spannung am Heizkessel abtrennen und wieder anlegen. Wenn beim Wiedereinschalten die Fernsteuerung nicht ermittelt wird, geht der Heizkessel in den lokalen Betriebsmodus über, d.h. es werden die Steuerungen an der Bedientafel verwendet. In diesem Fall kann die Funktion “Heizen” nicht aktiviert werden.', "comment": 'Dazu kommt es im Falle einer Verbindung mit einer nicht kompatiblen Fernsteuerung oder im Falle einer Unterbrechung des Datenaustausches zwischen Heizkessel und CARV2.'},
-    32: {"text1": 'Störung Sonde Zone 2 Niedertemperatur', "text2": 'Vorlaufsonde Zone 2 außerhalb des zulässigen Bereichs', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der Sonde Zone 2 Niedertemperatur, das System kann in der betreffenden Zone nicht betrieben werden.'},
-    33: {"text1": 'Störung Sonde Zone 3 Niedertemperatur', "text2": 'Vorlaufsonde Zone 3 außerhalb des zulässigen Bereichs', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der Sonde Zone 2 Niedertemperatur, das System kann in der betreffenden Zone nicht betrieben werden.'},
-    36: {"text1": 'Unterbrechung des Datenaustausches IMG Bus', "text2": 'Unterbrechung der Kommunikation am Protokoll IMG Bus.', "action": 'Der Heizkessel stellt die Heizanfrage nicht zufrieden.', "comment": 'Infolge einer Störung an der Steuereinheit des Heizkessels, an der Zonenkarte (optional) oder am IMG Bus wird die Kommunikation zwischen den unterschiedlichen Bauteilen unterbrochen.'},
-    37: {"text1": 'Niedrige Versorgungsspannung', "text2": 'Die Werte der Versorgungsspannung der Karte liegen unterhalb der zulässigen Grenzen.', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Dazu kommt es, wenn die Versorgungsspannung geringer ist als die zulässigen Grenzwerte für den korrekten Betrieb des Heizkessels.'},
-    38: {"text1": 'Unterbrechung Signal Flamme', "text2": 'Die Karte signalisiert eine Unterbrechung des Flammenstroms, nachdem ein korrekter Flammenstromwert hergestellt wurde.', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Dazu kommt es, wenn der Heizkessel korrekt eingeschaltet ist und die Flamme des Brenners unerwartet ausgeschaltet wird; es wird erneut ein Einschaltungsversuch ausgeführt, und im Falle eines Resets der normalen Betriebsbedingungen muss der Heizkessel nicht rückgestellt werden.'},
-    39: {"text1": 'Störung Sonde Solarverteiler', "text2": 'Die externe Sonde weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte erfasst eine Störung an der Sonde des Solarverteilers, der Heizkessel funktioniert regelmäßig weiter ohne Zufuhr von Solarenergie für die Trinkwarmwasseraufbereitung, weil die Solarpumpe aufhört zu funktionieren'},
-    40: {"text1": 'Störung Sonde Solarspeicher', "text2": 'Die Sonde des Solarspeichers weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte erfasst eine Störung an der Sonde des Solarspeichers, der Heizkessel funktioniert regelmäßig weiter ohne Zufuhr von Solarenergie für die Trinkwarmwasseraufbereitung, weil die Solarpumpe aufhört zu funktionieren.'},
-    41: {"text1": 'Hohe Temperatur an Solarverteiler', "text2": 'Der Solarverteiler hat die eingestellte Höchsttemperatur überschritten', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Dazu kommt es, wenn die Temperatur des Solarverteilers die eingestellte Höchstgrenze überschreitet'},
-    42: {"text1": 'Hohe Temperatur an Solarspeicher', "text2": 'Der Solarspeicher hat die eingestellte Höchsttemperatur überschritten', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Dazu kommt es, wenn die Wassertemperatur im Solarspeicher die eingestellte Höchstgrenze überschreitet.'},
-    43: {"text1": 'Blockierung wegen Unterbrechung des Flammensignals', "text2": 'Mehrmals nacheinander Unterbrechung des Flammensignals während des Betriebs.', "action": 'Die Reset-Taste drücken, vor dem Neustart führt der Heizkessel einen Nachlüftungszyklus aus.', "comment": 'Dazu kommt es, wenn sich der Fehler “Unterbrechung des Flammensignals” innerhalb einer festgesetzten Zeitspanne mehrmals nacheinander wiederholt.'},
-    44: {"text1": 'Blockierung wegen Überschreitung max. Dauer aufeinanderfolgende Öffnungen Gasventil.', "text2": 'Die Gesamtdauer für die Öffnung des Gasventils ohne Flammenermittlung überschreitet die maximale Grenze.', "action": 'Die Taste Reset drücken.', "comment": 'Dazu kommt es, wenn das Gasventil länger als für seinen normalen Betrieb vorgesehen geöffnet bleibt, ohne dass sich der Heizkessel einschaltet.'},
-    45: {"text1": 'dT erhöht', "text2": 'Der gemessene Temperatur unterschied zwischen Vorlauf und Rücklauf ist ≥  40°C.', "action": 'Die Leistung des Brenners wird begrenzt, um mögliche Schäden am Verflüssigermodul zu vermeiden, nach der Wiederherstellung des korrekten dT nimmt der Heizkessel den normalen Betrieb wieder auf. Sicherstellen, dass Wasser im Heizkessel umläuft und dass der Zirkulator gemäß den Erfordernissen der Anlage und dem korrekten Betrieb der Rücklaufsonde konfiguriert ist.', "comment": 'Der Heizkessel ermittelt einen plötzlichen und nicht vorhergesehenen Anstieg des dT zwischen Vorlauf- und Rücklaufsonde der Anlage.'},
-    46: {"text1": 'Eingriff Thermostat Niedertemperatur / Fehlerhafte Konfiguration Verkabelung/Karte', "text2": 'Das Sicherheitsthermostat am Vorlauf vom Heizkessel zu DIM v2 (funktioniert nur bei niedrigen Temperaturen) hat hohe Temperaturen erreicht. Fehlerhafte Verkabelung oder fehlerhafte Verwendung der Ersatzkarte', "action": 'In diesem Fall kann das Thermostat nach einer entsprechenden Abkühlung rückgestellt werden (siehe entsprechende Seite in den Anleitungen). / Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Wenn es während des normalen Betriebs aufgrund einer Störung zu einer übermäßigen Überhitzung der Vorlauftemperatur bei niedriger Temperatur kommt, wird der Heizkessel blockiert. / Fehlerhafte Verkabelung oder fehlerhafte Verwendung der Ersatzkarte'},
-    47: {"text1": 'Begrenzung Brennerleistung', "text2": 'Wenn die Temperatur der Rauchgase einen hohen Wert erreicht, vermindert die Karte die vom Brenner abgegebene Leistung, um Schäden am Rauchgaskreislauf in Grenzen zu halten.', "action": 'Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Falls eine hohe Temperatur der Rauchgase festgestellt wird vermindert der Heizkesseln die abgegebene Leistung, um Beschädigungen zu verhindern.'},
-    48: {"text1": 'Störung Vorlaufsonde anlagenseitig', "text2": 'Die Vorlaufsonde anlagenseitig weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Im Falle einer nicht angeschlossenen oder defekten Vorlaufsonde anlagenseitig wird eine Störung gemeldet'},
-    49: {"text1": 'Blockierung hohe Temperatur an Rücklaufsonde', "text2": 'Von der Rücklaufsonde gemessene hohe Temperatur', "action": 'Den korrekten Umlauf im Heizkessel und die einwandfreie Funktionsweise des 3-Wege-Ventils überprüfen.', "comment": 'Dazu kommt es, wenn am Rücklaufkreis des Wärmetauschers eine zu hohe Temperatur erreicht wird'},
-    50: {"text1": 'Störung externe Sonde', "text2": 'Die externe Sonde weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Den Anschluss der externen Sonde überprüfen. Das System funktioniert weiter', "comment": 'Im Falle einer nicht angeschlossenen oder defekten externen Sonde wird eine Störung gemeldet'},
-    51: {"text1": 'Unterbrechung Datenaustausch mit CAR Wireless', "text2": 'Der Datenaustausch zwischen Sender und CAR v2 RF wurde unterbrochen.', "action": 'Die Funktionstüchtigkeit des CAR Wireless überprüfen, die die Batterieladung überprüfen (siehe entsprechende Seite in den Anleitungen).', "comment": 'Im Falle einer Unterbrechung des Datenaustausches zwischen dem Heizkessel und CAR Version Wireless wird die Störung gemeldet, ab diesem Moment kann das System nur über die Bedientafel des Heizkessels selbst gesteuert werden.'},
-    54: {"text1": 'Störung Puffersonde', "text2": 'Die Puffersonde weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Die Puffer-Modalität wird deaktiviert', "comment": 'Im Falle einer nicht angeschlossenen oder defekten Puffersonde wird eine Störung gemeldet'},
-    55: {"text1": 'Störung Vorlauftemperatursonde Zone 1', "text2": 'Die Vorlaufsonde Zone 1 weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der Sonde Zone 1 Niedertemperatur, das System kann in der betreffenden Zone nicht betrieben werden'},
-    58: {"text1": 'Störung Audax', "text2": 'Meldung einer Störung seitens der mit dem System verbundenen Wärmepumpe AUDAX', "action": 'Die Wärmepumpe erfüllt die Heiz- und Kühlanforderungen nicht; nach Wiederherstellen der Verbindungen muss das System aus- und wieder eingeschaltet werden', "comment": 'Störung an der Wärmepumpe Audax, die Art der Störung direkt am Display der Wärmepumpe überprüfen'},
-    59: {"text1": 'Blockierung Netzfrequenz elektrische Versorgung', "text2": 'Die elektronische Karte hat eine Frequenzstörung am elektrischen Versorgungsnetz ermittelt.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine anormale Frequenz an der Netzversorgung.'},
-    60: {"text1": 'Störung Zirkulator blockiert', "text2": 'Der modulierende Zirkulator steht still.', "action": 'Versuchen, den Zirkulator wie im nachfolgenden Abschnitt beschrieben, zu entblocken. Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Der Zirkulator steht aus einem der folgenden Gründe still: Laufrad blockiert, elektrischer Defekt.'},
-    61: {"text1": 'Luft im Zirkulator', "text2": 'Der modulierende Zirkulator steht aufgrund eines Lufteintritts still.', "action": 'Die Luft aus dem Zirkulator und dem Heizkreislauf auslassen. Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Im Zirkulator wird Luft ermittelt; der Zirkulator kann nicht in Betrieb gesetzt werden.'},
-    62: {"text1": 'Anfrage Eichung beendet', "text2": 'Die Steuerparameter für die Feuerung an der Karte sind nicht korrekt konfiguriert.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Es wird festgestellt, dass die elektronische Karte nicht geeicht ist. Dazu kann es kommen, wenn die elektronische Karte ausgewechselt oder die Parameter im Abschnitt Luft/Gas verändert wurden, und infolgedessen eine “komplette Eichung” erforderlich ist.'},
-    63: {"text1": 'Störung Rücklaufsonde Anlage', "text2": 'Die Rücklaufsonde weist einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Der Heizkessel funktioniert weiter ohne jegliche Integration durch die externen Systeme', "comment": 'Im Falle einer nicht angeschlossenen oder defekten Rücklaufsonde wird eine Störung gemeldet'},
-    67: {"text1": 'Störung Druckwächter Solaranlage', "text2": 'Druckwächter Anlage offen, möglicherweise keine Flüssigkeit vorhanden', "action": 'Am Manometer der Solarkreislaufeinheit den korrekten Druckwert überprüfen', "comment": 'Aufgrund eines Druckabfalls im Solarkreis blockiert der Druckwächter den Betrieb des Solarheizkreises'},
-    70: {"text1": 'Sonden vertauscht', "text2": 'Bei einem Fehler im Anschluss der Heizkesselverkabelung wird der Fehler erfasst', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält, ist ein zugelassenes Unternehmen zu rufen (z.B. der technischen Kundendienst von Immergas).', "comment": 'Den Anschluss der Sonde für den Zu- und Rücklauf überprüfen'},
-    72: {"text1": 'Anfrage schnelle Eichung', "text2": 'Einige Feuerungssteuerparameter an der Karte sind nicht korrekt konfiguriert.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Es wird eine Änderung einiger Parameter festgestellt, infolgedessen eine “schnelle Eichung“ erforderlich ist.'},
-    73: {"text1": 'Es wurde eine hohe Abweichung der Sicherheits-Vor- und Rücklaufsonde festgestellt.', "text2": 'Die Vorlaufsonden weisen eine hohe Abweichung auf.', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Die Karte ermittelt eine Störung bei der Lesung der Temperaturen der NTC-Vorlaufsonden; mögliche Ursachen: Sonde defekt, nicht korrekt positioniert, geringer Anlagenumlauf, Verstopfung wasserseitig primärer Wärmetauscher.'},
-    74: {"text1": 'Störung Sicherheits-Vorlaufsonde.', "text2": 'Die Sicherheits-Vorlaufsonde hat einen Widerstandswert außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der NTC-Sicherheits-Vorlaufsonde.'},
-    75: {"text1": 'Blockierung wegen beschädigtem NTC-Sensor', "text2": 'Mögliche Beschädigung einer oder beider Sonden für den Zu- und Rücklauf der Anlage', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält, ist ein zugelassenes Unternehmen zu rufen (z.B. der technischen Kundendienst von Immergas).', "comment": 'Der Sensor die Sicherheitssonde verursacht einen hohen Temperaturgradienten'},
-    76: {"text1": 'Drift Sonde Zulauf oder Sonde Rücklauf', "text2": 'Es wird eine Fehlfunktion einer oder beider Sonden für den Zulauf und den Rücklauf der Anlage erfasst', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält, ist ein zugelassenes Unternehmen zu rufen (z.B. der technischen Kundendienst von Immergas).', "comment": 'Größere Differenz als bei einer Wärmeanforderung zwischen Sonde Zulauf und Rücklauf eingestellt'},
-    77: {"text1": 'Störung Steuerung Feuerung.', "text2": 'Strom Gasventil außerhalb des zulässigen Bereichs.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Der Strom des Gasventils ist außerhalb des zulässigen Bereichs.'},
-    78: {"text1": 'Störung Steuerung Feuerung.', "text2": 'Strom Gasventil erhöht.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Der Strom am Gasventil ist erhöht.'},
-    79: {"text1": 'Störung Steuerung Feuerung.', "text2": 'Strom Gasventil niedrig', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Der Strom am Gasventil ist niedrig.'},
-    80: {"text1": 'Blockierung Funktionsstörung elektronische Karte', "text2": 'Defekt Driver elektronisches Gasventil wegen Problemen an der Karte oder am Gasventil', "action": 'Die Taste Reset drücken.', "comment": 'Dazu kommt es im Falle einer Funktionsstörung der elektronischen Karte, die das Ventil steuert.'},
-    84: {"text1": 'Störung Feuerung - Leistungsverminderung im Gang', "text2": 'Assimilierbare Bedingungen bei Niederdruck Versorgung Gasventil', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Der Versorgungsdruck am Gasnetz ist gering. Folglich wird die Geräteleistung eingestellt und eine Störung gemeldet.'},
-    85: {"text1": 'Blockierung Problem Nachverbrennung', "text2": 'Potentielles Problem an Gasventil, Elektrode oder elektronischer Steuerplatine.', "action": 'Die Taste Reset drücken. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas)', "comment": 'Flamme nach Schließen des Gasventils vorhanden.'},
-    87: {"text1": 'Blockierung Steuerung Gasventil', "text2": 'Defekt an der Steuerung des Gasventils', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Es wird eine Funktionsstörung an einem der Bauteile, die dass Gasventil steuern, festgestellt.'},
-    88: {"text1": 'Blockierung Steuerung Gasventil', "text2": 'Defekt an der Steuerung des Gasventils', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Es wird eine Funktionsstörung an einem der Bauteile, die dass Gasventil steuern, festgestellt.'},
-    89: {"text1": 'Signal Feuerung nicht stabil', "text2": 'Das Signal der Feuerung ist nicht stabil.', "action": 'Der Heizkessel ist weiter in Betrieb.', "comment": 'Die Flamme ist aus folgenden Gründen nicht stabil: kein Rauchgasumlauf, Wind, Gasdruck nicht stabil, Geschwindigkeit Gebläse nicht stabil oder es liegt eine Funktionsstörung im System vor.'},
-    90: {"text1": 'Signal Feuerung außerhalb der zulässigen Grenze.', "text2": 'Das Signal der Feuerung ist außerhalb der zulässigen Grenze.', "action": 'Der Heizkessel ist weiter in Betrieb.', "comment": 'Das Signal der Feuerung ist zu lange nicht innerhalb des Bereichs der vorgesehenen Einstellung.'},
-    91: {"text1": 'Blockierung Einschaltung nicht korrekt', "text2": 'Die Karte hat alle Möglichkeiten für eine optimale Einschaltung des Brenners erschöpft.', "action": 'Die Taste Reset drücken.', "comment": 'Die Karte hat alle Möglichkeiten für eine optimale Einschaltung des Brenners erschöpft.'},
-    92: {"text1": 'Grenze Korrektur Gebläseumdrehungen', "text2": 'Die Karte hat die maximale Korrektur der Gebläseumdrehungen erreicht.', "action": 'Der Heizkessel ist weiter in Betrieb.', "comment": 'Das System hat alle möglichen Korrekturen der Gebläseumdrehungen erschöpft.'},
-    93: {"text1": 'Signal Feuerung außerhalb der zulässigen Grenze.', "text2": 'Das Signal der Feuerung ist außerhalb der zulässigen Grenze.', "action": 'Der Heizkessel ist weiter in Betrieb.', "comment": 'Das Signal der Feuerung ist zu lange nicht innerhalb des Bereichs der vorgesehenen Einstellung.'},
-    94: {"text1": 'Störung Feuerung', "text2": 'Problem der Feuerung, hervorgerufen durch System bzw. Steuerung der Feuerung.', "action": 'Im Falle eines Resets des normalen Betriebs startet der Heizkessel erneut ohne rückgestellt werden zu müssen.', "comment": 'Es wird ein Problem an der Steuerung der Feuerung ermittelt; mögliche Ursachen: geringer Gasdruck, Rauchgasumlauf, Gasventil oder elektronische Karte defekt.'},
-    95: {"text1": 'Signal Feuerung diskontinuierlich', "text2": 'Diskontinuität am Signal der Feuerung aufgrund von Problemen an der elektrischen Verbindung oder wegen Signaldispersion.', "action": 'Der Heizkessel ist weiter in Betrieb.', "comment": 'Das System ermittelt eine Diskontinuität beim Feuerungssignal.'},
-    96: {"text1": 'Rauchfang verstopft', "text2": 'Der Rauchfang ist verstopft.', "action": 'Der Heizkessel startet nicht. Wenn die Blockierung bzw. Störung anhält  sollten Sie sich an einen qualifizierten Techniker wenden (z.B. den technischen Kundendienst von Immergas).', "comment": 'Dazu kommt es, wenn eine Verstopfung im Rauchfang festgestellt wird.'},
-    98: {"text1": 'Blockierung maximale Anzahl Software-Fehler', "text2": 'Die elektronische Karte funktioniert nicht korrekt.', "action": 'Die Taste Reset drücken.', "comment": 'Es wird die maximale Anzahl an zulässigen Software-Fehlern erreicht.'},
-    99: {"text1": 'Allgemeine Blockierung', "text2": 'Die elektronische Karte funktioniert nicht korrekt.', "action": 'Die Taste Reset drücken.', "comment": 'Es wird eine Störung am Heizkessel ermittelt.'},
-    101: {"text1": 'Alarm offline Audax', "text2": 'Unterbrechung des Datenaustausches mit Wärmepumpe', "action": 'Die Wärmepumpe erfüllt die Heiz- und Kühlanforderungen nicht; nach Wiederherstellen der Verbindungen muss das System aus- und wieder eingeschaltet werden', "comment": 'Im Falle einer Unterbrechung des Datenaustausches, einer fehlerhaften Verbindung oder bei ausgeschalteter Wärmepumpe, erfasst die Elektronik die Wärmepumpe nicht'},
-    102: {"text1": 'Alarm offline Ausdehnung Zone 1', "text2": 'Unterbrechung des Datenaustausches mit Ausdehnung Zone 1', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Störung beim Datenaustausch mit Zone 1'},
-    103: {"text1": 'Alarm offline Ausdehnung Zone 2', "text2": 'Unterbrechung des Datenaustausches mit Ausdehnung Zone 2', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Störung beim Datenaustausch mit Zone 2'},
-    104: {"text1": 'Alarm offline Ausdehnung Zone 3', "text2": 'Unterbrechung des Datenaustausches mit Ausdehnung Zone 3', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Störung beim Datenaustausch mit Zone 3'},
-    106: {"text1": 'Alarm Sonde Trinkwarmwasser', "text2": 'Im Fall einer Integration mit Heizkessel und separater Verwaltung des Trinkwarmwassers, weist die von der Steuerung kontrollierte Boilersonde einen Widerstandswert außerhalb des zulässigen Bereichs auf', "action": 'Das System kann mit der Wärmepumpe kein Trinkwarmwasser aufbereiten. Die Trinkwarmwasseraufbereitung wird vom Heizkessel gewährleistet', "comment": 'Die Karte ermittelt eine Störung an der Boilersonde'},
-    120: {"text1": 'Alarm hoher Sollwert für Entfeuchtung Zone 1', "text2": 'Der berechnete Sollwert der Anforderung Zone 1 ist zu hoch für die Entfeuchtung', "action": 'Der berechnete Sollwert des Vorlaufs überschreitet die zulässige Grenze des Entfeuchters. Den Raum kühlen und warten, bis die Taupunkttemperatur wieder bei akzeptablen Werten liegt', "comment": 'Der berechnete Sollwert des Kühlvorlaufs für die Entfeuchtung überschreitet die in Zone 1 eingestellte Grenze'},
-    121: {"text1": 'Alarm offline Gerät Zone 1', "text2": 'Die Fernsteuerung der Zone 1 ist offline', "action": 'Überprüfen, ob die Fernsteuerung eingeschaltet ist', "comment": 'Der Datenaustausch mit der Zonensteuerung wird nicht erfasst. Die Temperaturregelung der Zone kann nicht ausgeführt werden'},
-    122: {"text1": 'Alarm offline Gerät Zone 2', "text2": 'Die Fernsteuerung der Zone 2 ist offline', "action": 'Überprüfen, ob die Fernsteuerung eingeschaltet ist', "comment": 'Der Datenaustausch mit der Zonensteuerung wird nicht erfasst. Die Temperaturregelung der Zone kann nicht ausgeführt werden'},
-    123: {"text1": 'Alarm offline Gerät Zone 3', "text2": 'Die Fernsteuerung der Zone 3 ist offline', "action": 'Überprüfen, ob die Fernsteuerung eingeschaltet ist', "comment": 'Der Datenaustausch mit der Zonensteuerung wird nicht erfasst. Die Temperaturregelung der Zone kann nicht ausgeführt werden'},
-    125: {"text1": 'Störung Raumtemperatursonde Zone 1', "text2": 'Die Raumtemperatursonde der Zone 1 liegt außerhalb des zulässigen Bereichs', "action": 'Außer der Temperatur wird der Taupunkt für die Zone nicht berechnet', "comment": 'Störung an der Raumtemperatursonde Zone 1 (optional). Die Temperaturregelung der Zone kann nicht ausgeführt werden'},
-    126: {"text1": 'Störung Raumtemperatursonde Zone 2', "text2": 'Die Raumtemperatursonde der Zone 2 liegt außerhalb des zulässigen Bereichs', "action": 'Außer der Temperatur wird der Taupunkt für die Zone nicht berechnet', "comment": 'Störung an der Raumtemperatursonde Zone 2 (optional). Die Temperaturregelung der Zone kann nicht ausgeführt werden'},
-    127: {"text1": 'Störung Raumtemperatursonde Zone 3', "text2": 'Die Raumtemperatursonde der Zone 3 liegt außerhalb des zulässigen Bereichs', "action": 'Außer der Temperatur wird der Taupunkt für die Zone nicht berechnet', "comment": 'Störung an der Raumtemperatursonde Zone 3 (optional). Die Temperaturregelung der Zone kann nicht ausgeführt werden'},
-    129: {"text1": 'Störung Feuchtigkeitssonde Zone 1', "text2": 'Die Raumfeuchtigkeitssonde der Zone 1 liegt außerhalb des zulässigen Bereichs', "action": 'Außer der Feuchtigkeit wird der Taupunkt für die Zone nicht berechnet', "comment": 'Störung an der Feuchtigkeitssonde Zone 1 (optional). Die Kontrolle der Feuchtigkeit der Zone kann nicht ausgeführt werden'},
-    130: {"text1": 'Störung Feuchtigkeitssonde Zone 2', "text2": 'Die Raumfeuchtigkeitssonde der Zone 2 liegt außerhalb des zulässigen Bereichs', "action": 'Außer der Feuchtigkeit wird der Taupunkt für die Zone nicht berechnet', "comment": 'Störung an der Feuchtigkeitssonde Zone 2 (optional). Die Kontrolle der Feuchtigkeit der Zone kann nicht ausgeführt werden'},
-    131: {"text1": 'Störung Feuchtigkeitssonde Zone 3', "text2": 'Die Raumfeuchtigkeitssonde der Zone 3 liegt außerhalb des zulässigen Bereichs', "action": 'Außer der Feuchtigkeit wird der Taupunkt für die Zone nicht berechnet', "comment": 'Störung an der Feuchtigkeitssonde Zone 3 (optional). Die Kontrolle der Feuchtigkeit der Zone kann nicht ausgeführt werden'},
-    132: {"text1": 'Alarm hoher Sollwert für Entfeuchtung Zone 2', "text2": 'Der berechnete Sollwert der Anforderung Zone 2 ist zu hoch für die Entfeuchtung', "action": 'Der berechnete Sollwert des Vorlaufs überschreitet die zulässige Grenze des Entfeuchters. Den Raum kühlen und warten, bis die Taupunkttemperatur wieder bei akzeptablen Werten liegt', "comment": 'Der berechnete Sollwert des Kühlvorlaufs für die Entfeuchtung überschreitet die in Zone 2 eingestellte Grenze'},
-    133: {"text1": 'Alarm Störung Entfeuchter Zone 1', "text2": 'Der Entfeuchter der Zone 1 befindet sich im Alarmzustand', "action": 'Das System führt in der entsprechenden Zone keine Entfeuchtung durch', "comment": 'Störung von Entfeuchter (optional) in Zone 1 kommend'},
-    134: {"text1": 'Alarm Störung Entfeuchter Zone 2', "text2": 'Der Entfeuchter der Zone 2 befindet sich im Alarmzustand', "action": 'Das System führt in der entsprechenden Zone keine Entfeuchtung durch', "comment": 'Störung von Entfeuchter (optional) in Zone 2 kommend'},
-    135: {"text1": 'Alarm Störung Entfeuchter Zone 3', "text2": 'Der Entfeuchter der Zone 3 befindet sich im Alarmzustand', "action": 'Das System führt in der entsprechenden Zone keine Entfeuchtung durch', "comment": 'Störung von Entfeuchter (optional) in Zone 3 kommend'},
-    137: {"text1": 'Systemalarm wiederhergestellt – Das System neu starten', "text2": 'Nach einer durch die Bedientafel erfolgten Wiederherstellung wird ein Alarm angezeigt, weil das System neu gestartet werden muss', "action": 'System aus- und wieder einschalten', "comment": 'Nach erfolgter Wiederherstellung der standardmäßigen Parameter muss das System neu gestartet werden'},
-    138: {"text1": 'Estrichheizung im Gang', "text2": 'Estrichheizfunktion im Gang', "action": '', "comment": ''},
-    139: {"text1": 'Entlüftung im Gang', "text2": 'Entlüftungsfunktion im Gang', "action": '', "comment": ''},
-    177: {"text1": 'Alarm Höchstzeit Trinkwarmwasser', "text2": 'Die Durchführung der Trinkwarmwasseranforderung hat die vorbestimmte Höchstzeit überschritten', "action": 'Das System arbeitet weiter mit nicht optimalen Leistungen', "comment": 'Die Trinkwarmwasseraufbereitung kann nicht in der vorbestimmten Zeit befriedigt werden (5 Stunden)'},
-    178: {"text1": 'Legionellen-Zyklus ohne Erfolg', "text2": 'Der Legionellen-Zyklus wird innerhalb der vorbestimmten Zeit nicht erfolgreich ausgeführt', "action": 'Die Reset-Taste drücken', "comment": 'Der Legionellen-Zyklus wird ohne Erfolg innerhalb der vorbestimmten Zeit ausgeführt (3 Stunden)'},
-    179: {"text1": 'Störung Flüssigsonde', "text2": 'Die Sonde der Flüssigphase liegt außerhalb des zulässigen Bereichs.', "action": 'Das System startet nicht. Eine zugelassene Firma kontaktieren (z.B. den technischen Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der Sonde Flüssigphase'},
-    181: {"text1": 'Unterbrechung des Datenaustausches mit Fernsteuerung Zone 2', "text2": 'Kein Datenaustausch zwischen Karte und Fernsteuerung Zone 2.', "action": 'Spannung am Hydronikmodul abtrennen und wieder anlegen. Wenn beim Wiedereinschalten die Fernsteuerung nicht ermittelt wird, geht das System in den lokalen Betriebsmodus über, d.h. es werden die Steuerungen an der Bedientafel verwendet. In diesem Fall kann die Funktion “Heizen”, nicht aktiviert werden', "comment": 'Dazu kommt es im Falle einer Verbindung mit einer nicht kompatiblen Fernsteuerung oder im Falle einer Unterbrechung des Datenaustausches zwischen Hydronikmodul und CARV2 der zweiten Zone'},
-    182: {"text1": 'Alarm Verflüssigungssatz', "text2": 'Ein Alarm am Verflüssigungssatz tritt ein', "action": 'Das System funktioniert nicht, siehe Störung am Verflüssigungssatz und entsprechende Seite in den Anleitungen', "comment": 'Es wird eine Störung am Verflüssigungssatz gemeldet'},
-    183: {"text1": 'Alarm Verflüssigungssatz in Test Mode', "text2": 'Der Verflüssigungssatz ist in TEST MODE', "action": 'Während dieser Phase können die Anforderungen für Raumklimatisierung und Trinkwarmwasseraufbereitung nicht zufriedengestellt werden', "comment": 'Es wird gemeldet, dass der Verflüssigungssatz in Test Mode-Phase ist'},
-    184: {"text1": 'Alarm Time-out Datenaustausch mit Außeneinheit', "text2": 'Unterbrechung des Datenaustausches mit Verflüssigungssatz', "action": 'Die elektrische Verbindung zwischen den Einheiten überprüfen', "comment": 'Es wird eine Störung beim Datenaustausch zwischen Inneneinheit und Verflüssigungssatz gemeldet'},
-    185: {"text1": 'Alarm Datenaustausch Safety-Modul', "text2": 'Unterbrechung des Datenaustausches mit Safety-Modul', "action": 'Verbindung zwischen den Bauteilen überprüfen lassen', "comment": 'Störung beim Datenaustausch zwischen Regelungskarte und Zündkarte'},
-    186: {"text1": 'Hochspannungsstörung am Zündgerät', "text2": 'Safety-Modul: Am Zündgerät ist eine Spannungsstörung aufgetreten', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Es wird eine Störung an der Zündkarte gemeldet'},
-    187: {"text1": 'Alarm Rücklaufsonde Verflüssigungssatz', "text2": 'Die Rücklaufsonde des Verflüssigungssatzes liegt außerhalb des zulässigen Bereichs', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der NTC-Rücklaufsonde der Wärmepumpe'},
-    188: {"text1": 'Anforderung außerhalb des zulässigen Betriebsbereichs', "text2": 'Die Anforderung wird nicht durchgeführt, weil die externen Bedingungen die Aktivierung des Verflüssigungssatzes nicht erlauben', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Es trifft eine Anforderung zum Heizen oder Kühlen mit Außentemperatur außerhalb der Betriebsgrenzen ein'},
-    189: {"text1": 'Alarm Time-out Datenaustausch mit Kommunikationskarte', "text2": 'Unterbrechung des Datenaustausches mit Kommunikationskarte f. Verflüssigungssatz', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Im Falle einer Unterbrechung des Datenaustausches zwischen den elektronischen Karten wird eine Störung gemeldet'},
-    191: {"text1": 'Unterbrechung des Datenaustausches RF mit CAR v2 RF Zone 2', "text2": 'Der Datenaustausch zwischen Sender und CAR v2 RF der Zone 2 wurde unterbrochen', "action": 'Die Funktionstüchtigkeit des CAR Wireless überprüfen, die Batterieladung überprüfen (siehe entsprechende Seite in den Anleitungen)', "comment": 'Im Falle einer Unterbrechung des Datenaustausches zwischen der Inneneinheit und CAR Version Wireless der zweiten Zone wird die Störung gemeldet, ab diesem Moment kann das System nur über die Bedientafel der Inneneinheit gesteuert werden'},
-    192: {"text1": 'Alarm Vorlaufsonde Verflüssigungssatz', "text2": 'Die Vorlaufsonde des Verflüssigungssatzes liegt außerhalb des zulässigen Bereichs', "action": 'Wenn die Blockierung bzw. Störung anhält, muss ein zugelassenes Unternehmen kontaktiert werden (z.B. der technische Kundendienst von Immergas).', "comment": 'Die Karte ermittelt eine Störung an der NTC-Vorlaufsonde der Wärmepumpe'},
-    193: {"text1": 'Gerät in Test Mode', "text2": 'Das Gerät wird durch eine externe Vorrichtung über Opentherm-Protokoll kontrolliert', "action": 'Das System funktioniert korrekt weiter', "comment": 'Es wird gemeldet, dass das Gerät in Test Mode-Phase ist'},
-    194: {"text1": 'Audax Pro deaktiviert', "text2": 'Der Verflüssigungssatz Audax Pro wurde deaktiviert', "action": 'Das System funktioniert korrekt weiter', "comment": 'Es wird gemeldet, dass der Verflüssigungssatz mit dem entsprechenden Eingang am Klemmenbrett deaktiviert wird'},
-    195: {"text1": 'Störung niedrige Temp. Flüssigphase ', "text2": 'Die Temp. der Sonde Flüssigphase ist zu niedrig', "action": 'Die einwandfreie Funktionsweise des Kühlkreislaufes überprüfen', "comment": 'Während der Flüssigphase wird eine zu niedrige Temperatur erfasst'},
-    196: {"text1": 'Blockierung hohe Vorlauftemperatur', "text2": 'Am Rücklaufkreis der Wärmepumpe wird eine zu hohe Temperatur erfasst', "action": 'Die einwandfreie Funktionsweise des Kühlkreislaufes überprüfen', "comment": 'Am Vorlaufkreis der Wärmepumpe wird eine zu hohe Temperatur erfasst'},
-}
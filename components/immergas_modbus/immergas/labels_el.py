@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: el)"""
-
-immergas_labels = {
-    'default': {"text1": 'Γενική ανωμαλία που δεν αναγνωρίζεται.', "text2": 'Ελέγξτε πίνακα λαθών ή επιλεγμένη κάρτα.', "action": 'Ελέγξτε πίνακα λαθών ή επιλεγμένη κάρτα.', "comment": 'Καμία ανάλογη σημείωση '},
-    0: {"text1": 'ΤΟ ΣΥΣΤΗΜΑ ΕΙΝΑΙ ΕΝΤΑΞΕΙ', "text2": 'Το σύστημα λειτουργεί σωστά', "action": 'Δεν απαιτείται καμία ενέργεια', "comment": 'Καμία ανωμαλία'},
-    1: {"text1": 'Εμπλοκή ελλιπούς εκκίνησης', "text2": 'Ελλιπής ανίχνευση φλόγας στο τέλος της τελευταίας προσπάθειας ενεργοποίησης.', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Ο λέβητας σε περίπτωση αιτήματος θέρμανσης περιβάλλοντος ή παραγωγής ζεστού νερού οικιακής χρήσης δεν ανάβει εντός του προκαθορισμένου χρόνου. Με την πρώτη ενεργοποίηση ή μετά από μεγάλη περίοδο αδράνειας της συσκευής μπορεί να χρειαστεί να επέμβετε για την απαλοιφή της εμπλοκής.'},
-    2: {"text1": 'Εμπλοκή θερμοστάτη ασφαλείας (υπερθέρμανση).', "text2": 'Επέμβαση θερμοστάτη ασφαλείας', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Κατά τη διάρκεια της κανονικής λειτουργίας, αν λόγω προβλήματος παρουσιαστεί υπερβολική εσωτερική υπερθέρμανση, ο λέβητας μεταφέρεται σε εμπλοκή.'},
-    3: {"text1": 'Εμπλοκή θερμοστάτη καπνών', "text2": 'Επέμβαση θερμοστάτη καπνών', "action": 'Πατήστε το κουμπί της επαναφοράς (έκδοση Nike)/ Διαμορφώστε σωστά την παράμετρο Ρ.14. Αν χρειάζεται πατήστε το κουμπί της επαναφοράς (έκδοση Star)', "comment": 'Κατά τη διάρκεια της κανονικής λειτουργίας, αν λόγω προβλήματος παρουσιαστεί υπερβολική εσωτερική υπερθέρμανση των καπνών, ο λέβητας μεταφέρεται σε εμπλοκή. (έκδοση Nike)/ Λάθος διαμόρφωση παραμέτρου Ρ.14 (έκδοση Star)'},
-    4: {"text1": 'Εμπλοκή αντίστασης επαφών', "text2": 'Έχει ανιχνευτεί κάποια ανωμαλία στο κύκλωμα οδήγησης της βαλβίδας αερίου.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": "La scheda elettronica rileva un'anomalia sull'alimentazione della valvola gas. Ελέγξτε τη σύνδεσή της. (l'anomalia viene rilevata e visualizzata solo in presenza di una richiesta)."},
-    5: {"text1": 'Ανωμαλία αισθητήρα κατάθλιψης', "text2": 'Ο αισθητήρας κατάθλιψης προσφέρει μια ανθεκτική τιμή εκτός του εύρους.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον αισθητήρα κατάθλιψης NTC.'},
-    6: {"text1": 'Ανωμαλία αισθητήρα νερού χρήσης', "text2": 'Ο αισθητήρας νερού οικιακής χρήσης προσφέρει μια ανθεκτική τιμή εκτός του εύρους.', "action": 'Ο λέβητας συνεχίζει να παράγει ζεστό νερό χρήσης αλλά όχι στη βέλτιστη απόδοση. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον αισθητήρα νερού οικιακής χρήσης NTC.'},
-    8: {"text1": 'Μέγιστος αριθμός επαναφορών', "text2": 'Δείχνει την επίτευξη του μέγιστου αριθμού των επαναφορών που επιτρέπονται από την ενσωματωμένη κάρτα.', "action": "Προσοχή: Μπορείτε να επαναφέρετε μέχρι 5 συνεχόμενες φορές την ανωμαλία, μετά η λειτουργία αναστέλλεται για τουλάχιστον μία ώρα και στη συνέχεια μπορείτε να δοκιμάζετε μία φορά κάθε ώρα για το μέγιστο των 5 προσπαθειών. Togliendo e riapplicando l'alimentazione all'apparecchio si riacquistano i 5 tentativi.", "comment": 'Διαθέσιμος αριθμός επαναφορών που έχουν ήδη εκτελεστεί.'},
-    10: {"text1": 'Ανεπαρκής πίεση εγκατάστασης', "text2": 'Είναι ανοιχτή η επαφή του διακόπτη πίεσης της εγκατάστασης.', "action": "Verificare sul manometro di caldaia che la pressione dell'impianto sia compresa tra 1÷1,2 bar ed eventualmente ripristinare la corretta pressione.", "comment": 'Δεν ανιχνεύεται κάποια πίεση νερού στο εσωτερικό του κυκλώματος θέρμανσης έτσι ώστε να εξασφαλιστεί η σωστή λειτουργία του λέβητα.'},
-    11: {"text1": 'Ανωμαλία διακόπτη πίεσης καυσαερίων', "text2": 'Πιθανή ανωμαλία στο διακόπτη καυσαερίων ή στον ανεμιστήρα', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Αν αποκατασταθούν οι κανονικές συνθήκες λειτουργίας ο λέβητας ξεκινά τη λειτουργία του χωρίς να χρειάζεται εκ νέου ρύθμιση'},
-    12: {"text1": 'Ανωμαλία αισθητήρα μπόιλερ', "text2": 'La sonda bollitore offre un valore resistivo fuori range', "action": 'Ο λέβητας δεν μπορεί να παράγει ζεστό νερό οικιακής χρήσης. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον αισθητήρα του μπόιλερ.'},
-    13: {"text1": 'Μετρητής ροής αέρα/καυσαερίων εκτός εύρους', "text2": 'Το σήμα αέρα/καυσαερίων είναι εκτός εύρους ή με σταματημένο ανεμιστήρα ο έλεγχος διαβάζει ένα πολύ υψηλό σήμα', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Με σταματημένο ανεμιστήρα, ο έλεγχος αέρα/καυσαερίων διαβάζει ένα πολύ υψηλό σήμα (επαφές διακόπτη πίεσης κολλημένες)'},
-    15: {"text1": 'Σφάλμα διαμόρφωσης', "text2": 'Η κάρτα λαμβάνει κάποια ασυμφωνία μεταξύ της διαμόρφωσής της και των σημάτων κατά την είσοδο.', "action": 'Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά. Βεβαιωθείτε ότι ο λέβητας είναι διαμορφωμένος με σωστό τρόπο. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Αν η κάρτα ανιχνεύσει κάποια ανωμαλία ή ασυμφωνία στην ηλεκτρική καλωδίωση ο λέβητας δεν ξεκινά.'},
-    16: {"text1": 'Ανωμαλία ανεμιστήρα', "text2": 'Ο ανεμιστήρας περιστρέφεται όταν δεν τροφοδοτείται ή παραμένει στάσιμος όταν τροφοδοτείται.', "action": 'Πατήστε το κουμπί της επαναφοράς. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Συμβαίνει στην περίπτωση που ο ανεμιστήρας έχει κάποια μηχανική ή ηλεκτρονική βλάβη.'},
-    17: {"text1": 'Εσφαλμένη ταχύτητα ανεμιστήρα', "text2": 'Ο αριθμός των περιστροφών του ανεμιστήρα είναι εκτός του σωστού εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Εσφαλμένος αριθμός περιστροφών ανεμιστήρα'},
-    20: {"text1": 'Εμπλοκή παρασιτικής φλόγας', "text2": 'Ανίχνευση ανωμαλίας φλόγας', "action": 'Πατήστε το κουμπί της επαναφοράς. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Συμβαίνει στην περίπτωση απώλειας του κυκλώματος ανίχνευσης ή ανωμαλίας στον έλεγχο της φλόγας.'},
-    23: {"text1": 'Ανωμαλία αισθητήρα επιστροφής', "text2": 'Ο αισθητήρας επιστροφής προσφέρει μια ανθεκτική τιμή εκτός του εύρους.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον αισθητήρα κατάθλιψης NTC.'},
-    24: {"text1": 'Ανωμαλία του πίνακα ελέγχου.', "text2": 'Λαμβάνεται μια συνεχής πίεση στα κουμπιά του πίνακα ελέγχου.', "action": 'Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον πίνακα κουμπιών.'},
-    25: {"text1": 'Συγκρότημα αισθητήρα καυσαερίων / συγκρότημα CRC (TERA)', "text2": 'Θερμοκρασία καυσαερίων εκτός εύρους /κατεστραμμένη μνήμη (TERA)', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Βαθμίδα καυσαερίων υψηλή, πιθανή εμπλοκή κυκλοφορητή ή έλλειψη νερού / κατεστραμμένη μνήμη'},
-    27: {"text1": 'Ανεπαρκής κυκλοφορία', "text2": 'Υπερθέρμανση του λέβητα λόγω της ελλιπούς κυκλοφορίας στο πρωτεύον κύκλωμα', "action": 'Πατήστε το κουμπί της επανεκκίνησης', "comment": 'Βεβαιωθείτε ότι δεν υπάρχουν διακοπές στο κύκλωμα θέρμανσης ή/και ελέγξτε τη σωστή λειτουργία του κυκλοφορητή'},
-    28: {"text1": 'Άντληση νερού οικιακής χρήσης', "text2": 'Αν κατά τη διάρκεια λειτουργίας της φάσης θέρμανσης επισημανθεί κάποια αύξηση της θερμοκρασίας του νερού οικιακής χρήσης ο λέβητας σηματοδοτεί την ανωμαλία και μειώνει τη θερμοκρασία του θερμαντήρα για να περιορίσει το σχηματισμό αλάτων στον εναλλάκτη.', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Βεβαιωθείτε ότι όλες οι βάνες του κυκλώματος νερού οικιακής χρήσης είναι κλειστές και δεν στάζουν και σε κάθε περίπτωση ελέγξτε ότι δεν υπάρχουν διαρροές στο σύστημα. Ο λέβητας επιστρέφει στην κανονική του λειτουργία όταν αποκατασταθούν οι άριστες συνθήκες στο σύστημα νερού οικιακής χρήσης'},
-    29: {"text1": 'Ανωμαλία αισθητήρα καπνών', "text2": 'Ο αισθητήρας καπνών προσφέρει μια ανθεκτική τιμή εκτός του εύρους.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": "La scheda rileva un'anomalia sulla sonda fumi."},
-    31: {"text1": 'Perdita di comunicazione col CARV2', "text2": 'Δεν υπάρχει συνομιλία μεταξύ κάρτας και τηλεχειριστηρίου.', "action": 'Αφαιρέστε και ξαναδώστε τάση στο λέβητα. Αν κατά την εκ νέου ενεργοποίηση δεν ανιχνεύεται το τηλεχειριστήριο ο λέβητας μεταφέρεται στην κατάσταση της τοπικής λειτουργίας χρησιμοποιώντας επομένως τις εντολές που υπάρχουν στον πίνακα εντολών. Στην περίπτωση αυτή δεν μπορείτε να ενεργοποιήσετε τη λειτουργία “Θέρμανσης”.', "comment": 'Διαπιστώνεται σε περίπτωση σύνδεσης  με ένα μη συμβατό τηλεχειριστήριο ή στην περίπτωση έλλειψης επικοινωνίας μεταξύ λέβητα και CARV2. '},
-    32: {"text1": 'Ανωμαλία αισθητήρα χαμηλής θερμοκρασίας περιοχής 2', "text2": 'Αισθητήρας κατάθλιψης εκτός εύρους περιοχής 2', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει κάποια ανωμαλία χαμηλής θερμοκρασίας στον αισθητήρα περιοχής 2, το σύστημα δεν μπορεί να λειτουργήσει στην εν λόγω περιοχή'},
-    33: {"text1": 'Ανωμαλία αισθητήρα χαμηλής θερμοκρασίας περιοχής 3', "text2": 'Αισθητήρας κατάθλιψης εκτός εύρους περιοχής 3', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει κάποια ανωμαλία χαμηλής θερμοκρασίας στον αισθητήρα περιοχής 2, το σύστημα δεν μπορεί να λειτουργήσει στην εν λόγω περιοχή'},
-    36: {"text1": 'Πτώση επικοινωνίας IMG Bus', "text2": 'Απώλεια επικοινωνίας στο πρωτόκολλο IMG Bus.', "action": 'Ο λέβητας δεν πληροί τις απαιτήσεις θέρμανσης.', "comment": "A causa di un anomalia sulla centralina di caldaia, sulla scheda a zone (optional) o sull'IMG Bus si interrompe la comunicazione tra i vari componenti."},
-    37: {"text1": 'Χαμηλή τάση τροφοδοσίας', "text2": 'Η τάση τροφοδοσίας κάρτας έχει τιμές κατώτερες από τα επιτρεπόμενα όρια.', "action": 'Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": "Si verifica nel caso in cui la tensione di alimentazione e' inferiore ai limiti consentiti per il corretto funzionamento della caldaia."},
-    38: {"text1": 'Απώλεια σήματος φλόγας', "text2": 'Η κάρτα, αφού συνδεθεί με μια σωστή τιμή ρεύματος της φλόγας, επισημαίνει μια πτώση της θερμοκρασίας της φλόγας.', "action": 'Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": 'Εμφανίζεται στην περίπτωση που ο λέβητας έχει ανάψει σωστά και η φλόγα του καυστήρα σβήνει απρόσμενα. Εκτελείται μια νέα προσπάθεια να ενεργοποιηθεί ξανά και σε περίπτωση επαναφοράς των κανονικών συνθηκών ο λέβητας δεν χρειάζεται επαναφορά.'},
-    39: {"text1": 'Ανωμαλία αισθητήρα ηλιακού συλλέκτη', "text2": 'Ο εξωτερικός αισθητήρας καπνών προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η πλακέτα ανιχνεύει κάποια ανωμαλία στον αισθητήρα του ηλιακού συλλέκτη, ο λέβητας συνεχίζει να λειτουργεί κανονικά χωρίς τη συμβολή του ηλιακού συλλέκτη για τη θέρμανση του ζεστού νερού οικιακής χρήσης εφόσον η ηλιακή αντλία σταματά να λειτουργεί'},
-    40: {"text1": 'Ανωμαλία αισθητήρα ηλιακής συσσώρευσης', "text2": 'Ο αισθητήρας ηλιακής συσσώρευσης προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η πλακέτα ανιχνεύει κάποια ανωμαλία στον αισθητήρα του ηλιακής συσσώρευσης, ο λέβητας συνεχίζει να λειτουργεί κανονικά χωρίς τη συμβολή της ηλιακής ενέργειας για τη θέρμανση του ζεστού νερού οικιακής χρήσης εφόσον η ηλιακή αντλία σταματά να λειτουργεί'},
-    41: {"text1": 'Υψηλή θερμοκρασία στον ηλιακό συλλέκτη', "text2": 'Ο ηλιακός συλλέκτης έχει υπερβεί τη μέγιστη προκαθορισμένη θερμοκρασία', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Διαπιστώνεται όταν η θερμοκρασία του ηλιακού συλλέκτη υπερβαίνει το μέγιστο προκαθορισμένο όριο'},
-    42: {"text1": 'Υψηλή θερμοκρασία στην ηλιακό αποθήκευση', "text2": 'Η ηλιακή αποθήκευση έχει υπερβεί τη μέγιστη προκαθορισμένη θερμοκρασία', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Διαπιστώνεται όταν η θερμοκρασία νερού στην ηλιακή αποθήκευση υπερβαίνει το μέγιστο προκαθορισμένο όριο'},
-    43: {"text1": 'Εμπλοκή για απώλεια σήματος φλόγας', "text2": 'Απώλεια σήματος φλόγας σε ρυθμισμένη λειτουργία για περισσότερες συνεχόμενες φορές.', "action": 'Πατήστε το κουμπί της επαναφοράς, ο λέβητας πριν από την έναρξη εκτελεί έναν κύκλο μεταεξαερισμού.', "comment": 'Συμβαίνει αν παρουσιαστεί για περισσότερες συνεχόμενες φορές κατά τη διάρκεια της προκαθορισμένης χρονικής περιόδου το λάθος “Απώλεια σήματος της φλόγας”. '},
-    44: {"text1": 'Εμπλοκή για την υπέρβαση του μεγίστου χρόνου συσσώρευσης κοντινών ανοιγμάτων της βαλβίδας αερίου', "text2": 'Η συσσώρευση του συνολικού χρόνου ανοίγματος βαλβίδας αερίου χωρίς ανίχνευση της φλόγας είναι μεγαλύτερη από τη μέγιστη επιτρεπόμενη.', "action": 'Πατήστε το κουμπί της επαναφοράς.', "comment": 'Συμβαίνει στην περίπτωση όπου η βαλβίδα αερίου παραμένει ανοιχτή για χρόνο μεγαλύτερο από τον αναμενόμενο για την κανονική λειτουργία της χωρίς να πρέπει να ανάψει ο λέβητας.'},
-    45: {"text1": 'dT υψηλό', "text2": 'Η διαφορά της μετρημένης θερμοκρασίας μεταξύ κατάθλιψης και επιστροφής είναι ≥ 40°C.', "action": "Περιορίζεται η ισχύς του καυστήρα για να προληφθούν τυχόν ζημιές στην μονάδα συμπύκνωσης, αφού αποκατασταθεί το σωστό dT ο λέβητας επιστρέφει στη σωστή λειτουργία. Verificare che ci sia circolazione di acqua in caldaia, che il circolatore sia configurato secondo le esigenze dell'impianto e il corretto funzionamento della sonda di ritorno.", "comment": 'Ο λέβητας ανιχνεύει μια ξαφνική και απροσδόκητη άνοδο του dT μεταξύ αισθητήρα κατάθλιψης και αισθητήρα επιστροφής εγκατάστασης.'},
-    46: {"text1": 'Παρέμβαση θερμοστάτη χαμηλής θερμοκρασίας / Εσφαλμένη διαμόρφωση καλωδίωσης/πλακέτας', "text2": 'Ο θερμοστάτης ασφαλείας που βρίσκεται στη σύνδεση κατάθλιψης λέβητα σε DIM v2 (που λειτουργεί μόνο σε χαμηλή θερμοκρασία) έχει φθάσει υψηλές θερμοκρασίες. / Σφάλμα καλωδίωσης ή εσφαλμένη χρήση εφεδρικής πλακέτας', "action": 'Στην περίπτωση αυτή μετά από μια κατάλληλη ψύξη μπορείτε να επαναρυθμίσετε το θερμοστάτη (βλέπε το σχετικό φυλλάδιο οδηγιών). / Αν η εμπλοκή ή η ανωμαλία παραμένουν θα πρέπει να καλέσετε μια αρμόδια εταιρεία (για παράδειγμα την υπηρεσία τεχνικής υποστήριξης Immergas).', "comment": 'Κατά την κανονική λειτουργία του συστήματος, αν προκύψει ανωμαλία υπερβολικής υπερθέρμανσης της θερμοκρασίας κατάθλιψης σε χαμηλή θερμοκρασία, ο λέβητας μπλοκάρει. / Σφάλμα καλωδίωσης ή εσφαλμένη χρήση εφεδρικής πλακέτας'},
-    47: {"text1": 'Περιορισμός ισχύος καυστήρα', "text2": 'Αν η θερμοκρασία καπνών φθάσει μια υψηλή τιμή η κάρτα μειώνει την ισχύ που παρέχεται από τον καυστήρα, για να περιορίσει ζημιές στο κύκλωμα καπνών.', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": "Nel caso in cui venga rilevata un'elevata temperatura fumi la caldaia riduce la potenza erogata per non danneggiare la stessa."},
-    48: {"text1": 'Ανωμαλία αισθητήρα κατάθλιψης πλευράς εγκατάστασης', "text2": 'Ο αισθητήρας κατάθλιψης πλευράς εγκατάστασης προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Σε περίπτωση που δεν είναι συνδεδεμένος ή έχει βλάβη ο αισθητήρας κατάθλιψης πλευράς εγκατάστασης επισημαίνεται η ανωμαλία'},
-    49: {"text1": 'Μπλοκάρισμα υψηλής θερμοκρασίας στον αισθητήρα επιστροφής', "text2": 'Η θερμοκρασία που έχει μετρηθεί από τον αισθητήρα επιστροφής είναι υψηλή', "action": 'Βεβαιωθείτε για τη σωστή κυκλοφορία του νερού στο λέβητα και τη σωστή λειτουργία της τρίοδης βαλβίδας.', "comment": 'Διαπιστώνεται στην περίπτωση που επιτευχθεί μια πολύ υψηλή θερμοκρασία στο κύκλωμα επιστροφής του εναλλάκτη'},
-    50: {"text1": 'Ανωμαλία εξωτερικού αισθητήρα', "text2": 'Ο εξωτερικός αισθητήρας καπνών προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Ελέγξτε τη σύνδεσή του εξωτερικού αισθητήρα. Το σύστημα συνεχίζει να λειτουργεί', "comment": 'Σε περίπτωση που δεν είναι συνδεδεμένος ή έχει βλάβη ο εξωτερικός αισθητήρας επισημαίνεται η ανωμαλία'},
-    51: {"text1": 'Πτώση επικοινωνίας με το CAR Wireless', "text2": 'Η επικοινωνία μεταξύ του πομπού βάσης και CAR v2 RF έχει χαθεί.', "action": 'Ελέγξτε τη λειτουργία του CAR Wireless, επαληθεύοντας τη φόρτιση των μπαταριών (δείτε το σχετικό εγχειρίδιο οδηγιών)', "comment": 'Σε περίπτωση πτώσης της επικοινωνίας μεταξύ του λέβητα και CAR Ασύρματης έκδοσης σηματοδοτείται η ανωμαλία, από τη στιγμή αυτή μπορείτε να ελέγξετε το σύστημα αποκλειστικά διαμέσου του πίνακα ελέγχου του ίδιου του λέβητα.'},
-    54: {"text1": 'Ανωμαλία αισθητήρα puffer', "text2": 'Ο αισθητήρας puffer προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Η λειτουργία puffer απενεργοποιείται', "comment": 'Σε περίπτωση που δεν είναι συνδεδεμένος ή έχει βλάβη ο αισθητήρας puffer επισημαίνεται η ανωμαλία'},
-    55: {"text1": 'Ανωμαλία αισθητήρα θερμοκρασίας κατάθλιψης περιοχής 1', "text2": 'Ο αισθητήρας κατάθλιψης περιοχής 1 προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η πλακέτα ανιχνεύει κάποια ανωμαλία χαμηλής θερμοκρασίας στον αισθητήρα περιοχής 1, το σύστημα δεν μπορεί να λειτουργήσει στην εν λόγω περιοχή.'},
-    58: {"text1": 'Ανωμαλία Audax', "text2": 'Επισήμανση ανωμαλίας από την αντλία θερμότητας AUDAX που είναι συνδεδεμένη με το σύστημα', "action": 'Η αντλία θερμότητας δεν πληροί τα αιτήματα θέρμανσης και ψύξης περιβάλλοντος, μόλις αποκατασταθούν οι συνδέσεις θα πρέπει να απενεργοποιήσετε και να ενεργοποιήσετε εκ νέου το σύστημα', "comment": 'Ανωμαλία στην αντλία θερμότητας Audax, επαληθεύστε τον τύπο της ανωμαλίας απευθείας στην οθόνη της αντλίας θερμότητας'},
-    59: {"text1": 'Εμπλοκή συχνότητας τροφοδοσίας ηλεκτρικού δικτύου.', "text2": 'Η ηλεκτρονική κάρτα έχει ανιχνεύσει κάποια ανώμαλη συχνότητα στο δίκτυο της ηλεκτρικής τροφοδοσίας.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": "La scheda rileva una frequenza sull'alimentazione di rete elettrica anomala."},
-    60: {"text1": 'Ανωμαλία μπλοκαρισμένου κυκλοφορητή', "text2": 'Ο κυκλοφορητής διαμόρφωσης έχει σταματήσει.', "action": 'Επιχειρήστε να εκτελέσετε την απεμπλοκή του κυκλοφορητή όπως αναφέρεται στη σχετική παράγραφο. Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": 'Ο κυκλοφορητής έχει σταματήσει για τους εξής λόγους: μπλοκαρισμένο στροφείο, ηλεκτρική βλάβη.'},
-    61: {"text1": 'Παρουσία νερού στον κυκλοφορητή', "text2": 'Ο κυκλοφορητής διαμόρφωσης έχει σταματήσει λόγω ανίχνευσης λειτουργίας στον αέρα.', "action": 'Εκτελέστε τον εξαερισμό του κυκλοφορητή και του κυκλώματος θέρμανσης. Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": "Viene rilevata aria all'interno del circolatore; il circolatore non puo' funzionare."},
-    62: {"text1": 'Αίτημα πλήρους βαθμονόμησης.', "text2": 'Η κάρτα δεν έχει τη σωστή διαμόρφωση των παραμέτρων ελέγχου καύσης.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": "Viene rilevata l'assenza di taratura della scheda elettronica. Μπορεί να επαληθευτεί σε περίπτωση αντικατάστασης της ηλεκτρονικής κάρτας ή σε περίπτωση αλλαγής των παραμέτρων στον τομέα αέρα / αερίου, για το λόγο αυτό καθίσταται απαραίτητη η “πλήρης βαθμονόμηση”."},
-    63: {"text1": 'Ανωμαλία αισθητήρα επιστροφής εγκατάστασης', "text2": 'Ο αισθητήρας κατάθλιψης προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Ο λέβητας συνεχίζει να λειτουργεί χωρίς καμιά ενσωμάτωση από τα συνδεδεμένα εξωτερικά συστήματα', "comment": 'Σε περίπτωση που δεν είναι συνδεδεμένος ή έχει βλάβη ο αισθητήρας κατάθλιψης επισημαίνεται η ανωμαλία'},
-    67: {"text1": 'Ανωμαλία διακόπτη πίεσης ηλιακής εγκατάστασης', "text2": 'Διακόπτης πίεσης εγκατάστασης ανοιχτός, πιθανή έλλειψη υγρού', "action": 'Επαληθεύστε στο μανόμετρο της ομάδας του ηλιακού κυκλοφορητή ότι η πίεση είναι στη σωστή τιμή', "comment": 'Λόγω μιας πτώσης της πίεσης στο ηλιακό κύκλωμα ο διακόπτης πίεσης μπλοκάρει τη λειτουργία του θερμικού ηλιακού κυκλώματος'},
-    70: {"text1": 'Ανεστραμμένοι αισθητήρες', "text2": 'Σε περίπτωση λάθους κατά την καλωδιακή σύνδεση του λέβητα ανιχνεύεται το λάθος', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζονται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ελέγξτε τη σύνδεσή του αισθητήρα παροχής και επιστροφής'},
-    72: {"text1": 'Αίτημα ταχείας βαθμονόμησης.', "text2": 'Η κάρτα δεν έχει τη σωστή διαμόρφωση ορισμένων παραμέτρων ελέγχου καύσης.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανιχνεύεται κάποια τροποποίηση ορισμένων παραμέτρων για το λόγο αυτό καθίσταται απαραίτητη η “ταχεία βαθμονόμηση”.'},
-    73: {"text1": 'Ανίχνευση υψηλής απόκλισης αισθητήρα κατάθλιψης και αισθητήρα κατάθλιψης ασφαλείας.', "text2": 'Οι αισθητήρες κατάθλιψης παρουσιάζουν μια υψηλή απόκλιση.', "action": 'Σε περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στην ανάγνωση των θερμοκρασιών των αισθητήρων κατάθλιψης NTC, οι αιτίες μπορεί να είναι: ελαττωματικός αισθητήρας, λάθος τοποθέτηση, ελλιπής κυκλοφορία της εγκατάστασης, φράξιμο πλευράς νερού του κύριου εναλλάκτη.'},
-    74: {"text1": 'Ανωμαλία αισθητήρα κατάθλιψης ασφαλείας', "text2": 'Ο αισθητήρας κατάθλιψης ασφαλείας προσφέρει μια ανθεκτική τιμή εκτός του εύρους.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον αισθητήρα κατάθλιψης ασφαλείας NTC.'},
-    75: {"text1": 'Εμπλοκή λόγω κατεστραμμένου αισθητήρα NTC', "text2": 'Πιθανή θραύση ενός ή και των δύο αισθητήρων του συστήματος παροχής και επιστροφής', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζονται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ο ανιχνευτής αισθητήρας ασφαλείας προκαλεί μια υψηλή κλίση θερμοκρασίας'},
-    76: {"text1": 'Αποτέλεσμα αισθητήρα παροχής ή αισθητήρα επιστροφής ', "text2": 'Ανιχνεύεται κάποια δυσλειτουργία σε έναν ή και στους δύο αισθητήρες της δομής και του συστήματος επιστροφής', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζονται θα πρέπει να καλέσετε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Μεγαλύτερη διαφορά σε σχέση με εκείνη που έχει ρυθμιστεί μεταξύ αισθητήρα παροχής και επιστροφής σε περίπτωση αιτήματος θέρμανσης'},
-    77: {"text1": 'Ανωμαλία ελέγχου καύσης.', "text2": 'Έχει ανιχνευθεί ρεύμα βαλβίδας αερίου εκτός εύρους.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανιχνεύεται ένα ρεύμα εκτός εύρους στη βαλβίδα αερίου.'},
-    78: {"text1": 'Ανωμαλία ελέγχου καύσης.', "text2": 'Έχει ανιχνευθεί υψηλό ρεύμα βαλβίδας αερίου.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανιχνεύεται ένα υψηλό ρεύμα στη βαλβίδα αερίου.'},
-    79: {"text1": 'Ανωμαλία ελέγχου καύσης.', "text2": 'Έχει ανιχνευθεί χαμηλό ρεύμα βαλβίδας αερίου.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανιχνεύεται ένα μειωμένο ρεύμα στη βαλβίδα αερίου.'},
-    80: {"text1": 'Εμπλοκή δυσλειτουργίας ηλεκτρονικής κάρτας.', "text2": 'Έχει ανιχνευθεί βλάβη στον οδηγό ηλεκτρονικής βαλβίδας αερίου λόγω προβλημάτων στην κάρτα ή στη βαλβίδα αερίου.', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Συμβαίνει σε περίπτωση δυσλειτουργίας της ηλεκτρονικής κάρτας που ελέγχει τη βαλβίδα.'},
-    84: {"text1": 'Ανωμαλία καύσης - μείωση ισχύος σε εξέλιξη', "text2": 'Έχουν ανιχνευθεί παρόμοιες συνθήκες σε χαμηλή πίεση τροφοδοσίας βαλβίδας αερίου.', "action": 'Σε περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": 'Ανιχνεύεται μια χαμηλή πίεση τροφοδοσίας στο δίκτυο αερίου. Κατά συνέπεια περιορίζεται η ισχύς της συσκευής και σηματοδοτείται η ανωμαλία.'},
-    85: {"text1": 'Πρόβλημα εμπλοκής μετακαύσης', "text2": 'Πιθανό πρόβλημα βαλβίδας αερίου, ηλεκτροδίου ή ηλεκτρονικής κάρτας', "action": 'Πατήστε το κουμπί της επαναφοράς. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Φλόγα που παραμένει και μετά το κλείσιμο της βαλβίδας αερίου '},
-    87: {"text1": 'Εμπλοκή ελέγχου βαλβίδας αερίου.', "text2": 'Έχει ανιχνευθεί βλάβη στον έλεγχο της βαλβίδας αερίου.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανιχνεύεται μια δυσλειτουργία σε ένα από τα εξαρτήματα που ελέγχουν τη βαλβίδα αερίου.'},
-    88: {"text1": 'Εμπλοκή ελέγχου βαλβίδας αερίου.', "text2": 'Έχει ανιχνευθεί βλάβη στον έλεγχο της βαλβίδας αερίου.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανιχνεύεται μια δυσλειτουργία σε ένα από τα εξαρτήματα που ελέγχουν τη βαλβίδα αερίου.'},
-    89: {"text1": 'Σήμα ασταθούς καύσης', "text2": 'Έχει ανιχνευθεί αστάθεια στο σήμα της καύσης.', "action": 'Ο λέβητας εξακολουθεί να λειτουργεί.', "comment": 'Η φλόγα είναι ασταθής λόγω: παρουσίας ανακύκλωσης καπνών, ανέμου, ασταθούς πίεσης αερίου, ασταθούς ταχύτητας ανεμιστήρα ή λόγω κάποιας δυσλειτουργίας του συστήματος.'},
-    90: {"text1": 'Σήμα καύσης εκτός ορίου', "text2": 'Έχει ανιχνευθεί σήμα καύσης εκτός ορίου.', "action": 'Ο λέβητας εξακολουθεί να λειτουργεί.', "comment": 'Το σήμα της καύσης ανιχνεύεται εκτός του εύρους της προβλεπόμενης ρύθμισης για ένα παρατεταμένο χρονικό διάστημα.'},
-    91: {"text1": 'Εμπλοκή εσφαλμένης εκκίνησης', "text2": 'Η κάρτα έχει εξαντλήσει όλες τις δυνατές ενέργειες της για να έχει μια βέλτιστη ενεργοποίηση του καυστήρα.', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Η κάρτα έχει εξαντλήσει όλες τις δυνατές ενέργειες της για την επίτευξη μιας βέλτιστης ενεργοποίησης του καυστήρα.'},
-    92: {"text1": 'Όριο διόρθωσης στροφών ανεμιστήρα', "text2": 'Η κάρτα έχει φθάσει τη μέγιστη διόρθωση των στροφών ανεμιστήρα.', "action": 'Ο λέβητας εξακολουθεί να λειτουργεί.', "comment": 'Το σύστημα έχει εξαντλήσει όλες τις δυνατές διορθώσεις του αριθμού των στροφών του ανεμιστήρα.'},
-    93: {"text1": 'Σήμα καύσης εκτός ορίου', "text2": 'Έχει ανιχνευθεί σήμα καύσης εκτός ορίου.', "action": 'Ο λέβητας εξακολουθεί να λειτουργεί.', "comment": 'Το σήμα της καύσης ανιχνεύεται εκτός του εύρους της προβλεπόμενης ρύθμισης για ένα παρατεταμένο χρονικό διάστημα.'},
-    94: {"text1": 'Ανωμαλία καύσης', "text2": 'Έχει ανιχνευθεί πρόβλημα καύσης που προκλήθηκε από το σύστημα ή τον έλεγχο καύσης.', "action": 'Στην περίπτωση αποκατάστασης των κανονικών συνθηκών, ο λέβητας ξεκινά και πάλι χωρίς να πρέπει να τον ρυθμίσετε ξανά.', "comment": 'Ανιχνεύεται κάποιο πρόβλημα στον έλεγχο της καύσης που μπορεί να έχει προκληθεί από: χαμηλή πίεση αερίου, ανακυκλοφορία καπνών, βαλβίδα αερίου ή ελαττωματική ηλεκτρονική κάρτα.'},
-    95: {"text1": 'Διακεκομμένο σήμα καύσης', "text2": 'Έχει ανιχνευθεί ασυνέχεια στο σήμα καύσης λόγω προβλημάτων στις ηλεκτρικές συνδέσεις ή διασπορά σήματος.', "action": 'Ο λέβητας εξακολουθεί να λειτουργεί.', "comment": "Il sistema rileva una discontinuita' nel segnale di combustione."},
-    96: {"text1": 'Σύστημα σωλήνων καύσης φραγμένο', "text2": 'Έχει ανιχνευθεί υψηλό φράξιμο στα εξαρτήματα αεραγωγών.', "action": 'Δεν ξεκινάει ο λέβητας. Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Επαληθεύεται σε περίπτωση που ανιχνευτεί κάποιο φράξιμο στο σύστημα των αεραγωγών.'},
-    98: {"text1": 'Μέγιστος αριθμός Μπλοκ σφαλμάτων λογισμικού.', "text2": 'Δεν λειτουργεί σωστά η ηλεκτρονική κάρτα.', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Επιτυγχάνεται ο μέγιστος αριθμός των σφαλμάτων λογισμικού που επιτρέπονται.'},
-    99: {"text1": 'Γενική εμπλοκή', "text2": 'Δεν λειτουργεί σωστά η ηλεκτρονική κάρτα.', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Ανιχνεύεται κάποια ανωμαλία στο λέβητα.'},
-    101: {"text1": 'Συναγερμός εκτός σύνδεσης Audax', "text2": 'Απώλεια επικοινωνίας με την αντλία θερμότητας', "action": 'Η αντλία θερμότητας δεν πληροί τα αιτήματα θέρμανσης και ψύξης περιβάλλοντος, μόλις αποκατασταθούν οι συνδέσεις θα πρέπει να απενεργοποιήσετε και να ενεργοποιήσετε εκ νέου το σύστημα', "comment": 'Σε περίπτωση βλάβης επικοινωνίας, εσφαλμένης σύνδεσης ή απενεργοποιημένης αντλίας θερμότητας η ηλεκτρονική μονάδα του λέβητα δεν ανιχνεύει την αντλία θερμότητας'},
-    102: {"text1": 'Συναγερμός εκτός σύνδεσης επέκτασης περιοχής 1', "text2": 'Απώλεια επικοινωνίας με επέκταση περιοχής 1', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανωμαλία επικοινωνίας με περιοχή 1'},
-    103: {"text1": 'Συναγερμός εκτός σύνδεσης επέκτασης περιοχής 2', "text2": 'Απώλεια επικοινωνίας με επέκταση περιοχής 2', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανωμαλία επικοινωνίας με περιοχή 2'},
-    104: {"text1": 'Συναγερμός εκτός σύνδεσης επέκτασης περιοχής 3', "text2": 'Απώλεια επικοινωνίας με επέκταση περιοχής 3', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Ανωμαλία επικοινωνίας με περιοχή 3'},
-    106: {"text1": 'Συναγερμός αισθητήρα νερού οικιακής χρήσης ', "text2": 'Σε περίπτωση ενσωμάτωσης με λέβητα και ξεχωριστή διαχείριση του νερού οικιακής χρήσης, ο αισθητήρας μπόιλερ που ελέγχεται από το διαχειριστή προσφέρει μια τιμή αντίστασης εκτός εύρους', "action": 'Το σύστημα δεν μπορεί να παράγει ζεστό νερό οικιακής χρήσης με την αντλία θερμότητας. Η παραγωγή του ζεστού νερού οικιακής χρήσης εξασφαλίζεται από το λέβητα', "comment": 'Η κάρτα ανιχνεύει μια ανωμαλία στον αισθητήρα του μπόιλερ'},
-    120: {"text1": 'Συναγερμός υψηλής ρύθμισης για αφύγρανση περιοχής 1', "text2": 'Η υπολογισμένη τιμή ρύθμισης αιτήματος περιοχής 1 είναι πάρα πολύ υψηλή για μια αφύγρανση', "action": 'Η υπολογισμένη ρύθμιση κατάθλιψης είναι ανώτερη από το όριο που επιτρέπεται από τον αφυγραντήρα. Ψύξτε το περιβάλλον και περιμένετε έως ότου η θερμοκρασία δρόσου επιστρέψει στις αποδεκτές τιμές', "comment": 'Η ρύθμιση κατάθλιψης ψύξης που υπολογίζεται για την αφύγρανση είναι ανώτερο από το προκαθορισμένο όριο στην περιοχή 1'},
-    121: {"text1": 'Συναγερμός εκτός σύνδεσης διάταξης περιοχής 1', "text2": 'Η απομακρυσμένη εντολή ή ο απομακρυσμένος έλεγχος της περιοχής 1 είναι εκτός σύνδεσης', "action": 'Επαληθεύστε ότι ο απομακρυσμένος έλεγχος είναι ενεργοποιημένος', "comment": 'Δεν ανιχνεύεται η επικοινωνία με τον έλεγχο της περιοχής. Δεν είναι δυνατό να εκτελέσετε τη θερμορύθμιση της περιοχής'},
-    122: {"text1": 'Συναγερμός εκτός σύνδεσης διάταξης περιοχής 2', "text2": 'Η απομακρυσμένη εντολή ή ο απομακρυσμένος έλεγχος της περιοχής 2 είναι εκτός σύνδεσης', "action": 'Επαληθεύστε ότι ο απομακρυσμένος έλεγχος είναι ενεργοποιημένος', "comment": 'Δεν ανιχνεύεται η επικοινωνία με τον έλεγχο της περιοχής. Δεν είναι δυνατό να εκτελέσετε τη θερμορύθμιση της περιοχής'},
-    123: {"text1": 'Συναγερμός εκτός σύνδεσης διάταξης περιοχής 3', "text2": 'Η απομακρυσμένη εντολή ή ο απομακρυσμένος έλεγχος της περιοχής 3 είναι εκτός σύνδεσης', "action": 'Επαληθεύστε ότι ο απομακρυσμένος έλεγχος είναι ενεργοποιημένος', "comment": 'Δεν ανιχνεύεται η επικοινωνία με τον έλεγχο της περιοχής. Δεν είναι δυνατό να εκτελέσετε τη θερμορύθμιση της περιοχής'},
-    125: {"text1": 'Ανωμαλία αισθητήρα θερμοκρασίας περιοχής 1', "text2": 'Ο αισθητήρας θερμοκρασίας περιβάλλοντος της περιοχής 1 είναι εκτός εύρους', "action": 'Εκτός από τη θερμοκρασία δεν υπολογίζεται το σημείο δρόσου της περιοχής', "comment": 'Ανωμαλία που υπάρχει στον αισθητήρα θερμοκρασίας περιβάλλοντος περιοχής 1 (προαιρετικό). Δεν είναι δυνατό να εκτελέσετε τη θερμορύθμιση της περιοχής'},
-    126: {"text1": 'Ανωμαλία αισθητήρα θερμοκρασίας περιοχής 2', "text2": 'Ο αισθητήρας θερμοκρασίας περιβάλλοντος της περιοχής 2 είναι εκτός εύρους', "action": 'Εκτός από τη θερμοκρασία δεν υπολογίζεται το σημείο δρόσου της περιοχής', "comment": 'Ανωμαλία που υπάρχει στον αισθητήρα θερμοκρασίας περιβάλλοντος περιοχής 2 (προαιρετικόl). Δεν είναι δυνατό να εκτελέσετε τη θερμορύθμιση της περιοχής'},
-    127: {"text1": 'Ανωμαλία αισθητήρα θερμοκρασίας περιβάλλοντος περιοχής 3', "text2": 'Ο αισθητήρας θερμοκρασίας περιβάλλοντος της περιοχής 3 είναι εκτός εύρους', "action": 'Εκτός από τη θερμοκρασία δεν υπολογίζεται το σημείο δρόσου της περιοχής', "comment": 'Ανωμαλία που υπάρχει στον αισθητήρα θερμοκρασίας περιβάλλοντος περιοχής 3 (προαιρετικό). Δεν είναι δυνατό να εκτελέσετε τη θερμορύθμιση της περιοχής'},
-    129: {"text1": 'Ανωμαλία αισθητήρα υγρασίας περιοχής 1', "text2": 'Ο αισθητήρας υγρασίας περιβάλλοντος της περιοχής 1 είναι εκτός εύρους', "action": 'Εκτός από την υγρασία δεν υπολογίζεται το σημείο δρόσου της περιοχής', "comment": 'Ανωμαλία που υπάρχει στον αισθητήρα υγρασίας περιοχής 1 (προαιρετικό). Δεν μπορεί να εκτελεστεί ο έλεγχος υγρασίας της περιοχής'},
-    130: {"text1": 'Ανωμαλία αισθητήρα υγρασίας περιοχής 2', "text2": 'Ο αισθητήρας υγρασίας περιβάλλοντος της περιοχής 2 είναι εκτός εύρους', "action": 'Εκτός από την υγρασία δεν υπολογίζεται το σημείο δρόσου της περιοχής', "comment": 'Ανωμαλία που υπάρχει στον αισθητήρα υγρασίας περιοχής 2 (προαιρετικό). Δεν μπορεί να εκτελεστεί ο έλεγχος υγρασίας της περιοχής'},
-    131: {"text1": 'Ανωμαλία αισθητήρα υγρασίας περιοχής 3', "text2": 'Ο αισθητήρας υγρασίας περιβάλλοντος της περιοχής 3 είναι εκτός εύρους', "action": 'Εκτός από την υγρασία δεν υπολογίζεται το σημείο δρόσου της περιοχής', "comment": 'Ανωμαλία που υπάρχει στον αισθητήρα υγρασίας περιοχής 3 (προαιρετικό). Δεν μπορεί να εκτελεστεί ο έλεγχος υγρασίας της περιοχής'},
-    132: {"text1": 'Συναγερμός υψηλής ρύθμισης για αφύγρανση περιοχής 2', "text2": 'Η υπολογισμένη τιμή ρύθμισης αιτήματος περιοχής 2 είναι πάρα πολύ υψηλή για μια αφύγρανση', "action": 'Η υπολογισμένη ρύθμιση κατάθλιψης είναι ανώτερη από το όριο που επιτρέπεται από τον αφυγραντήρα. Ψύξτε το περιβάλλον και περιμένετε έως ότου η θερμοκρασία δρόσου επιστρέψει στις αποδεκτές τιμές', "comment": 'Η ρύθμιση κατάθλιψης ψύξης που υπολογίζεται για την αφύγρανση είναι ανώτερη από το προκαθορισμένο όριο στην περιοχή 2'},
-    133: {"text1": 'Συναγερμός βλάβης αφυγραντήρα περιοχής 1', "text2": 'Ο αφυγραντήρας της περιοχής 1 είναι σε συναγερμό', "action": 'Το σύστημα δεν εκτελεί την αφύγρανση στη σχετική περιοχή', "comment": 'Η ανωμαλία προέρχεται από τον αφυγραντήρα (προαιρετικό) στην περιοχή 1'},
-    134: {"text1": 'Συναγερμός βλάβης αφυγραντήρα περιοχής 2', "text2": 'Ο αφυγραντήρας της περιοχής 2 είναι σε συναγερμό', "action": 'Το σύστημα δεν εκτελεί την αφύγρανση στη σχετική περιοχή', "comment": 'Η ανωμαλία προέρχεται από τον αφυγραντήρα (προαιρετικό) στην περιοχή 2'},
-    135: {"text1": 'Συναγερμός βλάβης αφυγραντήρα περιοχής 3', "text2": 'Ο αφυγραντήρας της περιοχής 3 είναι σε συναγερμό', "action": 'Το σύστημα δεν εκτελεί την αφύγρανση στη σχετική περιοχή', "comment": 'Η ανωμαλία προέρχεται από τον αφυγραντήρα (προαιρετικό) στην περιοχή 3'},
-    137: {"text1": 'Συναγερμός αποκατάστασης συστήματος – Επανεκκινήστε το σύστημα', "text2": 'Μετά από την διαδικασία αποκατάστασης, που εκτελείται από τον πίνακα ελέγχου, σηματοδοτείται συναγερμός καθώς θα πρέπει να γίνει επανεκκίνηση του συστήματος', "action": 'Απενεργοποιήστε και ενεργοποιήστε το σύστημα', "comment": 'Μόλις αποκατασταθούν οι προεπιλεγμένες παράμετροι θα πρέπει να γίνει η επανεκκίνηση του συστήματος'},
-    138: {"text1": 'Θερμαντική επίστρωση σε εξέλιξη', "text2": 'Λειτουργία θερμαντικής επίστρωσης σε εξέλιξη', "action": '', "comment": ''},
-    139: {"text1": 'Απομάκρυνση του αέρα σε εξέλιξη', "text2": 'Λειτουργία απομάκρυνσης του αέρα σε εξέλιξη', "action": '', "comment": ''},
-    177: {"text1": 'Συναγερμός μέγιστου χρόνου νερού οικιακής χρήσης', "text2": 'Το αίτημα νερού οικιακής χρήσης εκτελέστηκε με την υπέρβαση του μέγιστου προκαθορισμένου χρόνου', "action": 'Το σύστημα εξακολουθεί να λειτουργεί με μη βέλτιστη απόδοση', "comment": 'Δεν ικανοποιείται η παραγωγή ζεστού νερού οικιακής χρήσης στον προκαθορισμένο χρόνο (5 ώρες)'},
-    178: {"text1": 'Κύκλος κατά της νόσου των λεγεωνάριων χωρίς επιτυχία', "text2": 'Ο κύκλος κατά της νόσου των λεγεωνάριων δεν ολοκληρώθηκε με επιτυχία εντός του προκαθορισμένου χρόνου', "action": 'Πατήστε το κουμπί της επαναφοράς', "comment": 'Ο κύκλος κατά της νόσου των λεγεωνάριων εκτελείται χωρίς επιτυχία εντός του προκαθορισμένου χρόνου (3 ώρες)'},
-    179: {"text1": 'Ανωμαλία αισθητήρα υγρού', "text2": 'Ο αισθητήρας της υγρής φάσης είναι εκτός εύρους.', "action": 'Δεν ενεργοποιείται το σύστημα. Καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η πλακέτα ανιχνεύει κάποια ανωμαλία στον αισθητήρα υγρής φάσης'},
-    181: {"text1": 'Απώλεια επικοινωνίας απομακρυσμένου ελέγχου περιοχής 2', "text2": 'Δεν υπάρχει συνομιλία μεταξύ πλακέτας και απομακρυσμένου ελέγχου περιοχής 2.', "action": 'Αφαιρέστε και ξαναδώστε τάση στην υδραυλική μονάδα. Αν κατά την εκ νέου ενεργοποίηση δεν ανιχνεύεται ο απομακρυσμένος έλεγχος το σύστημα μεταφέρεται στον τρόπο της τοπικής λειτουργίας χρησιμοποιώντας επομένως τους ελέγχους που υπάρχουν στον πίνακα ελέγχου. Στην περίπτωση αυτή δεν μπορείτε να ενεργοποιήσετε τη λειτουργία “Θέρμανσης”', "comment": 'Επισημαίνεται σε περίπτωση σύνδεσης με ένα μη συμβατό απομακρυσμένο έλεγχο ή στην περίπτωση βλάβης της επικοινωνίας μεταξύ της υδραυλικής μονάδας και του CARV2 της δεύτερης περιοχής'},
-    182: {"text1": 'Συναγερμός μονάδας συμπύκνωσης', "text2": 'Εμφανίζεται κάποιος συναγερμός στη μονάδα συμπύκνωσης', "action": 'Το σύστημα δεν λειτουργεί, δείτε ανωμαλία στη μονάδα συμπύκνωσης και στο σχετικό εγχειρίδιο οδηγιών', "comment": 'Επισημαίνεται κάποια ανωμαλία στη μονάδα συμπύκνωσης'},
-    183: {"text1": 'Συναγερμός μονάδας συμπύκνωσης σε Testmode', "text2": 'Η μονάδα συμπύκνωσης βρίσκεται στη λειτουργία TESTMODE (ΛΕΙΤΟΥΡΓΊΑ ΔΟΚΙΜΗΣ)', "action": 'Κατά τη διάρκεια της φάσης αυτής δεν είναι δυνατό να ικανοποιηθούν τα αιτήματα κλιματισμού περιβάλλοντος και παραγωγής ζεστού νερού οικιακής χρήσης', "comment": 'Επισημαίνεται ότι η μονάδα συμπύκνωσης είναι στη φάση Testmode'},
-    184: {"text1": 'Συναγερμός διακοπής επικοινωνίας με εξωτερική μονάδα', "text2": 'Απώλεια επικοινωνίας με μονάδα συμπύκνωσης', "action": 'Ελέγξτε την ηλεκτρική σύνδεση μεταξύ των μονάδων', "comment": 'Επισημαίνεται η ανωμαλία για ένα πρόβλημα επικοινωνίας μεταξύ εσωτερικής μονάδας και μονάδας συμπύκνωσης'},
-    185: {"text1": 'Συναγερμός επικοινωνίας μονάδας ασφαλείας', "text2": 'Απώλεια επικοινωνίας με μονάδα ασφαλείας ', "action": 'Επαληθεύστε τη σύνδεση μεταξύ των εξαρτημάτων', "comment": 'Πρόβλημα κατά την επικοινωνία μεταξύ πλακέτα ρύθμισης και πλακέτα ενεργοποίησης'},
-    186: {"text1": 'Ανωμαλία υψηλής τάσης αναφλεκτήρα', "text2": 'Μονάδα ασφάλειας: επισημάνθηκε κάποια ανωμαλία στην τάση του αναφλεκτήρα', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Επισημαίνεται κάποια ανωμαλία στη πλακέτα ενεργοποίησης'},
-    187: {"text1": 'Συναγερμός αισθητήρα επιστροφής μονάδας συμπύκνωσης', "text2": 'Ο αισθητήρας επιστροφής της μονάδας συμπύκνωσης είναι εκτός εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η πλακέτα ανιχνεύει κάποια ανωμαλία στον αισθητήρα επιστροφής NTC αντλίας θερμότητας'},
-    188: {"text1": 'Αίτημα εκτός εύρους λειτουργίας', "text2": 'Το αίτημα που πραγματοποιήθηκε δεν εκτελέστηκε διότι οι εξωτερικές συνθήκες δεν επιτρέπουν την ενεργοποίηση της μονάδας συμπύκνωσης', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Εκτελείται ένα αίτημα θέρμανσης ή ψύξης με εξωτερική θερμοκρασία εκτός των ορίων της λειτουργίας'},
-    189: {"text1": 'Συναγερμός διακοπής επικοινωνίας με πλακέτα επικοινωνίας', "text2": 'Απώλεια επικοινωνίας με πλακέτα επικοινωνίας x μονάδας συμπύκνωσης', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Σε περίπτωση βλάβης της επικοινωνίας μεταξύ των ηλεκτρονικών πλακετών επισημαίνεται η ανωμαλία'},
-    191: {"text1": 'Βλάβη επικοινωνίας RF προς CAR v2 RF περιοχής 2', "text2": 'Έχει χαθεί η επικοινωνία μεταξύ του πομπού βάσης και CAR v2 RF της περιοχής 2', "action": 'Ελέγξτε τη λειτουργία του ασύρματου CAR, επαληθεύοντας τη φόρτιση των μπαταριών (δείτε το σχετικό εγχειρίδιο οδηγιών)', "comment": 'Σε περίπτωση βλάβης επικοινωνίας μεταξύ της μονάδας και της Ασύρματης έκδοσης CAR σηματοδοτείται η ανωμαλία, από τη στιγμή αυτή μπορείτε να ελέγξετε το σύστημα αποκλειστικά από τον πίνακα ελέγχου της ίδιας της μονάδας'},
-    192: {"text1": 'Ανωμαλία αισθητήρα κατάθλιψης μονάδας συμπύκνωσης', "text2": 'Ο αισθητήρας κατάθλιψης της μονάδας συμπύκνωσης είναι εκτός εύρους', "action": 'Αν η εμπλοκή ή η ανωμαλία συνεχίζεται καλέστε ένα εξειδικευμένο τεχνικό κέντρο (για παράδειγμα την Υπηρεσία Τεχνικής Υποστήριξης της Immergas).', "comment": 'Η πλακέτα ανιχνεύει κάποια ανωμαλία στον αισθητήρα κατάθλιψης NTC αντλίας θερμότητας'},
-    193: {"text1": 'Συσκευή σε Testmode', "text2": 'Η συσκευή ελέγχεται από μια εξωτερική διάταξη μέσω του πρωτοκόλλου Opentherm', "action": 'Το σύστημα συνεχίζει να λειτουργεί σωστά', "comment": 'Επισημαίνεται ότι η συσκευή είναι στη φάση Testmode'},
-    194: {"text1": 'Απενεργοποιημένο Audax Pro', "text2": 'Η μονάδα συμπύκνωσης Audax Pro έχει απενεργοποιηθεί', "action": 'Το σύστημα συνεχίζει να λειτουργεί σωστά', "comment": 'Επισημαίνεται ότι η μονάδα συμπύκνωσης έχει απενεργοποιηθεί μέσω της κατάλληλης εισόδου στην πλακέτα ακροδεκτών'},
-    195: {"text1": 'Ανωμαλία χαμηλής θερμοκρασίας υγρής φάσης ', "text2": 'Η θερμοκρασία του αισθητήρα υγρής φάσης είναι πάρα πολύ χαμηλή ', "action": 'Επαληθεύστε την καλή λειτουργία του κυκλώματος ψύξης', "comment": 'Ανιχνεύεται πάρα πολύ χαμηλή θερμοκρασία στην υγρή φάση'},
-    196: {"text1": 'Εμπλοκή θερμοκρασίας κατάθλιψης υψηλή', "text2": 'Ανιχνεύεται πάρα πολύ υψηλή θερμοκρασία στο κύκλωμα επιστροφής της αντλίας θερμότητας', "action": 'Επαληθεύστε την καλή λειτουργία του κυκλώματος ψύξης', "comment": 'Ανιχνεύεται πάρα πολύ υψηλή θερμοκρασία στο κύκλωμα κατάθλιψης της αντλίας θερμότητας'},
-}
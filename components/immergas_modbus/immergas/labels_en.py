@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: en)"""
-
-immergas_labels = {
-    'default': {"text1": 'Anomaly not recognized', "text2": 'Check error table or system installed', "action": 'Check error table or system installed', "comment": 'No note'},
-    0: {"text1": 'SYSTEM OK', "text2": 'Correctly working system', "action": 'No action required', "comment": 'No anomaly'},
-    1: {"text1": 'No ignition block', "text2": 'Failure to detect the flame at the end of the last attempt at ignition', "action": 'Press the Reset button', "comment": 'In the event of request of room central heating or domestic hot water production, the boiler does not switch on within the preset time. Upon appliance commissioning or after extended downtime, it may be necessary to eliminate the block.'},
-    2: {"text1": 'Safety thermostat block (over-temperature)', "text2": 'The safety thermostat has intervened', "action": 'Press the Reset button', "comment": 'During normal operation, if a fault causes excessive overheating internally, the boiler goes into overheating block.'},
-    3: {"text1": 'Flue safety thermostat block', "text2": 'The flue safety thermostat has intervened', "action": 'Press the Reset button (Nike versions)/ Correctly configure the P.14 parameter. Press the Reset button if required (Star versions)', "comment": 'During normal operation, if a fault causes excessive flue gas overheating, the boiler blocks. (Nike versions)/ Wrong P.14 parameter configuration (Star version)'},
-    4: {"text1": 'Contacts resistance block', "text2": 'Detected an abnormality in the driving circuit of the gas valve', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the gas valve supply. Check the connection. (the anomaly is detected and displayed only in the event of a request).'},
-    5: {"text1": 'Flow probe anomaly', "text2": 'The flow sensor provides a resistive value out of range', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the flow NTC probe.'},
-    6: {"text1": 'Domestic hot water probe anomaly', "text2": 'The Domestic hot water sensor provides a resistive value out of range', "action": 'In this case the boiler continues to produce domestic hot water but not with optimal performance. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the domestic hot water NTC probe.'},
-    8: {"text1": 'Maximum N° of reset', "text2": 'Indicates the maximum number of reset allowed by integrated P.C.B.', "action": 'Attention: the anomaly can be reset 5 times consecutively, after which the function in inhibited for at least one hour. One attempt is gained every hour for a maximum of 5 attempts. By switching the appliance on and off again, the 5 attempts are re-acquired.', "comment": 'Number of allowed resets that have already performed.'},
-    10: {"text1": 'Insufficient system pressure', "text2": 'The pressure switch contact is open', "action": 'Check on the boiler pressure gauge that the system pressure is between 1÷1.2 bar and restore the correct pressure if necessary.', "comment": 'Water pressure inside the central heating circuit that is sufficient to guarantee the correct operation of the boiler is not detected.'},
-    11: {"text1": 'Flue pressure switch anomaly', "text2": 'This occurs in case of a fault in the flue pressure switch or the fan.', "action": 'If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service)', "comment": 'If normal conditions are restored the boiler restarts without having to be reset'},
-    12: {"text1": 'Storage tank probe anomaly', "text2": 'The domestic hot water tank sensor provides a resistive value out of range', "action": 'The boiler does not satisfy the DHW production requests. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'If the P.C.B. detects a fault in the boiler probe, the boiler cannot produce DHW and signals a fault.'},
-    13: {"text1": 'Air/flue gas flow-meter out of range', "text2": 'The air/flue gas signal is out of range or with fan stopped, the controller reads an excessively high signal', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'With fan stopped, the air/flue gas controller reads an excessively high signal (pressure switch contacts stuck)'},
-    15: {"text1": 'Configuration error', "text2": 'The P.C.B. finds a mismatch between the configuration and the input signals', "action": 'If normal conditions are restored the boiler restarts without having to be reset. Check that the boiler is configured correctly. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'If the P.C.B. detects an anomaly or incongruity on the electric wiring, the boiler will not start.'},
-    16: {"text1": 'Fan anomaly', "text2": 'The fan is rotated when it is not powered or is stationary when powered', "action": 'Press the Reset button. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'This occurs if the fan has a mechanical or electrical fault.'},
-    17: {"text1": 'Incorrect fan speed', "text2": 'The number of fan revolutions is out of the correct range', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'Number of fan revolutions incorrect'},
-    20: {"text1": 'Parasite flame block', "text2": 'Flame detection abnormal', "action": 'Press the Reset button. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'This occurs in the event of a leak on the detection circuit or anomaly in the flame control unit.'},
-    23: {"text1": 'Return probe anomaly', "text2": 'The return sensor provides a resistive value out of range', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the flow NTC probe.'},
-    24: {"text1": 'Push button control panel anomaly', "text2": 'It is detected a continuous pressure on the dashboard buttons', "action": 'If normal conditions are restored the boiler restarts without having to be reset. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the pushbutton panel.'},
-    25: {"text1": 'Flue probe block / CRC block (TERA) ', "text2": 'Flue gas temperature out of range / memory corrupted (TERA)', "action": 'Press the Reset button', "comment": 'High flue gas gradient, probable circulator block or no water / memory corrupted'},
-    27: {"text1": 'Insufficient circulation', "text2": 'Overheating of the boiler due to poor circulation in the primary circuit', "action": 'Press the Reset button', "comment": 'X'},
-    28: {"text1": 'Domestic hot water leakage', "text2": 'If during the heating stage, a rise in domestic hot water temperature occurs, an anomaly is signalled and heating temperature is reduced to limit the formation of limescale in the heat exchanger.', "action": 'If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service)', "comment": 'Check that all domestic hot water system cocks are closed and are not leaking and also check that there are no leaks in the system. Once good conditions are restored in the domestic hot water system, the boiler returns to normal operation'},
-    29: {"text1": 'Flue probe anomaly', "text2": 'The flue sensor provides a resistive value out of range', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the flue gas probe.'},
-    31: {"text1": 'Loss of communication with the CARV2', "text2": 'There is no communication between the boiler and remote.', "action": "Power cycle the boiler. If the Remote Control is still not detected on re-starting the boiler will switch to local operating mode, i.e. using the controls on the control panel. In this case the ''Central Heating'' mode cannot be activated.", "comment": 'This occurs if an incompatible remote control is connected, or if communication between the boiler and CARV2 is lost.'},
-    32: {"text1": 'Zone 2 low temperature probe anomaly', "text2": 'Zone 2 flow probe out of range', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'If the board detects an anomaly on the zone 2 low temperature probe, the system cannot work in the affected area'},
-    33: {"text1": 'Zone 3 low temperature probe anomaly', "text2": 'Zone 3 flow probe out of range', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'If the board detects an anomaly on the zone 2 low temperature probe, the system cannot work in the affected area'},
-    36: {"text1": 'IMG Bus communication loss', "text2": 'Loss of communication on the IMG Bus protocol.', "action": 'The boiler does not satisfy the room heating requests.', "comment": 'Communication between the various components is interrupted due to an anomaly on the boiler control unit, on the zone control unit or on the IMG Bus.'},
-    37: {"text1": 'Low power supply voltage', "text2": 'The P.C.B. supply voltage has values below the allowed limits.', "action": 'If normal conditions are restored the boiler restarts without having to be reset.', "comment": 'This occurs when the power supply voltage is lower than the allowed limits for the correct boiler operation.'},
-    38: {"text1": 'Loss of flame signal', "text2": 'The P.C.B., after detecting a correct flame current value, signaling a drop in flame current.', "action": 'If normal conditions are restored the boiler restarts without having to be reset.', "comment": 'This occurs when the boiler is ignited correctly and the burner flame switches off unexpectedly; a new attempt at ignition is performed and if normal conditions are restored, the boiler does not have to be reset.'},
-    39: {"text1": 'Solar collector probe anomaly', "text2": 'The external probe has an out of range resistive value', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'If the board detects an anomaly on the solar collector probe, the boiler continues to work regularly without the intake of solar energy for heating the DHW as the solar pump stops working'},
-    40: {"text1": 'Solar storage tank probe anomaly', "text2": 'The solar storage tank has an out of range resistive value', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'If the board detects a fault on the solar storage tank probe, the boiler continues to work regularly without the intake of solar energy for heating the DHW as the solar pump stops working.'},
-    41: {"text1": 'High temperature on the solar collector', "text2": 'The solar collector has exceeded the maximum temperature set', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'This occurs when the temperature of the solar collector exceeds the maximum limit set'},
-    42: {"text1": 'High temperature on the solar storage tank', "text2": 'The solar storage tank has exceeded the maximum temperature set', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'This occurs when the temperature of the water in the solar storage tank exceeds the maximum limit set.'},
-    43: {"text1": 'Block due to loss of flame signal', "text2": 'Loss of flame signal during operation in regimen for more consecutive times.', "action": 'Press the Reset button, before restarting, the boiler will run a post-ventilation cycle.', "comment": "This occurs if the ''Flame signal loss'' error occurs many times in a row within a preset period."},
-    44: {"text1": 'Block for exceeding the maximum accumulated time, close gas valve opening', "text2": 'The accumulation of the total time of the gas valve opened without flame detection is greater than the maximum allowed.', "action": 'Press the Reset button.', "comment": 'This occurs if the gas valve remains open for longer than required for normal operation, without the boiler switching on.'},
-    45: {"text1": 'dT high', "text2": 'The temperature difference measured between flow and return is ≥ 40 ° C.', "action": 'The power of the burner is limited to prevent damage to the condensation module and once the right dT is restored, the boiler resumes regular operation. Make sure there is water circulating in the boiler, that the pump is configured according to system requirements and that the return probe works properly.', "comment": 'The boiler detects a sudden, unexpected increase in the dT between the flow probe and the system return probe.'},
-    46: {"text1": 'Low temperature thermostat intervention / Incorrect wiring/board configuration', "text2": 'The safety thermostat on the boiler flow connection to DIM v2 (operating only at Low Temperature) has reached high temperatures. / Wiring error or use of incorrect spare board', "action": 'In this case, after cooling down, it is possible to reset the thermostat (see relative instruction sheet). / If the blockage or anomaly persists it is necessary to call an authorised company (e.g. Immergas Technical Assistance Service).', "comment": 'During normal operation, if an anomaly causes excessive overheating of the flow temperature in low temperature conditions, the boiler shuts down. / Wiring error or use of incorrect spare board'},
-    47: {"text1": 'Burner power limitation', "text2": 'If the flue gas temperature reaches a high value the card reduces the power supplied by the burner, in order to limit damage to the smoke circuit.', "action": 'If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'Should flue high temperature be detected, the boiler reduces power supplied so as not to damage it.'},
-    48: {"text1": 'System side flow probe anomaly', "text2": 'The system side flow probe has an out of range resistive value', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'In the event that the system side flow probe is not connected or is faulty, the anomaly is indicated'},
-    49: {"text1": 'High temperature block on return probe', "text2": 'High temperature measured by the return probe', "action": 'Make sure that water circulates properly in the boiler and that the three-way valve works properly.', "comment": 'This occurs when the heat exchanger return circuit reaches an excessively high temperature'},
-    50: {"text1": 'External probe anomaly', "text2": 'The external probe has an out of range resistive value', "action": 'Check the external probe connection. The system keeps working', "comment": 'In the event that the external probe is not connected or is faulty, the anomaly is indicated'},
-    51: {"text1": 'CAR Wireless communication failure', "text2": 'Absent communication between base transmitter and CARv2 RF.', "action": 'Check operation of the Wireless CAR, check the battery charge (refer to the relative instructions booklet).', "comment": 'If there is no communication between the boiler and Wireless version CAR, an anomaly is signalled. From this moment, it is only possible to control the system by means of the control panel of the boiler itself.'},
-    54: {"text1": 'Puffer probe anomaly', "text2": 'The puffer probe has an out of range resistive value', "action": 'The puffer mode is disabled', "comment": 'In the event that the puffer probe is not connected or is faulty, the anomaly is indicated'},
-    55: {"text1": 'Zone 1 flow temperature probe anomaly', "text2": 'The zone 1 flow probe has an out of range resistive value', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'If the board detects an anomaly on the zone 1 low temperature probe, the system cannot work in the affected area.'},
-    58: {"text1": 'Audax anomaly', "text2": 'Anomaly indication from the AUDAX heat pump connected to the system', "action": 'The heat pump does not satisfy the room heating and cooling requests; once the connections are restored, switch the system on and off again', "comment": 'Anomaly on the Audax heat pump, check the type of anomaly directly on the heat pump display'},
-    59: {"text1": 'Main supply voltage frequency block', "text2": 'The P.C.B. has detected an abnormal frequency on the power supply network.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects a main supply voltage frequency anomaly.'},
-    60: {"text1": 'Anomaly pump blocked', "text2": 'The modulating pump is stopped.', "action": 'Try to unblock the pump as described in the relative section. If normal conditions are restored the boiler restarts without having to be reset.', "comment": 'The pump is stopped due to one of the following causes: impeller blocked, electrical fault.'},
-    61: {"text1": 'Air in circulator pump', "text2": 'The modulating pump is stopped for air detected.', "action": 'Vent the pump and the central heating circuit. If normal conditions are restored the boiler restarts without having to be reset.', "comment": 'Air is detected inside the pump; the pump cannot work.'},
-    62: {"text1": 'Complete calibration required', "text2": 'The P.C.B. not have the correct configuration of the combustion control parameters.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": "Missing calibration is detected by the P.C.B. It may occur in the event the P.C.B. is replaced or if the parameters are altered in the air / gas section, thus requiring ''complete calibration''."},
-    63: {"text1": 'System return probe anomaly', "text2": 'The return probe has an out of range resistive value', "action": 'The boiler continues to operate without any integration from the external systems connected', "comment": 'In the event that the return probe is not connected or is faulty, the anomaly is indicated'},
-    67: {"text1": 'Solar system pressure switch anomaly', "text2": 'Open system pressure switch, possibly no fluid', "action": 'Check on the pressure gauge of the solar circulation unit that the pressure is at the correct value', "comment": 'Due to a pressure drop in the solar circuit, the pressure switch blocks the operation of the thermal solar circuit'},
-    70: {"text1": 'Return/flow probe exchange', "text2": 'X', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'X'},
-    72: {"text1": 'Fast calibration required', "text2": 'The P.C.B. not have the correct configuration of some combustion control parameters.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": "The P.C.B. detects that some parameters have been altered, thus requiring ''fast calibration''."},
-    73: {"text1": 'High flow probe and safety flow probe deviation detected', "text2": 'The delivery probes have a high variance.', "action": 'If normal conditions are restored the boiler restarts without having to be reset.', "comment": 'The P.C.B. detects an anomaly in the temperature readings of the NTC flow probes; the causes may be: faulty probe, incorrect position, poor system circulation, or clogging of the water side primary heat exchanger.'},
-    74: {"text1": 'Safety flow probe anomaly', "text2": 'The safety flow sensor provides a resistive value out of range.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'The P.C.B. detects an anomaly on the NTC safety flow probe.'},
-    75: {"text1": 'Return and/or flow probe malfunction', "text2": 'X', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'X'},
-    76: {"text1": 'Return and/or flow probes temperature drift', "text2": 'X', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'X'},
-    77: {"text1": 'Combustion control anomaly', "text2": 'Gas valve current detected out of range.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'Out of range current is detected on the gas valve.'},
-    78: {"text1": 'Combustion control anomaly', "text2": 'High current detected on gas valve.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'High current on the gas valve is detected.'},
-    79: {"text1": 'Combustion control anomaly', "text2": 'Low current detected on gas valve.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'Reduced current on the gas valve is detected.'},
-    80: {"text1": 'P.C.B. malfunction block', "text2": 'Detected fault on gas valve electronic driver for problems on gas valve or P.C.B.', "action": 'Press the Reset button', "comment": 'This occurs in the event of malfunctions of the P.C.B. that controls the valve.'},
-    84: {"text1": 'Combustion anomaly - power reduction in progress', "text2": 'Detected conditions similar to low pressure feed gas valve.', "action": 'If normal conditions are restored the boiler restarts without having to be reset', "comment": 'A low supply pressure is detected on the gas line. As a result the appliance power is limited and the anomaly is reported.'},
-    85: {"text1": 'Afterburner problem block', "text2": 'Potential gas valve, electrode or P.C.B. problem', "action": 'Press the Reset button. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'Flame present for about after gas valve closing'},
-    87: {"text1": 'Block - gas valve control', "text2": 'Detected fault on gas valve control.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'A malfunction of one of the components that controls the gas valve has been detected.'},
-    88: {"text1": 'Block - gas valve control', "text2": 'Detected fault on gas valve control.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'A malfunction of one of the components that controls the gas valve has been detected.'},
-    89: {"text1": 'Combustion signal unstable', "text2": 'Detected instability of combustion signal.', "action": 'The boiler keeps working.', "comment": 'The flame is unstable due to: presence of flue gas recirculation, wind, unstable gas pressure, unstable fan speed, or due to system malfunction.'},
-    90: {"text1": 'Combustion signal beyond limit', "text2": 'Detected combustion signal out of bounds.', "action": 'The boiler keeps working.', "comment": 'The combustion signal is beyond the adjustment range required for an extended period of time.'},
-    91: {"text1": 'Incorrect ignition block', "text2": 'The P.C.B. has exhausted all of its possible actions for optimum ignition burner.', "action": 'Press the Reset button', "comment": 'The P.C.B. has exhausted all possible actions in order to obtain optimal ignition of the burner.'},
-    92: {"text1": 'Fan revs correction limit', "text2": 'The P.C.B. has reached the maximum fan speed correction.', "action": 'The boiler keeps working.', "comment": 'The system has exhausted all possible corrections of the number of fan revs.'},
-    93: {"text1": 'Combustion signal beyond limit', "text2": 'Detected combustion signal out of bounds.', "action": 'The boiler keeps working.', "comment": 'The combustion signal is beyond the adjustment range required for an extended period of time.'},
-    94: {"text1": 'Combustion anomaly', "text2": 'Combustion problem detected caused by the system or control combustion.', "action": 'If normal conditions are restored the boiler restarts without having to be reset.', "comment": 'A problem is detected on the combustion control, which may be due to: gas low pressure, flue recirculation, defective gas valve or P.C.B..'},
-    95: {"text1": 'Combustion signal discontinuous', "text2": 'Detected discontinuities of combustion signal to problems of electrical connections or signal dispersion.', "action": 'The boiler keeps working.', "comment": 'The system detects a discontinuous combustion signal.'},
-    96: {"text1": 'Clogged flue', "text2": 'Detected high obstruction of the boiler assembly.', "action": 'The boiler does not start. If the shutdown or fault persists, contact an authorised company (e.g. Authorised Technical After-Sales Service).', "comment": 'This occurs in the event an obstruction is detected in the flue system.'},
-    98: {"text1": 'Block - maximum no. of software errors', "text2": 'The P.C.B. is not working properly.', "action": 'Press the Reset button', "comment": 'The maximum number of software errors possible has been reached.'},
-    99: {"text1": 'General block', "text2": 'The P.C.B. is not working properly.', "action": 'Press the Reset button', "comment": 'A boiler anomaly has been detected.'},
-    101: {"text1": 'Audax off-line alarm', "text2": 'Loss of communication with heat pump', "action": 'The heat pump does not satisfy the room heating and cooling requests; once the connections are restored, switch the system on and off again', "comment": 'In the event of communication failure, incorrect connection or heat pump switched off, the boiler electronics do not detect the heat pump'},
-    102: {"text1": 'Zone 1 off-line expansion alarm', "text2": 'Loss of communication with zone 1 expansion', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'Communication anomaly with zone 1'},
-    103: {"text1": 'Zone 2 off-line expansion alarm', "text2": 'Loss of communication with zone 2 expansion', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'Communication anomaly with zone 2'},
-    104: {"text1": 'Zone 3 off-line expansion alarm', "text2": 'Loss of communication with zone 3 expansion', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'Communication anomaly with zone 3'},
-    106: {"text1": 'DHW probe alarm', "text2": 'In the event of boiler integration and separate DHW management, the storage tank probe controlled by the operator has an out of range resistive value', "action": 'The system cannot produce domestic hot water with the heat pump. The production of the domestic hot water is guaranteed by the boiler', "comment": 'The board detects an anomaly on the storage tank probe'},
-    120: {"text1": 'Zone 1 dehumidification high set alarm', "text2": 'The zone 1 request setpoint calculated is too high for dehumidification', "action": 'The calculated flow set exceeds the limit permitted by the dehumidifier. Cool the room and wait until the dew temperature returns to acceptable values', "comment": 'The cooling flow set calculated for dehumidification exceeds the limit set in zone 1'},
-    121: {"text1": 'Zone 1 device offline alarm', "text2": 'The remote control or the remote control of zone 1 is offline', "action": 'Check that the remote control is switched on', "comment": 'Communication with the zone control is not detected. It is not possible to perform the zone temperature control'},
-    122: {"text1": 'Zone 2 device offline alarm', "text2": 'The remote control or the remote control of zone 2 is offline', "action": 'Check that the remote control is switched on', "comment": 'Communication with the zone control is not detected. It is not possible to perform the zone temperature control'},
-    123: {"text1": 'Zone 3 device offline alarm', "text2": 'The remote control or the remote control of zone 3 is offline', "action": 'Check that the remote control is switched on', "comment": 'Communication with the zone control is not detected. It is not possible to perform the zone temperature control'},
-    125: {"text1": 'Zone 1 room temperature probe anomaly', "text2": 'The room temperature probe of zone 1 is out of range', "action": 'In addition to the temperature, the dew point is not calculated for the zone either', "comment": 'Anomaly on the room temperature probe of zone 1 (optional). It is not possible to perform the zone temperature control'},
-    126: {"text1": 'Zone 2 room temperature probe anomaly', "text2": 'The room temperature probe of zone 2 is out of range', "action": 'In addition to the temperature, the dew point is not calculated for the zone either', "comment": 'Anomaly on the room temperature probe of zone 2 (optional.) It is not possible to perform the zone temperature control'},
-    127: {"text1": 'Zone 3 room temperature probe anomaly', "text2": 'The room temperature probe of zone 3 is out of range', "action": 'In addition to the temperature, the dew point is not calculated for the zone either', "comment": 'Anomaly on the room temperature probe of zone 3 (optional). It is not possible to perform the zone temperature control'},
-    129: {"text1": 'Zone 1 humidity probe anomaly', "text2": 'The humidity probe of zone 1 is out of range', "action": 'In addition to the humidity, the dew point is not calculated for the zone either', "comment": 'Anomaly on the humidity probe of zone 1 (optional). Zone humidity cannot be checked'},
-    130: {"text1": 'Zone 2 humidity probe anomaly', "text2": 'The humidity probe of zone 2 is out of range', "action": 'In addition to the humidity, the dew point is not calculated for the zone either', "comment": 'Anomaly on the zone 2 humidity probe (optional). Zone humidity cannot be checked'},
-    131: {"text1": 'Zone 3 humidity probe anomaly', "text2": 'The humidity probe of zone 3 is out of range', "action": 'In addition to the humidity, the dew point is not calculated for the zone either', "comment": 'Anomaly on the zone 3 humidity probe (optional). Zone humidity cannot be checked'},
-    132: {"text1": 'Zone 2 dehumidification high set alarm', "text2": 'The zone 2 request setpoint calculated is too high for dehumidification', "action": 'The calculated flow set exceeds the limit permitted by the dehumidifier. Cool the room and wait until the dew temperature returns to acceptable values', "comment": 'The cooling flow set calculated for dehumidification exceeds the limit set in zone 2'},
-    133: {"text1": 'Zone 1 dehumidifier fault alarm', "text2": 'The dehumidifier in zone 1 is in alarm conditions', "action": 'The system does not dehumidify in the relative zone', "comment": 'Anomaly coming from the dehumidifier (optional) in zone 1'},
-    134: {"text1": 'Zone 2 dehumidifier fault alarm', "text2": 'The dehumidifier in zone 2 is in alarm conditions', "action": 'The system does not dehumidify in the relative zone', "comment": 'Anomaly coming from the dehumidifier (optional) in zone 2'},
-    135: {"text1": 'Zone 3 dehumidifier fault alarm', "text2": 'The dehumidifier in zone 3 is in alarm conditions', "action": 'The system does not dehumidify in the relative zone', "comment": 'Anomaly coming from the dehumidifier (optional) in zone 3'},
-    137: {"text1": 'Reset system alarm – Restart the system', "text2": 'After a reset operation, which is performed via the control panel, an alarm is signalled because a system restart is required', "action": 'Turn the system off and on', "comment": 'When the default parameters are restored, the system needs to be restarted'},
-    138: {"text1": 'Screed heater in progress', "text2": 'Screed heater function in progress', "action": '', "comment": ''},
-    139: {"text1": 'Deaeration in progress', "text2": 'Deaeration function in progress', "action": '', "comment": ''},
-    177: {"text1": 'DHW maximum time alarm', "text2": 'The DHW request was made exceeding a preset maximum time', "action": 'The system continues to operate with non-optimal performance', "comment": 'The domestic hot water production requirements are not met within the preset time (5 hours)'},
-    178: {"text1": 'Anti-legionella cycle not successful', "text2": 'The anti-legionella cycle was not completed successfully within a preset time', "action": 'Press the Reset button', "comment": 'The anti-legionella cycle is performed unsuccessfully within the preset time (3 hours)'},
-    179: {"text1": 'Liquid probe anomaly', "text2": 'The liquid phase probe is out of range.', "action": 'The system does not start. Call an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'The board detects an anomaly on the liquid phase probe'},
-    181: {"text1": 'Remote Control communication failure zone 2', "text2": 'There is no dialogue between the board and the remote control in zone 2.', "action": 'Disconnect and reconnect the power to the hydronic module. If the Remote Control is still not detected at restart, the system will switch to local operating mode, i.e. using the controls on the control panel. In this case the “Central Heating”, function cannot be activated', "comment": 'This happens when an incompatible remote control is connected or when communication between the hydronic module and the CARV2 of the second zone is lost'},
-    182: {"text1": 'Condensing unit alarm', "text2": 'An alarm is triggered on the condensing unit', "action": 'The system does not work, see the anomaly on the condensing unit and its instructions booklet', "comment": 'An anomaly is signalled on the condensing unit'},
-    183: {"text1": 'Condensing unit alarm in test mode', "text2": 'The condensing unit is in TEST MODE', "action": 'During this time, room heating/air conditioning and domestic hot water production requirements cannot be met', "comment": 'A signal notifies that the condensing unit is in test mode'},
-    184: {"text1": 'Communication with outdoor unit timeout alarm', "text2": 'Loss of communication with condensing unit', "action": 'Have the electrical connection between the units checked', "comment": 'A signal notifies an anomaly due to a communication problem between the indoor unit and the condensing unit'},
-    185: {"text1": 'Safety module communication alarm', "text2": 'Loss of communication with safety module', "action": 'Have the electrical connection between the components checked', "comment": 'Communication anomaly between P.C.B. and ignition board'},
-    186: {"text1": 'Igniter high voltage anomaly', "text2": 'Safety module: there is an igniter voltage anomaly', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'An anomaly appears on the ignition board'},
-    187: {"text1": 'Condensing unit return probe alarm', "text2": 'The condensing unit return probe is out of range', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'The board detects an anomaly on the heat pump return NTC probe'},
-    188: {"text1": 'Request out of operating range', "text2": 'The request made is not performed because the outdoor conditions do not enable the activation of the condensing unit', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'A heating or cooling request is made with an outdoor temperature exceeding the operating limits'},
-    189: {"text1": 'Communication with communication board timeout alarm', "text2": 'Loss of communication with condensing unit communication board', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'If communication between the printed circuit boards is lost, an anomaly is signalled'},
-    191: {"text1": 'RF communication failure towards CAR v2 RF zone 2', "text2": 'The communication between the transmitter base and the CAR v2 RF of zone 2 has failed', "action": 'Check operation of the Wireless CAR, check the battery charge (refer to the relative instructions booklet)', "comment": 'If there is no communication between the indoor unit and Wireless version CAR of the second zone, an anomaly is signalled. From this moment onwards, it is only possible to control the system by means of the indoor unit control panel'},
-    192: {"text1": 'Condensing unit flow probe anomaly', "text2": 'The condensing unit flow probe is out of range', "action": 'If the block or anomaly persists, contact an authorised company (e.g. Immergas Technical After-Sales Service).', "comment": 'The board detects an anomaly on the NTC heat pump flow probe'},
-    193: {"text1": 'Appliance in Test mode', "text2": 'The appliance is controlled by an external device via the Opentherm protocol', "action": 'The system continues operating properly', "comment": 'A signal notifies that the appliance is in test mode'},
-    194: {"text1": 'Audax Pro disabled', "text2": 'The Audax Pro condensing unit has been disabled', "action": 'The system continues operating properly', "comment": 'A signal notifies that the condensing unit has been disabled through the appropriate input in the terminal board'},
-    195: {"text1": 'Liquid phase low temp. anomaly ', "text2": 'The temp. of the liquid phase probe is too low ', "action": 'Check that the cooling circuit is working properly', "comment": 'An excessively low temperature is detected in the liquid phase'},
-    196: {"text1": 'High flow temp. block', "text2": 'An excessively high temperature is detected on the heat pump return circuit', "action": 'Check that the cooling circuit is working properly', "comment": 'An excessively high temperature is detected on the heat pump flow circuit'},
-}
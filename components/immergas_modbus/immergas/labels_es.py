@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: es)"""
-
-immergas_labels = {
-    'default': {"text1": 'Anomalía general no reconocida', "text2": 'Compruebe la tabla de errores o la tarjeta seleccionada', "action": 'Compruebe la tabla de errores o la tarjeta seleccionada', "comment": 'No hay ninguna nota al respecto'},
-    0: {"text1": 'SISTEMA OK', "text2": 'El sistema funciona correctamente', "action": 'No se requiere ninguna acción', "comment": 'Ninguna anomalía'},
-    1: {"text1": 'Bloqueo por fallo de encendido', "text2": 'No se ha detectado la llama al final del último intento de encendido', "action": 'Presione el pulsador de Reset', "comment": 'La caldera, en caso de solicitud de calefacción ambiente o de producción de agua caliente sanitaria, no se enciende en el tiempo predeterminado. En el primer encendido o después de un período prolongado de inactividad del aparato puede que sea necesario eliminar un bloqueo.'},
-    2: {"text1": 'Bloqueo por termostato de seguridad (sobretemperatura)', "text2": 'Intervención del termostato de seguridad', "action": 'Presione el pulsador de Reset', "comment": 'Durante el régimen normal de funcionamiento, si se produce, por causa de una anomalía, un excesivo sobrecalentamiento interno, la caldera efectúa un bloqueo.'},
-    3: {"text1": 'Bloqueo por termostato de humos', "text2": 'Intervención del termostato de humos', "action": 'Presione el pulsador de Reset (versiones Nike)/ Configure correctamente el parámetro P.14. Si fuera necesario, pulse el botón de Reset (versiones Star)', "comment": 'Durante el funcionamiento normal, si se produce, por causa de una anomalía, un excesivo sobrecalentamiento de los humos, la caldera se bloquea (versiones Nike)/ Configuración incorrecta parámetro P.14 (versión Star)'},
-    4: {"text1": 'Bloqueo de la resistencia contactos', "text2": 'Se ha detectado una anomalía en el circuito de control de la válvula de gas', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta electrónica detecta un error en la alimentación de la válvula del gas. Compruebe la conexión de esta. (la anomalía se detecta y visualiza solo en presencia de una solicitud).'},
-    5: {"text1": 'Anomalía de la sonda de ida', "text2": 'La sonda de ida ofrece un valor resistivo fuera del rango', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta detecta una anomalía en la sonda NTC de la línea de impulsión.'},
-    6: {"text1": 'Anomalía de la sonda sanitaria', "text2": 'La sonda del sanitario ofrece un valor resistivo fuera del rango', "action": 'La caldera continúa produciendo agua caliente sanitaria pero con un nivel de rendimiento inferior al óptimo. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta detecta una anomalía en la sonda NTC sanitario.'},
-    8: {"text1": 'Número máximo de reset', "text2": 'Indica que se ha alcanzado el número máximo de los resets que permite realizar la tarjeta integrada', "action": 'Atención: se puede restablecer el fallo hasta 5 veces seguidas, tras lo cual la función queda bloqueada durante al menos una hora y se puede volver a intentar el encendido una vez cada hora por un máximo de 5 intentos. Apagando y volviendo a encender el aparato se vuelven a recuperar 5 intentos.', "comment": 'Número de resets disponibles ya realizados.'},
-    10: {"text1": 'Presión de instalación insuficiente', "text2": 'El contacto del presostato de la instalación está abierto', "action": 'Compruebe en el manómetro de la caldera que la presión de la instalación se encuentre entre 1÷1,2 bares y, de ser necesario, restablezca la presión correcta.', "comment": 'La presión detectada del agua en el circuito de calefacción no es suficiente para garantizar el funcionamiento correcto de la caldera.'},
-    11: {"text1": 'Anomalía presostato humos', "text2": 'Posible anomalía en presostato humos o en ventilador', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'Si las condiciones normales de funcionamiento se restablecen, la caldera vuelve a arrancar sin necesidad de resetearla'},
-    12: {"text1": 'Anomalía en la sonda acumulador', "text2": 'La sonda del hervidor de calefacción ofrece un valor resistivo fuera del rango', "action": 'La caldera no produce agua caliente sanitaria. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta detecta una anomalía en la sonda del hervidor'},
-    13: {"text1": 'Medidor del caudal del aire/humos fuera de rango', "text2": 'Con ventilador parado o fuera de rango, el control del aire/humos lee una señal demasiado alta', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Con ventilador parado, el control del aire/humos lee una señal demasiado alta (contactos del presostato encolados)'},
-    15: {"text1": 'Error de configuración', "text2": 'La tarjeta detecta una incongruencia entre su configuración y las señales en entrada', "action": 'Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla. Compruebe que la caldera esté configurada correctamente. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La caldera no arranca porque la tarjeta detecta una anomalía o una incongruencia en los cables eléctricos.'},
-    16: {"text1": 'Anomalía en el ventilador', "text2": 'El ventilador gira cuando no recibe alimentación o está detenido cuando recibe alimentación', "action": 'Presione el pulsador de Reset. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'Se produce si el ventilador tiene una avería mecánica o electrónica.'},
-    17: {"text1": 'Velocidad del ventilador incorrecta', "text2": 'El número de revoluciones del ventilador está fuera del rango correcto', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Número de revoluciones del ventilador incorrecto'},
-    20: {"text1": 'Bloqueo de la llama parásita', "text2": 'Detección de llama anómala', "action": 'Presione el pulsador de Reset. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'Se produce en caso de dispersión del circuito, de detección o fallo en el control de la llama.'},
-    23: {"text1": 'Anomalía de la sonda de retorno', "text2": 'La sonda de retorno ofrece un valor resistivo fuera del rango', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta detecta una anomalía en la sonda NTC de la línea de impulsión.'},
-    24: {"text1": 'Anomalía en el teclado', "text2": 'Se detecta una presión constante en los botones del panel de mandos', "action": 'Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta detecta una anomalía en el teclado.'},
-    25: {"text1": 'Bloqueo de la sonda de humos/bloqueo CRC (TERA)', "text2": 'Temperatura de humos fuera de rango/ memoria dañada (TERA)', "action": 'Presione el pulsador de Reset', "comment": 'Gradiente humos elevado, probable bloqueo circulador o falta de agua/memoria dañada'},
-    27: {"text1": 'Circulación insuficiente', "text2": 'Recalentamiento de la caldera debido a una escasa circulación en el circuito primario', "action": 'Presione el pulsador de Reset', "comment": 'Comprobar que no haya interceptaciones en el circuito de calefacción y/o comprobar el correcto funcionamiento del circulador'},
-    28: {"text1": 'Fuga en circuito sanitario', "text2": 'Si durante el funcionamiento en modo de calefacción se detecta una elevación de la temperatura del agua sanitaria, la caldera señala la anomalía y reduce la temperatura de calefacción para limitar la formación de cal en el intercambiador.', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'Compruebe que todos los grifos de la instalación del agua sanitaria estén cerrados y que no pierdan agua; asimismo, controle que no haya pérdidas en la instalación. Una vez restablecidas las condiciones óptimas en la instalación del agua sanitaria, la caldera continúa su funcionamiento normal'},
-    29: {"text1": 'Anomalía sonda humos', "text2": 'La sonda de humos ofrece un valor resistivo fuera del rango', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'La tarjeta detecta una anomalía en la sonda de humos.'},
-    31: {"text1": 'Pérdida de comunicación con el CARV2', "text2": 'No existe comunicación entre tarjeta y remoto.', "action": 'Desenchufe y vuelva a enchufar la caldera a la red eléctrica. Si al encender no se detecta el mando remoto, la caldera pasa al modo de funcionamiento local, o sea utilizando los mandos presentes en el panel de mandos. En este caso, no es posible activar la función “Calefacción”.', "comment": 'Sucede en caso de conexión a un mando remoto incompatible, o bien en caso de problemas de comunicación entre la caldera y CARV2.'},
-    32: {"text1": 'Anomalía sonda Zona 2 baja temperatura', "text2": 'Sonda de impulsión de la zona 2 fuera de rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda de la zona 2 de baja temperatura; el sistema no puede funcionar en la zona afectada'},
-    33: {"text1": 'Anomalía sonda zona 3 baja temperatura', "text2": 'Sonda de impulsión de la zona 3 fuera de rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda de la zona 2 de baja temperatura; el sistema no puede funcionar en la zona afectada'},
-    36: {"text1": 'Caída comunicación IMG BUS', "text2": 'Pérdida de comunicación en el protocolo IMG Bus.', "action": 'La caldera no satisface las solicitudes de calefacción.', "comment": 'Debido a una anomalía en la centralita de la caldera, en la tarjeta de zonas (opcional) o en el IMG Bus se interrumpe la comunicación entre los diversos componentes.'},
-    37: {"text1": 'Baja tensión de alimentación', "text2": 'La tensión de alimentación de la tarjeta tiene valores inferiores a los límites permitidos.', "action": 'Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla.', "comment": 'Se produce cuando la tensión de alimentación es inferior a los límites permitidos para el funcionamiento correcto de la caldera.'},
-    38: {"text1": 'Pérdida señal de llama', "text2": 'Después de enganchar un valor de corriente de llama correcto la tarjeta señala una caída de la corriente de llama.', "action": 'Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla.', "comment": 'Se produce cuando la caldera está encendida correctamente y se apaga inesperadamente la llama del quemador; se realiza un nuevo intento de encendido y en caso de restablecimiento de las condiciones normales, la caldera no necesita ser reiniciada.'},
-    39: {"text1": 'Anomalía de la sonda del colector solar', "text2": 'La sonda externa ofrece un valor resistivo fuera del rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda del colector solar, la caldera todavía funciona sin energía solar para calentar el agua caliente sanitaria debido a que la bomba solar deja de funcionar'},
-    40: {"text1": 'Anomalía sonda acumulación solar', "text2": 'La sonda de acumulación solar ofrece un valor resistivo fuera del rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda del acumulador solar, la caldera todavía funciona normalmente sin energía solar para calentar el agua caliente sanitaria debido a que la bomba solar deja de funcionar.'},
-    41: {"text1": 'Temperatura elevada en el colector solar', "text2": 'El colector solar ha superado la temperatura máxima configurada', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Se produce cuando la temperatura del colector solar supera el límite máximo configurado'},
-    42: {"text1": 'Temperatura elevada en el acumulador solar', "text2": 'El acumulador solar ha superado la temperatura máxima configurada', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Si produce cuando la temperatura del agua en el acumulador solar supera el límite máximo configurado.'},
-    43: {"text1": 'Bloqueo por pérdida de señal de llama', "text2": 'Pérdida de señal de llama en funcionamiento correcto varias veces seguidas.', "action": 'Presione el pulsador de Reset, la caldera antes de volver a encenderse realiza un ciclo de posventilación.', "comment": 'Tiene lugar si se presenta varias veces consecutivas durante un tiempo preestablecido el error “Pérdida señal de llama”.'},
-    44: {"text1": 'Bloqueo por haber superado la acumulación de tiempo máximo de aperturas cercanas de la válvula de gas', "text2": 'La acumulación del tiempo total de apertura de la válvula de gas sin detección de llama es mayor que el máximo permitido.', "action": 'Presione el pulsador de Reset.', "comment": 'Se produce si la válvula de gas permanece abierta durante un tiempo superior al previsto para su funcionamiento normal sin que la caldera se encienda.'},
-    45: {"text1": 'dT elevado', "text2": 'La diferencia de temperatura medida entre ida y retorno es ≥ que 40 °C.', "action": 'Se limita la potencia del quemador para prevenir posibles daños en el módulo de condensación, cuando se haya restablecido la debida dT la caldera retoma el funcionamiento normal. Compruebe que el agua circule en la caldera, que el circulador esté configurado según las exigencias de la instalación y que la sonda de retorno funcione correctamente.', "comment": 'La caldera detecta un ascenso repentino e imprevisto del dT entre la sonda de ida y la sonda de retorno de la instalación.'},
-    46: {"text1": 'Intervención termostato baja temperatura/Configuración errónea del cableado/tarjeta', "text2": 'El termostato de seguridad colocado en la conexión de ida de la caldera a DIM v2 (que funciona solo con baja temperatura) ha alcanzado temperaturas altas. / Error cableado o uso de la tarjeta de recambio errónea', "action": 'En este caso, después de un lapso de enfriamiento adecuado, se puede resetear el termostato (vea el manual de instrucciones correspondiente). / Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa autorizada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Durante el régimen normal de funcionamiento, si a causa de una anomalía se produce un sobrecalentamiento excesivo de la temperatura de impulsión en baja temperatura la caldera se bloquea ./ Error del cableado o uso de la tarjeta de recambio errónea'},
-    47: {"text1": 'Limitación potencia quemador', "text2": 'Si la temperatura de humos alcanza un valor alto la tarjeta reduce la potencia distribuida por el quemador, para limitar los daños al circuito de humos.', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Si se detecta una temperatura alta de los humos, la caldera reduce la potencia distribuida para evitar daños.'},
-    48: {"text1": 'Anomalía de la sonda de impulsión del lado de la instalación', "text2": 'La sonda de ida del lado de la instalación ofrece un valor resistivo fuera del rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'En caso de que la sonda de ida del lado de la instalación no esté conectada o esté averiada, se indica la anomalía'},
-    49: {"text1": 'Bloqueo temperatura elevada de la sonda de retorno', "text2": 'Temperatura medida por la sonda de retorno alta', "action": 'Compruebe la correcta circulación en la caldera y el buen funcionamiento de la válvula de tres vías.', "comment": 'Se produce en caso de que se alcance una temperatura demasiado alta en el circuito de retorno del intercambiador'},
-    50: {"text1": 'Anomalía de la sonda externa', "text2": 'La sonda externa ofrece un valor resistivo fuera del rango', "action": 'Compruebe la conexión de la sonda externa. El sistema sigue funcionando', "comment": 'En caso de que la sonda externa no esté conectada o esté averiada, debe indicar la anomalía'},
-    51: {"text1": 'Caída de comunicación con CAR Wireless', "text2": 'Se ha interrumpido la comunicación entre la base de transmisión y CAR v2 RF.', "action": 'Compruebe el funcionamiento del CAR Wireless, y la carga de las baterías (vea el correspondiente manual de instrucciones).', "comment": 'En caso de caída de comunicación entre caldera y CAR versión Wireless se señala la anomalía, a partir de este momento se puede controlar el sistema solo mediante el panel de mandos de la caldera.'},
-    54: {"text1": 'Anomalía en la sonda puffer', "text2": 'La sonda puffer ofrece un valor resistivo fuera del rango', "action": 'Se deshabilita la modalidad puffer', "comment": 'En caso de que la sonda puffer no esté conectada o esté averiada, se indica la anomalía'},
-    55: {"text1": 'Anomalía de la sonda de temperatura de ida de la zona 1', "text2": 'La sonda de ida de la zona 1 ofrece un valor resistivo fuera del rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda de la zona 1 de baja temperatura; el sistema no puede funcionar en la zona afectada.'},
-    58: {"text1": 'Anomalía Audax', "text2": 'Aviso de anomalía por parte de la bomba de calor AUDAX conectada al sistema', "action": 'La bomba de calor no satisface las demandas de calefacción y de enfriamiento ambiente, cuando se restablezcan las conexiones deberá apagar la caldera y volver a encender el sistema', "comment": 'Anomalía en la bomba de calor Audax, compruebe el tipo de anomalía directamente en la pantalla de la bomba de calor'},
-    59: {"text1": 'Bloqueo de frecuencia de la red de alimentación eléctrica', "text2": 'La tarjeta electrónica detecta una frecuencia anómala en la alimentación de red eléctrica.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una frecuencia anómala en la alimentación de red eléctrica.'},
-    60: {"text1": 'Circulador bloqueado', "text2": 'El circulador de modulación está detenido.', "action": 'Pruebe a desbloquear el circulador tal y como se describe en el párrafo correspondiente. Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla.', "comment": 'El circulador está detenido por una de las siguientes causas: rotor bloqueado, avería eléctrica.'},
-    61: {"text1": 'Presencia de aire en el circulador', "text2": 'El circulador de modulación está detenido porque se ha detectado un funcionamiento en aire.', "action": 'Proceda a purgar el circulador y el circuito de la calefacción. Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla.', "comment": 'Se detecta aire dentro del circulador; el circulador no funciona.'},
-    62: {"text1": 'Solicitud de calibración completa', "text2": 'La tarjeta no tiene la configuración correcta de los parámetros de control de combustión.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta la ausencia de calibración de la tarjeta electrónica. Se puede verificar en caso de sustitución de la tarjeta electrónica o en caso de variación de los parámetros en la sección aire / gas, que vuelven necesaria la “calibración completa”.'},
-    63: {"text1": 'Anomalía sonda de retorno de la instalación', "text2": 'La sonda de retorno ofrece un valor resistivo fuera del rango', "action": 'La caldera continúa funcionando sin que la integren los sistemas externos que tiene conectados', "comment": 'En caso de que la sonda de retorno no esté conectada o esté averiada, se indica la anomalía'},
-    67: {"text1": 'Anomalía del presostato de la instalación solar', "text2": 'Presostato instalación abierta, posible falta de fluido', "action": 'Compruebe en el manómetro del grupo de circulación solar que la presión esté en el valor correcto', "comment": 'Debido a una disminución de la presión en el circuito solar, el presostato bloquea el funcionamiento del circuito solar térmico'},
-    70: {"text1": 'Sondas invertidas', "text2": 'En caso de error en la conexión del cableado de caldera, se registra el error', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Compruebe la conexión de la sonda de caudal y de retorno'},
-    72: {"text1": 'Solicitud de calibración rápida', "text2": 'La tarjeta no tiene la configuración correcta de los parámetros de control de combustión.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta un cambio de algunos parámetros, que vuelve necesaria la “calibración rápida”.'},
-    73: {"text1": 'Se ha detectado una diferencia alta entre la sonda de ida y la sonda de ida de seguridad', "text2": 'Las sondas de ida tienen una separación alta.', "action": 'Si se restablecen las condiciones normales la caldera arranca de nuevo sin necesidad de reset', "comment": 'La tarjeta detecta una anomalía en la lectura de las temperaturas de las sondas NTC de ida y las causas pueden ser: sonda defectuosa, posicionamiento incorrecto, poca circulación en la instalación, obstrucción del lado agua del intercambiador primario.'},
-    74: {"text1": 'Anomalía sonda ida de seguridad', "text2": 'La sonda de ida de seguridad ofrece un valor resistivo fuera del rango.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda NCT de ida de seguridad.'},
-    75: {"text1": 'Bloqueo por sensor NTC dañado', "text2": 'Posible rotura de una o ambas sondas de caudal de retorno del equipo', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'El sensor de la sonda de seguridad provoca un gradiente de temperatura elevado'},
-    76: {"text1": 'Variación sonda de caudal o sonda de retorno', "text2": 'Se detecta un mal funcionamiento de una o ambas sondas de caudal y retorno del equipo', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Diferencia mayor respecto al configurado entre la sonda de caudal y de retorno en caso de necesidad de calor'},
-    77: {"text1": 'Anomalía control combustión', "text2": 'Se ha detectado una corriente fuera de rango en la válvula de gas.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta una corriente fuera de rango en la válvula de gas.'},
-    78: {"text1": 'Anomalía control combustión', "text2": 'Se ha detectado una corriente elevada en la válvula de gas.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta una corriente elevada en la válvula de gas.'},
-    79: {"text1": 'Anomalía control combustión', "text2": 'Se ha detectado una corriente baja en la válvula de gas.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta una corriente reducida en la válvula de gas.'},
-    80: {"text1": 'Bloqueo por problemas de funcionamiento de la tarjeta electrónica', "text2": 'Se ha detectado una avería en el driver de la válvula de gas electrónica por problemas en la tarjeta o en la válvula de gas.', "action": 'Presione el pulsador de Reset', "comment": 'Se produce si la tarjeta electrónica que controla la válvula presenta problemas de funcionamiento.'},
-    84: {"text1": 'Anomalía combustión - reducción de potencia en curso', "text2": 'Se han detectado condiciones asimilables a la baja presión de alimentación de la válvula de gas.', "action": 'Si se restablecen las condiciones normales la caldera arranca de nuevo sin necesidad de reset', "comment": 'Se detecta una baja presión de alimentación en la red del gas. Por consiguiente, se limita la potencia del aparato y se señala la anomalía.'},
-    85: {"text1": 'Bloqueo problema postcombustión', "text2": 'Potencial problema de la válvula de gas, electrodo o tarjeta electrónica', "action": 'Presione el pulsador de Reset. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas)', "comment": 'Llama presente después del cierre de la válvula de gas'},
-    87: {"text1": 'Bloqueo control de la válvula de gas', "text2": 'Se ha detectado una avería en el control de la válvula de gas.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta un problema de funcionamiento de uno de los componentes que controlan la válvula de gas.'},
-    88: {"text1": 'Bloqueo control de la válvula de gas', "text2": 'Se ha detectado una avería en el control de la válvula de gas.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se detecta un problema de funcionamiento de uno de los componentes que controlan la válvula de gas.'},
-    89: {"text1": 'Señal combustión inestable', "text2": 'Se ha detectado una inestabilidad en la señal de combustión.', "action": 'La caldera sigue funcionando.', "comment": 'La llama es inestable a causa de: presencia de recirculación de humos, viento, presión de gas inestable, velocidad del ventilador inestable o a causa de un problema de funcionamiento del sistema.'},
-    90: {"text1": 'Señal combustión fuera de límite', "text2": 'Se detecta la señal de combustión fuera del límite.', "action": 'La caldera sigue funcionando.', "comment": 'Se detecta la señal de combustión fuera del rango de regulación establecido durante un tiempo prolongado.'},
-    91: {"text1": 'Bloqueo por encendido incorrecto', "text2": 'La tarjeta ha agotado todas las posibles acciones para tener un encendido óptimo del quemador.', "action": 'Presione el pulsador de Reset', "comment": 'La tarjeta ha agotado todas las posibles acciones para conseguir un encendido óptimo del quemador.'},
-    92: {"text1": 'Límite de corrección de revoluciones del ventilador', "text2": 'La tarjeta ha alcanzado la corrección máxima de las revoluciones del ventilador.', "action": 'La caldera sigue funcionando.', "comment": 'El sistema ha agotado todas las posibles correcciones del número de revoluciones del ventilador.'},
-    93: {"text1": 'Señal combustión fuera de límite', "text2": 'Se detecta la señal de combustión fuera del límite.', "action": 'La caldera sigue funcionando.', "comment": 'Se detecta la señal de combustión fuera del rango de regulación establecido durante un tiempo prolongado.'},
-    94: {"text1": 'Anomalía combustión', "text2": 'Se ha detectado un problema de combustión causado por el sistema o el control de combustión.', "action": 'Si se restablecen las condiciones normales, la caldera arranca de nuevo sin necesidad de reiniciarla.', "comment": 'Se detecta un problema en el control de combustión que puede ser causado por: baja presión del gas, recirculación de humos, válvula de gas o tarjeta electrónica defectuosa.'},
-    95: {"text1": 'Señal combustión discontinua', "text2": 'Se ha detectado una discontinuidad en la señal de combustión por problemas en las conexiones eléctricas o dispersión de señal.', "action": 'La caldera sigue funcionando.', "comment": 'El sistema detecta una discontinuidad en la señal de combustión.'},
-    96: {"text1": 'Conductos de toma de aire obstruidos', "text2": 'Se ha detectado una alta obstrucción los conductos de toma de aire.', "action": 'La caldera no arranca. Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'Se produce si se detecta una obstrucción en los conductos de toma de aire.'},
-    98: {"text1": 'Bloqueo n. máximo de errores software', "text2": 'La tarjeta electrónica no funciona correctamente.', "action": 'Presione el pulsador de Reset', "comment": 'Se alcanza el número máximo de errores software admitidos.'},
-    99: {"text1": 'Bloqueo genérico', "text2": 'La tarjeta electrónica no funciona correctamente.', "action": 'Presione el pulsador de Reset', "comment": 'Se detecta una anomalía en la caldera.'},
-    101: {"text1": 'Alarma off-line Audax', "text2": 'Pérdida de comunicación con la bomba de calor', "action": 'La bomba de calor no satisface las demandas de calefacción y de enfriamiento ambiente, cuando se restablezcan las conexiones deberá apagar la caldera y volver a encender el sistema', "comment": 'La electrónica de la caldera no detecta la bomba de calor, en caso de que pierda comunicación, de conexión equivocada o de bomba de calor apagada'},
-    102: {"text1": 'Alarma off-line expansión Zona 1', "text2": 'Pérdida de comunicación con expansión zona 1', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Anomalía de comunicación con zona 1'},
-    103: {"text1": 'Alarma off-line expansión Zona 2', "text2": 'Pérdida de comunicación con expansión zona 2', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Anomalía de comunicación con zona 2'},
-    104: {"text1": 'Alarma off-line expansión Zona 3', "text2": 'Pérdida de comunicación con expansión zona 3', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Anomalía de comunicación con zona 3'},
-    106: {"text1": 'Alarma sonda sanitaria ', "text2": 'En el caso de integración con caldera y gestión separada del sanitario, la sonda hervidor controlada por el gestor ofrece un valor resistivo fuera de rango', "action": 'El sistema no puede producir agua caliente sanitaria con la bomba de calor. La producción del agua caliente sanitaria es garantizada por la caldera', "comment": 'La tarjeta detecta una anomalía en la sonda del acumulador'},
-    120: {"text1": 'Alarma set elevado para deshumidificación de la zona 1', "text2": 'El setpoint calculado de demanda zona 1 es demasiado elevado para una deshumidificación', "action": 'El set de impulsión calculado es superior al límite admitido por el deshumidificador. Refrescar el ambiente y esperar a que la temperatura de rocío vuelva a valores aceptables', "comment": 'El set de impulsión enfriamiento calculado para la deshumidificación es superior al límite configurado en la zona 1'},
-    121: {"text1": 'Alarma offline dispositivo di zona 1', "text2": 'El control remoto o el control remoto de la zona 1 resulta estar offline', "action": 'Compruebe que el control remoto esté encendido', "comment": 'No se detecta comunicación con el control de zona. No se puede efectuar la termorregulación de la zona'},
-    122: {"text1": 'Alarma offline dispositivo di zona 2', "text2": 'El control remoto o el control remoto de la zona 2 resulta estar offline', "action": 'Compruebe que el control remoto esté encendido', "comment": 'No se detecta comunicación con el control de zona. No se puede efectuar la termorregulación de la zona'},
-    123: {"text1": 'Alarma offline dispositivo di zona 3', "text2": 'El control remoto o el control remoto de la zona 3 resulta estar offline', "action": 'Compruebe que el control remoto esté encendido', "comment": 'No se detecta comunicación con el control de zona. No se puede efectuar la termorregulación de la zona'},
-    125: {"text1": 'Anomalía de la sonda de temperatura de ambiente de la zona 1', "text2": 'La sonda de temperatura ambiente de la zona 1 está fuera de rango', "action": 'Además de la temperatura, no se calcula el punto de rocío para la zona', "comment": 'Anomalía presente en la sonda de temperatura ambiente de la zona 1 (opcional). No se puede efectuar la termorregulación de la zona'},
-    126: {"text1": 'Anomalía sonda temperatura ambiente zona 2', "text2": 'La sonda de temperatura ambiente de la zona 2 está fuera de rango', "action": 'Además de la temperatura, no se calcula el punto de rocío para la zona', "comment": 'Anomalía presente en la sonda de temperatura ambiente de la zona 2 (opcional). No se puede efectuar la termorregulación de la zona'},
-    127: {"text1": 'Anomalía sonda temperatura ambiente zona 3', "text2": 'La sonda de temperatura ambiente de la zona 3 está fuera de rango', "action": 'Además de la temperatura, no se calcula el punto de rocío para la zona', "comment": 'Anomalía presente en la sonda de temperatura ambiente de la zona 3 (opcional). No se puede efectuar la termorregulación de la zona'},
-    129: {"text1": 'Anomalía de la sonda de humedad de la zona 1', "text2": 'La sonda de humedad ambiente de la zona 1 está fuera de rango', "action": 'Además de la humedad, no se calcula el punto de rocío para la zona', "comment": 'Anomalía presente en la sonda de humedad de la zona 1 (opcional). No se puede realizar el control de la humedad de la zona'},
-    130: {"text1": 'Anomalía de la sonda de humedad de la zona 2', "text2": 'La sonda de humedad ambiente de la zona 2 está fuera de rango', "action": 'Además de la humedad, no se calcula el punto de rocío para la zona', "comment": 'Anomalía presente en la sonda de humedad de la zona 2 (opcional). No se puede realizar el control de la humedad de la zona'},
-    131: {"text1": 'Anomalía de la sonda de humedad de la zona 3', "text2": 'La sonda de humedad ambiente de la zona 3 está fuera de rango', "action": 'Además de la humedad, no se calcula el punto de rocío para la zona', "comment": 'Anomalía presente en la sonda de humedad de la zona 3 (opcional). No se puede realizar el control de la humedad de la zona'},
-    132: {"text1": 'Alarma set elevado para deshumidificación de la zona 2', "text2": 'El setpoint calculado de demanda zona 2 es demasiado elevado para una deshumidificación', "action": 'El set de impulsión calculado es superior al límite admitido por el deshumidificador. Refrescar el ambiente y esperar a que la temperatura de rocío vuelva a valores aceptables', "comment": 'El set de impulsión enfriamiento calculado para la deshumidificación es superior al límite configurado en la zona 2'},
-    133: {"text1": 'Alarma por avería del deshumidificador zona 1', "text2": 'El deshumidificador de la zona 1 está en alarma', "action": 'El sistema no deshumidifica la zona correspondiente', "comment": 'Anomalía que proviene del deshumidificador (opcional) en la zona 1'},
-    134: {"text1": 'Alarma por avería del deshumidificador zona 2', "text2": 'El deshumidificador de la zona 2 está en alarma', "action": 'El sistema no deshumidifica la zona correspondiente', "comment": 'Anomalía que proviene del deshumidificador (opcional) en la zona 2'},
-    135: {"text1": 'Alarma por avería del deshumidificador zona 3', "text2": 'El deshumidificador de la zona 3 está en alarma', "action": 'El sistema no deshumidifica la zona correspondiente', "comment": 'Anomalía que proviene del deshumidificador (opcional) en la zona 3'},
-    137: {"text1": 'Alarma sistema restablecido – Reiniciar el sistema', "text2": 'Después de una operación de restablecimiento, que se efectúa mediante el panel de mandos, se señala la alarma ya que es necesario el reinicio del sistema', "action": 'Apagar y encender el sistema', "comment": 'Una vez efectuado el restablecimiento de los parámetros predeterminados el sistema necesita un reinicio'},
-    138: {"text1": 'Calentador de pavimento en curso', "text2": 'Función de calentador de pavimento en curso', "action": '', "comment": ''},
-    139: {"text1": 'Desaireación en curso', "text2": 'Función de desaireación en curso', "action": '', "comment": ''},
-    177: {"text1": 'Alarma por tiempo máximo sanitario', "text2": 'La demanda sanitaria se ha realizado superando un tiempo máximo preestablecido', "action": 'el sistema sigue funcionando con prestaciones deficientes', "comment": 'No se satisface la producción de agua caliente sanitaria en el tiempo preestablecido (5 horas)'},
-    178: {"text1": 'Ciclo antilegionela sin éxito', "text2": 'El ciclo de antilegionela no se ha concluido con éxito dentro de un tiempo preestablecido', "action": 'Presione el pulsador de Reset', "comment": 'El ciclo antilegionela se ejecuta sin éxito en el plazo de tiempo preestablecido (3 horas)'},
-    179: {"text1": 'Anomalía en la sonda líquida', "text2": 'La sonda de la fase líquida está fuera de rango.', "action": 'El sistema no arranca. Llamar a una empresa autorizada (por ejemplo el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda en la fase líquida.'},
-    181: {"text1": 'Pérdida de la comunicación con el mando remoto zona 2', "text2": 'No existe comunicación entre tarjeta y remoto zona 2.', "action": 'Corte y vuelva a activar la tensión que alimenta el módulo hidrónico. Si al encender no se detecta el mando a distancia, el sistema pasa al modo de funcionamiento local, es decir, utilizando los mandos presentes en el panel de mandos. En este caso, no es posible activar la función “Calefacción”', "comment": 'Se produce en caso de una conexión a un mando a distancia no compatible, o bien en caso de problemas de comunicación entre el módulo hidrónico y el CARV2 de la segunda zona'},
-    182: {"text1": 'Alarma unidad motocondensadora', "text2": 'Si se produce una alarma en la unidad motocondensadora', "action": 'El sistema no funciona; consulte la anomalía en la unidad motocondensadora y el manual de instrucciones específico', "comment": 'El sistema señala una anomalía en la unidad motocondensadora'},
-    183: {"text1": 'Alarma unidad motocondensadora en testmode', "text2": 'La unidad motocondensadora se encuentra en el modo TESTMODE', "action": 'Durante esta fase no es posible satisfacer las demandas de climatización del ambiente y de producción de agua caliente sanitaria', "comment": 'El sistema señala que la unidad motocondensadora está en fase test mode'},
-    184: {"text1": 'Alarma timeout comunicación con unidad externa', "text2": 'Bloqueo de comunicación con la unidad motocondensadora', "action": 'Encargue la comprobación de la conexión eléctrica entre las unidades', "comment": 'Se señala la anomalía por un problema de comunicación entre la unidad interna y la motocondensadora'},
-    185: {"text1": 'Alarma de comunicación safety module', "text2": 'Pérdida de comunicación con safety –module', "action": 'Proceda a comprobar la conexión entre los componentes', "comment": 'Problema en la comunicación entre la tarjeta de regulación y la tarjeta de encendido'},
-    186: {"text1": 'Anomalía de alta tensión del encendedor', "text2": 'Safety module: se ha producido una anomalía en la tensión del encendedor', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'El sistema señala una anomalía en la tarjeta de encendido'},
-    187: {"text1": 'Alarma sonda retorno unidad motocondensadora', "text2": 'La sonda de retorno de la unidad motocondensadora está fuera de rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda NCT de retorno de la bomba de calor'},
-    188: {"text1": 'Demanda fuera de rango de funcionamiento', "text2": 'La demanda realizada no se ejecuta porque las condiciones externas no permiten la activación de la unidad motocondensadora', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Hay una demanda de calefacción o enfriamiento con una temperatura exterior fuera de los límites de funcionamiento'},
-    189: {"text1": 'Alarma timeout comunicación con tarjeta de comunicación', "text2": 'Pérdida de comunicación con tarjeta de comunicación x unidad motocondensadora', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'Si hay un corte de la comunicación entre las tarjetas electrónicas, el sistema señala la anomalía'},
-    191: {"text1": 'Corte de comunicación RF hacia CAR v2 RF zona 2', "text2": 'Se ha interrumpido la comunicación entre la base de transmisión y CAR v2 RF de la zona 2', "action": 'Compruebe el funcionamiento del CAR Wireless, y la carga de las baterías (vea el correspondiente manual de instrucciones)', "comment": 'En caso de caída de comunicación entre unidad interna y CAR versión Wireless de la segunda zona se señala la anomalía, a partir de este momento se puede controlar el sistema solo mediante el panel de mandos de la unidad interna'},
-    192: {"text1": 'Anomalía sonda impulsión unidad motocondensadora', "text2": 'La sonda de impulsión de la unidad motocondensadora está fuera de rango', "action": 'Si el bloqueo o la anomalía continúan, es necesario llamar a una empresa habilitada (por ejemplo, el Servicio de Asistencia Técnica Immergas).', "comment": 'La tarjeta detecta una anomalía en la sonda NCT de ida de la bomba de calor'},
-    193: {"text1": 'Aparato en test mode', "text2": 'El aparato se controla con un dispositivo externo mediante protocolo Opentherm', "action": 'El sistema sigue funcionando correctamente', "comment": 'El sistema señala que el aparato está en fase test mode'},
-    194: {"text1": 'Audax Pro desactivada', "text2": 'La unidad motocondensadora Audax Pro se ha desactivado', "action": 'El sistema sigue funcionando correctamente', "comment": 'El sistema señala que la unidad motocondensadora ha sido deshabilitada a través de la oportuna entrada en la regleta de bornes'},
-    195: {"text1": 'Anomalía baja temp. fase líquida ', "text2": 'La temp. de la sonda fase líquida es demasiado baja ', "action": 'Compruebe que el circuito frigorífico funcione correctamente', "comment": 'Se detecta una temperatura demasiado baja en la fase líquida'},
-    196: {"text1": 'Bloqueo temp. impulsión elevada', "text2": 'Se detecta una temperatura demasiado elevada en el circuito de retorno de la bomba de calor', "action": 'Compruebe que el circuito frigorífico funcione correctamente', "comment": 'Se detecta una temperatura demasiado elevada en el circuito de impulsión de la bomba de calor'},
-}
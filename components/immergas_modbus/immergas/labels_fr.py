@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: fr)"""
-
-immergas_labels = {
-    'default': {"text1": 'Anomalie générique non reconnue', "text2": 'Vérifier le tableau des erreurs ou la carte sélectionnée', "action": 'Vérifier le tableau des erreurs ou la carte sélectionnée', "comment": 'Aucune note à cet égard'},
-    0: {"text1": 'SYSTÈME OK', "text2": 'Système fonctionnant correctement', "action": 'Aucune action requise,', "comment": 'Aucune anomalie'},
-    1: {"text1": 'Blocage allumage raté', "text2": "Non-détection de la flamme au terme de la dernière tentative d'allumage", "action": 'Presser le bouton de Réinitialisation', "comment": "En cas de demande de chauffage ambiant ou de production d’eau chaude sanitaire, la chaudière ne s'allume pas dans le temps préétabli. Au premier allumage ou après une inactivité prolongée de l'appareil, il peut être nécessaire d'intervenir pour l'élimination du blocage."},
-    2: {"text1": 'Blocage du thermostat de sécurité (surchauffe)', "text2": 'Intervention du thermostat de sécurité', "action": 'Presser le bouton de Réinitialisation', "comment": "Pendant le régime de fonctionnement normal, si, à cause d'une anomalie, une surchauffe interne excessive a lieu, la chaudière se met en blocage."},
-    3: {"text1": 'Blocage thermostat de fumées', "text2": 'Intervention thermostat de fumées', "action": 'Presser le bouton de Réinitialisation (versions Nike)/ Configurer correctement le paramètre P.14. Si nécessaire, appuyer sur le bouton de réinitialisation (versions Star)', "comment": "Pendant le régime de fonctionnement normal, si, à cause d'une anomalie, une surchauffe excessive des fumées a lieu, la chaudière se met en blocage (versions Nike)/ Configuration erronée du paramètre P.14 (version Star)"},
-    4: {"text1": 'Blocage résistance contacts', "text2": 'Anomalie détectée sur le circuit de pilotage de la vanne du gaz', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": "La carte électronique relève une anomalie sur l'alimentation de la vanne du gaz. Vérifier le raccordement de celle-ci. (l'anomalie est relevée et affichée seulement sur demande)."},
-    5: {"text1": 'Anomalie sonde refoulement', "text2": 'Les sondes de refoulement offre une valeur résistive en dehors de la plage', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte relève une anomalie sur la sonde NTC refoulement.'},
-    6: {"text1": 'Anomalie sonde sanitaire', "text2": 'La sonde sanitaire offre une valeur résistive hors plage', "action": "La chaudière continue à produire de l'eau chaude sanitaire mais avec des prestations non optimales. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte relève une anomalie sur la sonde NTC sanitaire.'},
-    8: {"text1": 'Nombre maximum de réinitialisations', "text2": 'Indique qu’on a atteint le nombre maximum de réinitialisations autorisées par la carte intégrée', "action": "Attention : il est possible de rétablir l'anomalie 5 fois de suite, après ceci la fonction est inhibée pour au moins une heure et on gagne une tentative chaque heure avec un maximum de 5 tentatives. En coupant et en remettant l'alimentation à l'appareil, on retrouve les 5 tentatives.", "comment": 'Nombre de réinitialisations disponibles déjà exécutées.'},
-    10: {"text1": 'Pression installation insuffisante', "text2": 'Le contact du pressostat de l’installation est ouvert', "action": "Vérifier sur le manomètre de chaudière que la pression de l'installation soit comprise entre 1÷1,2 bar et éventuellement rétablir la pression correcte.", "comment": "Une pression de l'eau à l'intérieur du circuit de chauffage suffisante pour garantir le fonctionnement correct de la chaudière n'a pas été détectée."},
-    11: {"text1": 'Anomalie du pressostat de fumées', "text2": 'Possible anomalie sur le pressostat de fumées ou sur le ventilateur', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'Si les conditions de fonctionnement normales sont rétablies la chaudière redémarre sans devoir être réinitialisée'},
-    12: {"text1": 'Anomalie de la sonde du chauffe-eau', "text2": 'La sonde du bouilleur offre une valeur résistive hors plage', "action": "La chaudière ne peut pas produire d'eau chaude sanitaire. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte relève une anomalie sur la sonde du chauffe-eau'},
-    13: {"text1": 'Mesureur de débit air/fumées hors plage', "text2": 'Le signal air/fumées est hors plage ou avec le ventilateur à l’arrêt, le contrôle air/fumées lit un signal trop élevé', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Avec le ventilateur à l’arrêt, le contrôle air/fumées lit un signal trop élevé (contacts du pressostat collés)'},
-    15: {"text1": 'Erreur configuration', "text2": 'La carte reconnaît une incohérence entre sa configuration et les signaux en entrée', "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée. Vérifier que la chaudière soit correctement configurée. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte détecte une anomalie ou une incohérence sur le câblage électrique de la chaudière, elle ne part pas.'},
-    16: {"text1": 'Anomalie ventilateur', "text2": "Le ventilateur tourne lorsqu’il n'est pas alimenté ou bien est arrêté lorsqu’il est alimenté", "action": "Appuyer sur le bouton Reset (Réinitialisation).. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": ' Se vérifie lorsque le ventilateur a une panne mécanique ou électronique.'},
-    17: {"text1": 'Vitesse du ventilateur incorrecte', "text2": 'Le nombre de tours du ventilateur est hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Nombre de tours du ventilateur incorrect'},
-    20: {"text1": 'Blocage flamme parasite', "text2": 'Détection de la flamme anormale', "action": "Appuyer sur le bouton Reset (Réinitialisation).. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": "Se vérifie en cas de dispersion du circuit de détection ou d'anomalie du contrôle de la flamme."},
-    23: {"text1": 'Anomalie sonde de retour', "text2": 'Les sondes de retour offre une valeur résistive en dehors de la plage', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte relève une anomalie sur la sonde NTC refoulement.'},
-    24: {"text1": ' Anomalie boîtier de commande', "text2": 'Une pression continue est donnée sur les boutons du tableau de bord', "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte relève une anomalie sur le tableau de commande.'},
-    25: {"text1": 'Blocage sonde fumées / bloc CRC (TERA)', "text2": 'Température des fumées hors plage / mémoire corrompue (TERA)', "action": 'Appuyer sur le bouton de Reset (Réinitialisation)', "comment": 'Gradient de fumées élevé, probable blocage du circulateur ou manque d’eau / mémoire corrompue'},
-    27: {"text1": 'Circulation insuffisante', "text2": 'Surchauffe de la chaudière due à une mauvaise circulation dans le circuit primaire', "action": 'Appuyer sur le bouton Reset (Réinitialisation)', "comment": "S’assurer qu'il n’y ait pas d’interceptions sur le circuit de chauffage et/ou vérifier le bon fonctionnement du circulateur"},
-    28: {"text1": 'Fuite circuit sanitaire', "text2": "Si, pendant le fonctionnement en phase chauffage, une hausse de la température de l'eau sanitaire se produit, la chaudière signale l'anomalie et réduit la température de chauffage pour limiter la formation de calcaire dans l'échangeur.", "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": "Contrôler que tous les robinets de l'installation sanitaire sont fermés ou qu'il n'y a pas de fuites, et vérifier aussi qu'il n'y a pas de fuites dans l'installation. La chaudière revient à son fonctionnement normal une fois que les conditions optimales sont rétablies sur l'installation sanitaire"},
-    29: {"text1": 'Anomalie sonde fumées', "text2": 'La sonde des fumées offre une valeur résistive hors plage', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'La carte relève une anomalie sur la sonde des fumées.'},
-    31: {"text1": 'Perte de communication avec le CARV2', "text2": "Il n'y a pas de communication entre la carte et à distance", "action": "Couper et remettre le courant à la chaudière. Si au rallumage la Commande à Distance n'est pas détectée, la chaudière passe en mode de fonctionnement en local, donc en utilisant les commandes présentes sur le panneau de commandes. Dans ce cas, il est possible d'activer la fonction « Chauffage ».", "comment": "Cela a lieu en cas de branchement à un contrôle à distance non compatible, ou bien en cas de l'interruption de la communication entre la chaudière et CARV2."},
-    32: {"text1": 'Anomalie sonde Zone 2 basse température', "text2": 'Sonde de refoulement zone 2 hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'La carte détecte une anomalie sur la sonde zone 2 basse température, le système ne peut pas fonctionner dans la zone concernée'},
-    33: {"text1": 'Anomalie sonde Zone 3 basse température', "text2": 'Sonde de refoulement zone 3 hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'La carte détecte une anomalie sur la sonde zone 2 basse température, le système ne peut pas fonctionner dans la zone concernée'},
-    36: {"text1": 'Chute communication IMG Bus', "text2": 'Perte de communication sur le protocole IMG Bus.', "action": 'La chaudière ne satisfait pas les demandes de chauffage.', "comment": "À cause d'une anomalie sur la centrale de la chaudière, sur la carte à zones (en option) ou sur l’IMG Bus, la communication s’interrompt entre les divers composants."},
-    37: {"text1": "Basse tension d'alimentation", "text2": "La tension d'alimentation de la carte a des valeurs inférieures aux limites autorisées.", "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée.", "comment": "Elle se produit si la tension d'alimentation est inférieure aux limites autorisées pour le fonctionnement correct de la chaudière."},
-    38: {"text1": 'Perte signal de flamme', "text2": 'La carte, après avoir enclenché une valeur correcte de courant de flamme, signale une chute du courant de flamme.', "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée.", "comment": "Ceci a lieu si la chaudière est allumée correctement et que la flamme du brûleur s'éteint subitement ; une nouvelle tentative d'allumage est effectuée et si les conditions normales sont rétablies, la chaudière n'a pas besoin d'être réinitialisée."},
-    39: {"text1": 'Anomalie sonde collecteur solaire', "text2": 'La sonde externe offre une valeur résistive hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": "La carte détecte une anomalie sur la sonde du collecteur solaire, la chaudière continue de fonctionner régulièrement sans l'apport d'énergie solaire pour le chauffage de l'eau chaude sanitaire car la pompe solaire cesse de fonctionner"},
-    40: {"text1": 'Anomalie sonde cumulus solaire', "text2": 'La sonde cumulus solaire offre une valeur résistive hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": "La carte détecte une anomalie sur la sonde cumulus solaire, la chaudière continue de fonctionner régulièrement sans l'apport d'énergie solaire pour le chauffage de l'eau chaude sanitaire car la pompe solaire cesse de fonctionner."},
-    41: {"text1": 'Température élevée sur collecteur solaire', "text2": 'Le collecteur solaire a dépassé la température maximale configurée', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Cela se produit quand la température du collecteur solaire dépasse la limite maximale configurée'},
-    42: {"text1": 'Température élevée sur cumulus solaire', "text2": 'Le cumulus solaire a dépassé la température maximale configurée', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Cela se produit quand la température de l’eau dans le cumulus solaire dépasse la limite maximum configurée.'},
-    43: {"text1": 'Blocage pour perte du signal de la flamme', "text2": 'Perte du signal de la flamme en fonctionnement à régime plusieurs fois consécutives.', "action": 'Presser le bouton de Réinitialisation, la chaudière avant de repartir, effectue un cycle de post-ventilation.', "comment": "Se vérifie lorsque l'erreur « Pertes de signal de la flamme » se produit plusieurs fois de suite dans l'arc de temps préétabli."},
-    44: {"text1": "Blocage pour dépassement de l'accumulation du temps maximum des ouvertures rapprochées de la soupape du gaz", "text2": "L'accumulation du temps total d'ouverture de la vanne du gaz sans détection de la flamme est supérieure au maximum autorisé.", "action": 'Appuyer sur le bouton Reset (Réinitialisation)..', "comment": "Se vérifie si la soupape de gaz reste ouverte pour une durée supérieure à celle prévue pour son fonctionnement normal sans que la chaudière s'allume."},
-    45: {"text1": 'dT élevé', "text2": 'La différence de température mesurée entre le refoulement et le retour est ≥ à 40°C.', "action": "La puissance du brûleur est limitée pour prévenir d'éventuels dommages au module à condensation, après avoir rétabli le dT correct, la chaudière fonctionne à nouveau normalement. Vérifier qu'il y ait une circulation d'eau dans la chaudière, que le circulateur soit configuré selon les exigences de l'installation et le fonctionnement correct de la sonde de retour.", "comment": "La chaudière relève une élévation subite et non prévue du dT entre la sonde de refoulement et la sonde de retour de l'installation."},
-    46: {"text1": 'Intervention thermostat basse température / Configuration erronée du câblage/carte', "text2": 'Le thermostat de sécurité situé sur le raccordement du refoulement de la chaudière à DIM v2 (fonctionnant uniquement à Basse Température) a atteint es températures élevées. / Erreur de câblage ou mauvaise utilisation de la carte de rechange', "action": 'Dans ce cas, après un refroidissement approprié, il est possible de réinitialiser le thermostat (voir le mode d’emploi correspondant). / Si le blocage ou l’anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d’assistance technique Immergas).', "comment": "Pendant le régime normal de fonctionnement, si à cause d'une anomalie on vérifie une surchauffe importante de la température de refoulement en basse température, la chaudière se met en état de blocage. / Erreur de câblage ou mauvaise utilisation de la carte de rechange"},
-    47: {"text1": 'Limitation de puissance brûleur', "text2": 'Si la température des fumées atteint une valeur élevée, la carte réduit la puissance produite par le brûleur, afin de limiter des dommages au circuit des fumées.', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'Si une température élevée des fumées est relevée, la chaudière réduit la puissance débitée pour ne pas être endommagée.'},
-    48: {"text1": 'Anomalie sonde de refoulement côté installation', "text2": 'La sonde de refoulement côté installation offre une valeur résistive hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": "En cas de sonde de refoulement côté installation ou non reliée ou en panne, l'anomalie est signalée"},
-    49: {"text1": 'Blocage température élevée sur sonde de retour', "text2": 'Température mesurée par la sonde de retour élevée', "action": 'Vérifier la correcte circulation dans la chaudière et le bon fonctionnement de la vanne trois voies.', "comment": "Cela se vérifie lorsque l’on atteint une température trop élevée sur le circuit de retour de l'échangeur"},
-    50: {"text1": 'Anomalie sonde externe', "text2": 'La sonde externe offre une valeur résistive hors plage', "action": 'Vérifier le raccordement de la sonde externe.. Le système continue de fonctionner', "comment": "En cas de sonde externe non reliée ou en panne, l'anomalie est signalée"},
-    51: {"text1": 'Perte de la communication avec CAR Sans fil', "text2": 'La communication entre la base émettrice et le CAR v2 RF a cessé.', "action": "Vérifier le fonctionnement du CAR Sans fil, vérifier la charge des batteries (voir le mode d'emploi correspondant).", "comment": "En cas de perte de communication entre la chaudière et CAR version Sans fil, l'anomalie est signalée, à partir de cet instant on ne peut contrôler le système qu'à travers le tableau de commande de la chaudière."},
-    54: {"text1": 'Anomalie de la sonde du ballon tampon (puffer)', "text2": 'La sonde du ballon tampon (puffer) offre une valeur résistive hors plage', "action": 'La modalité ballon tampon (puffer) est désactivée', "comment": "En cas de sonde du ballon tampon (puffer) non reliée ou en panne, l'anomalie est signalée"},
-    55: {"text1": 'Anomalie de la sonde de température de refoulement Zone 1', "text2": 'La sonde de refoulement zone 1 offre une valeur résistive hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'La carte détecte une anomalie sur la sonde zone 1 basse température, le système ne peut pas fonctionner dans la zone concernée.'},
-    58: {"text1": 'Anomalie Audax', "text2": 'Signalisation d’anomalie de la part de la pompe à chaleur AUDAX reliée au système', "action": 'La pompe à chaleur ne satisfait pas les demandes de chauffage et de refroidissement ambiant, après avoir rétablis les raccordements, il faut éteindre et rallumer le système', "comment": "Anomalie sur la pompe à chaleur Audax, vérifier le type d'anomalie directement sur l’écran de la pompe à chaleur"},
-    59: {"text1": "Blocage fréquence réseau d'alimentation électrique", "text2": "La carte électronique a relevé une fréquence anormale sur le réseau d'alimentation électrique.", "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": "La carte relève une fréquence anormale sur l'alimentation du réseau électrique."},
-    60: {"text1": 'Anomalie circulateur bloqué', "text2": 'Le circulateur modulant est arrêté.', "action": "Essayer de débloquer le circulateur comme décrit dans le paragraphe correspondant. En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée.", "comment": 'Le circulateur est arrêté pour une des causes suivantes : roue bloquée, panne électrique.'},
-    61: {"text1": "Présence d'air dans le circulateur", "text2": "Le circulateur modulant est arrêté à cause d'un fonctionnement en air relevé.", "action": "Purger le circulateur et le circuit de chauffage. En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée.", "comment": "De l'air est détecté à l'intérieur du circulateur ; ce dernier ne peut pas fonctionner."},
-    62: {"text1": 'Demande réglage complet', "text2": "La carte n'a pas la bonne configuration des paramètres de contrôle de la combustion.", "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": "L'absence de réglage de la carte électronique est relevée. Cela peut se vérifier en cas de remplacement de la carte électronique ou en cas de variation des paramètres dans la section air/gaz, c'est pourquoi le « réglage complet » est nécessaire."},
-    63: {"text1": 'Anomalie sonde retour installation', "text2": 'La sonde de retour offre une valeur résistive hors plage', "action": 'La chaudière continue de fonctionner sans aucune intégration des systèmes externes reliés', "comment": "En cas de sonde de retour non reliée ou en panne, l'anomalie est signalée"},
-    67: {"text1": "Anomalie pressostat de l'installation solaire", "text2": 'Pressostat installation ouvert, manque de fluide possible', "action": 'Vérifier sur le manomètre du groupe de circulation solaire que la pression soit à la valeur correcte', "comment": "À cause d'une baisse de la pression dans le circuit solaire, le pressostat bloque le fonctionnement du circuit solaire thermique"},
-    70: {"text1": 'Sondes inversées', "text2": "En cas d’erreur dans le raccordement du câblage de la chaudière, l'erreur est relevée", "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas.", "comment": 'Vérifier le raccordement de la sonde de refoulement et de retour'},
-    72: {"text1": 'Demande réglage rapide', "text2": "La carte n'a pas la bonne configuration de certains paramètres de contrôle de la combustion.", "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": "La modification de quelques paramètres est relevée, c'est pourquoi le « réglage rapide » est nécessaire."},
-    73: {"text1": 'Éloignement élevé de la sonde de refoulement et de la sonde de refoulement de sécurité relevé', "text2": 'Les sondes de refoulement présentent un éloignement élevé.', "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée", "comment": "La carte relève une anomalie dans la lecture des températures des sondes NTC de refoulement et les causes peuvent être : sonde défectueuse, positionnement incorrect, mauvaise circulation dans l'installation, engorgement côté eau de l'échangeur primaire."},
-    74: {"text1": 'Anomalie de la sonde de refoulement de sécurité', "text2": 'Les sondes de refoulement de sécurité offre une valeur résistive en dehors de la plage.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'La carte relève une anomalie sur la sonde NTC de sécurité.'},
-    75: {"text1": 'Blocage pour capteur NTC endommagé', "text2": 'Rupture possible d’une ou des deux sondes de refoulement et de retour de l’installation', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas.", "comment": 'Le capteur de la sonde de sécurité provoque un gradient de température élevé'},
-    76: {"text1": 'Dérive sonde refoulement ou sonde retour', "text2": 'Un dysfonctionnement d’une ou des deux sondes de refoulement et de retour de l’installation est relevé', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'Différence supérieure par rapport à celle configurée entre la sonde de refoulement et de retour en cas de demande de chaleur'},
-    77: {"text1": 'Anomalie du contrôle de la combustion', "text2": 'Courant relevé de la vanne du gaz en dehors de la plage.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'Un courant hors plage est relevé sur la soupape du gaz.'},
-    78: {"text1": 'Anomalie du contrôle de la combustion', "text2": 'Courant relevé de la vanne du gaz élevé.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'Un courant élevé est relevé sur la soupape du gaz.'},
-    79: {"text1": 'Anomalie du contrôle de la combustion', "text2": 'Courant relevé de la vanne du gaz bas.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'Un courant réduit est relevé sur la soupape du gaz.'},
-    80: {"text1": 'Blocage dysfonctionnement carte électronique', "text2": 'Panne relevée sur le pilote de la vanne du gaz électronique à cause de problèmes sur la carte ou vanne du gaz.', "action": 'Presser le bouton de Réinitialisation', "comment": 'Cela se vérifie en cas de dysfonctionnement de la carte électronique qui contrôle la soupape.'},
-    84: {"text1": 'Anomalie combustion - réduction de la puissance en cours', "text2": "Conditions assimilables à une basse pression d'alimentation de la vanne du gaz relevées.", "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée", "comment": "Une basse pression d'alimentation est relevée sur le réseau du gaz. Par conséquent, la puissance de l'appareil est limitée et l'anomalie est signalée."},
-    85: {"text1": 'Blocage problème post-combustion', "text2": 'Problème potentiel vanne du gaz, électrode ou carte électronique', "action": "Appuyer sur le bouton Reset (Réinitialisation).. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'Assistance Technique Immergas)", "comment": 'Flamme présente après la fermeture de la soupape gaz'},
-    87: {"text1": 'Blocage contrôle soupape gaz', "text2": 'Panne relevée sur le contrôle de la vanne du gaz.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": "Le dysfonctionnement de l'un des composants qui contrôlent la soupape du gaz est relevé."},
-    88: {"text1": 'Blocage contrôle soupape gaz', "text2": 'Panne relevée sur le contrôle de la vanne du gaz.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": "Le dysfonctionnement de l'un des composants qui contrôlent la soupape du gaz est relevé."},
-    89: {"text1": 'Signal combustion instable', "text2": 'Instabilité relevée sur le signal de combustion.', "action": 'La chaudière continue de fonctionner.', "comment": "La flamme est instable à cause : de la recirculation des fumées, du vent, de la pression du gaz instable, de la vitesse instable du  ventilateur ou bien à cause d'un dysfonctionnement du système."},
-    90: {"text1": 'Signal combustion hors limite', "text2": 'Signal de combustion relevé hors limite.', "action": 'La chaudière continue de fonctionner.', "comment": 'Le signal de combustion est relevé en dehors de la plage de réglage prévu pour un temps prolongé.'},
-    91: {"text1": 'Blocage allumage incorrect', "text2": 'La carte a épuisé toutes ses actions possibles pour avoir un allumage optimal du brûleur.', "action": 'Presser le bouton de Réinitialisation', "comment": 'La carte a épuisé toutes ses actions possibles pour obtenir un allumage optimal du brûleur.'},
-    92: {"text1": 'Limite correction tours ventilateur', "text2": 'La carte a atteint la correction maximum des tours du ventilateur.', "action": 'La chaudière continue de fonctionner.', "comment": 'Le système a épuisé toutes les corrections possibles du nombre de tours du ventilateur.'},
-    93: {"text1": 'Signal combustion hors limite', "text2": 'Signal de combustion relevé hors limite.', "action": 'La chaudière continue de fonctionner.', "comment": 'Le signal de combustion est relevé en dehors de la plage de réglage prévu pour un temps prolongé.'},
-    94: {"text1": 'Anomalie combustion', "text2": 'Problème de combustion relevé, causé par le système ou contrôle de la combustion.', "action": "En cas de rétablissement des conditions normales, la chaudière repart sans la nécessité d'être réinitialisée.", "comment": 'Un problème sur le contrôle de la combustion est relevé, il peut être causé par : pression du gaz basse, recirculation des fumées, vanne du gaz ou carte électronique défectueuse.'},
-    95: {"text1": 'Signal combustion discontinu', "text2": 'Discontinuité relevée sur le signal de combustion à cause de problèmes sur des connexions électriques ou dispersion du signal.', "action": 'La chaudière continue de fonctionner.', "comment": 'Le système relève une discontinuité dans le signal de combustion.'},
-    96: {"text1": 'Fumisterie obstruée', "text2": 'Obstruction élevée relevée sur la fumisterie.', "action": "La chaudière ne part pas. Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le service d'assistance technique Immergas)", "comment": 'Cela se vérifie si une obstruction est relevée dans le système de fumée.'},
-    98: {"text1": 'Blocage nb maximum erreurs logiciel', "text2": 'La carte électronique ne fonctionne pas correctement.', "action": 'Presser le bouton de Réinitialisation', "comment": "Le nombre maximum d'erreurs logiciel admis a été atteint."},
-    99: {"text1": 'Blocage générique', "text2": 'La carte électronique ne fonctionne pas correctement.', "action": 'Presser le bouton de Réinitialisation', "comment": 'Une anomalie est relevée dans la chaudière.'},
-    101: {"text1": 'Alarme hors ligne Audax', "text2": 'Perte de communication avec la pompe à chaleur', "action": 'La pompe à chaleur ne satisfait pas les demandes de chauffage et de refroidissement ambiant, après avoir rétablis les raccordements, il faut éteindre et rallumer le système', "comment": "En cas de perte de communication, de raccordement erroné ou si la pompe à chaleur est éteinte, l'électronique de la chaudière ne détecte pas la pompe à chaleur"},
-    102: {"text1": 'Alarme hors ligne expansion zone 1', "text2": 'Perte de communication avec expansion zone 1', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Anomalie de communication avec zone 1'},
-    103: {"text1": 'Alarme hors ligne expansion zone 2', "text2": 'Perte de communication avec expansion zone 2', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Anomalie communication avec zone 2'},
-    104: {"text1": 'Alarme hors ligne expansion zone 3', "text2": 'Perte de communication avec expansion zone 3', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Anomalie communication avec zone 3'},
-    106: {"text1": 'Alarme sonde sanitaire ', "text2": 'En cas d’intégration avec une chaudière et une gestion séparée du sanitaire, la sonde bouilleur contrôlée par l’opérateur offre une valeur résistive hors plage', "action": "Le système ne peut pas produire d’eau chaude avec la pompe à chaleur. La production d'eau chaude sanitaire est garantie par la chaudière", "comment": 'La carte relève une anomalie sur la sonde du chauffe-eau'},
-    120: {"text1": 'Alarme point de consigne élevé pour déshumidification zone 1', "text2": 'Le point de consigne calculé de demande zone 1 est trop élevé pour une déshumidification', "action": 'Le point de consigne de refoulement est supérieur à la limite admise par déshumidificateur. Rafraîchir l’environnement et attendre que la température de rosée revienne à des valeurs acceptables', "comment": 'Le point de consigne de refroidissement calculé pour la déshumidification est supérieur à la limite configurée dans la zone 1'},
-    121: {"text1": 'Alarme hors ligne du dispositif de zone 1', "text2": 'La commande à distance ou le contrôle de la zone 1 est hors ligne', "action": 'Vérifier que le contrôle à distance soir allumé', "comment": "La communication avec le contrôle de zone n'est pas détectée. Il est impossible d'effectuer la thermorégulation de la zone"},
-    122: {"text1": 'Alarme hors ligne du dispositif de zone 2', "text2": 'La commande à distance ou le contrôle de la zone 2 est hors ligne', "action": 'Vérifier que le contrôle à distance soir allumé', "comment": "La communication avec le contrôle de zone n'est pas détectée. Il est impossible d'effectuer la thermorégulation de la zone"},
-    123: {"text1": 'Alarme hors ligne du dispositif de zone 3', "text2": 'La commande à distance ou le contrôle de la zone 3 est hors ligne', "action": 'Vérifier que le contrôle à distance soir allumé', "comment": "La communication avec le contrôle de zone n'est pas détectée. Il est impossible d'effectuer la thermorégulation de la zone"},
-    125: {"text1": 'Anomalie de la sonde de température ambiante zone 1', "text2": 'La sonde de température ambiante de la zone 1 est hors plage', "action": "Outre la température, le point de rosée n'est pas calculé pour la zone n’est pas calculé", "comment": "Anomalie présente sur la sonde de température ambiante zone 1 (en option). Il est impossible d'effectuer la thermorégulation de la zone"},
-    126: {"text1": 'Anomalie de la sonde de température ambiante zone 2', "text2": 'La sonde de température ambiante de la zone 2 est hors plage', "action": "Outre la température, le point de rosée n'est pas calculé pour la zone n’est pas calculé", "comment": "Anomalie présente sur la sonde de température ambiante zone 2 (en option). Il est impossible d'effectuer la thermorégulation de la zone"},
-    127: {"text1": 'Anomalie sonde de température ambiante zone 3', "text2": 'La sonde de température ambiante de la zone 3 est hors plage', "action": "Outre la température, le point de rosée n'est pas calculé pour la zone n’est pas calculé", "comment": "Anomalie présente sur la sonde de température ambiante zone 3 (en option). Il est impossible d'effectuer la thermorégulation de la zone"},
-    129: {"text1": "Anomalie sonde d'humidité zone 1", "text2": 'La sonde d’humidité ambiante de la zone 1 est hors plage', "action": "Outre l'humidité, le point de rosée n'est pas calculé pour la zone", "comment": "Anomalie présente sur la sonde d'humidité zone 1 (en option). Il est impossible d'effectuer le contrôle de l'humidité de la zone"},
-    130: {"text1": "Anomalie sonde d'humidité zone 2", "text2": 'La sonde d’humidité ambiante de la zone 2 est hors plage', "action": "Outre l'humidité, le point de rosée n'est pas calculé pour la zone", "comment": "Anomalie présente sur la sonde d'humidité zone 2 (en option). Il est impossible d'effectuer le contrôle de l'humidité de la zone"},
-    131: {"text1": "Anomalie sonde d'humidité zone 3", "text2": 'La sonde d’humidité ambiante de la zone 3 est hors plage', "action": "Outre l'humidité, le point de rosée n'est pas calculé pour la zone", "comment": "Anomalie présente sur la sonde d'humidité zone 3 (en option). Il est impossible d'effectuer le contrôle de l'humidité de la zone"},
-    132: {"text1": 'Alarme point de consigne élevé pour déshumidification zone 2', "text2": 'Le point de consigne calculé de demande zone 2 est trop élevé pour une déshumidification', "action": 'Le point de consigne de refoulement est supérieur à la limite admise par déshumidificateur. Rafraîchir l’environnement et attendre que la température de rosée revienne à des valeurs acceptables', "comment": 'Le point de consigne de refroidissement calculé pour la déshumidification est supérieur à la limite configurée dans la zone 2'},
-    133: {"text1": 'Alarme panne du déshumidificateur zone 1', "text2": 'Le déshumidificateur de la zone 1 est en état d’alarme', "action": "Le système n'effectue pas la déshumidification dans la zone correspondante", "comment": 'Anomalie provenant du déshumidificateur (en option) sur la zone 1'},
-    134: {"text1": 'Alarme panne du déshumidificateur zone 2', "text2": 'Le déshumidificateur de la zone 2 est en état d’alarme', "action": "Le système n'effectue pas la déshumidification dans la zone correspondante", "comment": 'Anomalie provenant du déshumidificateur (en option) sur la zone 2'},
-    135: {"text1": 'Alarme panne du déshumidificateur zone 3', "text2": 'Le déshumidificateur de la zone 3 est en état d’alarme', "action": "Le système n'effectue pas la déshumidification dans la zone correspondante", "comment": 'Anomalie provenant du déshumidificateur (en option) sur la zone 3'},
-    137: {"text1": 'Alarme système restauré - Redémarrer le système', "text2": 'Après une opération de restauration, qui est exécutée par le panneau de commandes, une alarme est signalée car il faut redémarrer le système', "action": 'Éteindre et rallumer le système', "comment": 'Après la restauration des paramètres par défaut, le système doit redémarrer'},
-    138: {"text1": 'Chauffe-dalle en cours', "text2": 'Fonction de chauffe-dalle en cours', "action": '', "comment": ''},
-    139: {"text1": 'Désaération en cours', "text2": 'Fonction de désaération en cours', "action": '', "comment": ''},
-    177: {"text1": 'Alarme temps maximum sanitaire', "text2": 'La demande sanitaire a été exécutée en dépassant un temps maximal fixé', "action": 'Le système continue de fonctionner avec des performances non optimales', "comment": "La production d'eau chaude sanitaire n'est pas satisfaite dans le délai fixé (5 heures)"},
-    178: {"text1": 'Cycle anti-légionelle sans succès', "text2": 'Le cycle de anti-légionelle n’a pas été conclu avec succès dans le délai fixé', "action": 'Appuyer sur le bouton de Reset (Réinitialisation)', "comment": 'Le cycle anti-légionelle est exécuté sans succès dans le délai fixé (3 heures)'},
-    179: {"text1": 'Anomalie de la sonde liquide', "text2": 'La sonde de la phase liquide est hors plage.', "action": 'Le système ne démarre pas. Contacter une entreprise qualifiée (par exemple, le Service Assistance Technique Immergas).', "comment": 'La carte détecte une anomalie sur la sonde de phase liquide'},
-    181: {"text1": 'Perte de communication Commande à distance zone 2', "text2": "Il n'y a pas de communication entre la carte et à distance zone 2.", "action": "Mettre hors tension le module hydronique puis le remettre sous tension. Si la Commande à Distance n'est pas détectée lors du rallumage, le système passe en mode de fonctionnement local, donc en utilisant les commandes présentes sur le panneau de commandes. Dans ce cas, il est impossible d'activer la fonction “Chauffage”", "comment": 'Cela se vérifie en cas de branchement à un contrôle à distance non compatible, ou bien en cas de chute de communication entre module hydronique et CARV2 de la deuxième zone'},
-    182: {"text1": 'Alarme du groupe de moto-condensation', "text2": 'Une alarme sur le groupe de moto-condensation se déclenche', "action": "Le système ne fonctionne pas, voir l'anomalie sur le groupe de moto-condensation et le mode d’emploi correspondant", "comment": 'Une anomalie est signalée sur le groupe de moto-condensation'},
-    183: {"text1": 'Alarme du groupe de moto-condensation en mode test', "text2": 'Le groupe de moto-condensation est en mode TESTMODE', "action": "Durant cette phase, il est impossible de satisfaire les demandes de climatisation ambiante et de production d'eau chaude sanitaire", "comment": 'Il est signalé que le groupe de moto-condensation est en phase de test'},
-    184: {"text1": 'Alarme timeout de communication avec unité externe', "text2": 'Perte de communication avec le groupe de moto-condensation', "action": 'Faire vérifier le branchement électrique entre les unités', "comment": "L'anomalie due à un problème de communication entre l’unité interne et le groupe de moto-condensation est signalée"},
-    185: {"text1": 'Alarme communication safety module (module de sécurité)', "text2": 'Perte de communication avec safety -module', "action": 'Faire vérifier le raccordement entre les composants', "comment": 'Problème dans la communication entre la carte réglage et la carte allumage.'},
-    186: {"text1": 'Anomalie haute tension allumeur', "text2": 'Safety module\xa0: une anomalie a eu lieu sur la tension de l’allumeur', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Une anomalie est signalée sur la carte allumage'},
-    187: {"text1": 'Alarme sonde retour moto-condensation', "text2": 'La sonde de retour moto-condensation est hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'La carte relève une anomalie sur la sonde NTC de retour pompe à chaleur'},
-    188: {"text1": 'Demande hors plage de fonctionnement', "text2": 'La demande effectuée n’est pas exécutée car les conditions externes ne permettent pas l’activation de la moto-condensation', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'Une demande de chauffage ou de refroidissement comportant une température extérieure hors des limites de fonctionnement est effectuée'},
-    189: {"text1": 'Alarme timeout de communication avec carte de communication', "text2": 'Perte de communication avec carte de communication pour moto-condensation', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": "L'anomalie est signalée en cas de chute de communication entre les cartes électroniques"},
-    191: {"text1": 'Chute de communication RF vers CAR v2 RF zone 2', "text2": 'La communication entre la base émettrice et le CAR v2 RF de la zone 2 a cessé', "action": "Vérifier le fonctionnement du CAR Sans fil, vérifier la charge des batteries (voir le mode d'emploi correspondant)", "comment": "En cas de chute de communication entre l’unité interne et CAR version Sans fil de la deuxième zone, l'anomalie est signalée, à partir de cet instant, il n’est possible de contrôler le système qu'à travers le tableau de commande de l’unité interne"},
-    192: {"text1": 'Anomalie sonde refoulement moto-condensation', "text2": 'La sonde de refoulement moto-condensation est hors plage', "action": "Si le blocage ou l'anomalie persiste, il faut contacter une entreprise qualifiée (par exemple, le Service d'assistance technique Immergas).", "comment": 'La carte relève une anomalie sur la sonde NTC refoulement pompe à chaleur.'},
-    193: {"text1": 'Appareil en mode test', "text2": 'L’appareil est contrôlé par un dispositif externe par protocole Opentherm', "action": 'Le système continue de fonctionner correctement', "comment": "Il est signalé que l'appareil est en phase de test"},
-    194: {"text1": 'Audax Pro désactivée', "text2": 'La moto-condensation Audax Pro a été désactivée', "action": 'Le système continue de fonctionner correctement', "comment": "Il est signalé que le groupe de moto-condensation a été désactivé par l'entrée appropriée dans le bornier"},
-    195: {"text1": 'Anomalie basse temp.  phase liquide ', "text2": 'La temp. de la sonde phase liquide est trop basse ', "action": 'Vérifier le bon fonctionnement du circuit frigorifique', "comment": 'Une température trop basse est détectée dans la phase liquide'},
-    196: {"text1": 'Blocage temp. refoulement élevée', "text2": 'Une température trop élevée est détectée sur le circuit de retour de la pompe à chaleur', "action": 'Vérifier le bon fonctionnement du circuit frigorifique', "comment": 'Une température trop élevée est détectée sur le circuit de refoulement de la pompe à chaleur'},
-}
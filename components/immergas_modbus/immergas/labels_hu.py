@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: hu)"""
-
-immergas_labels = {
-    'default': {"text1": 'Általános ismeretlen hiba', "text2": 'Ellenőrizze a hibatáblázatban vagy a kiválasztott lapon', "action": 'Ellenőrizze a hibatáblázatban vagy a kiválasztott lapon', "comment": 'Nincs kapcsolódó megjegyzés'},
-    0: {"text1": 'RENDSZER OK', "text2": 'A rendszer megfelelően működik', "action": 'Nincs szükség beavatkozásra', "comment": 'Nincs meghibásodás'},
-    1: {"text1": 'Gyújtáshiba miatti leállás', "text2": 'Nincs lángérzékelés az utolsó begyújtási kísérlet végén', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'A kazán nem kapcsolódik be az előre meghatározott idő alatt a fűtés beindításakor vagy használati melegvíz-előállításakor.  Az első bekapcsoláskor vagy hosszabb üzemen kívüli időszakot követően a leállás miatt beavatkozásra lehet szükség.'},
-    2: {"text1": 'Biztonsági határoló termosztát beavatkozása miatti leállás (túlmelegedés)', "text2": 'Működésbe lépett a biztonsági termosztát', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'A normál működés során, ha egy meghibásodás következtében túlmelegedés lép fel, a kazán leáll.'},
-    3: {"text1": 'Égéstermék hőmérséklet termosztát leállása', "text2": 'Égéstermék visszaáramlás miatti leállás', "action": 'Nyomja meg a Reset (visszaállítás) gombot. (Nike verziók)/ Konfigurálja helyesen a P.14 paramétert. Szükség esetén nyomja meg a Reset gombot (Star verziók)', "comment": 'A normál működés során, ha egy meghibásodás következtében az égéstermék túlmelegszik, a kazán leáll (Nike verziók)/ A P.14 paraméter konfigurálása hibás (Star verzió)'},
-    4: {"text1": 'Leállás az érintkezők ellenállása miatt', "text2": 'Meghibásodás a gázszelep vezérlő körében', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel hibát észlel a gázszelep ellátásánál. Ellenőrizze a szelep csatlakozását. (ezt az üzemzavart a kazán csak kérésre ellenőrzi és jeleníti meg).'},
-    5: {"text1": 'Előremenő fűtővíz érzékelő meghibásodása', "text2": 'Az előremenő fűtővíz érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást észlel az előremenő ág NTC érzékelőjében.'},
-    6: {"text1": 'Használati melegvíz érzékelő meghibásodása', "text2": 'A használati melegvíz érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'Ebben az esetben a kazán továbbra is állít elő melegvizet, de nem optimális teljesítményen. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást észlel a használati meleg víz NTC érzékelőjében.'},
-    8: {"text1": 'Maximum számú hibatörlés', "text2": 'A beépített vezérlőpanel maximálisan engedélyezett számú hibatörléseinek számát jelzi', "action": 'Figyelem: A meghibásodást egymást követően legfeljebb 5-ször oldhatja fel a Reset (törlés) gombbal, ezután a funkció egy órára kikapcsol. Az egy óra leteltével ismét próbálkozhat 5 alkalommal. Az áramellátás kikapcsolását és visszakapcsolását követően újból próbálkozhat 5-ször.', "comment": 'A rendelkezésére álló hibatörlési kísérleteket már elhasználta.'},
-    10: {"text1": 'A rendszerben a nyomás elégtelen', "text2": 'Nyitva van a rendszer nyomáskapcsolójának érintkezője ', "action": 'Ellenőrizze a kazán nyomásmérőjén, hogy a rendszer nyomása 1÷1,2 bar között van-e, és szükség esetén állítsa helyre a rendszer megfelelő nyomását.', "comment": 'A fűtési körben mért víznyomás nem elégséges a kazán megfelelő működésének biztosítására.'},
-    11: {"text1": 'Égéstermék nyomáskapcsoló meghibásodása', "text2": 'Lehetséges üzemzavar az égéstermék nyomáskapcsolón vagy a ventilátoron', "action": 'Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'Ha visszaállítja a normál működéshez szükséges feltételeket, a kazán automatikusan újraindul, nincs szükség újraindításra'},
-    12: {"text1": 'A tároló érzékelőjének meghibásodása', "text2": 'A melegvíz-tároló érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'A kazán nem tud használati melegvizet előállítani. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást észlel a tároló érzékelőjében.'},
-    13: {"text1": 'Égési levegő / égéstermék térfogatáram mérő határértéken kívüli értéket mér', "text2": 'Az égési levegő / égéstermék jel üzemi tartományon kívül van, vagy a ventilátor kikapcsolt állapotában az ellenőrzés túl magas jelet olvas le', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A ventilátor kikapcsolt állapotában az égési levegő / égéstermék ellenőrzés túl magas jelet olvas le (a nyomáskapcsoló érintkezői beragadtak)'},
-    15: {"text1": 'Konfigurációs hiba', "text2": 'A vezérlőpanel ellentmondást észlel a beállításai és a bemeneti jelek között.', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul. Ellenőrizze, hogy megfelelően-e lett-e konfigurálva a kazán. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást vagy a kazán nem megfelelő elektromos bekötését érzékeli, ezért a kazán nem indul el.'},
-    16: {"text1": 'Ventilátor hiba', "text2": 'A ventilátor forog, amikor nem kap tápfeszültséget, illetve leáll, amikor tápfeszültséget kap', "action": 'Nyomja meg a Reset (visszaállítás) gombot. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A ventilátor elektromos vagy mechanikus meghibásodását jelzi.'},
-    17: {"text1": 'Helytelen ventilátor sebesség', "text2": 'A ventilátor fordulatszáma a helyes tartományon kívül esik', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A ventilátor fordulatszáma helytelen'},
-    20: {"text1": 'Lángérzékelési hiba (parazita láng)', "text2": 'Rendellenes lángérzékelés', "action": 'Nyomja meg a Reset (visszaállítás) gombot. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'Az ellenőrző rendszer vagy a lángőr meghibásodását jelzi.'},
-    23: {"text1": 'Fűtési visszatérő érzékelőjének meghibásodása', "text2": 'Az előremenő fűtővíz visszatérő  érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást észlel az előremenő ág NTC érzékelőjében.'},
-    24: {"text1": 'Nyomógombok meghibásodása', "text2": 'A készülék a műszerfalon lévő nyomógombok folyamatos lenyomását észleli', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel a nyomógombok meghibásodását észleli.'},
-    25: {"text1": 'Égéstermék érzékelő / CRC (TERA) hiba', "text2": 'Égéstermék hőmérséklet üzemi tartományon kívül / sérült memória (TERA)', "action": 'Nyomja meg a Reset gombot', "comment": 'Az égéstermék gradiens magas, a keringtetőszivattyú valószínűleg letapadt vagy nincs víz / a memória sérült'},
-    27: {"text1": 'Elégtelen keringés', "text2": 'A primer kör nem megfelelő keringése miatt a kazán túlmelegedik', "action": 'Nyomja meg a Reset (visszaállítás) gombot', "comment": 'Ellenőrizze, hogy a fűtési kör nem akadályozott-e és/vagy ellenőrizze a keringető megfelelő működését'},
-    28: {"text1": 'Szivárgás a használati melegvíz körön', "text2": 'Ha a működés közben a fűtési szakaszban a kazán a használati meleg víz hőmérsékletének emelkedését is érzékeli, a kazán jelzi az üzemzavart, és csökkenti a fűtési hőmérsékletet, hogy a hőcserélő ne vízkövesedjen el túlságosan hamar.', "action": 'Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'Ellenőrizze, hogy a használati melegvíz rendszer csapjai zárva vannak-e, és nem szivárognak-e, majd ellenőrizze, hogy nincs-e szivárgás a rendszerben. A használati melegvíz rendszer megfelelő üzemi feltételeinek visszaállítását követően a kazán a megszokott módon üzemel tovább'},
-    29: {"text1": 'Égéstermék hőmérsékletérzékelő meghibásodása', "text2": 'Az égéstermék-érzékelő ellenállási értéke kívül esik a tartományon', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást észlel az égéstermék érzékelőjében.'},
-    31: {"text1": 'Megszakadt a kapcsolat a Mini CARV2-vel', "text2": 'Nincs párbeszéd a vezérlőpanel és a távvezérlő között.', "action": 'Szüntesse meg, majd indítsa újra a kazán áramellátását. Ha a berendezés az ismételt begyújtást követően sem érzékeli a távvezérlőt, a kazán közvetlen üzemmódba kapcsol, tehát csak a berendezés vezérlőjén elhelyezett kezelőszervek aktívak. Ebben az esetben nem lehet bekapcsolni a “fűtés” funkciót.', "comment": 'Ez akkor következhet be, ha a készüléket nem kompatibilis távvezérlőhöz csatlakoztatják, vagy ha a kazán és a CARV2 között megszűnik a kommunikáció.'},
-    32: {"text1": '2-es alacsony hőmérsékletű zóna érzékelőjének meghibásodása', "text2": 'Szonda a 2-es zóna előremenő ágán üzemi tartományon kívül', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel a 2-es alacsony hőmérsékletű zóna érzékelőjének meghibásodását érzékeli, a rendszer nem működik az érintett zónában'},
-    33: {"text1": '3-as alacsony hőmérsékletű zóna érzékelőjének meghibásodása', "text2": 'Szonda a 3-as zóna előremenő ágán üzemi tartományon kívül', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel a 2-es alacsony hőmérsékletű zóna érzékelőjének meghibásodását érzékeli, a rendszer nem működik az érintett zónában'},
-    36: {"text1": 'IMG Bus kommunikáció elvesztése', "text2": 'Megszakadt a kommunikáció az IMG Bus protokollal.', "action": 'A kazán nem hajtja végre a fűtési parancsokat.', "comment": 'Azt jelzi, hogy a kazán vezérlőpanelje és a zónavezérlés (opcionális) közötti IMG Bus kommunikáció megszakadt.'},
-    37: {"text1": 'Alacsony tápfeszültség', "text2": 'A vezérlőpanel tápfeszültsége kisebb a megengedett határértéknél.', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul.', "comment": 'Azt jelzi, hogy a készülék tápfeszültsége nem éri el a kazán megfelelő működéséhez szükséges szintet.'},
-    38: {"text1": 'Lángjelzés elvesztése', "text2": 'A vezérlőpanel, miután rögzítette a láng helyes áramlási értékét, a lángáram csökkenését jelzi.', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul.', "comment": 'Akkor látható, ha a kazán megfelelően be van kapcsolva, és az égő hirtelen kialszik. A kazán megpróbálja újra begyújtani az égőt. Amennyiben az üzemi körülmények helyreállnak, a kazán magától újraindul.'},
-    39: {"text1": 'a napkollektor érzékelőjének meghibásodása', "text2": 'A külső hőmérséklet-érzékelő ellenállási értéke kívül esik a tartományon', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel a napkollektor érzékelőjének meghibásodását érzékeli, a kazán tovább üzemel, de a használati-melegvíz előállításához nem használ napenergiát, mert a napkollektoros rendszer szivattyúja nem működik'},
-    40: {"text1": 'Meghibásodás a napkollektoros rendszer tárolójának érzékelőjén', "text2": 'A napkollektoros melegvíz tároló érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel a napkollektoros rendszer tárolóján elhelyezett érzékelő meghibásodását érzékeli, a kazán tovább üzemel, de a használati-melegvíz előállításához nem használ napenergiát, mert a napkollektoros rendszer szivattyúja nem működik.'},
-    41: {"text1": 'A napkollektor hőmérséklete magas', "text2": 'A napkollektoros rendszer tárolójának hőmérséklete meghaladta a beállított értéket', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Azt jelzi, hogy a napkollektor hőmérséklete meghaladta a beállított maximum értéket'},
-    42: {"text1": 'A napkollektoros rendszerben a tároló hőmérséklete magas', "text2": 'A napkollektoros melegvíz tároló hőmérséklete meghaladta a beállított értéket', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Azt jelzi, hogy a napkollektoros tárolóban lévő víz hőmérséklete meghaladta a beállított maximum értéket.'},
-    43: {"text1": 'Lángjelzés elvesztése következtében a berendezés leáll', "text2": 'Normál működés közben a lángjel egymás után többször is elveszik.', "action": 'Nyomja meg a Reset (visszaállítás) gombot, a kazán ventilátor-utóműködés ciklust indít be mielőtt újraindulna.', "comment": 'Ez akkor következik be, ha előre meghatározott időn belül a láng több egymást követő alkalommal kialszik - „Lángjel elvesztése”.'},
-    44: {"text1": 'A gázszelep összesített maximális nyitási ideje meghaladta a megengedett értéket, ezért a kazán leáll.', "text2": 'A gázszelep lángőr nélküli nyitási idejének felhalmozódott értéke nagyobb a megengedett értéknél.', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'Azt jelzi, hogy a gáz mágnesszelep a normális működéshez szükségesnél nagyobb ideig marad nyitva anélkül, hogy a kazán bekapcsolna.'},
-    45: {"text1": 'Nagy dT érték', "text2": 'Az előremenő és visszatérő ág vízhőmérséklete közötti különbség ≥ 40°C.', "action": 'A kondenzációs modul sérülésének elkerülése érdekében a kazán csökkenti az égő teljesítményét, és amikor a hőmérsékletváltozás mértéke visszatért a megfelelő értékre, a kazán is visszaáll az eredeti üzemmódra. Ellenőrizze, hogy a rendszerben kering-e a víz, hogy a keringető szivattyú konfigurációja megfelel-e a rendszer szükségleteinek, valamint hogy a visszatérő ágban elhelyezett érzékelő megfelelően működik-e.', "comment": 'A kazán nagy mértékű, nem kívánt hőmérsékletváltozást (dT) érzékel a rendszer előremenő és visszatérő csövére felszerelt érzékelői között.'},
-    46: {"text1": 'Működésbe lépett az alacsony hőmérsékletű termosztát / Hibás kábelezési/vezérlő konfiguráció', "text2": 'A DIM v2 kazán (amely csak alacsony hőmérsékleten működik) előremenő ágára szerelt biztonsági termosztát magas hőmérsékletet észlelt. / Kábelezési hiba vagy hibás pót-vezérlőpanel használata', "action": 'Amikor a hőmérséklet visszahűl a megfelelő szintre, újra lehet indítani a termosztátot (lásd a vonatkozó használati utasítást). / Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A normál működés során, ha az előremenő fűtővíz hőmérséklete a beállított határérték fölé megy (túlmelegszik), a kazán leáll. / Kábelezési hiba vagy hibás pót-vezérlőpanel használata'},
-    47: {"text1": 'Égő teljesítményének korlátozása', "text2": 'Ha az égéstermék hőmérséklete magas értéket ér el, a vezérlőpanel lecsökkenti az égő teljesítményét, hogy korlátozza a füstgázkör károsodását.', "action": 'Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'Ha az égéstermék hőmérséklete túl magas, a kazán csökkenti a leadott teljesítményt a meghibásodások elkerülése érdekében.'},
-    48: {"text1": 'Előremenő fűtővíz oldali érzékelő meghibásodása', "text2": 'Az előremenő fűtési rendszer oldali érzékelő ellenállási értéke kívül esik a tartományon', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Nem csatlakoztatott vagy hibás fűtés oldali nyomóági érzékelő esetén a rendszer meghibásodást jelez'},
-    49: {"text1": 'A visszatérő ág érzékelőjén mért magas hőmérséklet miatti leállás', "text2": 'A visszatérő ág érzékelője magas hőmérsékletet mért', "action": 'Ellenőrizze a keringtetőszivattyú és a váltószelepek megfelelő működését.', "comment": 'Akkor következik be, ha a hőcserélő visszatérő ágában a hőmérséklet túl magasra emelkedik.'},
-    50: {"text1": 'Külső érzékelő meghibásodása', "text2": 'A külső hőmérséklet-érzékelő ellenállási értéke kívül esik a tartományon', "action": 'Ellenőrizze a külső hőmérséklet-érzékelő csatlakozását. A rendszer tovább üzemel', "comment": 'Nem csatlakoztatott vagy hibás külső hőmérséklet-érzékelő esetén a rendszer meghibásodást jelez.'},
-    51: {"text1": 'Megszakadt a kommunikáció a CAR vezeték nélküli vezérlővel', "text2": 'Megszakadt a kommunikáció a jeladó bázis és a CAR v2 RF között.', "action": 'Ellenőrizze a vezeték nélküli CAR vezérlő működését, és hogy az elemek nincsenek-e lemerülve (lásd a melléklet használati útmutatót).', "comment": 'Ha megszakad az adatátvitel a kazán és a vezeték nélküli CAR vezérlő között, a kazán jelzi a meghibásodást, és ettől kezdve a kazán vezérlése kizárólag a kazánra szerelt vezérlőről történhet.'},
-    54: {"text1": 'Puffer érzékelőjének meghibásodása', "text2": 'A puffer-érzékelő ellenállási értéke kívül esik a tartományon', "action": 'A puffer mód le van tiltva', "comment": 'Nem csatlakoztatott vagy hibás puffer-érzékelő esetén a rendszer meghibásodást jelez.'},
-    55: {"text1": '1-es zóna előremenő ági hőmérséklet érzékelőjének meghibásodása', "text2": 'Az 1-es zóna előremenő fűtővíz érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel az 1-es alacsony hőmérsékletű zóna érzékelőjének meghibásodását érzékeli, a kazán nem működik az érintett zónában.'},
-    58: {"text1": 'Audax meghibásodása', "text2": 'A rendszerhez csatlakoztatott AUDAX hőszivattyú meghibásodást jelez', "action": 'A hőszivattyú nem hajtja végre a fűtési és helyiség hűtési parancsokat, a csatlakozók visszaállítását követően kapcsolja ki, és kapcsolja vissza a rendszert', "comment": 'Meghibásodás az Audax hőszivattyún, ellenőrizze a meghibásodás típusát közvetlenül a hőszivattyú kijelzőjén'},
-    59: {"text1": 'Leállás rendellenes frekvencia miatt', "text2": 'A vezérlőegység hibás frekvenciát észlelt a tápfeszültségi hálózatban.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőegység rendellenes hálózati frekvenciát érzékel.'},
-    60: {"text1": 'A keringtető szivattyú meghibásodott', "text2": 'A moduláló keringető szivattyú leáll.', "action": 'Próbálja meg megszüntetni a keringtető szivattyú elakadását, a vonatkozó fejezet utasításainak megfelelően. Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul.', "comment": 'A keringető szivattyú leáll az alábbi okok valamelyike miatt: blokkolt forgórész, elektromos hiba.'},
-    61: {"text1": 'Levegő a keringtető szivattyúban', "text2": 'A moduláló keringető szivattyú leáll, mert levegőt észlelt.', "action": 'Fúvassa le a keringtető szivattyút és a fűtési kört. Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul.', "comment": 'A keringtető szivattyúban levegő van; a keringtető szivattyú nem képes működni.'},
-    62: {"text1": 'Teljes beszabályzás kérés', "text2": 'A vezérlőegység nem az égésszabályozási paramétereknek megfelelő konfigurációra van beállítva.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A készülék az elektronikus vezérlőegység beszabályozásának hiányát érzékeli. Akkor fordulhat elő, ha kicserélték az áramköri kártyát, vagy ha megváltoztak a levegő/gáz paraméterek, és ez szükségessé teszi a „teljes beszabályozást”.'},
-    63: {"text1": 'Visszatérő fűtővíz érzékelő meghibásodása', "text2": 'A visszatérő fűtővíz érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'A kazán tovább üzemel, de nincs kiegészítés a csatlakoztatott külső rendszerek részéről', "comment": 'Nem csatlakoztatott vagy hibás visszatérő ági érzékelő esetén a rendszer meghibásodást jelez'},
-    67: {"text1": 'A napkollektoros rendszer nyomáskapcsolójának meghibásodása', "text2": 'A rendszer nyomáskapcsolója nyitva, lehet, hogy nincs folyadék', "action": 'Ellenőrizze a napkollektoros rendszer nyomásmérőjén, hogy az érték helyes-e', "comment": 'A napkollektoros rendszerben fellépő nyomásesés következtében a nyomáskapcsoló leállítja a napkollektoros rendszert'},
-    70: {"text1": 'Fordított érzékelők', "text2": 'A kazán nem megfelelő bekötése esetén hibát észlel', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Ellenőrizze a küldő és visszalépő szonda csatlakozását'},
-    72: {"text1": 'Gyors beszabályozási kérés', "text2": 'A vezérlőegység néhány égésszabályozási paraméter esetében nem a megfelelő konfigurációra van beállítva.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlő néhány paraméter módosítását érzékeli, és ez szükségessé teszi a „gyors beszabályozást”.'},
-    73: {"text1": 'A készülék fokozott mértékű eltérést érzékel az előremenő fűtővíz érzékelő és biztonsági előremenő fűtővíz érzékelő között.', "text2": 'Az előremenő fűtővíz érzékelők között jelentős eltérés észlelhető.', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul', "comment": 'A kártya az előremenő ági NTC érzékelő hőmérséklet olvasásának hibáját jelzi, az okok a következők lehetnek: hibás érzékelő, hibás elhelyezés, a rendszer elégtelen keringtetése vagy dugulás a primer hőcserélő víz oldalán.'},
-    74: {"text1": 'Biztonsági előremenő fűtővíz érzékelő meghibásodása', "text2": 'Az előremenő fűtővíz biztonsági érzékelőjének ellenállási értéke kívül esik a tartományon', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A kártya az előremenő ági NTC érzékelő meghibásodását jelzi.'},
-    75: {"text1": 'Elakadás sérült NTC érzékelő miatt', "text2": 'Lehetséges, hogy hibás a berendezés egy, vagy mindkét küldő és visszalépő érzékelője', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A biztonsági szonda érzékelője miatt nagy a hőmérsékleti gradiens'},
-    76: {"text1": 'A küldő vagy visszalépő érzékelő eltérése', "text2": 'Hiba lép fel a berendezés egy, vagy mindkét küldő és visszalépő érzékelőjénél', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Fűtési parancs során nagy a különbség a küldő és visszalépő érzékelő esetében megadott értékek között'},
-    77: {"text1": 'Hiba az égés ellenőrzésben', "text2": 'A gázszelep áramértéke kívül esik a tartományon.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlő tartományon kívüli értéket mér a gázszelepnél.'},
-    78: {"text1": 'Hiba az égés ellenőrzésben', "text2": 'A gázszelep áramlási értéke túl magas.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlő erős áramlási sebességet mér a gázszelepnél.'},
-    79: {"text1": 'Hiba az égés ellenőrzésben', "text2": 'A gázszelep áramlási értéke túl alacsony.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlő csökkent áramlási sebességet mér a gázszelepnél.'},
-    80: {"text1": 'Leállás a vezérlőpanel meghibásodása miatt', "text2": 'Hiba észlelése az elektronikus gázszelep-vezérlőnél, a kártyán vagy a gázszelepen fellépő problémák miatt.', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'Azt jelzi, hogy a szelepet szabályozó vezérlőpanel működése hibás.'},
-    84: {"text1": 'Nem megfelelő égés - a teljesítménycsökkenés folyamatban van', "text2": 'Az alacsony nyomáshoz hasonló körülmények észlelése a gázszelep ellátásánál.', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul', "comment": 'A gázvezeték ellátó nyomása alacsony. Ennek következtében a kazán csökkenti a teljesítményt, és hibajelzést küld.'},
-    85: {"text1": 'Utóégés problémája miatt bekövetkező leállás', "text2": 'Gázszelep, elektróda, vezérlőpanel lehetséges problémája', "action": 'Nyomja meg a Reset (visszaállítás) gombot. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'Van láng egészen a gázszelep zárása utánig'},
-    87: {"text1": 'Leállás a gázszelep ellenőrző egység hibája miatt', "text2": 'Hiba a gázszelep ellenőrző egységnél.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlő a gázszelepet ellenőrző valamelyik egység meghibásodását érzékeli.'},
-    88: {"text1": 'Leállás a gázszelep ellenőrző egység hibája miatt', "text2": 'Hiba a gázszelep ellenőrző egységnél.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'A vezérlő a gázszelepet ellenőrző valamelyik egység meghibásodását érzékeli.'},
-    89: {"text1": 'Instabil égés jelzés', "text2": 'A készülék instabilnak észleli az égési jelzést.', "action": 'A kazán továbbra is működik.', "comment": 'A láng nem egyenletes. Ennek oka lehet: a visszaáramló égéstermék, az ingadozó gáznyomás, a ventilátor egyenetlen sebessége vagy a rendszerben bekövetkezett egyéb hiba.'},
-    90: {"text1": 'Az égés jel tartományon kívül', "text2": 'Az égési jel kívül esik a határértékeken.', "action": 'A kazán továbbra is működik.', "comment": 'A mért égési jel hosszabb ideig a megadott értéktartományon kívül marad.'},
-    91: {"text1": 'Leállás gyújtáshiba miatt', "text2": 'A vezérlő nem tudja többször megkísérelni az égő helyes begyújtását.', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'A vezérlő nem tudja többször megkísérelni a helyes begyújtást.'},
-    92: {"text1": 'A ventilátor fordulatszám korrekció határértéke', "text2": 'A vezérlőegység már elérte a ventilátor fordulatszámának lehetséges maximális korrekcióját.', "action": 'A kazán továbbra is működik.', "comment": 'A vezérlő nem tudja többször megkísérelni a ventilátor fordulatszámának korrekcióját.'},
-    93: {"text1": 'Az égés jel tartományon kívül', "text2": 'Az égési jel kívül esik a határértékeken.', "action": 'A kazán továbbra is működik.', "comment": 'A mért égési jel hosszabb ideig a megadott értéktartományon kívül marad.'},
-    94: {"text1": 'Nem megfelelő égés', "text2": 'Égési probléma, amelyet az égési rendszer vagy az égésszabályozás okoz.', "action": 'Amennyiben a megfelelő működés körülményeit biztosítja, a kazán a reset gomb megnyomása nélkül indul.', "comment": 'A vezérlő problémát érzékelt az égésszabályozásnál, amelynek több oka lehet: alacsony gáznyomás, az égéstermék visszaáramlása, a gázszelep vagy a vezérlő panel meghibásodása.'},
-    95: {"text1": 'Az égés jel szakaszos', "text2": 'Az égési jel szakaszos az elektromos csatlakozások hibái vagy a jel szaggatottsága miatt.', "action": 'A kazán továbbra is működik.', "comment": 'A rendszer az égési jel szakaszosságát érzékeli.'},
-    96: {"text1": 'Dugulás az égéstermék kivezetésen', "text2": 'A rendszer az égéstermék-kivezetés dugulását észlelte.', "action": 'A kazán nem indul be. Ha a meghibásodás továbbra is fennáll, forduljon az Immergas szakszervizhez.', "comment": 'Akkor látható, ha az égéstermék elvezető rendszerben dugulás alakul ki.'},
-    98: {"text1": 'Leállás max. számú szoftverhiba miatt', "text2": 'Az elektronikus kártya nem működik megfelelően.', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'A vezérlő a megengedettnél nagyobb számú szoftverhibát érzékel.'},
-    99: {"text1": 'A kazán eláll.', "text2": 'Az elektronikus kártya nem működik megfelelően.', "action": 'Nyomja meg a Reset (visszaállítás) gombot.', "comment": 'Üzemzavar lépett fel a kazánon.'},
-    101: {"text1": 'Audax offline hibajelzés', "text2": 'Nincs kapcsolat a hőszivattyúval', "action": 'A hőszivattyú nem hajtja végre a fűtési és helyiség hűtési parancsokat, a csatlakozók visszaállítását követően kapcsolja ki, és kapcsolja vissza a rendszert', "comment": 'A kapcsolat elvesztése, hibás bekötés esetén, vagy akkor, ha a hőszivattyú ki van kapcsolva, a kazán elektronikája nem érzékeli a hőszivattyút'},
-    102: {"text1": '1-es zóna tágulási tartály offline hibajelzés', "text2": 'Nincs kapcsolat az 1-es zóna tágulási tartályával', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Kapcsolati hiba az 1-es zónával'},
-    103: {"text1": '2-es zóna tágulási tartály offline hibajelzés', "text2": 'Nincs kapcsolat a 2-es zóna tágulási tartályával', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Kapcsolati hiba a 2-es zónával'},
-    104: {"text1": '3-as zóna tágulási tartály offline hibajelzés', "text2": 'Nincs kapcsolat a 3-as zóna tágulási tartályával', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Kapcsolati hiba a 3-as zónával'},
-    106: {"text1": 'HMV érzékelő hibajelzés', "text2": 'Kazános kiegészítés és a HMV rendszer külön kezelése esetén a szabályozó által ellenőrzött melegvíz tároló érzékelője tartományon kívüli ellenállási értéket ad', "action": 'A rendszer nem tud HMV-t előállítani a hőszivattyúval. A HMV előállítását a kazán biztosítja', "comment": 'A vezérlőpanel meghibásodást észlel a vízmelegítő érzékelőjében'},
-    120: {"text1": '1-es zóna páramentesítési parancsolt értéke magas, hibajelzés', "text2": 'Az 1-es zónára kiszámított parancsolt érték túl magas a páramentesítéshez', "action": 'A kiszámított előremenő hőmérséklet meghaladja a páramentesítőre megengedett értéket. Hűtse a helyiséget, és várja meg, hogy a harmatponti hőmérséklet visszatérjen elfogadható értékekre', "comment": 'A páramentesítéshez kiszámított hűtési előremenő ág parancsolt értéke magasabb, mint az 1-es zónára beállított érték'},
-    121: {"text1": '1-es zóna berendezése offline hibajelzés', "text2": 'A távvezérlő vagy az 1-es zóna távirányítója nincs csatlakoztatva', "action": 'Ellenőrizze, hogy a táviránytó be van-e kapcsolva', "comment": 'Nincs kapcsolat a zónavezérléssel. A zóna hőmérséklete nem szabályozható'},
-    122: {"text1": '2-es zóna berendezése offline hibajelzés', "text2": 'A távvezérlő vagy az 2-es zóna távirányítója nincs csatlakoztatva', "action": 'Ellenőrizze, hogy a táviránytó be van-e kapcsolva', "comment": 'Nincs kapcsolat a zónavezérléssel. A zóna hőmérséklete nem szabályozható'},
-    123: {"text1": '3-as zóna berendezése offline hibajelzés', "text2": 'A távvezérlő vagy az 3-es zóna távirányítója nincs csatlakoztatva', "action": 'Ellenőrizze, hogy a táviránytó be van-e kapcsolva', "comment": 'Nincs kapcsolat a zónavezérléssel. A zóna hőmérséklete nem szabályozható'},
-    125: {"text1": '1-es zóna szobahőmérséklet érzékelőjének meghibásodása', "text2": 'Az 1-es zóna szobahőmérséklet érzékelője üzemi tartományon kívül', "action": 'A hőmérsékleten kívül a zóna harmatpontja sincs kiszámítva', "comment": 'Az 1-es zóna szobahőmérséklet érzékelője (választható) meghibásodott. A zóna hőmérséklete nem szabályozható'},
-    126: {"text1": '2-es zóna szobahőmérséklet érzékelőjének meghibásodása', "text2": 'A 2-es zóna szobahőmérséklet érzékelője üzemi tartományon kívül', "action": 'A hőmérsékleten kívül a zóna harmatpontja sincs kiszámítva', "comment": 'A 2-es zóna szobahőmérséklet érzékelője (választható) meghibásodott. A zóna hőmérséklete nem szabályozható'},
-    127: {"text1": '3-as zóna szobahőmérséklet érzékelőjének meghibásodása', "text2": 'A 3-as zóna szobahőmérséklet érzékelője üzemi tartományon kívül', "action": 'A hőmérsékleten kívül a zóna harmatpontja sincs kiszámítva', "comment": 'A 3-as zóna szobahőmérséklet érzékelője (választható) meghibásodott. A zóna hőmérséklete nem szabályozható'},
-    129: {"text1": 'Az 1-es zóna pára érzékelőjének meghibásodása', "text2": 'Az 1-es zóna pára érzékelője üzemi tartományon kívül', "action": 'A páratartalmon kívül a zóna harmatpontja sincs kiszámítva', "comment": 'Az 1-es zóna pára érzékelője (választható) meghibásodott. A zónában a páratartalom nem szabályozható'},
-    130: {"text1": 'A 2-es zóna pára érzékelőjének meghibásodása', "text2": 'A 2-es zóna pára érzékelője üzemi tartományon kívül', "action": 'A páratartalmon kívül a zóna harmatpontja sincs kiszámítva', "comment": 'A 2-es zóna pára érzékelője (választható) meghibásodott. A zónában a páratartalom nem szabályozható'},
-    131: {"text1": 'A 3-as zóna pára érzékelőjének meghibásodása', "text2": 'A 3-as zóna pára érzékelője üzemi tartományon kívül', "action": 'A páratartalmon kívül a zóna harmatpontja sincs kiszámítva', "comment": 'A 3-as zóna pára érzékelője (választható) meghibásodott. A zónában a páratartalom nem szabályozható'},
-    132: {"text1": '2-es zóna páramentesítési parancsolt értéke magas, hibajelzés', "text2": 'A 2-es zónára kiszámított parancsolt érték túl magas a páramentesítéshez', "action": 'A kiszámított előremenő hőmérséklet meghaladja a páramentesítőre megengedett értéket. Hűtse a helyiséget, és várja meg, hogy a harmatponti hőmérséklet visszatérjen elfogadható értékekre', "comment": 'A páramentesítéshez kiszámított hűtési előremenő ág parancsolt értéke magasabb, mint a 2-es zónára beállított érték'},
-    133: {"text1": '1-es zóna páramentesítése meghibásodott, hibajelzés', "text2": 'Az 1-es zóna páramentesítőjén hibajelzés kapcsolt be', "action": 'A rendszer nem páramentesíti az adott zónát', "comment": 'A meghibásodás az 1-es zóna páramentesítőjétől (választható) jön'},
-    134: {"text1": '2-es zóna páramentesítése meghibásodott, hibajelzés', "text2": 'A 2-es zóna páramentesítőjén hibajelzés kapcsolt be', "action": 'A rendszer nem páramentesíti az adott zónát', "comment": 'A meghibásodás a 2-es zóna páramentesítőjétől (választható) jön'},
-    135: {"text1": '3-as zóna páramentesítése meghibásodott, hibajelzés', "text2": 'A 3-as zóna páramentesítőjén hibajelzés kapcsolt be', "action": 'A rendszer nem páramentesíti az adott zónát', "comment": 'A meghibásodás a 3-as zóna páramentesítőjétől (választható) jön'},
-    137: {"text1": 'Rendszer visszaállítva hibajelzés – Indítsa újra a rendszert', "text2": 'A vezérlőről végzett visszaállítási műveletet követően megjelenik egy hibajelzés, mert újra kell indítani a rendszert', "action": 'Kapcsolja ki, és kapcsolja vissza a rendszert', "comment": 'Az alapértelmezett paraméterek visszaállítását követően a rendszert vissza kell állítani'},
-    138: {"text1": 'Esztrich szárítás folyamatban', "text2": 'Esztrich szárítási funkció folyamatban', "action": '', "comment": ''},
-    139: {"text1": 'Légtelenítés folyamatban', "text2": 'Légtelenítési funkció folyamatban', "action": '', "comment": ''},
-    177: {"text1": 'Használati-melegvíz maximum idő hibajelzés', "text2": 'A használati-melegvíz parancs teljesítésére a megadott maximális idő átlépésével került sor', "action": 'a rendszer tovább működik, csak nem optimális teljesítményen', "comment": 'A használati-melegvíz előállítása nem történik meg a megadott időn belül (5 óra)'},
-    178: {"text1": 'Sikertelen legionella elleni ciklus', "text2": 'A legionella ellen védő ciklus nem fejeződött be sikeresen a megadott időn belül', "action": 'Nyomja meg a Reset gombot', "comment": 'A legionella ellen védő ciklus a megadott időn belül (3 óra) sikertelenül zárul'},
-    179: {"text1": 'Folyadék érzékelőjének meghibásodása', "text2": 'A folyadék fázis érzékelője üzemi tartományon kívül.', "action": 'A rendszer nem indul el. Forduljon szakemberhez (pl. Immergas Szervizhálózat).', "comment": 'A vezérlőpanel meghibásodást észlel a folyadék fázis érzékelőjében'},
-    181: {"text1": 'Távvezérlő jel hiba a 2-es zónában', "text2": 'Nincs adatátvitel a vezérlőpanel és a 2-es zóna távvezérlője között.', "action": 'Szüntesse meg, majd indítsa újra a hidraulika modul áramellátását. Ha a berendezés az ismételt begyújtást követően sem érzékeli a távvezérlőt, a rendszer közvetlen üzemmódba kapcsol, tehát csak a berendezés vezérlőjén elhelyezett kezelőszervek aktívak. Ebben az esetben nem lehet bekapcsolni a “fűtés”, funkciót', "comment": 'Ez akkor következhet be, ha a hidraulika modult nem kompatibilis távvezérlőhöz csatlakoztatja, vagy ha a második zónaCARV2 vezérlője és a berendezés között megszűnik a kommunikáció.'},
-    182: {"text1": 'Kondenzátor hibajelzés', "text2": 'Egy hibajelzés kapcsolt be a kondenzátoron', "action": 'A rendszer nem működik, olvassa el a kondenzátor hibajelzését, és a kapcsolódó használati útmutatót', "comment": 'A kondenzátoron hiba lépett fel'},
-    183: {"text1": 'Kondenzátor tesztüzemben figyelmeztetés', "text2": 'A kondenzátor tesztüzemben (TESTMODE) működik', "action": 'Ebben a fázisban nem lehet a légkondicionálási és használati-melegvíz előállítási parancsokat tejesíteni', "comment": 'Jelzi, hogy a kondenzátor teszt módban dolgozik'},
-    184: {"text1": 'Kapcsolati időtúllépési hiba külső egységgel', "text2": 'Nincs kapcsolat a kondenzátorral', "action": 'Ellenőriztesse a villamos csatlakozásokat az egységek között', "comment": 'A rendszer a hibajelzést annak következtében küldi, hogy kapcsolati hiba lépett fel a belső egység és a kondenzátor között'},
-    185: {"text1": 'Biztonsági modul kapcsolati hiba jelzés', "text2": 'Nincs kapcsolat a biztonsági modullal', "action": 'Ellenőriztesse az alkatrészek közötti csatlakozásokat', "comment": 'Kapcsolati hiba lépett fel a vezérlő kártya és a begyújtási vezérlő között'},
-    186: {"text1": 'Gyújtótrafó nagyfeszültség meghibásodása', "text2": 'Biztonsági modul: a gyújtótrafó feszültsége hibás', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A begyújtási vezérlőn hiba lépett fel'},
-    187: {"text1": 'A kondenzátor visszatérő ági érzékelője meghibásodott', "text2": 'A kondenzátor visszatérő ági érzékelője üzemi tartományon kívül esik', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A vezérlőpanel meghibásodást észlel a hőszivattyú visszatérő ágának NTC érzékelőjében.'},
-    188: {"text1": 'Üzemi tartományon kívül eső parancs', "text2": 'A kért parancsot a rendszer nem hajtja végre, mert a külső feltételek nem teszik lehetővé a kondenzátor bekapcsolását', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Az üzemeltetési határértékeken kívül eső külső hőmérséklet esetén fűtési vagy hűtési parancs érkezik'},
-    189: {"text1": 'Kapcsolati időtúllépési hiba kommunikációs kártyával', "text2": 'Nincs kapcsolat a kondenzátor kommunikációs kártyájával', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'Ha megszűnik a kapcsolat a vezérlő kártyák között, bekapcsol a hibajelzés'},
-    191: {"text1": 'RF kapcsolat megszűnt a 2-es zóna CAR v2 RF vezérlője felé', "text2": 'Megszakadt a kommunikáció a jeladó bázis és a 2-s zóna CAR v2 RF között', "action": 'Ellenőrizze a vezeték nélküli CAR vezérlő működését, és hogy az elemek nincsenek-e lemerülve (lásd a melléklet használati útmutatót)', "comment": 'Ha megszakad az adatátvitel a beltéri egység és a második zóna vezeték nélküli CAR távvezérlője között, a rendszer jelzi a meghibásodást, és ettől kezdve a kazán vezérlése kizárólag a beltéri egységre szerelt vezérlőről történhet'},
-    192: {"text1": 'Kondenzátor előremenő ági érzékelőjének meghibásodása', "text2": 'A kondenzátor előremenő ági érzékelője üzemi tartományon kívül esik', "action": 'Ha a meghibásodás továbbra is fennáll; forduljon az Immergas szakszervizhez.', "comment": 'A kártya jelzi a hőszivattyú előremenő ági NTC érzékelőjének a meghibásodását'},
-    193: {"text1": 'Berendezés tesztüzemben', "text2": 'A berendezést egy külső egység vezérli Opentherm protokollon keresztül', "action": 'A rendszer a megszokott módon tovább üzemel', "comment": 'Jelzi, hogy a berendezés teszt módban dolgozik'},
-    194: {"text1": 'Audax Pro letiltva', "text2": 'Az Audax Pro kondenzátor működése le lett tiltva', "action": 'A rendszer a megszokott módon tovább üzemel', "comment": 'Jelzi, hogy a kondenzátor működése le lett tiltva a sorkapocs erre szolgáló bemenetén keresztül'},
-    195: {"text1": 'Folyadék fázis alacsony hőmérséklet hibajelzés', "text2": 'A folyadék fázis érzékelője által mért hőmérséklet túl alacsony', "action": 'Ellenőrizze, hogy a hűtőkör hőmérséklete kielégítő-e', "comment": 'A folyadék fázisban a mért hőmérséklet túl alacsony'},
-    196: {"text1": 'Magas előremenő ági hőmérséklet miatti leállás', "text2": 'A hőmérséklet túl magas a hőszivattyú visszatérő ágán.', "action": 'Ellenőrizze, hogy a hűtőkör hőmérséklete kielégítő-e', "comment": 'A hőmérséklet túl magas a hőszivattyú előremenő ágán.'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: it)"""
-
-immergas_labels = {
-    'default': {"text1": 'Anomalia generica non riconosciuta', "text2": 'Verificare tabella errori o scheda selezionata', "action": 'Verificare tabella errori o scheda selezionata', "comment": 'Nessuna nota a riguardo'},
-    0: {"text1": 'SISTEMA OK', "text2": 'Sistema correttamente funzionante', "action": 'Nessuna azione richiesta', "comment": 'Nessuna anomalia'},
-    1: {"text1": 'Blocco mancata accensione', "text2": "Mancata rilevazione fiamma al termine dell'ultimo tentativo d'accensione", "action": 'Premere il pulsante di Reset', "comment": "La caldaia in caso di richiesta di riscaldamento ambiente o produzione acqua calda sanitaria non si accende entro il tempo prestabilito. Alla prima accensione o dopo prolungata inattivita' dell'apparecchio puo' essere necessario intervenire per eliminare il blocco."},
-    2: {"text1": 'Blocco termostato sicurezza (sovratemperatura)', "text2": 'Intervento termostato di sicurezza', "action": 'Premere il pulsante di Reset', "comment": "Durante il normale regime di funzionamento se per un'anomalia si verifica un eccessivo surriscaldamento interno la caldaia va in blocco."},
-    3: {"text1": 'Blocco termostato fumi', "text2": 'Intervento termostato fumi', "action": 'Premere il pulsante di Reset (versioni Nike)/ Configurare correttamente il parametro P.14. Se necessario premere il pulsante di Reset (versioni Star)', "comment": "Durante il normale regime di funzionamento se per un'anomalia si verifica un eccessivo surriscaldamento dei fumi la caldaia va in blocco (versioni Nike)/ Configurazione errata parametro P.14 (versione Star) "},
-    4: {"text1": 'Blocco resistenza contatti', "text2": "Rilevata un'anomalia sul circuito di pilotaggio valvola gas", "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda elettronica rileva un'anomalia sull'alimentazione della valvola gas. Verificare il collegamento della stessa. (l'anomalia viene rilevata e visualizzata solo in presenza di una richiesta)."},
-    5: {"text1": 'Anomalia sonda mandata', "text2": 'La sonda di mandata offre un valore resistivo fuori range', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia sulla sonda NTC mandata."},
-    6: {"text1": 'Anomalia sonda sanitario', "text2": 'La sonda sanitario offre un valore resistivo fuori range', "action": "La caldaia continua a produrre acqua calda sanitaria ma con prestazioni non ottimali. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia sulla sonda NTC sanitario."},
-    8: {"text1": 'Numero massimo di reset', "text2": 'Indica il raggiungimento del numero massimo dei reset consentiti dalla scheda integrata', "action": "Attenzione: e' possibile resettare l'anomalia fino a 5 volte consecutive, dopodiche' la funzione e' inibita per almeno un'ora e si guadagna un tentativo ogni ora per un massimo di 5 tentativi. Togliendo e riapplicando l'alimentazione all'apparecchio si riacquistano i 5 tentativi.", "comment": "Numero di reset disponibili gia' eseguiti."},
-    10: {"text1": 'Pressione impianto insufficiente', "text2": "Il contatto del pressostato impianto e' aperto", "action": "Verificare sul manometro di caldaia che la pressione dell'impianto sia compresa tra 1÷1,2 bar ed eventualmente ripristinare la corretta pressione.", "comment": "Non viene rilevata una pressione dell'acqua all'interno del circuito di riscaldamento sufficiente per garantire il corretto funzionamento della caldaia."},
-    11: {"text1": 'Anomalia pressostato fumi', "text2": 'Possibile anomalia su pressostato fumi o su ventilatore', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": 'Se le condizioni normale di funzionamento vengono ripristinate la caldaia riparte senza la necessità di essere resettata'},
-    12: {"text1": 'Anomalia sonda boiler', "text2": 'La sonda bollitore offre un valore resistivo fuori range', "action": "La caldaia non puo' produrre acqua calda sanitaria. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia sulla sonda boiler"},
-    13: {"text1": 'Misuratore portata aria/fumi fuori range', "text2": 'Il segnale aria/fumi è fuori range o con ventilatore fermo il controllo legge un segnale troppo alto', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Con ventilatore fermo, il controllo aria/fumi legge un segnale troppo alto(contatti pressostato incollati)'},
-    15: {"text1": 'Errore configurazione', "text2": 'La scheda recepisce una incongruenza tra la sua configurazione e i segnali in ingresso', "action": "In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata. Verificare che la caldaia sia configurata in modo corretto. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia o un incongruenza sul cablaggio elettrico di caldaia e non parte."},
-    16: {"text1": 'Anomalia ventilatore', "text2": "Il ventilatore risulta ruotare quando non e' alimentato oppure risulta fermo quando alimentato", "action": "Premere il pulsante di Reset. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": 'Si verifica nel caso in cui il ventilatore abbia un guasto meccanico o elettronico.'},
-    17: {"text1": 'Velocità ventilatore non corretta', "text2": 'Il numero di giri ventilatore è al di fuori dal range corretto', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Numero di giri ventilatore non corretto'},
-    20: {"text1": 'Blocco fiamma parassita', "text2": 'Rilevazione fiamma anomala', "action": "Premere il pulsante di Reset. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": 'Si verifica in caso di dispersione nel circuito di rilevazione o anomalia nel controllo fiamma.'},
-    23: {"text1": 'Anomalia sonda ritorno', "text2": 'La sonda di ritorno offre un valore resistivo fuori range', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia sulla sonda NTC mandata."},
-    24: {"text1": 'Anomalia pulsantiera', "text2": "E' recepita una pressione continua sui pulsanti del cruscotto", "action": "In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia sulla pulsantiera."},
-    25: {"text1": 'Blocco sonda fumi / blocco CRC (TERA)', "text2": 'Temperatura fumi fuori range / memoria corrotta (TERA)', "action": 'Premere il pulsante di Reset', "comment": 'Gradiente fumi elevato, probabile blocco circolatore o mancanza acqua / memoria corrotta'},
-    27: {"text1": 'Circolazione insufficiente', "text2": 'Surriscaldamento della caldaia dovuto a scarsa circolazione nel circuito primario', "action": 'Premere il pulsante di Reset', "comment": 'Verificare che non siano presenti intercettazioni sul circuito di riscaldamento e/o verificare il corretto funzionamento del circolatore'},
-    28: {"text1": 'Trafila circuito sanitario', "text2": 'Se durante il funzionamento in fase riscaldamento viene riscontrato un’innalzamento della temperatura dell’acqua sanitaria la caldaia segnala l’anomalia e riduce la temperatura del riscaldamento per limitare la formazione di calcare nello scambiatore.', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": 'Controllare che tutti i rubinetti dell’impianto sanitario siano chiusi o che non trafilino, e comunque verificare che non ci siano perdite nell’impianto. La caldaia torna al normale funzionamento una volta ripristinate le condizioni ottimali sull’impianto sanitario'},
-    29: {"text1": 'Anomalia sonda fumi', "text2": 'La sonda fumi offre un valore resistivo fuori range', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": "La scheda rileva un'anomalia sulla sonda fumi."},
-    31: {"text1": 'Perdita di comunicazione col CARV2', "text2": "Non e' presente il colloquio tra scheda e remoto.", "action": "Togliere e ridare tensione alla caldaia. Se alla riaccensione non viene rilevato il Comando Remoto la caldaia passa in modalita' di funzionamento locale quindi utilizzando i comandi presenti sul pannello comandi. In questo caso non e' possibile attivare la funzione ''Riscaldamento''.", "comment": 'Si verifica nel caso di collegamento a un controllo remoto non compatibile, oppure in caso di caduta di comunicazione fra caldaia e CARV2.'},
-    32: {"text1": 'Anomalia sonda Zona 2 bassa temperatura', "text2": 'Sonda mandata zona 2 fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda zona 2 bassa temperatura il sistema non può funzionare nella zona interessata'},
-    33: {"text1": 'Anomalia sonda Zona 3 bassa temperatura', "text2": 'Sonda mandata zona 3 fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda zona 2 bassa temperatura il sistema non può funzionare nella zona interessata'},
-    36: {"text1": 'Caduta comunicazione IMG Bus', "text2": 'Perdita di comunicazione su protocollo IMG Bus.', "action": 'La caldaia non soddisfa le richieste di riscaldamento.', "comment": "A causa di un anomalia sulla centralina di caldaia, sulla scheda a zone (optional) o sull'IMG Bus si interrompe la comunicazione tra i vari componenti."},
-    37: {"text1": 'Bassa tensione di alimentazione', "text2": 'La tensione di alimentazione scheda ha valori inferiori ai limiti consentiti.', "action": 'In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata.', "comment": "Si verifica nel caso in cui la tensione di alimentazione e' inferiore ai limiti consentiti per il corretto funzionamento della caldaia."},
-    38: {"text1": 'Perdita segnale di fiamma', "text2": 'La scheda, dopo aver agganciato un corretto valore di corrente di fiamma, segnala una caduta della corrente di fiamma.', "action": 'In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata.', "comment": "Si verifica nel caso in cui la caldaia e' accesa correttamente e avviene uno spegnimento inaspettato della fiamma del bruciatore; viene eseguito un nuovo tentativo di riaccensione e in caso di ripristino delle normali condizioni la caldaia non necessita di essere resettata."},
-    39: {"text1": 'anomalia sonda collettore solare', "text2": 'La sonda esterna offre un valore resistivo fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda collettore solare, la caldaia continua a funzionare regolarmente senza l’apporto di energia solare per il riscaldamento dell’acqua calda sanitaria in quanto la pompa solare smette di funzionare'},
-    40: {"text1": 'Anomalia sonda accumulo solare', "text2": 'La sonda accumulo solare offre un valore resistivo fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda accumulo solare, la caldaia continua a funzionare regolarmente senza l’apporto di energia solare per il riscaldamento dell’acqua calda sanitaria in quanto la pompa solare smette di funzionare.'},
-    41: {"text1": 'Temperatura elevata su collettore solare', "text2": 'Il collettore solare ha superato la temperatura massima impostata', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Si verifica quando la temperatura del collettore solare supera il limite massimo impostato'},
-    42: {"text1": 'Temperatura elevata su accumulo solare', "text2": 'Il accumulo solare ha superato la temperatura massima impostata', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "Si verifica quando la temperatura dell’acqua nell'accumulo solare supera il limite massimo impostato."},
-    43: {"text1": 'Blocco per perdita segnale di fiamma', "text2": 'Perdita segnale di fiamma in funzionamento a regime per più volte consecutive.', "action": 'Premere il pulsante di Reset, la caldaia prima di ripartire effettua un ciclo di postventilazione.', "comment": "Si verifica se si presenta per più volte consecutive nell'arco di un tempo prestabilito l'errore ''Perdita segnale di fiamma''."},
-    44: {"text1": 'Blocco per superamento accumulo tempo massimo aperture ravvicinate valvola gas', "text2": "L'accumulo del tempo complessivo di apertura valvola gas senza rilevazione di fiamma e' maggiore del massimo consentito.", "action": 'Premere il pulsante di Reset.', "comment": 'Si verifica nel caso in cui la valvola gas rimane aperta per un tempo superiore a quello previsto per il suo normale funzionamento senza che la caldaia si accenda.'},
-    45: {"text1": 'dT elevato', "text2": 'La differenza di temperatura misurata tra mandata e ritorno é ≥ di 40°C.', "action": "Viene limitata la potenza del bruciatore per prevenire eventuali danni al modulo a condensazione, una volta ripristinato il giusto dT la caldaia torna al normale funzionamento. Verificare che ci sia circolazione di acqua in caldaia, che il circolatore sia configurato secondo le esigenze dell'impianto e il corretto funzionamento della sonda di ritorno.", "comment": 'La caldaia rileva un innalzamento improvviso e non previsto del dT tra sonda mandata e sonda ritorno impianto.'},
-    46: {"text1": 'Intervento termostato bassa temperatura / Errata configurazione cablaggio/scheda', "text2": 'Il termostato di sicurezza posto sul collegamento mandata da caldaia a DIM v2 (funzionante unicamente a Bassa Temperatura) ha raggiunto elevate temperature. / Errore cablaggio o utilizzo scheda ricambio errata', "action": "In questo caso dopo un opportuno raffreddamento e' possibile resettare il termostato (vedi relativo foglio istruzioni). / Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "Durante il normale regime di funzionamento se per un'anomalia si verifica un eccessivo surriscaldamento della temperatura di mandata in bassa temperatura la caldaia va in blocco. / Errore cablaggio o utilizzo scheda di ricambio errata"},
-    47: {"text1": 'Limitazione potenza bruciatore', "text2": 'Se la temperatura fumi raggiunge un valore elevato la scheda riduce la potenza erogata dal bruciatore, onde limitare danni al circuito fumi.', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "Nel caso in cui venga rilevata un'elevata temperatura fumi la caldaia riduce la potenza erogata per non danneggiare la stessa."},
-    48: {"text1": 'Anomalia sonda mandata lato impianto', "text2": 'La sonda di mandata lato impianto offre un valore resistivo fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'In caso di sonda di mandata lato impianto non collegata o guasta viene segnalata l’anomalia'},
-    49: {"text1": 'Blocco temperatura elevata su sond ritorno', "text2": 'Temperatura misurata dalla sonda di ritorno alta', "action": 'Verificare la corretta circolazione in caldaia e il buon funzionamento della valvola tre vie.', "comment": 'Si verifica nel caso venga raggiunta una temperatura troppo alta sul circuito di ritorno scambiatore'},
-    50: {"text1": 'Anomalia sonda esterna', "text2": 'La sonda esterna offre un valore resistivo fuori range', "action": 'Verificare il collegamento della sonda esterna. Il sistema continua a funzionare', "comment": 'In caso di sonda esterna non collegata o guasta viene segnalata l’anomalia'},
-    51: {"text1": 'Caduta comunicazione con CAR Wireless', "text2": "La comunicazione tra base trasmittente e CAR v2 RF e' caduta.", "action": 'Verificare il funzionamento del CAR Wireless, verificare la carica delle batterie (vedere il relativo libretto istruzioni).', "comment": "In caso di caduta di comunicazione tra caldaia e CAR versione Wireless viene segnalata l'anomalia, da questo momento e' possibile controllare il sistema unicamente attraverso il pannello comandi della caldaia stessa."},
-    54: {"text1": 'Anomalia sonda puffer', "text2": 'La sonda puffer offre un valore resistivo fuori range', "action": 'La modalità puffer viene disabilitata', "comment": 'In caso di sonda puffer non collegata o guasta viene segnalata l’anomalia'},
-    55: {"text1": 'Anomalia sonda temperatura mandata Zona 1', "text2": 'La sonda di mandata zona 1 offre un valore resistivo fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda zona 1 bassa temperatura il sistema non può funzionare nella zona interessata.'},
-    58: {"text1": 'Anomalia Audax', "text2": 'Segnalazione di anomalia da parte della pompa di calore AUDAX collegata al sistema', "action": 'La pompa di calore non soddisfa le richieste di riscaldamento e raffrescamento ambiente, una volta ripristinati i collegamenti è necessario spegnere e riaccendere il sistema', "comment": 'Anomalia sulla pompa di calore Audax, verificare il tipo di anomalia direttamente sul display della pompa di calore'},
-    59: {"text1": 'Blocco frequenza rete alimentazione elettrica', "text2": "La scheda elettronica ha rilevato un'anomala frequenza sulla rete di alimentazione elettrica.", "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "La scheda rileva una frequenza sull'alimentazione di rete elettrica anomala."},
-    60: {"text1": 'Anomalia circolatore bloccato', "text2": 'Il circolatore modulante risulta fermo.', "action": 'Provare ad effettuare lo sblocco del circolatore come descritto nel relativo paragrafo. In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata.', "comment": 'Il circolatore risulta fermo per una delle seguenti cause: girante bloccata, guasto elettrico.'},
-    61: {"text1": 'Presenza aria nel circolatore', "text2": 'Il circolatore modulante risulta fermo per rilevato funzionamento in aria.', "action": 'Effettuare lo sfiato del circolatore e del circuito di riscaldamento. In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata.', "comment": "Viene rilevata aria all'interno del circolatore; il circolatore non puo' funzionare."},
-    62: {"text1": 'Richiesta taratura completa', "text2": 'La scheda non ha la corretta configurazione dei parametri di controllo combustione.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "Viene rilevata l'assenza di taratura della scheda elettronica. Si puo' verificare in caso di sostituzione della scheda elettronica o in caso di variazione dei parametri nella sezione aria / gas per cui si rende necessaria la ''taratura completa''."},
-    63: {"text1": 'Anomalia sonda ritorno impianto', "text2": 'La sonda di ritorno offre un valore resistivo fuori range', "action": 'La caldaia continua a funzionare senza nessuna integrazione dai sistemi esterni collegati', "comment": 'In caso di sonda di ritorno non collegata o guasta viene segnalata l’anomalia'},
-    67: {"text1": 'Anomalia pressostato impianto solare', "text2": 'Pressostato impianto aperto, possibile mancanza fluido', "action": 'Verificare sul manometro del gruppo di circolazione solare che la pressione sia ad al valore corretto', "comment": 'A causa di un calo della pressione nel circuito solare il pressostato blocca il funzionamento del circuito solare termico'},
-    70: {"text1": 'Sonde invertite', "text2": 'In caso di errore nel collegamento del cablaggio di caldaia viene rilevato l’errore', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Verificare il collegamento della sonda di mandata e di ritorno'},
-    72: {"text1": 'Richiesta taratura veloce', "text2": 'La scheda non ha la corretta configurazione di alcuni parametri di controllo combustione.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "Viene rilevata una modifica di alcuni parametri per cui si rende necessaria la ''taratura veloce''."},
-    73: {"text1": 'Rilevato scostamento elevato sonda mandata e sonda mandata di sicurezza', "text2": 'Le sonde di mandata presentano uno scostamento elevato.', "action": 'In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata', "comment": "La scheda rileva un'anomalia nella lettura delle temperature delle sonde NTC di mandata e le cause possono essere: sonda difettosa, posizionamento scorretto, scarsa circolazione impianto, intasamento lato acqua dello scambiatore primario."},
-    74: {"text1": 'Anomalia sonda mandata di sicurezza', "text2": 'La sonda di mandata di sicurezza offre un valore resistivo fuori range.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": "La scheda rileva un'anomalia sulla sonda NTC mandata di sicurezza."},
-    75: {"text1": 'Blocco per sensore NTC danneggiato', "text2": 'Possibile rottura di una o entrambe le sonde di mandata e ritorno impianto', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Il sensore della sonda di sicurezza  provoca un gradiente di temperatura elevato'},
-    76: {"text1": 'Deriva sonda mandata o sonda ritorno', "text2": 'Viene rilevato un malfunzionamento di una od entrambe le sonda di manta e ritorno impianto', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Differenza maggiore rispetto a quello impostato fra sonda di mandata e ritorno in caso di richiesta di calore '},
-    77: {"text1": 'Anomalia controllo combustione', "text2": 'Rilevata corrente valvola gas fuori range.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene rilevata una corrente fuori range sulla valvola gas.'},
-    78: {"text1": 'Anomalia controllo combustione', "text2": 'Rilevata corrente valvola gas elevata.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene rilevata una corrente sulla valvola gas elevata.'},
-    79: {"text1": 'Anomalia controllo combustione', "text2": 'Rilevata corrente valvola gas bassa.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene rilevata una corrente sulla valvola gas ridotta.'},
-    80: {"text1": 'Blocco malfunzionamento scheda elettronica', "text2": 'Rilevato guasto su driver valvola gas elettronica per problemi su scheda o valvola gas.', "action": 'Premere il pulsante di Reset', "comment": 'Si verifica nel caso di malfunzionamento della scheda elettronica che controlla la valvola.'},
-    84: {"text1": 'Anomalia combustione - riduzione potenza in corso', "text2": 'Rilevate condizioni assimilabili a bassa pressione alimentazione valvola gas.', "action": 'In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata', "comment": "Viene rilevata una bassa pressione di alimentazione sulla rete gas. Di conseguenza viene limitata la potenza dell'apparecchio e segnalata l'anomalia."},
-    85: {"text1": 'Blocco problema post-combustione', "text2": 'Potenziale problema valvola gas, elettrodo o scheda elettronica', "action": "Premere il pulsante di Reset. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas)", "comment": 'Fiamma presente per circa dopo la chiusura della valvola gas'},
-    87: {"text1": 'Blocco controllo valvola gas', "text2": 'Rilevato guasto su controllo valvola gas.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene rilevato un malfunzionamento di uno dei componenti che controllano la valvola gas.'},
-    88: {"text1": 'Blocco controllo valvola gas', "text2": 'Rilevato guasto su controllo valvola gas.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene rilevato un malfunzionamento di uno dei componenti che controllano la valvola gas.'},
-    89: {"text1": 'Segnale combustione instabile', "text2": "Rilevata instabilita' su segnale di combustione.", "action": 'La caldaia continua a funzionare.', "comment": "La fiamma risulta essere instabile a causa di: presenza ricircolo fumi, vento, pressione gas instabile, velocita' ventilatore instabile oppure a causa di un malfunzionamento del sistema."},
-    90: {"text1": 'Segnale combustione fuori limite', "text2": 'Rilevato segnale di combustione fuori limite.', "action": 'La caldaia continua a funzionare.', "comment": 'Il segnale di combustione viene rilevato fuori dal range di regolazione previsto per un tempo prolungato.'},
-    91: {"text1": 'Blocco accensione non corretta', "text2": "La scheda ha esaurito tutte le sue possibili azioni per avere un'ottimale accensione bruciatore.", "action": 'Premere il pulsante di Reset', "comment": 'La scheda ha esaurito tutte le sue possibili azioni per ottenere un ottimale accensione del bruciatore.'},
-    92: {"text1": 'Limite correzione giri ventilatore', "text2": 'La scheda ha raggiunto la correzione massima dei giri ventilatore.', "action": 'La caldaia continua a funzionare.', "comment": 'Il sistema ha esaurito tutte le correzioni possibili del numero di giri del ventilatore.'},
-    93: {"text1": 'Segnale combustione fuori limite', "text2": 'Rilevato segnale di combustione fuori limite.', "action": 'La caldaia continua a funzionare.', "comment": 'Il segnale di combustione viene rilevato fuori dal range di regolazione previsto per un tempo prolungato.'},
-    94: {"text1": 'Anomalia combustione', "text2": 'Rilevato problema combustione causato da sistema o controllo combustione.', "action": 'In caso di ripristino delle condizioni normali la caldaia riparte senza il bisogno di dover essere resettata.', "comment": "Viene rilevato un problema sul controllo combustione che puo' essere causato da: bassa pressione gas, ricircolo fumi, valvola gas o scheda elettronica difettosa."},
-    95: {"text1": 'Segnale combustione discontinuo', "text2": "Rilevata discontinuita' su segnale combustione per problemi su connessioni elettriche o dispersione segnale.", "action": 'La caldaia continua a funzionare.', "comment": "Il sistema rileva una discontinuita' nel segnale di combustione."},
-    96: {"text1": 'Fumisteria ostruita', "text2": 'Rilevata elevata ostruzione su fumisteria.', "action": "La caldaia non parte. Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Si verifica nel caso venga rilevata un ostruzione nel sistema fumario.'},
-    98: {"text1": 'Blocco n° massimo errori software', "text2": 'La scheda elettronica non funziona correttamente.', "action": 'Premere il pulsante di Reset', "comment": 'Viene raggiunto il numero massimo di errori software ammessi.'},
-    99: {"text1": 'Blocco generico', "text2": 'La scheda elettronica non funziona correttamente.', "action": 'Premere il pulsante di Reset', "comment": "Viene rilevata un'anomalia in caldaia."},
-    101: {"text1": 'Allarme off-line Audax', "text2": 'Perdita di comunicazione con pompa di calore', "action": 'La pompa di calore non soddisfa le richieste di riscaldamento e raffrescamento ambiente, una volta ripristinati i collegamenti è necessario spegnere e riaccendere il sistema', "comment": 'Nel caso di caduta di comunicazione, collegamento errato o pompa di calore spenta l’elettronica di caldaia non rileva la pompa di calore'},
-    102: {"text1": 'Allarme off-line espansione zona 1', "text2": 'Perdita di comunicazione con espansione zona 1', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Anomalia comunicazione con zona 1'},
-    103: {"text1": 'Allarme off-line espansione zona 2', "text2": 'Perdita di comunicazione con espansione zona 2', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Anomalia comunicazione con zona 2'},
-    104: {"text1": 'Allarme off-line espansione zona 3', "text2": 'Perdita di comunicazione con espansione zona 3', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Anomalia comunicazione con zona 3'},
-    106: {"text1": 'Allarme sonda sanitario ', "text2": 'Nel caso di integrazione con caldaia e gestione separata del sanitario, la sonda bollitore controllata dal gestore offre un valore resistivo fuori range', "action": 'Il sistema non può produrre acqua calda sanitaria con la pompa di calore. La produzione dell’acqua calda sanitaria viene garantita dalla caldaia', "comment": 'La scheda rileva un’anomalia sulla sonda boiler'},
-    120: {"text1": 'Allarme set elevato per deumidificazione zona 1', "text2": 'Il setpoint calcolato di richiesta zona 1 è troppo elevato per una deumidifica', "action": "Il set di mandata calcolato è superiore al limite ammesso dal deumidificatore. Raffrescare l'ambiente ed attendere che la temperatura di rugiada torni a valori accettabili", "comment": 'Il set di mandata raffreddamento calcolato per la deumidifica è superiore al limite impostato nella zona 1'},
-    121: {"text1": 'Allarme offline dispositivo di zona 1', "text2": 'Il comando remoto o il controllo remoto della zona 1 risulta essere offline', "action": 'Verificare che il controllo remoto sia acceso', "comment": 'Non viene rilevata la comunicazione con il controllo di zona. Non è possibile effettuare la termoregolazione della zona'},
-    122: {"text1": 'Allarme offline dispositivo di zona 2', "text2": 'Il comando remoto o il controllo remoto della zona 2 risulta essere offline', "action": 'Verificare che il controllo remoto sia acceso', "comment": 'Non viene rilevata la comunicazione con il controllo di zona. Non è possibile effettuare la termoregolazione della zona'},
-    123: {"text1": 'Allarme offline dispositivo di zona 3', "text2": 'Il comando remoto o il controllo remoto della zona 3 risulta essere offline', "action": 'Verificare che il controllo remoto sia acceso', "comment": 'Non viene rilevata la comunicazione con il controllo di zona. Non è possibile effettuare la termoregolazione della zona'},
-    125: {"text1": 'Anomalia sonda temperatura ambiente zona 1', "text2": 'La sonda di temperatura ambiente della zona 1 è fuori range', "action": 'Oltre alla temperatura non viene calcolato il punto di rugiada per la zona', "comment": 'Anomalia presente sulla sonda temperatura ambiente zona 1 (optional). Non è possibile effettuare la termoregolazione della zona'},
-    126: {"text1": 'Anomalia sonda temperatura ambiente zona 2', "text2": 'La sonda di temperatura ambiente della zona 2 è fuori range', "action": 'Oltre alla temperatura non viene calcolato il punto di rugiada per la zona', "comment": 'Anomalia presente sulla sonda temperatura ambiente zona 2 (optional). Non è possibile effettuare la termoregolazione della zona'},
-    127: {"text1": 'Anomalia sonda temperatura ambiente zona 3', "text2": 'La sonda di temperatura ambiente della zona 3 è fuori range', "action": 'Oltre alla temperatura non viene calcolato il punto di rugiada per la zona', "comment": 'Anomalia presente sulla sonda temperatura ambiente zona 3 (optional). Non è possibile effettuare la termoregolazione della zona'},
-    129: {"text1": 'Anomalia sonda umidità zona 1', "text2": 'La sonda di umidità ambiente della zona 1 è fuori range', "action": 'Oltre all’umidità non viene calcolato il punto di rugiada per la zona', "comment": 'Anomalia presente sulla sonda umidità zona 1 (optional). Non è possibile effettuare il controllo dell’umidità della zona'},
-    130: {"text1": 'Anomalia sonda umidità zona 2', "text2": 'La sonda di umidità ambiente della zona 2 è fuori range', "action": 'Oltre all’umidità non viene calcolato il punto di rugiada per la zona', "comment": 'Anomalia presente sulla sonda umidità zona 2 (optional). Non è possibile effettuare il controllo dell’umidità della zona'},
-    131: {"text1": 'Anomalia sonda umidità zona 3', "text2": 'La sonda di umidità ambiente della zona 3 è fuori range', "action": 'Oltre all’umidità non viene calcolato il punto di rugiada per la zona', "comment": 'Anomalia presente sulla sonda umidità zona 3 (optional). Non è possibile effettuare il controllo dell’umidità della zona'},
-    132: {"text1": 'Allarme set elevato per deumidifica zona 2', "text2": 'Il setpoint calcolato di richiesta zona 2 è troppo elevato per una deumidifica', "action": "Il set di mandata calcolato è superiore al limite ammesso dal deumidificatore. Raffrescare l'ambiente ed attendere che la temperatura di rugiada torni a valori accettabili", "comment": 'Il set di mandata raffreddamento calcolato per la deumidifica è superiore al limite impostato nella zona 2'},
-    133: {"text1": 'Allarme guasto deumidificatore zona 1', "text2": 'Il deumidificatore della zona 1 è in allarme', "action": 'Il sistema non effettua la deumidificazione nella relativa zona', "comment": 'Anomalia proveniente dal deumidificatore (optional) sulla zona 1'},
-    134: {"text1": 'Allarme guasto deumidificatore zona 2', "text2": 'Il deumidificatore della zona 2 è in allarme', "action": 'Il sistema non effettua la deumidificazione nella relativa zona', "comment": 'Anomalia proveniente dal deumidificatore (optional) sulla zona 2'},
-    135: {"text1": 'Allarme guasto deumidificatore zona 3', "text2": 'Il deumidificatore della zona 3 è in allarme', "action": 'Il sistema non effettua la deumidificazione nella relativa zona', "comment": 'Anomalia proveniente dal deumidificatore (optional) sulla zona 3'},
-    137: {"text1": 'Allarme sistema ripristinato – Riavviare il sistema', "text2": 'Dopo un’operazione di ripristino, che viene eseguita tramite il pannello comandi, viene segnalato allarme in quanto è necessario il riavvio del sistema', "action": 'Spegnere e accendere il sistema', "comment": 'Ad avvenuto ripristino dei parametri di default il sistema necessita di un riavvio'},
-    138: {"text1": 'Scaldamassetto in corso', "text2": 'Funzione di scaldamassetto in corso', "action": '', "comment": ''},
-    139: {"text1": 'Disareazione in corso', "text2": 'Funzione di disareazione in corso', "action": '', "comment": ''},
-    177: {"text1": 'Allarme tempo massimo sanitario', "text2": 'La richiesta sanitario è stata eseguita superando un tempo massimo prestabilito', "action": 'il sistema continua a funzionare con prestazioni non ottimali', "comment": 'Non viene soddisfatta la produzione di acqua calda sanitaria nel tempo prestabilito (5 ore)'},
-    178: {"text1": 'Ciclo di antilegionella senza successo', "text2": 'Il ciclo di antilegionella non si è concluso con successo entro un tempo prestabilito', "action": 'Premere il pulsante di Reset', "comment": 'Il ciclo antilegionella viene eseguito senza successo entro il tempo prestabilito (3 ore)'},
-    179: {"text1": 'Anomalia sonda liquida', "text2": 'La sonda della fase liquida è fuori range.', "action": 'Il sistema non parte. Chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).', "comment": 'La scheda rileva un’anomalia sulla sonda fase liquida'},
-    181: {"text1": 'Perdita comunicazione Comando Remoto zona 2', "text2": 'Non è presente il colloquio tra scheda e remoto zona 2.', "action": 'Togliere e ridare tensione al modulo idronico. Se alla riaccensione non viene rilevato il Comando Remoto il sistema passa in modalità di funzionamento locale quindi utilizzando i comandi presenti sul pannello comandi. In questo caso non è possibile attivare la funzione “Riscaldamento”', "comment": 'Si verifica nel caso di collegamento a un controllo remoto non compatibile, oppure in caso di caduta di comunicazione fra modulo idronico e CARV2 della seconda zona'},
-    182: {"text1": 'Allarme motocondensante', "text2": 'Si verifica un allarme su motocondensante', "action": 'Il sistema non funziona, vedi anomalia sulla motocondensante e relativo libretto istruzioni', "comment": 'Viene segnalata un’anomalia sulla motocondensante'},
-    183: {"text1": 'Allarme motocondensante in testmode', "text2": 'La motocondensante si trova nella modalità TESTMODE', "action": 'Durante questa fase non è possibile soddisfare le richieste di climatizzazione ambiente e produzione acqua calda sanitaria', "comment": 'Viene segnalato che la motocondensante è in fase test mode'},
-    184: {"text1": 'Allarme timeout comunicazione con unità esterna', "text2": 'Perdita di comunicazione con motocondensante', "action": 'Far verificare il collegamento elettrico tra le unità', "comment": 'Viene segnalata l’anomalia per un problema di comunicazione tra unità interna e motocondensante'},
-    185: {"text1": 'Allarme comunicazione safety module', "text2": 'Perdita di comunicazione con safety –module', "action": 'Far verificare il collegamento tra i componenti', "comment": 'Problema nella comunicazione tra scheda regolazione e scheda accensione'},
-    186: {"text1": 'Anomalia alta tensione accenditore', "text2": 'Safety module: si è verificata un’anomalia sulla tensione dell’accenditore', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene segnalata un’anomalia sulla scheda accensione'},
-    187: {"text1": 'Allarme sonda ritorno motocondensante', "text2": 'La sonda di ritorno motocondensante è fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda NTC di ritorno pompa dicalore'},
-    188: {"text1": 'Richiesta fuori dal range di funzionamento', "text2": 'La richiesta effettuata non viene eseguita perché  le condizioni esterne non consentono l’attivazione della motocondensante', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'Viene fatta una richiesta riscaldamento o raffrescamento con temperatura esterna al di fuori dei limiti di funzionamento'},
-    189: {"text1": 'Allarme timeout comunicazione con scheda comunicazione', "text2": 'Perdita di comunicazione con scheda di comunicazione x motocondensante', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'In caso di caduta di comunicazione tra le schede elettroniche viene segnalata l’anomalia'},
-    191: {"text1": 'Caduta comunicazione RF verso CAR v2 RF zona 2', "text2": 'La comunicazione tra base trasmittente e CAR v2 RF della zona 2 è caduta', "action": 'Verificare il funzionamento del CAR Wireless, verificare la carica delle batterie (vedere il relativo libretto istruzioni)', "comment": 'In caso di caduta di comunicazione tra unità interna e CAR versione Wireless della seconda zona viene segnalata l’anomalia, da questo momento è possibile controllare il sistema unicamente attraverso il pannello comandi dell’unità interna stessa'},
-    192: {"text1": 'Anomalia sonda mandata motocondensante', "text2": 'La sonda di mandata motocondensante è fuori range', "action": "Se il blocco o l'anomalia persiste e' necessario chiamare una impresa abilitata (ad esempio il Servizio Assistenza Tecnica Immergas).", "comment": 'La scheda rileva un’anomalia sulla sonda NTC mandata pompa di calore'},
-    193: {"text1": 'Apparecchio in Testmode', "text2": 'L’apparecchio viene controllato da un dispositivo esterno tramite protocollo Opentherm', "action": 'Il sistema continua a funzionare correttamente', "comment": 'Viene segnalato che l’apparecchio è in fase test mode'},
-    194: {"text1": 'Audax Pro disabilitata', "text2": 'La motocondensante Audax Pro è stata disabilitata', "action": 'Il sistema continua a funzionare correttamente', "comment": 'Viene segnalato che la motocondensante è stata disabilitata tramite l’apposito ingresso in morsettiera'},
-    195: {"text1": 'Anomalia bassa temp.  fase liquida ', "text2": 'La temp. della sonda fase liquida è troppo bassa ', "action": 'Verificare il buon funzionamento del circuito frigorifero', "comment": 'Viene rilevata una temperatura troppo bassa nella fase liquida'},
-    196: {"text1": 'Blocco temp. mandata elevata', "text2": 'Viene rilevata una temperatura troppo elevata sul circuito di ritorno della pompa di calore', "action": 'Verificare il buon funzionamento del circuito frigorifero', "comment": 'Viene rilevata una temperatura troppo elevata sul circuito di mandata della pompa di calore'},
-}
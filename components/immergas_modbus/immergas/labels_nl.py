@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: nl)"""
-
-immergas_labels = {
-    'default': {"text1": 'Algemeen probleem niet erkend', "text2": 'Controleer foutentabel of geselecteerde kaart', "action": 'Controleer foutentabel of geselecteerde kaart', "comment": 'Geen enkele opmerking hierover'},
-    0: {"text1": 'SYSTEEM OK', "text2": 'Systeem werkt correct', "action": 'Geen actie gevraagd', "comment": 'Geen probleem'},
-    1: {"text1": 'Blokkering geen inschakeling', "text2": 'Geen detectie vlam aan einde laatste poging tot inschakeling', "action": 'Druk op de Resetknop', "comment": 'Bij een aanvraag voor verwarming van de omgeving of productie van sanitair warm water gaat de ketel niet binnen de vooraf bepaalde tijd aan. Bij de eerste inschakeling of na langdurige inactiviteit van het toestel kan het nodig zijn om in te grijpen om de blokkering uit te schakelen.'},
-    2: {"text1": 'Blokkering veiligheidsthermostaat (te hoge temperatuur)', "text2": 'Inwerkingtreding veiligheidsthermostaat', "action": 'Druk op de Resetknop', "comment": 'Indien tijdens de normale werking wegens een probleem een overmatige verhitting in de ketel optreedt, gaat de ketel in blokkering.'},
-    3: {"text1": 'Blokkering thermostaat rookgassen', "text2": 'Inwerkingtreding thermostaat rookgassen', "action": 'Druk op de Resetknop (Nike-versies)/ Configureer de parameter P.14 op correcte wijze. Druk indien nodig op de Reset-knop (Star-versies)', "comment": 'Indien tijdens de normale werking wegens een probleem een overmatige verhitting van de rookgassen optreedt, gaat de ketel in blokkering. (Nike-versies)/ Foutieve configuratie parameter P.14 (Star-versie)'},
-    4: {"text1": 'Blokkering weerstand contacten', "text2": 'Er is een probleem op het stuurcircuit van de gasklep gedetecteerd', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De elektronische kaart detecteert een probleem bij de voeding van de gasklep. Controleer de aansluiting van deze klep. (het probleem wordt enkel gedetecteerd en weergegeven indien er een aanvraag is).'},
-    5: {"text1": 'Probleem sonde aanvoer', "text2": 'De sonde van de aanvoer geeft een weerstandwaarde buiten de range aan', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De kaart detecteert een probleem op de NTC-sonde aanvoer.'},
-    6: {"text1": 'Probleem sonde sanitair', "text2": 'De sonde van het sanitair geeft een weerstandwaarde buiten de range aan', "action": 'De ketel blijft verder sanitair warm water produceren maar niet met optimale prestaties. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De kaart detecteert een probleem op de NTC-sonde sanitair.'},
-    8: {"text1": 'Maximum aantal resets', "text2": 'Duidt op het bereiken van het maximum aantal resets dat door de geïntegreerde kaart toegestaan wordt.', "action": 'Let op: u kunt het probleem tot 5 keer achter elkaar resetten, daarna is de functie minstens een uur niet beschikbaar en krijgt u opnieuw de kans om maximaal 5 pogingen per uur te proberen. Door de voeding naar het toestel uit te schakelen en weer in te schakelen, krijgt u opnieuw 5 pogingen.', "comment": 'Aantal beschikbare resets die al uitgevoerd zijn.'},
-    10: {"text1": 'Onvoldoende druk installatie', "text2": 'Het contact van de drukmeter van de installatie is geopend', "action": 'Controleer op de manometer van de ketel of de druk van de installatie tussen 1÷1,2 bar ligt en herstel eventueel de correcte druk.', "comment": 'Er wordt geen waterdruk gedetecteerd in het verwarmingscircuit die voldoende is om de correcte werking van de ketel te garanderen.'},
-    11: {"text1": 'Probleem drukregelaar rookgassen', "text2": 'Mogelijk probleem op drukregelaar rookgassen of op ventilator', "action": 'Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'Als de normale werkingscondities worden hersteld, start de ketel opnieuw zonder dat u die moet resetten'},
-    12: {"text1": 'Probleem sonde boiler', "text2": 'De sonde van de boiler geeft een weerstandwaarde buiten de range aan', "action": 'De ketel kan geen warm sanitair water produceren. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De kaart detecteert een probleem op de sonde van de boiler'},
-    13: {"text1": 'Debietmeter lucht/rookgassen buiten range', "text2": 'Het signaal lucht/rookgassen is buiten range of met stilstaande ventilator leest de besturing een te hoog signaal', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Met stilstaande ventilator leest de controle van lucht/rookgassen een te hoog signaal (contacten drukschakelaar vastgeplakt)'},
-    15: {"text1": 'Configuratiefout', "text2": 'De kaart bemerkt een incongruentie tussen haar configuratie en de binnenkomende signalen.', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten. Controleer of de ketel correct geconfigureerd is. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'Als de kaart een probleem of een incongruentie detecteert op de elektrische bekabeling, start de ketel niet.'},
-    16: {"text1": 'Probleem ventilator', "text2": 'De ventilator blijkt te draaien wanneer hij niet gevoed wordt of blijkt stil te staan als hij gevoed wordt.', "action": 'Druk op de Resetknop. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'Treedt op wanneer de ventilator een mechanisch of elektronisch defect voorheeft.'},
-    17: {"text1": 'Snelheid van ventilator niet correct', "text2": 'Het aantal toeren van de ventilator ligt buiten de correcte range', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Aantal toeren van de ventilator niet correct'},
-    20: {"text1": 'Blokkering waakvlam', "text2": 'Afwijkende vlamdetectie', "action": 'Druk op de Resetknop. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'Treedt op bij verlies van het circuit voor detectie of probleem bij controle van de vlam.'},
-    23: {"text1": 'Probleem sonde terugkeer', "text2": 'De sonde terugkeer geeft een weerstandwaarde buiten de range aan', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De kaart detecteert een probleem op de NTC-sonde aanvoer.'},
-    24: {"text1": 'Probleem toetsenbord', "text2": 'Er wordt een continue druk op de knoppen van het bedieningspaneel gedetecteerd', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De kaart detecteert een probleem op het toetsenbord.'},
-    25: {"text1": 'Blokkering rooksonde /blokkering CRC (TERA)', "text2": 'Temperatuur rookgassen buiten range / corrupt geheugen (TERA)', "action": 'Druk op de Resetknop', "comment": 'Gradiënt rookgassen hoog, mogelijke blokkering circulatiepomp of gebrek aan water / corrupt geheugen'},
-    27: {"text1": 'Onvoldoende circulatie', "text2": 'Oververhitting van de ketel te wijten aan geringe circulatie in het primaire circuit', "action": 'Druk op de Resetknop', "comment": 'Controleer of er geen onderbrekingen zijn op het verwarmingscircuit en/of controleer of de circulatiepomp correct werkt'},
-    28: {"text1": 'Lek sanitair circuit', "text2": 'Als er tijdens de werking in verwarmingsfase een toename van de temperatuur van het sanitaire water wordt vastgesteld, signaleert de ketel het probleem en vermindert de temperatuur van de verwarming om kalkvorming in de warmtewisselaar te beperken.', "action": 'Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'Controleer of alle kranen van de sanitaire installatie gesloten zijn ofwel of ze niet druppelen; controleer in ieder geval of er in de installatie geen lekken zijn. De ketel gaat opnieuw normaal werken wanneer de optimale condities op de sanitaire installatie eenmaal zijn hersteld'},
-    29: {"text1": 'Probleem sonde rookgassen', "text2": 'De sonde van de rookgassen geeft een weerstandwaarde buiten de range aan', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'De kaart detecteert een probleem op de sonde van de rookgassen.'},
-    31: {"text1": 'Verlies van communicatie met de CARV2', "text2": 'Er is geen dialoog tussen de kaart en de remote aanwezig.', "action": 'De spanning van de ketel uit- en weer inschakelen. Als de afstandsbediening bij de hernieuwde inschakeling niet wordt gedetecteerd, gaat de ketel over naar de lokale werkwijze en moeten dus de bedieningselementen gebruikt worden die op het bedieningspaneel aanwezig zijn. In dit geval is het niet mogelijk om de functie “Verwarming” te activeren.', "comment": 'Doet zich voor in geval van aansluiting op een niet-compatibele afstandsbediening, ofwel wanneer de communicatie tussen de ketel en de CARV2 is weggevallen.'},
-    32: {"text1": 'Storing sonde Zone 2 lage temperatuur', "text2": 'Sonde aanvoer zone 2 buiten range', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Als de kaart een storing op de sonde zone 2 lage temperatuur detecteert, kan het systeem in de betreffende zone niet werken'},
-    33: {"text1": 'Storing sonde zone 3 lage temperatuur', "text2": 'Sonde aanvoer zone 3 buiten range', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Als de kaart een storing op de sonde zone 2 lage temperatuur detecteert, kan het systeem in de betreffende zone niet werken'},
-    36: {"text1": 'Communicatie IMG Bus weggevallen', "text2": 'Verlies van communicatie op het protocol IMG Bus.', "action": 'De ketel voldoet niet aan de aanvragen voor verwarming', "comment": 'Omwille van een probleem op de centrale van de ketel, op de zonekaart (optie) of op de IMG Bus is de communicatie tussen de verschillende componenten verbroken.'},
-    37: {"text1": 'Lage voedingsspanning', "text2": 'De voedingsspanning van de kaart heeft waarden die lager zijn dan de toegestane limieten.', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten.', "comment": 'Treedt op wanneer de voedingsspanning lager is dan de toegelaten limieten voor een correcte werking van de ketel.'},
-    38: {"text1": 'Verlies herhaaldelijk ', "text2": 'Na een correcte vlamstroomwaarde aangekoppeld te hebben, signaleert de kaart een val van de vlamstroom.', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten.', "comment": 'Treedt op wanneer de ketel correct is aangezet en de vlam van de brander onverwacht uitgaat; er wordt opnieuw geprobeerd om aan te steken, wanneer de normale omstandigheden van de ketel terugkeren moet die niet worden gereset.'},
-    39: {"text1": 'Storing sonde solarcollector', "text2": 'De externe sonde geeft een weerstandwaarde buiten de range aan', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een storing op de sonde van de solarcollector, de ketel blijft verder normaal werken zonder aanvoer van zonne-energie voor de verwarming van het sanitair warm water omdat de solarpomp niet langer werkt.'},
-    40: {"text1": 'Storing sonde solar-accumulatie', "text2": 'De sonde van de solar-accumulatie geeft een weerstandwaarde buiten de range aan', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een storing op de sonde van de solar-accumulatie, de ketel blijft verder normaal werken zonder aanvoer van zonne-energie voor de verwarming van het sanitair warm water omdat de solarpomp niet langer werkt.'},
-    41: {"text1": 'Hoge temperatuur op solarcollector', "text2": 'De solarcollector heeft de ingestelde maximumtemperatuur bereikt', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Treedt op wanneer de temperatuur van de solarcollector de ingestelde maximumlimiet overschrijdt'},
-    42: {"text1": 'Hoge temperatuur op solar-accumulatie', "text2": 'De solaraccumulatie heeft de ingestelde maximumtemperatuur overschreden', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Treedt op wanneer de temperatuur van het water in de solar-accumulatie de ingestelde maximumlimiet overschrijdt.'},
-    43: {"text1": 'Blokkering wegens verlies signaal van de vlam', "text2": 'Verlies vlamsignaal in werking op bedrijfssnelheid gedurende meerdere achtereenvolgende malen.', "action": 'Druk op de resetknop; vooraleer opnieuw te starten, voert de ketel een naventilatiecyclus uit.', "comment": 'Treedt op wanneer binnen een bepaalde periode herhaaldelijk de fout “Verlies vlamsignaal” optreedt.'},
-    44: {"text1": 'Blokkering wegens overschrijding accumulatie maximale tijd opeenvolgend openen van de gasklep', "text2": 'De accumulatie van de totale tijd van opening van de gasklep zonder vlamdetectie is groter dan de maximaal toegestane tijd.', "action": 'Druk op de Resetknop.', "comment": 'Treedt op wanneer de gasklep open blijft gedurende een langere tijd dan voorzien voor de normale werking zonder dat de ketel ingeschakeld wordt.'},
-    45: {"text1": 'hoge dT', "text2": 'Het gemeten temperatuurverschil tussen aanvoer en terugkeer is ≥ 40°C.', "action": 'Het vermogen van de brander wordt beperkt om eventuele beschadigingen aan de condensatiemodule te voorkomen , als de correcte dT eenmaal weer hersteld is keert de ketel terug naar de gewone werking. Controleer of er water in de ketel circuleert, of de circulator geconfigureerd is volgens de vereisten van het systeem en of de sonde van de terugkeer correct werkt.', "comment": 'De ketel detecteert een onverwachte en niet beoogde verhoging van dT tussen sonde aanvoer en sonde terugkeer installatie'},
-    46: {"text1": 'Interventie thermostaat lage temperatuur / Verkeerde configuratie kabels/kaart', "text2": 'De veiligheidsthermostaat op de aansluiting van de aanvoer van de ketel naar DIM v2 (werkt uitsluitend met lage temperatuur) heeft hoge temperaturen bereikt. / Onjuiste bekabeling of gebruik van verkeerde kaart', "action": 'In dit geval kan de thermostaat na de afkoeling gereset worden (zie bijsluiter). / Als de blokkering of storing blijft, een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Indien tijdens de normale werking op lage temperatuur wegens een storing de temperatuur van de aanvoer overmatig stijgt, wordt de ketel geblokkeerd. / Onjuiste bekabeling of gebruik van verkeerde kaart'},
-    47: {"text1": 'Beperking vermogen van de brander', "text2": 'Als de temperatuur van de rookgassen en hoge waarde bereikt, verlaagt de kaart het door de brander afgegeven vermogen om beschadigingen van het rookgascircuit te beperken.', "action": 'Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Wanneer een hoge temperatuur van de rookgassen gedetecteerd wordt, vermindert de ketel het afgegeven vermogen om geen schade op te lopen.'},
-    48: {"text1": 'Storing sonde aanvoer installatiezijde', "text2": 'De sonde van de aanvoer geeft een weerstandwaarde buiten de range aan', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Wanneer de aanvoersonde installatiezijde niet aangesloten of defect is, wordt de storing gesignaleerd'},
-    49: {"text1": 'Blokkering hoge temperatuur op afvoersonde', "text2": 'Temperatuur gemeten door de afvoersonde hoog', "action": 'Controleer de correcte circulatie in de ketel en de goede werking van de driewegklep.', "comment": 'Treedt op wanneer er een te hoge temperatuur op het afvoercircuit van de warmtewisselaar wordt bereikt'},
-    50: {"text1": 'Storing externe sonde', "text2": 'De externe sonde geeft een weerstandwaarde buiten de range aan', "action": 'Controleer de aansluiting van de externe sonde. De ketel gaat door met werken', "comment": 'Wanneer de externe sonde niet aangesloten of defect is, wordt de storing gesignaleerd'},
-    51: {"text1": 'Communicatie met CAR Wireless weggevallen', "text2": 'De communicatie tussen zenderbasis en CAR v2 RF is weggevallen.', "action": 'Controleer de werking van de CAR Wireless, controleer of de batterijen opgeladen zijn (zie betreffende instructiehandleiding).', "comment": 'Wanneer de communicatie tussen de ketel en de CAR versie Wireless wegvalt, wordt het probleem gesignaleerd. Vanaf dat ogenblik kan het systeem enkel gecontroleerd worden via het bedieningspaneel op de ketel.'},
-    54: {"text1": 'Storing sonde puffer', "text2": 'De sonde van de puffer geeft een weerstandwaarde buiten de range aan', "action": 'De modus puffer wordt gedeactiveerd', "comment": 'Wanneer de sonde van de puffer niet aangesloten of defect is, wordt de storing gesignaleerd'},
-    55: {"text1": 'Storing temperatuursonde aanvoer zone 1', "text2": 'De aanvoersonde zone 1 geeft een weerstandwaarde buiten de range aan', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Als de kaart een storing op de sonde zone 1 lage temperatuur detecteert, kan het systeem in de betreffende zone niet werken.'},
-    58: {"text1": 'Storing Audax', "text2": 'Signalering afwijking van de warmtepomp AUDAX verbonden met het systeem', "action": 'De ketel voldoet niet aan de aanvragen voor verwarming en koeling van de omgeving, eenmaal de verbindingen hersteld zijn, moet u de ketel uit- en opnieuw aanzetten', "comment": 'Afwijking op de warmtepomp Audax, controleer de aard van het probleem rechtstreeks op het display van de warmtepomp'},
-    59: {"text1": 'Blokkering netfrequentie elektrische voeding', "text2": 'De elektronische kaart heeft een afwijkende frequentie op het elektrische voedingsnet gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een afwijkende frequentie op het elektrische voedingsnet.'},
-    60: {"text1": 'Probleem circulator geblokkeerd', "text2": 'De modulerende circulator blijkt stil te staan.', "action": 'Probeer de circulator te deblokkeren zoals in de betreffende paragraaf beschreven wordt. Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten.', "comment": 'De circulator blijkt stil te staan wegens een van de volgende oorzaken: waaier geblokkeerd, elektrisch defect.'},
-    61: {"text1": 'Lucht aanwezig in de circulator', "text2": 'De modulerende circulator blijkt stil te staan wegens gedetecteerde werking in lucht.', "action": 'Voer de ontluchting van de circulator en van het verwarmingscircuit uit. Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten.', "comment": 'Er wordt lucht binnenin de circulator gedetecteerd; de circulator kan niet werken.'},
-    62: {"text1": 'Aanvraag volledige afstelling', "text2": 'De kaart heeft niet de correcte configuratie van de parameters voor controle verbranding.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt vastgesteld dat de elektronische kaart niet afgesteld is. Dit kan zich voordoen in geval de elektronische kaart wordt vervangen of wanneer de parameters in de sectie lucht/gas worden gewijzigd, waardoor een “volledige afstelling” nodig is.'},
-    63: {"text1": 'Storing sonde afvoer installatie', "text2": 'De sonde van de afvoer geeft een weerstandwaarde buiten de range aan', "action": 'De ketel blijft verder werken zonder integratie door de aangesloten externe systemen', "comment": 'Wanneer de afvoersonde niet aangesloten of defect is, wordt de storing gesignaleerd'},
-    67: {"text1": 'Afwijking drukregelaar solarinstallatie', "text2": 'Drukregelaar installatie open, mogelijk gebrek aan vloeistof', "action": 'Controleer op de manometer van de solarcirculatiegroep of de druk op de correcte waarde is', "comment": 'Omwille van een drukval in het solarcircuit blokkeert de drukregelaar de werking van het thermische solarcircuit'},
-    70: {"text1": 'Sondes omgewisseld', "text2": 'In geval van een fout in de aansluiting van de bekabeling van de ketel, wordt de fout gedetecteerd', "action": 'De ketel start niet. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus opbellen (bijvoorbeeld de technische dienst van Immergas).', "comment": ' Controleer de aansluiting van de sonde voor aanvoer en voor retour'},
-    72: {"text1": 'Aanvraag snelle afstelling', "text2": 'De kaart heeft niet de correcte configuratie van de parameters voor controle verbranding.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een wijziging van bepaalde parameters vastgesteld, waardoor een “snelle afstelling” nodig is.'},
-    73: {"text1": 'Hoge afwijking vastgesteld sonde aanvoer en veiligheidssonde aanvoer.', "text2": 'De aanvoersondes vertonen een hoge afwijking.', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten', "comment": 'De kaart detecteert een probleem tijdens het lezen van de temperaturen van de NTC-sonde voor aanvoer; mogelijke oorzaken zijn: sonde defect, onjuiste positionering, weinig circulatie in het systeem, verstopping aan de kant van het water van de primaire warmtewisselaar.'},
-    74: {"text1": 'Probleem veiligheidssonde aanvoer', "text2": 'De veiligheidssonde van de aanvoer geeft een weerstandwaarde buiten de range aan', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een probleem op de NTC-veiligheidssonde aanvoer'},
-    75: {"text1": 'Blokkering wegens NTC-sensor beschadigd ', "text2": 'Mogelijke breuk van een of beide sondes voor aanvoer en retour van de installatie', "action": 'De ketel start niet. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus opbellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De sensor van de veiligheidssonde veroorzaakt een hoge temperatuurgradiënt'},
-    76: {"text1": 'Afwijking sonde aanvoer of sonde retour', "text2": 'Er wordt een werkingsstoring van een of beide sondes voor aanvoer en retour van de installatie gedetecteerd', "action": 'De ketel start niet. Als de blokkering of het probleem aanhoudt, moet u een erkend bedrijf opbellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Groter verschil in vergelijking met het verschil ingesteld tussen sonde aanvoer en retour in geval van een warmteaanvraag'},
-    77: {"text1": 'Probleem controle verbranding', "text2": 'Stroom gasklep buiten range gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een stroom buiten de range op de gasklep gedetecteerd.'},
-    78: {"text1": 'Probleem controle verbranding', "text2": 'Hoge stroom gasklep gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een hoge stroom op de gasklep gedetecteerd'},
-    79: {"text1": 'Probleem controle verbranding', "text2": 'Lage stroom gasklep gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een beperkte stroom op de gasklep gedetecteerd'},
-    80: {"text1": 'Blokkering werkingsstoring elektronische kaart', "text2": 'Defect op driver elektronische gasklep gedetecteerd wegens problemen op kaart of gasklep.', "action": 'Druk op de Resetknop', "comment": 'Dit probleem treedt op in geval van een werkingsstoring van de elektronische kaart die de klep controleert.'},
-    84: {"text1": 'Probleem met de verbranding - vermindering van het vermogen', "text2": 'Omstandigheden te wijten aan lage toevoerdruk gasklep gedetecteerd.', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten', "comment": 'Er wordt een lage toevoerdruk op het gasnet vastgesteld. Bijgevolg wordt het vermogen van het toestel beperkt en het probleem gesignaleerd.'},
-    85: {"text1": 'Blokkering probleem naverbranding', "text2": 'Potentieel probleem gasklep, elektrode of elektronische kaart', "action": 'Druk op de Resetknop. Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas)', "comment": 'Vlam aanwezig na het sluiten van de gasklep'},
-    87: {"text1": 'Blokkering controle gasklep', "text2": 'Defect op controle gasklep gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een werkingsstoring vastgesteld van een van de componenten die de gasklep controleren.'},
-    88: {"text1": 'Blokkering controle gasklep', "text2": 'Defect op controle gasklep gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een werkingsstoring vastgesteld van een van de componenten die de gasklep controleren.'},
-    89: {"text1": 'Signalering onstabiele verbranding', "text2": 'Instabiliteit op verbrandingssignaal gedetecteerd.', "action": 'De ketel gaat door met werken.', "comment": 'De vlam is onstabiel omwille van: recirculatie van rookgassen, wind, onstabiele gasdruk, onstabiele snelheid van de ventilator of omwille van een werkingsstoring van het systeem.'},
-    90: {"text1": 'Signalering verbranding buiten limiet', "text2": 'Verbrandingssignaal buiten limiet gedetecteerd.', "action": 'De ketel gaat door met werken.', "comment": 'Het signaal van de verbranding wordt gedurende een lange tijd buiten de voorziene afstellingsrange gedetecteerd.'},
-    91: {"text1": 'Blokkering inschakeling niet correct', "text2": 'De kaart heeft vergeefs alle mogelijke acties geprobeerd om een optimale inschakeling van de brander te verkrijgen.', "action": 'Druk op de Resetknop', "comment": 'De kaart heeft vergeefs alle mogelijke acties geprobeerd om een optimale inschakeling van de brander te verkrijgen.'},
-    92: {"text1": 'Limiet correctie toeren ventilator', "text2": 'De kaart heeft de maximum correctie van het ventilatortoerental bereikt.', "action": 'De ketel gaat door met werken.', "comment": 'Het systeem heeft vergeefs alle mogelijke correcties van het toerental van de ventilator geprobeerd.'},
-    93: {"text1": 'Signalering verbranding buiten limiet', "text2": 'Verbrandingssignaal buiten limiet gedetecteerd.', "action": 'De ketel gaat door met werken.', "comment": 'Het signaal van de verbranding wordt gedurende een lange tijd buiten de voorziene afstellingsrange gedetecteerd.'},
-    94: {"text1": 'Probleem verbranding', "text2": 'Probleem met verbranding gedetecteerd, veroorzaakt door systeem of controle verbranding.', "action": 'Wanneer de normale omstandigheden terugkeren, start de ketel opnieuw zonder dat u hoeft te resetten.', "comment": 'Er wordt een probleem gedetecteerd op de controle van de verbranding, dat te wijten kan zijn aan: lage gasdruk, recirculatie van rookgassen, gasklep of elektronische kaart defect.'},
-    95: {"text1": 'Signalering discontinue verbranding', "text2": 'Discontinuïteit op verbrandingssignaal gedetecteerd wegens problemen op elektrische verbindingen of verlies signaal.', "action": 'De ketel gaat door met werken.', "comment": 'Het systeem detecteert een discontinuïteit in het signaal van de verbranding.'},
-    96: {"text1": 'Rookkanaal verstopt', "text2": 'Hoge obstructie in rookgassensysteem gedetecteerd.', "action": 'De ketel start niet Als de blokkering of het probleem aanhoudt, moet u een bevoegde technicus bellen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Dit treedt op wanneer een obstructie in het rookgassensysteem wordt vastgesteld.'},
-    98: {"text1": 'Blokkering maximumaantal softwarefouten', "text2": 'De elektronische kaart werkt niet correct.', "action": 'Druk op de Resetknop', "comment": 'Het maximumaantal toegestane softwarefouten is bereikt.'},
-    99: {"text1": 'Algemene blokkering', "text2": 'De elektronische kaart werkt niet correct.', "action": 'Druk op de Resetknop', "comment": 'Er wordt een probleem in de ketel vastgesteld.'},
-    101: {"text1": 'Alarm off-line Audax', "text2": 'Verlies van communicatie met warmtepomp', "action": 'De ketel voldoet niet aan de aanvragen voor verwarming en koeling van de omgeving, eenmaal de verbindingen hersteld zijn, moet u de ketel uit- en opnieuw aanzetten', "comment": 'Als communicatie wegvalt, bij een foutieve aansluiting of als de warmtepomp uit is, kan de elektronica van de ketel de warmtepomp niet detecteren'},
-    102: {"text1": 'Alarm off-line uitbreiding Zone 1', "text2": 'Verlies van communicatie met uitbreiding zone 1', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Afwijking communicatie met zone 1'},
-    103: {"text1": 'Alarm off-line uitbreiding zone 2', "text2": 'Verlies van communicatie met uitbreiding zone 2', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Afwijking communicatie met zone 2'},
-    104: {"text1": 'Alarm off-line uitbreiding Zone 3', "text2": 'Verlies van communicatie met uitbreiding zone 3', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Afwijking communicatie met zone 3'},
-    106: {"text1": 'Alarm sonde sanitair', "text2": 'Bij integratie van een ketel en gescheiden beheer van het sanitair, biedt de boilersonde, gecontroleerd door de beheerder, een weerstandwaarde buiten range', "action": 'Het systeem kan sanitair warm water produceren met de warmtepomp. De productie van het sanitair warm water wordt door de ketel verzekerd', "comment": 'De kaart detecteert een storing op de sonde van de boiler'},
-    120: {"text1": 'Alarm instelling hoog voor ontvochtiging van zone 1', "text2": 'Het berekende setpoint voor aanvraag zone 1 is te hoog voor een ontvochtiging', "action": 'De berekende instelling voor de aanvoer is hoger dan de toegelaten limiet van de ontvochtiger. Koel de omgeving en wacht tot de dauwtemperatuur op een aanvaardbare waarde terugkeert', "comment": 'De instelling voor aanvoer van koude lucht, berekend voor de ontvochtiging, is hoger dan de limiet ingesteld in de zone 1'},
-    121: {"text1": 'Alarm offline apparaat van zone 1', "text2": 'De afstandsbediening van zone 1 is offline', "action": 'Controleer of de afstandsbediening aan staat', "comment": 'Er wordt geen communicatie vastgesteld met de bediening van de zone. De warmteregeling van de zone kan niet worden uitgevoerd'},
-    122: {"text1": 'Alarm offline apparaat van zone 2', "text2": 'De afstandsbediening van zone 2 is offline', "action": 'Controleer of de afstandsbediening aan staat', "comment": 'Er wordt geen communicatie vastgesteld met de bediening van de zone. De warmteregeling van de zone kan niet worden uitgevoerd'},
-    123: {"text1": 'Alarm offline apparaat van zone 3', "text2": 'De afstandsbediening van zone 3 is offline', "action": 'Controleer of de afstandsbediening aan staat', "comment": 'Er wordt geen communicatie vastgesteld met de bediening van de zone. De warmteregeling van de zone kan niet worden uitgevoerd'},
-    125: {"text1": 'Storing sonde omgevingstemperatuur zone 1', "text2": 'De sonde van de omgevingstemperatuur van zone 1 is buiten range', "action": 'Naast de vochtigheid wordt het dauwpunt niet berekend voor de zone', "comment": 'Storing aanwezig op de sonde van de omgevingstemperatuur zone 1 (optie). De warmteregeling van de zone kan niet worden uitgevoerd'},
-    126: {"text1": 'Storing sonde omgevingstemperatuur zone 2', "text2": 'De sonde van de omgevingstemperatuur van zone 2 is buiten range', "action": 'Naast de vochtigheid wordt het dauwpunt niet berekend voor de zone', "comment": 'Storing aanwezig op de sonde van de omgevingstemperatuur zone 2 (optie). De warmteregeling van de zone kan niet worden uitgevoerd'},
-    127: {"text1": 'Storing sonde omgevingstemperatuur zone 3', "text2": 'De sonde van de omgevingstemperatuur van zone 3 is buiten range', "action": 'Naast de vochtigheid wordt het dauwpunt niet berekend voor de zone', "comment": 'Storing aanwezig op de sonde van de omgevingstemperatuur zone 3 (optie). De warmteregeling van de zone kan niet worden uitgevoerd'},
-    129: {"text1": 'Storing sonde vochtigheid zone 1', "text2": 'De sonde van de omgevingsvochtigheid van zone 1 is buiten range', "action": 'Naast de vochtigheid wordt het dauwpunt niet berekend voor de zone', "comment": 'Storing aanwezig op de sonde van de vochtigheid zone 1 (optie). De controle van de vochtigheid van de zone kan niet worden uitgevoerd'},
-    130: {"text1": 'Storing sonde van de vochtigheid zone 2', "text2": 'De sonde van de omgevingsvochtigheid van zone 2 is buiten range', "action": 'Naast de vochtigheid wordt het dauwpunt niet berekend voor de zone', "comment": 'Storing aanwezig op de sonde van de vochtigheid zone 2 (optie). De controle van de vochtigheid van de zone kan niet worden uitgevoerd'},
-    131: {"text1": 'Storing vochtigheidssonde zone 3', "text2": 'De sonde van de omgevingsvochtigheid van zone 3 is buiten range', "action": 'Naast de vochtigheid wordt het dauwpunt niet berekend voor de zone', "comment": 'Storing aanwezig op de vochtigheidssonde zone 3 (optie). De controle van de vochtigheid van de zone kan niet worden uitgevoerd'},
-    132: {"text1": 'Alarm instelling hoog voor ontvochtiging van zone 2', "text2": 'Het berekende setpoint voor aanvraag zone 2 is te hoog voor een ontvochtiging', "action": 'De berekende instelling voor de aanvoer is hoger dan de toegelaten limiet van de ontvochtiger. Koel de omgeving en wacht tot de dauwtemperatuur op een aanvaardbare waarde terugkeert', "comment": 'De instelling voor aanvoer van koude lucht, berekend voor de ontvochtiging, is hoger dan de limiet ingesteld in de zone 2'},
-    133: {"text1": 'Alarm defect ontvochtiger zone 1', "text2": 'Alarm van de ontvochtiger van zone 1', "action": 'Het systeem onttrekt geen vocht in de betreffende zone', "comment": 'Storing afkomstig van de ontvochtiger (optie) op de zone 1'},
-    134: {"text1": 'Alarm defect ontvochter zone 2', "text2": 'Alarm van de ontvochtiger van zone 2', "action": 'Het systeem onttrekt geen vocht in de betreffende zone', "comment": 'Storing afkomstig van de ontvochtiger (optie) op de zone 2'},
-    135: {"text1": 'Alarm defect ontvochtiger zone 3', "text2": 'Alarm van de ontvochtiger van zone 3', "action": 'Het systeem onttrekt geen vocht in de betreffende zone', "comment": 'Storing afkomstig van de ontvochtiger (optie) op de zone 3'},
-    137: {"text1": 'Alarm systeem gereset – Systeem opnieuw starten', "text2": 'Na een reset die wordt uitgevoerd via het bedieningspaneel, wordt een alarm gemeld omdat het systeem opnieuw moet worden gestart.', "action": 'Schakel het systeem uit en weer in', "comment": 'Na de reset van de standaardparameters, is een nieuwe start van het systeem vereist'},
-    138: {"text1": 'Dekvloerverwarming in uitvoering', "text2": 'Functie dekvloerverwarming in uitvoering', "action": '', "comment": ''},
-    139: {"text1": 'Ontluchting in uitvoering', "text2": 'Functie ontluchting in uitvoering', "action": '', "comment": ''},
-    177: {"text1": 'Alarm maximumtijd sanitair', "text2": 'Bij het uitvoeren van de aanvraag voor sanitair water werd de ingestelde maximumtijd overschreden', "action": 'Het systeem blijft verder werken met prestaties die niet optimaal zijn (1)', "comment": 'Aan de productie van sanitair warm water wordt niet binnen de vooraf bepaalde tijd (5 uur) voldaan'},
-    178: {"text1": 'Antilegionellacyclus niet correct uitgevoerd', "text2": 'De antilegionellacyclus werd binnen een vooraf bepaalde tijd niet met succes afgerond', "action": 'Druk op de Resetknop', "comment": 'De antilegionella-cyclus wordt zonder succes binnen de vooraf bepaalde tijd uitgevoerd (3 uur)'},
-    179: {"text1": 'Storing sonde vloeibaar', "text2": 'De sonde van de vloeibare fase is buiten range.', "action": 'Het systeem start niet. U moet een bevoegd bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een storing op de sonde van de vloeibare fase'},
-    181: {"text1": 'Verlies communicatie afstandsbediening zone 2', "text2": 'Er is geen dialoog tussen de kaart en de remote zone 2 aanwezig.', "action": "Sluit de spanning van de hydromodule af en voed opnieuw. Als de afstandsbediening bij het starten niet wordt gedetecteerd, gaat het systeem over naar de lokale werkwijze en moet u de commando's op het bedieningspaneel gebruiken. In dit geval is het niet mogelijk om de functie “Verwarming”, te activeren", "comment": 'Doet zich voor in geval van aansluiting op een niet-compatibele afstandsbediening, ofwel wanneer de communicatie tussen de hydromodule en de CARV2 van de tweede zone is weggevallen'},
-    182: {"text1": 'Alarm condensgroep', "text2": 'Er is een alarm op de condensgroep', "action": 'Het systeem werkt niet, zie storing op de condensgroep en de betreffende handleiding', "comment": 'Er wordt een storing op de condensgroep gesignaleerd'},
-    183: {"text1": 'Alarm condensgroep in testmodus', "text2": 'De condensgroep is in TESTMODUS', "action": 'Tijdens deze fase is het niet mogelijk om aan de verzoeken tot klimaatregeling van de omgeving en productie van sanitair warm water te voldoen', "comment": 'Er wordt gesignaleerd dat de condensgroep in de modus testfase is'},
-    184: {"text1": 'Alarm time-out communicatie met externe groep', "text2": 'Fout bij communicatie met condensgroep', "action": 'Laat de elektrische aansluiting tussen de groepen controleren', "comment": 'Deze storing wordt gesignaleerd wegens een communicatieprobleem tussen de interne groep en de condensgroep'},
-    185: {"text1": 'Alarm communicatie safety-module', "text2": 'Verlies van communicatie met safety-module', "action": 'Laat de aansluiting tussen de componenten controleren', "comment": 'Storing in de communicatie van de kaar voor de regeling en de kaart voor de inschakeling'},
-    186: {"text1": 'Afwijking hoogspanning aansteker', "text2": 'Safety module: een afwijking van de spanning van de aansteker is opgetreden', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een storing op de kaart van de aansteker gesignaleerd'},
-    187: {"text1": 'Alarm sonde afvoer condensgroep', "text2": 'De sonde voor afvoer van de condensgroep is buiten range', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een probleem op de NTC-sonde afvoer installatie'},
-    188: {"text1": 'Verzoek buiten werkingsrange', "text2": 'Het verstrekte verzoek wordt niet uitgevoerd omdat de externe omstandigheden de activering van de condensgroep niet toestaan', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Er wordt een verzoek voor verwarming of koeling gezonden met een buitentemperatuur die buiten de werkingslimieten ligt'},
-    189: {"text1": 'Alarm time-out communicatie met communicatiekaart', "text2": 'Verlies van communicatie met communicatiekaart x condensgroep', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'Indien de communicatie tussen de elektronische kaarten wegvalt, wordt deze storing gesignaleerd'},
-    191: {"text1": 'Communicatie RF naar CAR v2 RF zona 2 is weggevallen', "text2": 'De communicatie tussen zenderbasis en CAR v2 RF van zone 2 is weggevallen', "action": 'Controleer de werking van de CAR Wireless, controleer of de batterijen opgeladen zijn (zie betreffende instructiehandleiding)', "comment": 'Wanneer de communicatie tussen de interne eenheid en de CAR versie Wireless van de tweede zone wegvalt, wordt het probleem gesignaleerd. Vanaf dat ogenblik kan het systeem enkel bestuurd worden via het bedieningspaneel op de ketel'},
-    192: {"text1": 'Afwijking aanvoersonde condensgroep', "text2": 'De sonde voor aanvoer van de condensgroep is buiten range', "action": 'Als de blokkering of de storing aanhoudt, moet u een erkend bedrijf oproepen (bijvoorbeeld de technische dienst van Immergas).', "comment": 'De kaart detecteert een probleem op de NTC-sonde voor aanvoer warmtepomp'},
-    193: {"text1": 'Toestel in testmodus', "text2": 'Het toestel wordt door een extern apparaat bestuurd via Opentherm protocol', "action": 'Het systeem gaat door met de correcte werking', "comment": 'Er wordt gesignaleerd dat het apparaat in de fase testmodus staat'},
-    194: {"text1": 'Audax Pro gedeactiveerd', "text2": 'De condensgroep Audax Pro werd gedeactiveerd', "action": 'Het systeem gaat door met de correcte werking', "comment": 'Er wordt gesignaleerd dat de condensgroep uitgeschakeld is via de speciale ingang in het klemmenbord'},
-    195: {"text1": 'Afwijking lage temp. vloeibare fase', "text2": 'De temp. van de sonde vloeibare fase is te laag ', "action": 'Controleer de goede werking van het koelcircuit', "comment": 'Er wordt een te lage temperatuur waargenomen in de vloeibare fase'},
-    196: {"text1": 'Blokkering temp. toevoer hoog', "text2": 'Er wordt een te hoge temperatuur waargenomen op het afvoercircuit van de warmtepomp', "action": 'Controleer de goede werking van het koelcircuit', "comment": 'Er wordt een te hoge temperatuur waargenomen op het aanvoercircuit van de warmtepomp'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: pl)"""
-
-immergas_labels = {
-    'default': {"text1": 'Nieprawidłowość ogólna nierozpoznana', "text2": 'Sprawdzić tabelę błędów lub wybraną kartę', "action": 'Sprawdzić tabelę błędów lub wybraną kartę', "comment": 'Brak odnośnych uwag'},
-    0: {"text1": 'SYSTEM OK', "text2": 'System działający prawidłowo', "action": 'Nie jest wymagana żadna czynność', "comment": 'Brak nieprawidłowości'},
-    1: {"text1": 'Blokada - brak zapłonu', "text2": 'Nie wykryto płomienia po zakończeniu ostatniej próby włączenia', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'W przypadku żądania c.o. lub c.w.u. kocioł nie włącza się w ustalonym czasie. Przy pierwszym włączeniu lub po długim okresie nieaktywności urządzenia może okazać się konieczne usunięcie blokady.'},
-    2: {"text1": 'Blokada termostatu bezpieczeństwa (nadmierna temperatura).', "text2": 'Ingerencja termostatu bezpieczeństwa', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'Jeśli podczas normalnego działania z powodu nieprawidłowości dochodzi do nadmiernego rozgrzania wewnętrznego, kocioł wprowadza się w stan blokady.'},
-    3: {"text1": 'Blokada termostatu spalin', "text2": 'Ingerencja termostatu dymu', "action": 'Należy nacisnąć na przycisk resetowania. (wersje Nike)/Skonfigurować prawidłowo parametr P.14. W razie konieczności nacisnąć przycisk Reset (wersja Star)', "comment": 'Jeśli podczas normalnego działania z powodu nieprawidłowości dochodzi do nadmiernego nagrzania spalin, kocioł wprowadza się w stan blokady. (wersje Nike)/Błędna konfiguracja parametru P.14 (wersja Star)'},
-    4: {"text1": 'Blokada oporu styków', "text2": 'Wykryto nieprawidłowość na obwodzie sterującym zaworem gazu', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta elektroniczna wykrywa nieprawidłowość zasilania zaworu gazu. Sprawdzić jego przyłączenie (nieprawidłowość jest wykrywana i wyświetlana tylko w razie wystąpienia żądania).'},
-    5: {"text1": 'Nieprawidłowość sondy odpływu', "text2": 'Sonda wyjścia c.o. wykazuje wartość rezystancji poza zakresem', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość na sondzie NTC wyjścia c.o.'},
-    6: {"text1": 'Nieprawidłowość sondy w.u.', "text2": 'Sonda c.w.u. wykazuje wartość rezystancji poza zakresem', "action": 'W tym przypadku kocioł wytwarza c.w.u., lecz nie w warunkach maksymalnych osiągów. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość na sondzie NTC c.w.u.'},
-    8: {"text1": 'Maksymalna liczba resetów', "text2": 'Wskazuje na osiągnięcie maksymalnej liczby resetów dozwolonych przez elektroniczną płytę główną', "action": 'Uwaga: nieprawidłowość można zresetować 5 razy z rzędu, następnie funkcja zostaje zablokowana na przynajmniej godzinę i zyskuje się jedną próbę co godzinę dla maksymalnie 5 prób. Odłączając i włączając zasilanie urządzenia, zyskuje się ponownie 5 prób.', "comment": 'Liczba dostępnych resetów, które już zostały wykonane.'},
-    10: {"text1": 'Niewystarczające ciśnienie w instalacji', "text2": 'Styk presostatu c.o. jest otwarty', "action": 'Należy sprawdzić na manometrze kotła, czy ciśnienie instalacji zawiera się między 1÷1,2 bara, i ewentualnie przywrócić prawidłowe ciśnienie.', "comment": 'Ciśnienie wody wewnątrz obwodu ogrzewania nie jest wystarczające do zagwarantowania właściwego funkcjonowania kotła.'},
-    11: {"text1": 'Nieprawidłowość presostatu spalin', "text2": 'Możliwe nieprawidłowości w presostacie spalin lub w wentylatorze', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Jeżeli zostaną przywrócone zwykłe warunki pracy, kocioł uruchomi się bez konieczności jego resetowania'},
-    12: {"text1": 'Nieprawidłowość sondy zasobnika c.w.u.', "text2": 'Sonda zasobnika c.w.u. wykazuje wartość rezystancji poza zakresem', "action": 'Kocioł nie może wytworzyć c.w.u. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość na sondzie zasobnika c.w.u.'},
-    13: {"text1": 'Miernik natężenia przepływu powietrza/spalin poza zakresem', "text2": 'Sygnał powietrze/spaliny jest poza zakresem lub przy wyłączonym wentylatorze urządzenie kontrolne odczytuje zbyt wysoki sygnał', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Przy wyłączonym wentylatorze urządzenie kontroli powietrza/spalin odczytuje zbyt wysoki sygnał (złączone styki presostatu)'},
-    15: {"text1": 'Błąd konfiguracji', "text2": 'Karta wykrywa niezgodność między swoją konfiguracją a sygnałami na wejściu', "action": 'W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go. Sprawdzić, czy kocioł jest skonfigurowany prawidłowo. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość lub niezgodność na okablowaniu elektrycznym, kocioł nie uruchamia się.'},
-    16: {"text1": 'Nieprawidłowość wentylatora', "text2": 'Wentylator obraca się, gdy nie jest zasilany, lub nie obraca się, gdy jest zasilany', "action": 'Należy nacisnąć na przycisk resetowania. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Pojawia się w przypadku mechanicznego lub elektrycznego uszkodzenia wentylatora.'},
-    17: {"text1": 'Nieprawidłowa prędkość wentylatora', "text2": 'Liczba obrotów wentylatora przekracza prawidłowy zakres', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Nieprawidłowa liczba obrotów wentylatora'},
-    20: {"text1": 'Blokada - niepożądany płomień', "text2": 'Wykrycie nieprawidłowego płomienia', "action": 'Należy nacisnąć na przycisk resetowania. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Pojawia się w przypadku dyspersji w obwodzie wykrywania lub nieprawidłowości w kontroli płomienia.'},
-    23: {"text1": 'Nieprawidłowość sondy powrotu', "text2": 'Sondy powrotu wykazuje wartość rezystancji poza zakresem', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość na sondzie NTC wyjścia c.o.'},
-    24: {"text1": 'Nieprawidłowość tablicy przyciskowej', "text2": 'Wykryto stały nacisk na przyciskach na tablicy sterowania', "action": 'W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość na panelu przyciskowym.'},
-    25: {"text1": 'Blokada sondy spalin / blokada CRC (TERA)', "text2": 'Temperatura spalin poza zakresem / uszkodzona pamięć (TERA)', "action": 'Wcisnąć przycisk Reset', "comment": 'Wysoki gradient spalin, możliwe zablokowanie pompy obiegowej lub brak wody / uszkodzona pamięć'},
-    27: {"text1": 'Niewystarczająca cyrkulacja', "text2": 'Przegrzanie kotła w wyniku słabej cyrkulacji w obwodzie pierwotnym', "action": 'Nacisnąć na przycisk Reset', "comment": 'Sprawdzić, czy nie ma żadnego przerwania obwodu grzewczego i/lub sprawdzić, czy cyrkulator działa prawidłowo'},
-    28: {"text1": 'Przeciek obwodu w.u.', "text2": 'Jeśli podczas pracy w fazie ogrzewania pojawi się podwyższenie temperatury w.u., kocioł wskazuje nieprawidłowość i redukuje temperaturę ogrzewania, aby ograniczyć tworzenie się osadów wapiennych w wymienniku.', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Sprawdzić, czy wszystkie zawory kurkowe instalacji użytkowej są zamknięte i nie przeciekają, i czy ogólnie nie ma wycieków w instalacji. Kocioł wraca do normalnego funkcjonowania po przywróceniu wszystkich optymalnych warunków w instalacji w.u.'},
-    29: {"text1": 'Nieprawidłowość sondy spalin', "text2": 'Sonda spalin wykazuje wartość rezystancji poza zakresem', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Karta wykrywa nieprawidłowość na sondzie spalin.'},
-    31: {"text1": 'Utrata komunikacji z CARV2', "text2": 'Brak komunikacji między kartą a zdalnym sterowaniem.', "action": 'Należy odłączyć i ponownie włączyć napięcie kotła. Jeśli nawet przy ponownym włączeniu nie zostanie wykryte zdalne sterowanie, kocioł przechodzi do pracy lokalnej, korzystając ze sterowania obecnego na panelu sterowania. W tym przypadku nie można włączyć funkcji „Ogrzewanie”.', "comment": 'Pojawia się w razie podłączenia do niekompatybilnego zdalnego sterowania lub w razie utraty połączenia między kotłem a CARV2.'},
-    32: {"text1": 'Nieprawidłowość sondy 2. strefy niskiej temperatury', "text2": 'Sonda wyjścia c.o. 2. strefy poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Jeśli karta odczyta nieprawidłowość na sondzie 2. strefy niskiej temperatury, instalacja nie może funkcjonować we wskazanej strefie'},
-    33: {"text1": 'Nieprawidłowość sondy 3. strefy niskiej temperatury', "text2": 'Sonda wyjścia c.o. 3. strefy poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Jeśli karta odczyta nieprawidłowość na sondzie 2. strefy niskiej temperatury, instalacja nie może funkcjonować we wskazanej strefie'},
-    36: {"text1": 'Utrata połączenia IMG Bus', "text2": 'Utrata połączenia na protokole IMG Bus.', "action": 'Kocioł nie spełnia wymagań c.o. ', "comment": 'Z powodu nieprawidłowości na centralce kotła, na karcie strefowej (opcja) lub na IMG Bus przerywa się połączenie między różnymi komponentami.'},
-    37: {"text1": 'Niskie ciśnienie zasilania', "text2": 'Napięcie zasilania karty jest niższe od dopuszczalnych limitów.', "action": 'W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go.', "comment": 'Pojawia się, gdy napięcie zasilania jest niższe od dopuszczalnego i koniecznego dla prawidłowego działania kotła.'},
-    38: {"text1": 'Utrata sygnału płomienia', "text2": 'Karta po osiągnięciu prawidłowej wartości prądu jonizacji odnotowuje jego spadek.', "action": 'W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go.', "comment": 'Pojawia się w przypadku, gdy kocioł jest włączony prawidłowo i dochodzi do nieoczekiwanego wyłączenia płomienia palnika; zostaje przeprowadzona nowa próba włączenia i, w razie przywrócenia normalnego stanu, kocioł nie musi być wyzerowany.'},
-    39: {"text1": 'Nieprawidłowość sondy kolektora słonecznego', "text2": 'Sonda zewnętrzna wykazuje wartość rezystancji poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Jeśli karta wykryje nieprawidłowość na sondzie kolektora słonecznego, kocioł funkcjonuje normalnie bez dostarczania energii słonecznej do podgrzania c.w.u., ponieważ pompa słoneczna nie funkcjonuje'},
-    40: {"text1": 'Nieprawidłowość sondy zasobnika słonecznego', "text2": 'Sonda zasobnika słonecznego wykazuje wartość rezystancji poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Karta wykrywa nieprawidłowość na sondzie zasobnika słonecznego, kocioł funkcjonuje normalnie bez dostarczania energii słonecznej do podgrzania c.w.u., ponieważ pompa słoneczna przestaje działać.'},
-    41: {"text1": 'Wysoka temperatura na kolektorze słonecznym', "text2": 'Kolektor słoneczny przekroczył maksymalną ustawioną temperaturę', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Pojawia się, gdy temperatura kolektora słonecznego przekracza maksymalny ustawiony limit'},
-    42: {"text1": 'Wysoka temperatura na zasobniku słonecznym', "text2": 'Zasobnik słoneczny przekroczył maksymalną ustawioną temperaturę', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Pojawia się, gdy temperatura wody w zasobniku słonecznym przekroczy maksymalny ustawiony limit.'},
-    43: {"text1": 'Blokada z powodu utraty sygnału płomienia', "text2": 'Utrata sygnału płomienia pracy kilka razy z rzędu.', "action": 'Należy nacisnąć na przycisk resetowania. Przed ponownym uruchomieniem kocioł wykona cykl post-wentylacji.', "comment": 'Występuje, gdy w ciągu ustalonego czasu kilka razy z rzędu pojawia się błąd „Utrata sygnału płomienia”.'},
-    44: {"text1": 'Blokada z powodu przekroczenia maksymalnego całkowitego czasu częstego otwierania zaworu gazu', "text2": 'Całkowity czas otwierania zaworu gazu bez wykrycia płomienia jest większy niż dopuszczalny czas maksymalny.', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'Następuje w przypadku, gdy zawór gazu pozostaje otwarty przez czas przekraczający czas przewidziany do normalnego funkcjonowania bez włączenia się kotła.'},
-    45: {"text1": 'duża ΔT', "text2": 'Różnica temperatury zmierzonej między wyjściem a powrotem wynosi ≥ di 40°C.', "action": 'Moc palnika jest zmniejszana, aby zapobiec ewentualnemu uszkodzeniu modułu kondensacyjnego; po przywróceniu prawidłowej ΔT kocioł wraca do normalnego funkcjonowania. Należy sprawdzić, czy w instalacji krąży woda, czy pompa obiegowa jest skonfigurowana zgodnie z wymaganiami instalacji oraz czy sonda powrotu funkcjonuje prawidłowo.', "comment": 'Kocioł wykrywa nagły i nieprzewidziany wzrost ΔT między sondą wyjścia a sondą powrotu instalacji.'},
-    46: {"text1": 'Interwencja termostatu niskiej temperatury (opcja) / Błędna konfiguracja okablowania/karty', "text2": 'Termostat bezpieczeństwa znajdujący się na połączeniu odpływu z kotła z DIM v2 (działający jedynie w niskiej temperaturze) osiągnął wysoką temperaturę. / Błąd okablowania lub błędne użycie karty zamiennej', "action": 'W takim przypadku po ochłodzeniu można zresetować termostat (patrz odpowiedni arkusz instrukcji). / Jeśli zablokowanie lub nieprawidłowość utrzymuje się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Podczas normalnego funkcjonowania, jeżeli z powodu nieprawidłowości nastąpi nadmierny wzrost temperatury po stronie tłocznej instalacji niskotemperaturowej, kocioł blokuje się. / Błąd okablowania lub błędne użycie karty zamiennej'},
-    47: {"text1": 'Ograniczenie mocy palnika', "text2": 'Jeżeli temperatura spalin osiągnie wysoką wartość, karta zmniejszy moc przekazywaną do palnika w celu ograniczenia szkód w obwodzie spalin.', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'W razie wykrycia wysokiej temperatury spalin, kocioł zmniejsza przekazywaną moc, aby nie ulec uszkodzeniu.'},
-    48: {"text1": 'Nieprawidłowość sondy wyjścia c.o. od strony instalacji', "text2": 'Sonda wyjścia c.o. od strony instalacji wykazuje wartość rezystancji poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'W przypadku niepodłączenia lub uszkodzenia sondy wyjścia c.o. od strony instalacji zostanie zasygnalizowana nieprawidłowość'},
-    49: {"text1": 'Blokada wysokiej temperatury na sondzie po stronie powrotnej', "text2": 'Sonda powrotu zmierzyła wysoką temperaturę', "action": 'Sprawdzić, czy obieg w kotle oraz funkcjonowanie zaworu trójdrożnego są prawidłowe.', "comment": 'Występuje w przypadku osiągnięcia zbyt wysokiej temperatury w obwodzie powrotnym wymiennika'},
-    50: {"text1": 'Nieprawidłowość sondy zewnętrznej', "text2": 'Sonda zewnętrzna wykazuje wartość rezystancji poza zakresem', "action": 'Sprawdzić podłączenie sondy zewnętrznej. Instalacja kontynuuje pracę', "comment": 'W przypadku niepodłączenia lub uszkodzenia sondy zewnętrznej zostanie zasygnalizowana nieprawidłowość'},
-    51: {"text1": 'Utrata połączenia z CAR Wireless', "text2": 'Połączenie między podstawą nadawczą a CAR v2 RF zostało utracone.', "action": 'Sprawdzić działanie CAR Wireless, sprawdzić poziom naładowania baterii (patrz oddzielna instrukcja obsługi).', "comment": 'W przypadku awarii komunikacji między kotłem i CAR Wireless pojawia się sygnalizacja nieprawidłowości, odtąd można sprawdzić system tylko z panelu sterowania kotła.'},
-    54: {"text1": 'Nieprawidłowość sondy puffer', "text2": 'Sonda puffer wykazuje wartość rezystancji poza zakresem', "action": 'Tryb puffer zostanie wyłączony', "comment": 'W przypadku niepodłączenia lub uszkodzenia sondy puffer zostanie zasygnalizowana nieprawidłowość'},
-    55: {"text1": 'Nieprawidłowość sondy temperatury wyjścia c.o. 1. strefy', "text2": 'Sonda wyjścia c.o. 1. strefy wykazuje wartość rezystancji poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Jeśli karta odczyta nieprawidłowość na sondzie 1. strefy niskiej temperatury, system nie może funkcjonować we wskazanej strefie'},
-    58: {"text1": 'Nieprawidłowość Audax', "text2": 'Sygnalizacja nieprawidłowości przez podłączoną do instalacji pompę ciepła AUDAX', "action": 'Pompa ciepła nie spełnia wymagań ogrzewania i chłodzenia pomieszczenia, po przywróceniu połączeń należy wyłączyć i ponownie uruchomić instalację', "comment": 'Nieprawidłowość pompy ciepła Audax, sprawdzić rodzaj nieprawidłowości bezpośrednio na wyświetlaczu pompy ciepła'},
-    59: {"text1": 'Blokada częstotliwości sieci zasilania elektrycznego', "text2": 'Karta elektryczna wykryła nieprawidłową częstotliwość sieci zasilania elektrycznego.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Karta wykrywa nieprawidłową częstotliwość w zasilaniu sieci elektrycznej.'},
-    60: {"text1": 'Nieprawidłowość pompy obiegowej', "text2": 'Pompa modulująca nie pracuje.', "action": 'Podjąć próbę odblokowania pompy obiegowej zgodnie ze wskazówkami w odpowiednim paragrafie. W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go.', "comment": 'Pompa nie pracuje z powodu jednej z następujących przyczyn: zablokowany wirnik, usterka elektryczna.'},
-    61: {"text1": 'Obecność powietrza w pompie obiegowej', "text2": 'Pompa modulująca nie pracuje na skutek wykrycia powietrza.', "action": 'Odpowietrzyć pompę obiegową oraz obwód grzewczy. W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go.', "comment": 'Wewnątrz pompy obiegowej wykrywane jest powietrze; brak możliwości pracy pompy.'},
-    62: {"text1": 'Żądanie pełnej kalibracji', "text2": 'Karta nie posiada prawidłowej konfiguracji parametrów kontroli spalania.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykryto brak kalibracji karty elektronicznej. Może wystąpić w przypadku wymiany karty elektronicznej lub zmiany parametrów w sekcji powietrze/gaz, dlatego wymagana jest „pełna kalibracja”.'},
-    63: {"text1": 'Nieprawidłowość sondy powrotu instalacji', "text2": 'Sonda powrotu wykazuje wartość rezystancji poza zakresem', "action": 'Kocioł kontynuuje pracę bez żadnej integracji ze strony podłączonych instalacji zewnętrznych', "comment": 'W przypadku niepodłączenia lub uszkodzenia sondy powrotu zostanie zasygnalizowana nieprawidłowość'},
-    67: {"text1": 'Nieprawidłowość presostatu instalacji słonecznej', "text2": 'Otwarty presostat instalacji, możliwy brak cieczy', "action": 'Sprawdzić na manometrze zespołu pompowego instalacji słonecznej, czy ciśnienie ma prawidłową wartość', "comment": 'W związku ze spadkiem ciśnienia w obwodzie słonecznym presostat blokuje działanie cieplnego obwodu słonecznego'},
-    70: {"text1": 'Sondy odwrócone', "text2": 'W przypadku błędu w połączeniu okablowania kotła, wykrywany jest błąd', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Sprawdzić połączenie sondy przepływu i powrotu'},
-    72: {"text1": 'Żądanie szybkiej kalibracji', "text2": 'Karta nie posiada prawidłowej konfiguracji niektórych parametrów kontroli spalania.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykryto zmianę niektórych parametrów, dlatego wymagana jest „szybka kalibracja”.'},
-    73: {"text1": 'Wykryte wysokie odchylenie sondy wyjścia c.o. i sondy wyjścia bezpieczeństwa c.o.', "text2": 'Sondy wyjścia wykazują wysokie odchylenie.', "action": 'W razie przywrócenia normalnego stanu kocioł uruchamia się bez konieczności jego wyzerowania', "comment": 'Karta wykrywa nieprawidłowość odczytu temperatur sond NTC wyjścia c.o. Jej przyczyną może być uszkodzona sonda, niewłaściwe ustawienie pozycji, niewystarczający obieg instalacji, zatkanie po stronie wody wymiennika pierwotnego.'},
-    74: {"text1": 'Nieprawidłowość sondy wyjścia bezpieczeństwa c.o.', "text2": 'Sonda wyjścia bezpieczeństwa c.o. wykazuje wartość rezystancji poza zakresem.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Karta wykrywa nieprawidłowość na sondzie NTC wyjścia bezpieczeństwa.'},
-    75: {"text1": 'Blokada w wyniku uszkodzonego czujnika NTC', "text2": 'Możliwe uszkodzenie jednej lub obydwu sond przepływu i powrotu instalacji', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Czujnik sondy bezpieczeństwa powoduje duży gradient temperatury'},
-    76: {"text1": 'Rozgałęzienie sondy przepływu lub sondy powrotu', "text2": 'Wykryto nieprawidłowe działanie jednej lub obydwu sond przepływu i powrotu instalacji', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wartość różnicy większa od tej ustawionej między sondą przepływu i powrotu w przypadku żądania ciepła'},
-    77: {"text1": 'Nieprawidłowość kontroli spalania', "text2": 'Wykryto prąd na zaworze gazu poza zakresem.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykrycie prądu poza zakresem na zaworze gazu.'},
-    78: {"text1": 'Nieprawidłowość kontroli spalania', "text2": 'Wykryto wysoki prąd na zaworze gazu.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykrycie wysokiego prądu na zaworze gazu.'},
-    79: {"text1": 'Nieprawidłowość kontroli spalania', "text2": 'Wykryto niski prąd na zaworze gazu.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykrycie niskiego prądu na zaworze gazu.'},
-    80: {"text1": 'Blokada z powodu awarii karty elektronicznej', "text2": 'Wykryto usterkę na sterowniku elektronicznego zaworu gazu w wyniku problemów na karcie lub zaworze gazu.', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'Pojawia się w przypadku wadliwego działania karty elektronicznej kontrolującej zawór.'},
-    84: {"text1": 'Nieprawidłowość spalania – trwa zmniejszanie mocy', "text2": 'Wykryto warunki porównywalne do niskiego ciśnienia zasilania zaworu gazu.', "action": 'W razie przywrócenia normalnego stanu kocioł uruchamia się bez konieczności jego wyzerowania', "comment": 'Wykrycie niskiego ciśnienia zasilania sieci gazu. W związku z tym ograniczana jest moc urządzenia i sygnalizowana nieprawidłowość.'},
-    85: {"text1": 'Blokada – problem z dopalaniem', "text2": 'Potencjalny problem z zaworem gazu, elektrodą lub kartą elektroniczną.', "action": 'Należy nacisnąć na przycisk resetowania. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas)', "comment": 'Płomień obecny po zamknięciu zaworu gazu'},
-    87: {"text1": 'Blokada kontroli zaworu gazu', "text2": 'Wykryto usterkę kontroli zaworu gazu.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykrycie nieprawidłowości jednego z komponentów kontrolujących zawór gazu.'},
-    88: {"text1": 'Blokada kontroli zaworu gazu', "text2": 'Wykryto usterkę kontroli zaworu gazu.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Wykrycie nieprawidłowości jednego z komponentów kontrolujących zawór gazu.'},
-    89: {"text1": 'Sygnał niestabilnego spalania', "text2": 'Wykryto niestabilny sygnał spalania.', "action": 'Kocioł kontynuuje pracę.', "comment": 'Płomień jest niestabilny ze względu na: obecność recyrkulacji spalin, wiatr, niestabilne ciśnienie gazu, niestabilną prędkość wentylatora lub awarię systemu.'},
-    90: {"text1": 'Sygnał spalania poza zakresem', "text2": 'Wykryto sygnał spalania poza zakresem.', "action": 'Kocioł kontynuuje pracę.', "comment": 'Wykrywany jest sygnał spalania poza przewidzianym zakresem regulacji trwający przez dłuższy czas.'},
-    91: {"text1": 'Blokada z powodu nieprawidłowego zapłonu', "text2": 'Karta wyczerpała wszystkie możliwe działania celem posiadania optymalnego zapłonu palnika.', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'Karta wyczerpała wszystkie możliwe działania celem uzyskania optymalnego zapłonu palnika.'},
-    92: {"text1": 'Limit korekcji obrotów wentylatora', "text2": 'Karta osiągnęła maksymalną liczbę korekcji obrotów wentylatora.', "action": 'Kocioł kontynuuje pracę.', "comment": 'System wykorzystał wszystkie możliwe poprawki liczby obrotów wentylatora.'},
-    93: {"text1": 'Sygnał spalania poza zakresem', "text2": 'Wykryto sygnał spalania poza zakresem.', "action": 'Kocioł kontynuuje pracę.', "comment": 'Wykrywany jest sygnał spalania poza przewidzianym zakresem regulacji trwający przez dłuższy czas.'},
-    94: {"text1": 'Nieprawidłowość spalania', "text2": 'Wykryto błąd w spalaniu spowodowany systemem lub kontrolą spalania.', "action": 'W razie przywrócenia normalnego stanu, kocioł uruchamia się bez konieczności wyzerowania go.', "comment": 'Wykrywany jest błąd kontroli spalania, który może być spowodowany przez: niskie ciśnienie gazu, recyrkulację spalin, zawór gazowy lub wadliwą kartę elektroniczną.'},
-    95: {"text1": 'Sygnał nieciągły spalania', "text2": 'Wykryto brak ciągłości sygnału spalania na skutek problemów z połączeniami elektrycznymi lub rozszczepienia sygnału.', "action": 'Kocioł kontynuuje pracę.', "comment": 'System wykrywa brak ciągłości sygnału spalania.'},
-    96: {"text1": 'Zatkany układ powietrzno-spalinowy', "text2": 'Wykryto zatkanie układu powietrzno-spalinowego.', "action": 'Kocioł nie uruchamia się. Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Występuje w razie wykrycia zatkania w systemie spalinowym.'},
-    98: {"text1": 'Blokada wskutek maks. liczby błędów oprogramowania', "text2": 'Karta elektroniczna nie działa prawidłowo.', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'Osiągnięto maksymalną dozwoloną liczbę błędów oprogramowania'},
-    99: {"text1": 'Blokada ogólna', "text2": 'Karta elektroniczna nie działa prawidłowo.', "action": 'Należy nacisnąć na przycisk resetowania.', "comment": 'Wykrycie nieprawidłowości kotła.'},
-    101: {"text1": 'Alarm pompa Audax jest niedostępna', "text2": 'Utrata połączenia z pompą ciepła', "action": 'Pompa ciepła nie spełnia wymagań ogrzewania i chłodzenia pomieszczenia, po przywróceniu połączeń należy wyłączyć i ponownie uruchomić instalację', "comment": 'W przypadku utraty połączenia, błędnego połączenia lub wyłączonej pompy ciepła, system elektroniczny kotła nie będzie wykrywał pompy ciepła'},
-    102: {"text1": 'Alarm zbiornik wyrównawczy 1. strefy jest niedostępny', "text2": 'Utrata połączenia ze zbiornikiem wyrównawczym 1. strefy', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Nieprawidłowość połączenia z 1. strefą'},
-    103: {"text1": 'Alarm zbiornik wyrównawczy 2. strefy jest niedostępny', "text2": 'Utrata połączenia ze zbiornikiem wyrównawczym 2. strefy', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Nieprawidłowość połączenia z 2. strefą'},
-    104: {"text1": 'Alarm zbiornik wyrównawczy 3. strefy jest niedostępny', "text2": 'Utrata połączenia ze zbiornikiem wyrównawczym 3. strefy', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Nieprawidłowość połączenia z 3. strefą'},
-    106: {"text1": 'Alarm sondy c.w.u. ', "text2": 'W przypadku wbudowania kotła i oddzielnego zarządzania ciepłą wodą użytkową, czujnik zasobnika c.w.u. kontrolowany przez administratora wykazuje wartość rezystancji poza zakresem', "action": 'Instalacja nie może produkować ciepłej wody użytkowej przy użyciu pompy ciepła. Wytwarzanie ciepłej wody użytkowej zapewniane jest przez kocioł', "comment": 'Karta wykrywa nieprawidłowość na sondzie zasobnika'},
-    120: {"text1": 'Alarm wysokiej nastawy dla osuszania 1 strefy', "text2": 'Obliczona nastawa wymagana przez 1. strefę jest zbyt wysoka w celu osuszenia', "action": 'Obliczona nastawa po stronie tłocznej przekracza dopuszczalną górną granicę osuszacza. Schłodzić pomieszczenie i zaczekać, aż punkt rosy powróci do dopuszczalnych wartości', "comment": 'Nastawa po stronie tłocznej chłodzenia obliczona dla osuszania przekracza górną granicę ustawioną dla 1. strefy'},
-    121: {"text1": 'Alarm urządzenie 1. strefy jest niedostępne', "text2": 'Zdalne sterowanie lub zdalna kontrola 1. strefą jest niedostępne', "action": 'Sprawdzić, czy zdalne sterowanie jest włączone', "comment": 'Nie można wykryć połączenia z systemem sterowania strefą. Nie można wykonać termoregulacji strefy'},
-    122: {"text1": 'Alarm urządzenie 2. strefy jest niedostępne', "text2": 'Zdalne sterowanie lub zdalna kontrola 2. strefą jest niedostępne', "action": 'Sprawdzić, czy zdalne sterowanie jest włączone', "comment": 'Nie można wykryć połączenia z systemem sterowania strefą. Nie można wykonać termoregulacji strefy'},
-    123: {"text1": 'Alarm urządzenie 3. strefy jest niedostępne', "text2": 'Zdalne sterowanie lub zdalna kontrola 3. strefą jest niedostępne', "action": 'Sprawdzić, czy zdalne sterowanie jest włączone', "comment": 'Nie można wykryć połączenia z systemem sterowania strefą. Nie można wykonać termoregulacji strefy'},
-    125: {"text1": 'Nieprawidłowość czujnika temperatury otoczenia 1. strefy', "text2": 'Sonda temperatury otoczenia 1. strefy jest poza zakresem', "action": 'Oprócz temperatury, nie jest obliczany punkt rosy dla strefy', "comment": 'Nieprawidłowość sondy temperatury otoczenia 1. strefy (fakultatywnie). Nie można wykonać termoregulacji strefy'},
-    126: {"text1": 'Nieprawidłowość czujnika temperatury otoczenia 2. strefy', "text2": 'Sonda temperatury otoczenia 2. strefy jest poza zakresem', "action": 'Oprócz temperatury, nie jest obliczany punkt rosy dla strefy', "comment": 'Nieprawidłowość sondy temperatury otoczenia 2. strefy (fakultatywnie). Nie można wykonać termoregulacji strefy'},
-    127: {"text1": 'Nieprawidłowość czujnika temperatury otoczenia 3. strefy', "text2": 'Sonda temperatury otoczenia 3. strefy jest poza zakresem', "action": 'Oprócz temperatury, nie jest obliczany punkt rosy dla strefy', "comment": 'Nieprawidłowość sondy temperatury otoczenia 3. strefy (fakultatywnie). Nie można wykonać termoregulacji strefy'},
-    129: {"text1": 'Nieprawidłowość sondy wilgotności 1. strefy', "text2": 'Sonda temperatury wilgotności 1. strefy jest poza zakresem', "action": 'Oprócz wilgotności, nie jest obliczany punkt rosy dla strefy', "comment": 'Nieprawidłowość na sondzie wilgotności 1. strefy (fakultatywnie). Nie można wykonać kontroli wilgotności strefy'},
-    130: {"text1": 'Nieprawidłowość sondy wilgotności 2. strefy', "text2": 'Sonda temperatury wilgotności 2. strefy jest poza zakresem', "action": 'Oprócz wilgotności, nie jest obliczany punkt rosy dla strefy', "comment": 'Nieprawidłowość na sondzie wilgotności 2. strefy (fakultatywnie). Nie można wykonać kontroli wilgotności strefy'},
-    131: {"text1": 'Nieprawidłowość sondy wilgotności 3. strefy', "text2": 'Sonda temperatury wilgotności 3. strefy jest poza zakresem', "action": 'Oprócz wilgotności, nie jest obliczany punkt rosy dla strefy', "comment": 'Nieprawidłowość na sondzie wilgotności 3. strefy (fakultatywnie). Nie można wykonać kontroli wilgotności strefy'},
-    132: {"text1": 'Alarm wysokiej nastawy dla osuszania 2. strefy', "text2": 'Obliczona nastawa wymagana przez 2. strefę jest zbyt wysoka w celu osuszenia', "action": 'Obliczona nastawa po stronie tłocznej przekracza dopuszczalną górną granicę osuszacza. Schłodzić pomieszczenie i zaczekać, aż punkt rosy powróci do dopuszczalnych wartości', "comment": 'Nastawa po stronie tłocznej chłodzenia obliczona dla osuszania przekracza górną granicę ustawioną dla 2. strefy'},
-    133: {"text1": 'Alarm uszkodzenia osuszacza 1. strefy', "text2": 'Osuszacz 1. strefy jest w stanie alarmu', "action": 'Instalacja nie wykonuje osuszania w danej strefie', "comment": 'Nieprawidłowość pochodząca z osuszacza (fakultatywny) w 1. strefie'},
-    134: {"text1": 'Alarm uszkodzenia osuszacza 2. strefy', "text2": 'Osuszacz 2. strefy jest w stanie alarmu', "action": 'Instalacja nie wykonuje osuszania w danej strefie', "comment": 'Nieprawidłowość pochodząca z osuszacza (fakultatywny) w 2. strefie'},
-    135: {"text1": 'Alarm uszkodzenia osuszacza 3. strefy', "text2": 'Osuszacz 3. strefy jest w stanie alarmowym', "action": 'Instalacja nie wykonuje osuszania w danej strefie', "comment": 'Nieprawidłowość pochodząca z osuszacza (fakultatywny) w 3. strefie'},
-    137: {"text1": 'Alarm przywrócenia instalacji - Ponownie uruchomić instalację', "text2": 'Po operacji przywrócenia wykonanej za pomocą panelu sterowania, wyświetli się alarm w związku z koniecznością ponownego uruchomienia instalacji', "action": 'Wyłączyć i ponownie uruchomić instalację', "comment": 'Po przywróceniu parametrów domyślnych, należy ponownie uruchomić instalację'},
-    138: {"text1": 'Wygrzewanie jastrychu w toku', "text2": 'Funkcja wygrzewania jastrychu w toku', "action": '', "comment": ''},
-    139: {"text1": 'Odpowietrzanie w toku', "text2": 'Funkcja odpowietrzania w toku', "action": '', "comment": ''},
-    177: {"text1": 'Alarm maksymalnego czasu c.w.u.', "text2": 'Żądanie ciepłej wody użytkowej zostało wykonane z przekroczeniem maksymalnego ustalonego czasu', "action": 'Instalacja kontynuuje pracę z nieoptymalną wydajnością', "comment": 'Produkcja ciepłej wody użytkowej nie jest zaspokojona w ustalonym czasie (5 godzin)'},
-    178: {"text1": 'Cykl antylegionella nie powiódł się', "text2": 'Cykl antylegionella nie zakończył się powodzeniem w ustalonym czasie', "action": 'Wcisnąć przycisk Reset', "comment": 'Cykl antylegionella nie powiódł się w ustalonym czasie (3 godziny)'},
-    179: {"text1": 'Nieprawidłowość sondy fazy ciekłej', "text2": 'Sonda fazy ciekłej jest poza zakresem.', "action": 'Instalacja nie uruchamia się. Wezwać autoryzowaną firmę (np. Serwis Techniczny Immergas).', "comment": 'Płyta wykrywa nieprawidłowość na sondzie fazy ciekłej'},
-    181: {"text1": 'Utrata połączenia ze zdalnym sterowaniem 2. strefy', "text2": 'Brak komunikacji między kartą a zdalnym sterowaniem 2. strefy.', "action": 'Należy odłączyć i ponownie włączyć moduł hydroniczny. Jeśli nawet przy ponownym włączeniu nie zostanie wykryte zdalne sterowanie, instalacja przechodzi do pracy lokalnej korzystając z poleceń obecnych na panelu sterowania. W tym przypadku nie można włączyć funkcji “Ogrzewanie”', "comment": 'Pojawia się w razie podłączenia do niekompatybilnego zdalnego sterowania lub w razie utraty połączenia między modułem hydronicznym a CARV2 drugiej strefy'},
-    182: {"text1": 'Alarm skraplarki', "text2": 'Występuje błąd skraplarki', "action": 'Instalacja nie działa, patrz nieprawidłowe działanie skraplarki i odpowiednią instrukcję obsługi', "comment": 'Sygnalizowana jest nieprawidłowość na skraplarce'},
-    183: {"text1": 'Alarm skraplarki w trybie testmode', "text2": 'Skraplarka znajduje się w trybie TESTMODE', "action": 'W tej fazie nie jest możliwe spełnienie żądań klimatyzacji pomieszczeń i produkcji ciepłej wody użytkowej.', "comment": 'Sygnalizuje się, że skraplarka jest w fazie test mode'},
-    184: {"text1": 'Alarm limitu czasu połączenia z jednostką zewnętrzną=', "text2": 'Utrata połączenia ze skraplarką', "action": 'Polecić sprawdzenie połączenia elektrycznego między urządzeniami', "comment": 'Sygnalizowana jest nieprawidłowość z powodu problemu połączenia pomiędzy jednostką wewnętrzną a skraplarką'},
-    185: {"text1": 'Alarm połączenia modułu bezpieczeństwa', "text2": 'Utrata połączenia z modułem bezpieczeństwa', "action": 'Polecić sprawdzenie połączenia pomiędzy komponentami', "comment": 'Problem w połączeniu pomiędzy elektroniczną płytą główną a centralką zapłonu'},
-    186: {"text1": 'Nieprawidłowość wysokiego napięcia modułu zapłonowego', "text2": 'Moduł bezpieczeństwa: wystąpiła nieprawidłowość napięcia modułu zapłonowego', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Sygnalizowana jest nieprawidłowość na centralce zapłonu'},
-    187: {"text1": 'Alarm sondy powrotu skraplarki', "text2": 'Czujnik powrotu skraplarki jest poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Karta wykrywa nieprawidłowość na sondzie NTC powrotu pompy ciepła'},
-    188: {"text1": 'Żądanie poza zakresem działania', "text2": 'Żądanie nie może zostać wykonane, ponieważ warunki zewnętrzne nie pozwalają na włączenie skraplarki', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Zostaje wysłane zapotrzebowanie na ogrzewanie lub chłodzenie, gdy temperatura zewnętrzna znajduje się poza zakresami działania'},
-    189: {"text1": 'Alarm limitu czasu połączenia z płytą komunikacyjną', "text2": 'Utrata połączenia z płytą komunikacyjną skraplarki', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'W przypadku utraty połączenia między płytami elektronicznymi zostanie zasygnalizowana nieprawidłowość'},
-    191: {"text1": 'Utrata połączenia RF w kierunku CAR v2 RF 2.strefy', "text2": 'Połączenie między podstawą nadawczą a CAR v2 RF 2.strefy zostało utracone', "action": 'Sprawdzić działanie CAR Wireless, sprawdzić poziom naładowania baterii (patrz oddzielna instrukcja obsługi).', "comment": 'W przypadku awarii połączenia między jednostką wewnętrzną a CAR w wersji Wireless drugiej strefy pojawi się sygnalizacja nieprawidłowości, odtąd będzie można sprawdzić system tylko z panelu sterowania jednostki wewnętrznej'},
-    192: {"text1": 'Nieprawidłowość sondy wyjścia c.o. skraplarki', "text2": 'Sonda wyjścia c.o. skraplarki jest poza zakresem', "action": 'Gdy blokada lub nieprawidłowość wydłuża się, należy wezwać autoryzowaną firmę (na przykład Serwis Techniczny Immergas).', "comment": 'Karta wykrywa nieprawidłowość na sondzie NTC wyjścia c.o. pompy ciepła'},
-    193: {"text1": 'Urządzenie w trybie Testmode', "text2": 'Urządzenie sterowane jest przez urządzenie zewnętrzne z użyciem protokołu Opentherm', "action": 'Instalacja kontynuuje prawidłową pracę', "comment": 'Sygnalizuje się, że urządzenie jest w fazie test mode'},
-    194: {"text1": 'Audax Pro jest wyłączona', "text2": 'Skraplarka Audax Pro została wyłączona', "action": 'Instalacja kontynuuje prawidłową pracę', "comment": 'Sygnalizowane jest wyłączenie skraplarki za pomocą powiązanego wejścia na listwie zaciskowej'},
-    195: {"text1": 'Nieprawidłowość niskiej temp. w fazie ciekłej', "text2": 'Temp. sondy fazy ciekłej jest za niska ', "action": 'Sprawdzić prawidłowe działanie obwodu chłodniczego', "comment": 'Wykryto zbyt niską temperaturę w fazie ciekłej'},
-    196: {"text1": 'Blokada wysoka temp. zasilania', "text2": 'Wykryto zbyt wysoką temperaturę obwodu powrotnego pompy ciepła.', "action": 'Sprawdzić prawidłowe działanie obwodu chłodniczego', "comment": 'Wykryto zbyt wysoką temperaturę obwodu tłocznego pompy ciepła'},
-}
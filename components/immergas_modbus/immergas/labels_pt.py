@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: pt)"""
-
-immergas_labels = {
-    'default': {"text1": 'Anomalia genérica não reconhecida.', "text2": 'Controlar a tabela de erros ou placa selecionada.', "action": 'Controlar a tabela de erros ou placa selecionada.', "comment": 'Nenhuma nota sobre o assunto.'},
-    0: {"text1": 'SISTEMA OK', "text2": 'Sistema que opera corretamente.', "action": 'Nenhuma ação requisitada.', "comment": 'Nenhuma anomalia.'},
-    1: {"text1": 'Bloqueio após falha durante o acendimento', "text2": 'Chama não detetada no final da última tentativa de ignição.', "action": 'Pressionar o botão de Reset.', "comment": 'Em caso de solicitação de aquecimento do ambiente ou produção de água quente sanitária, a caldeira não se acende dentro do tempo preestabelecido. No primeiro acendimento, ou após inutilização prolongada do aparelho, pode ser necessário intervir para eliminar o bloqueio.'},
-    2: {"text1": 'Bloqueio termóstato de segurança (sobretemperatura)', "text2": 'Intervenção do termóstato de segurança.', "action": 'Pressionar o botão de Reset.', "comment": 'Se ocorrer uma anomalia devido a um excessivo sobreaquecimento interno durante o funcionamento normal, a caldeira entra em condição de bloqueio.'},
-    3: {"text1": 'Bloqueio termóstato dos fumos', "text2": 'Intervenção do termóstato dos fumos.', "action": 'Pressionar o botão de Reset. (versões Nike)/ Configurar corretamente o parâmetro P.14. Se necessário, pressionar o botão Reset (versões Star)', "comment": 'Se ocorrer um aquecimento excessivo dos fumos por causa de uma anomalia durante o normal funcionamento do sistema, a caldeira será bloqueada. (versão Nike)/ Configuração incorreta parâmetro P.14 (versão Star)'},
-    4: {"text1": 'Bloqueio resistência contactos', "text2": 'Identificada uma anomalia no circuito de pilotagem da válvula de gás.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa eletrónica deteta uma anomalia na alimentação da válvula de gás. Verificar a sua ligação. (a anomalia é detetada e exibida apenas quando houver uma solicitação).'},
-    5: {"text1": 'Anomalia na sonda de fornecimento', "text2": 'A sonda de ida oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda NTC de ida.'},
-    6: {"text1": 'Anomalia na sonda do circuito sanitário', "text2": 'A sonda sanitário oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira continua a produzir água quente sanitária, mas com baixo rendimento. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda NTC de funcionamento sanitário.'},
-    8: {"text1": 'N° máximo de restabelecimentos.', "text2": 'Indica que foi atingido o número máximo dos restabelecimentos permitidos pela placa integrada.', "action": 'Atenção: é possível colocar em zero a anomalia até 5 vezes consecutivas, no máximo; a seguir, esta função é inibida por uma hora; cada hora que passa dá direito a uma tentativa, até ser alcançado o número máximo de 5 tentativas. Ao desconectar e fornecer novamente a alimentação ao aparelho são recuperadas 5 tentativas.', "comment": 'Número de restabelecimentos disponíveis já realizados.'},
-    10: {"text1": 'Pressão do sistema insuficiente', "text2": 'O contacto do pressóstato do sistema já está aberto.', "action": 'Verificar no manómetro da caldeira se a pressão do sistema está entre 1÷1,2 bar e eventualmente restabelecer a correta pressão.', "comment": 'Não é detetada uma pressão da água no circuito de aquecimento suficiente para garantir o correto funcionamento da caldeira.'},
-    11: {"text1": 'Anomalia no pressóstato dos fumos', "text2": 'Possível anomalia no pressóstato fumos ou no ventilador', "action": 'Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Se as condições normais de funcionamento foram restauradas, a caldeira reinicia sem a necessidade de ser reinicializada.'},
-    12: {"text1": 'Anomalia na sonda do boiler', "text2": 'A sonda do acumulador oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira não pode produzir água quente sanitária. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda da caldeira.'},
-    13: {"text1": 'Medidor de capacidade de ar/fumos fora do limiar', "text2": 'O sinal de ar/fumos está fora do limiar ou com o ventilador parado o controlo lê um sinal muito alto ', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Com o ventilador parado, o controlo de ar/fumaça lê um sinal muito alto (contactos aderidos do pressóstato)'},
-    15: {"text1": 'Erro de configuração', "text2": 'A placa deteta uma incongruência entre a sua configuração e os sinais em entrada.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”. Verificar se a caldeira está configurada no modo correto. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia ou incongruência na fiação elétrica da caldeira e não arranca.'},
-    16: {"text1": 'Anomalia no ventilador', "text2": 'É detetada a rotação do ventilador quando não está alimentado ou está parado quando alimentado.', "action": 'Pressionar o botão de Reset. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Ocorre quando o ventilador tem uma avaria mecânica ou eletrónica'},
-    17: {"text1": 'Velocidade do ventilador incorreta ', "text2": 'O número de giros do ventilador está fora do limiar correto', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Número de giros do ventilador incorreto'},
-    20: {"text1": 'Bloqueio chama parasita', "text2": 'Detetada chama anómala.', "action": 'Pressionar o botão de Reset. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Ocorre em caso de dispersão no circuito de deteção ou anomalia no controlo da chama.'},
-    23: {"text1": 'Anomalia na sonda de retorno', "text2": 'A sonda de retorno oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda NTC de ida.'},
-    24: {"text1": 'Anomalia na botoeira', "text2": 'É detetada uma pressão contínua nos botões do painel de comandos.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na botoeira.'},
-    25: {"text1": 'Bloco de sonda de fumos/bloqueio de CRC (TERA) ', "text2": 'Temperatura de fumos fora de limiar/memória corrupta (TERA) ', "action": 'Pressionar o botão de Reset', "comment": 'Gradiente de fumos elevado, provável bloqueio do circulador ou falta de água/memória corrupta'},
-    27: {"text1": 'Circulação insuficiente', "text2": 'Sobreaquecimento da caldeira devido a circulação insuficiente no circuito primário', "action": 'Pressionar o botão de Reset', "comment": 'Verificar se não há intercetações no circuito de aquecimento e/ou verificar o correto funcionamento do circulador'},
-    28: {"text1": 'Perdas no circuito sanitário', "text2": 'Se durante o funcionamento durante a fase de aquecimento for detetado um aumento da temperatura da água sanitária, a caldeira sinaliza a anomalia e reduz a temperatura do aquecimento para limitar a formação de calcário no permutador.', "action": 'Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Controlar se todas as torneiras do sistema sanitário estão fechadas e que não apresentam perdas e verificar se há perdas no sistema. A caldeira retorna ao funcionamento normal quando forem restabelecidas as condições ideais do sistema sanitário'},
-    29: {"text1": 'Anomalia na sonda de fumos', "text2": 'A sonda de fumos oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda de fumos.'},
-    31: {"text1": 'Perda de comunicação com CARV2.', "text2": 'Não há comunicação entre placa e remoto.', "action": 'Cortar e fornecer novamente tensão à caldeira. Se durante o reacendimento não for detetado o Comando Remoto, a caldeira passará para a modalidade de funcionamento local, ou seja, utilizará os comandos presentes no painel de comandos. Neste caso não é possível ativar a função “Aquecimento”', "comment": 'Ocorre no caso de conexão a um controlo remoto não compatível ou no caso de queda de comunicação entre a caldeira e CARV2.'},
-    32: {"text1": 'Anomalia sonda zona 2 baixa temperatura', "text2": 'Sonda alimentação zona 2 fora de limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda da zona 2 de baixa temperatura e o sistema não pode funcionar nesta mesma área.'},
-    33: {"text1": 'Anomalia sonda zona 3 baixa temperatura', "text2": 'Sonda alimentação zona 3 fora de limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda da zona 2 de baixa temperatura e o sistema não pode funcionar nesta mesma área.'},
-    36: {"text1": 'Queda de comunicação IMG Bus.', "text2": 'Perda de comunicação no protocolo IMG Bus.', "action": 'A caldeira não satisfaz as solicitações de aquecimento.', "comment": 'Por causa de uma anomalia na unidade de controlo da caldeira, na placa por zonas (opcional) ou no IMG Bus, é interrompida a comunicação entre os vários componentes.'},
-    37: {"text1": 'Baixa tensão de alimentação', "text2": 'A tensão de alimentação da placa possui valores inferiores aos valores permitidos.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”.', "comment": 'Ocorre quando a tensão de alimentação for inferior aos limites mínimos permitidos para o correto funcionamento da caldeira.'},
-    38: {"text1": 'Perda do sinal da chama', "text2": 'A placa, depois de ter alcançado o valor correto de corrente de chama, sinaliza queda da corrente de chama.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”.', "comment": 'Ocorre quando a caldeira é ligada de forma apropriada mas acontece um desligamento inesperado da chama do queimador; é efetuada uma tentativa de nova ignição e, caso as condições normais de funcionamento sejam restauradas, a caldeira reiniciará sem a necessidade de pressionar a tecla “reset”.'},
-    39: {"text1": 'anomalia sonda coletor solar ', "text2": 'A sonda externa oferece um valor resistivo fora do limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda coletor solar, a caldeira continua a funcionar regularmente sem o fornecimento de energia solar para o aquecimento de água quente doméstica quando a bomba solar deixa de funcionar '},
-    40: {"text1": 'Anomalia sonda acumulação solar', "text2": 'A sonda de acumulação solar oferece um valor resistivo fora do limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda acúmulo solar, a caldeira continua a funcionar regularmente sem o fornecimento de energia solar para o aquecimento de água quente doméstica quando a bomba solar deixa de funcionar '},
-    41: {"text1": 'Temperatura elevada no coletor solar', "text2": 'O coletor solar excedeu a temperatura máxima definida', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Ocorre quando a temperatura do coletor solar excede o limite máximo definido'},
-    42: {"text1": 'Temperatura elevada na acumulação solar', "text2": 'A acumulação solar solar excedeu a temperatura máxima definida', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Ocorre quando a temperatura da água na acumulação solar excede o limite máximo definido.'},
-    43: {"text1": 'Bloqueio por perda de sinal da chama', "text2": 'Perda de sinal de chama em funcionamento em regime por várias vezes consecutivas.', "action": 'Pressionar o botão Reset; antes de arrancar, a caldeira faz um ciclo de pós-ventilação.', "comment": 'Ocorre quando o erro “Perda do sinal da chama” ocorrer várias vezes consecutivas, em um intervalo de tempo preestabelecido.'},
-    44: {"text1": 'Bloqueio por superação da acumulação de tempo máximo de aberturas próximas da válvula de gás', "text2": 'O acúmulo do tempo total de abertura da válvula de gás sem deteção de chama é superior ao valor máximo permitido.', "action": 'Pressionar o botão de Reset.', "comment": 'Ocorre quando a válvula de gás permanecer aberta por um intervalo de tempo superior àquele presumido e a caldeira não se acende.'},
-    45: {"text1": 'dT elevado', "text2": 'A diferença de temperatura medida entre ida e retorno é ≥ de 40°C.', "action": 'É limitada a potência do queimador para prevenir eventuais danos ao módulo de condensação, uma vez restabelecido o correto dT a caldeira retorna ao funcionamento normal. Verificar se há circulação de água na caldeira, se o circulador está configurado segundo as exigências do sistema e o correto funcionamento da sonda de retorno.', "comment": 'A caldeira deteta um aumento repentino e não previsto de dT entre a sonda de ida e sonda de retorno do sistema.'},
-    46: {"text1": 'Intervenção do termostato de baixa temperatura/Configuração incorreta da cablagem/cartão', "text2": 'O termóstato de segurança instalado na conexão de ida da caldeira com DIM v2 (operante somente com baixa temperatura) atingiu temperaturas elevadas/Erro de cablagem ou uso incorreto da placa de reposição', "action": 'Neste caso, após o arrefecimento adequado, é possível restabelecer o termóstato (consulte a respetiva folha de instruções). / Se o bloqueio ou anomalia persistir, é necessário chamar uma empresa autorizada (por exemplo, o Serviço de Assistência Técnica Immergas).', "comment": 'Durante o normal funcionamento do sistema, se por causa de uma anomalia ocorrer um aquecimento excessivo da temperatura de ida em baixa temperatura, a caldeira será bloqueada./Erro de cablagem ou uso incorreto da placa de reposição.'},
-    47: {"text1": 'Redução da potência do queimador', "text2": 'Se a temperatura de fumos atingir um valor elevado, a placa reduz a potência fornecida pelo queimador para limitar danos ao circuito de fumos.', "action": 'Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Quando é detetada uma temperatura elevada de fumos, a caldeira diminui a potência fornecida para evitar danos.'},
-    48: {"text1": 'Anomalia na sonda de fornecimento lado da instalação', "text2": 'A sonda de alimentação lado instalação oferece um valor resistivo fora do limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Se uma sonda de alimentação lado sistema não está conectada ou com defeito, é sinalizada a anomalia.'},
-    49: {"text1": 'Bloqueio alta temperatura na sonda de retorno', "text2": 'Temperatura medida pela sonda de retorno alta ', "action": 'Verifique a circulação correta na caldeira e o bom funcionamento da válvula de três vias. ', "comment": 'Ocorre quando é atingida uma temperatura alta demais no circuito de retorno do permutador.'},
-    50: {"text1": 'Anomalia sonda externa', "text2": 'A sonda externa oferece um valor resistivo fora do limiar', "action": 'Controlar a conexão da sonda externa. O sistema continua a funcionar ', "comment": 'Em caso de sonda externa não conectada ou avariada, será sinalizada uma anomalia'},
-    51: {"text1": 'Queda de comunicação com CAR Wireless', "text2": 'Não há comunicação entre a base transmissora e CAR v2 RF.', "action": 'Verificar o funcionamento do CAR Wireless, verificar a carga das baterias (ver o respetivo manual de instruções).', "comment": 'Em caso de queda de comunicação entre a caldeira e o CAR versão Wireless, a anomalia é sinalizada; a partir desse momento torna-se possível controlar o sistema exclusivamente através do painel de comandos da caldeira.'},
-    54: {"text1": 'Anomalia sonda puffer', "text2": 'A sonda puffer oferece um valor de resistência fora dos limiares permitidos.', "action": 'A modalidade puffer será desabilitada', "comment": 'Em caso de sonda puffer não conectada ou avariada, será sinalizada uma anomalia'},
-    55: {"text1": ' Anomalia na sonda de temperatura de alimentação Zona 1 ', "text2": 'A sonda de ida zona 1 oferece um valor de resistência fora dos limiares permitidos.', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda da zona 1 de baixa temperatura e o sistema não pode funcionar nesta mesma área.'},
-    58: {"text1": 'Anomalia Audax', "text2": 'Sinalização de anomalia da bomba de calor AUDAX conectada ao sistema ', "action": 'A bomba de calor não satisfaz às demandas de aquecimento e refrigeração ambiente, quando as conexões foram restauradas, é necessário desligar o sistema e ligá-lo novamente ', "comment": 'Anomalia da bomba de calor Audax, verifique o tipo de anomalia diretamente no ecrã da bomba de calor '},
-    59: {"text1": 'Bloqueio da frequência da rede de alimentação elétrica', "text2": 'A placa eletrónica detetou uma frequência anómala na rede de alimentação elétrica.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma frequência anómala na alimentação da rede elétrica.'},
-    60: {"text1": 'Anomalia circulador bloqueado', "text2": 'Não é detetado movimento do circulador modulante.', "action": 'Tentar realizar o desbloqueio do circulador tal como descrito no respetivo parágrafo. Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”.', "comment": 'O circulador está parado por uma das seguintes causas: rotor bloqueado ou defeito elétrico.'},
-    61: {"text1": 'Presença de ar no circulador', "text2": 'O circulador modulante está parado por funcionamento em ar detetado.', "action": 'Realizar a purga do circulado e do circuito de aquecimento. Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”.', "comment": 'É detetado ar no interior do circulador; o circulador não pode funcionar.'},
-    62: {"text1": 'Solicitação de calibração completa', "text2": 'A placa não possui a correta configuração dos parâmetros de controlo de combustão.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetada a ausência de calibração da placa eletrónica. Isto pode ocorrer em caso de substituição da placa eletrónica ou em caso de variação dos parâmetros na secção ar / gás e requer uma “calibração completa”.'},
-    63: {"text1": 'Anomalia na sonda de retorno', "text2": 'A sonda de retorno oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira continua a operar sem qualquer integração dos sistemas conectados externos ', "comment": 'Em caso de sonda de retorno não conectada ou avariada, será sinalizada uma anomalia'},
-    67: {"text1": 'Anomalia do pressóstato do sistema solar', "text2": 'Pressóstato sistema aberto, possível falta de fluido', "action": 'Verifique no manómetro do grupo de circulação solar se a pressão está no valor correto ', "comment": 'Devido à queda de pressão no circuito solar, o pressóstato bloqueia o funcionamento do circuito térmico solar '},
-    70: {"text1": 'Sondas invertidas', "text2": 'Em caso de erro na conexão da cablagem da caldeira é detetado o erro', "action": 'A caldeira não arranca. Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Verificar a conexão da sonda de ida e de retorno'},
-    72: {"text1": 'Solicitação de calibração rápida', "text2": 'A placa não possui a correta configuração de alguns parâmetros de controlo de combustão.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetada uma alteração de alguns parâmetros que requer uma “calibração rápida”.'},
-    73: {"text1": 'É detetada uma diferença elevada entre a sonda de ida e de a sonda de ida de segurança.', "text2": 'As sondas de ida apresentam um afastamento elevado.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem precisar efetuar o reset', "comment": 'A placa deteta uma anomalia na leitura das temperaturas das sondas NTC de ida e as causas podem ser: sonda defeituosa, posicionamento incorreto, circulação insuficiente do sistema, entupimento do lado da água do permutador primário.'},
-    74: {"text1": 'Anomalia da sonda de ida de segurança', "text2": 'A sonda de ida de segurança oferece um valor de resistência fora dos limiares permitidos.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda NTC de ida de segurança.'},
-    75: {"text1": 'Bloqueio por causa de sensor NTC danificado', "text2": 'Possível rutura de uma ou de ambas as sondas de ida e retorno do sistema', "action": 'A caldeira não arranca. Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'O sensor da sonda de segurança provoca um gradiente de temperatura elevado'},
-    76: {"text1": 'Deriva sonda ida ou sonda retorno', "text2": 'É detetado um mau funcionamento de uma ou ambas as sondas de ida e retorno do sistema', "action": ' A caldeira não arranca. Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Diferença maior em relação ao valor definido entre a sonda de ida e retorno no caso de pedido de calor'},
-    77: {"text1": 'Anomalia no controlo de combustão', "text2": 'Detetada corrente da válvula de gás fora dos limiares permitidos.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetada uma corrente fora dos limites na válvula de gás.'},
-    78: {"text1": 'Anomalia no controlo de combustão', "text2": 'Detetada corrente da válvula de gás elevada.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetada uma corrente elevada na válvula de gás.'},
-    79: {"text1": 'Anomalia no controlo de combustão', "text2": 'Detetada corrente da válvula de gás baixa.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetada uma corrente reduzida na válvula de gás.'},
-    80: {"text1": 'Bloqueio por mau funcionamento da placa eletrónica', "text2": 'Detetado defeito no driver da válvula de gás eletrónica por problemas na placa ou na válvula de gás.', "action": 'Pressionar o botão de Reset.', "comment": 'Ocorre no caso de mau funcionamento da placa eletrónica que controla a válvula.'},
-    84: {"text1": 'Anomalia na combustão - redução da potência em andamento', "text2": 'Detetadas condições assimiláveis de baixa pressão de alimentação da válvula de gás.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem precisar efetuar o reset', "comment": 'É detetada uma pressão baixa de alimentação na rede de gás. Por consequência, é reduzida a potência do aparelho e é sinalizada a anomalia.'},
-    85: {"text1": 'Bloqueio problema pós-combustão', "text2": 'Potencial problema na válvula de gás, elétrico ou placa eletrónica.', "action": 'Pressionar o botão de Reset. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Chama presente após o fechamento da válvula de gás'},
-    87: {"text1": 'Bloqueio no controlo da válvula de gás', "text2": 'Detetado defeito no controle da válvula de gás.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetado um mau funcionamento de um dos componentes que controlam a válvula de gás.'},
-    88: {"text1": 'Bloqueio no controlo da válvula de gás', "text2": 'Detetado defeito no controle da válvula de gás.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'É detetado um mau funcionamento de um dos componentes que controlam a válvula de gás.'},
-    89: {"text1": 'Sinal de combustão instável', "text2": 'Detetada instabilidade no sinal de combustão.', "action": 'A caldeira continua a funcionar.', "comment": 'A chama está instável por causa de: presença de recirculação de fumos, pressão do gás instável, velocidade do ventilador instável ou por causa de um mau funcionamento do sistema.'},
-    90: {"text1": 'Sinal de combustão fora do limite', "text2": 'Detetado sinal de combustão fora do limite.', "action": 'A caldeira continua a funcionar.', "comment": 'O sinal de combustão é detetado fora do limite de regulação previsto durante um tempo prolongado.'},
-    91: {"text1": 'Bloqueio por acendimento incorreto', "text2": 'A placa esgotou todas as ações possíveis para obter um acendimento ideal do queimador.', "action": 'Pressionar o botão de Reset.', "comment": 'A placa esgotou todas as ações possíveis para obter um acendimento ideal do queimador.'},
-    92: {"text1": 'Limite de correção das rotações do ventilador', "text2": 'A placa atingiu a correção máxima dos giros do ventilador.', "action": 'A caldeira continua a funcionar.', "comment": 'O sistema esgotou todas as correções possíveis do número de rotações do ventilador.'},
-    93: {"text1": 'Sinal de combustão fora do limite', "text2": 'Detetado sinal de combustão fora do limite.', "action": 'A caldeira continua a funcionar.', "comment": 'O sinal de combustão é detetado fora do limite de regulação previsto durante um tempo prolongado.'},
-    94: {"text1": 'Anomalia na combustão', "text2": 'Detetado problema de combustão causado por sistema ou controlo de combustão.', "action": 'Caso as condições normais de funcionamento sejam restabelecidas a caldeira reinicia sem a necessidade de pressionar a tecla “reset”.', "comment": 'É detetado um problema no controlo da combustão que pode ser causado por: pressão baixa do gás, recirculação de fumos, válvula de gás ou placa eletrónica defeituosa.'},
-    95: {"text1": 'Sinal de combustão descontínua', "text2": 'Detetada descontinuidade no sinal de combustão por problemas em conexões elétricas ou dispersão do sinal.', "action": 'A caldeira continua a funcionar.', "comment": 'O sistema deteta uma descontinuidade no sinal de combustão.'},
-    96: {"text1": 'Tubagem de evacuação de fumos obstruída.', "text2": 'Detetada elevada obstrução dos tubos de fumos.', "action": 'A caldeira não arranca. Se o bloqueio ou a anomalia persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Ocorre quando é detetada uma obstrução no sistema de evacuação de fumos.'},
-    98: {"text1": 'Bloqueio n° máximo erros software', "text2": 'A placa eletrónica não funciona corretamente.', "action": 'Pressionar o botão de Reset.', "comment": 'É alcançado o número máximo de erros software admitidos.'},
-    99: {"text1": 'Bloqueio genérico', "text2": 'A placa eletrónica não funciona corretamente.', "action": 'Pressionar o botão de Reset.', "comment": 'Detetada uma anomalia na caldeira.'},
-    101: {"text1": 'Alarme off-line Audax', "text2": 'Perda de comunicação com bomba de calor ', "action": 'A bomba de calor não satisfaz às demandas de aquecimento e refrigeração ambiente, quando as conexões foram restauradas, é necessário desligar o sistema e ligá-lo novamente ', "comment": 'Em caso de falha de comunicação, conexão incorreta ou bomba de calor desligada, a eletrónica da caldeira não deteta a bomba de calor '},
-    102: {"text1": 'Alarme off-line de expansão da zona 1', "text2": 'Perda de comunicação com a expansão da zona 1 ', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Anomalia de comunicação com a zona 1 '},
-    103: {"text1": 'Alarme off-line de expansão da zona 2', "text2": 'Perda de comunicação com a expansão da zona 2 ', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Anomalia de comunicação com a zona 2 '},
-    104: {"text1": 'Alarme off-line de expansão da zona 3', "text2": 'Perda de comunicação com a expansão da zona 3 ', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Anomalia de comunicação com a zona 3 '},
-    106: {"text1": 'Alarme sonda sanitária ', "text2": 'Em caso de integração da caldeira e gestão sanitário separado, a sonda da caldeira controlada pelo operador oferece um valor resistivo fora do limiar', "action": 'O sistema não pode produzir água quente sanitária com a bomba de calor. A produção de água quente sanitária é garantida pela caldeira ', "comment": 'A placa deteta uma anomalia na sonda do termoacumulador'},
-    120: {"text1": ' Alarme set elevado para desumidificação da zona 1 ', "text2": 'O set point calculado pela solicitação zona 1 é muito elevado para uma desumidificação ', "action": 'O set de alimentação calculado é superior ao limite admitido pelo desumidificador. Arrefecer o ambiente e aguardar até que a temperatura do orvalho retorne a valores aceitáveis \u200b\u200b', "comment": 'O set de alimentação arrefecimento calculado para desumidificação é superior ao limite definido na zona 1 '},
-    121: {"text1": 'Alarme offline dispositivo de zona 1', "text2": 'O controle remoto ou controlo remoto da zona 1 é off-line ', "action": 'Verifique se o controle remoto está ativado ', "comment": 'A comunicação com o controlo de zona não é detetada. Não é possível efetuar a termorregulação da zona '},
-    122: {"text1": ' Alarme off-line do dispositivo de zona 2 ', "text2": 'O controle remoto ou controlo remoto da zona 2 é off-line ', "action": 'Verifique se o controle remoto está ativado ', "comment": 'A comunicação com o controlo de zona não é detetada. Não é possível efetuar a termorregulação da zona '},
-    123: {"text1": 'Alarme offline dispositivo de zona 3', "text2": 'O controle remoto ou controlo remoto da zona 3 é off-line ', "action": 'Verifique se o controle remoto está ativado ', "comment": 'A comunicação com o controlo de zona não é detetada. Não é possível efetuar a termorregulação da zona '},
-    125: {"text1": 'Anomalia sonda temperatura ambiente zona 1', "text2": ' A sonda de temperatura ambiente da zona 1 está fora do limiar', "action": 'Além da temperatura, o ponto de orvalho para a zona não é calculado', "comment": 'Anomalia presente na sonda de temperatura ambiente da zona 1 (opcional). Não é possível efetuar a termorregulação da zona '},
-    126: {"text1": 'Anomalia sonda temperatura ambiente zona 2', "text2": 'A sonda de temperatura ambiente da zona 2 está fora do limiar', "action": 'Além da temperatura, o ponto de orvalho para a zona não é calculado', "comment": 'Anomalia presente na sonda de temperatura ambiente da zona 2 (opcional). Não é possível efetuar a termorregulação da zona '},
-    127: {"text1": 'Anomalia sonda temperatura ambiente zona 3', "text2": ' A sonda de temperatura ambiente da zona 3 está fora do limiar', "action": 'Além da temperatura, o ponto de orvalho para a zona não é calculado', "comment": 'Anomalia presente na sonda de temperatura ambiente da zona 3 (opcional). Não é possível efetuar a termorregulação da zona '},
-    129: {"text1": 'Anomalia na sonda humidade zona 1', "text2": 'A sonda de humidade ambiente da Zona 1 está fora do limiar', "action": 'Além da humidade, não será calculado o ponto de orvalho para a zona', "comment": 'Anomalia presente na sonda humidade zona 1 (opcional). Não é possível efetuar o controlo da humidade na zona'},
-    130: {"text1": 'Anomalia na sonda humidade zona 2', "text2": 'A sonda de humidade ambiente da Zona 2 está fora do limiar', "action": 'Além da humidade, não será calculado o ponto de orvalho para a zona', "comment": 'Anomalia presente na sonda humidade zona 2 (opcional). Não é possível efetuar o controlo da humidade na zona'},
-    131: {"text1": 'Anomalia na sonda humidade zona 3', "text2": 'A sonda de humidade ambiente da Zona 3 está fora do limiar', "action": 'Além da humidade, não será calculado o ponto de orvalho para a zona', "comment": 'Anomalia presente na sonda humidade zona 3 (opcional). Não é possível efetuar o controlo da humidade na zona'},
-    132: {"text1": 'Alarme set elevado para desumidificação da zona 2 ', "text2": 'O set point calculado pela solicitação zona 2 é muito elevado para uma desumidificação ', "action": 'O set de alimentação calculado é superior ao limite admitido pelo desumidificador. Arrefecer o ambiente e aguardar até que a temperatura do orvalho retorne a valores aceitáveis \u200b\u200b', "comment": 'O set de alimentação arrefecimento calculado para desumidificação é superior ao limite definido na zona 2 '},
-    133: {"text1": 'Alarme defeito do desumidificador zona 1 ', "text2": 'Desumidificador zona 1 está em alarme ', "action": 'O sistema não realiza a desumidificação na respetiva zona ', "comment": 'Anomalia proveniente do desumidificador (opcional) na zona 1'},
-    134: {"text1": 'Alarme defeito desumidificador zona 2 ', "text2": 'O desumidificador da zona 2 está em alarme', "action": 'O sistema não realiza a desumidificação na respetiva zona ', "comment": 'Anomalia proveniente do desumidificador (opcional) na zona 2 '},
-    135: {"text1": 'Alarme defeito desumidificador zona 3 ', "text2": 'O desumidificador da zona 3 está em alarme', "action": 'O sistema não realiza a desumidificação na respetiva zona ', "comment": 'Anomalia proveniente do desumidificador (opcional) na zona 3'},
-    137: {"text1": 'Alarme sistema restabelecido – Reiniciar o sistema', "text2": 'Após uma operação de restabelecimento, realizada por meio do painel de comandos, é sinalizado um alarme porque é necessário reiniciar o sistema ', "action": 'Desligue e ligue o sistema ', "comment": 'Depois que os parâmetros padrão forem restaurados, o sistema deve ser reiniciado '},
-    138: {"text1": 'Função aquecimento em andamento', "text2": 'Função aquecimento em andamento ', "action": '', "comment": ''},
-    139: {"text1": 'Desaeração em curso', "text2": 'Função de desaeração em curso', "action": '', "comment": ''},
-    177: {"text1": 'Alarme por tempo máximo sanitário', "text2": 'Requisição sanitário efetuada superando um tempo máximo predefinido', "action": 'O sistema continua funcionando com rendimentos não ideais', "comment": 'A produção de água quente sanitária não é satisfeita no tempo preestabelecido (5 horas)'},
-    178: {"text1": 'Ciclo antilegionela sem sucesso', "text2": 'O ciclo antilegionella não foi concluído com sucesso em um tempo definido ', "action": 'Pressionar o botão de Reset', "comment": 'O ciclo antilegionela foi realizado sem sucesso no tempo preestabelecido (3 horas)'},
-    179: {"text1": 'Anomalia sonda líquida', "text2": 'A sonda de fase líquida está fora do limiar.', "action": 'O sistema não se ativa. Entrar em contacto com um técnico habilitado (por exemplo, o Serviço de Assistência Técnica Immergas).', "comment": 'A placa deteta uma anomalia na sonda na fase líquida.'},
-    181: {"text1": 'Perda de comunicação do comando remoto zona 2', "text2": 'Não há comunicação entre placa e remoto zona 2', "action": 'Desconectar o módulo hidrónico da energia elétrica e conectá-lo novamente. Se durante o reacendimento não for detetado o Comando Remoto, o sistema passa para a modalidade de funcionamento local, ou seja, utiliza os comandos presentes no painel de comandos. Neste caso não é possível ativar a função “Aquecimento”.', "comment": 'Ocorre em caso de conexão a um controlo remoto não compatível ou em caso de queda de comunicação entre módulo hidrónico e CARV2 da segunda zona.'},
-    182: {"text1": 'Alarme por unidade motocondensadora', "text2": 'Alarme na motocondensadora', "action": 'O sistema não funciona; referir-se à anomalia na unidade motocondensadora e no respetivo manual de instruções', "comment": 'Será sinalizada uma anomalia na unidade motocondensadora.'},
-    183: {"text1": 'Alarme por unidade motocondensadora em modo teste', "text2": 'A motocondensadora está no modo TESTE ', "action": 'Durante esta fase não é possível satisfazer as requisições de climatização ambiente e produção de água quente sanitária', "comment": 'Será sinalizado que a unidade motocondensadora está em modalidade de teste.'},
-    184: {"text1": 'Alarme de tempo limite de comunicação com unidade externa ', "text2": 'Perda de comunicação com unidade motocondensadora', "action": 'Controlar a ligação elétrica entre as unidades', "comment": 'Será sinalizada uma anomalia por um problema de comunicação entre unidade interna e motocondensadora.'},
-    185: {"text1": 'Alarme de comunicação do módulo de segurança', "text2": 'Perda de comunicação com o módulo de segurança ', "action": 'Requisitar uma verificação da ligação entre os componentes', "comment": 'Problema na comunicação entre placa de regulação e placa de acendimento.'},
-    186: {"text1": 'Anomalia Alta tensão Acendedor ', "text2": 'Módulo de segurança: ocorreu uma anomalia na tensão do Acendedor', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Será sinalizada uma anomalia na placa de acendimento'},
-    187: {"text1": 'Alarme sonda de retorno motocondensadora', "text2": 'A sonda de retorno motocondensadora está fora do limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda NTC de retorno da bomba de calor'},
-    188: {"text1": 'Requisição fora do limiar operacional ', "text2": 'A solicitação efetuada não é executada porque as condições externas não permitem a ativação da motocondensadora', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Será feita uma requisição de aquecimento ou refrigeração com valores de temperatura externa fora dos limites permitidos para o funcionamento.'},
-    189: {"text1": 'Alarme de tempo limite de comunicação com placa de comunicação ', "text2": 'Perda de comunicação com placa de comunicação x motocondensadora', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'Em caso de queda de comunicação entre as placas eletrónicas será sinalizada uma anomalia.'},
-    191: {"text1": 'Não há comunicação RF para CAR v2 RF zona 2', "text2": 'Não há comunicação entre a base do transmissor e CAR v2 RF da zona 2.', "action": 'Verificar o funcionamento do CAR Wireless, verificar a carga das baterias (ver o respetivo manual de instruções).', "comment": 'No caso de queda de comunicação entre a unidade interna e o CAR versão Wireless da segunda zona, a anomalia é sinalizada; a partir desse momento torna-se possível controlar o sistema exclusivamente através do painel de comandos da unidade interna.'},
-    192: {"text1": 'Anomalia na sonda de fornecimento', "text2": 'A sonda de alimentação motocondensadora está fora do limiar', "action": 'Se o bloqueio, ou a anomalia, persistir, entrar em contacto com uma empresa habilitada (como o Serviço de Assistência Técnica Immergas, por exemplo).', "comment": 'A placa deteta uma anomalia na sonda NTC de ida da bomba de calor.'},
-    193: {"text1": 'Aparelho em modalidade de teste', "text2": ' O dispositivo é controlado por um dispositivo externo usando o protocolo Opentherm ', "action": 'O sistema continua a funcionar corretamente.', "comment": 'Será sinalizado que o aparelho está em modalidade de teste.'},
-    194: {"text1": 'Audax Pro desabilitada', "text2": 'A motocondensadora Audax Pro foi desabilitada', "action": 'O sistema continua a funcionar corretamente.', "comment": 'É sinalizado que a motocondensadora foi desabilitada através da respetiva entrada na placa de bornes'},
-    195: {"text1": 'Anomalia de baixa temperatura fase líquida ', "text2": 'A temp. da sonda de fase líquida é muito baixa ', "action": 'Verificar o bom funcionamento do circuito de refrigeração', "comment": 'É detetada uma temperatura baixa demais na fase líquida'},
-    196: {"text1": 'Bloqueio temp. alimentação elevada', "text2": 'É detetada um temperatura elevada demais no circuito de retorno da bomba de calor', "action": 'Verificar o bom funcionamento do circuito de refrigeração', "comment": 'É detetada um temperatura elevada demais no circuito de ida da bomba de calor.'},
-}
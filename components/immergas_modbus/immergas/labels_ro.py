@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: ro)"""
-
-immergas_labels = {
-    'default': {"text1": 'Anomalie generală nerecunoscută', "text2": 'Verificați tabelul erorilor sau fișa selectată', "action": 'Verificați tabelul erorilor sau fișa selectată', "comment": 'Nu există nici o notă în acest sens'},
-    0: {"text1": 'SISTEM OK', "text2": 'Sistemul funcționează corect', "action": 'Nici o acțiune solicitată', "comment": 'Nici o anomalie'},
-    1: {"text1": 'Blocare datorată lipsei aprinderii', "text2": 'Nedetectarea flăcării la sfârșitul ultimei încercări de aprindere', "action": 'Apăsaţi tasta Reset', "comment": 'La orice solicitare de încălzire a mediului ambiant sau preparare de apă caldă de consum, centrala nu porneşte în intervalul de timp prestabilit. La prima pornire sau după o perioadă de nefuncționare prelungită a aparatului poate fi necesară intervenţia pentru eliminarea blocajului.'},
-    2: {"text1": 'Blocare datorată termostatului de siguranţă (supratemperatură)', "text2": 'Intervenţie termostat de siguranţă', "action": 'Apăsaţi tasta Reset', "comment": 'În timpul regimului normal de funcţionare, din cauza unui defect poate apărea supraîncălzirea circuitului intern, iar centrala se blochează.'},
-    3: {"text1": 'Blocarea datorată termostatului de siguranță al gazelor de ardere', "text2": 'Intervenţie termostat gaze de ardere', "action": 'Apăsaţi tasta Reset (versiuni Nike)/ Configurați în mod corect parametrul P.14. Dacă este cazul, apăsași tasta de Resetare (versiuni Star)', "comment": 'În timpul regimului normal de funcţionare, din cauza unui defect poate apărea supraîncălzirea gazelor de ardere şi blocarea centralei (versiuni Nike)/ Configurare greșită a parametrului P.14 (versiune Star)'},
-    4: {"text1": 'Blocarea datorată rezistenţei de contact', "text2": 'Este detectată o anomalie pe circuitul de comandă vană gaz', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa electronică a detectat o anomalie de alimentare a vanei de gaz. Verificaţi conexiunea acesteia. (anomalia este detectată şi afişată numai în cazul solicitării).'},
-    5: {"text1": 'Anomalie sondă de tur', "text2": 'Sonda de tur oferă o valoare rezistivă în afara limitelor', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa identifică un defect la sonda NTC de tur.'},
-    6: {"text1": 'Anomalie sondă de apă caldă de consum', "text2": 'Sonda de apă de consum oferă o valoare rezistivă în afara limitelor', "action": 'În acest caz centrala continuă să prepare apă caldă de consum, dar cu performanţe reduse. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa identifică un defect la sonda NTC de apă de consum.'},
-    8: {"text1": 'Număr maxim de resetări', "text2": 'Indică atingerea numărului maxim de resetări permise de placa integrată', "action": 'Atenţie: Defectul poate fi resetat de 5 ori consecutiv, după care funcţia devine inaccesibilă timp de cel puţin o oră. După o oră se pot face iarăși maxim 5 încercări. Oprind şi repornind aparatul se recâştigă cele 5 încercări.', "comment": 'Numărul de resetări disponibile deja efectuat.'},
-    10: {"text1": 'Presiunea din instalație este insuficientă', "text2": 'Contactul presostatului instalației este deschis', "action": 'Verificaţi pe manometrul centralei ca presiunea din instalaţie să fie cuprinsă între 1÷1,2 bar şi eventual restabiliţi presiunea corectă.', "comment": 'Nu este detectată o presiune suficientă a apei în circuitul de încălzire care să asigure funcţionarea corectă a centralei.'},
-    11: {"text1": 'Anomalie presostat gaze de ardere', "text2": 'Anomalie la presostatul gaze de ardere sau ventilator', "action": 'Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Dacă condițiile normale de funcționare sunt restabilite, centrala pornește din nou fără a fi necesară resetarea acesteia'},
-    12: {"text1": 'Defect la sonda boilerului', "text2": 'Sonda boilerului oferă o valoare rezistivă în afara limitelor', "action": 'Centrala nu poate prepara apă caldă de consum. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa identifică un defect la sonda boilerului'},
-    13: {"text1": 'Debitmetru aer/gaze de ardere în afara limitelor', "text2": 'Semnalul aer/gaze de ardere este în afara limitelor sau cu ventilatorul oprit, controlul citește un semnal prea mare', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Cu ventilatorul oprit, controlul aer/gaze de ardere citește un semnal prea mare (contacte presostat lipite)'},
-    15: {"text1": 'Eroare de configurare', "text2": 'Placa detectează o neconcordanță între configurarea sa și semnalele în intrare', "action": 'În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi. Verificaţi ca centrala să fie configurată corect. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Dacă placa electronică detectează o anomalie sau o neconcordanţă pe cablajul electric, centrala nu porneşte.'},
-    16: {"text1": 'Anomalie a ventilatorului', "text2": 'Ventilatorul se rotește când nu este alimentat sau este oprit când este alimentat', "action": 'Apăsaţi tasta Reset. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Apare în cazul în care ventilatorul prezintă o defecţiune mecanică sau electrică.'},
-    17: {"text1": 'Viteză ventilator incorectă', "text2": 'Numărul de rotații ventilator este în afara limitelor corecte', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Număr de rotații ventilator incorect'},
-    20: {"text1": 'Blocare datorată flăcării parazite', "text2": 'Detectare flacără anormală', "action": 'Apăsaţi tasta Reset. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Apare în cazul unei dispersii în circuitul de detectare sau al unui defect la sistemul de control al flăcării.'},
-    23: {"text1": 'Anomalie sondă retur', "text2": 'Sondă retur oferă o valoare rezistivă în afara limitelor', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa identifică un defect la sonda NTC de tur.'},
-    24: {"text1": 'Anomalie a panoului de comandă', "text2": 'Este detectată o apăsare continuă pe butoanele tabloului de bord', "action": 'În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa identifică un defect la panoul de comandă.'},
-    25: {"text1": 'Blocare sondă gaze de ardere / blocare CRC (TERA)', "text2": 'Temperatură gaze de ardere în afara limitelor / memorie coruptă (TERA)', "action": 'Apăsați pe tasta Reset', "comment": 'Gradient gaze de ardere ridicat, pericol de blocare a pompei de circulație sau lipsă apă / memorie coruptă'},
-    27: {"text1": 'Circulație insuficientă', "text2": 'Supraîncălzirea centralei datorită circulației reduse în circuitul primar', "action": 'Apăsați pe butonul de Resetare', "comment": 'Verificați să nu fie prezente blocaje pe circuitul de încălzire și/sau verificați ca pompa de circulație să funcționeze corect'},
-    28: {"text1": 'Scurgere din circuit apă caldă de consum', "text2": 'Dacă în timpul funcționării în regim de încălzire se observă o creștere a temperaturii apei calde de consum, centrala semnalează anomalia și reduce temperatura încălzirii pentru a limita formarea de calcar în schimbător.', "action": 'Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Asigurați-vă că toate robinetele sistemului de apă caldă de consum sunt închise sau că nu prezintă scurgeri și verificați oricum să nu existe pierderi în sistem. Centrala revine în modul de funcționare normală odată restabilite condițiile optime ale instalației de apă de consum'},
-    29: {"text1": 'Anomalie sondă  gaze de ardere', "text2": 'Sonda de gaze de ardere oferă o valoare rezistivă în afara limitelor', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Placa identifică un defect la sonda de gaze de ardere.'},
-    31: {"text1": 'Pierderea comunicării cu CARV2', "text2": 'Nu este prezentă comunicarea între placă și dispozitivul de la distanță.', "action": 'Întrerupeţi şi realimentaţi centrala cu tensiune. Dacă la repornire nu este detectată prezenţa dispozitivului de comandă de la distanţă, centrala trece în mod de funcţionare local şi pot fi utilizate comenzile aflate pe panoul de comandă. În acest caz nu este posibilă activarea funcţiei “Încălzire”.', "comment": 'Apare în cazul conectării unui dispozitiv de comandă de la distanţă necompatibil sau în cazul întreruperii comunicării dintre centrală şi CARV2.'},
-    32: {"text1": 'Defect la sonda din Zona 2 cu temperatură redusă', "text2": 'Sondă tur zona 2 în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'În cazul în care placa electronică detectează un defect la sonda din zona 2 pentru temperatură redusă, sistemul nu poate funcționa în zona respectivă'},
-    33: {"text1": 'Defect la sonda din Zona 3 cu temperatură redusă', "text2": 'Sondă tur zona 3 în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'În cazul în care placa electronică detectează un defect la sonda din zona 2 pentru temperatură redusă, sistemul nu poate funcționa în zona respectivă'},
-    36: {"text1": 'Întrerupere comunicare IMG Bus.', "text2": 'Pierderea comunicării pe protocolul IMG Bus.', "action": 'Centrala nu îndeplineşte solicitările de încălzire.', "comment": 'Dacă din cauza unui defect la unitatea de control a centralei, la placa cu zone (opţională) sau la IMG Bus, este întreruptă comunicarea dintre diferitele componente.'},
-    37: {"text1": 'Valoare redusă a tensiunii de alimentare.', "text2": 'Tensiunea de alimentare placă are valori inferioare limitelor admise.', "action": 'În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi.', "comment": 'Apare în cazul în care tensiunea de alimentare este inferioară limitelor admise pentru funcţionarea corectă a centralei.'},
-    38: {"text1": 'Pierderea semnalului de flacără', "text2": 'Placa, după ce a preluat o valoare corectă de curent de flacără, semnalează o cădere a curentului de flacără.', "action": 'În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi.', "comment": 'Apare în cazul în care centrala este pornită corect şi are loc stingerea neaşteptată a flăcării arzătorului; este realizată o nouă tentativă de aprindere şi, în caz de restabilire a condiţiilor normale de funcţionare, nu este necesară resetarea centralei.'},
-    39: {"text1": 'defect la sonda captatorului solar', "text2": 'Sonda pentru exterior oferă o valoare rezistivă în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Placa electronică detectează un defect la sonda captatorului solar, centrala continuă să funcționeze normal fără aport de energie solară pentru încălzirea apei calde de consum, deoarece funcționarea pompei solare este întreruptă'},
-    40: {"text1": 'Defect sondă acumulare solară', "text2": 'Sonda de acumulare solară oferă o valoare rezistivă în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Placa electronică detectează un defect la sonda de acumulare solară, centrala continuă să funcționeze normal fără aport de energie solară pentru încălzirea apei calde de consum, deoarece funcționarea pompei solare este întreruptă.'},
-    41: {"text1": 'Temperatură ridicată a captatorului solar', "text2": 'Captatorul solar a depășit temperatura maximă setată', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Apare atunci când temperatura captatorului solar depăşeşte limita maximă setată'},
-    42: {"text1": 'Temperatură ridicată la acumulare solară', "text2": 'Acumularea solară a depășit temperatura maximă setată', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Apare atunci când temperatura apei din acumularea solară depăşeşte limita maximă setată.'},
-    43: {"text1": 'Blocare din cauza pierderii semnalului de flacără', "text2": 'Pierderea semnalului de flacără pe durata funcționării în regim de mai multe ori consecutiv.', "action": 'Apăsaţi tasta Reset; înainte de a porni centrala efectuează un ciclu de post-ventilaţie.', "comment": 'Apare dacă se prezintă de mai multe ori consecutiv, în intervalul de timp prestabilit, eroarea “Pierderea semnalului de flacără”.'},
-    44: {"text1": 'Blocare din cauza depăşirii numărului maxim de deschideri la intervale apropiate de timp a vanei de gaz', "text2": 'Acumularea timpului total de deschidere vană gaz fără detectare de flacără este mai mare decât timpul maxim admis.', "action": 'Apăsaţi tasta Reset.', "comment": 'Apare în cazul în care vana de gaz rămâne deschisă pentru un interval de timp mai mare decât cel prevăzut pentru funcţionarea normală fără că centrala să pornească.'},
-    45: {"text1": 'dT ridicat', "text2": 'Diferenţa de temperatură măsurată dintre circuitul de tur şi retur este ≥ di 40°C.', "action": 'Este limitată puterea arzătorului pentru a preveni eventuale daune la modulul de condensare; după restabilirea valorii corecte a dT centrala reia funcționarea normală. Verificaţi ca apa să circule în instalaţie, pompa să fie configurată conform exigenţelor instalaţiei şi sonda de pe circuitul de retur să funcţioneze corect.', "comment": 'Centrala detectează creșterea neprevăzută a dT dintre sonda circuitului de tur și sonda circuitului de retur a instalației.'},
-    46: {"text1": 'Intervenţie termostat temperatură redusă / Configurare greșită cablaj/placă', "text2": 'Termostatul de siguranță poziționat pe conexiunea circuitului de tur de la centrală la DIM v2 (care funcționează doar la Temperatură Redusă) a atins temperaturi ridicate. / Eroare cablare sau utilizare placă de schimb greșită', "action": 'În acest caz după o reducere corespunzătoare a temperaturii este posibilă resetarea termostatului (vezi fișa de instrucțiuni). / Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'În timpul regimului normal de funcţionare, din cauza unui defect poate apărea o creștere semnificativă a temperaturii de pe circuitul de retur, iar centrala se blochează. / Eroare cablare sau utilizare placă de schimb greșită'},
-    47: {"text1": 'Limitarea puterii arzătorului', "text2": 'Dacă temperatura gazelor de ardere atinge o valoare ridicată placa reduce puterea furnizată de arzător, pentru a limita daunele la circuitul de gaze de ardere.', "action": 'Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'În cazul în care este detectată temperatura înaltă a gazelor de ardere, centrala reduce puterea pentru a preveni defectarea.'},
-    48: {"text1": 'Defect la sonda de tur în partea instalației', "text2": 'Sonda de tur în partea instalației oferă o valoare rezistivă în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'În caz de sondă de tur în partea instalației neconectată sau defectă este semnalată anomalia'},
-    49: {"text1": 'Blocare datorată temperaturii ridicate citite de sonda circuitului de retur', "text2": 'Temperatura măsurată de sonda de retur înaltă', "action": 'Verificați ca apa să circule în instalație şi vana cu trei căi să funcționeze corect.', "comment": 'Apare în cazul în care este atinsă o temperatură foarte ridicată pe circuitul de retur de la schimbător'},
-    50: {"text1": 'Defect sondă pentru exterior', "text2": 'Sonda pentru exterior oferă o valoare rezistivă în afara limitelor', "action": 'Verificaţi conexiunea sondei pentru exterior. Sistemul continuă să funcționeze', "comment": 'În caz de sondă pentru exterior neconectată sau defectă este semnalată anomalia'},
-    51: {"text1": 'Întrerupere comunicare CAR Wireless', "text2": 'Comunicarea între baza transmițătoare și CAR v2 RF a căzut.', "action": 'Verificaţi funcţionarea CAR Wireless, verificaţi ca bateriile să fie încărcate (vezi fişa de instrucţiuni).', "comment": 'În cazul întreruperii comunicării dintre centrală şi CAR versiunea Wireless, este semnalată o anomalie; din acest moment sistemul poate fi controlat numai prin intermediul panoului de comandă al centralei.'},
-    54: {"text1": 'Anomalie sondă puffer', "text2": 'Sonda puffer oferă o valoare rezistivă în afara limitelor', "action": 'Modalitatea puffer este dezactivată', "comment": 'În caz de sondă puffer neconectată sau defectă este semnalată anomalia'},
-    55: {"text1": 'Anomalie sondă temperatură tur Zona 1', "text2": 'Sonda de tur zona 1 oferă o valoare rezistivă în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'În cazul în care placa electronică detectează un defect la sonda din zona 1 pentru temperatură redusă, sistemul nu poate funcționa în zona respectivă.'},
-    58: {"text1": 'Anomalie Audax', "text2": 'Semnalare de anomalie de către pompa de căldură AUDAX conectată la sistem', "action": 'Pompa de căldură nu îndeplinește solicitările de încălzire și răcire ambient; după restabilirea conexiunilor trebuie să opriți și să reporniți sistemul', "comment": 'Anomalie la pompa de căldură Audax, verificați tipul de anomalie direct pe display-ul pompei de căldură'},
-    59: {"text1": 'Blocare datorată frecvenţei reţelei de alimentare cu energie electrică', "text2": 'Placa electronică a detectat o frecvenţă anormală pe rețeaua de alimentare cu energie electrică.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Placa electronică a detectat o frecvenţă anormală pe rețeaua de alimentare cu energie electrică.'},
-    60: {"text1": 'Defect pompă de circulaţie blocată', "text2": 'Pompa de circulație modulantă este oprită.', "action": 'În cercați să deblocați pompa conform indicațiilor din paragraful corespunzător. În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi.', "comment": 'Pompa de circulație este oprită din una din următoarele cauze: rotor blocat, defecțiune electrică.'},
-    61: {"text1": 'Prezență aer în pompa de circulație', "text2": 'Pompa de circulație modulantă este oprită din cauza detectării funcționării cu aer.', "action": 'Dezaerați pompa de circulație și circuitul de încălzire. În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi.', "comment": 'Este detectat aer în interiorul pompei de circulație; pompa de circulație nu poate funcționa.'},
-    62: {"text1": 'Solicitare calibrare completă', "text2": 'Placa nu are o configurare corectă a parametrilor de control al combustiei.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată lipsa calibrării plăcii electronice. Apare în caz de înlocuire a plăcii electronice sau în caz de modificare a parametrilor din secţiunea aer/gaz motiv pentru care este necesară efectuarea “calibrării complete”.'},
-    63: {"text1": 'Anomalie sondă retur instalație', "text2": 'Sonda de retur oferă o valoare rezistivă în afara limitelor', "action": 'Centrala continuă să funcționeze fără nici o integrare de la sistemele externe conectate', "comment": 'În caz de sondă de retur neconectată sau defectă este semnalată anomalia'},
-    67: {"text1": 'Anomalie presostat instalație solară', "text2": 'Presostat instalație deschis, posibilă lipsă lichid', "action": 'Verificați pe manometrul grupului de circulație instalație solară ca presiunea să fie la valoarea corectă', "comment": 'Din cauza unei reduceri a presiunii în circuitul solar presostatul blochează funcționarea circuitului solar termic'},
-    70: {"text1": 'Sonde inversate', "text2": 'În caz de eroare de conexiune a cablului centralei, este detectată eroarea', "action": 'Centrala nu pornește. Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Verificați conexiunea sondei de tur și retur'},
-    72: {"text1": 'Solicitare calibrare rapidă', "text2": 'Placa nu are o configurare corectă a anumitor parametri de control al combustiei.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată modificarea unor parametri, motiv pentru care este necesară efectuarea “calibrării rapide”.'},
-    73: {"text1": 'Este detectată o diferenţă importantă între valorile sondei de tur şi a celei de tur de siguranţă', "text2": 'Sondele de tur prezintă o diferență ridicată.', "action": ' În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi', "comment": 'Placa indică o anomalie după citirea temperaturilor detectate de sondele NTC de tur, cauzele pot fi: sondă defectă, amplasare incorectă, circulaţie redusă în instalaţie, blocarea părţii de apă a schimbătorului primar.'},
-    74: {"text1": 'Anomalie sondă tur de siguranţă', "text2": 'Sonda de tur de siguranță oferă o valoare rezistivă în afara limitelor.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Placa identifică un defect la sonda NTC de tur de siguranţă.'},
-    75: {"text1": 'Blocare din cauza deteriorării senzorului NTC', "text2": 'Posibila defectare a uneia sau a ambelor sonde de tur către instalație și retur de la instalație', "action": 'Centrala nu pornește. Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Senzorul sondei de siguranță provoacă un gradient de temperatură ridicat'},
-    76: {"text1": 'Derivă sondă de tur sau retur', "text2": 'Este detectată funcționarea defectuoasă a uneia sau a ambelor sonde de tur și retur de la instalație', "action": 'Centrala nu pornește. Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Diferență mai mare față de cea dintre sonda de tur și retur în cazul solicitării căldurii'},
-    77: {"text1": 'Anomalie control combustie', "text2": 'Detectat curent la vana de gaz în afara limitelor.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată o valoare în afara limitelor a curentului pe vana de gaz .'},
-    78: {"text1": 'Anomalie control combustie', "text2": 'Detectată o valoare ridicată a curentului pe vana de gaz.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată o valoare ridicată a curentului pe vana de gaz.'},
-    79: {"text1": 'Anomalie control combustie', "text2": 'Detectată o valoare scăzută a curentului la vana de gaz.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată o valoare redusă a curentului pe vana de gaz.'},
-    80: {"text1": 'Blocare datorată funcţionării defectuoase a plăcii electronice', "text2": 'Detectată defecțiune la driverul vanei de gaz electronice din cauza unor probleme la placă sau la vana de gaz.', "action": 'Apăsaţi tasta Reset', "comment": 'Apare loc în cazul funcţionării defectuoase a plăcii electronice care controlează vana.'},
-    84: {"text1": 'Anomalie combustie - reducerea puterii actuale', "text2": 'Detectate condiții asimilabile presiunii scăzute de alimentare a vanei de gaz.', "action": ' În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi', "comment": 'Este detectată presiune redusă de alimentare pe reţeaua de gaz. În consecinţă este limitată puterea aparatului şi este semnalată anomalia.'},
-    85: {"text1": 'Blocare datorată unei probleme post-combustie', "text2": 'Problemă la vana de gaz, electrod sau placa electronică', "action": 'Apăsaţi tasta Reset. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas)', "comment": 'Flacără prezentă după închiderea vanei de gaz'},
-    87: {"text1": 'Blocare dispozitiv de control vană de gaz', "text2": 'Detectată defecțiune la dispozitivul de control al vanei de gaz.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată o funcţionare defectuoasă a unuia dintre componentele care controlează vana de gaz.'},
-    88: {"text1": 'Blocare dispozitiv de control vană de gaz', "text2": 'Detectată defecțiune la dispozitivul de control al vanei de gaz.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Este detectată o funcţionare defectuoasă a unuia dintre componentele care controlează vana de gaz.'},
-    89: {"text1": 'Semnal combustie instabilă', "text2": 'Detectată instabilitate pe semnalul de combustie.', "action": 'Centrala continuă să funcționeze.', "comment": 'Flacăra este instabilă din cauza: recirculării gazelor de ardere, vântului, presiunii instabile a gazului, vitezei instabile a ventilatorului sau din cauza funcţionării defectuoase a sistemului.'},
-    90: {"text1": 'Semnal combustie în afara limitelor', "text2": 'Detectat semnal de combustie în afara limitelor.', "action": 'Centrala continuă să funcționeze.', "comment": 'Semnalul de combustie este în afara limitelor de reglare prevăzute pentru un timp îndelungat.'},
-    91: {"text1": 'Blocare aprindere incorectă', "text2": 'Placa electronică a terminat toate acţiunile posibile pentru o aprindere optimă a arzătorului.', "action": 'Apăsaţi tasta Reset', "comment": 'Placa electronică a terminat toate acţiunile posibile pentru a obţine aprinderea optimă a arzătorului.'},
-    92: {"text1": 'Limită de corecţie a rotaţiilor ventilatorului', "text2": 'Placa a atins corecția maximă a rotațiilor ventilatorului.', "action": 'Centrala continuă să funcționeze.', "comment": 'Sistemul a terminat toate corecţiile posibile ale numărului de rotaţii a ventilatorului.'},
-    93: {"text1": 'Semnal combustie în afara limitelor', "text2": 'Detectat semnal de combustie în afara limitelor.', "action": 'Centrala continuă să funcționeze.', "comment": 'Semnalul de combustie este în afara limitelor de reglare prevăzute pentru un timp îndelungat.'},
-    94: {"text1": 'Anomalie combustie', "text2": 'Detectată problemă de combustie cauzată de sistemul sau de dispozitivul de control al combustiei.', "action": 'În caz de restabilire a condiţiilor normale, centrala porneşte fără a fi nevoie să o resetaţi.', "comment": 'Este detectată o problemă la dispozitivul de control a combustiei care poate fi cauzat de: presiunea redusă a gazului, recircularea gazelor de ardere, vana de gaz sau placa electronică defectă.'},
-    95: {"text1": 'Semnal combustie discontinuă', "text2": 'Detectată discontinuitate pe semnalul de combustie din cauza unor probleme la conexiunile electrice sau din cauza dispersiei semnalului.', "action": 'Centrala continuă să funcționeze.', "comment": 'Sistemul detectează o discontinuitate a semnalului de combustie.'},
-    96: {"text1": 'Conducte de evacuare a gazelor de ardere înfundate', "text2": 'Detectată înfundare majoră pe conductele de evacuare a gazelor de ardere.', "action": 'Centrala nu porneşte. Dacă blocarea sau anomalia persistă, apelaţi la serviciile unei societăţi autorizate (de exemplu Serviciul de Asistenţă Tehnică Immergas).', "comment": 'Apare în cazul în care este detectată blocarea sistemului de evacuare a gazelor de ardere.'},
-    98: {"text1": 'Blocare datorată numărului maxim de erori software', "text2": 'Placa electronică nu funcționează corect.', "action": 'Apăsaţi tasta Reset', "comment": 'A fost atins numărul maxim de erori software admis.'},
-    99: {"text1": 'Blocare generală', "text2": 'Placa electronică nu funcționează corect.', "action": 'Apăsaţi tasta Reset', "comment": 'Este detectată o anomalie la centrală.'},
-    101: {"text1": 'Alarmă off-line Audax', "text2": 'Pierderea comunicării cu pompa de căldură', "action": 'Pompa de căldură nu îndeplinește solicitările de încălzire și răcire ambient; după restabilirea conexiunilor trebuie să opriți și să reporniți sistemul', "comment": 'În caz de întrerupere a comunicării, conexiune greșită sau pompă de căldură oprită partea electronică a centralei nu detectează pompa de căldură'},
-    102: {"text1": 'Alarmă off-line expansiune zona 1', "text2": 'Pierderea comunicării cu expansiunea zona 1', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Anomalie comunicare cu zona 1'},
-    103: {"text1": 'Alarmă off-line expansiune zona 2', "text2": 'Pierderea comunicării cu expansiunea zona 2', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Anomalie comunicare cu zona 2'},
-    104: {"text1": 'Alarmă off-line expansiune zona 3', "text2": 'Pierderea comunicării cu expansiunea zona 3', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Anomalie comunicare cu zona 3'},
-    106: {"text1": 'Alarmă sondă apă caldă de consum', "text2": 'În caz de integrare cu centrala și de gestionare separată a apei calde de consum, sonda boilerului controlată de dispozitivul de gestionare oferă o valoare rezistivă în afara limitelor', "action": 'Sistemul nu poate prepara apă caldă de consum cu pompa de căldură. Prepararea apei calde de consum este asigurată de centrală', "comment": 'Placa identifică un defect la sonda boilerului'},
-    120: {"text1": 'Alarmă set ridicat pentru dezumidificare zona 1', "text2": 'Setpoint-ul calculat de solicitare zona 1 este prea ridicat pentru o dezumidificare', "action": 'Set-ul de tur calculat este mai mare decât limita admisă de dezumidificator. Răciți ambientul și așteptați ca temperatura de rouă să revină la valori acceptabile', "comment": 'Set-ul de tur răcire calculat pentru dezumidificare este mai mare decât limita setată în zona 1'},
-    121: {"text1": 'Alarmă offline dispozitiv al zonei 1', "text2": 'Dispozitivul de comandă de la distanță sau controlul la distanță al zonei 1 este offline', "action": 'Verificați ca dispozitivul de control de la distanță să fie pornit', "comment": 'Nu este detectată comunicarea cu controlul zonei. Nu este posibilă efectuarea termoreglării zonei'},
-    122: {"text1": 'Alarmă offline dispozitiv al zonei 2', "text2": 'Dispozitivul de comandă de la distanță sau controlul la distanță al zonei 2 este offline', "action": 'Verificați ca dispozitivul de control de la distanță să fie pornit', "comment": 'Nu este detectată comunicarea cu controlul zonei. Nu este posibilă efectuarea termoreglării zonei'},
-    123: {"text1": 'Alarmă offline dispozitiv al zonei 3', "text2": 'Dispozitivul de comandă de la distanță sau controlul la distanță al zonei 3 este offline', "action": 'Verificați ca dispozitivul de control de la distanță să fie pornit', "comment": 'Nu este detectată comunicarea cu controlul zonei. Nu este posibilă efectuarea termoreglării zonei'},
-    125: {"text1": 'Anomalie sondă temperatură ambientală zona 1', "text2": 'Sonda de temperatură ambientală a zonei 1 este în afara limitelor', "action": 'Pe lângă temperatură nu este calculat nici punctul de rouă pentru zona', "comment": 'Anomalie prezentă pe sonda de temperatură ambientală zona 1 (opțional). Nu este posibilă efectuarea termoreglării zonei'},
-    126: {"text1": 'Anomalie sondă temperatură ambientală zona 2', "text2": 'Sonda de temperatură ambientală a zonei 2 este în afara limitelor', "action": 'Pe lângă temperatură nu este calculat nici punctul de rouă pentru zona', "comment": 'Anomalie prezentă pe sonda de temperatură ambientală zona 2 (opțional). Nu este posibilă efectuarea termoreglării zonei'},
-    127: {"text1": 'Anomalie sondă temperatură ambientală zona 3', "text2": 'Sonda de temperatură ambientală a zonei 3 este în afara limitelor', "action": 'Pe lângă temperatură nu este calculat nici punctul de rouă pentru zona', "comment": 'Anomalie prezentă pe sonda de temperatură ambientală zona 3 (opțional). Nu este posibilă efectuarea termoreglării zonei'},
-    129: {"text1": 'Anomalie sondă umiditate zona 1', "text2": 'Sonda de umiditate ambientală a zonei 1 este în afara limitelor', "action": 'Pe lângă umiditate nu este calculat nici punctul de rouă pentru zona', "comment": 'Anomalie prezentă pe sonda de umiditate zona 1 (opțional). Nu este posibilă efectuarea controlului umidității zonei'},
-    130: {"text1": 'Anomalie sondă umiditate zona 2', "text2": 'Sonda de umiditate ambientală a zonei 2 este în afara limitelor', "action": 'Pe lângă umiditate nu este calculat nici punctul de rouă pentru zona', "comment": 'Anomalie prezentă pe sonda de umiditate zona 2 (opțional). Nu este posibilă efectuarea controlului umidității zonei'},
-    131: {"text1": 'Anomalie sondă umiditate zona 3', "text2": 'Sonda de umiditate ambientală a zonei 3 este în afara limitelor', "action": 'Pe lângă umiditate nu este calculat nici punctul de rouă pentru zona', "comment": 'Anomalie prezentă pe sonda de umiditate zona 3 (opțional). Nu este posibilă efectuarea controlului umidității zonei'},
-    132: {"text1": 'Alarmă set ridicat pentru dezumidificare zona 2', "text2": 'Setpoint-ul calculat de solicitare zona 2 este prea ridicat pentru o dezumidificare', "action": 'Set-ul de tur calculat este mai mare decât limita admisă de dezumidificator. Răciți ambientul și așteptați ca temperatura de rouă să revină la valori acceptabile', "comment": 'Set-ul de tur răcire calculat pentru dezumidificare este mai mare decât limita setată în zona 2'},
-    133: {"text1": 'Alarmă defecțiune dezumidificator zona 1', "text2": 'Dezumidificatorul zonei 1 este în alarmă', "action": 'Sistemul nu efectuează dezumidificarea în zona corespunzătoare', "comment": 'Anomalie provenită de la dezumidificator (opțional) pe zona 1'},
-    134: {"text1": 'Alarmă defecțiune dezumidificator zona 2', "text2": 'Dezumidificatorul zonei 2 este în alarmă', "action": 'Sistemul nu efectuează dezumidificarea în zona corespunzătoare', "comment": 'Anomalie provenită de la dezumidificator (opțional) pe zona 2'},
-    135: {"text1": 'Alarmă defecțiune dezumidificator zona 3', "text2": 'Dezumidificatorul zonei 3 este în alarmă', "action": 'Sistemul nu efectuează dezumidificarea în zona corespunzătoare', "comment": 'Anomalie provenită de la dezumidificator (opțional) pe zona 3'},
-    137: {"text1": 'Alarmă sistem restabilit – Reporniți sistemul', "text2": 'După o operațiune de restabilire, care este efectuată de la panoul de comandă, este semnalată o alarmă deoarece este necesară repornirea sistemului', "action": 'Opriți și porniți sistemul', "comment": 'După finalizarea restabilirii parametrilor standard este necesară repornirea sistemului'},
-    138: {"text1": 'Încălzire șapă în curs', "text2": 'Funcție de încălzire șapă în curs', "action": '', "comment": ''},
-    139: {"text1": 'Dezaerare în curs', "text2": 'Funcție de dezaerare în curs', "action": '', "comment": ''},
-    177: {"text1": 'Alarmă timp maxim apă caldă de consum', "text2": 'Solicitarea apă caldă de consum a fost efectuată depășind un timp maxim prestabilit', "action": 'sistemul continuă să funcționeze cu performanțe reduse', "comment": 'Nu este realizată prepararea apei caldă de consum în timpul prestabilit (5 ore)'},
-    178: {"text1": 'Ciclu antilegionella fără succes', "text2": 'Ciclul antilegionella nu s-a încheiat cu succes într-un într-un interval de timp prestabilit', "action": 'Apăsați pe tasta Reset', "comment": 'Ciclul antilegionella este efectuat fără succes în intervalul de timp prestabilit (3 ore)'},
-    179: {"text1": 'Anomalie sondă lichidă', "text2": 'Sonda de fază lichidă este în afara limitelor.', "action": 'Sistemul nu pornește. Solicitați serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Placa identifică un defect la sonda de fază lichidă'},
-    181: {"text1": 'Pierderea comunicării cu dispozitivul de comandă de la distanță zona 2', "text2": 'Nu este prezentă comunicarea între placă și dispozitivul de la distanță zona 2.', "action": 'Întrerupeți și realimentați modulul hidronic cu tensiune. Dacă la repornire nu este detectată prezenţa dispozitivului de comandă de la distanţă, sistemul trece pe regimul de funcţionare local şi pot fi utilizate comenzile aflate pe panoul de comandă. În acest caz nu este posibilă activarea funcției “Încălzire”', "comment": 'Are loc în cazul conectării la o comandă de la distanță incompatibilă sau în cazul întreruperii comunicării dintre modul hidronic şi CARV2 al celei de-a doua zone'},
-    182: {"text1": 'Alarmă unitate motocondensantă', "text2": 'Apare o alarmă la unitatea motocondensantă', "action": 'Sistemul nu funcționează, vezi anomalia la unitatea motocondensantă și manualul de instrucțiuni corespunzător', "comment": 'Este semnalată o anomalie la unitatea motocondensantă'},
-    183: {"text1": 'Alarmă unitate motocondensantă în testmode', "text2": 'Unitatea motocondensantă se află în regim TESTMODE', "action": 'În timpul acestei faze nu este posibilă îndeplinirea cerințelor de climatizare ambient și de preparare apă caldă de consum', "comment": 'Este semnalat că unitatea motocondensantă este în faza de test mode'},
-    184: {"text1": 'Alarmă timeout comunicare cu unitatea externă', "text2": 'Pierderea comunicării cu unitatea motocondensantă', "action": 'Solicitați verificarea conexiunii electrice dintre unități', "comment": 'Este semnalată anomalia din cauza unei probleme de comunicare dintre unitatea internă și unitatea motocondensantă'},
-    185: {"text1": 'Alarmă comunicare safety module', "text2": 'Pierderea comunicării cu safety –module', "action": 'Solicitați verificarea conexiunii dintre componente', "comment": 'Problemă în comunicarea dintre placa de reglare și placa de pornire'},
-    186: {"text1": 'Anomalie înaltă tensiune aprinzător', "text2": 'Safety module: s-a produs o anomalie pe tensiunea aprinzătorului', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Este semnalată o anomalie la placa de pornire'},
-    187: {"text1": 'Alarmă sondă retur unitate motocondensantă', "text2": 'Sonda de retur unitate motocondensantă este în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Placa detectează un defect la sonda NTC de retur pompă de căldură'},
-    188: {"text1": 'Solicitare în afara limitelor de funcționare', "text2": 'Solicitarea efectuată nu este realizată deoarece condițiile externe nu permit activarea unității motocondensante', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Este efectuată o solicitare de încălzire sau răcire cu temperatura externă în afara limitelor de funcționare'},
-    189: {"text1": 'Alarmă timeout comunicare cu cardul de comunicare', "text2": 'Pierderea comunicării cu cardul de comunicare x unitatea motocondensantă', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'În caz de întrerupere a comunicării între plăcile electronice este semnalată anomalia'},
-    191: {"text1": 'Întrerupere comunicare RF către CAR v2 RF zona 2', "text2": 'Comunicarea între baza transmițătoare și CAR v2 RF a zonei 2 a căzut.', "action": 'Verificați funcționarea CAR Wireless, verificați ca bateriile să fie încărcate (vezi fișa de instrucțiuni)', "comment": 'În cazul întreruperii comunicării dintre unitatea internă şi CAR versiunea Wireless a celei de-a doua zone, este semnalată o anomalie; din acest moment sistemul poate fi controlat numai prin intermediul panoului de comandă al unității interne'},
-    192: {"text1": 'Anomalie sondă tur unitate motocondensantă', "text2": 'Sonda de tur unitate motocondensantă este în afara limitelor', "action": 'Dacă blocarea sau anomalia persistă, apelați la serviciile unei societăți autorizate (de exemplu Serviciul de Asistență Tehnică Immergas).', "comment": 'Placa identifică un defect la sonda NTC de tur pompă de căldură'},
-    193: {"text1": 'Aparat în Testmode', "text2": 'Aparatul este controlat de un dispozitiv extern prin intermediul protocolului Opentherm', "action": 'Sistemul continuă să funcționeze corect', "comment": 'Este semnalat că aparatul este în faza de test mode'},
-    194: {"text1": 'Audax Pro dezactivată', "text2": 'Unitatea motocondensantă Audax Pro a fost dezactivată', "action": 'Sistemul continuă să funcționeze corect', "comment": 'Este semnalat că unitatea motocondensantă a fost dezactivată de la intrarea corespunzătoare în regletă'},
-    195: {"text1": 'Anomalie temp. redusă  faza lichidă', "text2": 'Temp. sondei fază lichidă este prea redusă', "action": 'Verificați buna funcționare a circuitului de răcire', "comment": 'Este detectată o temperatură prea redusă în faza lichidă'},
-    196: {"text1": 'Blocare temp. tur ridicată', "text2": 'Este detectată o temperatură prea mare pe circuitul de retur al pompei de căldură', "action": 'Verificați buna funcționare a circuitului de răcire', "comment": 'Este detectată o temperatură prea mare pe circuitul de tur al pompei de căldură'},
-}
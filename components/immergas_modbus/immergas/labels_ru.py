@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: ru)"""
-
-immergas_labels = {
-    'default': {"text1": 'Общая неопознанная неполадка', "text2": 'Проверить таблицу ошибок или выбранную плату', "action": 'Проверить таблицу ошибок или выбранную плату', "comment": 'Никаких примечаний'},
-    0: {"text1": 'СИСТЕМА ОК', "text2": 'Система работает правильно ', "action": 'Не требуется никаких действий', "comment": 'Нет неполадок'},
-    1: {"text1": 'Блокировка зажигания', "text2": 'По завершении последней попытки зажигания не обнаружено пламя', "action": 'Нажать на кнопку Сброса', "comment": 'Котёл, в случае заявки на отопление помещения или производства ГВС, не включается в установленное время. При первом включении агрегата или после его продолжительного простоя может потребоваться устранение блокировки.'},
-    2: {"text1": 'Блокировка предохранительного термостата (перегрев)', "text2": 'Срабатывание предохранительного термостата', "action": 'Нажать на кнопку Сброса', "comment": 'Во время нормального режима работы, если при неполадке появляется внутренний перегрев, котел блокируется по перегреву.'},
-    3: {"text1": 'Блокировка реле давления дыма дыма', "text2": 'Срабатывание термостата дыма', "action": 'Нажать на кнопку Сброса (версии Nike)/ Выполнить правильную конфигурацию параметра P.14. При необходимости, нажать на кнопку Сброс (версии Star)', "comment": 'Во время нормального режима работы, если при неполадке появляется перегрев отработанных газов, котел блокируется по перегреву (версии Nike)/ Неправильная конфигурация параметра P.14 (версии Star)'},
-    4: {"text1": 'Блокировка сопротивления контактов', "text2": 'Обнаружена неполадка в системе управления газового клапана', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Электронная плата обнаруживает неполадку в питании газового клапана. Проверить, что выполнено подключение. (неполадка обнаруживается и показывается только при наличии запроса).'},
-    5: {"text1": 'Неисправность термопары.', "text2": 'Датчик подачи выдает резистивное значение вне диапазона', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата обнаруживает неполадку на датчике NTC на подаче.'},
-    6: {"text1": 'Неисправность зонда сантехнической воды', "text2": 'Датчик ГВС выдает резистивное значение вне диапазона', "action": 'Котёл продолжает производить ГВС, но не достигая оптимальных эксплуатационных показателей. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата обнаружила неполадку на датчике NTC на горячем водоснабжении.'},
-    8: {"text1": 'Максимальное количество сбросов', "text2": 'Указывает на достижение максимального количества сбросов, разрешенного встроенной платой', "action": 'Внимание! Данную неисправность можно сбросить до 5 раз подряд, после чего доступ к данной функции невозможен в течение не менее одного часа, после чего котел осуществляет 1 попытку каждый час, максимальное число попыток – 5. После отключения и последующей подачи электропитания на оборудование вновь предоставляется возможность осуществить 5 попыток.', "comment": 'Число уже выполненных сбросов из возможных.'},
-    10: {"text1": 'Недостаточное давление установки', "text2": 'Контакт реле давления системы разомкнут', "action": 'Убедиться с помощью манометра котла, что давление в системе находится в диапазоне 1÷1,2 бар, при необходимости восстановить правильное давление.', "comment": 'Давления воды в системе отопления недостаточно для гарантирования правильной работы котла.'},
-    11: {"text1": 'Неполадка реле давления дыма', "text2": 'Возможная неполадка реле давления дыма или вентилятора', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'При возобновлении нормальных условий котел переходит на нормальную работу без необходимости в сбросе'},
-    12: {"text1": 'Неполадка зонда водонагревателя', "text2": 'Зонд водонагревателя выдает резистивное значение вне диапазона', "action": 'Котел не может производить ГВС. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата обнаруживает неполадку на датчике водонагревателя'},
-    13: {"text1": 'Измеритель расхода воздуха/дымов вне диапазона', "text2": 'Сигнал воздуха/дымов вне диапазона или с выключенным вентилятором контроллер считывает слишком высокий сигнал', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'С выключенным вентилятором, контроллер воздуха/дыма считывает слишком высокий сигнал (склеены контакты реле давления)'},
-    15: {"text1": 'Ошибка конфигурации', "text2": 'Плата констатирует несоответствие между собственной конфигурацией и входными сигналами', "action": 'При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке. Проверить, что правильно выполнены настройки котла. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата фиксирует неисправность или несоответствие на электропроводке котла и не запускается.'},
-    16: {"text1": 'Неисправность вентилятора', "text2": 'Система выдает, что вентилятор вращается, когда на него не подается питание или что он остановлен, когда на него подается питание', "action": 'Нажать на кнопку Сброса. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Отображается при механических или электронных поломках вентилятора.'},
-    17: {"text1": 'Неправильная скорость вентилятора', "text2": 'Количество оборотов вентилятора выходит за допустимый диапазон', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Неправильное количество оборотов вентилятора'},
-    20: {"text1": 'Блокировка при помехах пламени', "text2": 'Обнаружение аномального пламени', "action": 'Нажать на кнопку Сброса. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Возникает в случае потерь в контуре измерения или при неполадках контроля пламени.'},
-    23: {"text1": 'Неполадки датчика обратной линии', "text2": 'Датчика обратной линии резистивное значение вне диапазона', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата обнаруживает неполадку на датчике NTC на подаче.'},
-    24: {"text1": 'Неисправность кнопочного пульта', "text2": 'Считывается постоянное давление на кнопки на приборной панели', "action": 'При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата обнаружила неполадку на кнопочном пульте.'},
-    25: {"text1": 'Блокировка дымового датчика/ блокировка CRC (ЗАЗЕМЛЕНИЕ)', "text2": 'Температура дыма вне диапазона / сбой памяти (ЗАЗЕМЛЕНИЕ)', "action": 'Нажать на кнопку Сброса', "comment": 'Высокий градиент дыма, возможно произошла блокировка циркуляционного насоса или недостаточно вода / сбой памяти'},
-    27: {"text1": 'Недостаточная циркуляция', "text2": 'Перегрев котла из-за недостаточной циркуляции в первичном контуре', "action": 'Нажать на кнопку Сброса', "comment": 'Убедиться в отсутствии перекрытия на контуре отопления и/или проверить правильность функционирования циркуляционного насоса'},
-    28: {"text1": 'Потери контура ГВС', "text2": 'Если на этапе отопления поднимается температура ГВС, котел сигнализирует о неполадке и понижает температуру отопления, для ограничения образования накипи на теплообменнике.', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Проверить, что все краны системы ГВС закрыты и не текут, и в любом случае проверить, что отсутствуют утечки на установке. Котел возвращается к нормальному режиму работы после того, как восстановлены оптимальные условия системы ГВС'},
-    29: {"text1": 'Неполадка датчика дыма', "text2": 'Дымовой датчик выдает резистивное значение вне диапазона', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Плата обнаружила неполадку на дымовом датчике.'},
-    31: {"text1": 'Потеря связи с CARV2', "text2": 'Нет связи между платой и удаленным управлением.', "action": 'Отключить и вновь подать напряжение на котел. Если повторный запуск также не был успешным, и связь с дистанционным управлением не восстановилась, котел переходит на недистанционный режим работы при помощи органов управления, имеющихся на панели управления. В этом случае невозможно активировать функцию “Отопление”.', "comment": 'Возникает в случае подключения к несовместимому дистанционному управлению, или в случае потери коммуникации между котлом и CARV2.'},
-    32: {"text1": 'Неполадка датчика зоны 2 низкой температуры', "text2": 'Датчик подачи в зоне 2 вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Когда плата считывает неполадку на датчике зоны 2 низкой температуры, система не может работать в этой зоне'},
-    33: {"text1": 'Неполадка датчика зоны 3 низкой температуры', "text2": 'Датчик подачи в зоне 3 вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Когда плата считывает неполадку на датчике зоны 2 низкой температуры, система не может работать в этой зоне'},
-    36: {"text1": 'Потеря связи IMG Bus.', "text2": 'Потеря связи по протоколу IMG Bus.', "action": 'Котёл не удовлетворяет требованиям нагрева.', "comment": 'В связи с неполадкой на контроллере котла, на зонной плате (опция) или на шине IMG Bus прерывается связь между различными компонентами.'},
-    37: {"text1": 'Низкое напряжение питания', "text2": 'Напряжение питания платы ниже дозволенных пределов.', "action": 'При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке.', "comment": 'Отображается в том случае, если напряжение питания ниже допустимого предела для правильной работы котла.'},
-    38: {"text1": 'Потеря сигнала пламени', "text2": 'После регистрации правильного значения тока пламени плата подает сигнал падения тока пламени.', "action": 'При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке.', "comment": 'Происходит в том случае, если после того, как произошло успешное зажигание пламени горелки котла, происходит его непредвиденное погашение; происходит повторная попытка зажигания и в том случае, если восстановлены нормальные условия котла, нет необходимости в сбросе.'},
-    39: {"text1": 'неисправность датчика солнечного коллектора', "text2": 'Уличный датчик выдает резистивное значение вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'При обнаружении платой неисправности датчика солнечного коллектора, котел продолжает работать, как обычно, но не производя солнечной энергии для производства ГВС, т.к. насос солнечного контура перестаёт работать.'},
-    40: {"text1": 'Неполадка датчика солнечного контура', "text2": 'Зонд накопителя солнечного контура выдает резистивное значение вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'При обнаружении платой неисправности зонда накопителя солнечного контура, котел продолжает работать, как обычно, но не производя солнечной энергии для производства ГВС, т.к. насос солнечного контура перестаёт работать.'},
-    41: {"text1": 'Чрезмерный перегрев в солнечном коллекторе', "text2": 'Солнечный коллектор превысил установленную максимальную температуру', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Возникает, когда температура солнечного коллектора превышает заданный максимальный предел'},
-    42: {"text1": 'Чрезмерный перегрев в накопителе солнечного контура', "text2": 'Накопитель солнечного контура превысил установленную максимальную температуру', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Возникает, когда температура воды в накопителе солнечного контура превышает заданный максимальный предел.'},
-    43: {"text1": 'Блокировка из-за потери сигнала пламени', "text2": 'Потеря сигнала пламени во время обычной работы несколько раз подряд.', "action": 'Нажать на кнопку Сброса, перед запуском котёл выполнит цикл поствентиляции.', "comment": 'Возникает, если несколько раз в течении установленного времени появляется ошибка “Потеря сигнала пламени”.'},
-    44: {"text1": 'Блокировка по превышению накопленного максимального времени открытий газового клапана за короткий период времени.', "text2": 'Общее накопленное время открытий газового клапана без обнаружения пламени превышает максимально разрешенное.', "action": 'Нажать на кнопку Сброса.', "comment": 'Отображается, если газовый клапан остаётся открытым на время, превышающее предусмотренное значение для его нормальной работы, при этом котел не включается.'},
-    45: {"text1": 'dT повышенная', "text2": 'Разница температуры, замеренной между подачей и возвратом установки ≥ 40°C.', "action": 'Мощность горелки ограничивается во избежание нанесения возможного ущерба конденсационному модулю, когда восстановлена правильная dT, котёл переходит к нормальному режиму работы. Убедитесь в наличии циркуляции воды в котле и в конфигурации циркуляционного насоса, согласно требованиям системы, а также в правильной работе датчика обратной линии.', "comment": 'Котёл обнаруживает неожиданное и непредвиденное повышение dT между датчиком подачи и датчиком возврата системы.'},
-    46: {"text1": 'Срабатывание термостата низкой температуры / Неправильная конфигурация кабельной проводки/платы', "text2": 'Предохранительный термостат, расположенный на подаче от котла к DIM v2 (работающий исключительно при низкой температуре) достиг высокой температуры. / Неправильная кабельная проводка или установка несоответствующей платы', "action": 'В этом случае после необходимого охлаждения, термостат может быть сброшен (смотреть соответствующий вкладыш с инструкциями). / Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Во время нормального режима работы, если при неполадке появляется перегрев подачи на низкой температуре, котел блокируется. / Неправильная кабельная проводка или установка несоответствующей платы'},
-    47: {"text1": 'Ограничение мощности горелки', "text2": 'Если температура дымов достигает высокого значения, плата уменьшает вырабатываемую горелкой мощность во избежание повреждения контура дымов.', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'При обнаружении высокой температуры отработанных газов котёл сокращает вырабатываемую мощность, чтобы не спровоцировать неполадки.'},
-    48: {"text1": 'Неполадка датчика подачи со стороны системы', "text2": 'Датчик подачи выдает резистивное значение вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Если датчик подачи со стороны системы подключен или повреждён, поступает сигнал неполадки'},
-    49: {"text1": 'Блокирование по высокой температуре датчиком возврата', "text2": 'Высокая температура измеренная датчиком обратной линии', "action": 'Проверить циркуляцию котла и функционирование трёхходового клапана.', "comment": 'Отображается при достижении слишком высокой температуры на возвратном контуре теплообменника'},
-    50: {"text1": 'Неполадка уличного датчика', "text2": 'Уличный датчик выдает резистивное значение вне диапазона', "action": 'Проверить подключение уличного датчика. Система продолжает работать', "comment": 'Если уличный датчик подключен или повреждён, поступает сигнал неполадки'},
-    51: {"text1": 'Прервана связь с CAR Wireless', "text2": 'Связь между передатчиком и CAR v2 RF прервана.', "action": 'Проверить работу беспроводного устройства CAR Wireless, проверить заряд батареек (смотреть соответствующие инструкции).', "comment": 'Если прервана связь между котлом и CAR на беспроводной версии, подаётся сигнал о неполадке, с этого момента систему можно проверить только через панель управления котла.'},
-    54: {"text1": 'Неполадка датчика буфера', "text2": 'Датчик буфера выдает резистивное значение вне диапазона', "action": 'Отключается режим буфера', "comment": 'Если датчик буфера подключен или повреждён, поступает сигнал неполадки'},
-    55: {"text1": 'Неполадка датчика температуры подачи Зоны 1', "text2": 'Датчик подачи зоны 1 выдает резистивное значение вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Когда плата считывает неполадку на датчике зоны 1 низкой температуры, котел не может работать в этой зоне.'},
-    58: {"text1": 'Неполадка Audax', "text2": 'Сигнал неполадки со стороны теплового насоса AUDAX, подключенного к системе', "action": 'Тепловой насос не отвечает требованиям отопления и охлаждения помещения, после того, как восстановлены подключения, необходимо выключить и обратно включить систему', "comment": 'Неполадка теплового насоса Audax, проверить тип неполадки непосредственно на дисплее теплового насоса'},
-    59: {"text1": 'Блокировка частоты сети электропитания', "text2": 'Электронная плата обнаружила неисправность частоты тока в сети электропитания.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Плата обнаружила аномальную частоту электропитания.'},
-    60: {"text1": 'Неисправность из-за блокировки циркуляционного насоса', "text2": 'Модулирующий циркуляционный насос остановлен.', "action": 'Попробуйте разблокировать циркуляционный насос, как описано в соответствующем параграфе. При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке.', "comment": 'Циркуляционный насос остановлен по одной из следующих причин: крыльчатка заблокирована, неисправность электрического характера.'},
-    61: {"text1": 'Наличие воздуха в циркуляционном насосе', "text2": 'Модулирующий циркуляционный насос остановлен из-за обнаружения воздуха.', "action": 'Выпустить воздух из циркуляционного насоса и отопительного контура. При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке.', "comment": 'Обнаружен воздух в циркуляционном насосе; циркуляционный насос не может работать.'},
-    62: {"text1": 'Запрос полного тарирования ', "text2": 'Неправильная конфигурация параметров контроля сгорания на плате.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Обнаруживается отсутствие тарирования электронной платы. Может иметь место при замене электронной платы или при изменении параметров в секции воздух / газ, когда требуется “полное тарирование”.'},
-    63: {"text1": 'Неполадка датчика обратной линии установки', "text2": 'Датчик обратной линии выдает резистивное значение вне диапазона', "action": 'Котёл продолжает работает без дополнения внешних подключенных систем', "comment": 'Если датчик обратной линии подключен или повреждён, поступает сигнал неполадки'},
-    67: {"text1": 'Неполадка реле давления установки', "text2": 'Открыто реле давления установки, возможно отсутствие жидкости', "action": 'Проверить на манометру узла циркуляционного насоса солнечного контура, что давление на правильном значении', "comment": 'В связи со спадом давления в солнечном контуре, реле давления блокирует работу теплового контура солнечных панелей'},
-    70: {"text1": 'Датчики переставлены местами', "text2": 'В случае ошибки в соединение кабельной проводки котла выдается ошибка', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Проверить соединение датчика на подаче и на возврате'},
-    72: {"text1": 'Запрос быстрого тарирования ', "text2": 'Неправильная конфигурация некоторых параметров контроля сгорания на плате.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Обнаруживается изменение некоторых параметров, для которых необходимо “быстрое тарирование“.'},
-    73: {"text1": 'Обнаружено большое отклонение датчика подачи и предохранительного датчика подачи', "text2": 'На датчиках подачи обнаружено большое отклонение.', "action": 'При возобновлении нормальных условий котел переходит на нормальную работу без необходимости сброса', "comment": 'Плата обнаруживает неполадку при считывании температуры датчиков NTC на подаче, причиной может быть: поломка датчика, неправильное размещение, недостаточная циркуляция в системе, закупорка в водной системе первичного теплообменника.'},
-    74: {"text1": 'Неполадка защитного датчика подачи', "text2": 'Предохранительный датчик подачи выдает резистивное значение вне диапазона.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Плата обнаруживает неполадку на защитном датчике NTC на подаче.'},
-    75: {"text1": 'Блокировка из-за поврежденного датчика NTC', "text2": 'Возможно повреждение одного или обоих датчиков на подаче и возврате системы', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Чувствительный элемент предохранительного датчика провоцирует высокий градиент температуры'},
-    76: {"text1": 'Отклонение датчика на подаче или датчика на возврате', "text2": 'Обнаружена неисправность одного или обоих датчиков на подаче и возврате системы', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Большая разница по сравнению с заданной между датчиком на подаче и датчиком на возврате в случае запроса тепла'},
-    77: {"text1": 'Неполадка контроля горения', "text2": 'Обнаружена сила тока газового клапана вне диапазона.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Определяется сила тока вне диапазона на газовом клапане.'},
-    78: {"text1": 'Неполадка контроля горения', "text2": 'Обнаружена высокая сила тока на газовом клапане.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Обнаружена высокая сила тока на газовом клапане.'},
-    79: {"text1": 'Неполадка контроля горения', "text2": 'Обнаружена низкая сила тока на газовом клапане.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Обнаружена низкая сила тока на газовом клапане.'},
-    80: {"text1": 'Блокировка по неполадке электронной платы', "text2": 'Обнаружена неполадка на драйвере электронного газового клапана из-за проблем на плате или газовом клапане.', "action": 'Нажать на кнопку Сброса', "comment": 'Обнаруживается при неполадке электронной платы, контролирующей клапан.'},
-    84: {"text1": 'Неполадка горения - идёт сокращение мощности', "text2": 'Обнаружены условия, схожие с низким давлением питания газового клапана.', "action": 'При возобновлении нормальных условий котел переходит на нормальную работу без необходимости сброса', "comment": 'Обнаруживается низкое давление на в питающей сети газа. Следовательно, ограничивается мощность прибора и подаётся сигнал о неполадке.'},
-    85: {"text1": 'Блокировка из-за проблемы дожигания', "text2": 'Потенциальная неисправность газового клапана, электрода или электронной платы', "action": 'Нажать на кнопку Сброса. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas)', "comment": 'Пламя горит даже после закрытия газового клапана'},
-    87: {"text1": 'Блокировка контроллера газового клапана', "text2": 'Обнаружена неполадка на контроле газового клапана.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Обнаруживается неполадка одного из компонентов, контролирующих газовый клапан.'},
-    88: {"text1": 'Блокировка контроллера газового клапана', "text2": 'Обнаружена неполадка на контроле газового клапана.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Обнаруживается неполадка одного из компонентов, контролирующих газовый клапан.'},
-    89: {"text1": 'Нестабильный сигнал горения', "text2": 'Обнаружена нестабильность на сигнале горения.', "action": 'Котел продолжает работать.', "comment": 'Пламя может быть нестабильным по следующим причинам: наличие рециркуляции дымовых газов, ветер, нестабильное давление газа, нестабильная скорость вентиляции в связи с неполадкой системы.'},
-    90: {"text1": 'Сигнал горения за установленным пределом', "text2": 'Обнаружен сигнал горения вне пределов.', "action": 'Котел продолжает работать.', "comment": 'Сигнал горения обнаружен за предусмотренным пределом настройки на длительное время.'},
-    91: {"text1": 'Блокировка из-за неправильного зажигания', "text2": 'Закончились все возможные действия платы для оптимального зажигания горелки.', "action": 'Нажать на кнопку Сброса', "comment": 'Закончились все возможные действия платы для оптимального зажигания горелки.'},
-    92: {"text1": 'Корректирующее ограничение оборотов вентилятора', "text2": 'Плата достигла максимальную корректировку оборотов вентилятора.', "action": 'Котел продолжает работать.', "comment": 'Закончились все возможные действия платы для оптимальных оборотов вентилятора.'},
-    93: {"text1": 'Сигнал горения за установленным пределом', "text2": 'Обнаружен сигнал горения вне пределов.', "action": 'Котел продолжает работать.', "comment": 'Сигнал горения обнаружен за предусмотренным пределом настройки на длительное время.'},
-    94: {"text1": 'Неполадка горения', "text2": 'Обнаружена проблема горения, спровоцированная системой или контрольным устройством горения.', "action": 'При возобновлении нормальных условий, котел переходит на нормальную работу без необходимости переустановке.', "comment": 'Обнаружена неполадка на контроллере горения, причиной может быть: низкое давление газа, рециркуляция отработанных газов, поломка газового клапана или электронной платы.'},
-    95: {"text1": 'Непостоянный сигнал горения', "text2": 'Обнаружена непостоянность сигнала горения из-за проблем в электрических соединениях или потери сигнала.', "action": 'Котел продолжает работать.', "comment": 'Система обнаружила непостоянность сигнала горения.'},
-    96: {"text1": 'Закупорены компоненты дымоудаления.', "text2": 'Обнаружено значительное загрязнение в дымоудалении.', "action": 'Котел не запускается. Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Появляется, при обнаружении закупорки в системе дымоудаления.'},
-    98: {"text1": 'Блокировка по макс. количеству ошибок программы', "text2": 'Электронная плата работает неправильно.', "action": 'Нажать на кнопку Сброса', "comment": 'Достигнуто максимальное количество допустимых ошибок программы.'},
-    99: {"text1": 'Блокирование общего характера', "text2": 'Электронная плата работает неправильно.', "action": 'Нажать на кнопку Сброса', "comment": 'Обнаружена неполадка котла.'},
-    101: {"text1": 'Сигнал тревоги оффлайн Audax', "text2": 'Потеря связи с тепловым насосом', "action": 'Тепловой насос не отвечает требованиям отопления и охлаждения помещения, после того, как восстановлены подключения, необходимо выключить и обратно включить систему', "comment": 'В случае прекращения связи, неправильном подключении или выключенном тепловом насосе, электронный блок не обнаруживает тепловой насос'},
-    102: {"text1": 'Сигнал тревоги офф-лайн расширения зоны 1', "text2": 'Потеря связи с расширением зоны 1', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Неполадка связи с зоной 1'},
-    103: {"text1": 'Сигнал тревоги офф-лайн расширения зоны 2', "text2": 'Потеря связи с расширением зоны 2', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Неполадка связи с зоной 2'},
-    104: {"text1": 'Сигнал тревоги офф-лайн расширения зоны 3', "text2": 'Потеря связи с расширением зоны 3', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Неполадка связи с зоной 3'},
-    106: {"text1": 'Сигнал тревоги датчика ГВС ', "text2": 'При комплектации с котлом и отдельным управлением ГВС, датчик водонагревателя, контролируемый блоком управления, выдаёт резистивное значение вне диапазона', "action": 'Система не может производить горячую санитарную воды тепловым насосом. Производство ГВС обеспечивается котлом', "comment": 'Плата обнаружила неполадку на датчике водонагревателя'},
-    120: {"text1": 'Сигнал тревоги высокой уставки для 1 осушения зоны 1', "text2": 'Рассчитанное заданное значение запроса зоны 1 слишком высокое для осушения', "action": 'Рассчитанная уставка подачи превышает допустимый предел осушителя. Охладить помещение и дождаться, пока температура не опуститься до допустимых значений', "comment": 'Заданное значение охлаждения, рассчитанное для осушения, превышает заданный предел в зоне 1'},
-    121: {"text1": 'Сигнал тревоги офф-лайн устройства зоны 1', "text2": 'Удалённое управление или удалённый контроллер зоны 1 находится в автономном режиме', "action": 'Проверить, что включено удалённое управление', "comment": 'Не обнаружена связь с контроллером зоны. Невозможно выполнить терморегулирование зоны'},
-    122: {"text1": 'Сигнал тревоги офф-лайн устройства зоны 2', "text2": 'Удалённое управление или удалённый контроллер зоны 2 находится в автономном режиме', "action": 'Проверить, что включено удалённое управление', "comment": 'Не обнаружена связь с контроллером зоны. Невозможно выполнить терморегулирование зоны'},
-    123: {"text1": 'Сигнал тревоги офф-лайн устройства зоны 3', "text2": 'Удалённое управление или удалённый контроллер зоны 3 находится в автономном режиме', "action": 'Проверить, что включено удалённое управление', "comment": 'Не обнаружена связь с контроллером зоны. Невозможно выполнить терморегулирование зоны'},
-    125: {"text1": 'Неполадка датчика температуры помещения зоны 1', "text2": 'Датчик температуры помещения 1 вне диапазона', "action": 'Кроме температуры не рассчитывается точка росы для зоны', "comment": 'Существует неполадка на температурном датчике помещения зоны 1 (опция). Невозможно выполнить терморегулирование зоны'},
-    126: {"text1": 'Неполадка датчика температуры помещения зоны 2', "text2": 'Датчик температуры помещения 2 вне диапазона', "action": 'Кроме температуры не рассчитывается точка росы для зоны', "comment": 'Существует неполадка на температурном датчике помещения зоны 2 (опция). Невозможно выполнить терморегулирование зоны'},
-    127: {"text1": 'Неполадка датчика температуры помещения зоны 3', "text2": 'Датчик температуры помещения 3 вне диапазона', "action": 'Кроме температуры не рассчитывается точка росы для зоны', "comment": 'Существует неполадка на температурном датчике помещения зоны 3 (опция). Невозможно выполнить терморегулирование зоны'},
-    129: {"text1": 'Неисправность датчика влажности зоны 1', "text2": 'Датчик влажности помещения 1 вне диапазона', "action": 'Кроме влажности не рассчитывается точка росы для зоны', "comment": 'Неисправность на датчике влажности зоны 1 (опция). Невозможно выполнить проверку влажности зоны'},
-    130: {"text1": 'Неисправность датчика влажности зоны 2', "text2": 'Датчик влажности помещения 2 вне диапазона', "action": 'Кроме влажности не рассчитывается точка росы для зоны', "comment": 'Неисправность на датчике влажности зоны 2 (опция). Невозможно выполнить проверку влажности зоны'},
-    131: {"text1": 'Неисправность датчика влажности зоны 3', "text2": 'Датчик влажности помещения 3 вне диапазона', "action": 'Кроме влажности не рассчитывается точка росы для зоны', "comment": 'Неисправность на датчике влажности зоны 3 (опция). Невозможно выполнить проверку влажности зоны'},
-    132: {"text1": 'Сигнал тревоги высокой уставки для осушения зоны 2', "text2": 'Рассчитанное заданное значение запроса зоны 2 слишком высокое для осушения', "action": 'Рассчитанная уставка подачи превышает допустимый предел осушителя. Охладить помещение и дождаться, пока температура не опуститься до допустимых значений', "comment": 'Заданное значение охлаждения, рассчитанное для осушения, превышает заданный предел в зоне 2'},
-    133: {"text1": 'Сигнал тревоги неполадки осушителя зоны 1', "text2": 'Осушитель зоны 1 в аварийном режиме', "action": 'Система не выполняет осушения в соответствующей зоне', "comment": 'Неисправность, поступающая с осушителя (опция) зоны 1'},
-    134: {"text1": 'Сигнал Тревоги неисправности зоны 2', "text2": 'Осушитель зоны 2 в аварийном режиме', "action": 'Система не выполняет осушения в соответствующей зоне', "comment": 'Неисправность, поступающая с осушителя (опция) зоны 2'},
-    135: {"text1": 'Сигнал Тревоги неисправности зоны 3', "text2": 'Осушитель зоны 3 в аварийном режиме', "action": 'Система не выполняет осушения в соответствующей зоне', "comment": 'Неисправность, поступающая с осушителя (опция) зоны 3'},
-    137: {"text1": 'Восстановлен аварийный контур системы – Перезапустить систему', "text2": 'После операции восстановления, которая выполняется с помощью панели управления, подаётся сигнал тревоги, так как необходимо перезапуск системы', "action": 'Выключить и включить систему', "comment": 'После восстановления параметров по умолчанию, необходимо выполнить перезапуск системы'},
-    138: {"text1": 'Идёт нагревание пола', "text2": 'Выполняется функция нагрева пола', "action": '', "comment": ''},
-    139: {"text1": 'Идёт стравливание', "text2": 'Выполняется функция стравливания', "action": '', "comment": ''},
-    177: {"text1": 'Сигнал тревоги макс. времени ГВС', "text2": 'Запрос ГВС был выполнен с превышением заданного максимального времени', "action": 'система продолжает работать с неоптимальными показателями', "comment": 'Не удовлетворено производство ГВС в заданное время (5 часов)'},
-    178: {"text1": 'Отрицательный результат цикла “антилегионелла”', "text2": 'Цикл “антилегионелла” не завершён удачно в заданное время', "action": 'Нажать на кнопку Сброса', "comment": 'Цикл “антилегионелла” не завершён удовлетворительно в заданное время (3 часа)'},
-    179: {"text1": 'Неполадка датчика жидкой фазы', "text2": 'Показатели датчика жидкой фазы выходят за диапазон', "action": 'Система на запускается. Обращаться к уполномоченной организации (например, к Сервисной службе фирмы Immergas).', "comment": 'Плата обнаружила неполадку на датчике жидкой фазы'},
-    181: {"text1": 'Потеря коммуникации Дистанционного Управления зоны 2', "text2": 'Нет связи между платой и удаленным управлением зоны 2.', "action": 'Отключить и вновь подать напряжение на водопроводный блок. Если повторный запуск также не был успешным, и связь с дистанционным управлением не восстановилась, система переходит на не дистанционный режим работы при помощи органов управления, имеющихся на панели управления. В этом случае невозможно активировать функцию “Отопление”', "comment": 'Возникает в случае подключения к несовместимому дистанционному управлению, или в случае прерывания связи между водопроводным блоком и CARV2 второй зоны'},
-    182: {"text1": 'Тревога компрессорно-конденсаторного блока', "text2": 'Обнаружен сигнал тревоги компрессорно-конденсаторного блока', "action": 'Система не работает, см. неполадку на компрессорно-конденсаторном блоке и в соответствующих инструкциях', "comment": 'Срабатывает сигнал тревоги компрессорно-конденсаторного блока'},
-    183: {"text1": 'Сигнал тревоги компрессорно-конденсаторного блока в тестовом режиме', "text2": 'Компрессорно-конденсаторный блок находится в режиме TESTMODE (тестовый)', "action": 'На этом этапе невозможно удовлетворить запросы для климатизации помещения и производства ГВС', "comment": 'Поступает сигнал, что компрессорно-конденсаторный блок находится в тестовом режиме'},
-    184: {"text1": 'Сигнал тревоги простоя связи с наружным агрегатом', "text2": 'Потеря связи с компрессорно-конденсаторным блоком', "action": 'Проверить электрическое подключение между блоками', "comment": 'Поступает сигнал тревоги по неполадке связи между внутренним блоком и компрессорно-конденсаторным блоком'},
-    185: {"text1": 'Сигнал тревоги связи модуля безопасности', "text2": 'Потеря связи с модулем безопасности', "action": 'Проверить подключение между компонентами', "comment": 'Неполадки связи между платой настройки и платой включения'},
-    186: {"text1": 'Неполадка высокого напряжения зажигателя', "text2": 'Модуль безопасности: обнаружена неполадка напряжения на зажигателе', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Срабатывает сигнал тревоги платы зажигания'},
-    187: {"text1": 'Сигнал тревоги датчика обратной линии компрессорно-конденсаторного блока', "text2": 'Датчика обратной линии компрессорно-конденсаторного блока обнаруживает значения вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Плата обнаружила неисправность датчика NTC возврата воды из системы отопления теплового насоса'},
-    188: {"text1": 'Запрос выходит за рабочие ограничения', "text2": 'Выполненный запрос не выполняется, так как внешние условия не позволяют подключить компрессорно-конденсаторный блок', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Подаётся запрос отопления или охлаждения с внешней температурой, которая выходит за ограничения в работе'},
-    189: {"text1": 'Сигнал тревоги простоя связи с платой связи', "text2": 'Потеря связи с платой связи на компрессорно-конденсаторном блоке', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'При потери связи между электронными платами, срабатывает сигнал тревоги'},
-    191: {"text1": 'Потеря связи RF на CAR v2 RF в зоне 2', "text2": 'Связь между передатчиком и CAR v2 RF зоны 2 прервана', "action": 'Проверить работу беспроводного устройства CAR Wireless, проверить заряд батареек (смотреть соответствующие инструкции).', "comment": 'Если прервана связь между внутренним блоком и CAR на беспроводной версии второй зоны, подаётся сигнал о неполадке, с этого момента систему можно проверить только через панель управления внутреннего блока.'},
-    192: {"text1": 'Неисправность датчика подачи компрессорно-конденсаторного блока', "text2": 'Датчик подачи компрессорно-конденсаторного блока обнаруживает значения вне диапазона', "action": 'Если блокировка или неполадка не устраняется, следует обращаться к уполномоченной организации (например, в Сервисную службу компании Immergas).', "comment": 'Плата обнаруживает неполадку на датчике NTC на подаче теплового насоса'},
-    193: {"text1": 'Прибор в тестовом режиме', "text2": 'Прибор контролируется внешним устройством с помощью протокола Opentherm', "action": 'Система продолжает работать правильно', "comment": 'Поступает сигнал, что прибор находится в тестовом режиме'},
-    194: {"text1": 'Audax Pro отключена', "text2": 'Компрессорно-конденсаторный блок Audax Pro был отключен', "action": 'Система продолжает работать правильно', "comment": 'Поступает сигнал, что компрессорно-конденсаторный блок был отключен с помощью специального входа на клеммной коробке'},
-    195: {"text1": 'Неполадка низкой темп. жидкой фазы', "text2": 'Слишком низкая темп датчика жидкой фазы слишком низкая ', "action": 'Проверить работу холодильного контура', "comment": 'Обнаружена слишком низкая температура в жидкой фазе'},
-    196: {"text1": 'Блокировка высокой температуры подачи', "text2": 'Обнаружена слишком высокая температура на обратном линии теплового насоса', "action": 'Проверить работу холодильного контура', "comment": 'Обнаружена слишком высокая температура на контуре подачи теплового насоса'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: sk)"""
-
-immergas_labels = {
-    'default': {"text1": 'Nerozpoznaná všeobecná porucha', "text2": 'Skontrolujte tabuľku chýb či vybranú kartu', "action": 'Skontrolujte tabuľku chýb či vybranú kartu', "comment": 'Žiadna súvisiaca poznámka'},
-    0: {"text1": 'SYSTÉM OK', "text2": 'Systém funguje správne', "action": 'Nevyžaduje sa žiadna akcia', "comment": 'Žiadna porucha'},
-    1: {"text1": 'Zablokovanie v dôsledku nezapálenia', "text2": 'Absencia zistenia plameňa po skončení posledného pokusu o zapálenie.', "action": 'Stlačte tlačidlo Reset.', "comment": 'Kotol v prípade požiadavky na vykurovanie alebo ohrev teplej úžitkovej vody sa nezapne do stanovenej doby. Pri prvom zapnutí alebo po dlhej nečinnosti zariadenia môže byť potrebný zásah na odstránenie zablokovania v dôsledku nezapnutia.'},
-    2: {"text1": 'Zablokovanie bezpečnostného termostatu (nadmerná teplota).', "text2": 'Zásah bezpečnostného termostatu', "action": 'Stlačte tlačidlo Reset.', "comment": 'Ak sa počas bežnej prevádzky vyskytne v dôsledku poruchy nadmerné prehriatie, kotol sa zablokuje.'},
-    3: {"text1": 'Zablokovanie termostatu spalín', "text2": 'Zásah termostatu spalín', "action": 'Stlačte tlačidlo Reset. (verzie Nike)/ Nakonfigurujte správne parameter P.14. V prípade potreby stlačte tlačidlo Reset (verzie Star)', "comment": 'Ak sa počas bežnej prevádzky v dôsledku anomálie vyskytne prehriatie spalín, kotol sa zablokuje. (verzie Nike)/ Chybná konfigurácia parametra P.14 (verzie Star)'},
-    4: {"text1": 'Zablokovanie kontaktného odporu', "text2": 'Zistená porucha obvodu ovládania plynového ventilu.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Elektronická karta zistila poruchu napájania plynového ventilu. Skontrolujte pripojenie karty. (porucha sa zistí a zobrazí sa iba v prítomnosti nejakej požiadavky).'},
-    5: {"text1": 'Anomália nábehovej sondy', "text2": 'Sonda prívodu ponúka hodnotu odporu mimo interval.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Doska zistí poruchu na nábehovej sonde NTC.'},
-    6: {"text1": 'Anomália úžitkovej sondy', "text2": 'Sonda TÚV ponúka hodnotu odporu mimo interval.', "action": 'Kotol pokračuje s produkciou teplej úžitkovej vody bez optimálneho výkonu. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Doska zistí poruchu na sonde NTC okruhu TÚV.'},
-    8: {"text1": 'Maximálny počet vynulovaní', "text2": 'Informuje o dosiahnutí maximálneho povoleného počtu vynulovaní zabudovanej karty.', "action": 'Pozor: Je možné vynulovať anomáliu 5 krát za sebou, potom je funkcia deaktivovaná najmenej na jednu hodinu a potom je možné skúšať jedenkrát za hodinu po maximálny počet pokusov 5. Vypnutím a opätovným zapnutím zariadenia získate znovu 5 pokusov k dispozícii.', "comment": 'Počet už vykonaných vynulovaní.'},
-    10: {"text1": 'Nedostatočný tlak v zariadení', "text2": 'Kontakt tlakomera systému je otvorený.', "action": 'Skontrolujte na manometri kotla, či je tlak zariadenia v rozmedzí 1÷1,2 bar a prípadne nastaviť správny tlak.', "comment": 'Nie je zistený postačujúci tlak vody vo vnútri vykurovacieho okruhu, ktorý je potrebný pre zabezpečenie správneho fungovania kotla.'},
-    11: {"text1": 'Anomália snímača tlaku spalín', "text2": 'Možná anomália na snímači tlaku spalín alebo ventilátore', "action": 'Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ budú obnovené podmienky normálneho fungovania, kotol sa znovu spustí bez potreby resetovania.'},
-    12: {"text1": 'Anomália sondy zásobníka', "text2": 'Sonda bojlera ponúka hodnotu odporu mimo interval.', "action": 'kotol nedokáže produkovať TÚV. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Karta zistí poruchu na sonde bojlera'},
-    13: {"text1": 'Prietokomer vzduchu/spalín mimo rozsahu', "text2": 'Signál vzduchu/spalín je mimo rozsahu alebo keď je ventilátor zastavený, riadiaca jednotka prečíta príliš vysoký signál', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pri zastavenom ventilátore kontrola deteguje príliš vysoký signál vzduchu/spalín (prilepené kontakty tlakového spínača)'},
-    15: {"text1": 'Chyba v konfigurácii', "text2": 'Karta zistila nesúlad medzi konfiguráciou a signálmi vstupu.', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný. Skontrolujte, či je kotol nakonfigurovaný správnym spôsobom. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Karta zistila poruchu alebo nesúlad na elektrických kábloch, kotol sa nespustí.'},
-    16: {"text1": 'Anomália ventilátora', "text2": 'Ventilátor sa otáča, keď nie je pod napätím, alebo je zastavený, pokiaľ je pod napätím.', "action": 'Stlačte tlačidlo Reset. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Objavuje sa v prípade mechanickej alebo elektronickej poruchy ventilátora.'},
-    17: {"text1": 'Nesprávna rýchlosť ventilátora', "text2": 'Rýchlosť ventilátora je mimo správneho rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Nesprávny počet otáčok ventilátora'},
-    20: {"text1": 'Zablokovanie parazitného plameňa', "text2": 'Porucha zistenia plameňa', "action": 'Stlačte tlačidlo Reset. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Objavuje sa v prípade rozptylu z kontrolného okruhu alebo v prípade anomálie plameňa.'},
-    23: {"text1": 'Anomália spiatočkovej sondy', "text2": 'Spiatočkovej sondy ponúka hodnotu odporu mimo interval.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Doska zistí poruchu na nábehovej sonde NTC.'},
-    24: {"text1": 'Anomália tlačidlového panela', "text2": 'Zistilo sa sústavné stlačenie tlačidiel na prístrojovej doske', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Karta zistí poruchu na klávesnici.'},
-    25: {"text1": 'Zablokovanie sondy spalín/zablokovanie CRC (TERA)', "text2": 'Teplota spalín mimo rozsahu/poškodenie pamäte (TERA)', "action": 'Stlačte tlačidlo Reset (1)', "comment": 'Vysoký nárast spalín, pravdepodobné zablokovanie cirkulácie alebo nedostatok vody/poškodenie pamäti'},
-    27: {"text1": 'Nedostatočný obeh', "text2": 'Prehriatie kotla v dôsledku nedostatočného obehu v primárnom okruhu', "action": 'Stlačte tlačidlo Reset', "comment": 'Skontrolujte, či nedochádza k odchytom vo vykurovacom okruhu a/alebo skontrolujte správne fungovanie obehového čerpadla'},
-    28: {"text1": 'Netesnosti úžitkového okruhu', "text2": 'Pokiaľ v priebehu prevádzky vo fáze kúrenia nastane zvýšenie teploty úžitkovej vody, kotol signalizuje anomáliu a zníži teplotu kúrenia, aby sa obmedzilo usadzovanie vodného kameňa vo výmenníku.', "action": 'Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Skontrolujte, či sú všetky kohútiky TÚV zatvorené a či nevykazujú netesnosti a celkovo skontrolujte, či na zariadení nedochádza k únikom. Kotol sa vráti do bežnej prevádzky po obnovení optimálnych podmienok zariadenia úžitkovej vody.'},
-    29: {"text1": 'Anomália sondy spalín', "text2": 'Sonda spalín ponúka hodnotu odporu mimo interval.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Karta zistí poruchu na sonde spalín.'},
-    31: {"text1": 'Výpadok komunikácie s CARV2', "text2": 'Neprebieha komunikácia medzi kartou a diaľkovým ovládaním.', "action": 'Odpojte a znovu pripojte napätie ku kotlu. Pokiaľ ani po opätovnom zapnutí kotla nedôjde k zachyteniu signálu s diaľkovým ovládaním, kotol prejde do lokálneho prevádzkového režimu, tzn. použitie ovládacích prvkov priamo na kotle. V tomto prípade nie je možné aktivovať funkciu „Vykurovanie“.', "comment": 'Nastane v prípade pripojenia nekompatibilného diaľkového ovládača alebo pri prerušení komunikácie medzi kotlom a CARV2.'},
-    32: {"text1": 'Porucha sondy zóny 2 nízkej teploty', "text2": 'Sonda na vstupe vykurovacieho okruhu zóny 2 mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ elektronika deteguje poruchu sondy zóny 2 nízkej teploty, systém nemôže pracovať pre príslušnú zónu.'},
-    33: {"text1": 'Porucha sondy zóny 3 nízkej teploty', "text2": 'Sonda na vstupe zóny 3 mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ elektronika deteguje poruchu sondy zóny 2 nízkej teploty, systém nemôže pracovať pre príslušnú zónu.'},
-    36: {"text1": 'Prerušenie komunikácie IMG Bus', "text2": 'Výpadok komunikácie protokolu IMG Bus.', "action": 'Kotol nespĺňa požiadavky na vykurovanie.', "comment": 'V dôsledku anomálie na riadiacej jednotke kotla, na doske zón (voliteľné príslušenstvo) alebo na zbernici IMG dôjde k prerušeniu komunikácie medzi jednotlivými komponentmi.'},
-    37: {"text1": 'Nízke napätie napájania', "text2": 'Napájacie napätie karty má nižšie hodnoty než povolené limity.', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Objavuje sa v prípade, keď je napájacie napätie nižšie ako limity povolené pre správne fungovanie kotla.'},
-    38: {"text1": 'Strata signálu plameňa.', "text2": 'Karta po nastavení správnej hodnoty prúdu plameňa signalizuje pokles prúdu plameňa.', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Objavuje sa v prípade, keď je kotol správne zapnutý a dôjde k neočakávanému vypnutiu plameňa horáka; dôjde k novému pokusu o zapnutie a v prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.'},
-    39: {"text1": 'porucha sondy solárneho kolektora', "text2": 'Vonkajší sonda ponúka hodnotu odporu mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ elektronika deteguje poruchu na sonde solárneho kolektora, kotol pokračuje v pravidelnej prevádzke bez prívodu solárnej energie na ohrev teplej úžitkovej vody, pretože solárne čerpadlo prestane fungovať.'},
-    40: {"text1": 'Porucha sondy solárnej akumulácie', "text2": 'Sonda solárnej akumulácie ponúka hodnotu odporu mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ elektronika deteguje poruchu na sonde solárneho kolektora, sonda solárnej akumulácie pokračuje v pravidelnej prevádzke bez prívodu solárnej energie na ohrievanie teplej úžitkovej vody, pretože solárne čerpadlo prestane fungovať.'},
-    41: {"text1": 'Vysoká teplota na solárnom kolektore', "text2": 'Solárny kolektor prekročil nastavenú maximálnu teplotu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Objavuje sa, keď teplota na solárnom kolektore prevýši maximálny nastavený limit.'},
-    42: {"text1": 'Vysoká teplota v solárnej akumulácii', "text2": 'Solárna akumulácia prekročila nastavenú maximálnu teplotu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Objavuje sa, keď teplota na solárnej akumulácii prevýši maximálny nastavený limit.'},
-    43: {"text1": 'Zablokovanie v dôsledku straty plameňa.', "text2": 'Strata signálu plameňa pri fingovaní v režime niekoľko krát za sebou.', "action": 'Stlačte tlačidlo Reset, kotol pred opätovným spustením prevedie dodatočnú ventiláciu.', "comment": 'Objavuje sa, keď sa viackrát za sebou v priebehu vopred nastavenej doby objaví chyba „Strata signálu plameňa”.'},
-    44: {"text1": 'Zablokovanie pre prekročenie maximálnej doby otvorenia plynového ventilu.', "text2": 'Celkový prírastok času otvorenia plynového ventilu bez zistenia plameňa je dlhší ako povolené maximum.', "action": 'Stlačte tlačidlo Reset.', "comment": 'Objavuje sa v prípade, keď plynový ventil zostane otvorený dlhšiu dobu než je doba potrebná pre jeho normálne fungovanie bez toho, aby sa kotol zapol.'},
-    45: {"text1": 'Nadmerný dT', "text2": 'Rozdiel medzi teplotou nameranou medzi prívodom a vratným vedením je ≥ ako 40 °C.', "action": 'Obmedzuje silu horáka, aby nedošlo k poškodeniu kondenzačného modulu, jedným obnovením správneho dT kotla sa vráti do normálnej prevádzky. Skontrolujte, či je prítomný obeh vody v kotle, či je obehové čerpadlo konfigurované podľa požiadaviek zariadenia a či sonda spiatočky pracuje správne.', "comment": 'Kotol detekuje náhly, neočakávaný dT medzi nábehovou sondou a sondou spiatočky zariadenia.'},
-    46: {"text1": 'Zásah termostatu nízkej teploty/nesprávna konfigurácia zapojenia/karty', "text2": 'Bezpečnostný termostat umiestnený na prívodnom spojení z kotla DIM v2 (fungujúca iba pri nízkych teplotách) dosiahol vysoké teploty./Chyba kabeláže alebo nesprávne použitie náhradnej karty', "action": 'V takom prípade je možné po správnom vychladení resetovať termostat (viď príslušný návod na obsluhu)./ Ak porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Ak sa počas pracovného režimu objaví nadmerné zvýšenie teploty prietoku pri prevádzke s nízkou teplotou, kotol sa zablokuje./Chyba zapojenia alebo nesprávne použitie náhradnej karty'},
-    47: {"text1": 'Obmedzenie výkonu horáka', "text2": 'Pokiaľ teplota spalín dosiahne zvýšenú hodnotu, karta zníži poskytovaný výkon horáku, aby sa obmedzili škody obvodu spalín.', "action": 'Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'V prípade zistenia nadmernej teploty spalín kotol zníži vydávaný výkon, aby nedošlo k jeho poškodeniu.'},
-    48: {"text1": 'Porucha sondy na vstupe systému', "text2": 'Sonda na vstupe zariadenia ponúka hodnotu odporu mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ sonda na vstupe systému nie je pripojená alebo je chybná, je signalizovaná porucha'},
-    49: {"text1": 'Vysoká teplota na sonde spiatočky', "text2": 'Vysoká teplota nameraná sondou spiatočky', "action": 'Skontrolujte správnu cirkuláciu v kotle a správny pracovný režim trojcestného ventilu.', "comment": 'Nastáva v prípade dosiahnutia príliš vysokej teploty na výmenníku spätného okruhu.'},
-    50: {"text1": 'Porucha vonkajšej sondy', "text2": 'Vonkajší sonda ponúka hodnotu odporu mimo rozsahu', "action": 'Skontrolujte pripojenie vonkajšej sondy. Systém naďalej funguje', "comment": 'Pokiaľ vonkajšia sonda nie je pripojená alebo je chybná, je signalizovaná porucha'},
-    51: {"text1": 'Strata komunikácie s CAR Wireless', "text2": 'Komunikácia medzi vysielacou základňou a systémom CAR v2 RF vypadla.', "action": 'Skontrolujte funkčnosť CAR Wireless, skontrolujte nabitie batérie (viď príslušnú príručku pokynov).', "comment": 'V prípade straty komunikácie medzi kotlom a CAR vo verzii Wireless bude signalizovaná porucha, od tohto okamžiku je možné ovládať systém len pomocou ovládacieho panelu kotla.'},
-    54: {"text1": 'Porucha sondy puffer', "text2": 'Sonda puffer ponúka hodnotu odporu mimo rozsahu', "action": 'Režim puffer bude deaktivovaný', "comment": 'V prípade nepripojenej alebo chybnej sondy puffer je signalizovaná porucha'},
-    55: {"text1": 'Porucha sondy vstupnej teploty zóny 1', "text2": 'Sonda na vstupe zóny 1 ponúka hodnotu odporu mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Pokiaľ elektronika deteguje poruchu sondy zóny 1 nízkej teploty, systém nemôže pracovať pre príslušnú zónu.'},
-    58: {"text1": 'Porucha Audax', "text2": 'Signalizácia poruchy tepelného čerpadla Audax pripojeného k systému', "action": 'Tepelné čerpadlo nespĺňa požiadavky na kúrenie a vychladenie prostredia a po opätovnom zapojení je nutné systém vypnúť a znovu zapnúť', "comment": 'Porucha tepelného čerpadla Audax, skontrolujte typ poruchy priamo na displeji tepelného čerpadla'},
-    59: {"text1": 'Blokovanie frekvencie napájacej siete', "text2": 'Elektronická karta zistila poruchu frekvencie v sieti elektrického napájania.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Karta zistila poruchu frekvencie elektrickej siete.'},
-    60: {"text1": 'Anomália zablokovania obežného čerpadla', "text2": 'Modulačné obehové čerpadlo je zastavené.', "action": 'Skúste odblokovať obežné koleso podľa pokynov v príslušnom odseku. V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Obehové čerpadlo je zastavené v dôsledku nasledovných príčin: zablokovaný rotor, elektrická porucha.'},
-    61: {"text1": 'Prítomnosť vzduchu v obehovom čerpadle', "text2": 'Modulačné obehové čerpadlo je zastavené v dôsledku zistenia fungovania so vzduchom.', "action": 'Odvzdušnite obežné čerpadlo a vykurovací okruh. V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Je detekovaná prítomnosť vzduchu v obežnom čerpadle; obežné čerpadlo nemôže pracovať.'},
-    62: {"text1": 'Žiadosť o kompletnú kalibráciu', "text2": 'Karta nemá správnu konfiguráciu parametrov kontroly spaľovania.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Je zistený výpadok kalibrácie elektronickej karty. Toto môže nastať v prípade výmeny elektronickej karty, alebo v prípade zmeny parametrov v sekcii vzduch / plyn, preto je nevyhnutné vykonať „kompletnú kalibráciu”.'},
-    63: {"text1": 'Porucha sondy na spiatočke systému', "text2": 'Sonda spiatočky ponúka hodnotu odporu mimo rozsahu', "action": 'Kotol pokračuje v prevádzke bez integrácie z externých pripojených systémov', "comment": 'V prípade nezapojenej alebo chybnej sondy spiatočky je signalizovaná porucha'},
-    67: {"text1": 'Porucha tlakového spínača solárneho systému', "text2": 'Otvorený tlakový spínač, možný nedostatok kvapaliny', "action": 'Skontrolujte na manometri jednotky obehového čerpadla solárneho zariadenia, či je tlak na správnej hodnote', "comment": 'Vplyvom poklesu tlaku v solárnom okruhu blokuje tlakový spínač pracovný režim solárneho tepelného okruhu'},
-    70: {"text1": 'Obrátené sondy', "text2": 'V prípade chybného zapojenia kabeláže kotla sa zistí chyba', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Skontrolujte zapojenie sondy prívodu a spiatočky'},
-    72: {"text1": 'Žiadosť o rýchlu kalibráciu', "text2": 'Karta nemá správnu konfiguráciu parametrov kontroly spaľovania.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Je detekovaná zmena niektorých parametrov, preto je nevyhnutné vykonať „rýchlu kalibráciu”.'},
-    73: {"text1": 'Zistená priveľká odchýlka medzi nábehovou sondou a bezpečnostnou výstupovou sondou.', "text2": 'Sondy prívodu vykazujú zvýšený posun.', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Doska zistí poruchu na čítaní teplôt nábehovej sondy NTC, príčiny môžu byť: poruchová sonda, nesprávne umiestnenie, nedostatočný obeh v systéme, upchatie na strane vody primárneho výmenníka.'},
-    74: {"text1": 'Anomália bezpečnostnej nábehovej sondy', "text2": 'Bezpečnostná sonda prívodu ponúka hodnotu odporu mimo interval.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Doska zistí poruchu na bezpečnostnej nábehovej sonde NTC.'},
-    75: {"text1": 'Poškodené blokovanie pre snímač NTC', "text2": 'Možná porucha jednej či obidvoch sond prívodu a spiatočky zariadenia', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Snímač bezpečnostnej sondy spôsobuje zvýšený teplotný gradient'},
-    76: {"text1": 'Východ sondy prívodu alebo sondy spiatočky', "text2": 'Zistí sa porucha jednej či obidvoch sond prívodu a spiatočky zariadenia', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Väčší rozdiel s ohľadom na nastavenie medzi sondou prívodu a spiatočky v prípade požiadavky na teplo'},
-    77: {"text1": 'Anomália kontroly spaľovania', "text2": 'Zistený prúd plynového ventilu mimo interval.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Na plynovom ventile je detekovaný prúd mimo rozsah.'},
-    78: {"text1": 'Anomália kontroly spaľovania', "text2": 'Zistený vysoký prúd plynového ventilu.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Na plynovom ventile je detekovaný vysoký prúd.'},
-    79: {"text1": 'Anomália kontroly spaľovania', "text2": 'Zistený nízky prúd plynového ventilu.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Na plynovom ventile je detekovaný nízky prúd.'},
-    80: {"text1": 'Blokovanie pre poruchu elektronickej dosky.', "text2": 'Zistená porucha na elektronickom pohone plynového ventilu v dôsledku problémov s kartou alebo plynovým ventilom.', "action": 'Stlačte tlačidlo Reset.', "comment": 'Objavuje sa v prípade chybného fungovania elektronickej dosky, ktorá riadi ventil.'},
-    84: {"text1": 'Anomália spaľovania - prebieha zníženie výkonu', "text2": 'Zistené podmienky podobné nízkemu tlaku prívodu plynového ventilu.', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Je detekovaný nízky tlak na prívode plynovej siete. V dôsledku toho dôjde k obmedzeniu výkonu zariadenia a signalizácii poruchy.'},
-    85: {"text1": 'Zablokovanie v dôsledku problému postspaľovania.', "text2": 'Možný problém plynového ventilu, elektródy alebo elektronickej karty.', "action": 'Stlačte tlačidlo Reset. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Plameň je prítomný aj po zatvorení plynového ventilu.'},
-    87: {"text1": 'Blokovanie kontroly plynového ventilu', "text2": 'Zistená porucha na ovládaní plynového ventilu.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Je detekované zlyhanie jedného z komponentov, ktoré ovládajú plynový ventil.'},
-    88: {"text1": 'Blokovanie kontroly plynového ventilu', "text2": 'Zistená porucha na ovládaní plynového ventilu.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Je detekované zlyhanie jedného z komponentov, ktoré ovládajú plynový ventil.'},
-    89: {"text1": 'Nestabilný signál spaľovania', "text2": 'Zistená nestabilita signálu spaľovania.', "action": 'Kotol ďalej funguje.', "comment": 'Plameň je nestabilný v dôsledku: prítomnosť recirkulácie spalín, vietor, nestabilný tlak plynu, rýchlosť ventilátora nestabilná v dôsledku poruchy systému.'},
-    90: {"text1": 'Signál spaľovania mimo rozsah', "text2": 'Zistený signál spaľovania mimo interval.', "action": 'Kotol ďalej funguje.', "comment": 'Signál spaľovania je detekovaný mimo rozsah stanovenej regulácie na dlhšiu dobu.'},
-    91: {"text1": 'Blokovanie v dôsledku nesprávneho zapálenia', "text2": 'Doska vyčerpala všetky možné kroky pre dosiahnutie optimálneho zapálenia horáka.', "action": 'Stlačte tlačidlo Reset.', "comment": 'Doska vyčerpala všetky možné kroky pre dosiahnutie optimálneho zapálenia horáka'},
-    92: {"text1": 'Obmedzenie korekcie otáčok ventilátora', "text2": 'Karta dosiahla maximálnu korekciu otáčok ventilátora.', "action": 'Kotol ďalej funguje.', "comment": 'Systém vyčerpal všetky možné korekcie otáčok ventilátora.'},
-    93: {"text1": 'Signál spaľovania mimo rozsah', "text2": 'Zistený signál spaľovania mimo interval.', "action": 'Kotol ďalej funguje.', "comment": 'Signál spaľovania je detekovaný mimo rozsah stanovenej regulácie na dlhšiu dobu.'},
-    94: {"text1": 'Porucha spaľovania', "text2": 'Zistený problém spaľovania v dôsledku systému či ovládania spaľovania.', "action": 'V prípade opätovného nastavenia normálnych podmienok sa kotol spustí bez toho, že by musel byť resetovaný.', "comment": 'Je detekovaný problém na ovládaní spaľovania, ktorý môže byť spôsobený: nízky tlak plynu, recirkulácia spalín, plynový ventil alebo chybná elektronická karta.'},
-    95: {"text1": 'Signál spaľovania nepravidelný', "text2": 'Zistená diskontinuita signálu spaľovania v dôsledku problémov s elektrickým pripojením či rozptylom signálu.', "action": 'Kotol ďalej funguje.', "comment": 'Systém detekuje nepravidelnosť signálu spaľovania.'},
-    96: {"text1": 'Upchaté dymovody', "text2": 'Zistená zvýšená prekážka na odvode spalín.', "action": 'Kotol sa nespustí. Ak blokovanie alebo porucha pretrvávajú, je potrebné povolať zodpovedného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Objavuje sa v prípade upchatia dymovodov systému.'},
-    98: {"text1": 'Blokovanie pre maximálny počet chýb softwaru', "text2": 'Elektronická karta nefunguje správne.', "action": 'Stlačte tlačidlo Reset.', "comment": 'Bol dosiahnutý maximálny počet chýb povolených softwarom.'},
-    99: {"text1": 'Všeobecné zablokovanie', "text2": 'Elektronická karta nefunguje správne.', "action": 'Stlačte tlačidlo Reset.', "comment": 'Bola zistená porucha kotla.'},
-    101: {"text1": 'Alarm off-line Audax', "text2": 'Strata komunikácie s tepelným čerpadlom', "action": 'Tepelné čerpadlo nespĺňa požiadavky na kúrenie a vychladenie prostredia a po opätovnom zapojení je nutné systém vypnúť a znovu zapnúť', "comment": 'V prípade poruchy komunikácie, nesprávneho pripojenia alebo vypnutia tepelného čerpadla elektronika kotla nezistí tepelné čerpadlo'},
-    102: {"text1": 'Alarm off-line expanzie zóny 1', "text2": 'Strata komunikácie s expanziou zóny 1', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Porucha komunikácie so zónou 1'},
-    103: {"text1": 'Alarm off-line expanzie zóny 2', "text2": 'Strata komunikácie s expanziou zóny 2', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Porucha komunikácie so zónou 2'},
-    104: {"text1": 'Alarm off-line expanzie zóny 3', "text2": 'Strata komunikácie s expanziou zóny 3', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Porucha komunikácie so zónou 3'},
-    106: {"text1": 'Alarm sondy TÚV', "text2": 'V prípade integrácie s kotlom a samostatným riadením TÚV ponúka sonda kotla riadená regulátorom hodnotu odporu mimo rozsahu', "action": 'Systém nemôže vyrábať TÚV s tepelným čerpadlom. Výroba TÚV je zabezpečená kotlom', "comment": 'Elektronika deteguje poruchu sondy zásobníka TÚV'},
-    120: {"text1": 'Alarm vysokého nastavenia pre odvlhčovanie zóny 1', "text2": 'Vypočítaná požadovaná nastavená hodnota zóny 1 je príliš vysoká pre odvlhčovanie', "action": 'Vypočítané nastavenie prietoku chladenia je vyššie ako povolený limit odvlhčovača. Vychlaďte izbu a počkajte, kým sa rosný bod nevráti na prijateľné hodnoty', "comment": 'Vypočítané nastavenie prietoku chladenia pre odvlhčovanie je nad hranicou nastavenou v zóne 1'},
-    121: {"text1": 'Alarm off-line zariadenia zóny 1', "text2": 'Diaľkové ovládanie alebo diaľkové ovládanie zóny 1 je off-line', "action": 'Skontrolujte, či je diaľkový ovládač zapnutý', "comment": 'Komunikácia s kontrolou zóny nie je detegovaná. Nie je možné vykonať termoreguláciu zóny'},
-    122: {"text1": 'Alarm off-line zariadenia zóny 2', "text2": 'Diaľkové ovládanie alebo diaľkové ovládanie zóny 2 je off-line', "action": 'Skontrolujte, či je diaľkový ovládač zapnutý', "comment": 'Komunikácia s kontrolou zóny nie je detegovaná. Nie je možné vykonať termoreguláciu zóny'},
-    123: {"text1": 'Alarm off-line zariadenia zóny 3', "text2": 'Diaľkové ovládanie alebo diaľkové ovládanie zóny 3 je off-line', "action": 'Skontrolujte, či je diaľkový ovládač zapnutý', "comment": 'Komunikácia s kontrolou zóny nie je detegovaná. Nie je možné vykonať termoreguláciu zóny'},
-    125: {"text1": 'Porucha sondy priestorovej teploty zóny 1', "text2": 'Sonda priestorovej teploty zóny 1 je mimo rozsahu', "action": 'Okrem teploty nie je vypočítaný rosný bod pre zónu', "comment": 'Porucha sondy priestorovej teploty zóny 1 (voliteľné). Nie je možné vykonať termoreguláciu zóny'},
-    126: {"text1": 'Porucha sondy priestorovej teploty zóny 2', "text2": 'Sonda priestorovej teploty zóny 2 je mimo rozsahu', "action": 'Okrem teploty nie je vypočítaný rosný bod pre zónu', "comment": 'Porucha sondy priestorovej teploty zóny 2 (voliteľné). Nie je možné vykonať termoreguláciu zóny'},
-    127: {"text1": 'Porucha sondy priestorovej teploty zóny 3', "text2": 'Sonda priestorovej teploty zóny 3 je mimo rozsahu', "action": 'Okrem teploty nie je vypočítaný rosný bod pre zónu', "comment": 'Porucha sondy priestorovej teploty zóny 3 (voliteľné). Nie je možné vykonať termoreguláciu zóny'},
-    129: {"text1": 'Porucha sondy vlhkosti zóny 1', "text2": 'Sonda vlhkosti prostredia zóny 1 je mimo rozsahu', "action": 'Okrem vlhkosti nie je vypočítaný rosný bod pre zónu', "comment": 'Porucha sondy vlhkosti zóny 1 (voliteľné). Nie je možné kontrolovať vlhkosť zóny'},
-    130: {"text1": 'Porucha sondy vlhkosti zóny 2', "text2": 'Sonda vlhkosti prostredia zóny 2 je mimo rozsahu', "action": 'Okrem vlhkosti nie je vypočítaný rosný bod pre zónu', "comment": 'Porucha prítomná na sonde vlhkosti zóny 2 (voliteľné). Nie je možné kontrolovať vlhkosť zóny'},
-    131: {"text1": 'Porucha zóny vlhkosti zóny 3', "text2": 'Sonda vlhkosti prostredia zóny 3 je mimo rozsahu', "action": 'Okrem vlhkosti nie je vypočítaný rosný bod pre zónu', "comment": 'Porucha sondy vlhkosti zóny 3 (voliteľné). Nie je možné kontrolovať vlhkosť zóny'},
-    132: {"text1": 'Alarm vysokého nastavenia pre odvlhčovanie zóny 2', "text2": 'Vypočítaná požadovaná nastavená hodnota zóny 2 je príliš vysoká pre odvlhčovanie', "action": 'Vypočítané nastavenie prietoku chladenia je vyššie ako povolený limit odvlhčovača. Vychlaďte izbu a počkajte, kým sa rosný bod nevráti na prijateľné hodnoty', "comment": 'Vypočítané nastavenie prietoku chladenia pre odvlhčovanie je nad hranicou nastavenou v zóne 2'},
-    133: {"text1": 'Alarm poruchy odvlhčovača zóny 1', "text2": 'Odvlhčovač zóny 1 je v stave alarmu', "action": 'Systém nevykonáva odvlhčovanie vo svojej zóne', "comment": 'Porucha pochádzajúca z odvlhčovača (voliteľné) v zóne 1'},
-    134: {"text1": 'Alarm poruchy odvlhčovača zóny 2', "text2": 'Odvlhčovač zóny 2 je v stave alarmu', "action": 'Systém nevykonáva odvlhčovanie vo svojej zóne', "comment": 'Porucha pochádzajúca z odvlhčovača (voliteľné) v zóne 2'},
-    135: {"text1": 'Alarm poruchy odvlhčovača zóny 3', "text2": 'Odvlhčovač zóny 3 je v stave alarmu', "action": 'Systém nevykonáva odvlhčovanie vo svojej zóne', "comment": 'Porucha pochádzajúca z odvlhčovača (voliteľné) v zóne 3'},
-    137: {"text1": 'Alarm obnoveného systému - reštartujte systém', "text2": 'Po obnovení, ktoré sa vykonáva prostredníctvom ovládacieho panelu, je signalizovaný alarm, pretože je vyžadovaný reštart systému', "action": 'Vypnite a zapnite systém', "comment": 'Po obnovení východiskových parametrov systém potrebuje reštart'},
-    138: {"text1": 'Prebieha vykurovanie podlahy', "text2": 'Prebieha funkcia vykurovania podlahy', "action": '', "comment": ''},
-    139: {"text1": 'Prebieha odvzdušnenie', "text2": 'Prebieha funkcia odvzdušnenia', "action": '', "comment": ''},
-    177: {"text1": 'Alarm maximálnej doby okruhu TÚV', "text2": 'Požiadavka o TÚV bola vykonaná prekročením vopred stanovenej maximálnej doby', "action": 'systém naďalej beží s neoptimálnym výkonom', "comment": 'Produkcia TÚV nie je splnená v nastavenej dobe (5 hodín)'},
-    178: {"text1": 'Neúspešný cyklus odstránenia legionely', "text2": 'Cyklus odstránenie legionely nebol úspešne dokončený v nadstavenom čase', "action": 'Stlačte tlačidlo Reset (1)', "comment": 'Cyklus odstránenia legionely sa neúspešne vykonáva v nadstavenom čase (3 hodiny)'},
-    179: {"text1": 'Porucha kvapalinovej sondy', "text2": 'Sonda kvapalnej fázy je mimo rozsahu.', "action": 'Systém sa nespustí. Zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Karta zistila poruchu na sonde kvapalnej fázy'},
-    181: {"text1": 'Strata komunikácie s riadiacou jednotkou zóny 2', "text2": 'Nie je k dispozícii komunikácia medzi kartou a diaľkovým ovládaním zóny 2.', "action": 'Odpojte a obnovte napätie v hydronickom module. Ak po zapnutí nedôjde k detegovaniu diaľkového ovládania, systém prechádza do lokálneho pracovného režimu, to znamená, že používa ovládacie prvky na ovládacom paneli. V tomto prípade nemožno aktivovať funkciu“Kúrenie”', "comment": 'Objavuje sa v prípade nekompatibilného pripojenia k riadiacej jednotke alebo v prípade straty komunikácie medzi hydronickým modulom a CARV2 druhej zóny.'},
-    182: {"text1": 'Alarm motorového kondenzátora', "text2": 'Vyskytol sa alarm motorového kondenzátora', "action": 'Systém nefunguje, pozri poruchu motorového kondenzátora a súvisiaci návod s pokynmi', "comment": 'Je hlásená porucha na motorovom kondenzátore'},
-    183: {"text1": 'Alarm motorového kondenzátora v režime testmode', "text2": 'Motorový kondenzátor je v režime TESTMODE', "action": 'Počas tejto fázy nie je možné splniť požiadavky na klimatizáciu prostredia a výrobu TÚV', "comment": 'Je hlásený motorový kondenzátor v režime fázového testu'},
-    184: {"text1": 'Alarm časového limitu komunikácie s vonkajšou jednotkou', "text2": 'Strata komunikácie s motorovým kondenzátorom', "action": 'Skontrolujte elektrické pripojenie medzi jednotkami', "comment": 'Je hlásená porucha v dôsledku komunikačného problému medzi vnútornou jednotkou a motorovým kondenzátorom'},
-    185: {"text1": 'Alarm komunikácie bezpečnostného modulu', "text2": 'Strata komunikácie s bezpečnostným modulom', "action": 'Skontrolujte prepojenie medzi komponentmi', "comment": 'Problém v komunikácii medzi regulačnou kartou a zapaľovacou doskou'},
-    186: {"text1": 'Porucha vysokého napätia zapaľovacieho mechanizmu', "text2": 'Bezpečnostný modul: je hlásená porucha napätia zapaľovacieho mechanizmu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Je hlásená porucha na zapaľovacej doske'},
-    187: {"text1": 'Alarm sondy spiatočky motorového kondenzátora', "text2": 'Sonda spiatočky motorového kondenzátora je mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Elektronika deteguje poruchu NTC sondy spiatočky tepelného čerpadla'},
-    188: {"text1": 'Požiadavka mimo rozsahu pracovného režimu', "text2": 'Zadaná požiadavka nie je vykonaná, pretože vonkajšie podmienky neumožňujú aktiváciu motorového kondenzátora', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Vyšle sa požiadavka na kúrenie alebo chladenie s vonkajšou teplotou mimo limitov pracovného režimu'},
-    189: {"text1": 'Alarm časového limitu komunikácie s komunikačnou doskou', "text2": 'Strata komunikácie s komunikačnou doskou x motorového kondenzátora', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'V prípade straty komunikácie medzi elektronickými doskami je signalizovaná porucha'},
-    191: {"text1": 'Strata RF komunikácie do CAR v2 RF zóny 2', "text2": 'Komunikácia medzi vysielacou základňou a CAR v2 RF zóny 2 vypadla', "action": 'Skontrolujte pracovný režim jednotky CAR v bezdrôtovej verzii, skontrolujte nabitie batérie (pozri príslušnú príručku s pokynmi).', "comment": 'V prípade straty komunikácie medzi vnútornou jednotkou a jednotkou CAR v bezdrôtovej verzii druhej zóny bude signalizovaná porucha, od tohto okamihu je možné ovládať systém iba pomocou ovládacieho panelu tejto vnútornej jednotky'},
-    192: {"text1": 'Porucha sondy na vstupe motorového kondenzátora', "text2": 'Sonda na vstupe motorového kondenzátora je mimo rozsahu', "action": 'Pokiaľ porucha pretrváva, zavolajte autorizovaného servisného technika (napríklad zo Strediska technickej asistencie Immergas).', "comment": 'Elektronika deteguje poruchu NTC sondy prietoku tepelného čerpadla'},
-    193: {"text1": 'Spotrebič v režime Testmode', "text2": 'Spotrebič je riadený externým zariadením pomocou protokolu Opentherm', "action": 'Systém naďalej funguje správne', "comment": 'Je hlásené, že spotrebič je v režime fázového testu'},
-    194: {"text1": 'Audax Pro deaktivovaný', "text2": 'Motorový kondenzátor Audax Pro bol deaktivovaný', "action": 'Systém naďalej funguje správne', "comment": 'Je hlásené, že motorový kondenzátor bol deaktivovaný pomocou príslušného vstupu na svorkovnici'},
-    195: {"text1": 'Porucha nízkej teploty kvapalnej fázy', "text2": 'Teplota sondy kvapalnej fázy je príliš nízka', "action": 'Skontrolujte správny pracovný režim chladiaceho okruhu', "comment": 'V kvapalnej fáze je zistená príliš nízka teplota'},
-    196: {"text1": 'Zablokovanie v dôsledku vysokej teploty prietoku', "text2": 'Bola zistená príliš vysoká teplota obvodu spiatočky tepelného čerpadla', "action": 'Skontrolujte správny pracovný režim chladiaceho okruhu', "comment": 'Bola zistená príliš vysoká teplota obvode prietoku tepelného čerpadla'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: sl)"""
-
-immergas_labels = {
-    'default': {"text1": 'Splošna nepoznana anomalija', "text2": 'Preverite tabelo napak ali izbrano kartico', "action": 'Preverite tabelo napak ali izbrano kartico', "comment": 'Nobene posebne opombe'},
-    0: {"text1": 'SISTEM OK', "text2": 'Sistem pravilno deluje', "action": 'Nobenega zahtevanega posega', "comment": 'Nobene anomalije'},
-    1: {"text1": 'Blokiranje zaradi neuspelega vžiga', "text2": 'Ob koncu zadnjega poizkusa vžiga ni zaznan plamen. ', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Kotel se v primeru zahteve za ogrevanje prostora ali proizvodnjo tople sanitarne vode ne prižge v predhodno določenem času.  Blokado vžiga je potrebno odpraviti tudi ob prvem vklopu in po daljšem obdobju nedelovanja naprave.'},
-    2: {"text1": 'Blokada varnostnega termostata (previsoka temperatura)', "text2": 'Sproženje varnostnega termostata.', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Če pride med običajnim delovanjem zaradi napake do prekomernega notranjega segrevanja, se kotel blokira zaradi previsoke temperature.'},
-    3: {"text1": 'Blokada termostata dimnih plinov', "text2": 'Sproženje termostata dimnih plinov', "action": 'Pritisnite gumb reset (Ponastavi) (verzije Nike)/Pravilno konfigurirajte parameter P.14. Po potrebi pritisnite gumb za ponastavitev (verzije Star)', "comment": 'Če pride med običajnim delovanjem zaradi napake do prekomernega segrevanja dimnih plinov, se kotel blokira zaradi previsoke temperature. (verzije Nike)/Napačna konfiguracija parametra P.14 (verzija Star)'},
-    4: {"text1": 'Blokiranje kontaktnega upora', "text2": 'Zaznana je anomalija na tokokrogu za usmerjanje plinskega ventila.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Elektronska kartica zazna anomalijo pri napajanju plinskega ventila. Preverite delovanje le-tega.  (anomalija je zaznana in prikazana le v primeru zahteve). '},
-    5: {"text1": 'Napaka sonde na dovodu', "text2": 'Sonda na dovodu zazna uporovno vrednost izven razpona. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi NTC na dovodu.'},
-    6: {"text1": 'Napaka sonde sanitarne vode', "text2": 'Sonda za sanitarno vodo zazna uporovno vrednost izven razpona. ', "action": 'Kotel nadaljuje s pripravo tople sanitarne vode, toda rezultati niso optimalni. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi NTC sistema za sanitarno vodo.'},
-    8: {"text1": 'Najvišje št. ponastavitev', "text2": 'Pomeni, da ste dosegli maksimalno število dovoljenih ponastavitev, ki jih omogoča integrirana kartica. ', "action": 'Pozor: napako lahko ponastavite do 5-krat zaporedoma, potem je funkcija onemogočena vsaj eno uro, nato pa lahko vsako uro opravite 1 ponovni zaporedni poskusov do maksimalno 5 poizkusov.  Če napravo izklopite in ponovno vklopite, pridobite 5 poizkusov. ', "comment": 'Število že opravljenih ponastavitev. '},
-    10: {"text1": 'Prenizek tlak v napeljavi', "text2": 'Kontakt presostata sistema je odprt.', "action": 'Na manometru kotla preverite, ali je tlak sistema znotraj vrednosti 1÷1,2 bara; če ne bi bilo tako, vzpostavite pravilni tlak.', "comment": 'V ogrevalnem tokokrogu ni zaznan zadosten vodni tlak za zagotovitev pravilnega delovanja kotla.'},
-    11: {"text1": 'Napaka presostata dimnih plinov', "text2": 'Morebitna napaka presostata dimnih plinov ali ventilatorja', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja, se kotel ponovno zažene brez potrebe po ponastavitvi.'},
-    12: {"text1": 'Napaka sonde grelnika', "text2": 'Sonda grelnika zazna uporovno vrednost izven razpona. ', "action": 'Kotel ne more proizvajati tople sanitarne vode. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi grelnika.'},
-    13: {"text1": 'Merilnik za pretok zraka/dimnih plinov je izven razpona', "text2": 'Signal za zrak/dimne pline je izven razpona ali pa je ventilator ustavljen, ko kontrola izmeri previsok signal', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Ko je ventilator ustavljen, kontrola zraka/dimnih plinov izmeri previsok signal (kontakti presostata zlepljeni)'},
-    15: {"text1": 'Napaka v konfiguraciji', "text2": 'Kartica zazna neskladje med lastno konfiguracijo in vhodnimi signali. ', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi. Prepričajte se, da je kotel pravilno konfiguriran. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna napako ali neskladje na električnem ožičenju kotla, kotel se ne zažene.'},
-    16: {"text1": 'Napaka ventilatorja', "text2": 'Ventilator se vrti, ko ni pod napajanjem ali pa je ustavljen, ko je pod napajanjem. ', "action": 'Pritisnite gumb reset (Ponastavi) Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Nastopi v primeru mehanske ali elektronske okvare ventilatorja. '},
-    17: {"text1": 'Hitrost ventilatorja ni pravilna', "text2": 'Število obratov ventilatorja je izven pravilnega razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Število obratov ventilatorja ni pravilno'},
-    20: {"text1": 'Blokiranje parazitskega plamena', "text2": 'Anomalija pri zaznavanju plamena', "action": 'Pritisnite gumb reset (Ponastavi) Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Pojavi se v primeru disperzije kontrolnega tokokroga ali napake pri nadzoru plamena.'},
-    23: {"text1": 'Napaka sonde na povratku', "text2": 'Sonda na povratku zazna uporovno vrednost izven razpona. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi NTC na dovodu.'},
-    24: {"text1": 'Napaka komandne plošče', "text2": 'Zaznan je neprekinjen pritisk gumbov na ohišju. ', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na stikalni plošči. '},
-    25: {"text1": 'Blokada sonde dimnih plinov/blokada CRC (TERA)', "text2": 'Temperatura dimnih plinov izven razpona/spomin pokvarjen (TERA)', "action": 'Pritisnite gumb Ponastavi ', "comment": 'Gradient dimnih plinov visok, verjetno blokada črpalke ali pomanjkanje vode/spomin pokvarjen'},
-    27: {"text1": 'Nezadosten obtok', "text2": 'pregrevanje kotla, ki je posledica nezadostnega obtoka v primarnem tokokrogu', "action": 'Pritisnite gumb reset', "comment": 'Prepričajte se, da niso prisotne zapore na tokokrogu za ogrevanje in/ali preverite pravilno delovanje obtočne črpalke'},
-    28: {"text1": 'Prehod tokokroga sanitarne vode', "text2": 'Če bi med delovanjem v fazi ogrevanja prišlo do dvigovanja temperature sanitarne vode, kotel opozori na anomalijo in zmanjša temperaturo ogrevanja ter s tem omeji nastajanje vodnega kamna v izmenjevalniku.', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Prepričajte se, da so vsi ventili sanitarnega sistema zaprti in da iz njih ne izteka voda ter v vsakem primeru preverite, da ne prihaja do puščanja v sistemu. Kotel se v običajno delovanje vrne takrat, ko so na sanitarnem sistemu ponovno vzpostavljeni optimalni pogoji'},
-    29: {"text1": 'Anomalija na sondi dimnih plinov ', "text2": 'Sonda grelnika zazna uporovno vrednost izven razpona. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi dimnih plinov'},
-    31: {"text1": 'Prekinitev komunikacije z daljinskim upravljalnikom  CARV2', "text2": 'Ni kontakta med kartico in daljinskim upravljanjem.', "action": 'Prekinite in ponovno vzpostavite napetost kotla. Če daljinski upravljalnik tudi ob ponovnem vklopu ni zaznan, kotel preide na lokalno delovanje oziroma na uporabo krmilnih mehanizmov na nadorni plošči. V tem primeru funkcije “Ogrevanje” ni mogoče aktivirati.', "comment": 'Pojavi se takrat, ko povezava z daljinskim upravljalnikom ni združljiva, ali v primeru prekinitve komunikacije med kotlom in daljinskim upravljalnikom CARV2.'},
-    32: {"text1": 'Napaka sonde nizkotemperaturne cone 2', "text2": 'Sonda na dovodu v cono 2 je izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi nizkotemperaturne cone 2, sistem ne more delati v dotični coni.'},
-    33: {"text1": 'Napaka sonde nizkotemperaturne cone 3', "text2": 'Sonda na dovodu v cono 3 je izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi nizkotemperaturne cone 2, sistem ne more delati v dotični coni.'},
-    36: {"text1": 'Prekinitev komunikacije vodila IMG', "text2": 'Prekinitev komunikacije na protokolu IMG Bus. ', "action": 'Kotel ne izpolni zahtev za ogrevanje.', "comment": 'Zaradi anomalije na centrali kotla se na conski kartici (opcijsko) ali na vodilu IMG Bus prekine komunikacija med različnimi komponentami.'},
-    37: {"text1": 'Nizka napajalna napetost', "text2": 'Napajalna napetost kartice ima manjše vrednosti od dovoljenih omejitev. ', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi.', "comment": 'Pojavi se takrat, ko je napajalna napetost nižja od dovoljenih mejnih vrednosti za pravilno delovanje kotla.'},
-    38: {"text1": 'Izguba signala plamena', "text2": 'Kartica po tem, ko je zabeležila pravilno vrednost toka plamena, opozori na prekinitev signala plamena. ', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi.', "comment": 'Pojavi se takrat, ko je kotel pravilno prižgan in se plamen gorilnika nenadoma ugasne. Izvede se poskus ponovnega vžiga in v primeru ponovne vzpostavitve normalnih pogojev delovanja, kotla ni potrebno ponastaviti.'},
-    39: {"text1": 'Temperatura sončnega zbiralnika', "text2": 'Sonda grelnika zazna uporovno vrednost izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Sonda zazna anomalijo na sondi sončnega zbiralnika, grelnik normalno nadaljuje z delovanjem, ne da bi porabil sončno energijo za ogrevanje tople sanitarne vode, saj črpalka preneha z delovanjem'},
-    40: {"text1": 'Temperatura solarne priprave', "text2": 'Sonda solarne priprave zazna uporovno vrednost izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Sonda zazna anomalijo na sondi solarne priprave, grelnik normalno nadaljuje z delovanjem, ne da bi porabil sončno energijo za ogrevanje tople sanitarne vode, saj črpalka preneha z delovanjem'},
-    41: {"text1": 'Visoka temperatura sončnega zbiralnika', "text2": 'Solarni kolektor je presegel maksimalno nastavljeno temperaturo', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Do tega pride, ko temperatura solarnega kolektorja preseže maksimalno nastavljeno omejitev'},
-    42: {"text1": 'Visoka temperatura solarne priprave', "text2": 'Solarna priprava je presegel maksimalno nastavljeno temperaturo', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Do tega pride, ko temperatura solarne priprave preseže maksimalno nastavljeno omejitev'},
-    43: {"text1": 'Blokada pri izgubi signala plamena', "text2": 'Izguba signala plamena pri običajnem delovanju večkrat zapored. ', "action": 'Pritisnite gumb Reset, preden kotel nadaljuje z delovanjem, izvede cikel post ventilacije.', "comment": 'Nastopi, če se v predhodno določenem časovnem loku večkrat zaporedoma pojavi napaka “Izguba signala plamena”.'},
-    44: {"text1": 'Blokada zaradi plinskega ventila', "text2": 'Skupni čas odpiranja plinskega ventila, ne da bi bil zaznan plamen, je večji od dovoljenega. ', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Pojavi se takrat, ko ostane plinski ventil odprte dlje časa od tistega, ki je predviden za njegovo običajno delovanje, ne da bi se kotel prižgal.'},
-    45: {"text1": 'dT visoka', "text2": 'Razlika med temperaturo, izmerjeno na dovodu in povratku je ≥ di 40°C.', "action": 'Omeji je moč gorilnika, s čimer se preprečijo morebitne poškodbe na modulu za kondenzacijo, ko je enkrat ponovno dosežena pravilna dT, se kotel vrne v normalni način delovanja Prepričajte se, da v kotlu kroži voda, ter da je obtočna črpalka konfigurirana skladno s potrebami sistema, prav tako preverite pravilno delovanje sonde povratka. ', "comment": 'Kotel zazna nenaden in nepričakovan dvig dT med sondo na dovodu in sondo na povratku sistema. '},
-    46: {"text1": 'Posredovanje termostata nizke temperature / napačna konfiguracija kabelske napeljave/kartice', "text2": 'Varnostni termostat, ki se nahaja na povezavi za dovod kotla na DIM v2 (deluje le na nizki temperaturi), je zaznal visoke temperature./Napaka kabelske napeljave ali uporaba nadomestne kartice napačna', "action": 'V tem primeru je po ustreznem ohlajanju mogoče termostat ponastaviti (oglejte si odgovarjajoči list z navodili)./Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Če se med normalnim režimom delovanja pojavi previsoka temperatura na dovodu z nizko temperaturo, se kotel blokira./Napaka kabelske napeljave ali napačna uporaba nadomestne kartice'},
-    47: {"text1": 'Omejitev moči gorilnika', "text2": 'Če temperatura dimnih plinov doseže visoko vrednost, kartica zmanja moč, ki jo oddaja  gorilnik, ter tako prepreči poškodbe tokokroga dimnih plinov. ', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'V primeru, da je zaznana visoka temperatura dimnih plinov, kotel zmanjša oddano moč, da ne bi prišlo do poškodb samega kotla.'},
-    48: {"text1": 'Napaka sonde na dovodu na strani sistema', "text2": 'Sonda na dovodu na strani sistema zazna uporovno vrednost izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'V primeru nepovezane ali okvarjene sonde na dovodu na strani sistema se opozori na anomalijo.'},
-    49: {"text1": 'Blokada temperature, zaznana na sondi povratka', "text2": 'Temperatura, ki jo izmeri sonda NTC na povratku, je visoka', "action": 'Preverite pravilno cirkulacijo v kotlu in dobro delovanje tripotnega ventila.', "comment": 'Do tega pride v primeru, da je dosežena previsoka temperatura na krogu povratka izmenjevalnika'},
-    50: {"text1": 'Napaka zunanje sonde', "text2": 'Sonda grelnika zazna uporovno vrednost izven razpona', "action": 'Preverite povezavo zunanje sonde. Kotel še naprej deluje', "comment": 'V primeru nepovezane ali okvarjene zunanje sonde se opozori na anomalijo.'},
-    51: {"text1": 'Prekinjena komunikacija s CAR brezžičnim internetnim omrežjem.', "text2": 'Komunikacija med oddajniško bazo in CARv2 RF je bila prekinjena. ', "action": 'Preverite delovanje brezžičnega CAR, preverite napolnjenost baterij (glejte pripadajočo knjižico z navodili).', "comment": 'V primeru prekinjene komunikacije med kotlom in brezžično verzijo CAR , se opozori na anomalijo, od tega trenutka naprej je mogoče nadzirati sistem le preko kontrolnega panela samega kotla. '},
-    54: {"text1": 'Anomalija na sondi puferja', "text2": 'Sonda puferja zazna uporovno vrednost izven razpona', "action": 'Način pufer je onemogočen', "comment": 'V primeru nepovezane ali okvarjene sonde puferja se opozori na anomalijo'},
-    55: {"text1": 'Anomalija sonde temperature na dovodu cone 1', "text2": 'Sonda na dovodu cone 1 zazna uporovno vrednost izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi nizkotemperaturne cone 1, sistem ne more delati v dotični coni.'},
-    58: {"text1": 'Anomalija Audax', "text2": 'Opozorilo na anomalijo s strani toplotne črpalke AUDAX, ki je povezana na sistem', "action": 'Toplotna črpalka ne izpolnjuje vseh zahteva za ogrevanje in ohlajanje okolja, ko so enkrat ponastavljene povezave, je treba ugasniti in ponovno prižgati sistem', "comment": 'Anomalija na toplotni črpalki Audax, preverite vrsto anomalije neposredno na zaslonu toplotne črpalke'},
-    59: {"text1": 'Blokada zaradi frekvence napajalnega električnega omrežja', "text2": 'Elektronska kartica je zaznala nepravilno frekvenco na omrežju električnega napajanja. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna nepravilno frekvenco na napajalnem električnem omrežju'},
-    60: {"text1": 'Anomalija obtočna črpalka blokirana', "text2": 'Modulacijska obtočna črpalka je ustavljena. ', "action": 'Poizkusite odblokirati obtočno črpalko, kot je opisano v pripadajočem odstavku.  V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi.', "comment": 'Modulacijska obtočna črpalka je ustavljena zaradi enega od naslednjih razlogov: rotor blokiran, električna okvara.'},
-    61: {"text1": 'Prisotnost zraka v obtočni črpalki. ', "text2": 'Modulacijska obtočna črpalka je ustavljena zaradi tega, ker je bilo zaznano gibanje z zrakom. ', "action": 'Izvedite odzračenje obtočne črpalke in sistema ogrevanja.  V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi.', "comment": 'V notranjosti obtočne črpalke je zaznan zrak; obtočna črpalka ne more delovati. '},
-    62: {"text1": 'Zahteva za celotno kalibriranje ', "text2": 'Parametri kontrole gorenja na kartici niso pravilno konfigurirani. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": "Zaznana je neprisotnost kalibriranja elektronske kartice. Do tega lahko pride zaradi zamenjave elektronske kartice ali v primeru spremembe parametrov v sekciji zrak/plin, zaradi česar je potrebna zahteva za ''celotno kalibriranje''. "},
-    63: {"text1": 'Anomalija na sondi povratka sistema', "text2": 'Sonda na povratku zazna uporovno vrednost izven razpona', "action": 'Kotel nadaljuje z delovanjem brez integracije povezanih zunanjih sistemov', "comment": 'V primeru nepovezane ali okvarjene sonde povratka se opozori na anomalijo'},
-    67: {"text1": 'Anomalija presostata solarnega sistema', "text2": 'Presostat sistema je odprt, morda ni dovolj tekočine', "action": 'Na manometru enote za cirkulacijo preverite, da je pritisk na pravilni vrednosti', "comment": 'Zaradi padca pritiska v solarnem krogotoku presostat blokira delovanje toplotnega solarnega krogotoka'},
-    70: {"text1": 'Obrnjene sonde', "text2": 'V primeru napake pri povezavi napeljave je zaznana napaka', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Preverite povezavo sonde na dovodu in na povratku'},
-    72: {"text1": 'Zahteva za hitro kalibriranje ', "text2": 'Določeni parametri kontrole gorenja na kartici niso pravilno konfigurirani. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": "Zaznana je sprememba določenih parametrov, zaradi česar je potrebno ''hitro kalibriranje''."},
-    73: {"text1": 'Zaznan je velik odklon na sondi za dovod in varnostni sondi za dovod.', "text2": 'Zaznan je velik odklon na sondah za dovod.', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi', "comment": 'Kartica zazna anomalijo pri ugotavljanju temperatur na NTC sondi na dovodu, vzroki so lahko: okvara na sondi, nepravilni položaj, čibka cirkulacija sistema, zamašitev na strani z vodo primarnega izmenjevalnika.'},
-    74: {"text1": 'Anomalija na varnostni sondi na dovodu', "text2": 'Sonda na dovodu zazna uporovno vrednost izven razpona. ', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi NTC na dovodu.'},
-    75: {"text1": 'Blok za senzor NTC poškodovan', "text2": 'Morda je prišlo do okvare ene ali druge sonde na dovodu ali na povratku sistema', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Senzor varnostne sonde povzroči visok temperaturni gradient'},
-    76: {"text1": 'Premik sonde na dovodu ali na povratku', "text2": 'Zaznano je nepravilno delovanje ene ali obeh sond na dovodu ali na povratku sistema', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Razlika med sondo na dovodu in na povratku je večja od nastavljene v primeru zahteve za toploto'},
-    77: {"text1": 'Anomalija na kontroli zgorevanja ', "text2": 'Zaznan je tok plinskega ventila izven razpona.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Zaznan je tok izven omejitev na plinskem ventilu. '},
-    78: {"text1": 'Anomalija na kontroli zgorevanja ', "text2": 'Zaznan je visok tok plinskega ventila.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Na plinskem ventilu je zaznan povečan tok.'},
-    79: {"text1": 'Anomalija na kontroli zgorevanja ', "text2": 'Zaznan je nizek tok plinskega ventila.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Na plinskem ventilu je zaznan zmanjšan tok'},
-    80: {"text1": 'Blokada zaradi nepravilnega delovanja elektronske kartice', "text2": 'Zaznana je bila okvara na driverju elektronskega plinskega ventila, nastala zaradi težav na kartici ali na plinskem ventilu. ', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Do tega pride v primeru nepravilnega delovanja elektronske kartice, ki nadzira ventil.'},
-    84: {"text1": 'Anomalija pri zgorevanju - v teku je zmanjšanje moči', "text2": 'Zaznani so bili pogoji kot pri nizkem napajalnem pritisku plinskega ventila.', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi', "comment": 'Zaznan je nizek pritisk napajanja na plinskem omrežju Posledično je zmanjšana moč aparata, opozori se na anomalijo.'},
-    85: {"text1": 'Blokada zaradi težave na post-gorenju', "text2": 'Morebitna težava plinskega ventila, elektrode ali elektronske kartice.', "action": 'Pritisnite gumb reset (Ponastavi) Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Plamen prisoten po zaprtju plinskega ventila'},
-    87: {"text1": 'Blokada s strani kontrole plinskega ventila', "text2": 'Zaznana je bila okvara na kontroli plinskega ventila.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Zaznano je nepravilno delovanje ene od komponent, ki nadzorujejo plinski ventil'},
-    88: {"text1": 'Blokada s strani kontrole plinskega ventila', "text2": 'Zaznana je bila okvara na kontroli plinskega ventila.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Zaznano je nepravilno delovanje ene od komponent, ki nadzorujejo plinski ventil'},
-    89: {"text1": 'Signal za nestabilno zgorevanje', "text2": 'Zaznana je bila nestabilnost signala gorenja.', "action": 'Kotel še naprej deluje.', "comment": 'Plamen je nestabilen zaradi: prisotnosti obtoka plinov, vetra, nestabilnega pritiska plina, nestabilne hitrosti ventilatorja, ali zaradi nepravilnega delovanja sistema'},
-    90: {"text1": 'Signal za izgorevanje izven omejitev', "text2": 'Zaznan je bil signal za gorenje izven razpona.', "action": 'Kotel še naprej deluje.', "comment": 'Signal za izgorevanje je zaznan izven omejitev predvidenega razpona za regulacijo za daljši čas'},
-    91: {"text1": 'Blokiranje vžiga ni pravilno', "text2": 'Kartica je uporabila vse možnosti za doseganje optimalnega vžiga gorilnika', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Kartica je uporabila vse možnosti za doseganje optimalnega vžiga gorilnika'},
-    92: {"text1": 'Omejitev popravka obratov ventilatorja', "text2": 'Kartica je dosegla maksimalni popravek obratov ventilatorja.', "action": 'Kotel še naprej deluje.', "comment": 'Sistem je uporabil vse možne popravke števila obratov ventilatorja'},
-    93: {"text1": 'Signal za izgorevanje izven omejitev', "text2": 'Zaznan je bil signal za gorenje izven razpona.', "action": 'Kotel še naprej deluje.', "comment": 'Signal za izgorevanje je zaznan izven omejitev predvidenega razpona za regulacijo za daljši čas'},
-    94: {"text1": 'Anomalija na zgorevanju', "text2": 'Zaznana je bila težava z gorenjem, nastala zaradi sistema ali kontrole gorenja. ', "action": 'V primeru ponovne vzpostavitve normalnih pogojev delovanja se kotel ponovno zažene brez potrebe po ponastavitvi.', "comment": 'Zaznana je težava na kontroli zgorevanja, ki je lahko nastala zaradi: nizkega pritiska plina, obtoka plinov, okvare na plinskem ventilu ali na elektronski kartici'},
-    95: {"text1": 'Signal za zgorevanje prekinjajoč', "text2": 'Zaznan je bil prekinjajoč signal za zgorevanje zaradi težav z električnimi povezavami ali disperzije signala.', "action": 'Kotel še naprej deluje.', "comment": 'Sistem zazna prekinjajoč signal za zgorevanje'},
-    96: {"text1": 'Dimnovod oviran', "text2": 'Zaznana je bila ovira na dimni napeljavi.', "action": 'Kotel se ne zažene. Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Do nje pride v primeru, da je zaznana ovira v dimniškem sistemu.'},
-    98: {"text1": 'Blokada zaradi maksimalnega števila napak programske opreme', "text2": 'Elektronska kartica ne deluje pravilno', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Doseženo je bilo maksimalno dovoljeno število napak programske opreme'},
-    99: {"text1": 'Splošna blokada', "text2": 'Elektronska kartica ne deluje pravilno', "action": 'Pritisnite gumb reset (Ponastavi) ', "comment": 'Zaznana je anomalija na kotlu.'},
-    101: {"text1": 'Alarm Audax offline', "text2": 'Izguba komunikacije s toplotno črpalko', "action": 'Toplotna črpalka ne izpolnjuje vseh zahteva za ogrevanje in ohlajanje okolja, ko so enkrat ponastavljene povezave, je treba ugasniti in ponovno prižgati sistem', "comment": 'V primeru prekinitve komunikacije, napačne povezave ali ugasnjene toplotne črpalke, elektronski del kotla ne zazna toplotne črpalke'},
-    102: {"text1": 'Alarm offline za razširitev cone 1', "text2": 'Izguba komunikacije za razširitev cone 1', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Anomalija komunikacije s cono 1'},
-    103: {"text1": 'Alarm offline za razširitev cone 2', "text2": 'Izguba komunikacije za razširitev cone 2', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Anomalija komunikacije s cono 2'},
-    104: {"text1": 'Alarm offline za razširitev cone 3', "text2": 'Izguba komunikacije za razširitev cone 3', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Anomalija komunikacije s cono 3'},
-    106: {"text1": 'Alarm na sondi za sistem za sanitarno vodo', "text2": 'V primeru integracije s kotlom in pri ločenem upravljanju sanitarnega sistema, sonda grelnika, ki jo upravlja upravljalec, zazna uporovno vrednost izven razpona', "action": 'Sistem ni zmožen proizvajati tople sanitarne vode s toplotno črpalko. Proizvodnjo tople sanitarne vode zagotavlja kotel', "comment": 'Kartica zazna anomalijo na sondi grelnika.'},
-    120: {"text1": 'Visok alarm seta zaradi razvlaževanja cone 1', "text2": 'Zahtevan izračunan setpoint cone 1 je previsok za razvlaževanje', "action": 'Izračunan set za dovod je večji od dovoljene omejitve razvlaževalca. Osvežite okolje in počakajte, da se temperatura rosišča vrne na sprejemljive vrednosti.', "comment": 'Izračunan set na dovodu ohlajanja za razvlaževanje je višji od nastavljene omejitve v coni 1'},
-    121: {"text1": 'Alarm offline za napravo na coni 1', "text2": 'Daljinski upravljalnik ali daljinska kontrola cone 1 je offline', "action": 'Prepričajte se, da je daljinska kontrola prižgana', "comment": 'Ni zaznana komunikacija s consko kontrolo. Termoregulacije cone ni mogoče izvesti.'},
-    122: {"text1": 'Alarm offline za napravo na coni 2', "text2": 'Daljinski upravljalnik ali daljinska kontrola cone 2 je offline', "action": 'Prepričajte se, da je daljinska kontrola prižgana', "comment": 'Ni zaznana komunikacija s consko kontrolo. Termoregulacije cone ni mogoče izvesti.'},
-    123: {"text1": 'Alarm offline za napravo na coni 3', "text2": 'Daljinski upravljalnik ali daljinska kontrola cone 3 je offline', "action": 'Prepričajte se, da je daljinska kontrola prižgana', "comment": 'Ni zaznana komunikacija s consko kontrolo. Termoregulacije cone ni mogoče izvesti.'},
-    125: {"text1": 'Anomalija sonde temperature okolja cone 1', "text2": 'Sonda za temperaturo okolja cone 1 je izven razpona', "action": 'Prav tako ni izračunana točka rosišča za cono', "comment": 'Anomalija na sonde temperature okolja cone 1 (opcijsko). Termoregulacije cone ni mogoče izvesti.'},
-    126: {"text1": 'Anomalija sonde temperature okolja cone 2', "text2": 'Sonda za temperaturo okolja cone 2 je izven razpona', "action": 'Prav tako ni izračunana točka rosišča za cono', "comment": 'Anomalija na sonde temperature okolja cone 2 (opcijsko). Termoregulacije cone ni mogoče izvesti.'},
-    127: {"text1": 'Anomalija sonde temperature okolja cone 3', "text2": 'Sonda za temperaturo okolja cone 3 je izven razpona', "action": 'Prav tako ni izračunana točka rosišča za cono', "comment": 'Anomalija na sonde temperature okolja cone 3 (opcijsko). Termoregulacije cone ni mogoče izvesti.'},
-    129: {"text1": 'Anomalija na sondi za vlažnost cona 1', "text2": 'Sonda za vlažnost okolja cone 1 je izven razpona', "action": 'Prav tako ni izračunana točka rosišča za cono', "comment": 'Zaznana je bila anomalija na sondi za vlažnost v coni 1 (opcijsko). Kontrole vlažnosti cone ni mogoče izvesti.'},
-    130: {"text1": 'Anomalija na sondi za vlažnost cona 2', "text2": 'Sonda za vlažnost okolja cone 2 je izven razpona', "action": 'Prav tako ni izračunana točka rosišča za cono', "comment": 'Zaznana je bila anomalija na sondi za vlažnost v coni 2 (opcijsko) Kontrole vlažnosti cone ni mogoče izvesti.'},
-    131: {"text1": 'Anomalija na sondi za vlažnost cona 3', "text2": 'Sonda za vlažnost okolja cone 3 je izven razpona', "action": 'Prav tako ni izračunana točka rosišča za cono', "comment": 'Zaznana je bila anomalija na sondi za vlažnost v coni 3 (opcijsko). Kontrole vlažnosti cone ni mogoče izvesti.'},
-    132: {"text1": 'Visok alarm seta zaradi razvlaževanja cone 2', "text2": 'Zahtevan izračunan setpoint cone 2 je previsok za razvlaževanje', "action": 'Izračunan set za dovod je večji od dovoljene omejitve razvlaževalca. Osvežite okolje in počakajte, da se temperatura rosišča vrne na sprejemljive vrednosti.', "comment": 'Izračunan set na dovodu ohlajanja za razvlaževanje je višji od nastavljene omejitve v coni 2'},
-    133: {"text1": 'Alarm okvara na razvlaževalcu cone 1', "text2": 'Alarm na razvlaževalcu cone 1', "action": 'Sistem ne izvede razvlaževanja dotične cone.', "comment": 'Anomalija, ki izvira z razvlaževalca (opcijsko) na coni 1'},
-    134: {"text1": 'Alarm okvara na razvlaževalcu cone 2', "text2": 'Alarm na razvlaževalcu cone 2', "action": 'Sistem ne izvede razvlaževanja dotične cone.', "comment": 'Anomalija, ki izvira z razvlaževalca (opcijsko) na coni 2'},
-    135: {"text1": 'Alarm okvara na razvlaževalcu cone 3', "text2": 'Alarm na razvlaževalcu cone 3', "action": 'Sistem ne izvede razvlaževanja dotične cone.', "comment": 'Anomalija, ki izvira z razvlaževalca (opcijsko) na coni 3'},
-    137: {"text1": 'Alarm sistem ponastavljen - Ponovno zaženite sistem', "text2": 'Po posegu ponastavitve, ki se izvede preko kontrolne plošče, se sproži alarm, saj je treba izvesti ponovni zagon sistema', "action": 'Izklopite in vklopite sistem', "comment": 'Ko je ponastavitev privzetih parametrov izvršena, sistem potrebuje ponovni zagon'},
-    138: {"text1": 'V teku je ogrevanje estriha', "text2": 'Funkcija ogrevanja estriha je v teku', "action": '', "comment": ''},
-    139: {"text1": 'V teku je odzračevanje sistema', "text2": 'Funkcija odzračevanja sistema je v teku', "action": '', "comment": ''},
-    177: {"text1": 'Alarm za maksimalni čas za pripravo sanitarne vode', "text2": 'Zahteva za sanitarno vodo je bila izvršena, presežen je bil maksimalni določeni čas', "action": 'Sistem nadaljuje z delovanjem, a rezultati niso optimalni', "comment": 'Priprava tople sanitarne vode ni izvedena v za to določenem času (5 ur)'},
-    178: {"text1": 'Cikel proti legioneli ni uspešen', "text2": 'Cikel proti legioneli ni bil uspešno zaključen v za to določenem času.', "action": 'Pritisnite gumb Ponastavi ', "comment": 'Cikel proti legioneli ni bil uspešno izveden v za to določenem času (3 ure)'},
-    179: {"text1": 'Anomalija na tekoči sondi', "text2": 'Sonda za tekočo fazo je izven razpona.', "action": 'Sistem se ne zažene. obrnite se na usposobljeno podjetje (na primer na pooblaščeno servisno-tehnično službo Immergas).', "comment": 'Kartica zazna anomalijo na sondi za tekočo fazo'},
-    181: {"text1": 'Izguba komunikacije z daljinskim upravljalnikom cone 2', "text2": 'Ni kontakta med kartico in daljinskim upravljanjem cone 2', "action": 'Prekinite in ponovno vzpostavite napetost hidravličnega modula. Če daljinski upravljalnik tudi ob ponovnem vklopu ni zaznan, sistem preide na lokalno delovanje oziroma na uporabo krmilnih mehanizmov na nadzorni plošči. V tem primeru funkcije “Ogrevanje”, ni mogoče aktivirati.', "comment": 'Pojavi se takrat, ko povezava z daljinskim upravljalnikom ni združljiva, ali v primeru prekinitve komunikacije med hidravličnim modulom in daljinskim upravljalnikom CARV2 druge cone.'},
-    182: {"text1": 'Alarm na motokondenzacijski enoti', "text2": 'Prihaja do alarma na motokondenzacijski enoti', "action": 'Sistem ne deluje, glejte anomalije na kondenzacijski enoti in pripadajoč priročnik z navodili', "comment": 'Opozorjeno je na anomalijo na kondenzacijski enoti'},
-    183: {"text1": 'Alarm motokondenzacijska enota v testnem načinu', "text2": 'Motokondenzacijska enota v TESTNEM NAČINU', "action": 'Tekom te faze ni mogoče zadostiti zahtevam za klimatizacijo prostora in pripravo tople sanitarne vode', "comment": 'Opozorjeno je, da je kondenzacijska enota v načinu test'},
-    184: {"text1": 'Alarm za timeout komunikacije z zunanjo enoto', "text2": 'Izguba komunikacije z motokondenzacijsko enoto', "action": 'Preverite električno povezavo med enotama', "comment": 'Opozorjeno je na anomalijo zaradi težave pri komunikaciji med notranjo enoto in kondenzacijsko enoto'},
-    185: {"text1": 'Alarm komunikacije varnostnega modula', "text2": 'Izguba komunikacije z varnostnim - modulom', "action": 'Preverite povezavo med komponentami', "comment": 'Težava pri komunikaciji med regulacijsko kartico in kartico za vžig'},
-    186: {"text1": 'Anomalija: visoka napetosti vžigala', "text2": 'Varnostni modul: prišlo je do anomalije na napetosti vžigala', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Opozorjeno je na anomalijo na kartici za vžig'},
-    187: {"text1": 'Alarm sonda na povratku motokondenzacijske enote', "text2": 'Sonda na povratku motokondenzacijske enote je izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi NTC na povratku na toplotni črpalki.'},
-    188: {"text1": 'Zahteva je izven delovnega razpona', "text2": 'Izvedena zahteva ni izvršena, saj zunanji pogoji ne omogočajo aktivacije motokondenzacijske enote', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Narejena je zahteva po ogrevanju hlajenju, ko je zunanja temperatura izven delovnih omejitev '},
-    189: {"text1": 'Alarm za timeout komunikacije s komunikacijsko kartico', "text2": 'Izguba komunikacije s komunikacijsko kartico za motokondenzacijsko enoto', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'V primeru prekinitve komunikacije med elektronskimi karticami, je opozorjeno na anomalijo'},
-    191: {"text1": 'Prekinitev komunikacije RF proti CAR v2 RF cona 2', "text2": 'Komunikacija med oddajniško bazo in CARv2 RF cone 2 je bila prekinjena', "action": 'Preverite delovanje brezžičnega CAR, preverite napolnjenost baterij (glejte pripadajočo knjižico z navodili).', "comment": 'V primeru prekinjene komunikacije med notranjo enoto in brezžično verzijo CAR druge cone, se opozori na anomalijo, od tega trenutka naprej je mogoče nadzirati sistem le preko kontrolnega panela same notranje enote'},
-    192: {"text1": 'Napaka sonde na dovodu motokondenzacijske enote', "text2": 'Sonda na dovodu motokondenzacijske enote je izven razpona', "action": 'Če napake ne bi mogli odpraviti, se obrnite na usposobljenega tehnika (na primer na servisno-tehnično službo družbe Immergas).', "comment": 'Kartica zazna anomalijo na sondi NTC na dovodu na toplotni črpalki'},
-    193: {"text1": 'Aparat v načinu test', "text2": 'Aparat nadzira zunanja naprava preko protokola Opentherm', "action": 'Sistem še naprej pravilno deluje', "comment": 'Opozorjeno je, da je aparat v načinu test'},
-    194: {"text1": 'Audax Pro onemogočena', "text2": 'Motokondenzacijska enota Audax Pro je bila onemogočena', "action": 'Sistem še naprej pravilno deluje', "comment": 'Opozorjeno je, da je bila kondenzacijska enota onemogočena preko pripadajočega vhoda na priključni plošči'},
-    195: {"text1": 'Anomalija na sondi nizke temperature v tekoči fazi', "text2": 'Temp. sonde za tekočo fazo je prenizka', "action": 'Preverite dobro delovanje hladilnega tokokroga', "comment": 'Zaznana je prenizka temperatura v tekoči fazi'},
-    196: {"text1": 'Blokada temp. na dovodu, previsoka', "text2": 'Zaznana je previsoka temperatura na povratnem tokokrogu toplotne črpalke.', "action": 'Preverite dobro delovanje hladilnega tokokroga', "comment": 'Zaznana je previsoka temperatura na dovodnem tokokrogu toplotne črpalke'},
-}
@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: tr)"""
-
-immergas_labels = {
-    'default': {"text1": 'Bilinmeyen genel arıza ', "text2": 'Hata veya seçilen kart tablosunu kontrol edin', "action": 'Hata veya seçilen kart tablosunu kontrol edin', "comment": 'İlgili herhangi bir not yok'},
-    0: {"text1": 'SİSTEM OK', "text2": 'Sistem doğru bir şekilde çalışıyor', "action": 'Herhangi bir işlem gerekmiyor', "comment": 'Herhangi bir arıza yok'},
-    1: {"text1": 'Ateşleme eksikliği engeli', "text2": 'Son ateşleme denemesi sonunda alev tespit edilmedi', "action": 'Reset düğmesine basın.', "comment": 'Oda ısıtma veya sıcak kullanma suyu üretimi talebi durumunda önceden belirlenmiş süre içinde ateşlenmiyor. Cihazın ilk kez çalıştırılmasında veya uzun bir süre çalıştırılmadan bekledikten sonra ateşlemenin kilitlenmesine karşı  müdahalede bulunulması gerekebilir.'},
-    2: {"text1": 'Emniyet termostatı arızası (aşırı ısınmadan ötürü)', "text2": 'Emniyet termostatı müdahalesi', "action": 'Reset düğmesine basın.', "comment": 'Normal çalışma esnasında herhangi bir arızadan ötürü içeride aşırı ısınma oluşursa kombi kilitlenir.'},
-    3: {"text1": 'Termostat duman engeli', "text2": 'Duman termostatı müdahalesi', "action": 'Reset düğmesine basın. (Nike versiyonu)/ P.14 parametresini doğru bir şekilde konfigüre ediniz. Gerekirse Reset tuşuna basınız (Star versiyonu)', "comment": 'Normal çalışma esnasında herhangi bir arızadan ötürü duman aşırı ısınırsa kombi kilitlenir. (Nike versiyonu)/ P.14 parametresi konfigürasyon hatalı (Star versiyonu)'},
-    4: {"text1": 'Bağlantıların dayanıklılık engeli', "text2": 'Gaz vanası pilotaj devresinde bir arıza tespit edildi', "action": 'Kombi çalışmıyor. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Elektronik kart, gaz vanası beslemesinde bir arıza tespit ediyor. Bu bağlantıyı denetleyin. (arıza sadece talep üzerine tespit  edilir ve görüntülenir).'},
-    5: {"text1": 'Çıkış sensöründe arıza', "text2": 'Çıkış sensörü arızası', "action": 'Kombi çalışmıyor. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart NTC çıkış sensöründe bir arıza tespit eder.'},
-    6: {"text1": 'Kullanma suyu sensöründe arıza', "text2": 'Sıcak su sensörü aralık dışında rezistif  bir değer sunar', "action": 'Kombi sıcak su üretmeye devam eder fakat iyi verim alınamaz. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart NTC sıcak su sensöründe bir arıza tespit eder.'},
-    8: {"text1": 'Maksimum reset sayısı', "text2": 'Entegre kart tarafından izin verilen maksimum reset sayısına ulaşıldığını gösterir.', "action": 'Dikkat: Arızayı üst üste en fazla 5 defa resetlemek mümkündür, ardından en azından bir saat boyunca fonksiyon durdurulur ve en fazla 5 deneme olmak üzere, saat başına bir deneme hakkı daha kazanılır. Cihazın beslemesi açılıp kapatılmak suretiyle 5 deneme olanağı daha elde edilir.', "comment": 'Hali hazırda gerçekleştirilmiş reset sayısıdır.'},
-    10: {"text1": 'Tesisat basıncı yetersiz', "text2": 'Sistem presostat kontağı açık', "action": 'Kombinin manometresini kontrol edin, doğru basınç değerinin 1 ila 1,2 bar arasında olması gerekmektedir, gerekli olması halinde doğru basıncı sağlayınız.', "comment": 'Kombinin doğru bir şekilde çalışmasını sağlamak için ısıtma devresinde su basıncı tespit edilemiyor.'},
-    11: {"text1": 'Duman presostatında arıza', "text2": 'Duman presostatı veya fanda olası arıza', "action": 'Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Normal çalışma koşullarına geri dönüldüğünde resete gerek kalmadan kombi tekrar çalışmaya başlar'},
-    12: {"text1": 'Boyler sensörü arızası', "text2": 'Boyler sensörü aralık dışında rezistif  bir değer sunar', "action": 'Kombi sıcak su üretmiyor. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart, ısıtıcı sensöründe bir arıza tespit etti.'},
-    13: {"text1": 'Hava/duman debi ölçeri aralık ötesinde', "text2": ' Hava/duman sinyali aralık ötesinde veya duran fan ile kontrol çok yüksek bir sinyal okuyor', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Fan durur halde, hava/duman kontrolü çok yüksek bir sinyal okuyor (yapışmış presostat temasları)'},
-    15: {"text1": 'Konfigurasyon hatası', "text2": 'Kart, konfigürasyonu ile giriş sinyalleri arasında bir tutarsızlık olduğunu tespit etti.', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır. Kombinin doğru yapılandırılmış olduğundan emin olun. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart bir arıza veya kombi elektrik kablolarında bir tutarsızlık tespit etti , kombi çalışmıyor.'},
-    16: {"text1": 'Fan arızası', "text2": 'Fan, besleme olmadığında dönüyor görünüyor veya besleme olduğunda duruyor görünüyor.', "action": 'Reset (1) düğmesine basın. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Fanın elektronik veya mekanik bir arızası olması halinde görülür.'},
-    17: {"text1": 'Fan hızı hatalı', "text2": 'Fan devir sayısı doğru aralık dışında', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Fan devir sayısı hatalı'},
-    20: {"text1": 'Parazit alev engelleme', "text2": 'Normal olmayan alev tespit edildi', "action": 'Reset (1) düğmesine basın. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Gösterge devresinin dağılması veya alev kontrol anormalliklerinde görülür.'},
-    23: {"text1": 'Geri dönüş sondası anormalliği', "text2": 'Geri dönüş sondası arızası', "action": 'Kombi çalışmıyor. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart NTC çıkış sensöründe bir arıza tespit eder.'},
-    24: {"text1": 'Tuş takımı anormalliği', "text2": 'Kontrol panelindeki tuşlara sürekli basıldığı tespit edildi', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart tuş takımında bir arıza tespit etti.'},
-    25: {"text1": 'Duman sensör engeli / CRC (TERA) sekmesi', "text2": 'Duman sıcaklığı aralık dışında / bozulmuş bellek (TERA)', "action": 'Reset düğmesine basın', "comment": 'Yüksek duman oranı, muhtemelen sirkülatör engeli veya su eksikliği / bozulmuş bellek'},
-    27: {"text1": 'Yetersiz Sirkülasyon', "text2": 'Birincil devredeki sirkülasyonun yetersiz olmasından dolayı kombinin aşırı ısınması', "action": 'Reset tuşuna basınız', "comment": 'Isıtma devresinde kesilme olup olmadığını ve/veya sirkülasyon cihazının doğru çalıştığını kontrol ediniz'},
-    28: {"text1": 'Kullanım suyu sızıntısı', "text2": 'Kalorifer konumunda çalışma esnasında kullanım suyunun ısısında artış gözlemlenmesi durumunda kombi hata bildirir ve eşanjörde kireç birikimi oluşmasına engel olmak için kalorifer ısısını düşürür.', "action": 'Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Tüm kullanım suyu musluklarının kapalı olduğunu ve sızıntı olmadığını kontrol ediniz, ayrıca da tesisatta kaçak olmadığını kontrol ediniz. Kullanım suyu devresi üzerindeki şartların düzeltilmesini müteakiben kombi normal çalışma düzenine geri döner'},
-    29: {"text1": 'Duman sondası arızası', "text2": 'Duman sensörü aralık dışında rezistif  bir değer sunar', "action": 'Kombi çalışmıyor. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart, duman sensöründe bir arıza tespit etti.'},
-    31: {"text1": 'CARV2 ile haberleşme yok', "text2": 'Kart ile uzaktan kumanda arasında iletişim yok', "action": 'Kesin ve yeniden güç verin kombiye. Eğer yeniden çalıştırmada Uzaktan Kumanda belirtilmezse kombi lokal işlem moduna geçer böylelikle kombide halihazırda mevcut kumandaları kullanır. Bu durumda kombi “Isıtma” işlevini harekete geçirmek mümkün değildir.', "comment": 'Uygun olmayan bir uzaktan kumandaya bağlanması halinde oluşur, veyahut da kombi ile CARV2 arasındaki bir iletişim kaybı halinde saptanır.'},
-    32: {"text1": 'Bölge 2 sensörü hatası düşük ısı', "text2": 'Bölge 2 gönderme sensörü aralık dışı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart bölge 2 düşük ısı sensöründe bir hata tespit ediyor sistem ilgili bölgede işleyemez'},
-    33: {"text1": 'Bölge 3 sensör hatası düşük ısı', "text2": 'Bölge 3 sevkiyat sensörü aralık dışı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart bölge 2 düşük ısı sensöründe bir hata tespit ediyor sistem ilgili bölgede işleyemez'},
-    36: {"text1": 'IMG Bus bağlantısı koptu', "text2": 'IMG Bus protokolünde haberleşme kaybı', "action": 'Kombi ısıtma taleplerini karşılamıyor', "comment": 'Kombi ünitesindeki, alan kartı (opsiyonel) veya IMG Bus’daki bir arıza nedeniyle çeşitli bileşenler arasındaki haberleşme kesilir.'},
-    37: {"text1": 'Alçak güç kaynağı gerilimi', "text2": 'Kartın besleme gerilimi izin verilen limitlerin altındadır', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Elektrik voltajı, kombinin doğru çalışması için öngörülen sınırların altına indiğinde görülür.'},
-    38: {"text1": 'Alev sinyali kaybı', "text2": 'Kart, doğru alev akımı değeri bulduğunda alev akımı düşüşü sinyali verir.', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Kombinin doğru şekilde ateşlendiği ve brülör alevinin beklenmedik bir sönüşü meydana geldiği durumlarda görülür; yeniden ateşleme denemesi yapılır ve kombinin normal koşullarının sağlanması durumunda reset edilmesine gerek duyulmaz.'},
-    39: {"text1": 'Güneş kollektörü sensör hatası', "text2": 'Duman sensörü aralık dışında dirençli bir değer sunuyor', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart güneş kollektör sensöründe bir anormallik saptıyor, kombi, güneş pompası çalışmadığından sıcak kullanım suyu ısıtma için güneş enerjisi tedariki olmaksızın düzenli olarak çalışmaya devam ediyor'},
-    40: {"text1": 'Güneş depolama sensör hatası', "text2": 'Güneş biriktirme sensörü aralık dışında dirençli bir değer sunuyor', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart güneş biriktirme sensöründe bir hata saptıyor, kombi, güneş pompası çalışmadığından sıcak kullanım suyu ısıtma için güneş enerjisi tedariki olmaksızın düzenli olarak çalışmaya devam ediyor'},
-    41: {"text1": 'Güneş kollektör sıcaklığı', "text2": 'Güneş kollektörü ayarlanmış maksimum sıcaklığı aştı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Güneş kollektörü sıcaklığı ayarlanmış maksimum limiti aştığında görülür'},
-    42: {"text1": 'Güneş depolaması üzerinde yüksek sıcaklık', "text2": 'Güneş depolama ayarlanmış maksimum sıcaklığı aştı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Güneş depolamadaki su sıcaklığı ayarlanmış maksimum limiti aştığında görülür'},
-    43: {"text1": 'Alev sinyal kaybı nedeniyle kilit', "text2": 'Ard arda birden fazla çalışmada alev sinyali kaybı.', "action": 'Reset düğmesine basın, başlamadan önce kombi havalandırma sonrası bir çevrim yapar.', "comment": 'Önceden belirlenen bir süre içinde arda arda birden fazla “Alev sinyal kaybı” hatası çıktığında görülür.'},
-    44: {"text1": 'Depolama için kilit aşılır maksimum diyafram açılışlar yakından aralıklı gaz vanası.', "text2": "Gaz vanasının toplam süre birikimi izin verilen maksimum değerden daha fazla alev algılama ve 'olmadan açıldı.", "action": 'Reset (1) düğmesine basın.', "comment": 'Gaz valfının kombinin açılmadan normal işleyişi için öngörülen süre boyunca açık kalması halinde görülür.'},
-    45: {"text1": 'dT yüksek', "text2": 'Gönderme ve geri dönüş arasında ölçülen sıcaklık farkı ≥ di 40°C.', "action": 'Yoğuşumlu modüle gelebilecek olası zararları önlemek için brülörün gücünü sınırlandırılır, doğru ΔT değeri sağlandığında kombi normal çalışmasına döner. Kombide su sirkülasyonu olup olmadığını, sirkülasyon pompasının tesisatın ihtiyaçlarına uygun şekilde konfigüre edilip edilmediğini ve geri dönüş sensörsının doğru şekilde çalışıp çalışmadığını kontrol edin.', "comment": 'Kombi sistem gönderme sönsörü ve geri dönüş sensörü arasında öngörülmeyen ve ani bir dT yükselmesi tespit etti.'},
-    46: {"text1": 'Düşük sıcaklık termostat müdahalesi / Hatalı kablo bağlantı konfigürasyonu/kart', "text2": 'Kombiden DIM v2’ye gönderme bağlantısı üzerindeki güvenlik termostatı (sadece Düşük Sıcaklıkta işleyen) yüksek sıcaklıklara ulaştı. / Hatalı kablo bağlantısı veya yedek kart kullanımı', "action": 'Bu durumda, yeterli bir soğutma sonrasında termostat resetlenebilir (kullanım kılavuzuna bakınız). / Bloke olma veya arızanın devam etmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Normal işletim sırasında, arıza nedeniyle düşük sıcaklık çıkışında aşırı sıcaklık artışı meydana gelirse kombi bloke olur. / Hatalı kablo bağlantısı veya yedek kart kullanımı.'},
-    47: {"text1": 'Düşük brülör gücü', "text2": 'Baca gazı sıcaklığı kartının yüksek bir değere ulaşırsa duman devresine hasarı sınırlamak amacıyla, brülör tarafından sağlanan gücü azaltır.', "action": '(1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Eğer yakalanan yüksek baca gazı sıcaklığı kombi kendi zarar görmesini önlemek için çıkış gücü azaltır.'},
-    48: {"text1": 'Tesisat tarafı sevkiyat sensörü arızası', "text2": 'Tesisat tarafı sevkiyat sensörü aralık dışı dirençli bir değer sunuyor', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Tesisat tarafı sevkiyat sensörünün bağlı olmadığı veya arızalı olduğu durumda hata bildirilir'},
-    49: {"text1": 'Dönüş sensöründe yüksek sıcaklık engeli', "text2": 'Dönüş sensörü tarafından ölçülen sıcaklık yüksek', "action": 'Kombide doğru sirkülasyonu ve üç yollu valfin çalışıp çalışmadığını kontrol edin.', "comment": 'Eşanjör dönüş devresinde aşırı yüksek bir sıcaklığa ulaşıldığında meydana gelir'},
-    50: {"text1": 'Dış sensörde hata', "text2": 'Duman sensörü aralık dışında dirençli bir değer sunuyor', "action": 'Dış sensör bağlantısını denetleyin. Sistem çalışmaya devam eder', "comment": 'Harici sensörün bağlı olmadığı veya arızalı olduğu durumda hata bildirilir'},
-    51: {"text1": 'CAR Wireless haberleşmesinin düşmesi', "text2": 'CAR v2 RF ile temel verici arasındaki haberleşme düştü.', "action": 'CAR Wireless çalışmasını denetleme , pil şarjını kontrol edin (bakınız talimat kitapçığı). ', "comment": 'Kombi ve CAR  arasında iletişim arızası durumunda Wireless versiyonu belirtilir anomali, şu andan itibaren kontrol belgili tanımlık sistemi sadece Kombi kontrol paneli.'},
-    54: {"text1": 'Puffer sensörü hatası', "text2": 'Puffer sensörü aralık dışında dirençli bir değer sunuyor', "action": 'Puffer modu devre dışı bırakılır', "comment": 'Puffer sensörünün bağlı olmadığı veya arızalı olduğu durumda hata bildirilir'},
-    55: {"text1": 'Bölge 1 sevkiyat sıcaklık sensörü hatası', "text2": 'Bölge 1 sevkiyat sensörü aralık dışında dirençli bir değer sunuyor', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart bölge 1 düşük sıcaklık sensöründe bir hata saptadı sistem ilgili bölgede çalışamaz.'},
-    58: {"text1": 'Audax Hatası', "text2": 'Sisteme bağlı AUDAX ısı pompası tarafından hata sinyali', "action": 'Isı pompası oda ısıtma ve soğutma isteklerini yerine getiremiyor, bağlantılar eski hallerine getirildiğinde sistemi kapatmak ve açmak gereklidir', "comment": 'Audax ısı pompasında hata, hata türünü doğrudan ısı pompası ekranında kontrol edin'},
-    59: {"text1": 'Elektrik enerjisi ağ frekans bloğu', "text2": 'Elektronik kart güç kaynağı ağdaki anormal frekans tespit etti. ', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart, Güç frekansı bağdaştırıcısını algılar anormal elektriksel güç kaynağı'},
-    60: {"text1": 'Bloke sirkülatör arızası', "text2": 'Modülasyon pompa durdurulur.', "action": 'İlgili paragrafta belirtildiği gibi sirkülatörün serbest kalmasını deneyin. Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Engellenen rotor elektrik arızası: Pompa aşağıdaki nedenlerden biri için durdurulur.'},
-    61: {"text1": 'Sirkülatörde hava mevcudiyeti', "text2": 'Modüle pompa Havada algılanan işlem için durdurulur.', "action": 'Sirkülatör ve ısıtma devresindeki havanın boşaltılmasını sağlayın. Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Sirkülatör içinde hava saptandı; sirkülatör çalışamaz.'},
-    62: {"text1": 'Kalibrasyon isteğini tamamlar', "text2": 'Kart yanma kontrol parametreleri doğru konfigürasyona sahip değildir. ', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Elektronik yönetim kurulumunda kalibrasyon yokluğunu algılar. Elektronik kartın değiştirilmesi durumunda kontrol edin veya parametreler bölümünde bir varyasyon hava ve gaz için gerektirir “kalibrasyon tamamlandı”'},
-    63: {"text1": 'Tesisat dönüş sensörü hatası', "text2": 'Dönüş sensörü aralık dışında dirençli bir değer sunuyor', "action": 'Kombi bağlı harici sistemler ile hiçbir entegrasyon olmadan işlemeye devam eder', "comment": 'Dönüş sensörünün bağlı olmadığı veya arızalı olduğu durumda hata bildirilir'},
-    67: {"text1": 'Güneş tesisatı basınç anahtarı hatası', "text2": 'Tesisat basınç anahtarı açık, olası akışkan eksikliği', "action": 'Güneş sirkülasyon grubunun manometresinde basıncın doğru değerde olduğunu kontrol edin', "comment": 'Güneş devresinde bir basınç düşmesi nedeniyle basınç anahtarı termal güneş devresinin işleyişini engelliyor'},
-    70: {"text1": 'Prob yer değiştirmiş', "text2": 'Kombi kablo bağlantısında hata olması sırasında hata tespit edilir', "action": 'Kombi çalışmıyor. Tutukluk veya arıza devam ederse yetki bir firmayı aramak gerekir (örneğin Immergas Teknik Yardım Servisi).', "comment": 'Besleme ve tahliye probunun bağlantısını kontrol ediniz.'},
-    72: {"text1": 'Hızlı kalibrasyon isteği', "text2": 'Kart, bazı yanma kontrol parametreleri doğru konfigürasyona sahip değildir.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Bazı parametre değişikliği algılar gerektirir “hızlı kalibrasyon”'},
-    73: {"text1": 'Yüksek akış sensör ofset algılandı ve emanet sensörsı dır.', "text2": 'Teslimat sensörlar yüksek varyansı var.', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Bağdaştırıcı bir anomali algılar NTC sıcaklık okumunda ve nedenleri olabilir: hatalı sensörsı, yanlış konumlandırma, dolaşım yetersizliği, su yan ısı eşanjörü birincil tıkanma.'},
-    74: {"text1": 'Akış sensörü hatası', "text2": 'Emniyet akış sensörü aralığının dışında bir direnç değer sağlar.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Bağdaştırıcı bir anomali tespit eder akış NTC akış sensörü sensörsında'},
-    75: {"text1": 'NTC sensörü bloğu arızalı', "text2": 'Bir veya iki devre besleme ve tahliye probunun da olası arızalanması', "action": 'Kombi çalışmıyor. Tutukluk veya arıza devam ederse yetki bir firmayı aramak gerekir (örneğin Immergas Teknik Yardım Servisi).', "comment": 'Emniyet probu sensörü artan yüksek sıcaklığa neden olur'},
-    76: {"text1": 'Besleme probu veya tahliye probu gelişi', "text2": 'Her iki besleme ve tahliye probunda da çalışma bozukluğu tespit edilir', "action": 'Kombi çalışmıyor. Tutukluk veya arıza devam ederse yetki bir firmayı aramak gerekir  (örneğin Immergas Teknik Yardım Servisi).', "comment": 'Isı gerektiğinde besleme ve tahliye probu arasında ayarlanana göre daha büyük fark'},
-    77: {"text1": 'Yakıt kontrolünde anomali', "text2": 'Valf akımı aralığın dışında gaz tespit edildi.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Gaz vanasında range dışı akım tespit edildi.'},
-    78: {"text1": 'Yakıt kontrolünde anomali', "text2": 'Algılandı yüksek gaz vanası akımı.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Gaz vanasında yüksek bir akım tespit edildi.'},
-    79: {"text1": 'Yakıt kontrolünde anomali', "text2": 'Valf akımı düşük gaz tespit edildi.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Küçültülmüş gaz vanası üzerinde yüksek bir akım tespit edildi.'},
-    80: {"text1": 'Elektronik kartı arızasından engelleme', "text2": 'Gaz veya Klape kurulu sorunları için gaz vanası elektronik sürücüsü Tespit edilen hata.', "action": 'Reset düğmesine basın.', "comment": 'Elektronik kart hatası oluştuğunda ortaya çıkar vanayı kontrol eden.'},
-    84: {"text1": 'Yanma anomali -devam eden güç azaltma', "text2": 'Alçak basınç besleme gaz vanası benzer Gözlenen koşullar.', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Tespit eder düşük basınç gaz ağ kaynağında. Bu nedenle cihazın gücünü sınırlanır ve sorun bildir.'},
-    85: {"text1": 'Yanma sonrası problem blokesi', "text2": 'Olası gaz valfı, elektrot veya elektronik kart problemi', "action": 'Reset (1) düğmesine basın. Kilitlenme veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Gaz vanasının kapanmasından sonra alev var'},
-    87: {"text1": 'Gaz vanası denetim bloğu', "text2": 'Gaz vanası kontrolünde arıza tespit etti.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Gaz vanasını kontrol eden aksamlardan birisinde bir çalışma bozukluğu tespit edildi. '},
-    88: {"text1": 'Gaz vanası denetim bloğu', "text2": 'Gaz vanası kontrolünde arıza tespit etti.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Gaz vanasını kontrol eden aksamlardan birisinde bir çalışma bozukluğu tespit edildi. '},
-    89: {"text1": 'Kararsız yakıt sinyali', "text2": 'Yanma sinyalinin algılandı istikrarsızlık', "action": 'Kombi çalışmaya devam ediyor.', "comment": 'Alev kararsız olduğu ortaya çıkıyor: baca gazı devridaim varlığı, kararsız gaz basıncı, fan hızı kararsız veya sistemin bir arıza nedeniyle.'},
-    90: {"text1": 'Yakıt dışarı sınırı sinyali', "text2": 'Aut algılandı yanma sinyali.', "action": 'Kombi çalışmaya devam ediyor.', "comment": 'Yanma sinyali, uzun süreli bir zaman için öngörülen ayar menzil dışı tespit etti.'},
-    91: {"text1": 'Hatalı ateşleme kiliti', "text2": 'Kartın, brülörün en iyi şekilde ateşlenmesini sağlamak için tüm olası eylemleri tükendi.', "action": 'Reset düğmesine basın.', "comment": 'Kartın, brülörün en iyi şekilde ateşlenmesini sağlamak için tüm olası eylemleri tükendi.'},
-    92: {"text1": 'Fan hızı ayarını limitler', "text2": 'Kart maksimum fan hızı düzeltmesini ulaşmıştır.', "action": 'Kombi çalışmaya devam ediyor.', "comment": 'Sistem fanın tüm olası devir sayısı düzeltmelerini tüketti.'},
-    93: {"text1": 'Yakıt dışarı sınırı sinyali', "text2": 'Aut algılandı yanma sinyali.', "action": 'Kombi çalışmaya devam ediyor.', "comment": 'Yanma sinyali, uzun süreli bir zaman için öngörülen ayar menzil dışı tespit etti.'},
-    94: {"text1": 'Yakıtta anormallik', "text2": 'Yanma veya yanma kontrol sisteminin neden algılandı sorun.', "action": 'Normal koşulların eski hallerine getirilmeleri ile kombi resetlemeye gerek kalmadan tekrar çalışır.', "comment": 'Yanma kontrolü üzerinde bir sorunla karşılaşılır bu neden olabilir: düşük gaz basıncı, baca gazı devridaim, gaz vanası veya hatalı elektronik kartı'},
-    95: {"text1": 'Süreksizlik yakıt sinyali', "text2": 'Elektrik bağlantıları veya sinyal dağılım problemlerine yanma sinyali algılandı.', "action": 'Kombi çalışmaya devam ediyor.', "comment": 'Sistem bir süreksizlik sinyali algılar.'},
-    96: {"text1": 'Engellenen bacalar', "text2": 'Kombi montaj tespit edilen yüksek tıkanıklığı.', "action": 'Kombi çalışmıyor. (1) Blok veya arızanın sürmesi halinde uzman bir firmaya müracaat edin (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Duman borusu sisteminde bir obstrüksiyon oluşur ortaya çıkar ise.'},
-    98: {"text1": 'Blok no maksimum hata software', "text2": 'Elektronik kart doğru bir şekilde çalışmıyor.', "action": 'Reset düğmesine basın.', "comment": 'En fazla hata sayısı ulaşır software kabul edilmektedir .'},
-    99: {"text1": 'Genel blok', "text2": 'Elektronik kart doğru bir şekilde çalışmıyor.', "action": 'Reset düğmesine basın.', "comment": 'Kombide bir arıza tespit edildi.'},
-    101: {"text1": 'Audax off-line alarmı', "text2": 'Isı pompası ile iletişim kaybı', "action": 'Isı pompası oda ısıtma ve soğutma isteklerini yerine getiremiyor, bağlantılar eski hallerine getirildiğinde sistemi kapatmak ve açmak gereklidir', "comment": 'İletişimin kopması, hatalı bağlantı veya kapalı ısı pompası halinde kombi ısı pompasını saptamıyor'},
-    102: {"text1": 'Bölge 1 genişleme off-line alarmı', "text2": 'Bölge 1 genişleme ile iletişim kaybı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Bölge 1 ile iletişim arızası'},
-    103: {"text1": 'Bölge 2 genişleme off-line alarmı', "text2": 'Bölge 2 genişleme ile iletişim kaybı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Bölge 2 ile iletişim hatası'},
-    104: {"text1": 'Bölge 3 genişleme off-line alarmı', "text2": 'Bölge 3 genişleme ile iletişim kaybı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Bölge 3 ile iletişim hatası'},
-    106: {"text1": 'Kullanım suyu sensör alarmı', "text2": 'Kombi ile entegrasyon ve kullanım suyunda ayrı idare durumunda yönetici tarafından kontrol edilen boyler sensörü aralık dışı dirençli bir değer sunuyor', "action": 'Sistem ısı pompası ile sıcak kullanım suyu üretemiyor. Sıcak kullanım suyunun üretimi kombi tarafından temin edilir', "comment": 'Kart boyler sensöründe bir hata tespit etti'},
-    120: {"text1": 'Bölge 1 nem giderme için yüksek set alarmı', "text2": 'Talep edilen bölge 1 hesaplanan setpoint değeri nem giderme için çok yüksek', "action": 'Hesaplanan sevkiyat seti nem giderici tarafından kabul edilen limitin üzerinde. Ortamı soğutun ve çiğ sıcaklığının kabul edilebilir değerlere dönmesini bekleyin', "comment": 'Nem giderme için hesaplanan soğutma sevkiyat seti 1. bölgede ayarlanan limitin üzerinde'},
-    121: {"text1": 'Bölge 1 cihaz offline alarmı', "text2": 'Uzaktan kumanda veya bölge 1 uzaktan kontrolü offline görünüyor', "action": 'Uzaktan kumandanın açık olduğunu kontrol edin', "comment": 'Bölge kontrolü ile iletişim saptanmadı. Bölgenin ısı ayarlamasını yapmak mümkün değil'},
-    122: {"text1": 'Bölge 2 cihaz offline alarmı', "text2": 'Uzaktan kumanda veya bölge 2 uzaktan kontrolü offline görünüyor', "action": 'Uzaktan kumandanın açık olduğunu kontrol edin', "comment": 'Bölge kontrolü ile iletişim saptanmadı. Bölgenin ısı ayarlamasını yapmak mümkün değil'},
-    123: {"text1": 'Bölge 3 cihaz offline alarmı', "text2": 'Uzaktan kumanda veya bölge 3 uzaktan kontrolü offline görünüyor', "action": 'Uzaktan kumandanın açık olduğunu kontrol edin', "comment": 'Bölge kontrolü ile iletişim saptanmadı. Bölgenin ısı ayarlamasını yapmak mümkün değil'},
-    125: {"text1": 'Bölge 1 oda sıcaklık sensörü hatası', "text2": 'Bölge 1 oda sıcaklığı sensörü aralık dışı', "action": 'Sıcaklık dışında bölge için çiğ noktası hesaplanmıyor', "comment": 'Bölge 1 oda sıcaklığı sensöründe (opsiyonel) hata mevcut. Bölgenin ısı ayarlamasını yapmak mümkün değil'},
-    126: {"text1": 'Bölge 2 oda sıcaklığı sensör hatası', "text2": 'Bölge 2 oda sıcaklığı sensörü aralık dışı', "action": 'Sıcaklık dışında bölge için çiğ noktası hesaplanmıyor', "comment": 'Bölge 2 oda sıcaklığı sensöründe (opsiyonel) hata mevcut. Bölgenin ısı ayarlamasını yapmak mümkün değil'},
-    127: {"text1": 'Bölge 3 oda sıcaklığı sensör hatası', "text2": 'Bölge 3 oda sıcaklığı sensörü aralık dışı', "action": 'Sıcaklık dışında bölge için çiğ noktası hesaplanmıyor', "comment": 'Bölge 3 oda sıcaklığı sensöründe (opsiyonel) hata mevcut. Bölgenin ısı ayarlamasını yapmak mümkün değil'},
-    129: {"text1": 'Nem sensörü hatası bölge 1', "text2": 'Bölge 1 oda nemi sensörü aralık dışı', "action": 'Nemin dışında bölge için çiğ noktası hesaplanmıyor', "comment": 'Bölge 1 nem sensöründe (opsiyonel) hata mevcut. Bölgenin nem kontrolünü yapmak mümkün değil'},
-    130: {"text1": 'Nem sensörü hatası bölge 2', "text2": 'Bölge 2 oda nemi sensörü aralık dışı', "action": 'Nemin dışında bölge için çiğ noktası hesaplanmıyor', "comment": 'Bölge 2 nem sensöründe (opsiyonel) hata mevcut. Bölgenin nem kontrolünü yapmak mümkün değil'},
-    131: {"text1": 'Nem sensörü hatası bölge 3', "text2": 'Bölge 3 oda nemi sensörü aralık dışı', "action": 'Nemin dışında bölge için çiğ noktası hesaplanmıyor', "comment": 'Bölge 3 nem sensöründe (opsiyonel) hata mevcut. Bölgenin nem kontrolünü yapmak mümkün değil'},
-    132: {"text1": 'Bölge 2 nem giderme için yüksek set alarmı', "text2": 'Talep edilen bölge 2 hesaplanan setpoint değeri nem giderme için çok yüksek', "action": 'Hesaplanan sevkiyat seti nem giderici tarafından kabul edilen limitin üzerinde. Ortamı soğutun ve çiğ sıcaklığının kabul edilebilir değerlere dönmesini bekleyin', "comment": 'Nem giderme için hesaplanan soğutma sevkiyat seti 2. bölgede ayarlanan limitin üzerinde'},
-    133: {"text1": 'Bölge 1 nem giderici arıza alarmı', "text2": 'Bölge 1 nem giderici alarmda', "action": 'Sistem ilgili bölgede nem giderme yapmıyor', "comment": 'Hata bölge 1’deki nem giderici (opsiyonel) kaynaklı'},
-    134: {"text1": 'Bölge 2 nem giderici arızası alarmı', "text2": 'Bölge 2 nem gidericisi alarmda', "action": 'Sistem ilgili bölgede nem giderme yapmıyor', "comment": 'Bölge 2’deki nem giderici (opsiyonel) kaynaklı hata'},
-    135: {"text1": 'Bölge 3 nem giderici arızası alarmı', "text2": 'Bölge 3 nem gidericisi alarmda', "action": 'Sistem ilgili bölgede nem giderme yapmıyor', "comment": 'Hata bölge 3’deki nem giderici (opsiyonel) kaynaklı'},
-    137: {"text1": 'Sistem eski haline getirildi alarmı - Sistemi yeniden başlatın', "text2": 'Kumanda paneli ile yapılan eski haline getirme işleminden sonra, sistemin yeniden başlatılması gerektiğinden alarm sinyali verilir', "action": 'Sistemi kapatın ve açın', "comment": 'Default parametrelerine geri dönüldüğünde sistemin yeniden başlatılması gerekir'},
-    138: {"text1": 'Mastar ısıtıcı sürüyor', "text2": 'Mastar ısıtıcı işlevi sürüyor', "action": '', "comment": ''},
-    139: {"text1": 'Hava boşaltma sürüyor', "text2": 'Hava boşaltma işlevi sürüyor', "action": '', "comment": ''},
-    177: {"text1": 'Maksimum kullanım süresi alarmı', "text2": 'Kullanım suyu talebi önceden belirlenmiş maksimum süre aşılarak yapıldı', "action": 'Sistem iyi olmayan randıman ile çalışmaya devam ediyor', "comment": 'Önceden belirlenen sürede (5 saat) sıcak kullanım suyu üretimi yerine getirilmedi'},
-    178: {"text1": 'Antilejyonella devri başarısız', "text2": 'Antilejyonella devri önceden belirlenen bir süre içinde başarı ile bitirilemedi', "action": 'Reset düğmesine basın', "comment": 'Antilejyonella devri başarı alınmadan belirlenen süre içinde (3 saat) yapıldı'},
-    179: {"text1": 'Likit sensörü hatası', "text2": 'Likit aşamada sensör aralık dışı.', "action": 'Sistem başlamıyor. Uzman bir firma çağırın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart, likit aşaması sensöründe bir hata tespit ediyor'},
-    181: {"text1": 'Bölge 2 Uzaktan Kumanda iletişim kaybı', "text2": 'Kart ile uzaktan kumanda bölge 2 arasında iletişim yok.', "action": 'Hidronik modülde gerilimi kesin ve yeniden gerilim verin. Eğer yeniden çalıştırmada Uzaktan Kumanda saptanmazsa, sistem lokal işleyiş moduna geçer ve böylece halihazırda mevcut kumandaları kullanır. Bu durumda “Isıtma”, işlevini etkinleştirmek mümkün değildir.', "comment": 'Uygun olmayan bir uzaktan kumandaya bağlanması halinde oluşur, ya da hidronik modül ile ikinci bölgenin CARV2 arasındaki bir iletişim kaybı halinde görülür'},
-    182: {"text1": 'Yoğuşturma birimi alarmı', "text2": 'Yoğuşturma biriminde bir alarm görülür', "action": 'Sistem çalışmıyor, yoğuşturma birimindeki hata ve ilgili talimatlar kitapçığına bakın', "comment": 'Yoğuşturma biriminde bir hata bildirilir'},
-    183: {"text1": 'Yoğuşturma birimin alarmı testmode konumunda', "text2": 'Yoğuşturma birimi TESTMODE konumunda bulunuyor', "action": 'Bu aşama sırasında oda klimatizasyonu ve sıcak kullanım suyu üretimi talepleri yerine getirilebilir', "comment": 'Yoğuşturma biriminin test mode aşamasında olduğu bildirilir'},
-    184: {"text1": 'Harici ünite ile iletişim timeout alarmı', "text2": 'Yoğuşturma birimi ile iletişim kaybı', "action": 'Birimler arasında elektrik bağlantısını kontrol edin', "comment": 'Dahili ünite ve yoğuşturma birimi arasında bir iletişim sorunu nedeniyle hata bildirilir'},
-    185: {"text1": 'Safety modülü iletişim alarmı', "text2": 'Safety-modülü ile iletişim kaybı', "action": 'Bileşenler arasındaki bağlantıyı kontrol ettirin', "comment": 'Ayarlama kartı ve ateşleme kartı arasında iletişim sorunu'},
-    186: {"text1": 'Ateşleyici yüksek gerilimi hatası', "text2": 'Safety modülü: ateşleyici geriliminde bir hata görüldü', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Ateşleme kartında bir hata bildirilir'},
-    187: {"text1": 'Yoğuşturma birimi dönüş sensörü alarmı', "text2": 'Yoğuşturma birimi dönüş sensörü aralık dışı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart NTC ısı pompası dönüş sensöründe bir arıza tespit etti'},
-    188: {"text1": 'Talep işleyiş aralığı dışında', "text2": 'Yapılan talep yürütülmedi çünkü harici koşullar yoğuşturma biriminin etkinleştirilmesine izin vermiyor', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'İşleyiş limitleri dışında bir harici ısı ile soğutma veya ısıtma talebi yapılır'},
-    189: {"text1": 'İletişim kartı ile iletişim timeout alarmı', "text2": 'Yoğuşturma birimi x iletişim kartı ile iletişim kaybı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Elektronik kartlar arasında iletişim düşmesi halinde hata bildirilir'},
-    191: {"text1": 'RF iletişimi bölge 2 CAR v2 RF yönünde düştü', "text2": 'Bölge 2 CAR v2 RF ile temel verici arasındaki haberleşme düştü', "action": 'CAR Wireless işleyişini denetleyin, pil şarjını kontrol edin (talimat kitapçığına bakın)', "comment": 'Dahili ünite ve CAR arasında iletişim düşmesi durumunda ikinci bölgenin Wireless versiyonu hata bildirilir, bu andan itibaren sistem yalnız dahili ünitenin kumanda paneli vasıtası ile kontrol edilebilir'},
-    192: {"text1": 'Yoğuşturma birimi sevkiyat sensör hatası', "text2": 'Yoğuşturma birimi sevkiyat sensörü aralık dışı', "action": 'Engel veya hatanın devam etmesi halinde uzman bir firmayı arayın (örneğin Immergas Yetkili Teknik Servisi).', "comment": 'Kart, ısı pompası sevkiyat NTC sensöründe bir hata tespit eder'},
-    193: {"text1": 'Sistem Testmode konumunda', "text2": 'Sistem Opentherm protokolü aracılığı ile harici bir cihaz tarafından kontrol edilir', "action": 'Sistem doğru şekilde çalışmaya devam eder', "comment": 'Sistemin test mode aşamasında olduğu bildirilir'},
-    194: {"text1": 'Audax Pro devre dışı bırakıldı', "text2": 'Audax Pro yoğuşturma birimi devre dışı bırakıldı', "action": 'Sistem doğru şekilde çalışmaya devam eder', "comment": 'Yoğuşturma birimi terminalde özel girişi vasıtası ile devre dışı bırakıldı'},
-    195: {"text1": 'Likit aşama düşük ısı hatası', "text2": 'Likit aşama sensörü sıcaklığı çok düşük ', "action": 'Soğutucu devresinin iyi çalıştığını kontrol edin', "comment": 'Likit aşamada çok düşük bir sıcaklık saptandı'},
-    196: {"text1": 'Yüksek sevkiyat sıc. engeli', "text2": 'Isı pompasının dönüş devresi üzerinde çok yüksek bir sıcaklık saptanır', "action": 'Soğutucu devresinin iyi çalıştığını kontrol edin', "comment": 'Isı pompasının sevkiyat devresi üzerinde çok yüksek bir sıcaklık saptanır'},
-}
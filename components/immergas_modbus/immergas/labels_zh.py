@@ -1,119 +0,0 @@
-"""Generated Immergas labels (language: zh)"""
-
-immergas_labels = {
-    'default': {"text1": '无法识别的一般异常', "text2": '检查表错误或选定的窗口', "action": '检查表错误或选定的窗口', "comment": '没有相关的备注说明'},
-    0: {"text1": '系统正常', "text2": '系统运行正常', "action": '无需任何操作', "comment": '无异常'},
-    1: {"text1": '点火故障', "text2": '最近一次点火尝试后火焰检测失败', "action": '按下复位按钮', "comment": '如果有环境加热或生产卫生热水要求，在预设时间内不启动锅炉。 设备第一次点火或长时间不运行后可能需要进行干预以清除堵塞。'},
-    2: {"text1": '安全温控器锁定（超温）', "text2": '安全调温器动作', "action": '按下复位按钮', "comment": '正常运行时，若因异常导致内部过热，锅炉进入闭锁状态。'},
-    3: {"text1": '烟温控器锁定', "text2": '烟气调温器动作', "action": '按下复位按钮 (Nike型)/ 正确地配置参数P.14。如果需要按重置的按钮 (Star 型)', "comment": '正常运行时，若因异常导致烟过热，锅炉进入闭锁状态。(Nike型)/ 错误的参数配置 P.14 (Star型)'},
-    4: {"text1": '接触电阻锁定', "text2": '燃气控制阀回路检测到异常 ', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '电子模板检测到燃气阀供气上的故障。 请检查电源连接。 （只有在提出请求后才能检测并显示异常）。'},
-    5: {"text1": '采暖温度传感器故障', "text2": '给水传感器给出超出范围的持续值', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板显示给水NTC传感器上检测到一个异常。'},
-    6: {"text1": '生活热水温度传感器故障', "text2": '卫生用水传感器给出超出范围的持续值', "action": '锅炉会继续生产热水，但无法保持最佳性能。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板显示卫生用水NTC传感器上检测到一个异常。'},
-    8: {"text1": '最多重置次数 ', "text2": '从组合模板显示允许执行的最多重置次数', "action": '注意: 最多连续5次重置异常，在随后的至少一小时内该功能将被禁用，即每小时最多重置5次。 关闭再重启设备电源，可以重置5次。 ', "comment": '已经达到重置可用的次数。'},
-    10: {"text1": '系统压力过低', "text2": '系统的稳压器触点打开', "action": '检查锅炉压力计的压力介于 1 ÷ 1.2 bar，如果必要恢复正确压力。', "comment": '没有检测到至取暖回路内部有足够的以保证锅炉正确运行的水压力。'},
-    11: {"text1": '烟气稳压器故障', "text2": '烟气稳压器或风机上可能的故障', "action": '如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '如果恢复正常操作条件锅炉重新启动而不需要进行重置'},
-    12: {"text1": '热水器传感器异常', "text2": '热水器的传感器给出超出范围的持续值', "action": '锅炉不能生产卫生热水。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板在热水器传感器上检测到一个异常。'},
-    13: {"text1": '空气/烟雾流量流量计超出范围', "text2": '空气/烟雾信号超出范围或风扇停止时控制器读取信号太高', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '风扇停止时，空气/烟雾的控制读取一个信号太高（压力开关触点胶合）'},
-    15: {"text1": '配置错误', "text2": '模板在其配置和输入信号之间接收到一个异常', "action": '如需恢复正常状态，重启锅炉，无需重置。 请检查锅炉配置的正确。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '若模板检测到一个异常或电路连接错误，锅炉不会启动。'},
-    16: {"text1": '风机故障', "text2": '风机未通电却旋转或接通电源却静止不动', "action": '按下重置按钮。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '确认风扇是否出现机械或电气故障。'},
-    17: {"text1": '风扇速度不正确', "text2": '风扇的转数超出正确的范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '风扇的转数不正确'},
-    20: {"text1": '点火异常闭锁', "text2": '异常火焰检测', "action": '按下重置按钮。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '在火焰控制装置异常或检测到回路泄露的情况下发生。'},
-    23: {"text1": '返回传感器异常', "text2": '返回传感器给出超出范围的持续值', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板显示给水NTC传感器上检测到一个异常。'},
-    24: {"text1": '按键故障', "text2": '控制板按钮受到一个连续的施压', "action": '如需恢复正常状态，重启锅炉，无需重置。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板检测到键盘上的一个异常。'},
-    25: {"text1": '锁定烟雾探头 / 锁定 CRC (TERA)', "text2": '烟雾温度超出范围 / 内存卡损坏 (TERA)', "action": '按下重置键', "comment": '高烟雾梯度，可能循环器阻塞或缺水 / 内存卡损坏'},
-    27: {"text1": '循环不足', "text2": '由于主回路中循环不畅锅炉过热', "action": '按下Reset按钮', "comment": '评论-意大利文“。 “核实供暖回路上没有障碍和/或核实循环器的正常运行'},
-    28: {"text1": '卫生用水回路泄漏', "text2": '如果在加热阶段操作期间发现卫生用水的温度上升锅炉发出异常信号并降低了加热的温度以限制在热交换器中水垢的形成。', "action": '如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检查所有卫生设备的水龙头被关闭或不泄漏，并且总之核实是否有泄漏。 一旦恢复卫生用水设备的最佳调节锅炉返回到正常运行'},
-    29: {"text1": '烟气传感器异常', "text2": '烟气传感器给出超出范围的持续值', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板显示烟气传感器上一个异常。'},
-    31: {"text1": '与 CARV2 通信中断', "text2": '模板和远程之间没有响应。', "action": '断开并恢复锅炉供电。 如果重新启动时未检测到远程控制，锅炉切换到本地模式因此需要使用控制面板上有的控制。  在这种情况下不可激活“供暖”功能。', "comment": '发生在连接到一个不兼容的遥控器情况下，或在锅炉和CARV2之间通讯中断的情况下。'},
-    32: {"text1": '低温第2区域探头异常', "text2": '第2区域供水探头超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到低温第2区域探头上异常，系统无法在受影响区域中工作'},
-    33: {"text1": '低温第3区域探头异常', "text2": '第3区域供水探头超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到低温第2区域探头上异常，系统无法在受影响区域中工作'},
-    36: {"text1": 'IMG 总线的通讯中断', "text2": '在 IMG 总线协议上的通信中断。', "action": '锅炉不能满足供暖要求。', "comment": '如果锅炉集控装置、区域模板（可选）或者IMG总线异常，就要断开各个元件间的通信。'},
-    37: {"text1": '电压过低', "text2": '电源电压模板的值低于允许范围。', "action": '如需恢复正常状态，重启锅炉，无需重置。', "comment": '电压低于锅炉正确运行所需限值。'},
-    38: {"text1": '火苗的信号丢失', "text2": '模板，在获取火焰校正正确的值之后, 发出火焰校正结束信号。', "action": '如需恢复正常状态，重启锅炉，无需重置。', "comment": '锅炉正确启动但燃烧器火焰意外熄灭；尝试再次点火，若锅炉恢复正常运行状态，则无需重置。'},
-    39: {"text1": '太阳能集热器探头异常', "text2": '外部探头给出电阻值超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到太阳能集热器传感器上的异常，没有生活热水，锅炉继续正常地运行，没因为太阳泵停止工作。'},
-    40: {"text1": '太阳能存储探头异常', "text2": '太阳能存储探头给出电阻值超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到太阳能存储探头上的异常，为了加热生活热水，锅炉继续正常地运行，因为太阳泵停止工作。'},
-    41: {"text1": '太阳能集热器上高温', "text2": '太阳能集热器已超过设定的最高温度', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '当太阳能集热器温度超过最大设定的极限时请核实'},
-    42: {"text1": '太阳能存储上高温', "text2": '太阳能存储已超过最高设置的温度', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '当太阳能存储水温度超过最高设置的极限时请核实'},
-    43: {"text1": '火焰信号丢失锁定', "text2": '在正常运行中连续几次缺失火焰信号。', "action": '按下Reset按钮，锅炉在启动前会执行通风后循环。', "comment": '在特定时间之内核实是否连续多次出现“火焰信号缺失”错误。'},
-    44: {"text1": '燃气阀接近开启最大累计时间超时锁定', "text2": '无火焰检测气体阀门打开的全部累计时间超出允许的最长时限。', "action": '按下重置按钮。', "comment": '在燃气阀保持打开比锅炉正常运行规定时间较长的情况下发生，锅炉没有点燃。'},
-    45: {"text1": '温差升高', "text2": '测量的给水和回水之间的温度差是 ≥ 40°C。', "action": '制约燃烧器功率以防止冷凝形成而损坏锅炉，恢复正确的温差锅炉回归正常运行。 核实在锅炉中是否有水循环，且该循环装置按照设备的要求进行配置和回水传感器的正确运行。', "comment": '锅炉检测到给水和回水传感器之间的温差突发和意外上升。'},
-    46: {"text1": '低温恒温器干预/错误配置接线/电路板', "text2": '从锅炉至DIM v2供水连接上放置的安全恒温器 （仅在低温时运行）达到高温。 / 接线错误或使用错误的备用电路板', "action": '在这种情况下经过适当的冷却后可以重置恒温器（参阅相关说明书）。 / 如果堵塞或异常仍然存在，则需要联系一家合格企业（例如Immergas技术援助服务）。', "comment": '在正常运行条件下，如果由于异常而发生低温供水的温度过热，则锅炉进入锁定状态。 / 接线错误或使用错误的备用电路板。'},
-    47: {"text1": '燃烧器功率的限制', "text2": '如果烟气温度达到高值降低燃烧器的输出功率以便防止烟气回路的损坏。', "action": '如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '如果检测到温度太高，锅炉就会降低输出功率，避免随坏自身。 '},
-    48: {"text1": '设备侧供水探头故障', "text2": '设备侧供水探头给出电阻值超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '如果设备侧的供水探头未连接或发生故障，则会发出异常信号'},
-    49: {"text1": '在返回探头上高温锁定', "text2": '从返回探头上测量的温度高', "action": '核实在锅炉中正确的循环和三通阀的良好运行。', "comment": '在热交换器返回的回路上达到过高温度的情况下请核实'},
-    50: {"text1": '外部探头异常', "text2": '外部探头给出电阻值超出范围', "action": '请核实外部探头的连接。系统继续工作', "comment": '如果外部探头未连接或发生故障，则会发出异常信号'},
-    51: {"text1": '和无线CAR的通讯中断', "text2": '发射基地和CAR v2 RF 的通信结束。', "action": '检查无线CAR的运转，确认电池的负荷（见相关的说明书）。', "comment": '如果锅炉和无线CAR的通信中断，会发出异常信号，此时，只能通过本锅炉的控制板来检查系统。'},
-    54: {"text1": ' puffer探头异常', "text2": 'puffer探头给出电阻值超出范围', "action": ' puffer 模式被禁用', "comment": '如果puffer探头未连接或发生故障，则会发出异常信号'},
-    55: {"text1": '第1区域供水温度探头异常', "text2": '第1区域供水探头给出电阻值超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到低温第1区域探头上的异常，系统无法在受影响区域工作'},
-    58: {"text1": ' Audax异常', "text2": '从热泵到 AUDAX 连接系统异常报告', "action": '热泵不能满足环境加热和冷却的要求，一旦连接恢复需要关闭并再打开系统', "comment": ' Audax热泵上异常,直接地在热泵的显示屏上核实异常的类型'},
-    59: {"text1": '电源装置频繁的锁定', "text2": '电子模板已在电源频率上检测到一个异常。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板检测到电源频率异常。'},
-    60: {"text1": '循环泵异常被闭锁', "text2": '循环泵调节显示停止。', "action": '按照有关段落中的描述尝试泵的解锁。 如需恢复正常状态，重启锅炉，无需重置。', "comment": '由于下列原因循环泵显示停止︰ 叶轮闭锁、电气故障。'},
-    61: {"text1": '循环泵中存在空气', "text2": '循环泵调节显示停止由于检测到运行中存在空气。', "action": '执行泵和取暖回路的排气。 如需恢复正常状态，重启锅炉，无需重置。', "comment": '泵中检测到空气; 泵不能运行。'},
-    62: {"text1": '完整校准请求', "text2": '模板并没有正确配置燃烧器的控制参数。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检测出电子模板缺少校准。 在替换模板或者需要“完全校准”的空气/燃气区域的参数变化，则可以确认。'},
-    63: {"text1": '设备返回探头异常', "text2": '返回探头给出电阻值超出范围', "action": '锅炉继续运行，无需从外部系统连接任何集成', "comment": '如果返回探头未连接或发生故障，则会发出异常信号'},
-    67: {"text1": '太阳能设备压力开关异常', "text2": '打开设备压力开关，可能液体不足', "action": '核实太阳能循环装置的压力表压力是否正确', "comment": '由于太阳能回路中压力下降，压力开关阻挡太阳能热回路的运行'},
-    70: {"text1": '反转探头', "text2": '在锅炉布线的连接中错误的情况下，检测到错误', "action": '锅炉不启动。如果锁定或异常仍然存在，需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '核实上水和返回探头的连接'},
-    72: {"text1": '快速校准请求', "text2": '模板并没有正确配置燃烧器的一些控制参数。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '需要检测到某些需要“快速校准”的参数发生变化。'},
-    73: {"text1": '安全给水传感器或给水传感器的偏移被发现增大。', "text2": '给水传感器检测到高的偏移。', "action": '在恢复正常状态的情况下，重启锅炉，无需重置。', "comment": '模板显示出给水的NTC塔头的温度读数异常，而原因可能是：传感器有瑕疵、定位错误、设备循环异常、主换热器的水一侧阻塞。'},
-    74: {"text1": '安全供水传感器故障', "text2": '给水传感器给出超出范围的持续值', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '模板检测到安全供水NTC传感器上的异常。'},
-    75: {"text1": '由于损坏 NTC传感器锁定', "text2": '一个或两个设备上水和返回的探头可能断裂', "action": '锅炉不启动。如果锁定或异常仍然存在，需要联系一家合格企业（例如Immergas 技术服务中心）。.', "comment": '安全探头的传感器造成较大的温度梯度'},
-    76: {"text1": '来自上水探头或返回探头', "text2": '检测到一个或两个设备上水和返回探头的一个故障', "action": '锅炉不启动。如果锁定或异常仍然存在，需要联系一家合格企业（例如Immergas技术服务中心）', "comment": '在热需求的情况下，上水和返回探头之间差大于所设置的差 '},
-    77: {"text1": '燃烧控制异常', "text2": '检测到燃气阀流量超出范围。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检测到燃气阀上的流量超出范围。'},
-    78: {"text1": '燃烧控制异常', "text2": '检测到燃气阀流量高。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检测到燃气阀上的流量高'},
-    79: {"text1": '燃烧控制异常', "text2": '检测到燃气阀流量低。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检测到燃气阀上的流量低'},
-    80: {"text1": '电子模板异常锁定', "text2": '由于模板或燃气阀的问题在电子燃气阀门驱动上检测到异常。', "action": '按下复位按钮', "comment": '在控制阀的电子模板异常的情况下进行检查。'},
-    84: {"text1": '燃烧异常- 当前功率降低', "text2": '检测到燃气阀供气压力低的类似状况。', "action": '在恢复正常状态的情况下，重启锅炉，无需重置。', "comment": '会显示燃气系统的压力降低。 结果是限制设备的功率，并发出异常信号。'},
-    85: {"text1": '锁定燃烧-后问题', "text2": '燃气阀、电极或电子卡潜在的问题', "action": '按下重置按钮。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '在燃气阀的关闭之后有火焰'},
-    87: {"text1": '燃气阀的控制锁定', "text2": '燃气阀门控制系统检测出故障。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检测到控制燃气阀的某一个组件运行异常。'},
-    88: {"text1": '燃气阀的控制锁定', "text2": '燃气阀门控制系统检测出故障。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '检测到控制燃气阀的某一个组件运行异常。'},
-    89: {"text1": '燃烧信号不稳定', "text2": '检测到燃烧信号不稳定。', "action": '锅炉继续运行。', "comment": '火焰显示不稳定，原因有：烟回流、风、燃气压力不稳、通风速度不稳或者系统运行异常。'},
-    90: {"text1": '超出范围的燃烧信号', "text2": '检测到燃烧的信号出界。', "action": '锅炉继续运行。', "comment": '燃烧信号被检测到超出延长时间的规定调控范围'},
-    91: {"text1": '点火锁定不正确', "text2": '模板会采取一切反应来获得最佳的燃烧器点火效果', "action": '按下复位按钮', "comment": '电路板会采取一切反应来获得最好的燃烧器点火效果'},
-    92: {"text1": '风机转数校正的限制', "text2": '模板已达到风机转速的最大修正值。', "action": '锅炉继续运行。', "comment": '系统会进行一切可能的校正，来调节风机的转数'},
-    93: {"text1": '超出范围的燃烧信号', "text2": '检测到燃烧的信号出界。', "action": '锅炉继续运行。', "comment": '燃烧信号被检测到超出延长时间的规定调控范围'},
-    94: {"text1": '燃烧异常', "text2": '检测到系统或燃烧控制引起的燃烧问题。', "action": '如需恢复正常状态，重启锅炉，无需重置。', "comment": '检测到燃烧控制问题，后者的原因有：气压低、烟回流、燃气阀或者模板瑕疵。'},
-    95: {"text1": '燃烧信号断断续续', "text2": '由于电气连接或信号消失问题检测到燃烧信号的不连续性', "action": '锅炉继续运行。', "comment": '系统会检测到燃烧信号的不连贯性。'},
-    96: {"text1": '排烟设备阻塞', "text2": '检测到烟囱管堵塞严重。', "action": '锅炉不启动。 如果闭锁或异常仍然存在，需要联系一个特许公司（例如Immergas技术服务中心）。', "comment": '确认排烟系统存在阻塞。'},
-    98: {"text1": '软件最大错误数锁定', "text2": '电子模板运行不正常。', "action": '按下复位按钮', "comment": '需要达到可接受的软件最大错误数。'},
-    99: {"text1": '一般性阻塞', "text2": '电子模板运行不正常。', "action": '按下复位按钮', "comment": '锅炉中检测出异常'},
-    101: {"text1": ' Audax 离线报警', "text2": '与热泵失去通讯', "action": '热泵不能满足环境加热和冷却的要求，一旦连接恢复需要关闭并再打开系统', "comment": '如果通讯断开，连接错误或热泵关闭锅炉电子设备，将无法检测到热泵'},
-    102: {"text1": '第1区域扩展离线报警', "text2": '与第1区域扩展丢失通讯', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '第1区域通讯异常'},
-    103: {"text1": '第2区域扩展离线报警', "text2": '与第2区域扩展丢失通讯', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '与第2区域通讯异常'},
-    104: {"text1": '第3区域扩展离线报警', "text2": '与第3区域扩展丢失通讯', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '与第3区域通讯异常'},
-    106: {"text1": '卫生用水探头报警 ', "text2": '在锅炉集成和单独管理卫生用水的情况下，由操作员控制的热水器探头给出电阻值超出范围', "action": '该系统不能用热泵生产生活热水。锅炉保证生活热水的生产', "comment": '电路板在热水器传感器上检测到一个异常。'},
-    120: {"text1": '第1区除湿高设定报警', "text2": '要求的第1区域计算的设定点对于除湿来说太高', "action": '计算的供水设定高于除湿机允许的限制。冷却环境并且等到露水温度恢复到可接受的值', "comment": '除湿计算的供水设定高于第1区域中设定的限值'},
-    121: {"text1": '第1区域装置离线报警', "text2": '第1区域的远程控制或远程控制为离线', "action": '核实远程控制是否打开', "comment": '未检测到与区域控制的通讯。无法对区域进行温度调节'},
-    122: {"text1": '第2区域装置离线报警', "text2": '远程控制或第2区域的远程控制为离线', "action": '核实远程控制是否打开', "comment": '未检测到与区域控制的通讯。无法对区域进行温度调节'},
-    123: {"text1": '第3区域装置离线报警', "text2": '远程控制或第3区域的远程控制为离线', "action": '核实远程控制是否打开', "comment": '未检测到与区域控制的通讯。无法对区域进行温度调节'},
-    125: {"text1": '第1区域环境温度探头异常', "text2": '第1区域的环境温度探头超出范围', "action": '除温度外不计算该区域的露点', "comment": '第1区域环境温度探头上有异常 (可选项)。无法对区域进行温度调节'},
-    126: {"text1": '第2区域环境温度探头异常', "text2": '第2区域环境温度探头超出范围', "action": '除温度外不计算该区域的露点', "comment": '第2区域环境温度探头上有异常 (可选项)。无法对区域进行温度调节'},
-    127: {"text1": '第3区域 环境温度探头异常', "text2": '第3区域环境温度超出范围', "action": '除温度外不计算该区域的露点', "comment": '第3区域环境温度探头上有异常 (选项)。无法对区域进行温度调节'},
-    129: {"text1": '第1区域湿度探头异常', "text2": '第1区域环境湿度的探头超出范围', "action": '除湿度外不计算该区域的露点', "comment": '第1区域环境湿度的探头出现异常 (选项)。不可以进行区域的湿度检查'},
-    130: {"text1": '第2区域湿度探头异常', "text2": '第2区域环境湿度的探头超出范围', "action": '除湿度外不计算该区域的露点', "comment": '第2区域湿度的探头出现异常 (可选项)。不可以进行区域的湿度检查'},
-    131: {"text1": '第3区域湿度探头异常', "text2": '第3区域环境湿度的探头超出范围', "action": '除湿度外不计算该区域的露点', "comment": '第3 区域湿度的探头出现异常 (选项)。不可以进行区域的湿度检查'},
-    132: {"text1": '第2区域除湿高设置报警', "text2": '要求第2区域计算设定值对于除湿来说太高', "action": '计算的供水设定高于除湿机允许的限制。冷却环境并且等到露水温度恢复到可接受的值', "comment": '除湿计算的供水设定高于第2区域中设置的限值'},
-    133: {"text1": '第1区域除湿器故障报警', "text2": '第1区域的除湿机处于报警状态', "action": '系统在相关区域不进行除湿', "comment": '来自第1区域上除湿机 (可选项) 异常'},
-    134: {"text1": '第2区域除湿机故障报警', "text2": '第2区域除湿机处于报警状态', "action": '系统在相关区域不进行除湿', "comment": '来自第2区域上除湿机 (可选项) 异常'},
-    135: {"text1": '第3区域的除湿机故障报警', "text2": '第3区域的除湿机处于报警状态', "action": '系统在相关区域不进行除湿', "comment": '来自第3区域上除湿机 (可选项) 异常'},
-    137: {"text1": '恢复系统报警 – 重启系统', "text2": '通过控制面板执行的复位操作之后，发出报警，因为需要重新启动系统', "action": '关闭并打开系统', "comment": '恢复默认参数后系统需要重新启动'},
-    138: {"text1": '加热板在进行中', "text2": '加热板的功能在进行中', "action": '', "comment": ''},
-    139: {"text1": '除气正在进行中', "text2": '除气的功能正在进行中', "action": '', "comment": ''},
-    177: {"text1": '生活用水最长时间报警', "text2": '请求生活用水超过了预定的最长时间', "action": '系统继续以非最佳性能运行', "comment": '在预定的时间内不满足生活用水的生产 (5 小时)'},
-    178: {"text1": '抗军团菌循环没有成功', "text2": '抗军团菌的循环尚未在规定的时间内成功结束', "action": '按下重置键', "comment": '抗军团菌循环在预定的时间内未成功执行 (3 小时)'},
-    179: {"text1": '液体探头异常 ', "text2": '液相的探头超出范围。', "action": '系统无法启动。联系一家合格企业（例如 Immergas技术服务中心）。', "comment": '电路板在液相探头上发现异常'},
-    181: {"text1": '第2区域远程控制丢失通讯', "text2": '电路板和第2区域远程之间没有对话。', "action": '切断并恢复水模块供电。如果重新启动时未检测到远程控制，系统进入本地操作模式，然后使用控制面板上的命令。在这种情况下不可以激活 “供暖”, 功能。', "comment": '核实在连接到一个远程遥控器不兼容的情况，或着水模块和第二区域 CARV2之间的通讯断开的情况'},
-    182: {"text1": '电机冷凝器报警', "text2": '核实电机冷凝器报警', "action": '系统不工作， 参阅电机冷凝器上和相关说明书中异常', "comment": '在电机冷凝器上发出异常的信号'},
-    183: {"text1": '测试模式中电机冷凝器报警', "text2": '电机冷凝器处于TESTMODE模式中', "action": '在此阶段无法满足环境空调和生产生活热水的要求。', "comment": '显示电机冷凝器在测试模式阶段'},
-    184: {"text1": '与外部设备的通讯超时报警', "text2": '与电冷凝器丢失通讯', "action": '检查在装置之间电气连接', "comment": '内部装置和电冷凝器之间通讯问题发出异常的信号'},
-    185: {"text1": '安全模块通讯报警', "text2": '与安全–模块丢失通讯', "action": '检查在组件之间连接', "comment": '调整电路板和打火板之间通讯问题'},
-    186: {"text1": '打火器电压高异常', "text2": '安全模块：打火器的电压上发生异常的信号', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '在打火板上发出异常的信号'},
-    187: {"text1": '电冷凝器返回探头报警', "text2": '电冷凝器返回探头超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到热泵的返回NTC 探头上异常'},
-    188: {"text1": '来自操作范围之外要求', "text2": '由于外部条件不允许激活电冷凝器，未执行发出的请求', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '外部温度超出操作限制时要求加热或冷却'},
-    189: {"text1": '与通讯电路板通讯超时报警', "text2": '与电冷凝器通讯电路板失去通讯', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电子板之间发生通讯断开的情况下发出异常的信号'},
-    191: {"text1": 'RF通向第2区域的CAR v2 RF通讯断开', "text2": '发射器底座和第2区域的CAR v2 RF之间通讯断开', "action": '检查无线CAR的运行，核实电池电量（参阅相关的说明书）', "comment": '在外部装置和第二区域无线CAR之间通讯断开的情况下，发出异常信号，从此只能通过其内部装置的控制板来检查系统'},
-    192: {"text1": '电冷凝器供水探头异常', "text2": '电冷凝器供水探头超出范围', "action": '如果锁定或异常仍然存在，则需要联系一家合格企业（例如Immergas 技术服务中心）。', "comment": '电路板检测到热泵供水NTC探头上的异常'},
-    193: {"text1": '设备处于Testmode模式', "text2": '通过Opentherm协议由外部装置控制设备', "action": '系统继续正常地运行', "comment": '显示设备在测试模式阶段'},
-    194: {"text1": 'Audax Pro 禁用', "text2": 'Audax Pro电冷凝器已禁用', "action": '系统继续正常地运行', "comment": '显示通过端子板中专门入口禁用了电冷凝器'},
-    195: {"text1": '液体相位低温异常 ', "text2": '液体相位探头的温度太低', "action": '核实冰箱回路的良好运行', "comment": '检测到液体相位中探头的温度太低'},
-    196: {"text1": '锁定高的供水温度', "text2": '在热泵返回的回路上检测到过高的温度', "action": '核实冰箱回路的良好运行', "comment": '在热泵供水的回路上检测到过高的温度'},
-}
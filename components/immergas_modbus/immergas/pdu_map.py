@@ -0,0 +1,252 @@
+"""PDU map of the Immergas registers, shared by the header generator and the codegen.
+
+`build_entries()` turns the PDUs of `immergas_registers.json` into the entries of
+`immergas_pdu_map` (ordered by register) and the flag bits of `immergas_pdu_bits`.
+"""
+import zlib
+
+TYPE_UNKNOWN = 0
+TYPE_U16 = 1
+TYPE_S16 = 2
+TYPE_U8 = 3
+TYPE_TEMP = 4
+TYPE_LB_FLAG8 = 5
+TYPE_U32 = 6
+TYPE_S32 = 7
+TYPE_FLOAT32 = 8
+
+# Two-register descriptors, named like the "u16"/"s16" ones, and the type they decode to.
+# immergas_registers.json has none yet; the Dominus tool would have to add them.
+WIDE_TYPES = {
+    "u32": TYPE_U32,
+    "s32": TYPE_S32,
+    "float32": TYPE_FLOAT32,
+}
+
+def flag8_bit(view):
+    """Bit index of a view that tests one bit of an LB flag8 register, else None.
+
+    Multi-bit fields such as "267" (bits 2, 6 and 7 matched as a pattern) are not single flags.
+    """
+    data = (view.get("check") or {}).get("data") or view.get("return")
+    if isinstance(data, list) and len(data) == 3 and data[0] == "LB" and data[1] == "flag8":
+        if len(str(data[2])) == 1 and str(data[2]) in "01234567":
+            return int(data[2])
+    return None
+
+def scale_of(view):
+    dec = view.get("decimal", None)
+    if isinstance(dec, int) and dec > 0:
+        return 10 ** (-dec)
+    return 1.0
+
+def detect_wide(descriptor):
+    """Type of a 32-bit descriptor such as ["u32", "item"], else None. The words are high word first."""
+    if not descriptor:
+        return None
+    return WIDE_TYPES.get(str(descriptor[0]))
+
+def split_half(name):
+    """(prefix, is_high) of an item named "<prefix>-hi" or "<prefix>-lo", else None."""
+    for suffix, high in (("-hi", True), ("-lo", False)):
+        if name.endswith(suffix):
+            return name[:-len(suffix)], high
+    return None
+
+def detect_split(data):
+    """(type, word_swap) of a value written as two u16 halves, [["u16", "x-hi"], ["u16", "x-lo"]], else None.
+
+    Two independent u16 fields are not merged: the items must be the -hi/-lo pair of one name.
+    """
+    if not isinstance(data, list) or len(data) != 2:
+        return None
+    if not all(isinstance(d, list) and len(d) > 1 and d[0] in ("u16", "s16") for d in data):
+        return None
+    halves = [split_half(str(d[1])) for d in data]
+    if None in halves or halves[0][0] != halves[1][0] or halves[0][1] == halves[1][1]:
+        return None
+    return (TYPE_S32 if data[0][0] == "s16" else TYPE_U32), not halves[0][1]
+
+def detect_type(view):
+    """(type, register count, scale, word_swap) decoded from one view."""
+    for descriptor in (view.get("return"), (view.get("check") or {}).get("data")):
+        wide = detect_wide(descriptor)
+        if wide is not None:
+            return wide, 2, scale_of(view), False
+    data = view.get("data")
+    if isinstance(data, list) and len(data) == 1 and isinstance(data[0], list):
+        # command data is [[type, item]]
+        wide = detect_wide(data[0])
+        if wide is not None:
+            return wide, 2, scale_of(view), False
+    split = detect_split(data)
+    if split is not None:
+        return split[0], 2, scale_of(view), split[1]
+    return detect_narrow_type(view) + (False,)
+
+def detect_narrow_type(view):
+    ret = view.get("return")
+    if not ret:
+        # views that only test a flag bit still read the flag byte
+        if flag8_bit(view) is not None:
+            return TYPE_LB_FLAG8, 1, 1.0
+        return TYPE_UNKNOWN, 1, 1.0
+    if isinstance(ret, list):
+        t0 = ret[0]
+        if t0 == "u16":
+            return TYPE_U16, 1, 1.0
+        if t0 == "s16":
+            return TYPE_S16, 1, 1.0
+        if t0 == "u8":
+            return TYPE_U8, 1, 1.0
+        if t0 == "temp":
+            return TYPE_TEMP, 1, scale_of(view)
+        if t0 == "LB" or flag8_bit(view) is not None:
+            # LB flag types are usually byte flags
+            return TYPE_LB_FLAG8, 1, 1.0
+    # fallback
+    return TYPE_UNKNOWN, 1, 1.0
+
+def build_entries(data):
+    """(entries, bits) of the register JSON: map entries sorted by register, {(pdu, bit): item}."""
+    pdus = data.get("pdus", [])
+
+    entries = []
+    bits = {}
+    for p in pdus:
+        pdu = p.get("pdu")
+        views = p.get("views", [])
+        # every view of a flag register, not just the one chosen below
+        for v in views:
+            bit = flag8_bit(v)
+            if bit is not None:
+                bits.setdefault((int(pdu), bit), v.get("item", ""))
+        # choose first view that has a return
+        found = None
+        for v in views:
+            if v.get("return"):
+                found = v
+                break
+        if found is None and views:
+            found = views[0]
+        if found is None:
+            # still include as unknown
+            t, cnt, scale, swap = TYPE_UNKNOWN, 1, 1.0, False
+        else:
+            t, cnt, scale, swap = detect_type(found)
+        if cnt == 1:
+            # a write command may reveal a width the read view does not
+            for cmd in p.get("commands", []):
+                wide = detect_type(cmd)
+                if wide[1] == 2:
+                    t, cnt, scale, swap = wide
+                    break
+
+        messages = p.get("messages", [])
+        writable = any(m.get("action") == "write" for m in messages)
+
+        entries.append({
+            "pdu": int(pdu),
+            "reg": int(pdu),
+            "count": int(cnt),
+            "type": int(t),
+            "scale": float(scale),
+            "writable": bool(writable),
+            "word_swap": bool(swap),
+        })
+
+    # sort by reg
+    entries.sort(key=lambda x: x["reg"])
+    return entries, bits
+
+def map_hash(entries):
+    """Identifies a map layout, e.g. to invalidate per-slave data stored by the firmware."""
+    layout = ";".join("%d,%d,%d,%d,%d" % (e["pdu"], e["reg"], e["count"], e["type"], e["word_swap"]) for e in entries)
+    return zlib.crc32(layout.encode())
+
+
+def render_header(entries, bits, layout=None):
+    """C++ declarations of `immergas_pdu_map`, its PDU index and `immergas_pdu_bits`.
+
+    `layout` is the full map when `entries` was pruned from it; the firmware keys and
+    indexes its preferences by the full map, so they survive a change of entities.
+    """
+    if layout is None:
+        layout = entries
+    header = []
+    header.append("#include <cstddef>")
+    header.append("#include <cstdint>")
+    header.append("namespace esphome { namespace immergas_modbus {")
+    header.append("enum ImmergasPduType : uint8_t { IM_PDU_UNKNOWN=0, IM_PDU_U16=1, IM_PDU_S16=2, IM_PDU_U8=3, IM_PDU_TEMP=4, IM_PDU_LB_FLAG8=5, IM_PDU_U32=6, IM_PDU_S32=7, IM_PDU_FLOAT32=8 };\n")
+    header.append("// `word_swap`: a 32-bit value stores its low word in the first register")
+    header.append("struct ImmergasPduEntry { uint16_t pdu; uint16_t reg_addr; uint8_t count; uint8_t type; float scale; bool writable; bool word_swap; const char *label; };\n")
+
+    header.append(f"static const ImmergasPduEntry immergas_pdu_map[] = {{")
+    for e in entries:
+        # try to include a label if available in the source (we have no label here, use empty)
+        label = '""'
+        header.append("    { %d, %d, %d, %d, %ff, %s, %s, %s }," % (e["pdu"], e["reg"], e["count"], e["type"], e["scale"], "true" if e["writable"] else "false", "true" if e["word_swap"] else "false", label))
+    header.append("};")
+    header.append(f"static const size_t immergas_pdu_map_len = sizeof(immergas_pdu_map)/sizeof(immergas_pdu_map[0]);")
+    header.append("static const uint32_t immergas_pdu_map_hash = 0x%08X;\n" % map_hash(entries))
+
+    position = {e["pdu"]: i for i, e in enumerate(layout)}
+    header.append("// The full map, which the entries above may be a subset of")
+    header.append("static const uint32_t immergas_pdu_layout_hash = 0x%08X;" % map_hash(layout))
+    header.append("static const size_t immergas_pdu_layout_len = %d;" % len(layout))
+    header.append("// Position of immergas_pdu_map[i] in the full map")
+    header.append("static const uint16_t immergas_pdu_layout_index[] = {")
+    for k in range(0, len(entries), 16):
+        header.append("    " + ", ".join(str(position[e["pdu"]]) for e in entries[k:k + 16]) + ",")
+    header.append("};\n")
+
+    # the map is ordered by register; index it by PDU id for binary search
+    by_pdu = sorted(range(len(entries)), key=lambda i: entries[i]["pdu"])
+    header.append("// Indices into immergas_pdu_map sorted by PDU id")
+    header.append("static const uint16_t immergas_pdu_index[] = {")
+    for k in range(0, len(by_pdu), 16):
+        header.append("    " + ", ".join(str(i) for i in by_pdu[k:k + 16]) + ",")
+    header.append("};\n")
+    header.append("// Map entry for `pdu`, or nullptr if the PDU is unknown")
+    header.append("inline const ImmergasPduEntry *immergas_find_pdu(uint16_t pdu) {")
+    header.append("  size_t lo = 0, hi = immergas_pdu_map_len;")
+    header.append("  while (lo < hi) {")
+    header.append("    size_t mid = (lo + hi) / 2;")
+    header.append("    const ImmergasPduEntry &e = immergas_pdu_map[immergas_pdu_index[mid]];")
+    header.append("    if (e.pdu == pdu) return &e;")
+    header.append("    if (e.pdu < pdu) lo = mid + 1; else hi = mid;")
+    header.append("  }")
+    header.append("  return nullptr;")
+    header.append("}\n")
+
+    # flag views, so one read of a flag register can feed a binary_sensor per bit
+    header.append("struct ImmergasPduBit { uint16_t pdu; uint8_t bit; const char *item; };\n")
+    header.append("// Bits of LB flag8 registers, sorted by PDU id and bit")
+    if bits:
+        header.append("static const ImmergasPduBit immergas_pdu_bits[] = {")
+        for (pdu, bit), item in sorted(bits.items()):
+            header.append('    { %d, %d, "%s" },' % (pdu, bit, item))
+        header.append("};")
+        header.append("static const size_t immergas_pdu_bits_len = sizeof(immergas_pdu_bits)/sizeof(immergas_pdu_bits[0]);\n")
+    else:
+        # a map without flag registers; C++ has no empty arrays
+        header.append("static const ImmergasPduBit *const immergas_pdu_bits = nullptr;")
+        header.append("static const size_t immergas_pdu_bits_len = 0;\n")
+    header.append("// Flag at `bit` of `pdu`, or nullptr if the map knows none")
+    header.append("inline const ImmergasPduBit *immergas_find_pdu_bit(uint16_t pdu, uint8_t bit) {")
+    header.append("  size_t lo = 0, hi = immergas_pdu_bits_len;")
+    header.append("  while (lo < hi) {")
+    header.append("    size_t mid = (lo + hi) / 2;")
+    header.append("    const ImmergasPduBit &b = immergas_pdu_bits[mid];")
+    header.append("    if (b.pdu == pdu && b.bit == bit) return &b;")
+    header.append("    if (b.pdu < pdu || (b.pdu == pdu && b.bit < bit)) lo = mid + 1; else hi = mid;")
+    header.append("  }")
+    header.append("  return nullptr;")
+    header.append("}")
+    header.append("}} // namespace esphome::immergas_modbus")
+    return "\n".join(header) + "\n"
+
+
+def prune(entries, bits, pdus):
+    """The entries and flag bits of the PDUs in `pdus` only, still ordered by register."""
+    return [e for e in entries if e["pdu"] in pdus], {k: v for k, v in bits.items() if k[0] in pdus}
@@ -0,0 +1,47 @@
+"""Read plans computed at codegen time from the entities in the YAML.
+
+Mirrors `immergas_plan_reads()` in im_read_plan.h, which the firmware plans with:
+the subscribed map entries of a slave are batched per update interval, small gaps
+are bridged when that saves a round trip and no batch exceeds 125 registers.
+tests/test_read_plan.py runs both over the shipped map.
+
+This is the cold-boot plan. A slave leaves it for a plan built at runtime as soon
+as it deviates (quarantined or unsupported PDUs, gaps it rejected), which includes
+every boot after discovery found an unsupported PDU.
+"""
+
+MAX_READ_REGISTERS = 125
+# Same constants as max_bridge_gap_() in immergas_modbus.cpp
+READ_OVERHEAD_CHARS = 20
+SLAVE_TURNAROUND_US = 20000
+
+
+def max_bridge_gap(baud_rate):
+    """Largest run of unused registers worth reading to save one round trip."""
+    baud = baud_rate or 9600
+    char_us = 11000000 // baud
+    round_trip_us = READ_OVERHEAD_CHARS * char_us + SLAVE_TURNAROUND_US
+    return min(round_trip_us // (2 * char_us), MAX_READ_REGISTERS)
+
+
+def build_slave_plan(entries, intervals, max_gap):
+    """Batches of one slave as (start, count, interval_ms, [map indices]).
+
+    `intervals` maps each subscribed PDU to the fastest update interval of its entities.
+    """
+    batches = []
+    for interval in sorted(set(intervals.values())):
+        tier_first = len(batches)
+        for i, e in enumerate(entries):
+            if intervals.get(e["pdu"]) != interval:
+                continue
+            if len(batches) > tier_first:
+                start, count, _, indices = batches[-1]
+                last_end = start + count
+                e_end = e["reg"] + e["count"]
+                # entries are added whole, so a 32-bit value is always read in one frame
+                if e_end - start <= MAX_READ_REGISTERS and e["reg"] - last_end <= max_gap:
+                    batches[-1] = (start, max(last_end, e_end) - start, interval, indices + [i])
+                    continue
+            batches.append((e["reg"], e["count"], interval, [i]))
+    return batches
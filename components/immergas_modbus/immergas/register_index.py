@@ -0,0 +1,122 @@
+"""Entity classification and PDU map derived from `immergas_registers.json`.
+
+Classifying the 3,300-line JSON on every `esphome config`/`compile` run is slow,
+so the extractor also writes the result to `registers_index_data.py` as plain
+literals. `load_index()` uses that module while it matches the JSON's CRC-32
+and only falls back to parsing and classifying the JSON when it does not.
+"""
+import functools
+import os
+import zlib
+
+from .const import IM_LABEL, IM_MESSAGE, IM_MODE
+from . import pdu_map
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+REG_PATH = os.path.join(ROOT, 'immergas_registers.json')
+INDEX_PATH = os.path.join(os.path.dirname(__file__), 'registers_index_data.py')
+
+
+def classify_entities(data):
+    """Default entity definitions per platform, keyed by PDU."""
+    sensors = {}
+    numbers = {}
+    switches = {}
+    selects = {}
+    binary_sensors = {}
+    climate = {}
+    for entry in data.get('pdus', []):
+        pid = entry.get('pdu')
+        # process views
+        for view in entry.get('views', []):
+            item = view.get('item') or f"pdu_{pid}"
+            label = view.get('label-en') or view.get('label-it') or item
+            defaults = {}
+            if view.get('step') is not None:
+                defaults['step'] = view.get('step')
+            if view.get('min') is not None:
+                defaults['min'] = view.get('min')
+            if view.get('max') is not None:
+                defaults['max'] = view.get('max')
+
+            # Weekday/calendar PDUs (u16 arrays) -> treat as numbers for now
+            if item and 'weekday' in item:
+                numbers[pid] = {IM_LABEL: label, IM_MESSAGE: pid, 'defaults': defaults}
+                continue
+
+            rtn = view.get('return')
+            if rtn:
+                # simple heuristic classification
+                if isinstance(rtn, list) and 'temp' in rtn:
+                    sensors[pid] = {IM_LABEL: label, IM_MESSAGE: pid, IM_MODE: 'STATUS', 'defaults': defaults}
+                elif isinstance(rtn, list) and rtn[0] in ('LB', 'u8', 'u16', 's16'):
+                    # if view defines on/off in 'value' treat as binary
+                    val = view.get('value') or []
+                    if any(str(v).lower() in ('on', 'off') for v in val):
+                        binary_sensors[pid] = {IM_LABEL: label, IM_MESSAGE: pid, IM_MODE: 'STATUS', 'defaults': defaults}
+                    else:
+                        sensors[pid] = {IM_LABEL: label, IM_MESSAGE: pid, IM_MODE: 'STATUS', 'defaults': defaults}
+                else:
+                    sensors[pid] = {IM_LABEL: label, IM_MESSAGE: pid, IM_MODE: 'STATUS', 'defaults': defaults}
+
+        # process commands -> writeable entities (numbers / switches)
+        for cmd in entry.get('commands', []):
+            citem = cmd.get('item') or f"pdu_{pid}"
+            # 'data' contains tuples like [ ["temp", "mb-room-temp-set"] ]
+            for data_item in cmd.get('data', []):
+                if isinstance(data_item, list) and data_item:
+                    dt = data_item[0]
+                    label = cmd.get('label-en') or citem
+                    defaults = {}
+                    if dt == 'temp' or (isinstance(dt, str) and 'temp' in dt):
+                        numbers[pid] = {IM_LABEL: label, IM_MESSAGE: pid, IM_MODE: 'CONTROL', 'defaults': defaults}
+                    elif dt in ('LB', 'u8'):
+                        switches[pid] = {IM_LABEL: label, IM_MESSAGE: pid, IM_MODE: 'CONTROL', 'defaults': defaults}
+    return {
+        'sensors': sensors,
+        'numbers': numbers,
+        'switches': switches,
+        'selects': selects,
+        'binary_sensors': binary_sensors,
+        'climate': climate,
+    }
+
+
+def build_index(data):
+    entries, bits = pdu_map.build_entries(data)
+    return {'entities': classify_entities(data), 'pdu_entries': entries, 'pdu_bits': bits}
+
+
+def write_index_module(raw, path=INDEX_PATH):
+    """Write the index of the register JSON `raw` (bytes) as a Python module of literals."""
+    # json and pprint (which pulls in dataclasses and inspect) stay off the load_index() fast path
+    import json
+    import pprint
+    index = build_index(json.loads(raw))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('"""Generated by extract_registers.py from immergas_registers.json; do not edit."""\n\n')
+        f.write('JSON_CRC32 = 0x%08X\n\n' % zlib.crc32(raw))
+        for key, value in index.items():
+            f.write('%s = %s\n\n' % (key, pprint.pformat(value, width=120)))
+
+
+@functools.lru_cache(maxsize=None)
+def load_index():
+    """The index of the register JSON, or an empty one if the JSON is missing."""
+    if not os.path.exists(REG_PATH):
+        return {'entities': classify_entities({}), 'pdu_entries': [], 'pdu_bits': {}}
+    with open(REG_PATH, 'rb') as fh:
+        raw = fh.read()
+    try:
+        from . import registers_index_data
+        if registers_index_data.JSON_CRC32 == zlib.crc32(raw):
+            return {
+                'entities': registers_index_data.entities,
+                'pdu_entries': registers_index_data.pdu_entries,
+                'pdu_bits': registers_index_data.pdu_bits,
+            }
+    except ImportError:
+        pass
+    # the JSON changed since the extractor last ran
+    import json
+    return build_index(json.loads(raw))
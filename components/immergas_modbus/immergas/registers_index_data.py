@@ -0,0 +1,328 @@
+"""Generated by extract_registers.py from immergas_registers.json; do not edit."""
+
+JSON_CRC32 = 0xF52A307D
+
+entities = {'binary_sensors': {2001: {'defaults': {}, 'im_label': 'mb-water-request', 'message': 2001, 'mode': 'STATUS'},
+                    2010: {'defaults': {}, 'im_label': 'mb-heating-request', 'message': 2010, 'mode': 'STATUS'},
+                    2020: {'defaults': {}, 'im_label': 'mb-heating-request', 'message': 2020, 'mode': 'STATUS'},
+                    2030: {'defaults': {}, 'im_label': 'mb-heating-request', 'message': 2030, 'mode': 'STATUS'},
+                    2040: {'defaults': {}, 'im_label': 'mb-heating-request', 'message': 2040, 'mode': 'STATUS'}},
+ 'climate': {},
+ 'numbers': {2015: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2015, 'mode': 'CONTROL'},
+             2025: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2025, 'mode': 'CONTROL'},
+             2035: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2035, 'mode': 'CONTROL'},
+             2045: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2045, 'mode': 'CONTROL'},
+             2095: {'defaults': {}, 'im_label': 'mb-water-temp-set', 'message': 2095, 'mode': 'CONTROL'},
+             2210: {'defaults': {}, 'im_label': 'set-1', 'message': 2210, 'mode': 'CONTROL'},
+             2211: {'defaults': {}, 'im_label': 'set-2', 'message': 2211, 'mode': 'CONTROL'},
+             2214: {'defaults': {}, 'im_label': 'set-5', 'message': 2214, 'mode': 'CONTROL'},
+             2215: {'defaults': {}, 'im_label': 'set-6', 'message': 2215, 'mode': 'CONTROL'},
+             2217: {'defaults': {}, 'im_label': 'set-8', 'message': 2217, 'mode': 'CONTROL'},
+             2218: {'defaults': {}, 'im_label': 'set-9', 'message': 2218, 'mode': 'CONTROL'},
+             2220: {'defaults': {}, 'im_label': 'set-1', 'message': 2220, 'mode': 'CONTROL'},
+             2221: {'defaults': {}, 'im_label': 'set-2', 'message': 2221, 'mode': 'CONTROL'},
+             2224: {'defaults': {}, 'im_label': 'set-5', 'message': 2224, 'mode': 'CONTROL'},
+             2225: {'defaults': {}, 'im_label': 'set-6', 'message': 2225, 'mode': 'CONTROL'},
+             2227: {'defaults': {}, 'im_label': 'set-8', 'message': 2227, 'mode': 'CONTROL'},
+             2228: {'defaults': {}, 'im_label': 'set-9', 'message': 2228, 'mode': 'CONTROL'},
+             2230: {'defaults': {}, 'im_label': 'set-1', 'message': 2230, 'mode': 'CONTROL'},
+             2231: {'defaults': {}, 'im_label': 'set-2', 'message': 2231, 'mode': 'CONTROL'},
+             2234: {'defaults': {}, 'im_label': 'set-5', 'message': 2234, 'mode': 'CONTROL'},
+             2235: {'defaults': {}, 'im_label': 'set-6', 'message': 2235, 'mode': 'CONTROL'},
+             2237: {'defaults': {}, 'im_label': 'set-8', 'message': 2237, 'mode': 'CONTROL'},
+             2238: {'defaults': {}, 'im_label': 'set-9', 'message': 2238, 'mode': 'CONTROL'},
+             2240: {'defaults': {}, 'im_label': 'set-1', 'message': 2240, 'mode': 'CONTROL'},
+             2241: {'defaults': {}, 'im_label': 'set-2', 'message': 2241, 'mode': 'CONTROL'},
+             2244: {'defaults': {}, 'im_label': 'set-5', 'message': 2244, 'mode': 'CONTROL'},
+             2245: {'defaults': {}, 'im_label': 'set-6', 'message': 2245, 'mode': 'CONTROL'},
+             2247: {'defaults': {}, 'im_label': 'set-8', 'message': 2247, 'mode': 'CONTROL'},
+             2248: {'defaults': {}, 'im_label': 'set-9', 'message': 2248, 'mode': 'CONTROL'},
+             2410: {'defaults': {}, 'im_label': 'weekday-1-cal', 'message': 2410},
+             2411: {'defaults': {}, 'im_label': 'weekday-2-cal', 'message': 2411},
+             2412: {'defaults': {}, 'im_label': 'weekday-3-cal', 'message': 2412},
+             2413: {'defaults': {}, 'im_label': 'weekday-4-cal', 'message': 2413},
+             2414: {'defaults': {}, 'im_label': 'weekday-5-cal', 'message': 2414},
+             2415: {'defaults': {}, 'im_label': 'weekday-6-cal', 'message': 2415},
+             2416: {'defaults': {}, 'im_label': 'weekday-7-cal', 'message': 2416},
+             2420: {'defaults': {}, 'im_label': 'weekday-1-cal', 'message': 2420},
+             2421: {'defaults': {}, 'im_label': 'weekday-2-cal', 'message': 2421},
+             2422: {'defaults': {}, 'im_label': 'weekday-3-cal', 'message': 2422},
+             2423: {'defaults': {}, 'im_label': 'weekday-4-cal', 'message': 2423},
+             2424: {'defaults': {}, 'im_label': 'weekday-5-cal', 'message': 2424},
+             2425: {'defaults': {}, 'im_label': 'weekday-6-cal', 'message': 2425},
+             2426: {'defaults': {}, 'im_label': 'weekday-7-cal', 'message': 2426},
+             2430: {'defaults': {}, 'im_label': 'weekday-1-cal', 'message': 2430},
+             2431: {'defaults': {}, 'im_label': 'weekday-2-cal', 'message': 2431},
+             2432: {'defaults': {}, 'im_label': 'weekday-3-cal', 'message': 2432},
+             2433: {'defaults': {}, 'im_label': 'weekday-4-cal', 'message': 2433},
+             2434: {'defaults': {}, 'im_label': 'weekday-5-cal', 'message': 2434},
+             2435: {'defaults': {}, 'im_label': 'weekday-6-cal', 'message': 2435},
+             2436: {'defaults': {}, 'im_label': 'weekday-7-cal', 'message': 2436},
+             2440: {'defaults': {}, 'im_label': 'weekday-1-cal', 'message': 2440},
+             2441: {'defaults': {}, 'im_label': 'weekday-2-cal', 'message': 2441},
+             2442: {'defaults': {}, 'im_label': 'weekday-3-cal', 'message': 2442},
+             2443: {'defaults': {}, 'im_label': 'weekday-4-cal', 'message': 2443},
+             2444: {'defaults': {}, 'im_label': 'weekday-5-cal', 'message': 2444},
+             2445: {'defaults': {}, 'im_label': 'weekday-6-cal', 'message': 2445},
+             2446: {'defaults': {}, 'im_label': 'weekday-7-cal', 'message': 2446},
+             2490: {'defaults': {}, 'im_label': 'weekday-1-cal', 'message': 2490},
+             2491: {'defaults': {}, 'im_label': 'weekday-2-cal', 'message': 2491},
+             2492: {'defaults': {}, 'im_label': 'weekday-3-cal', 'message': 2492},
+             2493: {'defaults': {}, 'im_label': 'weekday-4-cal', 'message': 2493},
+             2494: {'defaults': {}, 'im_label': 'weekday-5-cal', 'message': 2494},
+             2495: {'defaults': {}, 'im_label': 'weekday-6-cal', 'message': 2495},
+             2496: {'defaults': {}, 'im_label': 'weekday-7-cal', 'message': 2496}},
+ 'selects': {},
+ 'sensors': {2000: {'defaults': {}, 'im_label': 'mb-boiler-status', 'message': 2000, 'mode': 'STATUS'},
+             2011: {'defaults': {}, 'im_label': 'mb-room-temp', 'message': 2011, 'mode': 'STATUS'},
+             2015: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2015, 'mode': 'STATUS'},
+             2021: {'defaults': {}, 'im_label': 'mb-room-temp', 'message': 2021, 'mode': 'STATUS'},
+             2025: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2025, 'mode': 'STATUS'},
+             2031: {'defaults': {}, 'im_label': 'mb-room-temp', 'message': 2031, 'mode': 'STATUS'},
+             2035: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2035, 'mode': 'STATUS'},
+             2041: {'defaults': {}, 'im_label': 'mb-room-temp', 'message': 2041, 'mode': 'STATUS'},
+             2045: {'defaults': {}, 'im_label': 'mb-room-temp-set', 'message': 2045, 'mode': 'STATUS'},
+             2095: {'defaults': {}, 'im_label': 'mb-water-temp-set', 'message': 2095, 'mode': 'STATUS'},
+             2100: {'defaults': {}, 'im_label': 'mb-functional-log', 'message': 2100, 'mode': 'STATUS'},
+             2210: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Heat',
+                    'message': 2210,
+                    'mode': 'STATUS'},
+             2211: {'defaults': {'max': 25, 'min': 5, 'step': 0.1},
+                    'im_label': 'Set Eco Heat',
+                    'message': 2211,
+                    'mode': 'STATUS'},
+             2214: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Cool',
+                    'message': 2214,
+                    'mode': 'STATUS'},
+             2215: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Eco Cool',
+                    'message': 2215,
+                    'mode': 'STATUS'},
+             2216: {'defaults': {'max': 70, 'min': 30, 'step': 1},
+                    'im_label': 'Set Umidity',
+                    'message': 2216,
+                    'mode': 'STATUS'},
+             2217: {'defaults': {'max': 85, 'min': 5, 'step': 1},
+                    'im_label': 'Set Flow',
+                    'message': 2217,
+                    'mode': 'STATUS'},
+             2218: {'defaults': {'max': 15, 'min': -15, 'step': 1},
+                    'im_label': 'Offset Flow',
+                    'message': 2218,
+                    'mode': 'STATUS'},
+             2220: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Heat',
+                    'message': 2220,
+                    'mode': 'STATUS'},
+             2221: {'defaults': {'max': 25, 'min': 5, 'step': 0.1},
+                    'im_label': 'Set Eco Heat',
+                    'message': 2221,
+                    'mode': 'STATUS'},
+             2224: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Cool',
+                    'message': 2224,
+                    'mode': 'STATUS'},
+             2225: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Eco Cool',
+                    'message': 2225,
+                    'mode': 'STATUS'},
+             2226: {'defaults': {'max': 70, 'min': 30, 'step': 1},
+                    'im_label': 'Set Umidity',
+                    'message': 2226,
+                    'mode': 'STATUS'},
+             2227: {'defaults': {'max': 85, 'min': 5, 'step': 1},
+                    'im_label': 'Set Flow',
+                    'message': 2227,
+                    'mode': 'STATUS'},
+             2228: {'defaults': {'max': 15, 'min': -15, 'step': 1},
+                    'im_label': 'Offset Flow',
+                    'message': 2228,
+                    'mode': 'STATUS'},
+             2230: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Heat',
+                    'message': 2230,
+                    'mode': 'STATUS'},
+             2231: {'defaults': {'max': 25, 'min': 5, 'step': 0.1},
+                    'im_label': 'Set Eco Heat',
+                    'message': 2231,
+                    'mode': 'STATUS'},
+             2234: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Cool',
+                    'message': 2234,
+                    'mode': 'STATUS'},
+             2235: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Eco Cool',
+                    'message': 2235,
+                    'mode': 'STATUS'},
+             2236: {'defaults': {'max': 70, 'min': 30, 'step': 1},
+                    'im_label': 'Set Umidity',
+                    'message': 2236,
+                    'mode': 'STATUS'},
+             2237: {'defaults': {'max': 85, 'min': 5, 'step': 1},
+                    'im_label': 'Set Flow',
+                    'message': 2237,
+                    'mode': 'STATUS'},
+             2238: {'defaults': {'max': 15, 'min': -15, 'step': 1},
+                    'im_label': 'Offset Flow',
+                    'message': 2238,
+                    'mode': 'STATUS'},
+             2240: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Heat',
+                    'message': 2240,
+                    'mode': 'STATUS'},
+             2241: {'defaults': {'max': 25, 'min': 5, 'step': 0.1},
+                    'im_label': 'Set Eco Heat',
+                    'message': 2241,
+                    'mode': 'STATUS'},
+             2244: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Comfort Cool',
+                    'message': 2244,
+                    'mode': 'STATUS'},
+             2245: {'defaults': {'max': 35, 'min': 15, 'step': 0.1},
+                    'im_label': 'Set Eco Cool',
+                    'message': 2245,
+                    'mode': 'STATUS'},
+             2246: {'defaults': {'max': 70, 'min': 30, 'step': 1},
+                    'im_label': 'Set Umidity',
+                    'message': 2246,
+                    'mode': 'STATUS'},
+             2247: {'defaults': {'max': 85, 'min': 5, 'step': 1},
+                    'im_label': 'Set Flow',
+                    'message': 2247,
+                    'mode': 'STATUS'},
+             2248: {'defaults': {'max': 15, 'min': -15, 'step': 1},
+                    'im_label': 'Offset Flow',
+                    'message': 2248,
+                    'mode': 'STATUS'},
+             3002: {'defaults': {}, 'im_label': 'mb-outdoor-temp', 'message': 3002, 'mode': 'STATUS'},
+             3016: {'defaults': {}, 'im_label': 'mb-water-temp', 'message': 3016, 'mode': 'STATUS'}},
+ 'switches': {2216: {'defaults': {}, 'im_label': 'set-7', 'message': 2216, 'mode': 'CONTROL'},
+              2226: {'defaults': {}, 'im_label': 'set-7', 'message': 2226, 'mode': 'CONTROL'},
+              2236: {'defaults': {}, 'im_label': 'set-7', 'message': 2236, 'mode': 'CONTROL'},
+              2246: {'defaults': {}, 'im_label': 'set-7', 'message': 2246, 'mode': 'CONTROL'}}}
+
+pdu_entries = [{'count': 1, 'pdu': 2000, 'reg': 2000, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2001, 'reg': 2001, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2010, 'reg': 2010, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2011, 'reg': 2011, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2015, 'reg': 2015, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2020, 'reg': 2020, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2021, 'reg': 2021, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2025, 'reg': 2025, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2030, 'reg': 2030, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2031, 'reg': 2031, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2035, 'reg': 2035, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2040, 'reg': 2040, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2041, 'reg': 2041, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2045, 'reg': 2045, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2095, 'reg': 2095, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2100, 'reg': 2100, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2101, 'reg': 2101, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2210, 'reg': 2210, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2211, 'reg': 2211, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2214, 'reg': 2214, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2215, 'reg': 2215, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2216, 'reg': 2216, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2217, 'reg': 2217, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2218, 'reg': 2218, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2220, 'reg': 2220, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2221, 'reg': 2221, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2224, 'reg': 2224, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2225, 'reg': 2225, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2226, 'reg': 2226, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2227, 'reg': 2227, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2228, 'reg': 2228, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2230, 'reg': 2230, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2231, 'reg': 2231, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2234, 'reg': 2234, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2235, 'reg': 2235, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2236, 'reg': 2236, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2237, 'reg': 2237, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2238, 'reg': 2238, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2240, 'reg': 2240, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2241, 'reg': 2241, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2244, 'reg': 2244, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2245, 'reg': 2245, 'scale': 0.1, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2246, 'reg': 2246, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2247, 'reg': 2247, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2248, 'reg': 2248, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2310, 'reg': 2310, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2311, 'reg': 2311, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2312, 'reg': 2312, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2313, 'reg': 2313, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2314, 'reg': 2314, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2315, 'reg': 2315, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2316, 'reg': 2316, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2317, 'reg': 2317, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2320, 'reg': 2320, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2321, 'reg': 2321, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2322, 'reg': 2322, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2323, 'reg': 2323, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2324, 'reg': 2324, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2325, 'reg': 2325, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2326, 'reg': 2326, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2327, 'reg': 2327, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2330, 'reg': 2330, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2331, 'reg': 2331, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2332, 'reg': 2332, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2333, 'reg': 2333, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2334, 'reg': 2334, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2335, 'reg': 2335, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2336, 'reg': 2336, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2337, 'reg': 2337, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2340, 'reg': 2340, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2341, 'reg': 2341, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2342, 'reg': 2342, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2343, 'reg': 2343, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2344, 'reg': 2344, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2345, 'reg': 2345, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2346, 'reg': 2346, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2347, 'reg': 2347, 'scale': 1.0, 'type': 0, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 2410, 'reg': 2410, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2411, 'reg': 2411, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2412, 'reg': 2412, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2413, 'reg': 2413, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2414, 'reg': 2414, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2415, 'reg': 2415, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2416, 'reg': 2416, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2420, 'reg': 2420, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2421, 'reg': 2421, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2422, 'reg': 2422, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2423, 'reg': 2423, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2424, 'reg': 2424, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2425, 'reg': 2425, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2426, 'reg': 2426, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2430, 'reg': 2430, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2431, 'reg': 2431, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2432, 'reg': 2432, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2433, 'reg': 2433, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2434, 'reg': 2434, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2435, 'reg': 2435, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2436, 'reg': 2436, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2440, 'reg': 2440, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2441, 'reg': 2441, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2442, 'reg': 2442, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2443, 'reg': 2443, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2444, 'reg': 2444, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2445, 'reg': 2445, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2446, 'reg': 2446, 'scale': 1.0, 'type': 5, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2490, 'reg': 2490, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2491, 'reg': 2491, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2492, 'reg': 2492, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2493, 'reg': 2493, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2494, 'reg': 2494, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2495, 'reg': 2495, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 2496, 'reg': 2496, 'scale': 1.0, 'type': 1, 'word_swap': False, 'writable': True},
+ {'count': 1, 'pdu': 3002, 'reg': 3002, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': False},
+ {'count': 1, 'pdu': 3016, 'reg': 3016, 'scale': 1.0, 'type': 4, 'word_swap': False, 'writable': False}]
+
+pdu_bits = {(2001, 0): 'mb-water-request',
+ (2001, 2): 'mb-functional-log',
+ (2010, 3): 'mb-heating-request',
+ (2020, 3): 'mb-heating-request',
+ (2030, 3): 'mb-heating-request',
+ (2040, 3): 'mb-heating-request',
+ (2101, 1): 'reset'}
+
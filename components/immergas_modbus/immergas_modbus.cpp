@@ -1,12 +1,14 @@
 #include "immergas_modbus.h"
 #include "im_device.h"
 #include "im_number.h"
+#include "im_sensor.h"
 #include "im_binary_sensor.h"
 #include "im_switch.h"
 #include "im_select.h"
 
 #include "im_climate.h"
 #include "im_client.h"
+#include <algorithm>
 #include <cmath>
 #include <vector>
 #include <cstring>
@@ -15,285 +17,925 @@
 namespace esphome {
 namespace immergas_modbus {
 
+// Discovery result stored in preferences, one per slave. Bits are indexed by the full
+// map (immergas_pdu_layout_index), so a configuration polling other PDUs keeps what
+// was learned about the ones it shares with the last.
+struct ImmergasDiscoveryRecord {
+  uint32_t map_hash;
+  uint8_t probed[(immergas_pdu_layout_len + 7) / 8];
+  uint8_t unsupported[(immergas_pdu_layout_len + 7) / 8];
+};
+
+// The full map's hash is part of the key, so a firmware with a different map discovers again
+static uint32_t discovery_preference_key(uint8_t slave_id) {
+	return fnv1_hash_extend(fnv1_hash_extend(fnv1_hash("immergas_modbus_pdus"), slave_id), immergas_pdu_layout_hash);
+}
+
+// Last-known values stored in preferences, one per slave
+struct ImmergasSnapshotRecord {
+  uint32_t map_hash;
+  float values[immergas_pdu_layout_len];  // indexed like ImmergasDiscoveryRecord, NAN if never read
+};
+
+static uint32_t snapshot_preference_key(uint8_t slave_id) {
+	return fnv1_hash_extend(fnv1_hash_extend(fnv1_hash("immergas_modbus_values"), slave_id), immergas_pdu_layout_hash);
+}
+
+static bool test_bit(const uint8_t *bits, size_t i) { return bits[i / 8] & (1 << (i % 8)); }
+
+static void assign_bit(uint8_t *bits, size_t i, bool value) {
+	if (value) {
+		bits[i / 8] |= 1 << (i % 8);
+	} else {
+		bits[i / 8] &= ~(1 << (i % 8));
+	}
+}
+
 void ImmergasModbus::setup() {
-	// TODO: initialise Modbus client / registers
 	if (this->debug_logs_) {
 		ESP_LOGD("immergas_modbus", "Setup called (language=%s)", this->language_.c_str());
 	}
+	if (this->restore_values_) this->restore_snapshots_();
+	for (auto &slave : this->slaves_) {
+		if (slave.health.restored_sensor != nullptr) slave.health.restored_sensor->publish_state(slave.stale_devices != 0);
+	}
+	this->snapshot_saved_ms_ = millis();
+	this->bus_stats_.window_start_ms = millis();
+	// the read queue must exist before discovery reads are queued
+	if (this->plan_dirty_) this->rebuild_read_plans_();
+	for (size_t s = 0; s < this->slaves_.size(); ++s) this->start_discovery_(static_cast<uint8_t>(s));
 }
 
-void ImmergasModbus::register_device(IM_Device *dev) {
-	if (dev == nullptr) return;
-	this->devices_.push_back(dev);
-	dev->set_controller(this);
+void ImmergasModbus::start_discovery_(uint8_t slave_index) {
+	ImmergasSlave &slave = this->slaves_[slave_index];
+	if (slave.subscribers.empty()) return;
+	ESPPreferenceObject pref = global_preferences->make_preference<ImmergasDiscoveryRecord>(discovery_preference_key(slave.id), true);
+	ImmergasDiscoveryRecord record;
+	bool probed = pref.load(&record) && record.map_hash == immergas_pdu_layout_hash;
+	for (size_t i = 0; probed && i < immergas_pdu_map_len; ++i) probed = test_bit(record.probed, immergas_pdu_layout_index[i]);
+	if (probed) {
+		for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
+			if (test_bit(record.unsupported, immergas_pdu_layout_index[i])) this->mark_unsupported_(slave, static_cast<uint16_t>(i));
+		}
+		this->plan_dirty_ = true;
+		return;
+	}
+	// a PDU the last discovery did not cover is polled now: discover again
+	if (!this->discovery_) return;
+	// start from the largest ranges of consecutive map entries one read can cover
+	size_t first = 0;
+	for (size_t i = 1; i <= immergas_pdu_map_len; ++i) {
+		if (i < immergas_pdu_map_len &&
+		    immergas_pdu_map[i].reg_addr + immergas_pdu_map[i].count - immergas_pdu_map[first].reg_addr <= IM_MAX_READ_REGISTERS)
+			continue;
+		slave.discovery.emplace_back(first, i - 1);
+		first = i;
+	}
+	ESP_LOGI("immergas_modbus", "Discovering the PDUs slave %d supports", slave.id);
+	slave.discovering = true;
+	this->push_read_(ImmergasPendingRead{slave_index, IM_DISCOVERY_BATCH});
 }
 
-
-static bool crc16_calc(const uint8_t *buf, size_t len, uint16_t &out_crc) {
-	uint16_t crc = 0xFFFF;
-	for (size_t pos = 0; pos < len; pos++) {
-		crc ^= (uint16_t)buf[pos];
-		for (int i = 8; i != 0; i--) {
-			if ((crc & 0x0001) != 0) {
-				crc >>= 1;
-				crc ^= 0xA001;
-			} else
-				crc >>= 1;
+void ImmergasModbus::handle_discovery_response_(uint8_t slave_index, const ImmergasResponse &response) {
+	this->record_timing_(response);
+	ImmergasSlave &slave = this->slaves_[slave_index];
+	const std::pair<uint16_t, uint16_t> range = slave.discovery.back();
+	slave.discovery.pop_back();
+	this->record_result_(slave, response.result == IM_RESULT_OK || response.result == IM_RESULT_EXCEPTION);
+	if (response.result == IM_RESULT_EXCEPTION && response.exception == IM_EXCEPTION_ILLEGAL_DATA_ADDRESS) {
+		// bisect until the rejected entries are isolated
+		if (range.first == range.second) {
+			this->mark_unsupported_(slave, range.first);
+		} else {
+			uint16_t mid = (range.first + range.second) / 2;
+			slave.discovery.emplace_back(mid + 1, range.second);
+			slave.discovery.emplace_back(range.first, mid);
 		}
+	} else if (response.result != IM_RESULT_OK && response.result != IM_RESULT_EXCEPTION) {
+		// without answers nothing is learned; poll everything and discover again on the next boot
+		ESP_LOGW("immergas_modbus", "Discovery of slave %d aborted, no answer", slave.id);
+		slave.discovery.clear();
+		slave.discovering = false;
+		slave.sweep_pending = true;
+		this->plan_dirty_ = true;
+		return;
 	}
-	out_crc = crc;
-	return true;
+	if (!slave.discovery.empty()) {
+		this->push_read_(ImmergasPendingRead{slave_index, IM_DISCOVERY_BATCH});
+		return;
+	}
+	this->finish_discovery_(slave);
 }
 
-static uint16_t parse_slave_from_address(const std::string &addr) {
-	size_t pos = addr.find('.');
-	try {
-		if (pos != std::string::npos) {
-			return static_cast<uint16_t>(std::stoi(addr.substr(0, pos)));
-		}
-		return static_cast<uint16_t>(std::stoi(addr));
-	} catch (...) {
-		return 0;
-	}
-}
-
-bool ImmergasModbus::read_holding_registers(uint8_t slave_id, uint16_t reg_addr, uint16_t count, std::vector<uint16_t> &out) {
-	if (this->client_ == nullptr) return false;
-	uint8_t req[8];
-	req[0] = slave_id;
-	req[1] = 0x03;
-	req[2] = (reg_addr >> 8) & 0xFF;
-	req[3] = reg_addr & 0xFF;
-	req[4] = (count >> 8) & 0xFF;
-	req[5] = count & 0xFF;
-	uint16_t crc;
-	crc16_calc(req, 6, crc);
-	req[6] = crc & 0xFF;
-	req[7] = (crc >> 8) & 0xFF;
-
-	this->client_->write_array(req, 8);
-	this->client_->flush();
-
-	const uint32_t timeout_ms = 300;
-	uint32_t start = millis();
-	std::vector<uint8_t> buf;
-	while (millis() - start < timeout_ms) {
-		int avail = this->client_->available();
-		if (avail > 0) {
-			for (int i = 0; i < avail; i++) {
-				int b = this->client_->read();
-				if (b >= 0) buf.push_back(static_cast<uint8_t>(b));
+void ImmergasModbus::finish_discovery_(ImmergasSlave &slave) {
+	ESPPreferenceObject pref = global_preferences->make_preference<ImmergasDiscoveryRecord>(discovery_preference_key(slave.id), true);
+	// keep the result for PDUs outside this configuration's map
+	ImmergasDiscoveryRecord record;
+	if (!pref.load(&record) || record.map_hash != immergas_pdu_layout_hash) {
+		record = ImmergasDiscoveryRecord{};
+		record.map_hash = immergas_pdu_layout_hash;
+	}
+	size_t unsupported = 0;
+	for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
+		assign_bit(record.probed, immergas_pdu_layout_index[i], true);
+		assign_bit(record.unsupported, immergas_pdu_layout_index[i], slave.pdu_stats[i].unsupported);
+		if (slave.pdu_stats[i].unsupported) unsupported++;
+	}
+	pref.save(&record);
+	ESP_LOGI("immergas_modbus", "Slave %d supports %u of %u PDUs", slave.id,
+	         static_cast<unsigned>(immergas_pdu_map_len - unsupported), static_cast<unsigned>(immergas_pdu_map_len));
+	slave.discovering = false;
+	slave.sweep_pending = true;
+	this->plan_dirty_ = true;
+}
+
+void ImmergasModbus::mark_unsupported_(ImmergasSlave &slave, uint16_t index) {
+	slave.pdu_stats[index].unsupported = true;
+	// never polled, so a restored value would otherwise keep the slave's `restored` sensor on
+	this->release_stale_(slave, index);
+	// a hole in the register layout: never bridge a gap across it either
+	const ImmergasPduEntry &e = immergas_pdu_map[index];
+	for (uint16_t r = 0; r < e.count; ++r) slave.no_bridge.insert(e.reg_addr + r);
+}
+
+void ImmergasModbus::restore_snapshots_() {
+	for (auto &slave : this->slaves_) {
+		ESPPreferenceObject pref = global_preferences->make_preference<ImmergasSnapshotRecord>(snapshot_preference_key(slave.id), true);
+		ImmergasSnapshotRecord record;
+		if (!pref.load(&record) || record.map_hash != immergas_pdu_layout_hash) continue;
+		size_t restored = 0;
+		for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
+			float value = record.values[immergas_pdu_layout_index[i]];
+			if (std::isnan(value)) continue;
+			slave.snapshot[i] = value;
+			auto subscribers = slave.subscribers.find(immergas_pdu_map[i].pdu);
+			if (subscribers == slave.subscribers.end()) continue;
+			for (auto dev : subscribers->second) {
+				if (!dev->is_stale()) slave.stale_devices++;
+				dev->set_stale(true);
+				dev->handle_immergas_update(immergas_pdu_map[i].pdu, value);
 			}
-			if (buf.size() >= static_cast<size_t>(5 + 2 * count)) break;
+			restored++;
+		}
+		ESP_LOGI("immergas_modbus", "Restored %u last-known values of slave %d", static_cast<unsigned>(restored), slave.id);
+	}
+}
+
+void ImmergasModbus::save_snapshots_() {
+	this->snapshot_saved_ms_ = millis();
+	for (auto &slave : this->slaves_) {
+		if (!slave.snapshot_dirty) continue;
+		ESPPreferenceObject pref = global_preferences->make_preference<ImmergasSnapshotRecord>(snapshot_preference_key(slave.id), true);
+		// keep the values of PDUs outside this configuration's map
+		ImmergasSnapshotRecord record;
+		if (!pref.load(&record) || record.map_hash != immergas_pdu_layout_hash) {
+			record.map_hash = immergas_pdu_layout_hash;
+			std::fill(std::begin(record.values), std::end(record.values), NAN);
 		}
-		delay(5);
+		for (size_t i = 0; i < immergas_pdu_map_len; ++i) record.values[immergas_pdu_layout_index[i]] = slave.snapshot[i];
+		if (pref.save(&record)) slave.snapshot_dirty = false;
 	}
+}
 
-	if (buf.size() < 5) return false;
-	uint16_t resp_crc;
-	crc16_calc(buf.data(), buf.size() - 2, resp_crc);
-	uint16_t resp_crc_in = buf[buf.size() - 2] | (buf[buf.size() - 1] << 8);
-	if (resp_crc != resp_crc_in) return false;
-	uint8_t func = buf[1];
-	if (func & 0x80) return false;
-	uint8_t bytecount = buf[2];
-	if (bytecount != 2 * count) return false;
+void ImmergasModbus::register_device(IM_Device *dev) {
+	if (dev == nullptr) return;
+	this->devices_.push_back(dev);
+	dev->set_controller(this);
 
-	out.clear();
-	for (size_t i = 0; i < count; i++) {
-		size_t idx = 3 + i * 2;
-		uint16_t val = (buf[idx] << 8) | buf[idx + 1];
-		out.push_back(val);
+	uint16_t slave_id = dev->parse_slave();
+	if (slave_id == 0) {
+		ESP_LOGW("immergas_modbus", "Invalid slave address '%s', device will not be polled", dev->get_address().c_str());
+		return;
+	}
+	dev->set_slave_id(static_cast<uint8_t>(slave_id));
+	ImmergasSlave *slave = this->get_or_create_slave_(static_cast<uint8_t>(slave_id));
+	slave->devices.push_back(dev);
+	if (dev->get_pdu() != 0) {
+		dev->set_pdu_entry(immergas_find_pdu(dev->get_pdu()));
+		if (dev->get_pdu_entry() == nullptr) ESP_LOGW("immergas_modbus", "Unknown PDU %d for device %s", dev->get_pdu(), dev->get_address().c_str());
+		slave->subscribers[dev->get_pdu()].push_back(dev);
+		this->plan_dirty_ = true;
 	}
-	return true;
 }
 
-bool ImmergasModbus::write_multiple_registers(uint8_t slave_id, uint16_t reg_addr, const std::vector<uint16_t> &values) {
-	if (this->client_ == nullptr) return false;
-	// function 0x10: Write Multiple Registers
-	uint16_t count = static_cast<uint16_t>(values.size());
-	// build header: slave, func, addr_hi, addr_lo, count_hi, count_lo, bytecount
-	std::vector<uint8_t> pkt;
-	pkt.push_back(slave_id);
-	pkt.push_back(0x10);
-	pkt.push_back((reg_addr >> 8) & 0xFF);
-	pkt.push_back(reg_addr & 0xFF);
-	pkt.push_back((count >> 8) & 0xFF);
-	pkt.push_back(count & 0xFF);
-	pkt.push_back(static_cast<uint8_t>(count * 2));
-	for (uint16_t v : values) {
-		pkt.push_back((v >> 8) & 0xFF);
-		pkt.push_back(v & 0xFF);
-	}
-	uint16_t crc;
-	crc16_calc(pkt.data(), pkt.size(), crc);
-	pkt.push_back(crc & 0xFF);
-	pkt.push_back((crc >> 8) & 0xFF);
-
-	this->client_->write_array(pkt.data(), pkt.size());
-	this->client_->flush();
-
-	const uint32_t timeout_ms = 500;
-	uint32_t start = millis();
-	std::vector<uint8_t> buf;
-	while (millis() - start < timeout_ms) {
-		int avail = this->client_->available();
-		if (avail > 0) {
-			for (int i = 0; i < avail; i++) {
-				int b = this->client_->read();
-				if (b >= 0) buf.push_back(static_cast<uint8_t>(b));
-			}
-			// expected response length: 8 bytes (slave, func, addr_hi, addr_lo, count_hi, count_lo, crc_lo, crc_hi)
-			if (buf.size() >= 8) break;
-		}
-		delay(5);
+ImmergasSlave *ImmergasModbus::find_slave_(uint8_t slave_id) {
+	for (auto &slave : this->slaves_) {
+		if (slave.id == slave_id) return &slave;
 	}
-	if (buf.size() < 8) return false;
-	uint16_t resp_crc;
-	crc16_calc(buf.data(), buf.size() - 2, resp_crc);
-	uint16_t resp_crc_in = buf[buf.size() - 2] | (buf[buf.size() - 1] << 8);
-	if (resp_crc != resp_crc_in) return false;
-	uint8_t func = buf[1];
-	if (func & 0x80) return false;
-	// success if echo of addr/count
-	uint16_t resp_addr = (buf[2] << 8) | buf[3];
-	uint16_t resp_count = (buf[4] << 8) | buf[5];
-	return resp_addr == reg_addr && resp_count == count;
+	return nullptr;
 }
 
-bool ImmergasModbus::write_pdu_by_value(uint8_t slave_id, uint16_t pdu, float value) {
-	// find PDU entry
-	const ImmergasPduEntry *entry = nullptr;
-	for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
-		if (immergas_pdu_map[i].pdu == pdu) { entry = &immergas_pdu_map[i]; break; }
+void ImmergasModbus::set_online_sensor(IM_Device *dev, binary_sensor::BinarySensor *sensor) {
+	uint16_t slave_id = dev->parse_slave();
+	if (slave_id != 0) this->get_or_create_slave_(static_cast<uint8_t>(slave_id))->health.online_sensor = sensor;
+}
+
+void ImmergasModbus::set_restored_sensor(IM_Device *dev, binary_sensor::BinarySensor *sensor) {
+	uint16_t slave_id = dev->parse_slave();
+	if (slave_id != 0) this->get_or_create_slave_(static_cast<uint8_t>(slave_id))->health.restored_sensor = sensor;
+}
+
+void ImmergasModbus::set_successes_sensor(IM_Device *dev, sensor::Sensor *sensor) {
+	uint16_t slave_id = dev->parse_slave();
+	if (slave_id != 0) this->get_or_create_slave_(static_cast<uint8_t>(slave_id))->health.successes_sensor = sensor;
+}
+
+void ImmergasModbus::set_failures_sensor(IM_Device *dev, sensor::Sensor *sensor) {
+	uint16_t slave_id = dev->parse_slave();
+	if (slave_id != 0) this->get_or_create_slave_(static_cast<uint8_t>(slave_id))->health.failures_sensor = sensor;
+}
+
+ImmergasSlave *ImmergasModbus::get_or_create_slave_(uint8_t slave_id) {
+	for (auto &slave : this->slaves_) {
+		if (slave.id == slave_id) return &slave;
+	}
+	this->slaves_.emplace_back();
+	ImmergasSlave &slave = this->slaves_.back();
+	slave.id = slave_id;
+	slave.pdu_stats.resize(immergas_pdu_map_len);
+	slave.snapshot.assign(immergas_pdu_map_len, NAN);
+	return &slave;
+}
+
+void ImmergasModbus::dispatch_(ImmergasSlave &slave, const std::vector<IM_Device *> &subscribers, uint16_t pdu,
+                               float value) {
+	for (auto dev : subscribers) {
+		this->clear_stale_(slave, dev);
+		dev->handle_immergas_update(pdu, value);
 	}
+}
+
+void ImmergasModbus::clear_stale_(ImmergasSlave &slave, IM_Device *dev) {
+	if (!dev->is_stale()) return;
+	dev->set_stale(false);
+	// the last restored value of the slave has been read live, or will never be
+	if (--slave.stale_devices == 0 && slave.health.restored_sensor != nullptr)
+		slave.health.restored_sensor->publish_state(false);
+}
+
+void ImmergasModbus::release_stale_(ImmergasSlave &slave, uint16_t index) {
+	auto subscribers = slave.subscribers.find(immergas_pdu_map[index].pdu);
+	if (subscribers == slave.subscribers.end()) return;
+	for (auto dev : subscribers->second) this->clear_stale_(slave, dev);
+}
+
+
+bool ImmergasModbus::write_pdu_by_value(uint8_t slave_id, uint16_t pdu, float value) {
+	const ImmergasPduEntry *entry = immergas_find_pdu(pdu);
 	if (entry == nullptr) return false;
-	std::vector<uint16_t> vals;
-	switch (entry->type) {
+	return this->write_pdu(slave_id, *entry, value);
+}
+
+bool ImmergasModbus::write_pdu(uint8_t slave_id, const ImmergasPduEntry &entry, float value) {
+	ImmergasPendingWrite write{slave_id, entry.pdu, entry.reg_addr, 1, {0, 0}};
+	switch (entry.type) {
 		case IM_PDU_TEMP: {
 			// inverse scale
-			float inv = (entry->scale != 0.0f) ? (1.0f / entry->scale) : 1.0f;
+			float inv = (entry.scale != 0.0f) ? (1.0f / entry.scale) : 1.0f;
 			int32_t iv = static_cast<int32_t>(roundf(value * inv));
-			vals.push_back(static_cast<uint16_t>(iv & 0xFFFF));
+			write.values[0] = static_cast<uint16_t>(iv & 0xFFFF);
 			break;
 		}
 		case IM_PDU_U16: {
-			uint16_t v = static_cast<uint16_t>(roundf(value)); vals.push_back(v); break;
+			write.values[0] = static_cast<uint16_t>(roundf(value)); break;
 		}
 		case IM_PDU_S16: {
-			int16_t sv = static_cast<int16_t>(roundf(value)); vals.push_back(static_cast<uint16_t>(sv)); break;
+			int16_t sv = static_cast<int16_t>(roundf(value)); write.values[0] = static_cast<uint16_t>(sv); break;
 		}
 		case IM_PDU_U8:
 		case IM_PDU_LB_FLAG8: {
-			uint16_t v = static_cast<uint16_t>(static_cast<int>(roundf(value)) & 0xFF); vals.push_back(v); break;
-		}
-		case IM_PDU_FLOAT32: {
-			// encode IEEE754 into two registers (big-endian: high reg first)
-			uint32_t u; memcpy(&u, &value, sizeof(float));
-			uint16_t hi = static_cast<uint16_t>((u >> 16) & 0xFFFF);
-			uint16_t lo = static_cast<uint16_t>(u & 0xFFFF);
-			vals.push_back(hi); vals.push_back(lo);
-			break;
+			write.values[0] = static_cast<uint16_t>(static_cast<int>(roundf(value)) & 0xFF); break;
 		}
+		case IM_PDU_FLOAT32:
 		case IM_PDU_U32:
 		case IM_PDU_S32: {
-			uint32_t u = static_cast<uint32_t>(roundf(value));
-			uint16_t hi = static_cast<uint16_t>((u >> 16) & 0xFFFF);
-			uint16_t lo = static_cast<uint16_t>(u & 0xFFFF);
-			vals.push_back(hi); vals.push_back(lo);
+			float inv = (entry.scale != 0.0f) ? (1.0f / entry.scale) : 1.0f;
+			uint32_t u;
+			if (entry.type == IM_PDU_FLOAT32) {
+				// IEEE754 bits
+				float f = value * inv; memcpy(&u, &f, sizeof(float));
+			} else if (entry.type == IM_PDU_S32) {
+				u = static_cast<uint32_t>(static_cast<int32_t>(roundf(value * inv)));
+			} else {
+				u = static_cast<uint32_t>(roundf(value * inv));
+			}
+			// high word first unless the map says the device stores the low word first
+			uint16_t hi = static_cast<uint16_t>((u >> 16) & 0xFFFF), lo = static_cast<uint16_t>(u & 0xFFFF);
+			write.values[0] = entry.word_swap ? lo : hi;
+			write.values[1] = entry.word_swap ? hi : lo;
+			write.count = 2;
 			break;
 		}
 		default:
 			// fallback to single register
-			vals.push_back(static_cast<uint16_t>(roundf(value)));
-	}
-	return this->write_multiple_registers(slave_id, entry->reg_addr, vals);
-}
-
-// Helper to read contiguous ranges using the pdu map, batching consecutive registers
-void ImmergasModbus::poll_device(uint16_t slave, IM_Device *dev) {
-	size_t i = 0;
-	while (i < immergas_pdu_map_len) {
-		const ImmergasPduEntry &start_e = immergas_pdu_map[i];
-		uint16_t batch_start = start_e.reg_addr;
-		uint16_t batch_count = start_e.count;
-		size_t j = i + 1;
-		// merge contiguous entries
-		while (j < immergas_pdu_map_len) {
-			const ImmergasPduEntry &next_e = immergas_pdu_map[j];
-			if (next_e.reg_addr == batch_start + batch_count) {
-				batch_count += next_e.count;
-				++j;
-			} else break;
+			write.values[0] = static_cast<uint16_t>(roundf(value));
+	}
+	// a write still waiting for the bus is superseded, e.g. while a slider is dragged
+	for (auto &pending : this->write_queue_) {
+		if (pending.slave_id == write.slave_id && pending.pdu == write.pdu) {
+			pending = write;
+			return true;
+		}
+	}
+	this->write_queue_.push_back(write);
+	return true;
+}
+
+uint16_t ImmergasModbus::max_bridge_gap_() const {
+	return immergas_max_bridge_gap(this->client_ != nullptr ? this->client_->get_baud_rate() : 9600, IM_MAX_READ_REGISTERS);
+}
+
+uint32_t ImmergasModbus::pdu_interval_(const ImmergasSlave &slave, uint16_t pdu) const {
+	uint32_t interval = 0;
+	auto it = slave.subscribers.find(pdu);
+	if (it == slave.subscribers.end()) return interval;
+	for (auto dev : it->second) {
+		uint32_t dev_interval = dev->get_update_interval();
+		if (dev_interval == 0) dev_interval = this->get_update_interval();
+		if (interval == 0 || dev_interval < interval) interval = dev_interval;
+	}
+	return interval;
+}
+
+uint8_t ImmergasModbus::tier_for_interval_(uint32_t interval_ms) {
+	for (size_t t = 0; t < this->tiers_.size(); ++t) {
+		if (this->tiers_[t].interval_ms == interval_ms) return static_cast<uint8_t>(t);
+	}
+	this->tiers_.push_back(ImmergasPollTier{interval_ms, millis(), 0});
+	return static_cast<uint8_t>(this->tiers_.size() - 1);
+}
+
+void ImmergasModbus::rebuild_read_plans_() {
+	// tier 0 is driven by PollingComponent::update(). Tiers outlive re-plans (quarantine, discovery,
+	// retests) so their poll timers and since-boot overrun counts are kept. The intervals come
+	// from the registered entities, so the set of tiers does not change after the first build.
+	if (this->tiers_.empty()) {
+		this->tiers_.push_back(ImmergasPollTier{this->get_update_interval(), millis(), 0});
+	} else {
+		this->tiers_[0].interval_ms = this->get_update_interval();
+	}
+	size_t batches = 0;
+	for (auto &slave : this->slaves_) {
+		this->build_read_plan_(slave);
+		slave.health.probe_queued = false;
+		batches += slave.plan.size() + 2;
+	}
+	// allocate the read queue once, here, rather than while polling
+	this->read_queue_.assign(batches, ImmergasPendingRead{0, 0});
+	this->read_head_ = 0;
+	this->read_count_ = 0;
+	this->plan_dirty_ = false;
+}
+
+// Batch the subscribed PDUs of `slave` into holding-register reads, one set
+// of batches per polling tier. PDUs nobody subscribed to are left out, so bus
+// traffic follows the YAML. Small gaps are bridged when reading the filler
+// registers is cheaper than another round trip, unless the slave rejected
+// those registers before, and no batch exceeds the 125-register Modbus limit.
+void ImmergasModbus::build_read_plan_(ImmergasSlave &slave) {
+	slave.plan.clear();
+	slave.plan_entries.clear();
+	slave.plan_subscribers.clear();
+	if (this->use_static_plan_(slave)) {
+		if (this->debug_logs_) {
+			ESP_LOGD("immergas_modbus", "Read plan for slave %d: %u PDUs in %u batches, computed at build time", slave.id,
+			         static_cast<unsigned>(slave.plan_entries.size()), static_cast<unsigned>(slave.plan.size()));
 		}
-		std::vector<uint16_t> regs;
-		if (!this->read_holding_registers(static_cast<uint8_t>(slave), batch_start, batch_count, regs)) {
-			if (this->debug_logs_) ESP_LOGD("immergas_modbus", "No response from slave %d for batch %d..%d", slave, batch_start, batch_start + batch_count - 1);
-			i = j;
+		return;
+	}
+	const uint16_t max_gap = this->max_bridge_gap_();
+	std::vector<uint8_t> entry_tiers(immergas_pdu_map_len, IM_PLAN_SKIP);
+	std::vector<bool> isolated(immergas_pdu_map_len, false);
+	std::set<uint8_t> used_tiers;
+	for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
+		isolated[i] = slave.pdu_stats[i].isolated;
+		uint32_t interval = this->pdu_interval_(slave, immergas_pdu_map[i].pdu);
+		if (interval == 0 || slave.pdu_stats[i].quarantined || slave.pdu_stats[i].unsupported) continue;
+		entry_tiers[i] = this->tier_for_interval_(interval);
+		used_tiers.insert(entry_tiers[i]);
+	}
+	immergas_plan_reads(immergas_pdu_map, immergas_pdu_map_len, entry_tiers.data(), used_tiers, isolated, slave.no_bridge,
+	                    max_gap, IM_MAX_READ_REGISTERS, &slave.plan, &slave.plan_entries);
+	// every planned entry has subscribers, or pdu_interval_() would have skipped it
+	for (uint16_t index : slave.plan_entries) {
+		slave.plan_subscribers.push_back(&slave.subscribers.find(immergas_pdu_map[index].pdu)->second);
+	}
+	if (this->debug_logs_) {
+		ESP_LOGD("immergas_modbus", "Read plan for slave %d: %u PDUs in %u batches over %u tiers (max gap %d)", slave.id,
+		         static_cast<unsigned>(slave.plan_entries.size()), static_cast<unsigned>(slave.plan.size()),
+		         static_cast<unsigned>(used_tiers.size()), max_gap);
+	}
+}
+
+bool ImmergasModbus::use_static_plan_(ImmergasSlave &slave) {
+	if (this->static_batches_ == nullptr || this->static_map_hash_ != immergas_pdu_map_hash) return false;
+	// what the slave taught us at runtime is not in the static plan
+	if (this->static_max_gap_ != this->max_bridge_gap_() || !slave.no_bridge.empty()) return false;
+	size_t subscribed = 0;
+	for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
+		const ImmergasPduStats &stats = slave.pdu_stats[i];
+		if (stats.quarantined || stats.unsupported || stats.isolated) return false;
+		if (slave.subscribers.count(immergas_pdu_map[i].pdu)) subscribed++;
+	}
+	for (size_t b = 0; b < this->static_batch_count_; ++b) {
+		const ImmergasStaticBatch &sb = this->static_batches_[b];
+		if (sb.slave_id != slave.id) continue;
+		slave.plan.push_back(ImmergasReadBatch{sb.start, sb.count, static_cast<uint16_t>(slave.plan_entries.size()),
+		                                       sb.entry_count, this->tier_for_interval_(sb.interval_ms), false});
+		for (size_t k = sb.entry_offset; k < sb.entry_offset + sb.entry_count; ++k) {
+			const uint16_t index = this->static_entries_[k];
+			auto subscribers = slave.subscribers.find(immergas_pdu_map[index].pdu);
+			if (subscribers == slave.subscribers.end() || this->pdu_interval_(slave, immergas_pdu_map[index].pdu) != sb.interval_ms) {
+				subscribed = SIZE_MAX;  // the entities registered at runtime differ from the YAML
+				break;
+			}
+			slave.plan_entries.push_back(index);
+			slave.plan_subscribers.push_back(&subscribers->second);
+		}
+	}
+	if (slave.plan_entries.size() == subscribed) return true;
+	slave.plan.clear();
+	slave.plan_entries.clear();
+	slave.plan_subscribers.clear();
+	return false;
+}
+
+bool ImmergasModbus::learn_rejected_gaps_(ImmergasSlave &slave, const ImmergasReadBatch &batch) {
+	std::vector<bool> used(batch.count, false);
+	for (size_t k = batch.entry_offset; k < batch.entry_offset + batch.entry_count; ++k) {
+		const ImmergasPduEntry &e = immergas_pdu_map[slave.plan_entries[k]];
+		for (size_t x = 0; x < e.count; ++x) used[e.reg_addr - batch.start + x] = true;
+	}
+	bool learned = false;
+	for (uint16_t r = 0; r < batch.count; ++r) {
+		if (used[r]) continue;
+		slave.no_bridge.insert(batch.start + r);
+		learned = true;
+	}
+	if (learned) {
+		ESP_LOGD("immergas_modbus", "Slave %d rejected batch %d..%d, no longer bridging its gaps", slave.id, batch.start,
+		         batch.start + batch.count - 1);
+		this->plan_dirty_ = true;
+	}
+	return learned;
+}
+
+void ImmergasModbus::reject_pdus_(ImmergasSlave &slave, const ImmergasReadBatch &batch) {
+	if (batch.entry_count > 1) {
+		// several PDUs share the batch: read them one by one to find the one the slave rejects
+		for (size_t k = batch.entry_offset; k < batch.entry_offset + batch.entry_count; ++k) {
+			slave.pdu_stats[slave.plan_entries[k]].isolated = true;
+		}
+		ESP_LOGD("immergas_modbus", "Slave %d rejected batch %d..%d, reading its PDUs separately", slave.id, batch.start,
+		         batch.start + batch.count - 1);
+		this->plan_dirty_ = true;
+		return;
+	}
+	const uint16_t index = slave.plan_entries[batch.entry_offset];
+	ImmergasPduStats &stats = slave.pdu_stats[index];
+	if (++stats.illegal_streak < IM_QUARANTINE_AFTER_REJECTS) return;
+	stats.quarantined = true;
+	this->release_stale_(slave, index);
+	if (slave.quarantined++ == 0) slave.quarantine_retest_ms = millis() + IM_QUARANTINE_RETEST_MS;
+	// the culprit is known, so the others can share batches again
+	for (auto &other : slave.pdu_stats) other.isolated = false;
+	ESP_LOGI("immergas_modbus", "Slave %d does not support PDU %d, no longer polling it", slave.id, immergas_pdu_map[index].pdu);
+	this->plan_dirty_ = true;
+}
+
+void ImmergasModbus::count_batch_result_(ImmergasSlave &slave, const ImmergasReadBatch &batch,
+                                         const ImmergasResponse &response) {
+	for (size_t k = batch.entry_offset; k < batch.entry_offset + batch.entry_count; ++k) {
+		ImmergasPduStats &stats = slave.pdu_stats[slave.plan_entries[k]];
+		// counters saturate instead of wrapping
+		uint16_t *counter = &stats.timeouts;
+		if (response.result == IM_RESULT_OK) {
+			counter = &stats.ok;
+			stats.illegal_streak = 0;
+		} else if (response.result == IM_RESULT_EXCEPTION) {
+			counter = &stats.exceptions;
+		}
+		if (*counter < UINT16_MAX) (*counter)++;
+	}
+}
+
+void ImmergasModbus::retest_quarantined_() {
+	const uint32_t now = millis();
+	for (auto &slave : this->slaves_) {
+		if (slave.quarantined == 0 || static_cast<int32_t>(now - slave.quarantine_retest_ms) < 0) continue;
+		for (auto &stats : slave.pdu_stats) {
+			if (!stats.quarantined) continue;
+			stats.quarantined = false;
+			// one more rejection puts it straight back
+			stats.illegal_streak = IM_QUARANTINE_AFTER_REJECTS - 1;
+		}
+		ESP_LOGD("immergas_modbus", "Retesting %d quarantined PDUs of slave %d", slave.quarantined, slave.id);
+		slave.quarantined = 0;
+		this->plan_dirty_ = true;
+	}
+}
+
+const ImmergasPduStats *ImmergasModbus::get_pdu_stats(uint8_t slave_id, uint16_t pdu) {
+	ImmergasSlave *slave = this->find_slave_(slave_id);
+	const ImmergasPduEntry *entry = immergas_find_pdu(pdu);
+	if (slave == nullptr || entry == nullptr) return nullptr;
+	return &slave->pdu_stats[entry - immergas_pdu_map];
+}
+
+void ImmergasModbus::log_pdu_stats() {
+	for (const auto &slave : this->slaves_) {
+		for (size_t i = 0; i < slave.pdu_stats.size(); ++i) {
+			const ImmergasPduStats &stats = slave.pdu_stats[i];
+			if (stats.exceptions == 0 && stats.timeouts == 0) continue;
+			ESP_LOGI("immergas_modbus", "Slave %d PDU %d: ok=%u exceptions=%u timeouts=%u%s", slave.id, immergas_pdu_map[i].pdu,
+			         stats.ok, stats.exceptions, stats.timeouts, stats.quarantined ? " (quarantined)" : "");
+		}
+	}
+}
+
+void ImmergasModbus::start_next_transaction_() {
+	if (this->client_ == nullptr || !this->client_->is_idle()) return;
+	// writes take priority over scheduled reads
+	if (!this->write_queue_.empty()) {
+		this->start_next_write_();
+		return;
+	}
+	ImmergasPendingRead read;
+	while (this->pop_read_(&read)) {
+		ImmergasSlave &slave = this->slaves_[read.slave_index];
+		if (read.batch_index == IM_DISCOVERY_BATCH) {
+			const ImmergasPduEntry &first = immergas_pdu_map[slave.discovery.back().first];
+			const ImmergasPduEntry &last = immergas_pdu_map[slave.discovery.back().second];
+			auto on_response = [this, read](const ImmergasResponse &response) {
+				this->handle_discovery_response_(read.slave_index, response);
+			};
+			this->client_->read_holding_registers(slave.id, first.reg_addr, last.reg_addr + last.count - first.reg_addr,
+			                                      on_response);
+			return;
+		}
+		if (read.batch_index == IM_PROBE_BATCH) {
+			// the cheapest read the slave is known to answer: the first register of its plan
+			auto on_response = [this, read](const ImmergasResponse &response) {
+				this->handle_probe_response_(read.slave_index, response);
+			};
+			this->client_->read_holding_registers(slave.id, slave.plan[0].start, 1, on_response);
+			return;
+		}
+		ImmergasReadBatch &batch = slave.plan[read.batch_index];
+		if (!slave.health.online) {
+			// the slave went offline after this batch was queued; skip it rather than wait out its timeout
+			batch.queued = false;
+			this->count_cycle_batch_(batch);
 			continue;
 		}
-		// dispatch values back to individual PDUs
-		size_t offset = 0;
-		for (size_t k = i; k < j; ++k) {
-			const ImmergasPduEntry &e = immergas_pdu_map[k];
-			// collect registers for this entry
-			std::vector<uint16_t> sub;
-			for (size_t x = 0; x < e.count && (offset + x) < regs.size(); ++x) sub.push_back(regs[offset + x]);
-			offset += e.count;
-			float value = 0.0f;
-			switch (e.type) {
-				case IM_PDU_TEMP:
-					if (!sub.empty()) value = static_cast<float>(sub[0]) * e.scale;
-					break;
-				case IM_PDU_U16:
-					if (!sub.empty()) value = static_cast<float>(sub[0]);
-					break;
-				case IM_PDU_S16:
-					if (!sub.empty()) {
-						int16_t sv = static_cast<int16_t>(sub[0]);
-						value = static_cast<float>(sv);
-					}
-					break;
-				case IM_PDU_U8:
-				case IM_PDU_LB_FLAG8:
-					if (!sub.empty()) value = static_cast<float>(sub[0] & 0xFF);
-					break;
-				case IM_PDU_U32:
-				case IM_PDU_S32:
-				case IM_PDU_FLOAT32:
-					if (sub.size() >= 2) {
-						// combine registers: assume big-endian register order (reg N = high 16 bits)
-						uint32_t hi = sub[0];
-						uint32_t lo = sub[1];
-						uint32_t comb = (hi << 16) | lo;
-						if (e.type == IM_PDU_FLOAT32) {
-							float f; memcpy(&f, &comb, sizeof(float)); value = f * e.scale;
-						} else if (e.type == IM_PDU_S32) {
-							int32_t si = static_cast<int32_t>(comb); value = static_cast<float>(si) * e.scale;
-						} else {
-							value = static_cast<float>(comb) * e.scale;
-						}
+		auto on_response = [this, read](const ImmergasResponse &response) {
+			this->handle_read_response_(read.slave_index, read.batch_index, response);
+		};
+		this->client_->read_holding_registers(slave.id, batch.start, batch.count, on_response);
+		return;
+	}
+}
+
+void ImmergasModbus::start_next_write_() {
+	const ImmergasPendingWrite &head = this->write_queue_.front();
+	const uint8_t slave_id = head.slave_id;
+	uint16_t start = head.reg_addr;
+	uint16_t end = head.reg_addr + head.count;
+	// grow the register run with pending writes directly before or after it
+	for (bool grown = true; grown;) {
+		grown = false;
+		for (const auto &w : this->write_queue_) {
+			if (w.slave_id != slave_id) continue;
+			if (w.reg_addr == end && end + w.count - start <= IM_MAX_WRITE_REGISTERS) {
+				end += w.count;
+				grown = true;
+			} else if (w.reg_addr + w.count == start && end - w.reg_addr <= IM_MAX_WRITE_REGISTERS) {
+				start = w.reg_addr;
+				grown = true;
+			}
+		}
+	}
+	// move the writes inside the run out of the queue, in queue order so later writes win
+	uint16_t values[IM_MAX_WRITE_REGISTERS];
+	size_t merged = 0, kept = 0;
+	for (size_t i = 0; i < this->write_queue_.size(); ++i) {
+		const ImmergasPendingWrite &w = this->write_queue_[i];
+		if (w.slave_id == slave_id && w.reg_addr >= start && w.reg_addr + w.count <= end) {
+			memcpy(values + (w.reg_addr - start), w.values, w.count * sizeof(uint16_t));
+			merged++;
+		} else {
+			this->write_queue_[kept++] = w;
+		}
+	}
+	this->write_queue_.resize(kept);
+	const uint16_t count = end - start;
+	if (this->debug_logs_ && merged > 1) {
+		ESP_LOGD("immergas_modbus", "Merged %u writes for slave %d into registers %d..%d", static_cast<unsigned>(merged), slave_id, start, end - 1);
+	}
+	auto on_response = [this, slave_id, start, count](const ImmergasResponse &response) {
+		this->record_timing_(response);
+		if (response.result != IM_RESULT_OK) {
+			ESP_LOGW("immergas_modbus", "Write failed for slave %d registers %d..%d (result=%d exception=%d)", slave_id, start,
+			         start + count - 1, response.result, response.exception);
+		}
+		ImmergasSlave *slave = this->find_slave_(slave_id);
+		if (slave != nullptr) this->record_result_(*slave, response.result == IM_RESULT_OK || response.result == IM_RESULT_EXCEPTION);
+	};
+	// function 0x06 needs 8 bytes on the wire, 0x10 needs 9 plus the data
+	if (count == 1) {
+		this->client_->write_single_register(slave_id, start, values[0], on_response);
+	} else {
+		this->client_->write_multiple_registers(slave_id, start, values, count, on_response);
+	}
+}
+
+void ImmergasModbus::handle_read_response_(uint8_t slave_index, uint16_t batch_index, const ImmergasResponse &response) {
+	ImmergasSlave &slave = this->slaves_[slave_index];
+	ImmergasReadBatch &batch = slave.plan[batch_index];
+	batch.queued = false;
+	this->record_timing_(response);
+	this->count_cycle_batch_(batch);
+	this->record_result_(slave, response.result == IM_RESULT_OK || response.result == IM_RESULT_EXCEPTION);
+	this->count_batch_result_(slave, batch, response);
+	if (response.result == IM_RESULT_OK) {
+		this->decode_batch_(slave, batch, response.registers);
+	} else if (response.result == IM_RESULT_EXCEPTION && response.exception == IM_EXCEPTION_ILLEGAL_DATA_ADDRESS) {
+		if (!this->learn_rejected_gaps_(slave, batch)) this->reject_pdus_(slave, batch);
+	} else if (this->debug_logs_) {
+		ESP_LOGD("immergas_modbus", "No response from slave %d for batch %d..%d", slave.id, batch.start, batch.start + batch.count - 1);
+	}
+}
+
+void ImmergasModbus::handle_probe_response_(uint8_t slave_index, const ImmergasResponse &response) {
+	this->record_timing_(response);
+	ImmergasSlave &slave = this->slaves_[slave_index];
+	slave.health.probe_queued = false;
+	// an exception is still an answer: the slave is alive
+	this->record_result_(slave, response.result == IM_RESULT_OK || response.result == IM_RESULT_EXCEPTION);
+}
+
+void ImmergasModbus::record_result_(ImmergasSlave &slave, bool answered) {
+	ImmergasSlaveHealth &health = slave.health;
+	if (answered) {
+		health.successes++;
+		health.consecutive_failures = 0;
+		if (health.online) return;
+		health.online = true;
+		health.backoff_ms = 0;
+		ESP_LOGI("immergas_modbus", "Slave %d is back online", slave.id);
+		this->publish_health_(slave);
+		// sweep it right away instead of waiting for the next cycle of each tier
+		this->sweep_slave_(static_cast<uint8_t>(&slave - this->slaves_.data()));
+		return;
+	}
+	health.failures++;
+	if (health.consecutive_failures < UINT8_MAX) health.consecutive_failures++;
+	if (health.online) {
+		if (health.consecutive_failures < IM_OFFLINE_AFTER_FAILURES) return;
+		health.online = false;
+		health.backoff_ms = IM_PROBE_BACKOFF_MIN_MS;
+		ESP_LOGW("immergas_modbus", "Slave %d is offline after %d failed transactions, probing every %u ms", slave.id,
+		         health.consecutive_failures, health.backoff_ms);
+		this->publish_health_(slave);
+	} else {
+		health.backoff_ms = std::min(health.backoff_ms * 2, IM_PROBE_BACKOFF_MAX_MS);
+	}
+	health.next_probe_ms = millis() + health.backoff_ms;
+}
+
+void ImmergasModbus::publish_health_(ImmergasSlave &slave) {
+	const ImmergasSlaveHealth &health = slave.health;
+	if (health.online_sensor != nullptr) health.online_sensor->publish_state(health.online);
+	if (health.successes_sensor != nullptr && health.successes_sensor->get_raw_state() != health.successes) {
+		health.successes_sensor->publish_state(health.successes);
+	}
+	if (health.failures_sensor != nullptr && health.failures_sensor->get_raw_state() != health.failures) {
+		health.failures_sensor->publish_state(health.failures);
+	}
+}
+
+void ImmergasModbus::record_timing_(const ImmergasResponse &response) {
+	ImmergasBusStats &stats = this->bus_stats_;
+	stats.round_trip_us.add(response.timing.round_trip_us);
+	if (response.timing.turnaround_us != 0) stats.turnaround_us.add(response.timing.turnaround_us);
+	stats.busy_us += response.timing.round_trip_us;
+	stats.bytes += response.timing.wire_bytes;
+}
+
+void ImmergasModbus::count_cycle_batch_(const ImmergasReadBatch &batch) {
+	ImmergasBusStats &stats = this->bus_stats_;
+	if (batch.tier != 0 || stats.cycle_pending == 0) return;
+	if (--stats.cycle_pending == 0) stats.cycle_duration_ms = millis() - stats.cycle_start_ms;
+}
+
+void ImmergasModbus::publish_bus_stats_() {
+	ImmergasBusStats &stats = this->bus_stats_;
+	const uint32_t now = millis();
+	const uint32_t window_ms = now - stats.window_start_ms;
+	uint32_t overruns = 0;
+	for (const auto &tier : this->tiers_) overruns += tier.overruns;
+	float values[IM_BUS_METRIC_COUNT];
+	values[IM_BUS_UTILIZATION] = window_ms == 0 ? 0.0f : std::min(100.0f, stats.busy_us / (window_ms * 10.0f));
+	values[IM_BUS_BYTES] = stats.bytes;
+	values[IM_BUS_ROUND_TRIP_MIN] = stats.round_trip_us.min / 1000.0f;
+	values[IM_BUS_ROUND_TRIP_AVG] = stats.round_trip_us.avg() / 1000.0f;
+	values[IM_BUS_ROUND_TRIP_P95] = stats.round_trip_us.p95() / 1000.0f;
+	values[IM_BUS_TURNAROUND_MIN] = stats.turnaround_us.min / 1000.0f;
+	values[IM_BUS_TURNAROUND_AVG] = stats.turnaround_us.avg() / 1000.0f;
+	values[IM_BUS_TURNAROUND_P95] = stats.turnaround_us.p95() / 1000.0f;
+	values[IM_BUS_CYCLE_DURATION] = stats.cycle_duration_ms;
+	values[IM_BUS_OVERRUNS] = overruns;
+	for (size_t m = 0; m < IM_BUS_METRIC_COUNT; ++m) {
+		// an empty window has no timings to report
+		bool timing = m >= IM_BUS_ROUND_TRIP_MIN && m <= IM_BUS_TURNAROUND_P95;
+		if (timing && (m < IM_BUS_TURNAROUND_MIN ? stats.round_trip_us.count : stats.turnaround_us.count) == 0) continue;
+		if (this->bus_sensors_[m] != nullptr) this->bus_sensors_[m]->publish_state(values[m]);
+	}
+	if (this->debug_logs_) {
+		ESP_LOGD("immergas_modbus", "Bus %.1f%% busy, %u bytes, round trip avg %.1f ms p95 %.1f ms over %u transactions",
+		         values[IM_BUS_UTILIZATION], stats.bytes, values[IM_BUS_ROUND_TRIP_AVG], values[IM_BUS_ROUND_TRIP_P95],
+		         stats.round_trip_us.count);
+	}
+	stats.round_trip_us.reset();
+	stats.turnaround_us.reset();
+	stats.busy_us = 0;
+	stats.bytes = 0;
+	stats.window_start_ms = now;
+}
+
+void ImmergasModbus::schedule_probes_() {
+	const uint32_t now = millis();
+	for (size_t s = 0; s < this->slaves_.size(); ++s) {
+		ImmergasSlaveHealth &health = this->slaves_[s].health;
+		if (health.online || health.probe_queued || this->slaves_[s].plan.empty()) continue;
+		if (static_cast<int32_t>(now - health.next_probe_ms) < 0) continue;
+		health.probe_queued = true;
+		this->push_read_(ImmergasPendingRead{static_cast<uint8_t>(s), IM_PROBE_BATCH});
+	}
+}
+
+void ImmergasModbus::decode_batch_(ImmergasSlave &slave, const ImmergasReadBatch &batch, const ImmergasRegisterView &regs) {
+	// dispatch values back to individual PDUs
+	for (size_t k = batch.entry_offset; k < batch.entry_offset + batch.entry_count; ++k) {
+		const ImmergasPduEntry &e = immergas_pdu_map[slave.plan_entries[k]];
+		// registers for this entry, read in place from the response frame
+		ImmergasRegisterView sub = regs.slice(e.reg_addr - batch.start, e.count);
+		float value = 0.0f;
+		switch (e.type) {
+			case IM_PDU_TEMP:
+				if (!sub.empty()) value = static_cast<float>(sub[0]) * e.scale;
+				break;
+			case IM_PDU_U16:
+				if (!sub.empty()) value = static_cast<float>(sub[0]);
+				break;
+			case IM_PDU_S16:
+				if (!sub.empty()) {
+					int16_t sv = static_cast<int16_t>(sub[0]);
+					value = static_cast<float>(sv);
+				}
+				break;
+			case IM_PDU_U8:
+			case IM_PDU_LB_FLAG8:
+				if (!sub.empty()) value = static_cast<float>(sub[0] & 0xFF);
+				break;
+			case IM_PDU_U32:
+			case IM_PDU_S32:
+			case IM_PDU_FLOAT32:
+				if (sub.size() >= 2) {
+					// reg N holds the high 16 bits unless the map entry swaps the words
+					uint32_t hi = e.word_swap ? sub[1] : sub[0];
+					uint32_t lo = e.word_swap ? sub[0] : sub[1];
+					uint32_t comb = (hi << 16) | lo;
+					if (e.type == IM_PDU_FLOAT32) {
+						float f; memcpy(&f, &comb, sizeof(float)); value = f * e.scale;
+					} else if (e.type == IM_PDU_S32) {
+						int32_t si = static_cast<int32_t>(comb); value = static_cast<float>(si) * e.scale;
+					} else {
+						value = static_cast<float>(comb) * e.scale;
 					}
-					break;
-				default:
-					if (!sub.empty()) value = static_cast<float>(sub[0]);
+				}
+				break;
+			default:
+				if (!sub.empty()) value = static_cast<float>(sub[0]);
+		}
+		// written to flash later, see save_snapshots_()
+		float &last = slave.snapshot[slave.plan_entries[k]];
+		if (last != value) {
+			last = value;
+			slave.snapshot_dirty = true;
+		}
+		this->dispatch_(slave, *slave.plan_subscribers[k], e.pdu, value);
+	}
+}
+
+void ImmergasModbus::poll_tier_(uint8_t tier) {
+	if (tier >= this->tiers_.size()) return;
+	ImmergasPollTier &poll_tier = this->tiers_[tier];
+	poll_tier.last_poll_ms = millis();
+	// Each slave is swept once per cycle, regardless of how many entities share its address.
+	// The batches are only queued here; loop() sends them one transaction at a time.
+	size_t pending = 0, pushed = 0;
+	for (size_t s = 0; s < this->slaves_.size(); ++s) {
+		// offline slaves are only probed, see schedule_probes_(); discovery comes first
+		if (!this->slaves_[s].health.online || this->slaves_[s].discovering) continue;
+		auto &plan = this->slaves_[s].plan;
+		for (size_t b = 0; b < plan.size(); ++b) {
+			if (plan[b].tier != tier) continue;
+			// a batch still waiting from the previous cycle is not queued twice
+			if (plan[b].queued) {
+				pending++;
+				continue;
 			}
-			dev->handle_immergas_update(e.pdu, value);
+			plan[b].queued = true;
+			this->push_read_(ImmergasPendingRead{static_cast<uint8_t>(s), static_cast<uint16_t>(b)});
+			pushed++;
+		}
+	}
+	if (tier == 0) {
+		this->bus_stats_.cycle_start_ms = poll_tier.last_poll_ms;
+		this->bus_stats_.cycle_pending = pushed + pending;
+	}
+	if (pending != 0) {
+		poll_tier.overruns++;
+		ESP_LOGW("immergas_modbus", "Poll cycle of %u ms overran: %u batches of the previous cycle still pending (%u overruns)",
+		         poll_tier.interval_ms, static_cast<unsigned>(pending), poll_tier.overruns);
+	}
+}
+
+void ImmergasModbus::sweep_slave_(uint8_t slave_index) {
+	auto &plan = this->slaves_[slave_index].plan;
+	for (size_t b = 0; b < plan.size(); ++b) {
+		if (plan[b].queued) continue;
+		plan[b].queued = true;
+		this->push_read_(ImmergasPendingRead{slave_index, static_cast<uint16_t>(b)});
+	}
+}
+
+void ImmergasModbus::push_read_(const ImmergasPendingRead &read) {
+	if (this->read_count_ == this->read_queue_.size()) return;
+	this->read_queue_[(this->read_head_ + this->read_count_) % this->read_queue_.size()] = read;
+	this->read_count_++;
+}
+
+bool ImmergasModbus::pop_read_(ImmergasPendingRead *read) {
+	if (this->read_count_ == 0) return false;
+	*read = this->read_queue_[this->read_head_];
+	this->read_head_ = (this->read_head_ + 1) % this->read_queue_.size();
+	this->read_count_--;
+	return true;
+}
+
+bool ImmergasModbus::can_rebuild_read_plans_() const {
+	// queued and in-flight reads refer to batches by index
+	return this->read_count_ == 0 && (this->client_ == nullptr || this->client_->is_idle());
+}
+
+void ImmergasModbus::loop() {
+	const uint32_t loop_start = millis();
+	if (this->plan_dirty_ && this->can_rebuild_read_plans_()) this->rebuild_read_plans_();
+	if (!this->plan_dirty_) {
+		// slaves that skipped their first cycles while discovering are read as soon as their plan is ready
+		for (size_t s = 0; s < this->slaves_.size(); ++s) {
+			if (!this->slaves_[s].sweep_pending) continue;
+			this->slaves_[s].sweep_pending = false;
+			this->sweep_slave_(static_cast<uint8_t>(s));
 		}
-		i = j;
+	}
+	// tiers other than 0 run on their own interval, independent of update()
+	const uint32_t now = millis();
+	for (size_t t = 1; t < this->tiers_.size(); ++t) {
+		if (now - this->tiers_[t].last_poll_ms >= this->tiers_[t].interval_ms) this->poll_tier_(static_cast<uint8_t>(t));
+	}
+	this->schedule_probes_();
+	this->retest_quarantined_();
+	// rate-limited to spare the flash; values that keep changing are saved at most this often
+	if (this->restore_values_ && now - this->snapshot_saved_ms_ >= IM_SNAPSHOT_SAVE_INTERVAL_MS) this->save_snapshots_();
+	// At most one transaction per iteration, and none once this iteration used up its budget:
+	// its response is decoded and published from the client's loop(), which adds to the time.
+	if (millis() - loop_start < this->loop_budget_ms_) this->start_next_transaction_();
+	// keep the main loop spinning while transactions are waiting for the bus
+	if (this->read_count_ != 0 || !this->write_queue_.empty()) {
+		this->high_freq_.start();
+	} else {
+		this->high_freq_.stop();
 	}
 }
 
 void ImmergasModbus::update() {
 	if (this->debug_logs_) {
-		ESP_LOGD("immergas_modbus", "Update called (polling) devices=%d", this->devices_.size());
-	}
-	// For each registered device, iterate the generated PDU map and read each entry.
-	for (auto dev : this->devices_) {
-		uint16_t slave = parse_slave_from_address(dev->get_address());
-		if (slave == 0) continue;
-		this->poll_device(slave, dev);
+		ESP_LOGD("immergas_modbus", "Update called (polling) devices=%u slaves=%u tiers=%u",
+		         static_cast<unsigned>(this->devices_.size()), static_cast<unsigned>(this->slaves_.size()),
+		         static_cast<unsigned>(this->tiers_.size()));
 	}
+	if (this->plan_dirty_ && this->can_rebuild_read_plans_()) this->rebuild_read_plans_();
+	for (auto &slave : this->slaves_) this->publish_health_(slave);
+	this->publish_bus_stats_();
+	this->poll_tier_(0);
+}
+
+void ImmergasModbus::on_shutdown() {
+	// reboots and OTA updates keep the values read since the last save
+	if (this->restore_values_) this->save_snapshots_();
 }
 
 }  // namespace immergas_modbus
@@ -1,6 +1,12 @@
 #pragma once
 
 #include "esphome.h"
+#include "im_client.h"
+#include "im_labels.h"
+#include "im_read_plan.h"
+#include <algorithm>
+#include <map>
+#include <set>
 #include <vector>
 #include <string>
 
@@ -8,6 +14,186 @@ namespace esphome {
 namespace immergas_modbus {
 
 class IM_Device;
+struct ImmergasPduEntry;
+
+// Modbus exception code 0x02 (illegal data address)
+static const uint8_t IM_EXCEPTION_ILLEGAL_DATA_ADDRESS = 0x02;
+
+// One batch of the read plan computed at codegen time from the YAML, see set_static_plan().
+// `entry_offset`/`entry_count` select its map indices in the static entry list.
+struct ImmergasStaticBatch {
+  uint8_t slave_id;
+  uint16_t start;
+  uint16_t count;
+  uint16_t entry_offset;
+  uint16_t entry_count;
+  uint32_t interval_ms;
+};
+
+// Polling tier: every PDU is read at the fastest update interval requested by
+// one of its subscribers. Tier 0 runs at the controller's own update interval.
+struct ImmergasPollTier {
+  uint32_t interval_ms;
+  uint32_t last_poll_ms;
+  // Cycles that started while batches of the previous one were still waiting for the bus
+  uint32_t overruns;
+};
+
+// A read batch waiting for the bus: `slaves_[slave_index].plan[batch_index]`
+struct ImmergasPendingRead {
+  uint8_t slave_index;
+  uint16_t batch_index;  // IM_PROBE_BATCH for a health probe
+};
+
+// `batch_index` of a one-register read that only checks whether an offline slave answers
+static const uint16_t IM_PROBE_BATCH = 0xFFFF;
+// `batch_index` of the next startup discovery read, see ImmergasSlave::discovery
+static const uint16_t IM_DISCOVERY_BATCH = 0xFFFE;
+// Consecutive failed transactions after which a slave is considered offline
+static const uint8_t IM_OFFLINE_AFTER_FAILURES = 3;
+// Probe backoff for offline slaves, doubled after every unanswered probe
+static const uint32_t IM_PROBE_BACKOFF_MIN_MS = 5000;
+static const uint32_t IM_PROBE_BACKOFF_MAX_MS = 300000;
+
+// Answers a slave gave for one PDU, kept per slave in an array parallel to
+// immergas_pdu_map. A PDU the slave keeps rejecting with "illegal data address"
+// is quarantined: left out of the read plan until the next retest.
+struct ImmergasPduStats {
+  uint16_t ok;
+  uint16_t exceptions;
+  uint16_t timeouts;  // no answer or a garbled one
+  uint8_t illegal_streak;  // consecutive "illegal data address" answers
+  bool quarantined : 1;
+  bool isolated : 1;  // read in a batch of its own to find out which PDU the slave rejects
+  bool unsupported : 1;  // rejected during startup discovery; never read
+};
+
+// "Illegal data address" answers in a row after which a PDU is quarantined
+static const uint8_t IM_QUARANTINE_AFTER_REJECTS = 3;
+// How long quarantined PDUs stay out of the read plan before they are tried again
+static const uint32_t IM_QUARANTINE_RETEST_MS = 6 * 3600 * 1000UL;
+
+// Link health of one slave. An offline slave is not swept; instead a single
+// probe read is sent on an exponential backoff until the slave answers again.
+struct ImmergasSlaveHealth {
+  bool online{true};
+  bool probe_queued{false};
+  uint8_t consecutive_failures{0};
+  uint32_t backoff_ms{0};
+  uint32_t next_probe_ms{0};
+  uint32_t successes{0};
+  uint32_t failures{0};
+  binary_sensor::BinarySensor *online_sensor{nullptr};
+  // On while any entity of the slave still shows a value restored from flash
+  binary_sensor::BinarySensor *restored_sensor{nullptr};
+  sensor::Sensor *successes_sensor{nullptr};
+  sensor::Sensor *failures_sensor{nullptr};
+};
+
+// Bus diagnostics, published by update() for the window since the previous update
+enum ImmergasBusMetric : uint8_t {
+  IM_BUS_UTILIZATION = 0,  // % of the window the bus was held by a transaction
+  IM_BUS_BYTES,            // request and response bytes in the window
+  IM_BUS_ROUND_TRIP_MIN,   // ms per transaction
+  IM_BUS_ROUND_TRIP_AVG,
+  IM_BUS_ROUND_TRIP_P95,
+  IM_BUS_TURNAROUND_MIN,   // ms from the end of a request to the first response byte
+  IM_BUS_TURNAROUND_AVG,
+  IM_BUS_TURNAROUND_P95,
+  IM_BUS_CYCLE_DURATION,   // ms from the start of the last complete hub poll cycle to its last response
+  IM_BUS_OVERRUNS,         // poll cycles that overran, all tiers, since boot
+  IM_BUS_METRIC_COUNT,
+};
+
+// Most recent samples kept per window for the percentile; min and avg cover every sample
+static const size_t IM_BUS_WINDOW_SAMPLES = 64;
+
+// Samples of one timing over a reporting window, without allocating
+struct ImmergasSampleWindow {
+  uint32_t samples[IM_BUS_WINDOW_SAMPLES];
+  uint32_t count;
+  uint32_t min;
+  uint64_t sum;
+
+  void add(uint32_t v) {
+    this->samples[this->count % IM_BUS_WINDOW_SAMPLES] = v;
+    this->min = this->count == 0 ? v : std::min(this->min, v);
+    this->sum += v;
+    this->count++;
+  }
+  uint32_t avg() const { return this->count == 0 ? 0 : static_cast<uint32_t>(this->sum / this->count); }
+  uint32_t p95() const {
+    size_t n = std::min<size_t>(this->count, IM_BUS_WINDOW_SAMPLES);
+    if (n == 0) return 0;
+    uint32_t sorted[IM_BUS_WINDOW_SAMPLES];
+    std::copy(this->samples, this->samples + n, sorted);
+    size_t k = (n * 95 + 99) / 100 - 1;
+    std::nth_element(sorted, sorted + k, sorted + n);
+    return sorted[k];
+  }
+  void reset() {
+    this->count = 0;
+    this->min = 0;
+    this->sum = 0;
+  }
+};
+
+struct ImmergasBusStats {
+  ImmergasSampleWindow round_trip_us;
+  ImmergasSampleWindow turnaround_us;
+  uint64_t busy_us;
+  uint32_t bytes;
+  uint32_t window_start_ms;
+  // The current hub (tier 0) poll cycle: batches still to be answered
+  uint32_t cycle_start_ms;
+  uint32_t cycle_pending;
+  uint32_t cycle_duration_ms;
+};
+
+// Shortest time between two saves of the last-known values to flash
+static const uint32_t IM_SNAPSHOT_SAVE_INTERVAL_MS = 15 * 60 * 1000UL;
+
+// Most registers one PDU occupies (32-bit values)
+static const uint8_t IM_MAX_PDU_REGISTERS = 2;
+
+// An encoded PDU write waiting for the bus. A newer write to the same PDU replaces
+// the pending value, and writes to adjacent registers of one slave share a frame.
+struct ImmergasPendingWrite {
+  uint8_t slave_id;
+  uint16_t pdu;
+  uint16_t reg_addr;
+  uint8_t count;
+  uint16_t values[IM_MAX_PDU_REGISTERS];
+};
+
+// All entities registered for one Modbus slave. The slave is polled once per
+// cycle and every decoded PDU value is fanned out through `subscribers`.
+struct ImmergasSlave {
+  uint8_t id;
+  std::vector<IM_Device *> devices;
+  std::map<uint16_t, std::vector<IM_Device *>> subscribers;  // pdu -> entities
+  // Read plan covering only the subscribed PDUs, rebuilt when entities are added
+  std::vector<ImmergasReadBatch> plan;
+  std::vector<uint16_t> plan_entries;
+  // Subscribers of each plan entry, so decoding dispatches without a map lookup
+  std::vector<const std::vector<IM_Device *> *> plan_subscribers;
+  // Gap registers that made the slave answer "illegal data address"; never bridged again
+  std::set<uint16_t> no_bridge;
+  ImmergasSlaveHealth health;
+  std::vector<ImmergasPduStats> pdu_stats;  // indexed like immergas_pdu_map
+  uint16_t quarantined;
+  uint32_t quarantine_retest_ms;
+  // Startup discovery: ranges [first, last] of map entries still to read, split in
+  // half when rejected. The slave is not polled until the stack is empty.
+  std::vector<std::pair<uint16_t, uint16_t>> discovery;
+  bool discovering;
+  bool sweep_pending;  // sweep once the rebuilt plan is in place, e.g. after discovery
+  // Last decoded value of every map entry (NAN if never read), saved to flash and
+  // published as stale state on the next boot
+  std::vector<float> snapshot;
+  bool snapshot_dirty;
+  uint16_t stale_devices;  // entities showing a restored value that was not read since boot
+};
 
 class ImmergasModbus : public PollingComponent {
  public:
@@ -16,24 +202,144 @@ class ImmergasModbus : public PollingComponent {
   ImmergasModbus(IM_Client *client) : PollingComponent(15000), client_(client) {}
 
   void setup() override;
+  void loop() override;
   void update() override;
+  void on_shutdown() override;
 
   void set_debug_log_messages(bool v) { this->debug_logs_ = v; }
   void set_language(const std::string &lang) { this->language_ = lang; }
+  // Label catalog embedded by the codegen with `fault_text: true`, see im_labels.h
+  void set_label_catalog(const uint8_t *data) { this->labels_ = ImmergasLabelCatalog(data); }
+  // Text of boiler fault `code` in the configured language, e.g. for a template text_sensor;
+  // nullptr if no catalog is embedded
+  const char *fault_text(uint16_t code, ImmergasLabelField field = IM_LABEL_TEXT1) const {
+    return this->labels_.text(this->labels_.language_index(this->language_.c_str()), code, field);
+  }
+  // Probe which PDUs each slave supports on first boot, see start_discovery_()
+  void set_discovery(bool v) { this->discovery_ = v; }
+  // Keep the last-known values in flash and publish them at boot, see restore_snapshots_()
+  void set_restore_values(bool v) { this->restore_values_ = v; }
+  // Time loop() may spend before it leaves the next transaction to the next iteration
+  void set_loop_budget(uint32_t budget_ms) { this->loop_budget_ms_ = budget_ms; }
   void register_device(IM_Device *dev);
+  // Read plan computed by the codegen for the map with `map_hash` and bridging gaps up to `max_gap`
+  // registers. Slaves start from it instead of planning at runtime until they deviate from it.
+  void set_static_plan(const ImmergasStaticBatch *batches, size_t batch_count, const uint16_t *entries,
+                       uint32_t map_hash, uint16_t max_gap) {
+    this->static_batches_ = batches;
+    this->static_batch_count_ = batch_count;
+    this->static_entries_ = entries;
+    this->static_map_hash_ = map_hash;
+    this->static_max_gap_ = max_gap;
+  }
 
-  // Low-level Modbus RTU read: read `count` holding registers at `reg_addr`
-  // Returns true on success and fills `out` with register values.
-  bool read_holding_registers(uint8_t slave_id, uint16_t reg_addr, uint16_t count, std::vector<uint16_t> &out);
-  // Write multiple registers helper (function 0x10)
-  bool write_multiple_registers(uint8_t slave_id, uint16_t reg_addr, const std::vector<uint16_t> &values);
-  // Encode and write a PDU by pdu id, converting the float `value` according to the mapped type/scale
+  // Encode a PDU write by pdu id, converting the float `value` according to the mapped type/scale,
+  // and queue it for the bus. Returns false if the PDU is unknown; the outcome is logged later.
   bool write_pdu_by_value(uint8_t slave_id, uint16_t pdu, float value);
+  // Same, for callers that already resolved the PDU map entry
+  bool write_pdu(uint8_t slave_id, const ImmergasPduEntry &entry, float value);
+
+  // Diagnostics: answer counters of `pdu` on slave `slave_id`, or nullptr if either is unknown
+  const ImmergasPduStats *get_pdu_stats(uint8_t slave_id, uint16_t pdu);
+  // Log the counters of every PDU that failed at least once
+  void log_pdu_stats();
+
+  // Optional diagnostics for the slave of hub device `dev`
+  void set_online_sensor(IM_Device *dev, binary_sensor::BinarySensor *sensor);
+  void set_restored_sensor(IM_Device *dev, binary_sensor::BinarySensor *sensor);
+  void set_successes_sensor(IM_Device *dev, sensor::Sensor *sensor);
+  void set_failures_sensor(IM_Device *dev, sensor::Sensor *sensor);
+  // Optional bus diagnostics of the hub
+  void set_bus_sensor(ImmergasBusMetric metric, sensor::Sensor *sensor) { this->bus_sensors_[metric] = sensor; }
+
+ protected:
+  ImmergasSlave *get_or_create_slave_(uint8_t slave_id);
+  ImmergasSlave *find_slave_(uint8_t slave_id);
+  // Count a transaction with `slave` and take it offline or back online
+  void record_result_(ImmergasSlave &slave, bool answered);
+  void publish_health_(ImmergasSlave &slave);
+  // Add the bus time of one finished transaction to the current window
+  void record_timing_(const ImmergasResponse &response);
+  // A tier 0 batch of the current cycle was answered or dropped
+  void count_cycle_batch_(const ImmergasReadBatch &batch);
+  // Publish the bus diagnostics of the window since the last call and start a new one
+  void publish_bus_stats_();
+  // Queue a probe for every offline slave whose backoff has expired
+  void schedule_probes_();
+  // Rebuild the polling tiers and every slave's read plan
+  void rebuild_read_plans_();
+  bool can_rebuild_read_plans_() const;
+  // Update interval for `pdu` on `slave`: the fastest one requested by its subscribers
+  uint32_t pdu_interval_(const ImmergasSlave &slave, uint16_t pdu) const;
+  uint8_t tier_for_interval_(uint32_t interval_ms);
+  // Rebuild `slave.plan` from the set of PDUs its entities subscribe to, batched per tier
+  void build_read_plan_(ImmergasSlave &slave);
+  // Take `slave.plan` from the static plan if it still describes the slave; false leaves the plan empty
+  bool use_static_plan_(ImmergasSlave &slave);
+  // Largest run of unused registers worth reading to save one extra request/response round trip
+  uint16_t max_bridge_gap_() const;
+  // Remember the gap registers of a batch the slave rejected so the planner stops bridging them.
+  // Returns false if the batch has no gaps, i.e. one of its PDUs was rejected.
+  bool learn_rejected_gaps_(ImmergasSlave &slave, const ImmergasReadBatch &batch);
+  // Narrow a rejected gap-free batch down to its PDU and quarantine it once it keeps failing
+  void reject_pdus_(ImmergasSlave &slave, const ImmergasReadBatch &batch);
+  void count_batch_result_(ImmergasSlave &slave, const ImmergasReadBatch &batch, const ImmergasResponse &response);
+  // Put quarantined PDUs whose retest time has come back into the read plan
+  void retest_quarantined_();
+  // Load the PDUs `slaves_[slave_index]` supports from preferences, or queue their discovery
+  void start_discovery_(uint8_t slave_index);
+  void handle_discovery_response_(uint8_t slave_index, const ImmergasResponse &response);
+  void finish_discovery_(ImmergasSlave &slave);
+  void mark_unsupported_(ImmergasSlave &slave, uint16_t index);
+  // Publish the values saved by the previous boot, flagged stale until they are read again
+  void restore_snapshots_();
+  // Save the snapshots that changed since they were last saved
+  void save_snapshots_();
+  // Queue the batches of `tier` once for every slave
+  void poll_tier_(uint8_t tier);
+  // Queue every batch of one slave that is not queued yet
+  void sweep_slave_(uint8_t slave_index);
+  void push_read_(const ImmergasPendingRead &read);
+  bool pop_read_(ImmergasPendingRead *read);
+  // Hand the next pending write, or else read, to the client when it is idle. Called once per loop().
+  void start_next_transaction_();
+  // Send the oldest pending write merged with pending writes to adjacent registers
+  void start_next_write_();
+  void handle_read_response_(uint8_t slave_index, uint16_t batch_index, const ImmergasResponse &response);
+  void handle_probe_response_(uint8_t slave_index, const ImmergasResponse &response);
+  // Decode the PDUs of `batch` from its registers and dispatch them to their subscribers
+  void decode_batch_(ImmergasSlave &slave, const ImmergasReadBatch &batch, const ImmergasRegisterView &regs);
+  void dispatch_(ImmergasSlave &slave, const std::vector<IM_Device *> &subscribers, uint16_t pdu, float value);
+  // Drop the stale flag of `dev`, or of every subscriber of map entry `index` once it is no longer polled
+  void clear_stale_(ImmergasSlave &slave, IM_Device *dev);
+  void release_stale_(ImmergasSlave &slave, uint16_t index);
 
  private:
   bool debug_logs_{false};
+  bool discovery_{true};
+  bool restore_values_{true};
+  uint32_t snapshot_saved_ms_{0};
+  uint32_t loop_budget_ms_{20};
+  HighFrequencyLoopRequester high_freq_;
+  const ImmergasStaticBatch *static_batches_{nullptr};
+  size_t static_batch_count_{0};
+  const uint16_t *static_entries_{nullptr};
+  uint32_t static_map_hash_{0};
+  uint16_t static_max_gap_{0};
+  ImmergasBusStats bus_stats_{};
+  sensor::Sensor *bus_sensors_[IM_BUS_METRIC_COUNT]{};
   std::string language_{"en"};
+  ImmergasLabelCatalog labels_{};
   std::vector<IM_Device *> devices_;
+  std::vector<ImmergasSlave> slaves_;
+  std::vector<ImmergasPollTier> tiers_;
+  bool plan_dirty_{true};
+  // Fixed ring of pending reads, sized to the number of batches plus one probe and one discovery
+  // read per slave when the plans are rebuilt. Each batch is queued at most once, so polling never grows it.
+  std::vector<ImmergasPendingRead> read_queue_;
+  size_t read_head_{0};
+  size_t read_count_{0};
+  std::vector<ImmergasPendingWrite> write_queue_;
   IM_Client *client_;
 };
 
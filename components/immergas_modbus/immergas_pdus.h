@@ -1,125 +1,200 @@
 #pragma once
+// Generated by tools/generate_pdus_header.py: the full map, used unless the ESPHome
+// codegen emitted immergas_pdus_config.h with only the PDUs the configuration uses.
+#if __has_include("immergas_pdus_config.h")
+#include "immergas_pdus_config.h"
+#else
+#include <cstddef>
 #include <cstdint>
 namespace esphome { namespace immergas_modbus {
-enum ImmergasPduType : uint8_t { IM_PDU_UNKNOWN=0, IM_PDU_U16=1, IM_PDU_S16=2, IM_PDU_U8=3, IM_PDU_TEMP=4, IM_PDU_LB_FLAG8=5 };
+enum ImmergasPduType : uint8_t { IM_PDU_UNKNOWN=0, IM_PDU_U16=1, IM_PDU_S16=2, IM_PDU_U8=3, IM_PDU_TEMP=4, IM_PDU_LB_FLAG8=5, IM_PDU_U32=6, IM_PDU_S32=7, IM_PDU_FLOAT32=8 };
 
-struct ImmergasPduEntry { uint16_t pdu; uint16_t reg_addr; uint8_t count; uint8_t type; float scale; bool writable; };
+// `word_swap`: a 32-bit value stores its low word in the first register
+struct ImmergasPduEntry { uint16_t pdu; uint16_t reg_addr; uint8_t count; uint8_t type; float scale; bool writable; bool word_swap; const char *label; };
 
 static const ImmergasPduEntry immergas_pdu_map[] = {
-    { 2000, 2000, 1, 1, 1.000000f, true },
-    { 2001, 2001, 1, 5, 1.000000f, false },
-    { 2010, 2010, 1, 5, 1.000000f, false },
-    { 2011, 2011, 1, 4, 1.000000f, false },
-    { 2015, 2015, 1, 4, 1.000000f, true },
-    { 2020, 2020, 1, 5, 1.000000f, false },
-    { 2021, 2021, 1, 4, 1.000000f, false },
-    { 2025, 2025, 1, 4, 1.000000f, true },
-    { 2030, 2030, 1, 5, 1.000000f, false },
-    { 2031, 2031, 1, 4, 1.000000f, false },
-    { 2035, 2035, 1, 4, 1.000000f, true },
-    { 2040, 2040, 1, 5, 1.000000f, false },
-    { 2041, 2041, 1, 4, 1.000000f, false },
-    { 2045, 2045, 1, 4, 1.000000f, true },
-    { 2095, 2095, 1, 4, 1.000000f, true },
-    { 2100, 2100, 1, 1, 1.000000f, false },
-    { 2101, 2101, 1, 0, 1.000000f, false },
-    { 2210, 2210, 1, 4, 0.100000f, true },
-    { 2211, 2211, 1, 4, 0.100000f, true },
-    { 2214, 2214, 1, 4, 0.100000f, true },
-    { 2215, 2215, 1, 4, 0.100000f, true },
-    { 2216, 2216, 1, 5, 1.000000f, true },
-    { 2217, 2217, 1, 4, 1.000000f, true },
-    { 2218, 2218, 1, 4, 1.000000f, true },
-    { 2220, 2220, 1, 4, 0.100000f, true },
-    { 2221, 2221, 1, 4, 0.100000f, true },
-    { 2224, 2224, 1, 4, 0.100000f, true },
-    { 2225, 2225, 1, 4, 0.100000f, true },
-    { 2226, 2226, 1, 5, 1.000000f, true },
-    { 2227, 2227, 1, 4, 1.000000f, true },
-    { 2228, 2228, 1, 4, 1.000000f, true },
-    { 2230, 2230, 1, 4, 0.100000f, true },
-    { 2231, 2231, 1, 4, 0.100000f, true },
-    { 2234, 2234, 1, 4, 0.100000f, true },
-    { 2235, 2235, 1, 4, 0.100000f, true },
-    { 2236, 2236, 1, 5, 1.000000f, true },
-    { 2237, 2237, 1, 4, 1.000000f, true },
-    { 2238, 2238, 1, 4, 1.000000f, true },
-    { 2240, 2240, 1, 4, 0.100000f, true },
-    { 2241, 2241, 1, 4, 0.100000f, true },
-    { 2244, 2244, 1, 4, 0.100000f, true },
-    { 2245, 2245, 1, 4, 0.100000f, true },
-    { 2246, 2246, 1, 5, 1.000000f, true },
-    { 2247, 2247, 1, 4, 1.000000f, true },
-    { 2248, 2248, 1, 4, 1.000000f, true },
-    { 2310, 2310, 1, 0, 1.000000f, false },
-    { 2311, 2311, 1, 0, 1.000000f, false },
-    { 2312, 2312, 1, 0, 1.000000f, false },
-    { 2313, 2313, 1, 0, 1.000000f, false },
-    { 2314, 2314, 1, 0, 1.000000f, false },
-    { 2315, 2315, 1, 0, 1.000000f, false },
-    { 2316, 2316, 1, 0, 1.000000f, false },
-    { 2317, 2317, 1, 0, 1.000000f, false },
-    { 2320, 2320, 1, 0, 1.000000f, false },
-    { 2321, 2321, 1, 0, 1.000000f, false },
-    { 2322, 2322, 1, 0, 1.000000f, false },
-    { 2323, 2323, 1, 0, 1.000000f, false },
-    { 2324, 2324, 1, 0, 1.000000f, false },
-    { 2325, 2325, 1, 0, 1.000000f, false },
-    { 2326, 2326, 1, 0, 1.000000f, false },
-    { 2327, 2327, 1, 0, 1.000000f, false },
-    { 2330, 2330, 1, 0, 1.000000f, false },
-    { 2331, 2331, 1, 0, 1.000000f, false },
-    { 2332, 2332, 1, 0, 1.000000f, false },
-    { 2333, 2333, 1, 0, 1.000000f, false },
-    { 2334, 2334, 1, 0, 1.000000f, false },
-    { 2335, 2335, 1, 0, 1.000000f, false },
-    { 2336, 2336, 1, 0, 1.000000f, false },
-    { 2337, 2337, 1, 0, 1.000000f, false },
-    { 2340, 2340, 1, 0, 1.000000f, false },
-    { 2341, 2341, 1, 0, 1.000000f, false },
-    { 2342, 2342, 1, 0, 1.000000f, false },
-    { 2343, 2343, 1, 0, 1.000000f, false },
-    { 2344, 2344, 1, 0, 1.000000f, false },
-    { 2345, 2345, 1, 0, 1.000000f, false },
-    { 2346, 2346, 1, 0, 1.000000f, false },
-    { 2347, 2347, 1, 0, 1.000000f, false },
-    { 2410, 2410, 1, 5, 1.000000f, true },
-    { 2411, 2411, 1, 5, 1.000000f, true },
-    { 2412, 2412, 1, 5, 1.000000f, true },
-    { 2413, 2413, 1, 5, 1.000000f, true },
-    { 2414, 2414, 1, 5, 1.000000f, true },
-    { 2415, 2415, 1, 5, 1.000000f, true },
-    { 2416, 2416, 1, 5, 1.000000f, true },
-    { 2420, 2420, 1, 5, 1.000000f, true },
-    { 2421, 2421, 1, 5, 1.000000f, true },
-    { 2422, 2422, 1, 5, 1.000000f, true },
-    { 2423, 2423, 1, 5, 1.000000f, true },
-    { 2424, 2424, 1, 5, 1.000000f, true },
-    { 2425, 2425, 1, 5, 1.000000f, true },
-    { 2426, 2426, 1, 5, 1.000000f, true },
-    { 2430, 2430, 1, 5, 1.000000f, true },
-    { 2431, 2431, 1, 5, 1.000000f, true },
-    { 2432, 2432, 1, 5, 1.000000f, true },
-    { 2433, 2433, 1, 5, 1.000000f, true },
-    { 2434, 2434, 1, 5, 1.000000f, true },
-    { 2435, 2435, 1, 5, 1.000000f, true },
-    { 2436, 2436, 1, 5, 1.000000f, true },
-    { 2440, 2440, 1, 5, 1.000000f, true },
-    { 2441, 2441, 1, 5, 1.000000f, true },
-    { 2442, 2442, 1, 5, 1.000000f, true },
-    { 2443, 2443, 1, 5, 1.000000f, true },
-    { 2444, 2444, 1, 5, 1.000000f, true },
-    { 2445, 2445, 1, 5, 1.000000f, true },
-    { 2446, 2446, 1, 5, 1.000000f, true },
-    { 2490, 2490, 1, 1, 1.000000f, true },
-    { 2491, 2491, 1, 1, 1.000000f, true },
-    { 2492, 2492, 1, 1, 1.000000f, true },
-    { 2493, 2493, 1, 1, 1.000000f, true },
-    { 2494, 2494, 1, 1, 1.000000f, true },
-    { 2495, 2495, 1, 1, 1.000000f, true },
-    { 2496, 2496, 1, 1, 1.000000f, true },
-    { 3002, 3002, 1, 4, 1.000000f, false },
-    { 3016, 3016, 1, 4, 1.000000f, false },
+    { 2000, 2000, 1, 1, 1.000000f, true, false, "" },
+    { 2001, 2001, 1, 5, 1.000000f, false, false, "" },
+    { 2010, 2010, 1, 5, 1.000000f, false, false, "" },
+    { 2011, 2011, 1, 4, 1.000000f, false, false, "" },
+    { 2015, 2015, 1, 4, 1.000000f, true, false, "" },
+    { 2020, 2020, 1, 5, 1.000000f, false, false, "" },
+    { 2021, 2021, 1, 4, 1.000000f, false, false, "" },
+    { 2025, 2025, 1, 4, 1.000000f, true, false, "" },
+    { 2030, 2030, 1, 5, 1.000000f, false, false, "" },
+    { 2031, 2031, 1, 4, 1.000000f, false, false, "" },
+    { 2035, 2035, 1, 4, 1.000000f, true, false, "" },
+    { 2040, 2040, 1, 5, 1.000000f, false, false, "" },
+    { 2041, 2041, 1, 4, 1.000000f, false, false, "" },
+    { 2045, 2045, 1, 4, 1.000000f, true, false, "" },
+    { 2095, 2095, 1, 4, 1.000000f, true, false, "" },
+    { 2100, 2100, 1, 1, 1.000000f, false, false, "" },
+    { 2101, 2101, 1, 5, 1.000000f, false, false, "" },
+    { 2210, 2210, 1, 4, 0.100000f, true, false, "" },
+    { 2211, 2211, 1, 4, 0.100000f, true, false, "" },
+    { 2214, 2214, 1, 4, 0.100000f, true, false, "" },
+    { 2215, 2215, 1, 4, 0.100000f, true, false, "" },
+    { 2216, 2216, 1, 5, 1.000000f, true, false, "" },
+    { 2217, 2217, 1, 4, 1.000000f, true, false, "" },
+    { 2218, 2218, 1, 4, 1.000000f, true, false, "" },
+    { 2220, 2220, 1, 4, 0.100000f, true, false, "" },
+    { 2221, 2221, 1, 4, 0.100000f, true, false, "" },
+    { 2224, 2224, 1, 4, 0.100000f, true, false, "" },
+    { 2225, 2225, 1, 4, 0.100000f, true, false, "" },
+    { 2226, 2226, 1, 5, 1.000000f, true, false, "" },
+    { 2227, 2227, 1, 4, 1.000000f, true, false, "" },
+    { 2228, 2228, 1, 4, 1.000000f, true, false, "" },
+    { 2230, 2230, 1, 4, 0.100000f, true, false, "" },
+    { 2231, 2231, 1, 4, 0.100000f, true, false, "" },
+    { 2234, 2234, 1, 4, 0.100000f, true, false, "" },
+    { 2235, 2235, 1, 4, 0.100000f, true, false, "" },
+    { 2236, 2236, 1, 5, 1.000000f, true, false, "" },
+    { 2237, 2237, 1, 4, 1.000000f, true, false, "" },
+    { 2238, 2238, 1, 4, 1.000000f, true, false, "" },
+    { 2240, 2240, 1, 4, 0.100000f, true, false, "" },
+    { 2241, 2241, 1, 4, 0.100000f, true, false, "" },
+    { 2244, 2244, 1, 4, 0.100000f, true, false, "" },
+    { 2245, 2245, 1, 4, 0.100000f, true, false, "" },
+    { 2246, 2246, 1, 5, 1.000000f, true, false, "" },
+    { 2247, 2247, 1, 4, 1.000000f, true, false, "" },
+    { 2248, 2248, 1, 4, 1.000000f, true, false, "" },
+    { 2310, 2310, 1, 0, 1.000000f, false, false, "" },
+    { 2311, 2311, 1, 0, 1.000000f, false, false, "" },
+    { 2312, 2312, 1, 0, 1.000000f, false, false, "" },
+    { 2313, 2313, 1, 0, 1.000000f, false, false, "" },
+    { 2314, 2314, 1, 0, 1.000000f, false, false, "" },
+    { 2315, 2315, 1, 0, 1.000000f, false, false, "" },
+    { 2316, 2316, 1, 0, 1.000000f, false, false, "" },
+    { 2317, 2317, 1, 0, 1.000000f, false, false, "" },
+    { 2320, 2320, 1, 0, 1.000000f, false, false, "" },
+    { 2321, 2321, 1, 0, 1.000000f, false, false, "" },
+    { 2322, 2322, 1, 0, 1.000000f, false, false, "" },
+    { 2323, 2323, 1, 0, 1.000000f, false, false, "" },
+    { 2324, 2324, 1, 0, 1.000000f, false, false, "" },
+    { 2325, 2325, 1, 0, 1.000000f, false, false, "" },
+    { 2326, 2326, 1, 0, 1.000000f, false, false, "" },
+    { 2327, 2327, 1, 0, 1.000000f, false, false, "" },
+    { 2330, 2330, 1, 0, 1.000000f, false, false, "" },
+    { 2331, 2331, 1, 0, 1.000000f, false, false, "" },
+    { 2332, 2332, 1, 0, 1.000000f, false, false, "" },
+    { 2333, 2333, 1, 0, 1.000000f, false, false, "" },
+    { 2334, 2334, 1, 0, 1.000000f, false, false, "" },
+    { 2335, 2335, 1, 0, 1.000000f, false, false, "" },
+    { 2336, 2336, 1, 0, 1.000000f, false, false, "" },
+    { 2337, 2337, 1, 0, 1.000000f, false, false, "" },
+    { 2340, 2340, 1, 0, 1.000000f, false, false, "" },
+    { 2341, 2341, 1, 0, 1.000000f, false, false, "" },
+    { 2342, 2342, 1, 0, 1.000000f, false, false, "" },
+    { 2343, 2343, 1, 0, 1.000000f, false, false, "" },
+    { 2344, 2344, 1, 0, 1.000000f, false, false, "" },
+    { 2345, 2345, 1, 0, 1.000000f, false, false, "" },
+    { 2346, 2346, 1, 0, 1.000000f, false, false, "" },
+    { 2347, 2347, 1, 0, 1.000000f, false, false, "" },
+    { 2410, 2410, 1, 5, 1.000000f, true, false, "" },
+    { 2411, 2411, 1, 5, 1.000000f, true, false, "" },
+    { 2412, 2412, 1, 5, 1.000000f, true, false, "" },
+    { 2413, 2413, 1, 5, 1.000000f, true, false, "" },
+    { 2414, 2414, 1, 5, 1.000000f, true, false, "" },
+    { 2415, 2415, 1, 5, 1.000000f, true, false, "" },
+    { 2416, 2416, 1, 5, 1.000000f, true, false, "" },
+    { 2420, 2420, 1, 5, 1.000000f, true, false, "" },
+    { 2421, 2421, 1, 5, 1.000000f, true, false, "" },
+    { 2422, 2422, 1, 5, 1.000000f, true, false, "" },
+    { 2423, 2423, 1, 5, 1.000000f, true, false, "" },
+    { 2424, 2424, 1, 5, 1.000000f, true, false, "" },
+    { 2425, 2425, 1, 5, 1.000000f, true, false, "" },
+    { 2426, 2426, 1, 5, 1.000000f, true, false, "" },
+    { 2430, 2430, 1, 5, 1.000000f, true, false, "" },
+    { 2431, 2431, 1, 5, 1.000000f, true, false, "" },
+    { 2432, 2432, 1, 5, 1.000000f, true, false, "" },
+    { 2433, 2433, 1, 5, 1.000000f, true, false, "" },
+    { 2434, 2434, 1, 5, 1.000000f, true, false, "" },
+    { 2435, 2435, 1, 5, 1.000000f, true, false, "" },
+    { 2436, 2436, 1, 5, 1.000000f, true, false, "" },
+    { 2440, 2440, 1, 5, 1.000000f, true, false, "" },
+    { 2441, 2441, 1, 5, 1.000000f, true, false, "" },
+    { 2442, 2442, 1, 5, 1.000000f, true, false, "" },
+    { 2443, 2443, 1, 5, 1.000000f, true, false, "" },
+    { 2444, 2444, 1, 5, 1.000000f, true, false, "" },
+    { 2445, 2445, 1, 5, 1.000000f, true, false, "" },
+    { 2446, 2446, 1, 5, 1.000000f, true, false, "" },
+    { 2490, 2490, 1, 1, 1.000000f, true, false, "" },
+    { 2491, 2491, 1, 1, 1.000000f, true, false, "" },
+    { 2492, 2492, 1, 1, 1.000000f, true, false, "" },
+    { 2493, 2493, 1, 1, 1.000000f, true, false, "" },
+    { 2494, 2494, 1, 1, 1.000000f, true, false, "" },
+    { 2495, 2495, 1, 1, 1.000000f, true, false, "" },
+    { 2496, 2496, 1, 1, 1.000000f, true, false, "" },
+    { 3002, 3002, 1, 4, 1.000000f, false, false, "" },
+    { 3016, 3016, 1, 4, 1.000000f, false, false, "" },
 };
 static const size_t immergas_pdu_map_len = sizeof(immergas_pdu_map)/sizeof(immergas_pdu_map[0]);
-}} // namespace esphome::immergas_modbus
\ No newline at end of file
+static const uint32_t immergas_pdu_map_hash = 0xF56DD876;
+
+// The full map, which the entries above may be a subset of
+static const uint32_t immergas_pdu_layout_hash = 0xF56DD876;
+static const size_t immergas_pdu_layout_len = 114;
+// Position of immergas_pdu_map[i] in the full map
+static const uint16_t immergas_pdu_layout_index[] = {
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47,
+    48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63,
+    64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79,
+    80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95,
+    96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111,
+    112, 113,
+};
+
+// Indices into immergas_pdu_map sorted by PDU id
+static const uint16_t immergas_pdu_index[] = {
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47,
+    48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63,
+    64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79,
+    80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95,
+    96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111,
+    112, 113,
+};
+
+// Map entry for `pdu`, or nullptr if the PDU is unknown
+inline const ImmergasPduEntry *immergas_find_pdu(uint16_t pdu) {
+  size_t lo = 0, hi = immergas_pdu_map_len;
+  while (lo < hi) {
+    size_t mid = (lo + hi) / 2;
+    const ImmergasPduEntry &e = immergas_pdu_map[immergas_pdu_index[mid]];
+    if (e.pdu == pdu) return &e;
+    if (e.pdu < pdu) lo = mid + 1; else hi = mid;
+  }
+  return nullptr;
+}
+
+struct ImmergasPduBit { uint16_t pdu; uint8_t bit; const char *item; };
+
+// Bits of LB flag8 registers, sorted by PDU id and bit
+static const ImmergasPduBit immergas_pdu_bits[] = {
+    { 2001, 0, "mb-water-request" },
+    { 2001, 2, "mb-functional-log" },
+    { 2010, 3, "mb-heating-request" },
+    { 2020, 3, "mb-heating-request" },
+    { 2030, 3, "mb-heating-request" },
+    { 2040, 3, "mb-heating-request" },
+    { 2101, 1, "reset" },
+};
+static const size_t immergas_pdu_bits_len = sizeof(immergas_pdu_bits)/sizeof(immergas_pdu_bits[0]);
+
+// Flag at `bit` of `pdu`, or nullptr if the map knows none
+inline const ImmergasPduBit *immergas_find_pdu_bit(uint16_t pdu, uint8_t bit) {
+  size_t lo = 0, hi = immergas_pdu_bits_len;
+  while (lo < hi) {
+    size_t mid = (lo + hi) / 2;
+    const ImmergasPduBit &b = immergas_pdu_bits[mid];
+    if (b.pdu == pdu && b.bit == bit) return &b;
+    if (b.pdu < pdu || (b.pdu == pdu && b.bit < bit)) lo = mid + 1; else hi = mid;
+  }
+  return nullptr;
+}
+}} // namespace esphome::immergas_modbus
+
+#endif
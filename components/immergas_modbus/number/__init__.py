@@ -1,13 +1,15 @@
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import number
-from esphome.const import CONF_MAX_VALUE, CONF_MIN_VALUE, CONF_STEP
+from esphome.const import CONF_MAX_VALUE, CONF_MIN_VALUE, CONF_STEP, CONF_UPDATE_INTERVAL
 from ..immergas.const import IM_LABEL, IM_MESSAGE, IM_MODE
-from ..immergas.labels_en import immergas_labels
 from ..immergas.auto_entities import numbers as auto_numbers_map
 from .. import (
     IM_CONTROLLER_ID,
     IM_DEVICE_ID,
+    NUMERIC_PUBLISH_SCHEMA,
+    register_subscription,
+    setup_publish_options,
     IM_Number,
 )
 
@@ -20,7 +22,7 @@ def validate(config):
     if IM_MESSAGE in config:
         mapped = auto_numbers_map.get(config[IM_MESSAGE]) if auto_numbers_map is not None else None
         if mapped is not None:
-            config[IM_LABEL] = mapped.get(IM_LABEL, immergas_labels.get(config[IM_MESSAGE], "IM_UNKNOWN_LABEL"))
+            config[IM_LABEL] = mapped.get(IM_LABEL, "IM_UNKNOWN_LABEL")
             config[IM_MODE] = mapped.get(IM_MODE, "CONTROL")
             defaults = mapped.get('defaults', {})
             if defaults.get('min') is not None:
@@ -30,7 +32,7 @@ def validate(config):
             if defaults.get('step') is not None:
                 config[CONF_STEP] = defaults.get('step')
         else:
-            config[IM_LABEL] = immergas_labels.get(config[IM_MESSAGE], "IM_UNKNOWN_LABEL")
+            config[IM_LABEL] = "IM_UNKNOWN_LABEL"
     return config
 
 
@@ -44,7 +46,9 @@ CONFIG_SCHEMA = cv.All(
         cv.Required(CONF_MIN_VALUE): cv.float_,
         cv.Required(CONF_MAX_VALUE): cv.float_,
         cv.Required(CONF_STEP): cv.positive_float,
+        cv.Optional(CONF_UPDATE_INTERVAL): cv.update_interval,
     })
+    .extend(NUMERIC_PUBLISH_SCHEMA)
     .extend({cv.GenerateID(IM_CONTROLLER_ID): cv.use_id, cv.GenerateID(IM_DEVICE_ID): cv.use_id})
 )
 
@@ -54,14 +58,14 @@ async def to_code(config):
     controller = await cg.get_variable(config[IM_CONTROLLER_ID])
     var_number = await number.new_number(
         config,
-        config[IM_LABEL],
-        config[IM_MESSAGE],
-        config.get(IM_MODE, "CONTROL"),
-        device,
+        device.get_address(),
         min_value=config[CONF_MIN_VALUE],
         max_value=config[CONF_MAX_VALUE],
         step=config[CONF_STEP]
     )
     cg.add(var_number.set_pdu(config[IM_MESSAGE]))
-    cg.add(var_number.set_parent(controller))
+    if CONF_UPDATE_INTERVAL in config:
+        cg.add(var_number.set_update_interval(config[CONF_UPDATE_INTERVAL]))
+    setup_publish_options(var_number, config)
     cg.add(controller.register_device(var_number))
+    register_subscription(config)
@@ -1,9 +1,8 @@
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import sensor
-from esphome.const import CONF_DEFAULTS, CONF_FILTERS
+from esphome.const import CONF_DEFAULTS, CONF_FILTERS, CONF_UPDATE_INTERVAL
 from ..immergas.const import IM_LABEL, IM_MESSAGE, IM_MODE
-from ..immergas.labels_en import immergas_labels
 try:
     from ..immergas.auto_entities import sensors as auto_sensors_map
 except Exception:
@@ -11,6 +10,10 @@ except Exception:
 from .. import (
     IM_CONTROLLER_ID,
     IM_DEVICE_ID,
+    NUMERIC_PUBLISH_SCHEMA,
+    register_subscription,
+    setup_publish_options,
+    IM_Sensor,
 )
 
 
@@ -22,7 +25,7 @@ def validate(config):
     if IM_MESSAGE in config:
         # If a generated sensors map exists, prefer its defaults (label, mode, defaults)
         if auto_sensors_map and (mapped := auto_sensors_map.get(config[IM_MESSAGE])) is not None:
-            config[IM_LABEL] = mapped.get(IM_LABEL, immergas_labels.get(config[IM_MESSAGE], "IM_UNKNOWN_LABEL"))
+            config[IM_LABEL] = mapped.get(IM_LABEL, "IM_UNKNOWN_LABEL")
             if mapped.get(IM_MODE) is not None:
                 config[IM_MODE] = mapped.get(IM_MODE)
             # apply any default keys provided by the mapper
@@ -30,31 +33,37 @@ def validate(config):
                 config.setdefault(key, value)
             cv._LOGGER.log(cv.logging.INFO, f"Auto configured Immergas message {config[IM_MESSAGE]} from auto_entities map")
         else:
-            label = immergas_labels.get(config[IM_MESSAGE], "IM_UNKNOWN_LABEL")
-            config[IM_LABEL] = label
+            config[IM_LABEL] = "IM_UNKNOWN_LABEL"
             cv._LOGGER.log(cv.logging.INFO, f"Auto configured Immergas message {config[IM_MESSAGE]} as sensor")
     return config
 
 
 n_schema = cv.All(
-    cv.Schema({cv.Required(IM_MESSAGE): cv.hex_int}, extra=cv.ALLOW_EXTRA),
+    cv.Schema({cv.GenerateID(): cv.declare_id(IM_Sensor), cv.Required(IM_MESSAGE): cv.hex_int}, extra=cv.ALLOW_EXTRA),
     validate,
 )
 
 CONFIG_SCHEMA = cv.All(
     n_schema,
-    sensor.sensor_schema(cg.Component)
+    sensor.sensor_schema(IM_Sensor)
     .extend({
-        cv.GenerateID(): cv.declare_id(cg.Component),
+        cv.GenerateID(): cv.declare_id(IM_Sensor),
         cv.Required(IM_MESSAGE): cv.hex_int,
         cv.Optional(CONF_FILTERS): sensor.validate_filters,
+        cv.Optional(CONF_UPDATE_INTERVAL): cv.update_interval,
     })
-    .extend({cv.GenerateID(IM_CONTROLLER_ID): cv.use_id}),
+    .extend(NUMERIC_PUBLISH_SCHEMA)
+    .extend({cv.GenerateID(IM_CONTROLLER_ID): cv.use_id, cv.GenerateID(IM_DEVICE_ID): cv.use_id}),
 )
 
 
 async def to_code(config):
+    device = await cg.get_variable(config[IM_DEVICE_ID])
     controller = await cg.get_variable(config[IM_CONTROLLER_ID])
-    var = await sensor.new_sensor(config, config[IM_LABEL], config[IM_MESSAGE], config.get(IM_MODE, "STATUS"), controller)
-    cg.add(var.set_parent(controller))
-    cg.add(controller.register_component(var))
+    var = await sensor.new_sensor(config, device.get_address())
+    cg.add(var.set_pdu(config[IM_MESSAGE]))
+    if CONF_UPDATE_INTERVAL in config:
+        cg.add(var.set_update_interval(config[CONF_UPDATE_INTERVAL]))
+    setup_publish_options(var, config)
+    cg.add(controller.register_device(var))
+    register_subscription(config)
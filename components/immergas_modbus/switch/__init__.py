@@ -1,12 +1,15 @@
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import switch
+from esphome.const import CONF_UPDATE_INTERVAL
 from ..immergas.const import IM_LABEL, IM_MESSAGE, IM_MODE
-from ..immergas.labels_en import immergas_labels
 from ..immergas.auto_entities import switches as auto_switches_map
 from .. import (
     IM_CONTROLLER_ID,
     IM_DEVICE_ID,
+    PUBLISH_SCHEMA,
+    register_subscription,
+    setup_publish_options,
     IM_Switch,
 )
 
@@ -19,7 +22,7 @@ def validate(config):
     if IM_MESSAGE in config:
         mapped = auto_switches_map.get(config[IM_MESSAGE]) if auto_switches_map is not None else None
         if mapped is not None:
-            config[IM_LABEL] = mapped.get(IM_LABEL, immergas_labels.get(config[IM_MESSAGE], "IM_UNKNOWN_LABEL"))
+            config[IM_LABEL] = mapped.get(IM_LABEL, "IM_UNKNOWN_LABEL")
             config[IM_MODE] = mapped.get(IM_MODE, "CONTROL")
     return config
 
@@ -31,7 +34,9 @@ CONFIG_SCHEMA = cv.All(
     .extend({
         cv.GenerateID(): cv.declare_id(IM_Switch),
         cv.Required(IM_MESSAGE): cv.hex_int,
+        cv.Optional(CONF_UPDATE_INTERVAL): cv.update_interval,
     })
+    .extend(PUBLISH_SCHEMA)
     .extend({cv.GenerateID(IM_CONTROLLER_ID): cv.use_id, cv.GenerateID(IM_DEVICE_ID): cv.use_id})
 )
 
@@ -41,11 +46,11 @@ async def to_code(config):
     controller = await cg.get_variable(config[IM_CONTROLLER_ID])
     var_sw = await switch.new_switch(
         config,
-        config[IM_LABEL],
-        config[IM_MESSAGE],
-        config.get(IM_MODE, "CONTROL"),
-        device,
+        device.get_address(),
     )
     cg.add(var_sw.set_pdu(config[IM_MESSAGE]))
-    cg.add(var_sw.set_parent(controller))
+    if CONF_UPDATE_INTERVAL in config:
+        cg.add(var_sw.set_update_interval(config[CONF_UPDATE_INTERVAL]))
+    setup_publish_options(var_sw, config)
     cg.add(controller.register_device(var_sw))
+    register_subscription(config)
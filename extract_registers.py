@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """
 Convert Dominus CFG/LBL files into a compact Immergas register mapping
-and generate per-language label modules for the ESPHome custom component.
+and a packed label catalog for the ESPHome custom component.
 
 Writes:
-- `components/immergas_modbus/immergas/labels_<lang>.py` for each language
+- `components/immergas_modbus/immergas/labels.bin` (fault labels of every
+  language, see `immergas/label_catalog.py`)
 - `immergas_registers.json` (compact PDU list)
+- `components/immergas_modbus/immergas/registers_index_data.py` (the JSON classified
+  into entities and PDU map, so codegen does not re-parse it)
 
 Run from the `Immergas-Modbus` directory:
     python extract_registers.py
@@ -70,7 +73,7 @@ def dedupe_list(lst):
     return out
 
 
-def generate_label_modules(lbl_json: dict):
+def generate_label_catalog(lbl_json: dict):
     # detect languages from keys like 'text1-en', 'action-it', 'comment-fr'
     langs = set()
     for entry in lbl_json.get('anomalies', []):
@@ -80,44 +83,30 @@ def generate_label_modules(lbl_json: dict):
                 langs.add(m.group('lang'))
     if not langs:
         print('No language keys found in label file')
-        return []
+        return None
 
-    LABELS_DIR.mkdir(parents=True, exist_ok=True)
-    generated = []
+    mappings = {}
     for lang in sorted(langs):
         mapping = {}
         for entry in lbl_json.get('anomalies', []):
             code = entry.get('fault-code')
             if code is None:
                 continue
-            text1 = entry.get(f'text1-{lang}') or entry.get('text1-en')
-            text2 = entry.get(f'text2-{lang}') or entry.get('text2-en')
-            action = entry.get(f'action-{lang}') or entry.get('action-en')
-            comment = entry.get(f'comment-{lang}') or entry.get('comment-en')
             mapping[code] = {
-                'text1': text1,
-                'text2': text2,
-                'action': action,
-                'comment': comment,
+                'text1': entry.get(f'text1-{lang}') or entry.get('text1-en'),
+                'text2': entry.get(f'text2-{lang}') or entry.get('text2-en'),
+                'action': entry.get(f'action-{lang}') or entry.get('action-en'),
+                'comment': entry.get(f'comment-{lang}') or entry.get('comment-en'),
             }
+        mappings[lang] = mapping
 
-        # write python module
-        mod_path = LABELS_DIR / f'labels_{lang}.py'
-        with mod_path.open('w', encoding='utf8') as f:
-            f.write('"""Generated Immergas labels (language: %s)"""\n' % lang)
-            f.write('\n')
-            f.write('immergas_labels = {\n')
-            for code, d in mapping.items():
-                # ensure code is a valid literal (int or string)
-                key = repr(code)
-                text1 = repr(d['text1'])
-                text2 = repr(d['text2'])
-                action = repr(d['action'])
-                comment = repr(d['comment'])
-                f.write(f'    {key}: {{"text1": {text1}, "text2": {text2}, "action": {action}, "comment": {comment}}},\n')
-            f.write('}\n')
-        generated.append(str(mod_path))
-    return generated
+    # one catalog for all languages; repeated texts are stored once
+    sys.path.insert(0, str(LABELS_DIR.parent))
+    from immergas.label_catalog import pack
+    LABELS_DIR.mkdir(parents=True, exist_ok=True)
+    path = LABELS_DIR / 'labels.bin'
+    path.write_bytes(pack(mappings))
+    return str(path)
 
 
 def main():
@@ -161,11 +150,14 @@ def main():
         json.dump(result, f, indent=2, ensure_ascii=False)
     print('Wrote', OUT_PATH, '- PDUs found:', len(out))
 
-    generated = generate_label_modules(lbl)
-    if generated:
-        print('Generated label modules:')
-        for p in generated:
-            print(' -', p)
+    sys.path.insert(0, str(LABELS_DIR.parent))
+    from immergas.register_index import write_index_module
+    write_index_module(OUT_PATH.read_bytes(), LABELS_DIR / 'registers_index_data.py')
+    print('Wrote', LABELS_DIR / 'registers_index_data.py')
+
+    catalog = generate_label_catalog(lbl)
+    if catalog:
+        print('Wrote', catalog)
 
 
 if __name__ == '__main__':
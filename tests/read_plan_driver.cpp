@@ -0,0 +1,49 @@
+// Plans reads over the shipped immergas_pdu_map with im_read_plan.h, for tests/test_read_plan.py.
+//   read_plan_driver gap <baud>                  -> max bridging gap at <baud>
+//   read_plan_driver plan <max_gap> < subscriptions ("<pdu> <interval_ms>" lines)
+//                                                 -> one "<interval> <start> <count> <index>,..." line per batch
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <map>
+#include "immergas_pdus.h"
+#include "im_read_plan.h"
+
+using namespace esphome::immergas_modbus;
+
+int main(int argc, char **argv) {
+  if (argc == 3 && strcmp(argv[1], "gap") == 0) {
+    printf("%u\n", immergas_max_bridge_gap(strtoul(argv[2], nullptr, 10), 125));
+    return 0;
+  }
+  if (argc != 3 || strcmp(argv[1], "plan") != 0) return 2;
+  std::map<unsigned, unsigned> intervals;  // pdu -> interval
+  unsigned pdu, interval;
+  while (scanf("%u %u", &pdu, &interval) == 2) intervals[pdu] = interval;
+  // tiers in interval order
+  std::map<unsigned, uint8_t> tier_of;
+  for (auto &it : intervals) tier_of.emplace(it.second, 0);
+  std::vector<unsigned> tier_intervals;
+  for (auto &it : tier_of) {
+    it.second = static_cast<uint8_t>(tier_intervals.size());
+    tier_intervals.push_back(it.first);
+  }
+  std::vector<uint8_t> entry_tiers(immergas_pdu_map_len, IM_PLAN_SKIP);
+  std::set<uint8_t> tiers;
+  for (size_t i = 0; i < immergas_pdu_map_len; ++i) {
+    auto it = intervals.find(immergas_pdu_map[i].pdu);
+    if (it == intervals.end()) continue;
+    entry_tiers[i] = tier_of[it->second];
+    tiers.insert(entry_tiers[i]);
+  }
+  std::vector<ImmergasReadBatch> plan;
+  std::vector<uint16_t> entries;
+  immergas_plan_reads(immergas_pdu_map, immergas_pdu_map_len, entry_tiers.data(), tiers, {}, {},
+                      static_cast<uint16_t>(atoi(argv[2])), 125, &plan, &entries);
+  for (const auto &b : plan) {
+    printf("%u %u %u ", tier_intervals[b.tier], b.start, b.count);
+    for (size_t k = b.entry_offset; k < b.entry_offset + b.entry_count; ++k) printf(k == b.entry_offset ? "%u" : ",%u", entries[k]);
+    printf("\n");
+  }
+  return 0;
+}
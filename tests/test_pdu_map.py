@@ -0,0 +1,65 @@
+"""Type detection of immergas/pdu_map.py, pinned to concrete descriptors."""
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "components", "immergas_modbus"))
+
+from immergas import pdu_map  # noqa: E402
+
+
+def test_flag8_bit_single_bits_only():
+    assert pdu_map.flag8_bit({"return": ["LB", "flag8", "3"]}) == 3
+    assert pdu_map.flag8_bit({"check": {"data": ["LB", "flag8", 0]}}) == 0
+    # "267" matches bits 2, 6 and 7 together, not one flag
+    assert pdu_map.flag8_bit({"return": ["LB", "flag8", "267"]}) is None
+    assert pdu_map.flag8_bit({"return": ["LB", "flag8", "8"]}) is None
+    assert pdu_map.flag8_bit({"return": ["u16"]}) is None
+
+
+def test_narrow_types():
+    assert pdu_map.detect_type({"return": ["temp"], "decimal": 1}) == (pdu_map.TYPE_TEMP, 1, 0.1, False)
+    assert pdu_map.detect_type({"return": ["u16"]}) == (pdu_map.TYPE_U16, 1, 1.0, False)
+    assert pdu_map.detect_type({"return": ["s16"]}) == (pdu_map.TYPE_S16, 1, 1.0, False)
+    assert pdu_map.detect_type({"return": ["LB", "flag8", "1"]}) == (pdu_map.TYPE_LB_FLAG8, 1, 1.0, False)
+    assert pdu_map.detect_type({"check": {"data": ["LB", "flag8", "1"]}}) == (pdu_map.TYPE_LB_FLAG8, 1, 1.0, False)
+
+
+def test_wide_descriptors():
+    assert pdu_map.detect_type({"return": ["u32"]}) == (pdu_map.TYPE_U32, 2, 1.0, False)
+    assert pdu_map.detect_type({"return": ["s32"], "decimal": 2}) == (pdu_map.TYPE_S32, 2, 0.01, False)
+    assert pdu_map.detect_type({"data": [["float32", "x"]]}) == (pdu_map.TYPE_FLOAT32, 2, 1.0, False)
+    assert pdu_map.detect_wide(["u16"]) is None
+
+
+def test_split_needs_hi_lo_pair_of_one_item():
+    assert pdu_map.detect_split([["u16", "counter-hi"], ["u16", "counter-lo"]]) == (pdu_map.TYPE_U32, False)
+    assert pdu_map.detect_split([["s16", "counter-lo"], ["s16", "counter-hi"]]) == (pdu_map.TYPE_S32, True)
+    # two independent fields are not one 32-bit value
+    assert pdu_map.detect_split([["u16", "min-temp"], ["u16", "max-temp"]]) is None
+    assert pdu_map.detect_split([["u16", "a-hi"], ["u16", "b-lo"]]) is None
+    assert pdu_map.detect_split([["u16", "a-hi"], ["u16", "a-hi"]]) is None
+    assert pdu_map.detect_split([["u16"], ["u16"]]) is None
+
+
+def test_shipped_map_matches_checked_in_header():
+    with open(os.path.join(ROOT, "immergas_registers.json"), encoding="utf-8") as fh:
+        entries, _ = pdu_map.build_entries(json.load(fh))
+    with open(os.path.join(ROOT, "components", "immergas_modbus", "immergas_pdus.h"), encoding="utf-8") as fh:
+        header = fh.read()
+    shipped = int(re.search(r"immergas_pdu_map_hash = 0x([0-9A-F]{8})", header).group(1), 16)
+    assert pdu_map.map_hash(entries) == shipped
+    # the JSON has no 32-bit descriptors yet
+    assert all(e["count"] == 1 for e in entries)
+
+
+def test_pruned_header_keeps_full_layout():
+    with open(os.path.join(ROOT, "immergas_registers.json"), encoding="utf-8") as fh:
+        entries, bits = pdu_map.build_entries(json.load(fh))
+    pruned, pruned_bits = pdu_map.prune(entries, bits, {entries[-1]["pdu"], entries[3]["pdu"]})
+    header = pdu_map.render_header(pruned, pruned_bits, entries)
+    assert "immergas_pdu_layout_hash = 0x%08X;" % pdu_map.map_hash(entries) in header
+    assert "immergas_pdu_layout_len = %d;" % len(entries) in header
+    assert re.search(r"immergas_pdu_layout_index\[\] = \{\s+3, %d,\s+\};" % (len(entries) - 1), header)
@@ -0,0 +1,72 @@
+"""immergas/read_plan.py (codegen) must plan exactly like im_read_plan.h (firmware).
+
+The C++ planner is compiled against the checked-in immergas_pdus.h by a small driver,
+tests/read_plan_driver.cpp, and both are run over the shipped map.
+"""
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+COMPONENT = os.path.join(ROOT, "components", "immergas_modbus")
+sys.path.insert(0, COMPONENT)
+
+from immergas import pdu_map, read_plan  # noqa: E402
+
+BAUD_RATES = (1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200)
+
+
+@pytest.fixture(scope="module")
+def driver(tmp_path_factory):
+    cxx = shutil.which(os.environ.get("CXX", "g++"))
+    if cxx is None:
+        pytest.skip("no C++ compiler")
+    exe = str(tmp_path_factory.mktemp("read_plan") / "read_plan_driver")
+    subprocess.run(
+        [cxx, "-std=c++17", "-O1", "-I", COMPONENT, os.path.join(ROOT, "tests", "read_plan_driver.cpp"), "-o", exe],
+        check=True,
+    )
+    return exe
+
+
+@pytest.fixture(scope="module")
+def entries():
+    with open(os.path.join(ROOT, "immergas_registers.json"), encoding="utf-8") as fh:
+        return pdu_map.build_entries(json.load(fh))[0]
+
+
+def cxx_plan(driver, max_gap, intervals):
+    stdin = "".join("%d %d\n" % item for item in intervals.items())
+    out = subprocess.run([driver, "plan", str(max_gap)], input=stdin, capture_output=True, text=True, check=True).stdout
+    batches = []
+    for line in out.splitlines():
+        interval, start, count, indices = line.split()
+        batches.append((int(start), int(count), int(interval), [int(i) for i in indices.split(",")]))
+    return batches
+
+
+def subscriptions(entries):
+    pdus = [e["pdu"] for e in entries]
+    rng = random.Random(2021)
+    yield {pdu: 30000 for pdu in pdus}
+    yield {pdu: (5000 if k % 3 == 0 else 60000) for k, pdu in enumerate(pdus)}
+    for _ in range(5):
+        yield {pdu: rng.choice((1000, 10000, 30000)) for pdu in rng.sample(pdus, len(pdus) // 4)}
+
+
+@pytest.mark.parametrize("baud", BAUD_RATES)
+def test_max_bridge_gap_matches(driver, baud):
+    out = subprocess.run([driver, "gap", str(baud)], capture_output=True, text=True, check=True).stdout
+    assert int(out) == read_plan.max_bridge_gap(baud)
+
+
+# 0 turns bridging off; the others are the gaps the supported baud rates produce
+@pytest.mark.parametrize("max_gap", sorted({0} | {read_plan.max_bridge_gap(b) for b in BAUD_RATES}))
+def test_plans_match(driver, entries, max_gap):
+    for intervals in subscriptions(entries):
+        assert read_plan.build_slave_plan(entries, intervals, max_gap) == cxx_plan(driver, max_gap, intervals)
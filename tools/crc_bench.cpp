@@ -0,0 +1,81 @@
+// Host benchmark: bit-by-bit CRC-16/MODBUS versus the shared table-driven
+// implementation in components/immergas_modbus/im_crc.h, on the frame sizes
+// produced by our batch reads and writes.
+#include <chrono>
+#include <cstdint>
+#include <cstdlib>
+#include <iomanip>
+#include <iostream>
+#include <vector>
+
+#include "../components/immergas_modbus/im_crc.h"
+
+using esphome::immergas_modbus::crc16_calc;
+using esphome::immergas_modbus::crc16_update;
+
+static uint16_t crc16_bitwise(const uint8_t *buf, size_t len) {
+  uint16_t crc = 0xFFFF;
+  for (size_t pos = 0; pos < len; pos++) {
+    crc ^= (uint16_t)buf[pos];
+    for (int i = 8; i != 0; i--) {
+      if ((crc & 0x0001) != 0) {
+        crc >>= 1;
+        crc ^= 0xA001;
+      } else
+        crc >>= 1;
+    }
+  }
+  return crc;
+}
+
+static uint16_t crc16_table(const uint8_t *buf, size_t len) { return crc16_calc(buf, len); }
+
+// Feed bytes one at a time, as the client does while a response arrives
+static uint16_t crc16_incremental(const uint8_t *buf, size_t len) {
+  uint16_t crc = 0xFFFF;
+  for (size_t pos = 0; pos < len; pos++) crc = crc16_update(crc, buf[pos]);
+  return crc;
+}
+
+template<typename F> static double ns_per_frame(F fn, const std::vector<uint8_t> &frame, size_t iterations) {
+  volatile uint16_t sink = 0;
+  auto start = std::chrono::steady_clock::now();
+  for (size_t i = 0; i < iterations; i++) sink = sink ^ fn(frame.data(), frame.size());
+  auto end = std::chrono::steady_clock::now();
+  return std::chrono::duration<double, std::nano>(end - start).count() / iterations;
+}
+
+int main(int argc, char **argv) {
+  size_t iterations = argc > 1 ? std::strtoul(argv[1], nullptr, 10) : 200000;
+  // name, frame length without CRC
+  const std::vector<std::pair<const char *, size_t>> frames = {
+      {"read request (0x03)", 6},
+      {"read 1 register", 3 + 2 * 1},
+      {"read 8 registers (zone block)", 3 + 2 * 8},
+      {"read 18 registers (bridged)", 3 + 2 * 18},
+      {"read 64 registers", 3 + 2 * 64},
+      {"read 125 registers (max)", 3 + 2 * 125},
+      {"write 2 registers (0x10)", 7 + 2 * 2},
+  };
+
+  std::srand(1);
+  std::cout << std::left << std::setw(32) << "frame" << std::right << std::setw(8) << "bytes" << std::setw(14)
+            << "bitwise ns" << std::setw(14) << "table ns" << std::setw(14) << "per-byte ns" << std::setw(10) << "speedup"
+            << std::endl;
+  for (const auto &f : frames) {
+    std::vector<uint8_t> frame(f.second);
+    for (auto &b : frame) b = static_cast<uint8_t>(std::rand() & 0xFF);
+    if (crc16_bitwise(frame.data(), frame.size()) != crc16_calc(frame.data(), frame.size()) ||
+        crc16_bitwise(frame.data(), frame.size()) != crc16_incremental(frame.data(), frame.size())) {
+      std::cerr << "CRC mismatch for " << f.first << std::endl;
+      return 1;
+    }
+    double bitwise = ns_per_frame(crc16_bitwise, frame, iterations);
+    double table = ns_per_frame(crc16_table, frame, iterations);
+    double incremental = ns_per_frame(crc16_incremental, frame, iterations);
+    std::cout << std::left << std::setw(32) << f.first << std::right << std::setw(8) << frame.size() + 2 << std::fixed
+              << std::setprecision(1) << std::setw(14) << bitwise << std::setw(14) << table << std::setw(14) << incremental
+              << std::setw(9) << bitwise / table << "x" << std::endl;
+  }
+  return 0;
+}
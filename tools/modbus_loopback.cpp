@@ -3,19 +3,10 @@
 #include <cstdint>
 #include <iomanip>
 
+#include "../components/immergas_modbus/im_crc.h"
+
 static uint16_t crc16_calc_buf(const uint8_t *buf, size_t len) {
-  uint16_t crc = 0xFFFF;
-  for (size_t pos = 0; pos < len; pos++) {
-    crc ^= (uint16_t)buf[pos];
-    for (int i = 8; i != 0; i--) {
-      if ((crc & 0x0001) != 0) {
-        crc >>= 1;
-        crc ^= 0xA001;
-      } else
-        crc >>= 1;
-    }
-  }
-  return crc;
+  return esphome::immergas_modbus::crc16_calc(buf, len);
 }
 
 static void print_hex(const std::vector<uint8_t> &v) {